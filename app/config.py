@@ -71,11 +71,34 @@ _API_BASE_URL = os.getenv("API_BASE_URL", "http://localhost:8080/api")
 _API_TIMEOUT = int(os.getenv("API_TIMEOUT", "30"))
 _API_USERNAME = os.getenv("API_USERNAME", "")
 _API_PASSWORD = os.getenv("API_PASSWORD", "")
+# Entity cache: scale factors over the per-type defaults in services/api_entity_cache.py
+_API_CACHE_ENABLED = os.getenv("API_CACHE_ENABLED", "true").lower() in ("true", "1", "yes")
+_API_CACHE_TTL_SCALE = float(os.getenv("API_CACHE_TTL_SCALE", "1.0"))
+_API_CACHE_SIZE_SCALE = float(os.getenv("API_CACHE_SIZE_SCALE", "1.0"))
+_API_CACHE_STATS_MINUTES = float(os.getenv("API_CACHE_STATS_MINUTES", "15"))
+# Background task executor (services/task_executor.py): worker threads shared by all API calls
+_TASK_EXECUTOR_WORKERS = int(os.getenv("TASK_EXECUTOR_WORKERS", "4"))
+# Reference data (divisions, neighborhoods, vocabularies): hours before a login revalidates a dataset
+_REFERENCE_DATA_REVALIDATE_HOURS = float(os.getenv("REFERENCE_DATA_REVALIDATE_HOURS", "12"))
+# Dashboard statistics counters (repositories/stat_counters.py): hours between background rebuilds
+_STAT_COUNTERS_RECONCILE_HOURS = float(os.getenv("STAT_COUNTERS_RECONCILE_HOURS", "24"))
+# Document version store (services/document_chunk_store.py): average chunk size in KB
+_DOCUMENT_CHUNK_AVG_KB = int(os.getenv("DOCUMENT_CHUNK_AVG_KB", "64"))
+# Evidence previews (services/preview_cache.py): disk cache size and render processes
+_PREVIEW_CACHE_MB = int(os.getenv("PREVIEW_CACHE_MB", "256"))
+_PREVIEW_WORKERS = int(os.getenv("PREVIEW_WORKERS", "2"))
+# Attachment downloads (services/download_manager.py): parallel transfers and local cache size
+_DOWNLOAD_WORKERS = int(os.getenv("DOWNLOAD_WORKERS", "3"))
+_ATTACHMENT_CACHE_MB = int(os.getenv("ATTACHMENT_CACHE_MB", "1024"))
+# Document uploads (services/upload_pipeline.py): parallel uploads and image resolution sent
+_UPLOAD_WORKERS = int(os.getenv("UPLOAD_WORKERS", "3"))
+_UPLOAD_IMAGE_DPI = int(os.getenv("UPLOAD_IMAGE_DPI", "200"))
 
 # Tile Server Settings
 _TILE_SERVER_URL = os.getenv("TILE_SERVER_URL", None)
 _USE_DOCKER_TILES = os.getenv("USE_DOCKER_TILES", "false").lower() in ("true", "1", "yes")
 _MBTILES_PATH = os.getenv("MBTILES_PATH", None)
+_MAP_VECTOR_TILES = os.getenv("MAP_VECTOR_TILES", "false").lower() in ("true", "1", "yes")
 
 # Map Geographic Settings (defaults: Aleppo, Syria)
 _MAP_CENTER_LAT = float(os.getenv("MAP_CENTER_LAT", "36.2021"))
@@ -131,6 +154,20 @@ class Config:
     API_USERNAME: str = _API_USERNAME  # From .env or default (admin)
     API_PASSWORD: str = _API_PASSWORD  # From .env or default (Admin@123)
     VERIFY_SSL: bool = _VERIFY_SSL  # Honored only for localhost; remote always verified
+    API_CACHE_ENABLED: bool = _API_CACHE_ENABLED  # Read-through cache for entity GETs
+    API_CACHE_TTL_SCALE: float = _API_CACHE_TTL_SCALE  # 0 disables the cache
+    API_CACHE_SIZE_SCALE: float = _API_CACHE_SIZE_SCALE
+    API_CACHE_STATS_MINUTES: float = _API_CACHE_STATS_MINUTES  # 0 = no periodic [API_CACHE] line
+    TASK_EXECUTOR_WORKERS: int = _TASK_EXECUTOR_WORKERS
+    REFERENCE_DATA_REVALIDATE_HOURS: float = _REFERENCE_DATA_REVALIDATE_HOURS  # 0 = revalidate on every login
+    STAT_COUNTERS_RECONCILE_HOURS: float = _STAT_COUNTERS_RECONCILE_HOURS  # 0 = never reconcile
+    DOCUMENT_CHUNK_AVG_KB: int = _DOCUMENT_CHUNK_AVG_KB  # 0 = store whole-file copies
+    PREVIEW_CACHE_MB: int = _PREVIEW_CACHE_MB
+    PREVIEW_WORKERS: int = _PREVIEW_WORKERS  # 0 = render in the calling thread
+    DOWNLOAD_WORKERS: int = _DOWNLOAD_WORKERS
+    ATTACHMENT_CACHE_MB: int = _ATTACHMENT_CACHE_MB
+    UPLOAD_WORKERS: int = _UPLOAD_WORKERS
+    UPLOAD_IMAGE_DPI: int = _UPLOAD_IMAGE_DPI  # 0 = upload images unchanged
 
     # Map Tile Server Configuration
     TILE_SERVER_URL: Optional[str] = _TILE_SERVER_URL
@@ -138,6 +175,7 @@ class Config:
     USE_EMBEDDED_TILES_FALLBACK: bool = True
     TILE_SERVER_HEALTH_TIMEOUT: int = 2
     MBTILES_PATH: Optional[str] = _MBTILES_PATH
+    MAP_VECTOR_TILES: bool = _MAP_VECTOR_TILES  # Building footprints from /vtiles/{z}/{x}/{y}.pbf
 
     # Map Geographic Configuration
     MAP_CENTER_LAT: float = _MAP_CENTER_LAT
@@ -251,6 +289,15 @@ class Config:
     MAX_IMPORT_RECORDS: int = 10000
     VALIDATION_DELAY_MS: int = 50  # Simulated delay per record
 
+    # Page construction: pages are built on first navigation; after login
+    # these are prebuilt one per idle event-loop turn, in this order.
+    PAGE_IDLE_PREBUILD: bool = os.getenv("PAGE_IDLE_PREBUILD", "true").lower() in ("true", "1", "yes")
+    PAGE_PREBUILD_ORDER: tuple = (
+        "surveys", "claims", "survey_details", "claim_details",
+        "case_management", "buildings",
+    )
+    PAGE_PREBUILD_INTERVAL_MS: int = 50
+
     # Pagination
     DEFAULT_PAGE_SIZE: int = 50
     PAGE_SIZE_OPTIONS: tuple = (25, 50, 100, 200)
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 """Main application window with navbar navigation."""
 
+import time
+
 from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QHBoxLayout, QVBoxLayout,
     QStackedWidget, QShortcut, QApplication,
@@ -18,6 +20,8 @@ from utils.i18n import I18n
 from utils.logger import get_logger
 from ui.error_handler import ErrorHandler
 from ui.design_system import ScreenScale
+from ui.style_manager import StyleManager
+from ui.theme_engine import apply_component_style
 
 logger = get_logger(__name__)
 
@@ -121,8 +125,16 @@ class MainWindow(QMainWindow):
         Pages.BUILDINGS: {"admin", "data_manager"},
     }
 
+    # Pages whose buttons are shown/hidden by configure_for_role()
+    _ROLE_CONFIGURED_PAGES = (
+        Pages.BUILDINGS, Pages.BUILDING_DETAILS, Pages.UNITS,
+        Pages.PERSONS, Pages.IMPORT_WIZARD, Pages.IMPORT_PACKAGES,
+        Pages.SURVEY_DETAILS, Pages.CASE_ENTITY_DETAILS,
+    )
+
     def __init__(self, db: Database, lang: str = "ar", parent=None):
         super().__init__(parent)
+        init_started = time.perf_counter()
         self.WINDOW_RADIUS = 12
         self.db = db
         self.i18n = I18n(lang)
@@ -144,6 +156,10 @@ class MainWindow(QMainWindow):
         # Proactive token refresh timer
         self._token_refresh_timer = None
 
+        # Set once the post-login UI is configured; lazily built pages use it
+        # to decide whether to load session-dependent data on construction.
+        self._login_ui_ready = False
+
         self._setup_window()
         self._setup_shortcuts()
         self._create_widgets()
@@ -159,6 +175,11 @@ class MainWindow(QMainWindow):
 
         # Start with login page
         self._show_login()
+        logger.info(
+            "[PAGE_PERF] main_window_init_ms=%.1f (pages deferred: %d)",
+            (time.perf_counter() - init_started) * 1000.0,
+            len(self.pages.startup_report()["pending"]),
+        )
 
     def _setup_window(self):
         """Configure window properties — adapts to screen size."""
@@ -227,50 +248,38 @@ class MainWindow(QMainWindow):
 
 
     def _create_widgets(self):
-        """Create main UI components with new design."""
+        """Create main UI components with new design.
+
+        Only the navbar and login page are built here. Every other page is
+        registered as a factory and constructed on first navigation (or on
+        idle after login, see _prebuild_pages_on_idle).
+        """
         # Import here to avoid circular imports
         from ui.components.navbar import Navbar
         from ui.pages.login_page import LoginPage
-        from ui.pages.buildings_page import BuildingsPage
-        from ui.pages.building_details_page import BuildingDetailsPage
-        from ui.pages.units_page import UnitsPage
-        from ui.pages.unit_details_page import UnitDetailsPage
-        from ui.pages.persons_page import PersonsPage
-        from ui.pages.relations_page import RelationsPage
-        from ui.pages.households_page import HouseholdsPage
-        from ui.pages.completed_claims_page import CompletedClaimsPage
-        from ui.pages.cases_page import CasesPage
-        from ui.pages.duplicates_page import DuplicatesPage
-        from ui.pages.claim_comparison_page import ClaimComparisonPage
-        from ui.pages.field_work_preparation_page import FieldWorkPreparationPage
-        from controllers.building_controller import BuildingController
-        from ui.pages.case_details_page import CaseDetailsPage
-        from ui.pages.claim_details_page import ClaimDetailsPage
-        from ui.wizards.office_survey import OfficeSurveyWizard
-        from ui.pages.import_wizard_page import ImportWizardPage
-        from ui.pages.claim_edit_page import ClaimEditPage
+        from .page_registry import LazyPageRegistry
 
 
         # Central widget
+        # Container looks live in the application stylesheet
+        # (StyleManager.main_window_shell): a stylesheet on any of them
+        # would push every themed widget on every page onto a sheet of its own.
         self.central_widget = QWidget()
+        self.central_widget.setObjectName("MainCentralWidget")
         self.setCentralWidget(self.central_widget)
-        self.central_widget.setStyleSheet("background: transparent;")
+        apply_component_style(self.central_widget, StyleManager.main_window_shell)
         # إطار داخلي هو اللي رح يبين التطبيق + يعطي زوايا + ظل
         self.window_frame = QFrame(self.central_widget)
         self.window_frame.setObjectName("window_frame")
         self.window_frame.setAttribute(Qt.WA_StyledBackground, True)
-        self.window_frame.setStyleSheet(f"""
-            QFrame#window_frame {{
-                background-color: {Config.BACKGROUND_COLOR};
-                border-radius: 12px;
-            }}
-        """)
+        apply_component_style(self.window_frame, StyleManager.main_window_shell)
 
 
         # مقبض تغيير الحجم (resize) خليّه جوّا الإطار
         self._size_grip = QSizeGrip(self.window_frame)
         self._size_grip.setFixedSize(ScreenScale.w(16), ScreenScale.h(16))
-        self._size_grip.setStyleSheet("background: transparent;")
+        self._size_grip.setObjectName("MainSizeGrip")
+        apply_component_style(self._size_grip, StyleManager.main_window_shell)
 
 
         # Navbar (hidden initially - shown after login)
@@ -279,134 +288,145 @@ class MainWindow(QMainWindow):
 
         # Stacked widget for pages
         self.stack = QStackedWidget()
-        self.stack.setStyleSheet(f"background-color: {Config.BACKGROUND_COLOR};")
+        self.stack.setObjectName("MainStack")
+        apply_component_style(self.stack, StyleManager.main_window_shell)
+
+        # Pages are built lazily on first access
+        self.pages = LazyPageRegistry(self.stack, on_built=self._on_page_built)
+        self._office_survey_wizard = None
 
-        # Create pages
-        self.pages = {}
+        # Login page (needed immediately)
+        self.pages.add(Pages.LOGIN, LoginPage(self.i18n, db=self.db, parent=self))
 
-        # Login page
-        self.pages[Pages.LOGIN] = LoginPage(self.i18n, db=self.db, parent=self)
-        self.stack.addWidget(self.pages[Pages.LOGIN])
+        self._register_pages()
+
+        # Map tabs to pages
+        # Tab 0: المطالبات المكتملة (Completed Claims)
+        # Tab 1: الادعاءات (Cases/Claims)
+        # Tab 2: إدارة الحالات (Case Management)
+        # Tab 3: الاستيراد (Import)
+        # Tab 4: التكرارات (Duplicates)
+        # Tab 5: تجهيز العمل الميداني (Field Work Preparation)
+        # Tab 6: المباني (Buildings)
+        self.tab_page_mapping = {
+            0: Pages.CLAIMS,
+            1: Pages.SURVEYS,
+            2: Pages.CASE_MANAGEMENT,
+            3: Pages.IMPORT_PACKAGES,
+            4: Pages.DUPLICATES,
+            5: Pages.FIELD_ASSIGNMENT,
+            6: Pages.BUILDINGS,
+        }
+
+    def _register_pages(self):
+        """Register a factory (and its signal wiring) for every content page."""
+        reg = self.pages.register
+        std = lambda cls: cls(self.db, self.i18n, self)  # noqa: E731
+        own = lambda cls: cls(self)  # noqa: E731
 
         # Buildings list page
-        self.pages[Pages.BUILDINGS] = BuildingsPage(self.db, self.i18n, self)
-        self.stack.addWidget(self.pages[Pages.BUILDINGS])
+        reg(Pages.BUILDINGS, "ui.pages.buildings_page", "BuildingsPage", std,
+            wire=lambda p: p.view_building.connect(self._on_view_building))
 
-        # Building details page
-        self.pages[Pages.BUILDING_DETAILS] = BuildingDetailsPage(self.db, self.i18n, self)
-        self.stack.addWidget(self.pages[Pages.BUILDING_DETAILS])
+        # Building details page - back to list
+        reg(Pages.BUILDING_DETAILS, "ui.pages.building_details_page", "BuildingDetailsPage", std,
+            wire=lambda p: p.back_requested.connect(lambda: self.navigate_to(Pages.BUILDINGS)))
 
-        # Units page
-        self.pages[Pages.UNITS] = UnitsPage(self.db, self.i18n, self)
-        self.stack.addWidget(self.pages[Pages.UNITS])
+        # Units page - view details
+        reg(Pages.UNITS, "ui.pages.units_page", "UnitsPage", std,
+            wire=lambda p: p.view_unit.connect(self._on_view_unit))
 
-        # Unit details page
-        self.pages[Pages.UNIT_DETAILS] = UnitDetailsPage(self.db, self.i18n, self)
-        self.stack.addWidget(self.pages[Pages.UNIT_DETAILS])
+        # Unit details page - back to list
+        reg(Pages.UNIT_DETAILS, "ui.pages.unit_details_page", "UnitDetailsPage", std,
+            wire=lambda p: p.back_requested.connect(lambda: self.navigate_to(Pages.UNITS)))
 
         # Persons page
-        self.pages[Pages.PERSONS] = PersonsPage(self.db, self.i18n, self)
-        self.stack.addWidget(self.pages[Pages.PERSONS])
+        reg(Pages.PERSONS, "ui.pages.persons_page", "PersonsPage", std)
 
         # Relations page (Person-Unit Relations)
-        self.pages[Pages.RELATIONS] = RelationsPage(self.db, self.i18n, self)
-        self.stack.addWidget(self.pages[Pages.RELATIONS])
+        reg(Pages.RELATIONS, "ui.pages.relations_page", "RelationsPage", std)
 
         # Households page
-        self.pages[Pages.HOUSEHOLDS] = HouseholdsPage(self.db, self.i18n, self)
-        self.stack.addWidget(self.pages[Pages.HOUSEHOLDS])
+        reg(Pages.HOUSEHOLDS, "ui.pages.households_page", "HouseholdsPage", std)
 
         # Completed Claims page
-        self.pages[Pages.CLAIMS] = CompletedClaimsPage(self.db, self.i18n, self)
-        self.stack.addWidget(self.pages[Pages.CLAIMS])
+        reg(Pages.CLAIMS, "ui.pages.completed_claims_page", "CompletedClaimsPage", std,
+            wire=self._wire_claims_page)
 
         # Cases page (3 sub-tabs: Draft / Finalized / Completed)
-        self.pages[Pages.SURVEYS] = CasesPage(self.db, self.i18n, self)
-        self.stack.addWidget(self.pages[Pages.SURVEYS])
+        reg(Pages.SURVEYS, "ui.pages.cases_page", "CasesPage", std,
+            wire=self._wire_cases_page)
 
         # Case Management page (Case entity: Open / Closed)
-        from ui.pages.case_management_page import CaseManagementPage
-        self.pages[Pages.CASE_MANAGEMENT] = CaseManagementPage(self)
-        self.stack.addWidget(self.pages[Pages.CASE_MANAGEMENT])
+        reg(Pages.CASE_MANAGEMENT, "ui.pages.case_management_page", "CaseManagementPage", own,
+            wire=lambda p: p.case_selected.connect(self._on_case_entity_selected))
 
         # Case Entity Details page
-        from ui.pages.case_entity_details_page import CaseEntityDetailsPage
-        self.pages[Pages.CASE_ENTITY_DETAILS] = CaseEntityDetailsPage(self)
-        self.stack.addWidget(self.pages[Pages.CASE_ENTITY_DETAILS])
+        reg(Pages.CASE_ENTITY_DETAILS, "ui.pages.case_entity_details_page",
+            "CaseEntityDetailsPage", own, wire=self._wire_case_entity_details_page)
 
         # Duplicates page
-        self.pages[Pages.DUPLICATES] = DuplicatesPage(self.db, self.i18n, self)
-        self.stack.addWidget(self.pages[Pages.DUPLICATES])
+        reg(Pages.DUPLICATES, "ui.pages.duplicates_page", "DuplicatesPage", std,
+            wire=self._wire_duplicates_page)
 
-        # Claim Comparison page
-        self.pages[Pages.CLAIM_COMPARISON] = ClaimComparisonPage(self.db, self.i18n, self)
-        self.stack.addWidget(self.pages[Pages.CLAIM_COMPARISON])
+        # Claim Comparison page - back to duplicates
+        reg(Pages.CLAIM_COMPARISON, "ui.pages.claim_comparison_page", "ClaimComparisonPage", std,
+            wire=lambda p: p.back_requested.connect(lambda: self.navigate_to(Pages.DUPLICATES)))
 
         # Field Work Preparation wizard
-        field_bc = BuildingController(self.db)
-        self.pages[Pages.FIELD_ASSIGNMENT] = FieldWorkPreparationPage(field_bc, self.i18n, self)
-        self.stack.addWidget(self.pages[Pages.FIELD_ASSIGNMENT])
-        self.pages[Pages.FIELD_ASSIGNMENT].completed.connect(self._on_field_work_completed)
+        def _build_field_work(cls):
+            from controllers.building_controller import BuildingController
+            return cls(BuildingController(self.db), self.i18n, self)
+
+        reg(Pages.FIELD_ASSIGNMENT, "ui.pages.field_work_preparation_page",
+            "FieldWorkPreparationPage", _build_field_work,
+            wire=lambda p: p.completed.connect(self._on_field_work_completed))
 
         # Case Details page — read-only view of survey/claim
-        self.pages[Pages.SURVEY_DETAILS] = CaseDetailsPage(self)
-        self.stack.addWidget(self.pages[Pages.SURVEY_DETAILS])
+        reg(Pages.SURVEY_DETAILS, "ui.pages.case_details_page", "CaseDetailsPage", own,
+            wire=self._wire_case_details_page)
 
         # Claim Details page — dedicated view for claims from Claims API
-        self.pages[Pages.CLAIM_DETAILS] = ClaimDetailsPage(self)
-        self.stack.addWidget(self.pages[Pages.CLAIM_DETAILS])
+        reg(Pages.CLAIM_DETAILS, "ui.pages.claim_details_page", "ClaimDetailsPage", own,
+            wire=self._wire_claim_details_page)
 
         # Sync & Data page
-        from ui.pages.sync_data_page import SyncDataPage
-        self.pages[Pages.SYNC_DATA] = SyncDataPage(self.db, self.i18n, self)
-        self.stack.addWidget(self.pages[Pages.SYNC_DATA])
+        reg(Pages.SYNC_DATA, "ui.pages.sync_data_page", "SyncDataPage", std,
+            wire=self._wire_sync_data_page)
 
         # Import Wizard page
-        from controllers.import_controller import ImportController
-        self._import_controller = ImportController(self.db)
-        self.pages[Pages.IMPORT_WIZARD] = ImportWizardPage(
-            import_controller=self._import_controller, db=self.db, i18n=self.i18n, parent=self
-        )
-        self.stack.addWidget(self.pages[Pages.IMPORT_WIZARD])
+        def _build_import_wizard(cls):
+            from controllers.import_controller import ImportController
+            self._import_controller = ImportController(self.db)
+            return cls(import_controller=self._import_controller, db=self.db,
+                       i18n=self.i18n, parent=self)
 
-        # Import <-> Duplicates navigation signals
-        self.pages[Pages.IMPORT_WIZARD].navigate_to_duplicates.connect(
-            self._on_import_navigate_to_duplicates
-        )
-        self.pages[Pages.DUPLICATES].return_to_import.connect(
-            self._on_duplicates_return_to_import
-        )
+        reg(Pages.IMPORT_WIZARD, "ui.pages.import_wizard_page", "ImportWizardPage",
+            _build_import_wizard, wire=self._wire_import_wizard_page)
 
         # Import Packages list page
-        from ui.pages.import_packages_page import ImportPackagesPage
-        self.pages[Pages.IMPORT_PACKAGES] = ImportPackagesPage(self.db, self.i18n, self)
-        self.stack.addWidget(self.pages[Pages.IMPORT_PACKAGES])
+        reg(Pages.IMPORT_PACKAGES, "ui.pages.import_packages_page", "ImportPackagesPage", std,
+            wire=lambda p: p.view_package.connect(self._on_view_import_package))
 
         # Claim Edit page
-        self.pages[Pages.CLAIM_EDIT] = ClaimEditPage(self.db, self.i18n, self)
-        self.stack.addWidget(self.pages[Pages.CLAIM_EDIT])
-
-        # Office Survey Wizard
-        self.office_survey_wizard = OfficeSurveyWizard(self.db, self)
-        self.stack.addWidget(self.office_survey_wizard)
-
-        # Map tabs to pages
-        # Tab 0: المطالبات المكتملة (Completed Claims)
-        # Tab 1: الادعاءات (Cases/Claims)
-        # Tab 2: إدارة الحالات (Case Management)
-        # Tab 3: الاستيراد (Import)
-        # Tab 4: التكرارات (Duplicates)
-        # Tab 5: تجهيز العمل الميداني (Field Work Preparation)
-        # Tab 6: المباني (Buildings)
-        self.tab_page_mapping = {
-            0: Pages.CLAIMS,
-            1: Pages.SURVEYS,
-            2: Pages.CASE_MANAGEMENT,
-            3: Pages.IMPORT_PACKAGES,
-            4: Pages.DUPLICATES,
-            5: Pages.FIELD_ASSIGNMENT,
-            6: Pages.BUILDINGS,
-        }
+        reg(Pages.CLAIM_EDIT, "ui.pages.claim_edit_page", "ClaimEditPage", std,
+            wire=self._wire_claim_edit_page)
+
+    @property
+    def office_survey_wizard(self):
+        """Office Survey Wizard, built on first use (not part of self.pages)."""
+        if self._office_survey_wizard is None:
+            wizard = self.pages.build_detached(
+                "office_survey_wizard", "ui.wizards.office_survey", "OfficeSurveyWizard",
+                lambda cls: cls(self.db, self),
+            )
+            wizard.survey_completed.connect(self._on_survey_completed)
+            wizard.survey_cancelled.connect(self._on_survey_cancelled)
+            wizard.survey_saved_draft.connect(self._on_survey_saved_draft)
+            if getattr(self, '_api_token', None):
+                wizard.set_auth_token(self._api_token)
+            self._office_survey_wizard = wizard
+        return self._office_survey_wizard
 
     def _setup_layout(self):
     # لاي اوت خارجي: بدون فراغ شفاف (حسب طلب المستخدم)
@@ -426,7 +446,11 @@ class MainWindow(QMainWindow):
 
 
     def _connect_signals(self):
-        """Connect widget signals to slots."""
+        """Connect widget signals to slots.
+
+        Page signals are connected by each page's `wire` callback when the
+        page is built (see _register_pages).
+        """
         # Login page signals
         self.pages[Pages.LOGIN].login_successful.connect(self._on_login_success)
 
@@ -437,156 +461,125 @@ class MainWindow(QMainWindow):
         self.navbar.language_change_requested.connect(self.toggle_language)
         self.navbar.sync_requested.connect(self._on_sync_requested)
         self.navbar.password_change_requested.connect(self._on_voluntary_password_change)
-        self.pages[Pages.SYNC_DATA].sync_notification.connect(self._on_sync_notification)
         self.navbar.import_requested.connect(self._on_import_requested)
 
+        # Language change signal
+        self.language_changed.connect(self._on_language_changed)
+
+    # -- Page wiring (run once per page, right after construction) --
+
+    def _wire_import_wizard_page(self, page):
         # Import pages signals. The wizard is always entered with a specific
         # package id via `view_package`; there is no package-less entry point.
         # Upload flows emit `view_package` with the new id after success.
-        self.pages[Pages.IMPORT_PACKAGES].view_package.connect(
-            self._on_view_import_package
-        )
-        self.pages[Pages.IMPORT_WIZARD].completed.connect(
-            self._on_import_completed_silent_refresh
-        )
-        self.pages[Pages.IMPORT_WIZARD].cancelled.connect(
-            lambda: self.navigate_to(Pages.IMPORT_PACKAGES)
-        )
-        self.pages[Pages.IMPORT_WIZARD].terminal_state_message.connect(
-            self._on_import_terminal_state_message
-        )
-
-        # Buildings page - view details
-        self.pages[Pages.BUILDINGS].view_building.connect(self._on_view_building)
-
-        # Building details - back to list
-        self.pages[Pages.BUILDING_DETAILS].back_requested.connect(
-            lambda: self.navigate_to(Pages.BUILDINGS)
-        )
-
-        # Units page - view details
-        self.pages[Pages.UNITS].view_unit.connect(self._on_view_unit)
+        page.completed.connect(self._on_import_completed_silent_refresh)
+        page.cancelled.connect(lambda: self.navigate_to(Pages.IMPORT_PACKAGES))
+        page.terminal_state_message.connect(self._on_import_terminal_state_message)
+        # Import <-> Duplicates navigation signals
+        page.navigate_to_duplicates.connect(self._on_import_navigate_to_duplicates)
 
-        # Unit details - back to list
-        self.pages[Pages.UNIT_DETAILS].back_requested.connect(
-            lambda: self.navigate_to(Pages.UNITS)
+    def _wire_duplicates_page(self, page):
+        page.return_to_import.connect(self._on_duplicates_return_to_import)
+        # Duplicates page - view comparison
+        page.view_comparison_requested.connect(
+            lambda group: self.navigate_to(Pages.CLAIM_COMPARISON, group)
         )
 
-        # Case Details - back to source page (draft or finalized)
-        self.pages[Pages.SURVEY_DETAILS].back_requested.connect(self._on_case_details_back)
-
-        # Case Management - view case details
-        self.pages[Pages.CASE_MANAGEMENT].case_selected.connect(self._on_case_entity_selected)
-
+    def _wire_case_entity_details_page(self, page):
         # Case Entity Details - back to case management
-        self.pages[Pages.CASE_ENTITY_DETAILS].back_requested.connect(
-            lambda: self.navigate_to(Pages.CASE_MANAGEMENT)
-        )
-
-        # Case Entity Details - view survey (contextual navigation)
-        self.pages[Pages.CASE_ENTITY_DETAILS].survey_clicked.connect(
-            self._on_case_entity_survey_clicked
-        )
-
-        # Case Entity Details - view claim (contextual navigation)
-        self.pages[Pages.CASE_ENTITY_DETAILS].claim_clicked.connect(
-            self._on_case_entity_claim_clicked
-        )
-
-        # Case Entity Details - toggle editable
-        self.pages[Pages.CASE_ENTITY_DETAILS].toggle_editable_requested.connect(
-            self._on_toggle_case_editable
-        )
-
-        # Case Entity Details - revisit
-        self.pages[Pages.CASE_ENTITY_DETAILS].revisit_requested.connect(
-            self._on_case_revisit_requested
-        )
-
+        page.back_requested.connect(lambda: self.navigate_to(Pages.CASE_MANAGEMENT))
+        # Case Entity Details - view survey / claim (contextual navigation)
+        page.survey_clicked.connect(self._on_case_entity_survey_clicked)
+        page.claim_clicked.connect(self._on_case_entity_claim_clicked)
+        # Case Entity Details - toggle editable / revisit
+        page.toggle_editable_requested.connect(self._on_toggle_case_editable)
+        page.revisit_requested.connect(self._on_case_revisit_requested)
+
+    def _wire_cases_page(self, page):
         # Cases - view survey details (works for all 3 sub-tabs)
-        self.pages[Pages.SURVEYS].claim_selected.connect(self._on_draft_claim_selected)
-
+        page.claim_selected.connect(self._on_draft_claim_selected)
         # Cases - resume draft survey in wizard for editing
-        self.pages[Pages.SURVEYS].resume_survey.connect(self._on_resume_draft_survey)
-
+        page.resume_survey.connect(self._on_resume_draft_survey)
         # Cases - finalize survey → stay on cases page (switch to finalized sub-tab)
-        self.pages[Pages.SURVEYS].survey_finalized.connect(
-            lambda _: self.navigate_to(Pages.SURVEYS)
-        )
-
-        # Completed Claims - view claim details
-        self.pages[Pages.CLAIMS].claim_selected.connect(self._on_completed_claim_selected)
-
+        page.survey_finalized.connect(lambda _: self.navigate_to(Pages.SURVEYS))
         # Add Claim button - start new office survey
-        self.pages[Pages.SURVEYS].add_claim_clicked.connect(self._start_new_office_survey)
-
-        # Office Survey Wizard signals
-        self.office_survey_wizard.survey_completed.connect(self._on_survey_completed)
-        self.office_survey_wizard.survey_cancelled.connect(self._on_survey_cancelled)
-        self.office_survey_wizard.survey_saved_draft.connect(self._on_survey_saved_draft)
-
-        # Resume draft survey from CaseDetailsPage
-        self.pages[Pages.SURVEY_DETAILS].resume_requested.connect(
-            self._on_resume_draft_survey
-        )
-
-        # Cancel draft survey from CaseDetailsPage
-        self.pages[Pages.SURVEY_DETAILS].cancel_requested.connect(
-            self._on_cancel_draft_survey
-        )
-
-        # Resume obstructed survey from CaseDetailsPage
-        self.pages[Pages.SURVEY_DETAILS].resume_obstructed_requested.connect(
-            self._on_resume_obstructed_survey
-        )
-
-        # Revert finalized survey to draft from CaseDetailsPage
-        self.pages[Pages.SURVEY_DETAILS].revert_requested.connect(
-            self._on_revert_survey_to_draft
-        )
+        page.add_claim_clicked.connect(self._start_new_office_survey)
 
-        # Claim Details page signals
-        self.pages[Pages.CLAIM_DETAILS].back_requested.connect(
-            self._on_claim_details_back
-        )
-        self.pages[Pages.CLAIM_DETAILS].edit_requested.connect(
-            self._on_edit_claim_requested
-        )
+    def _wire_claims_page(self, page):
+        # Completed Claims - view claim details
+        page.claim_selected.connect(self._on_completed_claim_selected)
 
+    def _wire_case_details_page(self, page):
+        # Case Details - back to source page (draft or finalized)
+        page.back_requested.connect(self._on_case_details_back)
+        # Resume / cancel / resume-obstructed / revert from CaseDetailsPage
+        page.resume_requested.connect(self._on_resume_draft_survey)
+        page.cancel_requested.connect(self._on_cancel_draft_survey)
+        page.resume_obstructed_requested.connect(self._on_resume_obstructed_survey)
+        page.revert_requested.connect(self._on_revert_survey_to_draft)
+
+    def _wire_claim_details_page(self, page):
+        page.back_requested.connect(self._on_claim_details_back)
+        page.edit_requested.connect(self._on_edit_claim_requested)
+
+    def _wire_claim_edit_page(self, page):
         # Claim Edit - back to claim details on save (success or failure) or cancel
-        self.pages[Pages.CLAIM_EDIT].back_requested.connect(
-            lambda: self.navigate_to(Pages.CLAIM_DETAILS)
-        )
-        self.pages[Pages.CLAIM_EDIT].save_completed.connect(
-            lambda: self.navigate_to(Pages.CLAIM_DETAILS)
-        )
-
-        # Duplicates page - view comparison
-        self.pages[Pages.DUPLICATES].view_comparison_requested.connect(
-            lambda group: self.navigate_to(Pages.CLAIM_COMPARISON, group)
-        )
-
-        # Claim Comparison - back to duplicates
-        self.pages[Pages.CLAIM_COMPARISON].back_requested.connect(
-            lambda: self.navigate_to(Pages.DUPLICATES)
-        )
+        page.back_requested.connect(lambda: self.navigate_to(Pages.CLAIM_DETAILS))
+        page.save_completed.connect(lambda: self.navigate_to(Pages.CLAIM_DETAILS))
 
+    def _wire_sync_data_page(self, page):
+        page.sync_notification.connect(self._on_sync_notification)
         # Sync Data - back to field assignment
-        self.pages[Pages.SYNC_DATA].back_requested.connect(
-            lambda: self.navigate_to(Pages.FIELD_ASSIGNMENT)
-        )
-
-        # Claim Search - back to claims
-        if Pages.CLAIM_SEARCH in self.pages:
-            self.pages[Pages.CLAIM_SEARCH].back_requested.connect(
-                lambda: self.navigate_to(Pages.CLAIMS)
-            )
+        page.back_requested.connect(lambda: self.navigate_to(Pages.FIELD_ASSIGNMENT))
 
-        # Language change signal
-        self.language_changed.connect(self._on_language_changed)
+    def _on_page_built(self, page_id: str, page):
+        """Bring a freshly built page up to the current session state."""
+        if not self.current_user:
+            return
+        self._apply_user_context(page_id, page)
+        token = getattr(self, '_api_token', None)
+        if token and page_id in (Pages.BUILDINGS, Pages.FIELD_ASSIGNMENT):
+            if hasattr(page, 'building_controller'):
+                page.building_controller.set_auth_token(token)
+        if page_id == Pages.FIELD_ASSIGNMENT and self._login_ui_ready:
+            self._load_field_assignment_filters(page)
+
+    def _apply_user_context(self, page_id: str, page):
+        """Apply user/role configuration to one page."""
+        user = self.current_user
+        # Set user context on CasesPage BEFORE configure_for_role,
+        # because configure_for_role emits tab_changed which triggers refresh()
+        if page_id == Pages.SURVEYS and hasattr(page, 'configure_for_user'):
+            page.configure_for_user(user.role, str(user.user_id))
+        elif page_id == Pages.CASE_MANAGEMENT and hasattr(page, 'configure_for_user'):
+            page.configure_for_user(user.role)
+        # Apply role-based button visibility to content pages
+        if page_id in self._ROLE_CONFIGURED_PAGES and hasattr(page, 'configure_for_role'):
+            page.configure_for_role(user.role)
+
+    @staticmethod
+    def _load_field_assignment_filters(field_page):
+        # Load field assignment filter data async (requires valid API token)
+        if hasattr(field_page, '_load_filter_data_async'):
+            field_page._load_filter_data_async()
+        elif hasattr(field_page, 'load_data'):
+            field_page.load_data()
+
+    def _prebuild_pages_on_idle(self):
+        """Build the most-used pages during idle time after login."""
+        if not Config.PAGE_IDLE_PREBUILD or not self.current_user:
+            return
+        role = getattr(self.current_user, 'role', None)
+        allowed = [
+            p for p in Config.PAGE_PREBUILD_ORDER
+            if p not in self._PAGE_ROLE_ACCESS or role in self._PAGE_ROLE_ACCESS[p]
+        ]
+        self.pages.prebuild_on_idle(allowed, interval_ms=Config.PAGE_PREBUILD_INTERVAL_MS)
 
     def _show_login(self):
         """Show the login page."""
+        self._login_ui_ready = False
+        self.pages.cancel_prebuild()
         self.navbar.setVisible(False)
         self.pages[Pages.LOGIN].set_data_mode(Config.DATA_MODE, self.db)
         self.stack.setCurrentWidget(self.pages[Pages.LOGIN])
@@ -624,8 +617,9 @@ class MainWindow(QMainWindow):
         from PyQt5.QtCore import QTimer
         QTimer.singleShot(100, lambda: self._finish_login_ui(user))
 
-        # Refresh vocabularies in background (fire-and-forget)
+        # Revalidate vocabularies and cached reference data in background (fire-and-forget)
         from services.api_worker import ApiWorker
+        from services.task_executor import Priority
 
         def _background_vocab_refresh():
             try:
@@ -634,9 +628,22 @@ class MainWindow(QMainWindow):
                 logger.info("Vocabularies refreshed after login")
             except Exception as e:
                 logger.warning(f"Vocab refresh failed (non-critical): {e}")
+            try:
+                from services.reference_data_cache import get_reference_data_cache
+                cache = get_reference_data_cache()
+                cache.refresh(exclude=("vocabularies",))  # revalidated just above
+                cache.log_report("login")
+            except Exception as e:
+                logger.warning(f"Reference data refresh failed (non-critical): {e}")
+            try:
+                # Survey changes journaled before a crash or while offline
+                from services.survey_outbox import get_survey_outbox
+                get_survey_outbox().resume()
+            except Exception as e:
+                logger.warning(f"Survey outbox resume failed: {e}")
 
         self._vocab_worker = ApiWorker(_background_vocab_refresh)
-        self._vocab_worker.start()
+        self._vocab_worker.start(priority=Priority.BACKGROUND)
 
         # Fetch admin-managed security policy from backend (fire-and-forget)
         def _background_security_policy_refresh():
@@ -645,7 +652,7 @@ class MainWindow(QMainWindow):
                 logger.warning("Security policy fetch returned no data — using local fallback")
 
         self._security_policy_worker = ApiWorker(_background_security_policy_refresh)
-        self._security_policy_worker.start()
+        self._security_policy_worker.start(priority=Priority.BACKGROUND)
 
         # Pre-initialize map services in background (tile server + landmark icons)
         import threading
@@ -687,27 +694,15 @@ class MainWindow(QMainWindow):
             name_en = getattr(user, 'full_name', '') or getattr(user, 'username', '')
             self.navbar.set_username_bilingual(name_ar, name_en)
 
-            # Set user context on CasesPage BEFORE configure_for_role,
-            # because configure_for_role emits tab_changed which triggers refresh()
-            cases_page = self.pages.get(Pages.SURVEYS)
-            if cases_page and hasattr(cases_page, 'configure_for_user'):
-                cases_page.configure_for_user(user.role, str(user.user_id))
-
-            # Set user context on CaseManagementPage
-            cm_page = self.pages.get(Pages.CASE_MANAGEMENT)
-            if cm_page and hasattr(cm_page, 'configure_for_user'):
-                cm_page.configure_for_user(user.role)
+            # Apply user/role context to pages that already exist (e.g. from
+            # a previous session). Pages built later get the same treatment
+            # from _on_page_built — including the landing page that
+            # configure_for_role builds when it emits tab_changed.
+            for page_id, page in self.pages.items():
+                self._apply_user_context(page_id, page)
 
             # Configure tabs based on user role (RBAC)
             self.navbar.configure_for_role(user.role)
-
-            # Apply role-based button visibility to content pages
-            for page_id in (Pages.BUILDINGS, Pages.BUILDING_DETAILS, Pages.UNITS,
-                            Pages.PERSONS, Pages.IMPORT_WIZARD, Pages.IMPORT_PACKAGES,
-                            Pages.SURVEY_DETAILS, Pages.CASE_ENTITY_DETAILS):
-                page = self.pages.get(page_id)
-                if page and hasattr(page, 'configure_for_role'):
-                    page.configure_for_role(user.role)
         except Exception as e:
             logger.error(f"Error during login UI setup: {e}", exc_info=True)
         finally:
@@ -717,13 +712,14 @@ class MainWindow(QMainWindow):
         # Start session timeout timer
         self._start_session_timer()
 
-        # Load field assignment filter data async (requires valid API token)
-        if Pages.FIELD_ASSIGNMENT in self.pages:
-            field_page = self.pages[Pages.FIELD_ASSIGNMENT]
-            if hasattr(field_page, '_load_filter_data_async'):
-                field_page._load_filter_data_async()
-            elif hasattr(field_page, 'load_data'):
-                field_page.load_data()
+        # Field assignment filters load when that page is built; if it
+        # already exists, refresh them now that the API token is valid.
+        self._login_ui_ready = True
+        field_page = self.pages.built(Pages.FIELD_ASSIGNMENT)
+        if field_page is not None:
+            self._load_field_assignment_filters(field_page)
+
+        self._prebuild_pages_on_idle()
 
     # -- Forced Password Change (async UX flow) --
 
@@ -1038,23 +1034,22 @@ class MainWindow(QMainWindow):
             api.set_network_error_callback(self._on_network_error)
             logger.info("API token set on singleton")
 
-        # Pass token to BuildingsPage controller
-        if Pages.BUILDINGS in self.pages:
-            buildings_page = self.pages[Pages.BUILDINGS]
-            if hasattr(buildings_page, 'building_controller'):
-                buildings_page.building_controller.set_auth_token(token)
-                logger.info("API token set for BuildingController")
+        # Pass token to BuildingsPage controller (pages built later pick the
+        # token up in _on_page_built)
+        buildings_page = self.pages.built(Pages.BUILDINGS)
+        if buildings_page is not None and hasattr(buildings_page, 'building_controller'):
+            buildings_page.building_controller.set_auth_token(token)
+            logger.info("API token set for BuildingController")
 
         # Pass token to Field Work Preparation wizard controller
-        if Pages.FIELD_ASSIGNMENT in self.pages:
-            field_page = self.pages[Pages.FIELD_ASSIGNMENT]
-            if hasattr(field_page, 'building_controller'):
-                field_page.building_controller.set_auth_token(token)
-                logger.info("API token set for Field Work BuildingController")
-
-        # Pass token to OfficeSurveyWizard controller
-        if hasattr(self, 'office_survey_wizard') and self.office_survey_wizard:
-            self.office_survey_wizard.set_auth_token(token)
+        field_page = self.pages.built(Pages.FIELD_ASSIGNMENT)
+        if field_page is not None and hasattr(field_page, 'building_controller'):
+            field_page.building_controller.set_auth_token(token)
+            logger.info("API token set for Field Work BuildingController")
+
+        # Pass token to OfficeSurveyWizard controller (if already built)
+        if self._office_survey_wizard is not None:
+            self._office_survey_wizard.set_auth_token(token)
             logger.info("API token set for OfficeSurveyWizard")
 
         # Pass token to UserController
@@ -1234,11 +1229,10 @@ class MainWindow(QMainWindow):
 
             effective_ids = api_assignment_ids
 
-            # Reset wizard and navigate to sync data page
-            if Pages.FIELD_ASSIGNMENT in self.pages:
-                field_page = self.pages[Pages.FIELD_ASSIGNMENT]
-                if hasattr(field_page, 'refresh'):
-                    field_page.refresh()
+            # Reset wizard (only if it was opened) and navigate to sync data page
+            field_page = self.pages.built(Pages.FIELD_ASSIGNMENT)
+            if field_page is not None and hasattr(field_page, 'refresh'):
+                field_page.refresh()
 
             self.navigate_to(Pages.SYNC_DATA)
 
@@ -1268,7 +1262,7 @@ class MainWindow(QMainWindow):
         NOT call navigate_to here — that would yank the user off the
         report they're trying to read.
         """
-        pkg_page = self.pages.get(Pages.IMPORT_PACKAGES)
+        pkg_page = self.pages.built(Pages.IMPORT_PACKAGES)
         if pkg_page is None:
             return
         for method_name in ("_load_packages", "refresh"):
@@ -1297,7 +1291,7 @@ class MainWindow(QMainWindow):
             else Toast.WARNING if sev == "warning"
             else Toast.INFO
         )
-        target = self.pages.get(Pages.IMPORT_PACKAGES) or self
+        target = self.pages.built(Pages.IMPORT_PACKAGES) or self
         try:
             Toast.show_toast(target, message_ar, kind, duration=6000)
         except Exception:
@@ -1309,7 +1303,7 @@ class MainWindow(QMainWindow):
     def _on_import_navigate_to_duplicates(self, package_id: str = ""):
         """Navigate from import wizard to duplicates page, scoped to this package."""
         dup_page = self.pages.get(Pages.DUPLICATES)
-        import_page = self.pages.get(Pages.IMPORT_WIZARD)
+        import_page = self.pages.built(Pages.IMPORT_WIZARD)
         if not dup_page:
             return
 
@@ -1420,7 +1414,7 @@ class MainWindow(QMainWindow):
         logger.info(f"Search requested: {search_text}")
         # If on draft claims page, search within drafts
         current_page = self.stack.currentWidget()
-        if current_page == self.pages.get(Pages.SURVEYS):
+        if current_page is not None and current_page is self.pages.built(Pages.SURVEYS):
             search_mode = getattr(self.navbar, 'search_mode', 'name')
             current_page.search_claims(search_text, search_mode)
             return
@@ -1428,14 +1422,16 @@ class MainWindow(QMainWindow):
     def _on_filter_applied(self, filters: dict):
         """Handle filter applied from navbar filter popup."""
         current_page = self.stack.currentWidget()
-        if current_page == self.pages.get(Pages.SURVEYS):
+        if current_page is not None and current_page is self.pages.built(Pages.SURVEYS):
             current_page.apply_filters(filters)
 
     def navigate_to(self, page_id: str, data=None):
         """Navigate to a specific page."""
         # Check if currently in wizard with unsaved data
         current_widget = self.stack.currentWidget()
-        if current_widget == self.office_survey_wizard and page_id != "office_survey_wizard":
+        if (self._office_survey_wizard is not None
+                and current_widget == self._office_survey_wizard
+                and page_id != "office_survey_wizard"):
             if self._has_unsaved_wizard_data():
                 from ui.components.bottom_sheet import BottomSheet
                 from PyQt5.QtCore import QEventLoop
@@ -1465,8 +1461,9 @@ class MainWindow(QMainWindow):
                 if choice_result[0] == "save":
                     draft_id = self.office_survey_wizard.on_save_draft()
                     if draft_id:
-                        if Pages.SURVEYS in self.pages:
-                            self.pages[Pages.SURVEYS].refresh()
+                        surveys_page = self.pages.built(Pages.SURVEYS)
+                        if surveys_page is not None:
+                            surveys_page.refresh()
                     else:
                         logger.warning("Failed to save draft")
                         return
@@ -1499,6 +1496,8 @@ class MainWindow(QMainWindow):
 
                         if not reason_result[0]:
                             return
+                        from services.survey_outbox import get_survey_outbox
+                        get_survey_outbox().discard(survey_id)
                         try:
                             from services.api_client import get_api_client
                             api = get_api_client()
@@ -2104,7 +2103,8 @@ class MainWindow(QMainWindow):
 
     def _on_language_changed(self, is_arabic: bool):
         """Handle language change across all components."""
-        # Update all pages
+        # Update all pages that have been built (unbuilt pages are created
+        # with the current language)
         for page in self.pages.values():
             if hasattr(page, 'update_language'):
                 page.update_language(is_arabic)
@@ -2113,10 +2113,10 @@ class MainWindow(QMainWindow):
         if hasattr(self.navbar, 'update_language'):
             self.navbar.update_language(is_arabic)
 
-        # Update office survey wizard (not in self.pages)
-        if hasattr(self, 'office_survey_wizard') and self.office_survey_wizard:
-            if hasattr(self.office_survey_wizard, 'update_language'):
-                self.office_survey_wizard.update_language(is_arabic)
+        # Update office survey wizard (not in self.pages, only if built)
+        if self._office_survey_wizard is not None:
+            if hasattr(self._office_survey_wizard, 'update_language'):
+                self._office_survey_wizard.update_language(is_arabic)
 
         # Update window title
         title = Config.APP_TITLE_AR if is_arabic else Config.APP_TITLE
@@ -2131,6 +2131,11 @@ class MainWindow(QMainWindow):
                 return
 
         logger.info("Application closing")
+        try:
+            from services.api_client import get_api_client
+            get_api_client().log_cache_stats("at exit")
+        except Exception:
+            pass
         self._stop_session_timer()
         self._stop_token_refresh_timer()
         try:
@@ -2211,21 +2216,13 @@ class MainWindow(QMainWindow):
         from PyQt5.QtCore import QEvent
         if event.type() == QEvent.WindowStateChange:
             if hasattr(self, "window_frame") and self.window_frame:
+                self.window_frame.setProperty("maximized", self.isMaximized())
+                style = self.window_frame.style()
+                style.unpolish(self.window_frame)
+                style.polish(self.window_frame)
                 if self.isMaximized():
-                    self.window_frame.setStyleSheet(f"""
-                        QFrame#window_frame {{
-                            background-color: {Config.BACKGROUND_COLOR};
-                            border-radius: 0px;
-                        }}
-                    """)
                     self.window_frame.clearMask()
                 else:
-                    self.window_frame.setStyleSheet(f"""
-                        QFrame#window_frame {{
-                            background-color: {Config.BACKGROUND_COLOR};
-                            border-radius: 12px;
-                        }}
-                    """)
                     self._apply_round_mask()
         super().changeEvent(event)
 
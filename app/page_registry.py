@@ -0,0 +1,240 @@
+# -*- coding: utf-8 -*-
+"""On-demand page construction for the main window.
+
+Pages are registered as factories (module path + class name + builder) and
+are only imported and constructed the first time they are looked up. Every
+build records its import and construction time so the startup report can
+show where time goes:
+
+    [PAGE_PERF] page=<id> import_ms=<n> build_ms=<n> total_ms=<n> trigger=<nav|idle>
+
+`prebuild_on_idle()` builds a list of pages one per event-loop turn after
+login, so the most-used pages are ready before the user clicks on them
+without blocking the UI for the whole batch.
+"""
+
+import importlib
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from PyQt5.QtCore import QTimer
+from PyQt5.QtWidgets import QStackedWidget, QWidget
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class PageFactory:
+    """How to build one page: import `module`, fetch `attr`, call `build(cls)`."""
+
+    module: str
+    attr: str
+    build: Callable[[type], QWidget]
+    wire: Optional[Callable[[QWidget], None]] = None
+
+
+@dataclass
+class PageTiming:
+    """Import/construction timing for a single page."""
+
+    page_id: str
+    import_ms: float
+    build_ms: float
+    trigger: str
+
+    @property
+    def total_ms(self) -> float:
+        return self.import_ms + self.build_ms
+
+
+class LazyPageRegistry:
+    """Dict-like page container that builds pages on first access.
+
+    `registry[page_id]` and `registry.get(page_id)` build the page if needed;
+    `page_id in registry` only checks registration. `values()`/`items()`
+    iterate over pages that already exist, so broadcast operations such as
+    language changes never force a build.
+    """
+
+    def __init__(self, stack: QStackedWidget,
+                 on_built: Optional[Callable[[str, QWidget], None]] = None):
+        self._stack = stack
+        self._on_built = on_built
+        self._factories: Dict[str, PageFactory] = {}
+        self._pages: Dict[str, QWidget] = {}
+        self._timings: List[PageTiming] = []
+        self._building: set = set()
+        self._idle_queue: List[str] = []
+        self._created_at = time.perf_counter()
+
+    # -- Registration --
+
+    def register(self, page_id: str, module: str, attr: str,
+                 build: Callable[[type], QWidget],
+                 wire: Optional[Callable[[QWidget], None]] = None):
+        """Register a page factory. `wire` connects signals after construction."""
+        self._factories[page_id] = PageFactory(module, attr, build, wire)
+
+    def add(self, page_id: str, page: QWidget):
+        """Register an already-built page (e.g. the login page)."""
+        self._pages[page_id] = page
+        self._stack.addWidget(page)
+
+    # -- Dict-like access --
+
+    def __contains__(self, page_id) -> bool:
+        return page_id in self._pages or page_id in self._factories
+
+    def __getitem__(self, page_id: str) -> QWidget:
+        page = self._pages.get(page_id)
+        if page is not None:
+            return page
+        if page_id not in self._factories:
+            raise KeyError(page_id)
+        return self._build(page_id, trigger="nav")
+
+    def get(self, page_id: str, default=None):
+        if page_id not in self:
+            return default
+        return self[page_id]
+
+    def values(self):
+        return list(self._pages.values())
+
+    def items(self):
+        return list(self._pages.items())
+
+    def keys(self):
+        return list(self._pages.keys())
+
+    def built(self, page_id: str) -> Optional[QWidget]:
+        """Return the page if it has been constructed, without building it."""
+        return self._pages.get(page_id)
+
+    def is_built(self, page_id: str) -> bool:
+        return page_id in self._pages
+
+    # -- Construction --
+
+    def build_detached(self, key: str, module: str, attr: str,
+                       build: Callable[[type], QWidget],
+                       trigger: str = "nav") -> QWidget:
+        """Build a widget with timing and add it to the stack, but keep it
+        out of the page mapping (used for the office survey wizard)."""
+        widget, timing = self._timed_build(key, PageFactory(module, attr, build), trigger)
+        self._stack.addWidget(widget)
+        self._record(timing)
+        return widget
+
+    def _build(self, page_id: str, trigger: str) -> QWidget:
+        if page_id in self._building:
+            raise RuntimeError(f"Recursive construction of page '{page_id}'")
+        factory = self._factories[page_id]
+        self._building.add(page_id)
+        try:
+            page, timing = self._timed_build(page_id, factory, trigger)
+        finally:
+            self._building.discard(page_id)
+
+        self._pages[page_id] = page
+        self._stack.addWidget(page)
+        self._record(timing)
+
+        if factory.wire is not None:
+            factory.wire(page)
+        if self._on_built is not None:
+            try:
+                self._on_built(page_id, page)
+            except Exception as e:
+                logger.error(f"Post-build hook failed for page '{page_id}': {e}", exc_info=True)
+        return page
+
+    @staticmethod
+    def _timed_build(key: str, factory: PageFactory, trigger: str):
+        t0 = time.perf_counter()
+        cls = getattr(importlib.import_module(factory.module), factory.attr)
+        t1 = time.perf_counter()
+        widget = factory.build(cls)
+        t2 = time.perf_counter()
+        return widget, PageTiming(key, (t1 - t0) * 1000.0, (t2 - t1) * 1000.0, trigger)
+
+    def _record(self, timing: PageTiming):
+        self._timings.append(timing)
+        logger.info(
+            "[PAGE_PERF] page=%s import_ms=%.1f build_ms=%.1f total_ms=%.1f trigger=%s",
+            timing.page_id, timing.import_ms, timing.build_ms, timing.total_ms, timing.trigger,
+        )
+
+    # -- Idle prebuilding --
+
+    def prebuild_on_idle(self, page_ids: Iterable[str], interval_ms: int = 0):
+        """Build the given pages one per event-loop turn, skipping built ones."""
+        pending = [p for p in page_ids
+                   if p in self._factories and p not in self._pages
+                   and p not in self._idle_queue]
+        if not pending:
+            return
+        was_idle = not self._idle_queue
+        self._idle_queue.extend(pending)
+        if was_idle:
+            QTimer.singleShot(interval_ms, lambda: self._prebuild_next(interval_ms))
+
+    def cancel_prebuild(self):
+        self._idle_queue.clear()
+
+    def _prebuild_next(self, interval_ms: int):
+        while self._idle_queue:
+            page_id = self._idle_queue.pop(0)
+            if page_id in self._pages:
+                continue
+            try:
+                self._build(page_id, trigger="idle")
+            except Exception as e:
+                logger.warning(f"Idle prebuild of page '{page_id}' failed: {e}")
+            break
+        if self._idle_queue:
+            QTimer.singleShot(interval_ms, lambda: self._prebuild_next(interval_ms))
+        else:
+            self.log_startup_report()
+
+    # -- Reporting --
+
+    def timings(self) -> List[PageTiming]:
+        return list(self._timings)
+
+    def startup_report(self) -> Dict[str, Any]:
+        """Per-page import/build breakdown plus the pages still unbuilt."""
+        return {
+            "uptime_ms": round((time.perf_counter() - self._created_at) * 1000.0, 1),
+            "built": [
+                {
+                    "page": t.page_id,
+                    "import_ms": round(t.import_ms, 1),
+                    "build_ms": round(t.build_ms, 1),
+                    "total_ms": round(t.total_ms, 1),
+                    "trigger": t.trigger,
+                }
+                for t in self._timings
+            ],
+            "pending": sorted(p for p in self._factories if p not in self._pages),
+            "total_import_ms": round(sum(t.import_ms for t in self._timings), 1),
+            "total_build_ms": round(sum(t.build_ms for t in self._timings), 1),
+        }
+
+    def log_startup_report(self):
+        report = self.startup_report()
+        lines = [
+            f"  {row['page']:<24} import={row['import_ms']:>8.1f}ms "
+            f"build={row['build_ms']:>8.1f}ms total={row['total_ms']:>8.1f}ms ({row['trigger']})"
+            for row in sorted(report["built"], key=lambda r: -r["total_ms"])
+        ]
+        logger.info(
+            "[PAGE_PERF_SUMMARY] built=%d pending=%d import_ms=%.1f build_ms=%.1f\n%s",
+            len(report["built"]), len(report["pending"]),
+            report["total_import_ms"], report["total_build_ms"],
+            "\n".join(lines) or "  (no pages built)",
+        )
+        return report
@@ -0,0 +1,305 @@
+/*
+ * Minimal Mapbox Vector Tile layer for Leaflet (TRRCMS building footprints).
+ *
+ * Fetches /vtiles/{z}/{x}/{y}.pbf from the local tile server, decodes the
+ * protobuf in the browser and draws polygons / points on one canvas per
+ * tile. Decoded features are kept per tile, so clicks are hit-tested
+ * against them and fired as `click` events carrying the building's
+ * properties, and `restyle()` repaints after a selection change without
+ * refetching.
+ *
+ *   L.buildingVectorTiles(url, {style: function(props) {...}})
+ *       .on('click', function(e) { ... e.properties.building_id ... })
+ *       .addTo(map);
+ */
+(function () {
+    'use strict';
+
+    function Reader(buf) {
+        this.buf = buf;
+        this.pos = 0;
+    }
+    Reader.prototype.varint = function () {
+        var result = 0, mul = 1, b;
+        do {
+            b = this.buf[this.pos++];
+            result += (b & 0x7f) * mul;
+            mul *= 128;
+        } while (b & 0x80);
+        return result;
+    };
+    Reader.prototype.skip = function (type) {
+        if (type === 0) this.varint();
+        else if (type === 1) this.pos += 8;
+        else if (type === 2) this.pos += this.varint();
+        else if (type === 5) this.pos += 4;
+    };
+    Reader.prototype.message = function (end, onField) {
+        while (this.pos < end) {
+            var key = this.varint(), field = key >> 3, type = key & 7;
+            var start = this.pos;
+            if (onField(field, type) === false || this.pos === start) {
+                this.pos = start;
+                this.skip(type);
+            }
+        }
+    };
+
+    function readValue(r, end) {
+        var value = null;
+        r.message(end, function (field, type) {
+            if (field === 1) {
+                var len = r.varint();
+                value = new TextDecoder('utf-8').decode(r.buf.subarray(r.pos, r.pos + len));
+                r.pos += len;
+            } else if (field === 3) {
+                value = new DataView(r.buf.buffer, r.buf.byteOffset + r.pos, 8).getFloat64(0, true);
+                r.pos += 8;
+            } else if (field === 4 || field === 5) {
+                value = r.varint();
+            } else if (field === 6) {
+                var n = r.varint();
+                value = (n % 2) ? -(n + 1) / 2 : n / 2;
+            } else if (field === 7) {
+                value = !!r.varint();
+            } else {
+                return false;
+            }
+        });
+        return value;
+    }
+
+    function readPacked(r) {
+        var end = r.varint() + r.pos, out = [];
+        while (r.pos < end) out.push(r.varint());
+        return out;
+    }
+
+    function decodeTile(buf) {
+        var r = new Reader(new Uint8Array(buf)), layers = [];
+        r.message(r.buf.length, function (field) {
+            if (field !== 3) return false;
+            var end = r.varint() + r.pos;
+            var layer = {features: [], keys: [], values: [], extent: 4096};
+            r.message(end, function (f) {
+                if (f === 1) {
+                    var len = r.varint();
+                    layer.name = new TextDecoder('utf-8').decode(r.buf.subarray(r.pos, r.pos + len));
+                    r.pos += len;
+                } else if (f === 2) {
+                    var fend = r.varint() + r.pos, feature = {tags: [], geometry: [], type: 0};
+                    r.message(fend, function (ff) {
+                        if (ff === 2) feature.tags = readPacked(r);
+                        else if (ff === 3) feature.type = r.varint();
+                        else if (ff === 4) feature.geometry = readPacked(r);
+                        else return false;
+                    });
+                    layer.features.push(feature);
+                } else if (f === 3) {
+                    var klen = r.varint();
+                    layer.keys.push(new TextDecoder('utf-8').decode(r.buf.subarray(r.pos, r.pos + klen)));
+                    r.pos += klen;
+                } else if (f === 4) {
+                    layer.values.push(readValue(r, r.varint() + r.pos));
+                } else if (f === 5) {
+                    layer.extent = r.varint();
+                } else {
+                    return false;
+                }
+            });
+            layers.push(layer);
+        });
+        return layers;
+    }
+
+    function rings(cmds) {
+        var out = [], ring = null, x = 0, y = 0, i = 0;
+        while (i < cmds.length) {
+            var c = cmds[i++], id = c & 7, n = c >> 3;
+            if (id === 7) { if (ring) out.push(ring); ring = null; continue; }
+            for (var k = 0; k < n; k++) {
+                var dx = cmds[i++], dy = cmds[i++];
+                x += (dx >> 1) ^ -(dx & 1);
+                y += (dy >> 1) ^ -(dy & 1);
+                if (id === 1) { if (ring && ring.length) out.push(ring); ring = [[x, y]]; }
+                else ring.push([x, y]);
+            }
+        }
+        if (ring && ring.length) out.push(ring);
+        return out;
+    }
+
+    function pointInRing(x, y, ring) {
+        var inside = false;
+        for (var i = 0, j = ring.length - 1; i < ring.length; j = i++) {
+            var xi = ring[i][0], yi = ring[i][1], xj = ring[j][0], yj = ring[j][1];
+            if ((yi > y) !== (yj > y) && x < (xj - xi) * (y - yi) / (yj - yi) + xi) inside = !inside;
+        }
+        return inside;
+    }
+
+    L.BuildingVectorTiles = L.GridLayer.extend({
+        options: {
+            style: function () {
+                return {fill: 'rgba(59,130,246,0.35)', stroke: '#1d4ed8', width: 1, radius: 2};
+            },
+            // Extra screen pixels around point features that still count as a hit.
+            tolerance: 4
+        },
+
+        initialize: function (url, options) {
+            this._url = url;
+            this._decoded = {};
+            L.setOptions(this, options);
+        },
+
+        onAdd: function (map) {
+            L.GridLayer.prototype.onAdd.call(this, map);
+            this.on('tileunload', this._forgetTile, this);
+            map.on('click', this._onMapClick, this);
+            map.on('mousemove', this._onMapMove, this);
+        },
+
+        onRemove: function (map) {
+            map.off('click', this._onMapClick, this);
+            map.off('mousemove', this._onMapMove, this);
+            this.off('tileunload', this._forgetTile, this);
+            this._setCursor(false);
+            L.GridLayer.prototype.onRemove.call(this, map);
+        },
+
+        createTile: function (coords, done) {
+            var tile = L.DomUtil.create('canvas', 'leaflet-tile');
+            var size = this.getTileSize();
+            tile.width = size.x;
+            tile.height = size.y;
+            var url = L.Util.template(this._url, coords);
+            var key = this._tileCoordsToKey(coords);
+            var self = this;
+
+            fetch(url).then(function (resp) {
+                return resp.ok ? resp.arrayBuffer() : new ArrayBuffer(0);
+            }).then(function (buf) {
+                var features = [];
+                decodeTile(buf).forEach(function (layer) {
+                    var scale = size.x / layer.extent;
+                    layer.features.forEach(function (feature) {
+                        var props = {};
+                        for (var t = 0; t + 1 < feature.tags.length; t += 2) {
+                            props[layer.keys[feature.tags[t]]] = layer.values[feature.tags[t + 1]];
+                        }
+                        var geom = rings(feature.geometry).map(function (ring) {
+                            return ring.map(function (pt) { return [pt[0] * scale, pt[1] * scale]; });
+                        });
+                        features.push({type: feature.type, geometry: geom, properties: props});
+                    });
+                });
+                self._decoded[key] = features;
+                self._draw(tile, features);
+                done(null, tile);
+            }).catch(function (err) {
+                done(err, tile);
+            });
+            return tile;
+        },
+
+        _draw: function (tile, features) {
+            var ctx = tile.getContext('2d');
+            var style = this.options.style;
+            ctx.clearRect(0, 0, tile.width, tile.height);
+            features.forEach(function (feature) {
+                var s = style(feature.properties);
+                feature.radius = s.radius;
+                ctx.beginPath();
+                if (feature.type === 1) {
+                    feature.geometry.forEach(function (pt) {
+                        ctx.moveTo(pt[0][0] + s.radius, pt[0][1]);
+                        ctx.arc(pt[0][0], pt[0][1], s.radius, 0, 2 * Math.PI);
+                    });
+                } else {
+                    feature.geometry.forEach(function (ring) {
+                        ctx.moveTo(ring[0][0], ring[0][1]);
+                        for (var p = 1; p < ring.length; p++) ctx.lineTo(ring[p][0], ring[p][1]);
+                        ctx.closePath();
+                    });
+                }
+                ctx.fillStyle = s.fill;
+                ctx.fill('evenodd');
+                if (s.width) {
+                    ctx.strokeStyle = s.stroke;
+                    ctx.lineWidth = s.width;
+                    ctx.stroke();
+                }
+            });
+        },
+
+        // Repaint loaded tiles from their decoded features (e.g. after the
+        // selection changed) without fetching them again.
+        restyle: function () {
+            for (var key in this._tiles) {
+                var features = this._decoded[key];
+                if (features) this._draw(this._tiles[key].el, features);
+            }
+        },
+
+        // Topmost building under `latlng`: {properties, latlng} or null.
+        featureAt: function (latlng) {
+            if (!this._map || this._tileZoom === undefined) return null;
+            var size = this.getTileSize();
+            var point = this._map.project(latlng, this._tileZoom);
+            var coords = L.point(Math.floor(point.x / size.x), Math.floor(point.y / size.y));
+            coords.z = this._tileZoom;
+            var features = this._decoded[this._tileCoordsToKey(coords)];
+            if (!features) return null;
+            var x = point.x - coords.x * size.x, y = point.y - coords.y * size.y;
+            var slack = this.options.tolerance / this._map.getZoomScale(this._map.getZoom(), this._tileZoom);
+            for (var i = features.length - 1; i >= 0; i--) {
+                var feature = features[i], hit = false;
+                if (feature.type === 1) {
+                    var reach = (feature.radius || 0) + slack;
+                    hit = feature.geometry.some(function (pt) {
+                        var dx = pt[0][0] - x, dy = pt[0][1] - y;
+                        return dx * dx + dy * dy <= reach * reach;
+                    });
+                } else {
+                    var inside = false;
+                    feature.geometry.forEach(function (ring) {
+                        if (pointInRing(x, y, ring)) inside = !inside;
+                    });
+                    hit = inside;
+                }
+                if (hit) return {properties: feature.properties, latlng: latlng};
+            }
+            return null;
+        },
+
+        _onMapClick: function (e) {
+            var hit = this.featureAt(e.latlng);
+            if (hit) {
+                this.fire('click', {
+                    latlng: e.latlng,
+                    properties: hit.properties,
+                    originalEvent: e.originalEvent
+                });
+            }
+        },
+
+        _onMapMove: function (e) {
+            this._setCursor(!!this.featureAt(e.latlng));
+        },
+
+        _setCursor: function (pointer) {
+            if (!this._map || pointer === !!this._pointer) return;
+            this._pointer = pointer;
+            this._map.getContainer().style.cursor = pointer ? 'pointer' : '';
+        },
+
+        _forgetTile: function (e) {
+            delete this._decoded[this._tileCoordsToKey(e.coords)];
+        }
+    });
+
+    L.buildingVectorTiles = function (url, options) {
+        return new L.BuildingVectorTiles(url, options);
+    };
+})();
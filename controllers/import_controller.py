@@ -15,6 +15,8 @@ from PyQt5.QtCore import pyqtSignal
 
 from controllers.base_controller import BaseController, OperationResult
 from services.api_client import get_api_client
+from services.staged_snapshot import StagedSnapshot, get_staged_snapshot, release_staged_snapshot
+from services.vector_tile_service import invalidate_building_tiles
 from services.exceptions import (
     ApiException,
     NetworkException,
@@ -233,6 +235,7 @@ class ImportController(BaseController):
     def stage_package(self, package_id: str) -> OperationResult[Dict]:
         t = time.monotonic()
         logger.info(f"[import-flow] api POST /stage/{package_id} started")
+        release_staged_snapshot(package_id)
         try:
             api = get_api_client()
             result = self._with_retry(lambda: api.stage_import_package(package_id))
@@ -291,19 +294,33 @@ class ImportController(BaseController):
         except Exception as e:
             return _fail_from_exception(e, CTX_LOAD_REPORT)
 
-    def get_staged_entities(self, package_id: str) -> OperationResult[Dict]:
+    def get_staged_entities(self, package_id: str, refresh: bool = False) -> OperationResult[Dict]:
+        """Grouped staged entities, from the shared per-package snapshot."""
+        result = self.get_staged_snapshot(package_id, refresh=refresh)
+        if not result.success:
+            return result
+        return OperationResult.ok(data=result.data.data)
+
+    def get_staged_snapshot(self, package_id: str, refresh: bool = False) -> OperationResult[StagedSnapshot]:
+        """Indexed staged-entities snapshot shared by the wizard steps and
+        the comparison page; fetched once per package until released."""
         t = time.monotonic()
         try:
             api = get_api_client()
-            result = api.get_staged_entities(package_id)
-            if not isinstance(result, dict):
-                result = {}
-            latency = int((time.monotonic() - t) * 1000)
-            counts = {k: (len(v) if isinstance(v, list) else v) for k, v in result.items()}
-            logger.info(
-                f"[import-flow] api GET /staged-entities/{package_id} → {counts} latency={latency}ms"
-            )
-            return OperationResult.ok(data=result)
+            loaded = []
+
+            def _load(pkg_id):
+                loaded.append(True)
+                return api.get_staged_entities(pkg_id)
+
+            snapshot = get_staged_snapshot(package_id, loader=_load, refresh=refresh)
+            if loaded:
+                latency = int((time.monotonic() - t) * 1000)
+                counts = {k: (len(v) if isinstance(v, list) else v) for k, v in snapshot.data.items()}
+                logger.info(
+                    f"[import-flow] api GET /staged-entities/{package_id} → {counts} latency={latency}ms"
+                )
+            return OperationResult.ok(data=snapshot)
         except (ApiException, NetworkException) as e:
             latency = int((time.monotonic() - t) * 1000)
             trace = getattr(e, "trace_id", "") or ""
@@ -318,6 +335,7 @@ class ImportController(BaseController):
     def detect_duplicates(self, package_id: str) -> OperationResult[Dict]:
         t = time.monotonic()
         logger.info(f"[import-flow] api POST /detect-duplicates/{package_id} started")
+        release_staged_snapshot(package_id)
         try:
             api = get_api_client()
             data = api.detect_duplicates(package_id)
@@ -337,11 +355,49 @@ class ImportController(BaseController):
         except Exception as e:
             return _fail_from_exception(e, CTX_DETECT)
 
+    def detect_local_duplicates(self, package_id: str) -> OperationResult[Dict]:
+        """Staged entities checked against the local database, without the server.
+
+        Returns {"conflicts": [...], "summary": {...}} in the backend
+        conflict-list / summary shapes.
+        """
+        from services.duplicate_service import DuplicateService
+        from services.local_duplicate_detector import LocalDuplicateDetector
+
+        result = self.get_staged_snapshot(package_id)
+        if not result.success:
+            return result
+        snapshot = result.data
+        t = time.monotonic()
+        try:
+            found = LocalDuplicateDetector().detect(
+                {
+                    "persons": snapshot.records("persons"),
+                    "buildings": snapshot.records("buildings"),
+                    "units": snapshot.records("propertyUnits"),
+                },
+                self.db,
+                package_id=package_id,
+            )
+        except Exception as e:
+            return _fail_from_exception(e, CTX_DETECT)
+        conflicts = found["persons"] + found["buildings"] + found["units"]
+        latency = int((time.monotonic() - t) * 1000)
+        logger.info(
+            f"[import-flow] local duplicate check pkg={package_id} → {len(conflicts)} conflicts "
+            f"latency={latency}ms"
+        )
+        return OperationResult.ok(
+            data={"conflicts": conflicts, "summary": DuplicateService.compute_local_summary(conflicts)}
+        )
+
     def stage_and_detect_if_pending(
         self, package_id: str, current_status: int
     ) -> OperationResult[Dict]:
         """Stage then detect-duplicates — but only when the package is still
-        PENDING. If stage fails, do NOT call detect-duplicates."""
+        PENDING. If stage fails, do NOT call detect-duplicates. If the
+        server's detection fails, the staged entities are checked against
+        the local database instead ("local_detect")."""
         from services.import_status_map import PkgStatus
         if current_status != PkgStatus.PENDING:
             return OperationResult.ok(data={"skipped": True, "reason": "status_not_pending"})
@@ -354,9 +410,14 @@ class ImportController(BaseController):
         detect_result = self.detect_duplicates(package_id)
         if not detect_result.success:
             logger.warning(f"Duplicate detection failed after stage: {detect_result.message}")
+            local_result = self.detect_local_duplicates(package_id)
             # Stage succeeded — surface partial success but attach the detect error
             return OperationResult.ok(
-                data={"stage": stage_result.data, "detect": None},
+                data={
+                    "stage": stage_result.data,
+                    "detect": None,
+                    "local_detect": local_result.data if local_result.success else None,
+                },
                 message_ar=stage_result.message_ar,
             )
         return OperationResult.ok(
@@ -370,6 +431,7 @@ class ImportController(BaseController):
         try:
             api = get_api_client()
             data = self._with_retry(lambda: api.approve_import_package(package_id))
+            release_staged_snapshot(package_id)
             latency = int((time.monotonic() - t) * 1000)
             logger.info(f"[import-flow] api POST /approve/{package_id} OK latency={latency}ms")
             return OperationResult.ok(data=data, message_ar="تمت الموافقة على الحزمة")
@@ -392,6 +454,8 @@ class ImportController(BaseController):
             result = self._with_retry(lambda: api.commit_import_package(package_id))
             latency = int((time.monotonic() - t) * 1000)
             logger.info(f"[import-flow] api POST /commit/{package_id} OK latency={latency}ms")
+            release_staged_snapshot(package_id)
+            invalidate_building_tiles()
             self.package_committed.emit(package_id)
             return OperationResult.ok(data=result, message_ar="تم إدخال البيانات في الإنتاج")
         except (ApiException, NetworkException) as e:
@@ -444,6 +508,7 @@ class ImportController(BaseController):
         non-empty reason for the audit trail."""
         try:
             api = get_api_client()
+            release_staged_snapshot(package_id)
             return OperationResult.ok(
                 data=self._with_retry(lambda: api.reset_commit(package_id, reason=reason)),
                 message_ar="تم إعادة تعيين حالة الإدخال",
@@ -464,6 +529,7 @@ class ImportController(BaseController):
                 result = api.cancel_import_package(package_id)
             latency = int((time.monotonic() - t) * 1000)
             logger.info(f"[import-flow] api POST /cancel/{package_id} OK latency={latency}ms")
+            release_staged_snapshot(package_id)
             self.package_cancelled.emit(package_id)
             return OperationResult.ok(data=result, message_ar="تم إلغاء الحزمة")
         except (ApiException, NetworkException) as e:
@@ -480,6 +546,7 @@ class ImportController(BaseController):
     def quarantine_package(self, package_id: str) -> OperationResult[Dict]:
         try:
             api = get_api_client()
+            release_staged_snapshot(package_id)
             return OperationResult.ok(
                 data=api.quarantine_import_package(package_id),
                 message_ar="تم حجر الحزمة",
@@ -444,6 +444,10 @@ def main():
         # Set application-wide default font
         set_application_default_font()
 
+        # Compile shared StyleManager styles into one application stylesheet
+        from ui.theme_engine import ThemeEngine
+        ThemeEngine.install(app)
+
         # Initialize database in background thread so splash can animate
         splash.set_progress(0.1)
         splash.showMessage(tr("splash.initializing_db"),
@@ -490,6 +494,16 @@ def main():
                 initialize_vocabularies()
             except Exception as e:
                 logger.warning(f"Vocabularies initialization failed: {e}")
+            try:
+                from services.reference_data_cache import get_reference_data_cache  # type: ignore
+                get_reference_data_cache().log_report("startup")
+            except Exception as e:
+                logger.warning(f"Reference data report failed: {e}")
+            try:
+                from repositories.stat_counters import schedule_reconcile  # type: ignore
+                schedule_reconcile(db)
+            except Exception as e:
+                logger.warning(f"Statistics counters reconcile not scheduled: {e}")
 
         from PyQt5.QtCore import QTimer  # type: ignore
         QTimer.singleShot(0, _init_deferred)
@@ -523,4 +537,7 @@ def main():
 
 
 if __name__ == "__main__":
+    # Needed by frozen (PyInstaller) builds for process pools, e.g. batch geometry QA.
+    import multiprocessing
+    multiprocessing.freeze_support()
     main()
@@ -4,6 +4,7 @@ TRRCMS Data Models
 """
 
 from .building import Building
+from .compact_building import CompactBuilding, AdminArea, AdminHierarchy
 from .unit import PropertyUnit
 from .person import Person
 from .relation import PersonUnitRelation
@@ -14,6 +15,9 @@ from .user import User
 
 __all__ = [
     "Building",
+    "CompactBuilding",
+    "AdminArea",
+    "AdminHierarchy",
     "PropertyUnit",
     "Person",
     "PersonUnitRelation",
@@ -0,0 +1,321 @@
+# -*- coding: utf-8 -*-
+"""
+Compact building model for large in-memory building sets.
+
+`Building` carries 15 administrative-hierarchy strings per instance even
+though a city has only a few hundred neighborhoods. `CompactBuilding` keeps
+the same read API but:
+
+- is a `__slots__` dataclass (no per-instance `__dict__`),
+- references one shared, immutable `AdminArea` per distinct neighborhood
+  hierarchy (flyweight) instead of holding the names itself,
+- interns vocabulary codes (building type/status) and ID strings that repeat,
+- resolves `building_type_display` / `building_status_display` through a
+  shared per-(vocabulary, code) label cache that is dropped when the app
+  language changes or the vocabularies are refreshed.
+
+Use `CompactBuilding.from_building()` / `.to_building()` at the boundary of
+code that needs the mutable `Building` (forms, controllers, API payloads).
+"""
+
+import sys
+from dataclasses import dataclass, field
+from datetime import datetime
+from threading import Lock
+from typing import Any, Dict, Optional, Tuple, Union
+
+from models.building import Building
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_ADMIN_FIELDS = (
+    "governorate_code", "governorate_name", "governorate_name_ar",
+    "district_code", "district_name", "district_name_ar",
+    "subdistrict_code", "subdistrict_name", "subdistrict_name_ar",
+    "community_code", "community_name", "community_name_ar",
+    "neighborhood_code", "neighborhood_name", "neighborhood_name_ar",
+)
+
+
+def _intern(value):
+    """Intern repeated strings; everything else is returned unchanged."""
+    return sys.intern(value) if type(value) is str else value
+
+
+# ---------------------------------------------------------------------------
+# Administrative hierarchy flyweight
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True, slots=True)
+class AdminArea:
+    """One neighborhood and its parent hierarchy (shared, immutable)."""
+
+    governorate_code: str
+    governorate_name: str
+    governorate_name_ar: str
+    district_code: str
+    district_name: str
+    district_name_ar: str
+    subdistrict_code: str
+    subdistrict_name: str
+    subdistrict_name_ar: str
+    community_code: str
+    community_name: str
+    community_name_ar: str
+    neighborhood_code: str
+    neighborhood_name: str
+    neighborhood_name_ar: str
+
+    @property
+    def key(self) -> Tuple[str, str, str, str, str]:
+        return (self.governorate_code, self.district_code, self.subdistrict_code,
+                self.community_code, self.neighborhood_code)
+
+    @property
+    def full_address(self) -> str:
+        return f"{self.neighborhood_name}, {self.district_name}, {self.governorate_name}"
+
+    @property
+    def full_address_ar(self) -> str:
+        return f"{self.neighborhood_name_ar}، {self.district_name_ar}، {self.governorate_name_ar}"
+
+
+class AdminHierarchy:
+    """Registry of shared `AdminArea` instances keyed by codes and names.
+
+    Buildings with the same hierarchy share one instance. Buildings whose
+    codes match but whose names differ (renamed areas, stale API rows) get
+    their own instance, so every building keeps the names it was loaded
+    with.
+    """
+
+    _areas: Dict[Tuple[str, ...], AdminArea] = {}
+    _by_codes: Dict[Tuple[str, ...], AdminArea] = {}
+    _lock = Lock()
+
+    @classmethod
+    def intern(cls, **values) -> AdminArea:
+        key = tuple(str(values.get(name) or "") for name in _ADMIN_FIELDS)
+        area = cls._areas.get(key)
+        if area is not None:
+            return area
+        with cls._lock:
+            area = cls._areas.get(key)
+            if area is None:
+                area = AdminArea(*(_intern(value) for value in key))
+                cls._areas[key] = area
+                cls._by_codes.setdefault(area.key, area)
+        return area
+
+    @classmethod
+    def from_object(cls, obj) -> AdminArea:
+        return cls.intern(**{name: getattr(obj, name, "") for name in _ADMIN_FIELDS})
+
+    @classmethod
+    def get(cls, governorate: str, district: str, subdistrict: str,
+            community: str, neighborhood: str) -> Optional[AdminArea]:
+        """First area registered for a code path."""
+        return cls._by_codes.get((governorate, district, subdistrict, community, neighborhood))
+
+    @classmethod
+    def size(cls) -> int:
+        return len(cls._areas)
+
+    @classmethod
+    def clear(cls):
+        with cls._lock:
+            cls._areas.clear()
+            cls._by_codes.clear()
+
+
+# ---------------------------------------------------------------------------
+# Shared display-label cache
+# ---------------------------------------------------------------------------
+
+_label_cache: Dict[Tuple[str, Any], str] = {}
+_listener_registered = False
+
+
+def _ensure_language_listener():
+    global _listener_registered
+    if _listener_registered:
+        return
+    _listener_registered = True
+    try:
+        from services.translation_manager import TranslationManager
+        TranslationManager().on_language_changed(lambda _lang: invalidate_display_cache())
+    except Exception as e:
+        logger.warning(f"Could not register language listener for display cache: {e}")
+
+
+def invalidate_display_cache():
+    """Drop cached type/status labels (language change, vocabulary refresh)."""
+    _label_cache.clear()
+
+
+def _cached_label(kind: str, code) -> str:
+    key = (kind, code)
+    label = _label_cache.get(key)
+    if label is not None:
+        return label
+
+    from services.display_mappings import get_building_type_display, get_building_status_display
+    from services.vocab_service import is_initialized
+    resolver = get_building_type_display if kind == "type" else get_building_status_display
+    label = resolver(code)
+    # Labels resolved before vocabularies load are fallbacks; don't pin them.
+    if is_initialized():
+        _ensure_language_listener()
+        _label_cache[key] = label
+    return label
+
+
+# ---------------------------------------------------------------------------
+# Compact building
+# ---------------------------------------------------------------------------
+
+@dataclass(slots=True)
+class CompactBuilding:
+    """Memory-lean, read-mostly counterpart of `Building`."""
+
+    building_uuid: str
+    building_id: str
+    area: AdminArea
+    building_number: str = "00001"
+    building_type: Optional[Union[int, str]] = None
+    building_status: Optional[Union[int, str]] = None
+    number_of_units: int = 0
+    number_of_apartments: int = 0
+    number_of_shops: int = 0
+    number_of_floors: int = 1
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+    geo_location: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    created_by: Optional[str] = None
+    updated_by: Optional[str] = None
+    legacy_stdm_id: Optional[str] = None
+    location_description: Optional[str] = None
+    general_description: Optional[str] = None
+    is_assigned: bool = False
+    is_locked: bool = False
+    building_id_formatted: str = ""
+    _id_display: Optional[str] = field(default=None, repr=False, compare=False)
+
+    # -- Construction --
+
+    @classmethod
+    def from_building(cls, building: Building) -> "CompactBuilding":
+        return cls(
+            building_uuid=building.building_uuid,
+            building_id=building.building_id,
+            area=AdminHierarchy.from_object(building),
+            building_number=_intern(building.building_number),
+            building_type=_intern(building.building_type),
+            building_status=_intern(building.building_status),
+            number_of_units=building.number_of_units,
+            number_of_apartments=building.number_of_apartments,
+            number_of_shops=building.number_of_shops,
+            number_of_floors=building.number_of_floors,
+            latitude=building.latitude,
+            longitude=building.longitude,
+            geo_location=building.geo_location,
+            created_at=building.created_at,
+            updated_at=building.updated_at,
+            created_by=_intern(building.created_by),
+            updated_by=_intern(building.updated_by),
+            legacy_stdm_id=building.legacy_stdm_id,
+            location_description=building.location_description,
+            general_description=building.general_description,
+            is_assigned=building.is_assigned,
+            is_locked=building.is_locked,
+            building_id_formatted=building.building_id_formatted,
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "CompactBuilding":
+        """Same field mapping as `Building.from_dict`."""
+        return cls.from_building(Building.from_dict(data))
+
+    def to_building(self) -> Building:
+        """Materialize a full, mutable `Building`."""
+        values = {name: getattr(self.area, name) for name in _ADMIN_FIELDS}
+        return Building(
+            building_uuid=self.building_uuid,
+            building_id=self.building_id,
+            building_id_formatted=self.building_id_formatted or self.building_id_display,
+            building_number=self.building_number,
+            building_type=self.building_type,
+            building_status=self.building_status,
+            number_of_units=self.number_of_units,
+            number_of_apartments=self.number_of_apartments,
+            number_of_shops=self.number_of_shops,
+            number_of_floors=self.number_of_floors,
+            latitude=self.latitude,
+            longitude=self.longitude,
+            geo_location=self.geo_location,
+            created_at=self.created_at,
+            updated_at=self.updated_at,
+            created_by=self.created_by,
+            updated_by=self.updated_by,
+            legacy_stdm_id=self.legacy_stdm_id,
+            location_description=self.location_description,
+            general_description=self.general_description,
+            is_assigned=self.is_assigned,
+            is_locked=self.is_locked,
+            **values,
+        )
+
+    def to_dict(self) -> dict:
+        return self.to_building().to_dict()
+
+    # -- Administrative hierarchy (read-only, via the shared AdminArea) --
+
+    governorate_code = property(lambda self: self.area.governorate_code)
+    governorate_name = property(lambda self: self.area.governorate_name)
+    governorate_name_ar = property(lambda self: self.area.governorate_name_ar)
+    district_code = property(lambda self: self.area.district_code)
+    district_name = property(lambda self: self.area.district_name)
+    district_name_ar = property(lambda self: self.area.district_name_ar)
+    subdistrict_code = property(lambda self: self.area.subdistrict_code)
+    subdistrict_name = property(lambda self: self.area.subdistrict_name)
+    subdistrict_name_ar = property(lambda self: self.area.subdistrict_name_ar)
+    community_code = property(lambda self: self.area.community_code)
+    community_name = property(lambda self: self.area.community_name)
+    community_name_ar = property(lambda self: self.area.community_name_ar)
+    neighborhood_code = property(lambda self: self.area.neighborhood_code)
+    neighborhood_name = property(lambda self: self.area.neighborhood_name)
+    neighborhood_name_ar = property(lambda self: self.area.neighborhood_name_ar)
+
+    @property
+    def full_address(self) -> str:
+        return self.area.full_address
+
+    @property
+    def full_address_ar(self) -> str:
+        return self.area.full_address_ar
+
+    # -- Display strings --
+
+    @property
+    def building_id_display(self) -> str:
+        """Dashed building ID (language independent, computed once)."""
+        if self._id_display is None:
+            bid = self.building_id
+            if len(bid) == 17 and "-" not in bid:
+                self._id_display = (
+                    f"{bid[0:2]}-{bid[2:4]}-{bid[4:6]}-{bid[6:9]}-{bid[9:12]}-{bid[12:17]}"
+                )
+            else:
+                self._id_display = bid
+        return self._id_display
+
+    @property
+    def building_type_display(self) -> str:
+        return _cached_label("type", self.building_type)
+
+    @property
+    def building_status_display(self) -> str:
+        return _cached_label("status", self.building_status)
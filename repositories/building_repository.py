@@ -8,6 +8,8 @@ from datetime import datetime
 
 from models.building import Building
 from .database import Database
+from .search_index import has_search_index, ranked_search_sql, schedule_search_index_refresh
+from .stat_counters import counter_total, has_stat_counters, read_stat_counters
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -49,6 +51,7 @@ class BuildingRepository:
             building.created_by, building.updated_by, building.legacy_stdm_id
         )
         self.db.execute(query, params)
+        schedule_search_index_refresh(self.db, "buildings_fts")
         logger.debug(f"Created building: {building.building_id}")
         return building
 
@@ -83,7 +86,25 @@ class BuildingRepository:
         limit: int = 100,
         offset: int = 0
     ) -> List[Building]:
-        """Search buildings with filters."""
+        """Search buildings with filters.
+
+        `search_text` goes through the ranked full-text index when it
+        exists; LIKE scanning is the fallback.
+        """
+        if search_text and has_search_index(self.db, "buildings_fts"):
+            filters, filter_params = "", []
+            if neighborhood_code:
+                filters += " AND t.neighborhood_code = ?"
+                filter_params.append(neighborhood_code)
+            if building_type:
+                filters += " AND t.building_type = ?"
+                filter_params.append(building_type)
+            if building_status:
+                filters += " AND t.building_status = ?"
+                filter_params.append(building_status)
+            return self.search_ranked(search_text, limit=limit, offset=offset, filters=filters,
+                                      filter_params=tuple(filter_params))
+
         query = "SELECT * FROM buildings WHERE 1=1"
         params = []
 
@@ -117,6 +138,17 @@ class BuildingRepository:
         rows = self.db.fetch_all(query, tuple(params))
         return [self._row_to_building(row) for row in rows]
 
+    def search_ranked(self, text: str, limit: int = 100, offset: int = 0,
+                      filters: str = "", filter_params: tuple = ()) -> List[Building]:
+        """Ranked full-text search over building code/number and area names."""
+        built = ranked_search_sql(self.db, "buildings_fts", text, filters=filters,
+                                  filter_params=filter_params, limit=limit, offset=offset)
+        if built is None:
+            return []
+        query, params = built
+        rows = self.db.fetch_all(query, params)
+        return [self._row_to_building(row) for row in rows]
+
     def count(self, filters: Optional[Dict[str, Any]] = None) -> int:
         """Count buildings with optional filters."""
         query = "SELECT COUNT(*) as count FROM buildings WHERE 1=1"
@@ -165,6 +197,7 @@ class BuildingRepository:
             building.building_uuid
         )
         self.db.execute(query, params)
+        schedule_search_index_refresh(self.db, "buildings_fts")
         logger.debug(f"Updated building: {building.building_id}")
         return building
 
@@ -172,11 +205,15 @@ class BuildingRepository:
         """Delete a building by UUID."""
         query = "DELETE FROM buildings WHERE building_uuid = ?"
         self.db.execute(query, (building_uuid,))
+        schedule_search_index_refresh(self.db, "buildings_fts")
         # Verify deletion
         return self.get_by_uuid(building_uuid) is None
 
     def get_statistics(self) -> Dict[str, Any]:
         """Get building statistics for dashboard."""
+        if has_stat_counters(self.db):
+            return self._statistics_from_counters()
+
         stats = {}
 
         # Total count
@@ -215,6 +252,24 @@ class BuildingRepository:
 
         return stats
 
+    def _statistics_from_counters(self) -> Dict[str, Any]:
+        """get_statistics() from the trigger-maintained counters (no table scans)."""
+        counters = read_stat_counters(self.db, "buildings")
+        top = sorted(counters.get("neighborhood", {}).items(), key=lambda kv: kv[1], reverse=True)[:10]
+        by_neighborhood = {}
+        for code, count in top:
+            row = self.db.fetch_one(
+                "SELECT neighborhood_name FROM buildings WHERE neighborhood_code = ? LIMIT 1", (code,)
+            ) if code is not None else None
+            by_neighborhood[row["neighborhood_name"] if row else None] = count
+        return {
+            "total": counter_total(counters),
+            "by_status": counters.get("status", {}),
+            "by_type": counters.get("type", {}),
+            "by_neighborhood": by_neighborhood,
+            "total_units": counter_total(counters, "sum:units"),
+        }
+
     def get_neighborhoods(self) -> List[Dict[str, str]]:
         """Get list of unique neighborhoods."""
         query = """
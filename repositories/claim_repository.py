@@ -4,16 +4,19 @@ Claim repository for database operations.
 """
 
 from typing import List, Optional, Dict, Any
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
 import uuid
 import json
 
 from models.claim import Claim
 from .database import Database
+from .stat_counters import count_created_since, counter_total, has_stat_counters, read_stat_counters
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+_PENDING_REVIEW_STATUSES = ('submitted', 'screening', 'under_review')
+
 
 class ClaimRepository:
     """Repository for Claim CRUD operations."""
@@ -147,6 +150,12 @@ class ClaimRepository:
 
     def count(self, filters: Optional[Dict[str, Any]] = None) -> int:
         """Count claims with optional filters."""
+        if has_stat_counters(self.db) and set(filters or {}) <= {"status"}:
+            counters = read_stat_counters(self.db, "claims")
+            if filters and filters.get("status"):
+                return counters.get("status", {}).get(filters["status"], 0)
+            return counter_total(counters)
+
         query = "SELECT COUNT(*) as count FROM claims WHERE 1=1"
         params = []
 
@@ -160,6 +169,17 @@ class ClaimRepository:
 
     def get_statistics(self) -> Dict[str, Any]:
         """Get claim statistics for dashboard."""
+        if has_stat_counters(self.db):
+            counters = read_stat_counters(self.db, "claims")
+            by_status = counters.get("status", {})
+            return {
+                "total": counter_total(counters),
+                "by_status": by_status,
+                "pending_review": sum(by_status.get(s, 0) for s in _PENDING_REVIEW_STATUSES),
+                "with_conflicts": counters.get("conflict", {}).get("1", 0),
+                "recent": count_created_since(self.db, "claims", date.today() - timedelta(days=7)),
+            }
+
         stats = {}
 
         # Total count
@@ -10,7 +10,7 @@ For new code, use: from repositories.db_adapter import get_database, DatabaseFac
 """
 
 from pathlib import Path
-from typing import Optional, List, Any
+from typing import Any, Iterable, Iterator, List, Optional
 from contextlib import contextmanager
 
 from repositories.db_adapter import (
@@ -150,6 +150,39 @@ class Database:
         """
         return self._adapter.fetch_all(query, params)
 
+    def iter_rows(self, query: str, params: tuple = (), batch_size: int = 2000) -> Iterator[RowProxy]:
+        """
+        Stream query results in batches (server-side cursor on PostgreSQL).
+
+        Args:
+            query: SQL query
+            params: Query parameters
+            batch_size: Rows fetched per round trip
+
+        Returns:
+            Iterator of RowProxy objects
+        """
+        return self._adapter.iter_rows(query, params, batch_size)
+
+    def copy_rows(self, table: str, columns: List[str], rows: Iterable[tuple]) -> int:
+        """
+        Bulk-load rows (COPY FROM STDIN on PostgreSQL, batched INSERT on SQLite).
+
+        Args:
+            table: Target table
+            columns: Column names, in tuple order
+            rows: Iterable of value tuples
+
+        Returns:
+            Number of rows loaded
+        """
+        return self._adapter.copy_rows(table, columns, rows)
+
+    def pool_stats(self) -> dict:
+        """Connection pool checkout/wait metrics (PostgreSQL only)."""
+        stats = getattr(self._adapter, "pool_stats", None)
+        return stats() if stats else {}
+
     def close(self) -> None:
         """Close database connection."""
         self._adapter.close()
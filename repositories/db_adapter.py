@@ -7,13 +7,20 @@ This module is the ONLY place that should import sqlite3 or psycopg2 for the mai
 (.uhc container parsing is exempt as .uhc files are SQLite format by design)
 """
 
+import io
+import json
 import os
 import re
+import threading
+import time
+import uuid
+import weakref
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
@@ -40,8 +47,14 @@ class DatabaseConfig:
     pg_password: str = ""
     pg_pool_min: int = 2
     pg_pool_max: int = 10
+    pg_pool_timeout_s: float = 30.0  # max wait for a free pooled connection
     # SQLite settings (fallback)
     sqlite_path: Optional[Path] = None
+    sqlite_journal_mode: str = "WAL"
+    sqlite_synchronous: str = "NORMAL"
+    sqlite_cache_size_kb: int = 65536
+    sqlite_mmap_size_mb: int = 256
+    sqlite_busy_timeout_s: float = 30.0
 
     @classmethod
     def from_env(cls) -> 'DatabaseConfig':
@@ -58,59 +71,106 @@ class DatabaseConfig:
             pg_password=os.getenv("TRRCMS_DB_PASSWORD", ""),
             pg_pool_min=int(os.getenv("TRRCMS_DB_POOL_MIN", "2")),
             pg_pool_max=int(os.getenv("TRRCMS_DB_POOL_MAX", "10")),
-            sqlite_path=Path(os.getenv("TRRCMS_SQLITE_PATH", "")) if os.getenv("TRRCMS_SQLITE_PATH") else None
+            pg_pool_timeout_s=float(os.getenv("TRRCMS_DB_POOL_TIMEOUT", "30")),
+            sqlite_path=Path(os.getenv("TRRCMS_SQLITE_PATH", "")) if os.getenv("TRRCMS_SQLITE_PATH") else None,
+            sqlite_journal_mode=os.getenv("TRRCMS_SQLITE_JOURNAL_MODE", "WAL").upper(),
+            sqlite_synchronous=os.getenv("TRRCMS_SQLITE_SYNCHRONOUS", "NORMAL").upper(),
+            sqlite_cache_size_kb=int(os.getenv("TRRCMS_SQLITE_CACHE_KB", "65536")),
+            sqlite_mmap_size_mb=int(os.getenv("TRRCMS_SQLITE_MMAP_MB", "256")),
+            sqlite_busy_timeout_s=float(os.getenv("TRRCMS_SQLITE_BUSY_TIMEOUT", "30")),
         )
 
 
+class ColumnIndex:
+    """Column names of one result shape, shared by every row of that shape.
+
+    `positions` maps a name to its (last) position, matching the old
+    dict-per-row behaviour where a repeated column name kept the last value.
+    """
+
+    __slots__ = ("names", "positions")
+
+    _shapes: Dict[Tuple[str, ...], "ColumnIndex"] = {}
+
+    def __init__(self, columns: Tuple[str, ...]):
+        self.positions = {name: i for i, name in enumerate(columns)}
+        self.names = tuple(self.positions)
+
+    @classmethod
+    def for_columns(cls, columns) -> "ColumnIndex":
+        columns = tuple(columns)
+        index = cls._shapes.get(columns)
+        if index is None:
+            index = cls._shapes[columns] = cls(columns)
+        return index
+
+
 class RowProxy:
     """
     A dict-like row proxy that supports both dict access and attribute access.
     Provides consistent interface regardless of backend.
+
+    Rows store a plain value tuple plus a shared ColumnIndex, so a result
+    set does not carry one dict (and one column list) per row.
     """
 
+    __slots__ = ("_values", "_index")
+
     def __init__(self, data: Dict[str, Any], columns: Optional[List[str]] = None):
-        self._data = data
-        self._columns = columns or list(data.keys())
+        index = ColumnIndex.for_columns(columns if columns is not None else data.keys())
+        self._index = index
+        self._values = tuple(data[name] for name in index.names)
+
+    @classmethod
+    def from_values(cls, values: tuple, index: ColumnIndex) -> "RowProxy":
+        """Wrap a raw value tuple (positions must match `index`)."""
+        row = cls.__new__(cls)
+        if len(index.names) != len(values):
+            values = tuple(values[index.positions[name]] for name in index.names)
+        row._values = values
+        row._index = index
+        return row
 
     def __getitem__(self, key):
         if isinstance(key, int):
-            return self._data[self._columns[key]]
-        return self._data[key]
+            return self._values[key]
+        return self._values[self._index.positions[key]]
 
     def __getattr__(self, name):
         if name.startswith('_'):
             raise AttributeError(name)
         try:
-            return self._data[name]
+            return self._values[self._index.positions[name]]
         except KeyError:
             raise AttributeError(f"'{type(self).__name__}' has no attribute '{name}'")
 
     def __contains__(self, key):
-        return key in self._data
+        return key in self._index.positions
 
     def __iter__(self):
-        return iter(self._data.values())
+        return iter(self._values)
 
     def __len__(self):
-        return len(self._data)
+        return len(self._values)
 
     def get(self, key, default=None):
-        return self._data.get(key, default)
+        position = self._index.positions.get(key)
+        return default if position is None else self._values[position]
 
     def keys(self):
-        return self._data.keys()
+        return self._index.names
 
     def values(self):
-        return self._data.values()
+        return self._values
 
     def items(self):
-        return self._data.items()
+        return zip(self._index.names, self._values)
 
     def to_dict(self) -> Dict[str, Any]:
-        return dict(self._data)
+        return dict(zip(self._index.names, self._values))
 
     def __repr__(self):
-        return f"RowProxy({self._data})"
+        return f"RowProxy({self.to_dict()})"
 
 
 class DatabaseAdapter(ABC):
@@ -171,6 +231,17 @@ class DatabaseAdapter(ABC):
         """Initialize database schema."""
         pass
 
+    def iter_rows(self, query: str, params: Optional[Tuple] = None,
+                  batch_size: int = 2000) -> Iterator[RowProxy]:
+        """Stream rows instead of materializing the whole result."""
+        yield from self.fetch_all(query, params)
+
+    def copy_rows(self, table: str, columns: List[str], rows) -> int:
+        """Bulk-load `rows` (iterable of tuples) into `table`."""
+        placeholders = ", ".join("?" for _ in columns)
+        query = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
+        return self.execute_many(query, list(rows))
+
     @property
     @abstractmethod
     def db_type(self) -> DatabaseType:
@@ -178,21 +249,52 @@ class DatabaseAdapter(ABC):
         pass
 
 
+# Statements execute() runs without the write lock
+_READ_QUERY = re.compile(r"^\s*(SELECT|EXPLAIN)\b", re.IGNORECASE)
+
+
+class _ConnectionOwner:
+    """Thread-local marker; collected with the thread's locals when the thread ends."""
+
+    __slots__ = ("__weakref__",)
+
+
 class SQLiteAdapter(DatabaseAdapter):
-    """SQLite database adapter."""
+    """SQLite database adapter.
+
+    Tuned profile (see DatabaseConfig.sqlite_*):
+    - WAL journal with synchronous=NORMAL, a larger page cache and mmap I/O
+    - one connection per thread (the Qt main thread and each worker thread,
+      QThreads included), so readers never share a connection with a
+      writer; a thread's connection is released with its thread-local
+      storage at thread exit and closed by the next thread that connects
+    - a process-wide write lock serialising writes across those connections
+    - `transaction()` as a unit of work: statements inside it are committed
+      once at the end instead of after every `execute()`
+    """
 
-    def __init__(self, db_path: Optional[Path] = None):
+    def __init__(self, db_path: Optional[Path] = None, config: Optional[DatabaseConfig] = None):
         """Initialize SQLite adapter."""
         # Import sqlite3 only here
         import sqlite3 as _sqlite3
+        import threading
         self._sqlite3 = _sqlite3
+        self._threading = threading
 
         if db_path is None:
             from app.config import Config
             db_path = Config.DB_PATH
 
         self._db_path = db_path
-        self._connection = None
+        self._config = config or DatabaseConfig.from_env()
+        self._local = threading.local()
+        self._connections: Dict[int, Any] = {}  # owner key -> connection
+        self._next_owner = 0
+        self._released: List[int] = []  # owner keys of finished threads
+        self._connections_lock = threading.Lock()
+        self._write_lock = threading.RLock()
+        self._search_indexes_ready = None
+        self._stat_counters_ready = None
 
         # Ensure directory exists
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
@@ -206,35 +308,107 @@ class SQLiteAdapter(DatabaseAdapter):
         """Get database file path."""
         return self._db_path
 
+    @property
+    def _connection(self):
+        """Connection of the calling thread (None until connected)."""
+        return getattr(self._local, "connection", None)
+
     def connect(self) -> bool:
-        """Establish SQLite connection."""
+        """Establish the SQLite connection for the calling thread."""
         try:
             if self._connection is None:
-                self._connection = self._sqlite3.connect(
-                    str(self._db_path),
-                    check_same_thread=False,
-                    detect_types=self._sqlite3.PARSE_DECLTYPES
-                )
-                # Use dict-like row factory
-                self._connection.row_factory = self._dict_factory
-                # Enable foreign keys
-                self._connection.execute("PRAGMA foreign_keys = ON")
+                conn = self._open_connection()
+                owner = _ConnectionOwner()
+                with self._connections_lock:
+                    self._close_released()
+                    self._next_owner += 1
+                    key = self._next_owner
+                    self._connections[key] = conn
+                # Thread idents are recycled and QThreads are not in
+                # threading.enumerate(): tie the connection to the thread's
+                # locals instead
+                weakref.finalize(owner, self._release_connection, key)
+                self._local.owner = owner
+                self._local.connection = conn
+                self._local.tx_depth = 0
             return True
         except Exception as e:
             logger.error(f"SQLite connection error: {e}")
             return False
 
+    def _open_connection(self):
+        cfg = self._config
+        conn = self._sqlite3.connect(
+            str(self._db_path),
+            check_same_thread=False,
+            detect_types=self._sqlite3.PARSE_DECLTYPES,
+            timeout=cfg.sqlite_busy_timeout_s,
+        )
+        # Use dict-like row factory
+        conn.row_factory = self._dict_factory
+        # Enable foreign keys
+        conn.execute("PRAGMA foreign_keys = ON")
+        # Tuned profile
+        if cfg.sqlite_journal_mode:
+            conn.execute(f"PRAGMA journal_mode = {cfg.sqlite_journal_mode}")
+        if cfg.sqlite_synchronous:
+            conn.execute(f"PRAGMA synchronous = {cfg.sqlite_synchronous}")
+        conn.execute(f"PRAGMA cache_size = {-int(cfg.sqlite_cache_size_kb)}")
+        conn.execute(f"PRAGMA mmap_size = {int(cfg.sqlite_mmap_size_mb) * 1024 * 1024}")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        return conn
+
+    def _release_connection(self, key: int) -> None:
+        """Finalizer of a thread's locals: mark its connection for closing.
+
+        Runs during thread teardown, where closing a connection with Python
+        functions registered on it is not safe; the next connect() closes it.
+        """
+        self._released.append(key)
+
+    def _close_released(self) -> None:
+        """Close connections of finished threads (called with _connections_lock held)."""
+        while self._released:
+            conn = self._connections.pop(self._released.pop(), None)
+            if conn is not None:
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+
     def _dict_factory(self, cursor, row):
-        """Convert row to dictionary."""
-        columns = [col[0] for col in cursor.description]
-        return {col: row[idx] for idx, col in enumerate(columns)}
+        """Convert row to dictionary (column names cached per result set)."""
+        local = self._local
+        description = cursor.description
+        if description is not getattr(local, "description", None):
+            local.columns = tuple(col[0] for col in description)
+            local.description = description
+        return dict(zip(local.columns, row))
+
+    @staticmethod
+    def _column_index(cursor) -> ColumnIndex:
+        return ColumnIndex.for_columns(col[0] for col in cursor.description)
+
+    def _raw_cursor(self, conn):
+        """Cursor returning plain tuples (wrapped into RowProxy by the caller)."""
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        return cursor
 
     def close(self) -> None:
-        """Close SQLite connection."""
-        if self._connection:
-            self._connection.close()
-            self._connection = None
-            logger.info("SQLite connection closed")
+        """Close all SQLite connections."""
+        with self._connections_lock:
+            for conn in self._connections.values():
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+            closed = len(self._connections)
+            self._connections.clear()
+            self._released.clear()
+        self._local = self._threading.local()
+        if closed:
+            logger.info(f"SQLite connections closed ({closed})")
 
     def is_connected(self) -> bool:
         """Check if connected."""
@@ -246,101 +420,139 @@ class SQLiteAdapter(DatabaseAdapter):
             self.connect()
         return self._connection
 
+    def _in_transaction(self) -> bool:
+        return getattr(self._local, "tx_depth", 0) > 0
+
     def execute(self, query: str, params: Optional[Tuple] = None) -> List[RowProxy]:
-        """Execute query and return results."""
+        """Execute query and return results (reads run without the write lock)."""
+        if _READ_QUERY.match(query):
+            return self.fetch_all(query, params)
         conn = self._get_connection()
-        cursor = conn.cursor()
-        try:
-            cursor.execute(query, params or ())
-            conn.commit()
-
-            if cursor.description:
-                columns = [col[0] for col in cursor.description]
-                return [RowProxy(row, columns) for row in cursor.fetchall()]
-            return []
-        except Exception as e:
-            conn.rollback()
-            logger.error(f"SQLite execute error: {e}\nQuery: {query}")
-            raise
+        with self._write_lock:
+            cursor = self._raw_cursor(conn)
+            try:
+                cursor.execute(query, params or ())
+                rows = cursor.fetchall() if cursor.description else None
+                if not self._in_transaction():
+                    conn.commit()
+
+                if rows is not None:
+                    index = self._column_index(cursor)
+                    return [RowProxy.from_values(row, index) for row in rows]
+                return []
+            except Exception as e:
+                if not self._in_transaction():
+                    conn.rollback()
+                logger.error(f"SQLite execute error: {e}\nQuery: {query}")
+                raise
 
     def execute_many(self, query: str, params_list: List[Tuple]) -> int:
         """Execute query with multiple parameter sets."""
         conn = self._get_connection()
-        cursor = conn.cursor()
-        try:
-            cursor.executemany(query, params_list)
-            conn.commit()
-            return cursor.rowcount
-        except Exception as e:
-            conn.rollback()
-            logger.error(f"SQLite executemany error: {e}")
-            raise
+        with self._write_lock:
+            cursor = conn.cursor()
+            try:
+                cursor.executemany(query, params_list)
+                if not self._in_transaction():
+                    conn.commit()
+                return cursor.rowcount
+            except Exception as e:
+                if not self._in_transaction():
+                    conn.rollback()
+                logger.error(f"SQLite executemany error: {e}")
+                raise
 
     def fetch_one(self, query: str, params: Optional[Tuple] = None) -> Optional[RowProxy]:
         """Fetch single row."""
         conn = self._get_connection()
-        cursor = conn.cursor()
+        cursor = self._raw_cursor(conn)
         try:
             cursor.execute(query, params or ())
             row = cursor.fetchone()
             if row and cursor.description:
-                columns = [col[0] for col in cursor.description]
-                return RowProxy(row, columns)
+                return RowProxy.from_values(row, self._column_index(cursor))
             return None
         except Exception as e:
             logger.error(f"SQLite fetch_one error: {e}\nQuery: {query}")
             raise
+        finally:
+            cursor.close()
 
     def fetch_all(self, query: str, params: Optional[Tuple] = None) -> List[RowProxy]:
         """Fetch all rows."""
         conn = self._get_connection()
-        cursor = conn.cursor()
+        cursor = self._raw_cursor(conn)
         try:
             cursor.execute(query, params or ())
             if cursor.description:
-                columns = [col[0] for col in cursor.description]
-                return [RowProxy(row, columns) for row in cursor.fetchall()]
+                index = self._column_index(cursor)
+                return [RowProxy.from_values(row, index) for row in cursor.fetchall()]
             return []
         except Exception as e:
             logger.error(f"SQLite fetch_all error: {e}\nQuery: {query}")
             raise
+        finally:
+            cursor.close()
 
-    @contextmanager
-    def cursor(self) -> Iterator[Any]:
-        """Cursor context manager."""
+    def iter_rows(self, query: str, params: Optional[Tuple] = None,
+                  batch_size: int = 2000) -> Iterator[RowProxy]:
+        """Stream rows with fetchmany() instead of materializing them all."""
         conn = self._get_connection()
-        cursor = conn.cursor()
+        cursor = self._raw_cursor(conn)
         try:
-            yield cursor
-            conn.commit()
-        except Exception as e:
-            conn.rollback()
-            logger.error(f"SQLite cursor error: {e}")
-            raise
+            cursor.execute(query, params or ())
+            if not cursor.description:
+                return
+            index = self._column_index(cursor)
+            while True:
+                batch = cursor.fetchmany(batch_size)
+                if not batch:
+                    break
+                for row in batch:
+                    yield RowProxy.from_values(row, index)
         finally:
             cursor.close()
 
+    @contextmanager
+    def cursor(self) -> Iterator[Any]:
+        """Cursor context manager (one unit of work)."""
+        with self.transaction() as conn:
+            cursor = conn.cursor()
+            try:
+                yield cursor
+            finally:
+                cursor.close()
+
     @contextmanager
     def transaction(self) -> Iterator[Any]:
-        """Transaction context manager."""
+        """Unit of work: commit once on success, roll back on error.
+
+        Holds the write lock for its duration. Nested calls on the same
+        thread join the outer transaction.
+        """
         conn = self._get_connection()
-        try:
-            yield conn
-            conn.commit()
-        except Exception as e:
-            conn.rollback()
-            logger.error(f"SQLite transaction error: {e}")
-            raise
+        with self._write_lock:
+            self._local.tx_depth = getattr(self._local, "tx_depth", 0) + 1
+            outermost = self._local.tx_depth == 1
+            try:
+                yield conn
+                if outermost:
+                    conn.commit()
+            except Exception as e:
+                if outermost:
+                    conn.rollback()
+                    logger.error(f"SQLite transaction error: {e}")
+                raise
+            finally:
+                self._local.tx_depth -= 1
 
     def initialize(self) -> None:
         """Initialize SQLite schema."""
         logger.info(f"Initializing SQLite database at: {self._db_path}")
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        # Create all tables
-        self._create_tables(cursor)
-        conn.commit()
+        with self.transaction() as conn:
+            cursor = conn.cursor()
+            # Create all tables
+            self._create_tables(cursor)
         logger.info("SQLite database initialized successfully")
 
     def _create_tables(self, cursor) -> None:
@@ -907,6 +1119,14 @@ class SQLiteAdapter(DatabaseAdapter):
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_surveys_status ON surveys(status)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_surveys_source ON surveys(source)")
 
+        # Full-text search over persons/buildings (FTS5 + sync triggers)
+        from repositories.search_index import create_sqlite_search_index
+        self._search_indexes_ready = create_sqlite_search_index(cursor)
+
+        # Dashboard statistics counters (trigger-maintained)
+        from repositories.stat_counters import create_sqlite_stat_counters
+        self._stat_counters_ready = create_sqlite_stat_counters(cursor)
+
         # Seed default data
         self._seed_defaults(cursor)
 
@@ -1091,6 +1311,100 @@ class SQLiteAdapter(DatabaseAdapter):
         return result["count"] == 0 if result else True
 
 
+_QUOTED_RE = re.compile(r"('(?:[^']|'')*'|\"(?:[^\"]|\"\")*\")")
+_VALUES_RE = re.compile(r"^(?P<head>.*\bVALUES\s*)(?P<row>\([^()]*\))(?P<tail>\s*(?:ON\s+CONFLICT.*|RETURNING.*)?)$",
+                        re.IGNORECASE | re.DOTALL)
+
+
+@lru_cache(maxsize=1024)
+def _to_pyformat(query: str) -> str:
+    """`?` -> `%s` outside quoted literals/identifiers (cached per query text)."""
+    parts = _QUOTED_RE.split(query)
+    for i in range(0, len(parts), 2):
+        parts[i] = parts[i].replace("?", "%s")
+    return "".join(parts)
+
+
+@lru_cache(maxsize=256)
+def _split_values_insert(query: str) -> Optional[Tuple[str, str]]:
+    """Split `INSERT ... VALUES (%s, ...)` into (query with VALUES %s, row template)."""
+    match = _VALUES_RE.match(query.strip())
+    if not match or match.group("tail").upper().lstrip().startswith("RETURNING"):
+        return None
+    return f"{match.group('head')}%s{match.group('tail')}", match.group("row")
+
+
+def _copy_text_value(value) -> str:
+    """Encode one value for COPY ... FROM STDIN (text format)."""
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return "\\\\x" + bytes(value).hex()
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    elif isinstance(value, (dict, list)):
+        value = json.dumps(value, ensure_ascii=False, default=str)
+    return (str(value).replace("\\", "\\\\").replace("\t", "\\t")
+            .replace("\n", "\\n").replace("\r", "\\r"))
+
+
+class _CopyStream(io.TextIOBase):
+    """File-like reader that encodes rows for COPY lazily, chunk by chunk."""
+
+    def __init__(self, rows):
+        self._rows = iter(rows)
+        self._buffer = ""
+        self.row_count = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def _fill(self, size: int):
+        chunks = [self._buffer]
+        length = len(self._buffer)
+        while size < 0 or length < size:
+            row = next(self._rows, None)
+            if row is None:
+                break
+            line = "\t".join(_copy_text_value(v) for v in row) + "\n"
+            chunks.append(line)
+            length += len(line)
+            self.row_count += 1
+        self._buffer = "".join(chunks)
+
+    def read(self, size: int = -1) -> str:
+        self._fill(size if size is not None else -1)
+        if size is None or size < 0:
+            data, self._buffer = self._buffer, ""
+        else:
+            data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+    def readline(self, size: int = -1) -> str:
+        while "\n" not in self._buffer:
+            before = len(self._buffer)
+            self._fill(before + 1)
+            if len(self._buffer) == before:
+                break
+        line, sep, rest = self._buffer.partition("\n")
+        self._buffer = rest
+        return line + sep
+
+
+@dataclass
+class PoolMetrics:
+    """Connection pool checkout statistics."""
+    checkouts: int = 0
+    waits: int = 0              # checkouts that found the pool saturated
+    timeouts: int = 0
+    total_wait_ms: float = 0.0
+    max_wait_ms: float = 0.0
+    in_use: int = 0
+    peak_in_use: int = 0
+
+
 class PostgreSQLAdapter(DatabaseAdapter):
     """PostgreSQL database adapter with connection pooling and PostGIS support."""
 
@@ -1098,15 +1412,19 @@ class PostgreSQLAdapter(DatabaseAdapter):
         """Initialize PostgreSQL adapter."""
         self._config = config
         self._pool = None
+        self._pool_slots = threading.BoundedSemaphore(max(1, config.pg_pool_max))
+        self._metrics = PoolMetrics()
+        self._metrics_lock = threading.Lock()
 
         # Check for psycopg2
         try:
             import psycopg2
             from psycopg2 import pool as pg_pool
-            from psycopg2.extras import RealDictCursor
+            from psycopg2.extras import RealDictCursor, execute_values
             self._psycopg2 = psycopg2
             self._pg_pool = pg_pool
             self._RealDictCursor = RealDictCursor
+            self._execute_values = execute_values
             self._available = True
         except ImportError:
             logger.warning("psycopg2 not installed. PostgreSQL support unavailable.")
@@ -1147,23 +1465,85 @@ class PostgreSQLAdapter(DatabaseAdapter):
         if self._pool:
             self._pool.closeall()
             self._pool = None
-            logger.info("PostgreSQL connection pool closed")
+            logger.info(f"PostgreSQL connection pool closed; stats: {self.pool_stats()}")
 
     def is_connected(self) -> bool:
         """Check if pool is active."""
         return self._pool is not None
 
     def _get_connection(self):
-        """Get connection from pool."""
+        """Get connection from pool, waiting (up to pg_pool_timeout_s) when saturated.
+
+        ThreadedConnectionPool raises immediately once pg_pool_max
+        connections are out; the slot semaphore turns that into a bounded
+        wait and records how long callers waited.
+        """
         if not self._pool:
             if not self.connect():
                 raise RuntimeError("Could not connect to PostgreSQL")
-        return self._pool.getconn()
+
+        waited = not self._pool_slots.acquire(blocking=False)
+        wait_ms = 0.0
+        if waited:
+            t0 = time.perf_counter()
+            acquired = self._pool_slots.acquire(timeout=self._config.pg_pool_timeout_s)
+            wait_ms = (time.perf_counter() - t0) * 1000.0
+            if not acquired:
+                with self._metrics_lock:
+                    self._metrics.timeouts += 1
+                logger.error(
+                    f"[DB_POOL] checkout timed out after {wait_ms:.0f}ms "
+                    f"(pool_max={self._config.pg_pool_max})"
+                )
+                raise RuntimeError("PostgreSQL connection pool exhausted")
+
+        try:
+            conn = self._pool.getconn()
+        except Exception:
+            self._pool_slots.release()
+            raise
+
+        with self._metrics_lock:
+            m = self._metrics
+            m.checkouts += 1
+            m.in_use += 1
+            m.peak_in_use = max(m.peak_in_use, m.in_use)
+            if waited:
+                m.waits += 1
+                m.total_wait_ms += wait_ms
+                m.max_wait_ms = max(m.max_wait_ms, wait_ms)
+        if waited and wait_ms >= 100:
+            logger.warning(
+                f"[DB_POOL] saturated: waited {wait_ms:.0f}ms for a connection "
+                f"(in_use={self._metrics.in_use}/{self._config.pg_pool_max})"
+            )
+        return conn
 
     def _put_connection(self, conn):
         """Return connection to pool."""
         if self._pool and conn:
             self._pool.putconn(conn)
+            with self._metrics_lock:
+                self._metrics.in_use -= 1
+            self._pool_slots.release()
+
+    def pool_stats(self) -> Dict[str, Any]:
+        """Checkout/wait/saturation metrics next to the pool size settings."""
+        with self._metrics_lock:
+            m = self._metrics
+            return {
+                "pool_min": self._config.pg_pool_min,
+                "pool_max": self._config.pg_pool_max,
+                "in_use": m.in_use,
+                "peak_in_use": m.peak_in_use,
+                "saturation": round(m.in_use / self._config.pg_pool_max, 2) if self._config.pg_pool_max else 0.0,
+                "checkouts": m.checkouts,
+                "waits": m.waits,
+                "wait_ratio": round(m.waits / m.checkouts, 4) if m.checkouts else 0.0,
+                "avg_wait_ms": round(m.total_wait_ms / m.waits, 1) if m.waits else 0.0,
+                "max_wait_ms": round(m.max_wait_ms, 1),
+                "timeouts": m.timeouts,
+            }
 
     def execute(self, query: str, params: Optional[Tuple] = None) -> List[RowProxy]:
         """Execute query and return results."""
@@ -1172,13 +1552,13 @@ class PostgreSQLAdapter(DatabaseAdapter):
 
         conn = self._get_connection()
         try:
-            with conn.cursor(cursor_factory=self._RealDictCursor) as cursor:
+            with conn.cursor() as cursor:
                 cursor.execute(query, params)
                 conn.commit()
 
                 if cursor.description:
-                    columns = [col.name for col in cursor.description]
-                    return [RowProxy(dict(row), columns) for row in cursor.fetchall()]
+                    index = ColumnIndex.for_columns(col.name for col in cursor.description)
+                    return [RowProxy.from_values(row, index) for row in cursor.fetchall()]
                 return []
         except Exception as e:
             conn.rollback()
@@ -1187,16 +1567,31 @@ class PostgreSQLAdapter(DatabaseAdapter):
         finally:
             self._put_connection(conn)
 
-    def execute_many(self, query: str, params_list: List[Tuple]) -> int:
-        """Execute query with multiple parameter sets."""
+    def execute_many(self, query: str, params_list: List[Tuple], page_size: int = 1000) -> int:
+        """Execute query with multiple parameter sets.
+
+        `INSERT ... VALUES (...)` statements are sent as multi-row VALUES
+        pages via execute_values; anything else falls back to executemany.
+        """
         query = self._convert_placeholders(query)
+        split = _split_values_insert(query)
 
         conn = self._get_connection()
         try:
             with conn.cursor() as cursor:
-                cursor.executemany(query, params_list)
+                if split is None:
+                    cursor.executemany(query, params_list)
+                    total = cursor.rowcount
+                else:
+                    values_query, template = split
+                    total = 0
+                    for start in range(0, len(params_list), page_size):
+                        page = params_list[start:start + page_size]
+                        self._execute_values(cursor, values_query, page,
+                                             template=template, page_size=len(page))
+                        total += max(cursor.rowcount, 0)
                 conn.commit()
-                return cursor.rowcount
+                return total
         except Exception as e:
             conn.rollback()
             logger.error(f"PostgreSQL executemany error: {e}")
@@ -1210,12 +1605,12 @@ class PostgreSQLAdapter(DatabaseAdapter):
 
         conn = self._get_connection()
         try:
-            with conn.cursor(cursor_factory=self._RealDictCursor) as cursor:
+            with conn.cursor() as cursor:
                 cursor.execute(query, params)
                 row = cursor.fetchone()
                 if row and cursor.description:
-                    columns = [col.name for col in cursor.description]
-                    return RowProxy(dict(row), columns)
+                    index = ColumnIndex.for_columns(col.name for col in cursor.description)
+                    return RowProxy.from_values(row, index)
                 return None
         except Exception as e:
             logger.error(f"PostgreSQL fetch_one error: {e}\nQuery: {query}")
@@ -1229,11 +1624,11 @@ class PostgreSQLAdapter(DatabaseAdapter):
 
         conn = self._get_connection()
         try:
-            with conn.cursor(cursor_factory=self._RealDictCursor) as cursor:
+            with conn.cursor() as cursor:
                 cursor.execute(query, params)
                 if cursor.description:
-                    columns = [col.name for col in cursor.description]
-                    return [RowProxy(dict(row), columns) for row in cursor.fetchall()]
+                    index = ColumnIndex.for_columns(col.name for col in cursor.description)
+                    return [RowProxy.from_values(row, index) for row in cursor.fetchall()]
                 return []
         except Exception as e:
             logger.error(f"PostgreSQL fetch_all error: {e}\nQuery: {query}")
@@ -1241,6 +1636,56 @@ class PostgreSQLAdapter(DatabaseAdapter):
         finally:
             self._put_connection(conn)
 
+    def iter_rows(self, query: str, params: Optional[Tuple] = None,
+                  batch_size: int = 2000) -> Iterator[RowProxy]:
+        """Stream a large result through a named server-side cursor.
+
+        Rows arrive `batch_size` at a time; the pooled connection is held
+        until the generator is exhausted or closed.
+        """
+        query = self._convert_placeholders(query)
+
+        conn = self._get_connection()
+        try:
+            with conn.cursor(name=f"trrcms_stream_{uuid.uuid4().hex[:12]}") as cursor:
+                cursor.itersize = batch_size
+                cursor.execute(query, params)
+                index = None
+                while True:
+                    batch = cursor.fetchmany(batch_size)
+                    if not batch:
+                        break
+                    if index is None:
+                        index = ColumnIndex.for_columns(col.name for col in cursor.description)
+                    for row in batch:
+                        yield RowProxy.from_values(row, index)
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            logger.error(f"PostgreSQL iter_rows error: {e}\nQuery: {query}")
+            raise
+        finally:
+            self._put_connection(conn)
+
+    def copy_rows(self, table: str, columns: List[str], rows) -> int:
+        """Bulk-load rows with COPY ... FROM STDIN (streamed, text format)."""
+        stream = _CopyStream(rows)
+        sql = f"COPY {table} ({', '.join(columns)}) FROM STDIN"
+
+        conn = self._get_connection()
+        try:
+            with conn.cursor() as cursor:
+                cursor.copy_expert(sql, stream, size=65536)
+            conn.commit()
+            logger.debug(f"COPY {table}: {stream.row_count} rows")
+            return stream.row_count
+        except Exception as e:
+            conn.rollback()
+            logger.error(f"PostgreSQL COPY error: {e}")
+            raise
+        finally:
+            self._put_connection(conn)
+
     @contextmanager
     def cursor(self) -> Iterator[Any]:
         """Cursor context manager."""
@@ -1272,9 +1717,8 @@ class PostgreSQLAdapter(DatabaseAdapter):
             self._put_connection(conn)
 
     def _convert_placeholders(self, query: str) -> str:
-        """Convert ? placeholders to %s for PostgreSQL."""
-        # Simple replacement - works for most cases
-        return query.replace("?", "%s")
+        """Convert ? placeholders to %s for PostgreSQL (cached per query)."""
+        return _to_pyformat(query)
 
     def initialize(self) -> None:
         """Initialize PostgreSQL schema with PostGIS."""
@@ -1762,6 +2206,14 @@ class PostgreSQLAdapter(DatabaseAdapter):
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_conflicts_priority ON conflicts(priority)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_conflicts_type ON conflicts(conflict_type)")
 
+        # Trigram search over normalized person/building text (pg_trgm)
+        from repositories.search_index import create_postgres_search_index
+        create_postgres_search_index(cursor)
+
+        # Dashboard statistics counters (trigger-maintained)
+        from repositories.stat_counters import create_postgres_stat_counters
+        create_postgres_stat_counters(cursor)
+
         # Seed defaults
         self._seed_defaults(cursor)
 
@@ -1886,7 +2338,7 @@ class DatabaseFactory:
                 logger.warning("PostgreSQL unavailable, falling back to SQLite")
 
         # Fallback to SQLite
-        adapter = SQLiteAdapter(config.sqlite_path)
+        adapter = SQLiteAdapter(config.sqlite_path, config)
         adapter.connect()
         logger.info(f"Using SQLite database: {adapter.db_path}")
         cls._instance = adapter
@@ -8,6 +8,8 @@ from datetime import datetime
 
 from models.person import Person
 from .database import Database
+from .search_index import has_search_index, ranked_search_sql, schedule_search_index_refresh
+from .stat_counters import counter_total, has_stat_counters, read_stat_counters
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -46,6 +48,7 @@ class PersonRepository:
             person.created_by, person.updated_by
         )
         self.db.execute(query, params)
+        schedule_search_index_refresh(self.db, "persons_fts")
         logger.debug(f"Created person: {person.person_id}")
         return person
 
@@ -73,7 +76,23 @@ class PersonRepository:
 
     def search(self, name: str = None, national_id: str = None,
                gender: str = None, search_text: str = None, limit: int = 50) -> List[Person]:
-        """Search persons by name, national ID, or gender."""
+        """Search persons by name, national ID, or gender.
+
+        Free text (`name`/`search_text`) goes through the ranked full-text
+        index when it exists; LIKE scanning is the fallback.
+        """
+        text = " ".join(t for t in (name, search_text) if t)
+        if text and has_search_index(self.db, "persons_fts"):
+            filters, filter_params = "", []
+            if national_id:
+                filters += " AND t.national_id LIKE ?"
+                filter_params.append(f"%{national_id}%")
+            if gender:
+                filters += " AND t.gender = ?"
+                filter_params.append(gender)
+            return self.search_ranked(text, limit=limit, filters=filters,
+                                      filter_params=tuple(filter_params))
+
         query = "SELECT * FROM persons WHERE 1=1"
         params = []
 
@@ -108,6 +127,22 @@ class PersonRepository:
         rows = self.db.fetch_all(query, tuple(params))
         return [self._row_to_person(row) for row in rows]
 
+    def search_ranked(self, text: str, limit: int = 50, offset: int = 0,
+                      filters: str = "", filter_params: tuple = ()) -> List[Person]:
+        """Ranked full-text search over names and national ID / passport.
+
+        Arabic spelling variants (hamza on alef, taa marbuta, diacritics,
+        the "ال" article) match each other; every word must match as a
+        prefix, and a digit run of three or more anywhere in an ID.
+        """
+        built = ranked_search_sql(self.db, "persons_fts", text, filters=filters,
+                                  filter_params=filter_params, limit=limit, offset=offset)
+        if built is None:
+            return []
+        query, params = built
+        rows = self.db.fetch_all(query, params)
+        return [self._row_to_person(row) for row in rows]
+
     def get_by_unit(self, unit_id: str) -> List[Person]:
         """Get all persons related to a unit."""
         query = """
@@ -121,6 +156,8 @@ class PersonRepository:
 
     def count(self) -> int:
         """Count total persons."""
+        if has_stat_counters(self.db):
+            return counter_total(read_stat_counters(self.db, "persons"))
         result = self.db.fetch_one("SELECT COUNT(*) as count FROM persons")
         return result["count"] if result else 0
 
@@ -154,6 +191,7 @@ class PersonRepository:
             person.person_id
         )
         self.db.execute(query, params)
+        schedule_search_index_refresh(self.db, "persons_fts")
         logger.debug(f"Updated person: {person.person_id}")
         return person
 
@@ -161,6 +199,7 @@ class PersonRepository:
         """Delete a person by ID."""
         query = "DELETE FROM persons WHERE person_id = ?"
         self.db.execute(query, (person_id,))
+        schedule_search_index_refresh(self.db, "persons_fts")
         return self.get_by_id(person_id) is None
 
     def _row_to_person(self, row) -> Person:
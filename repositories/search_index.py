@@ -0,0 +1,412 @@
+# -*- coding: utf-8 -*-
+"""
+Full-text search index for persons and buildings.
+
+Person and building searches used `LIKE '%text%'` over several columns,
+which cannot use an index and misses Arabic spelling variants. This module
+keeps one normalized search document per row instead:
+
+- SQLite: FTS5 tables `persons_fts` / `buildings_fts`. Each FTS row is
+  keyed through `<index>_docs` (doc = FTS rowid, key = the base table's
+  primary key), so it survives VACUUM renumbering the implicit rowids.
+  AFTER INSERT/UPDATE/DELETE triggers only mark the key dirty in plain
+  SQL, so any sqlite3 connection can write the base tables; the dirty
+  documents are normalized in Python by a background task the writes
+  schedule (schedule_search_index_refresh()), never by a search.
+  ID / code columns also go into a trigram table `<index>_sub`, so digit
+  runs match anywhere inside a national ID or building code, not only
+  as a prefix.
+- PostgreSQL: an IMMUTABLE `trrcms_normalize()` SQL function and GIN
+  trigram expression indexes (maintained by PostgreSQL itself).
+
+Normalization (identical in Python, SQLite and PostgreSQL):
+- strips harakat, superscript alef and tatweel
+- folds alef forms (أ إ آ ٱ) to ا, ة to ه, ى to ي, ؤ to و, ئ to ي
+- Arabic-Indic digits to ASCII, lower-case Latin
+- drops dashes inside digit runs so "01-01-01" matches "010101"
+
+The Arabic article is optional: documents index "الخطيب" both as written
+and as "خطيب", and query words lose a leading "ال", so either spelling
+finds the other.
+"""
+
+import re
+from typing import List, Optional, Tuple
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+NORMALIZE_FUNCTION = "trrcms_normalize"
+
+_FOLD_FROM = "أإآٱةىؤئ٠١٢٣٤٥٦٧٨٩۰۱۲۳۴۵۶۷۸۹"
+_FOLD_TO = "ااااهيوي01234567890123456789"
+_DIACRITICS = "\u064B-\u0652\u0670\u0640"  # harakat, superscript alef, tatweel
+
+_FOLD_TABLE = str.maketrans(_FOLD_FROM, _FOLD_TO)
+_DIACRITICS_RE = re.compile(f"[{_DIACRITICS}]")
+_DIGIT_DASH_RE = re.compile(r"(?<=\d)[-/](?=\d)")
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def normalize_search_text(text) -> str:
+    """Normalize Arabic/Latin text for indexing and querying."""
+    if text is None:
+        return ""
+    text = _DIACRITICS_RE.sub("", str(text))
+    text = _DIGIT_DASH_RE.sub("", text.translate(_FOLD_TABLE))
+    return text.lower()
+
+
+def search_tokens(text: str) -> List[str]:
+    return _TOKEN_RE.findall(normalize_search_text(text))
+
+
+def _strip_article(token: str) -> str:
+    return token[2:] if token.startswith("ال") and len(token) > 3 else token
+
+
+def query_tokens(text: str) -> List[str]:
+    """Search tokens of a query, without the Arabic article."""
+    return [_strip_article(t) for t in search_tokens(text)]
+
+
+def index_document(text: str) -> str:
+    """Normalized document text; article-prefixed words also appear without it."""
+    out = []
+    for token in search_tokens(text):
+        out.append(token)
+        stripped = _strip_article(token)
+        if stripped != token:
+            out.append(stripped)
+    return " ".join(out)
+
+
+def build_match_query(text: str) -> Optional[str]:
+    """FTS5 MATCH expression: every token must match as a prefix."""
+    return _prefix_match(query_tokens(text))
+
+
+def _prefix_match(tokens: List[str]) -> Optional[str]:
+    return " AND ".join(f'"{t}"*' for t in tokens) if tokens else None
+
+
+def _is_substring_token(token: str) -> bool:
+    """Digit runs long enough for the trigram table match anywhere in an ID."""
+    return token.isdigit() and len(token) >= 3
+
+
+# ---------------------------------------------------------------------------
+# Index definitions
+# ---------------------------------------------------------------------------
+
+# index -> (base table, primary key, [(fts column, [source columns])], bm25 weights)
+_INDEXES = {
+    "persons_fts": (
+        "persons",
+        "person_id",
+        [
+            ("name_ar", ["first_name_ar", "father_name_ar", "last_name_ar", "mother_name_ar"]),
+            ("name_en", ["first_name", "father_name", "last_name", "mother_name"]),
+            ("ids", ["national_id", "passport_number"]),
+        ],
+        (10.0, 5.0, 8.0),
+    ),
+    "buildings_fts": (
+        "buildings",
+        "building_uuid",
+        [
+            ("code", ["building_id", "building_number"]),
+            ("area_ar", ["neighborhood_name_ar", "district_name_ar", "community_name_ar"]),
+            ("area_en", ["neighborhood_name", "district_name", "community_name"]),
+        ],
+        (10.0, 4.0, 2.0),
+    ),
+}
+
+# index -> FTS column whose text also goes into the `<index>_sub` trigram table
+_SUBSTRING_COLUMNS = {
+    "persons_fts": "ids",
+    "buildings_fts": "code",
+}
+
+
+def _document_expr(prefix: str, columns: List[str]) -> str:
+    parts = " || ' ' || ".join(f"COALESCE({prefix}{c}, '')" for c in columns)
+    return f"{NORMALIZE_FUNCTION}({parts})"
+
+
+def create_sqlite_search_index(cursor) -> bool:
+    """Create FTS5 tables, key maps and dirty-marking triggers; index pending rows.
+
+    Returns False (and leaves LIKE search in place) if FTS5 is unavailable.
+    """
+    try:
+        for index, (table, key, columns, _weights) in _INDEXES.items():
+            cursor.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table' AND name = ?", (f"{index}_docs",)
+            )
+            if cursor.fetchone() is None:
+                # Earlier layout: FTS rowid = base rowid, triggers calling trrcms_normalize()
+                for suffix in ("ai", "ad", "au"):
+                    cursor.execute(f"DROP TRIGGER IF EXISTS {index}_{suffix}")
+                cursor.execute(f"DROP TABLE IF EXISTS {index}")
+
+            names = ", ".join(name for name, _ in columns)
+            cursor.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {index} USING fts5("
+                f"{names}, tokenize='unicode61 remove_diacritics 2', prefix='2 3')"
+            )
+            cursor.execute(f"""
+                CREATE TABLE IF NOT EXISTS {index}_docs (
+                    doc INTEGER PRIMARY KEY,
+                    key TEXT UNIQUE NOT NULL,
+                    dirty INTEGER NOT NULL DEFAULT 1
+                )
+            """)
+            cursor.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_{index}_docs_dirty ON {index}_docs(doc) WHERE dirty = 1"
+            )
+            cursor.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table' AND name = ?", (f"{index}_sub",)
+            )
+            # Documents written before the trigram table (and article
+            # variants) existed are re-indexed below.
+            reindex = cursor.fetchone() is None
+            cursor.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {index}_sub USING fts5("
+                f"{_SUBSTRING_COLUMNS[index]}, tokenize='trigram')"
+            )
+            sources = ", ".join([key] + [c for _, cols in columns for c in cols])
+            cursor.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS {index}_ai AFTER INSERT ON {table} BEGIN
+                    INSERT INTO {index}_docs(key) VALUES (new.{key})
+                        ON CONFLICT(key) DO UPDATE SET dirty = 1;
+                END
+            """)
+            cursor.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS {index}_ad AFTER DELETE ON {table} BEGIN
+                    UPDATE {index}_docs SET dirty = 1 WHERE key = old.{key};
+                END
+            """)
+            cursor.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS {index}_au AFTER UPDATE OF {sources} ON {table} BEGIN
+                    UPDATE {index}_docs SET dirty = 1 WHERE key = old.{key};
+                    INSERT INTO {index}_docs(key) VALUES (new.{key})
+                        ON CONFLICT(key) DO UPDATE SET dirty = 1;
+                END
+            """)
+
+            cursor.execute(f"SELECT COUNT(*) AS count FROM {index}_docs")
+            indexed = _first(cursor.fetchone())
+            cursor.execute(f"SELECT COUNT(*) AS count FROM {table}")
+            total = _first(cursor.fetchone())
+            if reindex or indexed != total:
+                rebuild_sqlite_search_index(cursor, index)
+            else:
+                sync_sqlite_search_index(cursor, index)
+        return True
+    except Exception as e:
+        logger.warning(f"FTS5 search index unavailable, using LIKE search: {e}")
+        return False
+
+
+def rebuild_sqlite_search_index(cursor, index: str) -> None:
+    """Re-populate one FTS table from its base table."""
+    table, key, _columns, _weights = _INDEXES[index]
+    cursor.execute(f"INSERT OR IGNORE INTO {index}_docs(key) SELECT {key} FROM {table}")
+    cursor.execute(f"UPDATE {index}_docs SET dirty = 1")
+    sync_sqlite_search_index(cursor, index)
+    logger.info(f"Rebuilt search index {index}")
+
+
+def sync_sqlite_search_index(cursor, index: str, batch_size: int = 500) -> int:
+    """Re-index the documents the triggers marked dirty; returns how many."""
+    table, key, columns, _weights = _INDEXES[index]
+    names = ", ".join(name for name, _ in columns)
+    sources = [c for _, cols in columns for c in cols]
+    substring = [name for name, _ in columns].index(_SUBSTRING_COLUMNS[index])
+    cursor.execute(f"SELECT doc, key FROM {index}_docs WHERE dirty = 1")
+    pending = [tuple(_values(row)) for row in cursor.fetchall()]
+    for start in range(0, len(pending), batch_size):
+        batch = pending[start:start + batch_size]
+        marks = ", ".join("?" for _ in batch)
+        cursor.execute(
+            f"SELECT {key}, {', '.join(sources)} FROM {table} WHERE {key} IN ({marks})",
+            tuple(k for _, k in batch),
+        )
+        rows = {values[0]: dict(zip(sources, values[1:]))
+                for values in map(_values, cursor.fetchall())}
+        for doc, k in batch:
+            cursor.execute(f"DELETE FROM {index} WHERE rowid = ?", (doc,))
+            cursor.execute(f"DELETE FROM {index}_sub WHERE rowid = ?", (doc,))
+            row = rows.get(k)
+            if row is None:
+                cursor.execute(f"DELETE FROM {index}_docs WHERE doc = ?", (doc,))
+                continue
+            texts = [" ".join(str(row[c] or "") for c in cols) for _, cols in columns]
+            docs = [index_document(text) for text in texts]
+            cursor.execute(
+                f"INSERT INTO {index}(rowid, {names}) VALUES (?, {', '.join('?' for _ in docs)})",
+                (doc, *docs),
+            )
+            cursor.execute(f"INSERT INTO {index}_sub(rowid, {_SUBSTRING_COLUMNS[index]}) VALUES (?, ?)",
+                           (doc, " ".join(search_tokens(texts[substring]))))
+        cursor.execute(f"UPDATE {index}_docs SET dirty = 0 WHERE doc IN ({marks})",
+                       tuple(doc for doc, _ in batch))
+    return len(pending)
+
+
+def has_pending_documents(db, index: str) -> bool:
+    """True if rows were written since `index` was last refreshed."""
+    if _is_postgres(db) or not has_search_index(db, index):
+        return False
+    return db.fetch_one(f"SELECT 1 FROM {index}_docs WHERE dirty = 1 LIMIT 1") is not None
+
+
+def refresh_search_index(db, index: str) -> int:
+    """Index rows written since the last refresh; returns how many."""
+    if not has_pending_documents(db, index):
+        return 0
+    with db.cursor() as cursor:
+        count = sync_sqlite_search_index(cursor, index)
+    logger.debug(f"Search index {index}: {count} documents re-indexed")
+    return count
+
+
+def schedule_search_index_refresh(db, index: str) -> bool:
+    """Queue a background refresh of `index` if rows are pending.
+
+    Called after writes (and by searches that find pending rows), so the
+    Python normalization never runs on the thread that searches. Repeated
+    calls collapse into the latest queued task.
+    """
+    from services.task_executor import Priority, get_task_executor
+
+    if not has_pending_documents(db, index):
+        return False
+    get_task_executor().submit(
+        refresh_search_index, db, index, priority=Priority.BACKGROUND, key=f"search_index.{index}",
+        on_error=lambda e: logger.warning(f"Search index {index} refresh failed: {e}"))
+    return True
+
+
+def _values(row) -> list:
+    return list(row.values()) if isinstance(row, dict) else list(row)
+
+
+def _first(row):
+    if row is None:
+        return 0
+    if isinstance(row, dict):
+        return next(iter(row.values()))
+    return row[0]
+
+
+def _sql_literal(text: str) -> str:
+    return "'" + text.replace("'", "''") + "'"
+
+
+def create_postgres_search_index(cursor) -> None:
+    """Create trrcms_normalize() and trigram expression indexes (needs pg_trgm)."""
+    cursor.execute(f"""
+        CREATE OR REPLACE FUNCTION {NORMALIZE_FUNCTION}(t text) RETURNS text AS $$
+            SELECT lower(regexp_replace(
+                translate(regexp_replace(COALESCE(t, ''), '[{_DIACRITICS}]', '', 'g'),
+                          {_sql_literal(_FOLD_FROM)}, {_sql_literal(_FOLD_TO)}),
+                '([0-9])[-/](?=[0-9])', '\\1', 'g'))
+        $$ LANGUAGE sql IMMUTABLE PARALLEL SAFE
+    """)
+    for index, (table, _key, columns, _weights) in _INDEXES.items():
+        all_columns = [c for _, cols in columns for c in cols]
+        cursor.execute(
+            f"CREATE INDEX IF NOT EXISTS idx_{index}_trgm ON {table} "
+            f"USING GIN (({_document_expr('', all_columns)}) gin_trgm_ops)"
+        )
+
+
+# ---------------------------------------------------------------------------
+# Query helpers used by the repositories
+# ---------------------------------------------------------------------------
+
+def ranked_search_sql(db, index: str, text: str, columns: str = "t.*",
+                      filters: str = "", filter_params: tuple = (),
+                      limit: int = 50, offset: int = 0) -> Optional[Tuple[str, tuple]]:
+    """Build a ranked search query over `index` for the database behind `db`.
+
+    `filters` is an extra `AND ...` clause on alias `t` with `filter_params`.
+    On SQLite, words match as prefixes and digit runs of three or more
+    anywhere inside the ID / code column. Rows written since the last
+    refresh are not searched yet; their refresh is queued in the background.
+    Returns None when the text has no searchable tokens.
+    """
+    table, key, fts_columns, weights = _INDEXES[index]
+    tokens = query_tokens(text)
+    if not tokens:
+        return None
+
+    if _is_postgres(db):
+        document = _document_expr("t.", [c for _, cols in fts_columns for c in cols])
+        like_clauses = " AND ".join(f"{document} LIKE ?" for _ in tokens)
+        query = (
+            f"SELECT {columns}, similarity({document}, ?) AS search_rank FROM {table} t "
+            f"WHERE {like_clauses} {filters} "
+            f"ORDER BY search_rank DESC LIMIT ? OFFSET ?"
+        )
+        params = ((" ".join(tokens),) + tuple(f"%{t}%" for t in tokens)
+                  + tuple(filter_params) + (limit, offset))
+        return query, params
+
+    schedule_search_index_refresh(db, index)
+    substrings = [t for t in tokens if _is_substring_token(t)]
+    words = [t for t in tokens if not _is_substring_token(t)]
+    sub = f"{index}_sub"
+    if not words:
+        query = (
+            f"SELECT {columns}, bm25({sub}) AS search_rank "
+            f"FROM {sub} JOIN {index}_docs d ON d.doc = {sub}.rowid "
+            f"JOIN {table} t ON t.{key} = d.key "
+            f"WHERE {sub} MATCH ? {filters} "
+            f"ORDER BY search_rank LIMIT ? OFFSET ?"
+        )
+        match = " AND ".join(f'"{t}"' for t in substrings)
+        return query, (match,) + tuple(filter_params) + (limit, offset)
+
+    weight_args = ", ".join(str(w) for w in weights)
+    substring_filters = "".join(
+        f" AND d.doc IN (SELECT rowid FROM {sub} WHERE {sub} MATCH ?)" for _ in substrings
+    )
+    query = (
+        f"SELECT {columns}, bm25({index}, {weight_args}) AS search_rank "
+        f"FROM {index} JOIN {index}_docs d ON d.doc = {index}.rowid "
+        f"JOIN {table} t ON t.{key} = d.key "
+        f"WHERE {index} MATCH ?{substring_filters} {filters} "
+        f"ORDER BY search_rank LIMIT ? OFFSET ?"
+    )
+    params = (_prefix_match(words),) + tuple(f'"{t}"' for t in substrings)
+    return query, params + tuple(filter_params) + (limit, offset)
+
+
+def has_search_index(db, index: str) -> bool:
+    """True if `index` can be queried on this database (checked once per adapter)."""
+    if _is_postgres(db):
+        return True
+    adapter = getattr(db, "_adapter", db)
+    ready = getattr(adapter, "_search_indexes_ready", None)
+    if ready is None:
+        try:
+            rows = db.fetch_all(
+                "SELECT name FROM sqlite_master WHERE type = 'table' "
+                "AND (name LIKE '%_fts' OR name LIKE '%_fts_docs' OR name LIKE '%_fts_sub')"
+            )
+            needed = {f"{i}{suffix}" for i in _INDEXES for suffix in ("", "_docs", "_sub")}
+            ready = {row["name"] for row in rows} >= needed
+        except Exception:
+            ready = False
+        adapter._search_indexes_ready = ready
+    return bool(ready)
+
+
+def _is_postgres(db) -> bool:
+    from repositories.db_adapter import DatabaseType
+    return getattr(db, "db_type", None) == DatabaseType.POSTGRESQL
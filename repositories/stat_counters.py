@@ -0,0 +1,364 @@
+# -*- coding: utf-8 -*-
+"""
+Incrementally maintained dashboard statistics.
+
+Dashboard statistics ran COUNT(*) / GROUP BY scans over buildings, claims
+and persons on every call, and `date(created_at) >= ?` filters that no
+index can serve. This module keeps the counts in a small counter table
+instead:
+
+    stat_counters(entity, dimension, value, count)
+
+- entity is the base table; dimension "total" (value ''), a counted
+  column ("status", "type", ...), "day" (creation date buckets,
+  'YYYY-MM-DD') or "sum:<name>" (running sum of a column, value '').
+- SQLite: AFTER INSERT/DELETE/UPDATE OF triggers upsert the affected rows
+  in the same transaction as the write.
+- PostgreSQL: one plpgsql trigger function, `trrcms_stat_counters()`,
+  with the dimensions passed as trigger arguments.
+
+Reads are a handful of primary-key rows regardless of table size. The
+counters are self-healing: reconcile_stat_counters() rebuilds them from
+the base tables and reports the drift; schedule_reconcile() runs it on
+the background task executor when it is due.
+"""
+
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Optional
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+COUNTER_TABLE = "stat_counters"
+
+# entity -> {dimension: column}
+_COUNTERS = {
+    "buildings": {
+        "status": "building_status",
+        "type": "building_type",
+        "neighborhood": "neighborhood_code",
+        "day": "created_at",
+        "sum:units": "number_of_units",
+    },
+    "property_units": {"type": "unit_type", "day": "created_at"},
+    "persons": {"day": "created_at"},
+    "claims": {
+        "status": "case_status",
+        "type": "claim_type",
+        "conflict": "has_conflict",
+        "day": "created_at",
+    },
+    "documents": {"type": "document_type", "day": "created_at"},
+}
+
+# Last reconcile time (epoch seconds in `count`)
+_META_ENTITY = "_meta"
+
+
+def _value_expr(prefix: str, dimension: str, column: str) -> str:
+    """SQLite expression of the counter value (or increment, for sums) of one row."""
+    if dimension.startswith("sum:"):
+        return f"COALESCE({prefix}{column}, 0)"
+    if dimension == "day":
+        return f"COALESCE(substr({prefix}{column}, 1, 10), '')"
+    return f"COALESCE(CAST({prefix}{column} AS TEXT), '')"
+
+
+def _pg_value_expr(dimension: str, column: str) -> str:
+    """PostgreSQL counter value of one row, as trrcms_stat_counters() derives it from to_jsonb()."""
+    text = f"(to_jsonb({column}) #>> '{{}}')"
+    if dimension == "day":
+        return f"COALESCE(left({text}, 10), '')"
+    return (f"COALESCE(CASE WHEN jsonb_typeof(to_jsonb({column})) = 'boolean' "
+            f"THEN CASE WHEN {text} = 'true' THEN '1' ELSE '0' END ELSE {text} END, '')")
+
+
+def _sqlite_delta_rows(entity: str, prefix: str, sign: int) -> str:
+    rows = [f"('{entity}', 'total', '', {sign})"]
+    for dimension, column in _COUNTERS[entity].items():
+        expr = _value_expr(prefix, dimension, column)
+        if dimension.startswith("sum:"):
+            rows.append(f"('{entity}', '{dimension}', '', {sign} * {expr})")
+        else:
+            rows.append(f"('{entity}', '{dimension}', {expr}, {sign})")
+    return (
+        f"INSERT INTO {COUNTER_TABLE}(entity, dimension, value, count) VALUES "
+        + ", ".join(rows)
+        + " ON CONFLICT(entity, dimension, value) DO UPDATE SET count = count + excluded.count;"
+    )
+
+
+def _create_counter_table(cursor) -> None:
+    cursor.execute(f"""
+        CREATE TABLE IF NOT EXISTS {COUNTER_TABLE} (
+            entity TEXT NOT NULL,
+            dimension TEXT NOT NULL,
+            value TEXT NOT NULL,
+            count BIGINT NOT NULL DEFAULT 0,
+            PRIMARY KEY (entity, dimension, value)
+        )
+    """)
+
+
+def create_sqlite_stat_counters(cursor) -> bool:
+    """Create the counter table and triggers; backfill entities never counted.
+
+    Returns False (and leaves the scanning statistics queries in place) on failure.
+    """
+    try:
+        _create_counter_table(cursor)
+        for entity, dimensions in _COUNTERS.items():
+            cursor.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS {entity}_stats_ai AFTER INSERT ON {entity} BEGIN
+                    {_sqlite_delta_rows(entity, "new.", 1)}
+                END
+            """)
+            cursor.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS {entity}_stats_ad AFTER DELETE ON {entity} BEGIN
+                    {_sqlite_delta_rows(entity, "old.", -1)}
+                END
+            """)
+            columns = ", ".join(dict.fromkeys(dimensions.values()))
+            cursor.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS {entity}_stats_au AFTER UPDATE OF {columns} ON {entity} BEGIN
+                    {_sqlite_delta_rows(entity, "old.", -1)}
+                    {_sqlite_delta_rows(entity, "new.", 1)}
+                END
+            """)
+
+            cursor.execute(
+                f"SELECT COUNT(*) AS count FROM {COUNTER_TABLE} WHERE entity = ? AND dimension = 'total'",
+                (entity,))
+            if not _first(cursor.fetchone()):
+                rebuild_stat_counters(cursor, entity)
+        return True
+    except Exception as e:
+        logger.warning(f"Statistics counters unavailable, dashboard uses table scans: {e}")
+        return False
+
+
+def create_postgres_stat_counters(cursor) -> None:
+    """Create the counter table, trrcms_stat_counters() and per-table triggers."""
+    _create_counter_table(cursor)
+    cursor.execute(f"""
+        CREATE OR REPLACE FUNCTION trrcms_stat_counters() RETURNS trigger AS $$
+        DECLARE
+            rec jsonb;
+            direction integer;
+            spec text;
+            dim text;
+            col text;
+            val text;
+            delta bigint;
+        BEGIN
+            FOR pass IN 1..2 LOOP
+                IF pass = 1 AND TG_OP IN ('DELETE', 'UPDATE') THEN
+                    rec := to_jsonb(OLD); direction := -1;
+                ELSIF pass = 2 AND TG_OP IN ('INSERT', 'UPDATE') THEN
+                    rec := to_jsonb(NEW); direction := 1;
+                ELSE
+                    CONTINUE;
+                END IF;
+                INSERT INTO {COUNTER_TABLE} VALUES (TG_TABLE_NAME, 'total', '', direction)
+                    ON CONFLICT (entity, dimension, value)
+                    DO UPDATE SET count = {COUNTER_TABLE}.count + EXCLUDED.count;
+                FOREACH spec IN ARRAY TG_ARGV LOOP
+                    dim := split_part(spec, '=', 1);
+                    col := split_part(spec, '=', 2);
+                    val := rec ->> col;
+                    delta := direction;
+                    IF dim LIKE 'sum:%' THEN
+                        delta := direction * COALESCE(val::bigint, 0);
+                        val := '';
+                    ELSIF dim = 'day' THEN
+                        val := COALESCE(left(val, 10), '');
+                    ELSIF jsonb_typeof(rec -> col) = 'boolean' THEN
+                        val := CASE WHEN val = 'true' THEN '1' ELSE '0' END;
+                    ELSE
+                        val := COALESCE(val, '');
+                    END IF;
+                    INSERT INTO {COUNTER_TABLE} VALUES (TG_TABLE_NAME, dim, val, delta)
+                        ON CONFLICT (entity, dimension, value)
+                        DO UPDATE SET count = {COUNTER_TABLE}.count + EXCLUDED.count;
+                END LOOP;
+            END LOOP;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+    """)
+    for entity, dimensions in _COUNTERS.items():
+        args = ", ".join(f"'{dimension}={column}'" for dimension, column in dimensions.items())
+        columns = ", ".join(dict.fromkeys(dimensions.values()))
+        cursor.execute(f"DROP TRIGGER IF EXISTS {entity}_stats_iud ON {entity}")
+        cursor.execute(f"DROP TRIGGER IF EXISTS {entity}_stats_u ON {entity}")
+        cursor.execute(
+            f"CREATE TRIGGER {entity}_stats_iud AFTER INSERT OR DELETE ON {entity} "
+            f"FOR EACH ROW EXECUTE FUNCTION trrcms_stat_counters({args})")
+        cursor.execute(
+            f"CREATE TRIGGER {entity}_stats_u AFTER UPDATE OF {columns} ON {entity} "
+            f"FOR EACH ROW EXECUTE FUNCTION trrcms_stat_counters({args})")
+        cursor.execute(
+            f"SELECT COUNT(*) AS count FROM {COUNTER_TABLE} WHERE entity = %s AND dimension = 'total'",
+            (entity,))
+        if not _first(cursor.fetchone()):
+            rebuild_stat_counters(cursor, entity, postgres=True)
+
+
+def rebuild_stat_counters(cursor, entity: str, postgres: bool = False) -> None:
+    """Re-populate the counters of one entity from its base table."""
+    placeholder = "%s" if postgres else "?"
+    cursor.execute(f"DELETE FROM {COUNTER_TABLE} WHERE entity = {placeholder}", (entity,))
+    cursor.execute(f"INSERT INTO {COUNTER_TABLE} SELECT '{entity}', 'total', '', COUNT(*) FROM {entity}")
+    for dimension, column in _COUNTERS[entity].items():
+        if dimension.startswith("sum:"):
+            cursor.execute(
+                f"INSERT INTO {COUNTER_TABLE} "
+                f"SELECT '{entity}', '{dimension}', '', COALESCE(SUM({column}), 0) FROM {entity}")
+            continue
+        if postgres:
+            expr = _pg_value_expr(dimension, column)
+        else:
+            expr = _value_expr("", dimension, column)
+        cursor.execute(
+            f"INSERT INTO {COUNTER_TABLE} "
+            f"SELECT '{entity}', '{dimension}', {expr}, COUNT(*) FROM {entity} GROUP BY {expr}")
+    logger.info(f"Rebuilt statistics counters for {entity}")
+
+
+def _first(row):
+    if row is None:
+        return 0
+    if isinstance(row, dict):
+        return next(iter(row.values()))
+    return row[0]
+
+
+# ---------------------------------------------------------------------------
+# Reads used by the repositories and services
+# ---------------------------------------------------------------------------
+
+def has_stat_counters(db) -> bool:
+    """True if the counters can be read on this database (checked once per adapter)."""
+    adapter = getattr(db, "_adapter", db)
+    ready = getattr(adapter, "_stat_counters_ready", None)
+    if ready is None:
+        try:
+            db.fetch_one(f"SELECT count FROM {COUNTER_TABLE} WHERE entity = ? AND dimension = ? "
+                         f"AND value = ?", ("claims", "total", ""))
+            ready = True
+        except Exception:
+            ready = False
+        adapter._stat_counters_ready = ready
+    return bool(ready)
+
+
+def read_stat_counters(db, entity: str) -> Dict[str, Dict[Optional[str], int]]:
+    """
+    Counters of one entity as {dimension: {value: count}}, without day buckets.
+
+    The empty value (NULL column) is returned as None, like GROUP BY did;
+    "total" and sums are under the key ''.
+    """
+    rows = db.fetch_all(
+        f"SELECT dimension, value, count FROM {COUNTER_TABLE} "
+        f"WHERE entity = ? AND dimension != 'day' AND count != 0",
+        (entity,))
+    counters: Dict[str, Dict[Optional[str], int]] = {}
+    for row in rows:
+        dimension = row["dimension"]
+        value = row["value"]
+        if value == "" and dimension != "total" and not dimension.startswith("sum:"):
+            value = None
+        counters.setdefault(dimension, {})[value] = row["count"]
+    return counters
+
+
+def counter_value(db, entity: str, dimension: str = "total", value: str = "") -> int:
+    """One counter by primary key, e.g. the total of an entity."""
+    row = db.fetch_one(
+        f"SELECT count FROM {COUNTER_TABLE} WHERE entity = ? AND dimension = ? AND value = ?",
+        (entity, dimension, value))
+    return int(row["count"]) if row else 0
+
+
+def counter_total(counters: Dict[str, Dict[Optional[str], int]], dimension: str = "total") -> int:
+    """The single value of "total" or a "sum:" dimension."""
+    return int(counters.get(dimension, {}).get("", 0))
+
+
+def count_created_since(db, entity: str, since) -> int:
+    """Rows of `entity` created on or after `since` (a date, datetime or 'YYYY-MM-DD')."""
+    day = since.strftime("%Y-%m-%d") if hasattr(since, "strftime") else str(since)[:10]
+    row = db.fetch_one(
+        f"SELECT COALESCE(SUM(count), 0) AS count FROM {COUNTER_TABLE} "
+        f"WHERE entity = ? AND dimension = 'day' AND value >= ? AND value != ''",
+        (entity, day))
+    return int(row["count"]) if row else 0
+
+
+# ---------------------------------------------------------------------------
+# Reconcile
+# ---------------------------------------------------------------------------
+
+def reconcile_stat_counters(db, entities: Iterable[str] = None) -> Dict[str, int]:
+    """
+    Rebuild the counters from the base tables.
+
+    Returns the drift per entity: the sum of absolute differences between
+    the counters before and after (0 when the triggers kept them exact).
+    """
+    from repositories.db_adapter import DatabaseType
+    postgres = getattr(db, "db_type", None) == DatabaseType.POSTGRESQL
+    drift = {}
+    started = time.perf_counter()
+    for entity in entities or _COUNTERS:
+        before = _snapshot(db, entity)
+        with db.transaction() as conn:
+            cursor = conn.cursor()
+            if postgres:
+                # Writers wait for the rebuild instead of updating counters mid-way
+                cursor.execute(f"LOCK TABLE {entity} IN SHARE MODE")
+            rebuild_stat_counters(cursor, entity, postgres=postgres)
+        after = _snapshot(db, entity)
+        drift[entity] = sum(abs(after.get(k, 0) - before.get(k, 0)) for k in set(before) | set(after))
+        if drift[entity]:
+            logger.warning(f"Statistics counters for {entity} drifted by {drift[entity]}, rebuilt")
+    db.execute(
+        f"DELETE FROM {COUNTER_TABLE} WHERE entity = ? AND dimension = 'reconciled'", (_META_ENTITY,))
+    db.execute(
+        f"INSERT INTO {COUNTER_TABLE}(entity, dimension, value, count) VALUES (?, 'reconciled', '', ?)",
+        (_META_ENTITY, int(time.time())))
+    logger.info(f"Reconciled statistics counters in {time.perf_counter() - started:.2f}s: {drift}")
+    return drift
+
+
+def _snapshot(db, entity: str) -> Dict[tuple, int]:
+    rows = db.fetch_all(
+        f"SELECT dimension, value, count FROM {COUNTER_TABLE} WHERE entity = ?", (entity,))
+    return {(row["dimension"], row["value"]): row["count"] for row in rows}
+
+
+def last_reconciled(db) -> Optional[datetime]:
+    row = db.fetch_one(
+        f"SELECT count FROM {COUNTER_TABLE} WHERE entity = ? AND dimension = 'reconciled'",
+        (_META_ENTITY,))
+    return datetime.fromtimestamp(row["count"]) if row else None
+
+
+def schedule_reconcile(db, interval_hours: float = None) -> bool:
+    """Queue a background reconcile if the last one is older than the interval."""
+    from app.config import Config
+    from services.task_executor import Priority, get_task_executor
+
+    interval_hours = Config.STAT_COUNTERS_RECONCILE_HOURS if interval_hours is None else interval_hours
+    if interval_hours <= 0 or not has_stat_counters(db):
+        return False
+    last = last_reconciled(db)
+    if last is not None and datetime.now() - last < timedelta(hours=interval_hours):
+        return False
+    get_task_executor().submit(
+        reconcile_stat_counters, db, priority=Priority.BACKGROUND, key="stat_counters.reconcile",
+        on_error=lambda e: logger.warning(f"Statistics counters reconcile failed: {e}"))
+    return True
@@ -6,13 +6,16 @@
     يوفر وصولاً كاملاً لجميع endpoints الخاصة بالخريطة والمباني.
 """
 
+import io
 import requests
 from requests.adapters import HTTPAdapter
 import urllib3
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Tuple
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from utils.logger import get_logger
+from services.api_entity_cache import ApiEntityCache
+from services.vector_tile_service import invalidate_building_tiles
 from services.exceptions import ApiException, NetworkException, PasswordChangeRequiredException
 
 logger = get_logger(__name__)
@@ -123,6 +126,21 @@ class ApiConfig:
                 self.timeout = Config.API_TIMEOUT
 
 
+class _ProgressBody(io.BytesIO):
+    """Request body that reports how much of it was sent (read by the HTTP layer)."""
+
+    def __init__(self, data: bytes, progress):
+        super().__init__(data)
+        self._total = len(data)
+        self._progress = progress
+
+    def read(self, size: int = -1) -> bytes:
+        block = super().read(size)
+        if block:
+            self._progress(self.tell(), self._total)
+        return block
+
+
 class TRRCMSApiClient:
     """API client for TRRCMS Backend."""
 
@@ -143,7 +161,8 @@ class TRRCMSApiClient:
         self._on_network_error = None
         self._last_network_error_time: Optional[datetime] = None
         self._session_expired_flag = False
-        self._neighborhoods_cache = None
+        # Read-through cache for single-entity GETs (see services/api_entity_cache.py)
+        self._entity_cache = ApiEntityCache.from_config()
         # Single Session for all requests — enables TCP connection reuse on the
         # LAN backend (keep-alive) and provides better RemoteDisconnected recovery
         # via urllib3's connection pool. Auth headers are injected per-request in
@@ -216,6 +235,8 @@ class TRRCMSApiClient:
             self._login_failures = 0
             self._login_cooldown_until = None
             self._session_expired_flag = False
+            # Another user may see different fields; never serve their cache.
+            self._entity_cache.clear()
             logger.info(f"Logged in as {username}")
             return data
 
@@ -278,6 +299,8 @@ class TRRCMSApiClient:
         self.access_token = None
         self.refresh_token = None
         self.token_expires_at = None
+        self._entity_cache.log_stats("at logout")
+        self._entity_cache.clear()
         # Drop the persisted refresh_token; otherwise the next launch would
         # silently revive a logged-out session.
         _clear_refresh_token()
@@ -300,7 +323,30 @@ class TRRCMSApiClient:
 
     def lock_building(self, building_id: str, is_locked: bool) -> Dict[str, Any]:
         """PUT /v1/Buildings/{id}/lock — toggle building lock state."""
-        return self._request("PUT", f"/v1/Buildings/{building_id}/lock", {"isLocked": is_locked}) or {}
+        try:
+            return self._request("PUT", f"/v1/Buildings/{building_id}/lock", {"isLocked": is_locked}) or {}
+        finally:
+            self._entity_cache.invalidate("building", building_id)
+
+    # ── Entity cache ────────────────────────────────────────────────
+
+    def cache_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-entity-type hit/miss/coalesced/eviction counters of the entity cache."""
+        return self._entity_cache.stats()
+
+    def clear_entity_cache(self):
+        """Drop every cached entity (e.g. after a bulk import or sync)."""
+        self._entity_cache.clear()
+
+    def log_cache_stats(self, reason: str = ""):
+        """Log the entity cache's [API_CACHE] hit-rate line."""
+        self._entity_cache.log_stats(reason)
+
+    def _invalidate_person(self, person_id: str):
+        """Drop a person and the claims/cases that embed claimant names."""
+        self._entity_cache.invalidate("person", person_id)
+        self._entity_cache.invalidate("claim")
+        self._entity_cache.invalidate("case")
 
     def _ensure_valid_token(self):
         """التأكد من صلاحية الـ Token قبل الطلب."""
@@ -354,8 +400,14 @@ class TRRCMSApiClient:
         skip_accept_language: bool = False,
         disable_retry: bool = False,
         timeout_override: int = 0,
+        with_response: bool = False,
     ) -> Any:
-        """Execute HTTP request with error handling and automatic retry."""
+        """
+        Execute HTTP request with error handling and automatic retry.
+
+        With with_response=True returns (result, status_code, headers) so
+        callers can read ETags and 304 Not Modified answers.
+        """
         url = f"{self.base_url}{endpoint}"
 
         import json as _json
@@ -407,6 +459,8 @@ class TRRCMSApiClient:
                     except Exception:
                         logger.info(f"[API RES] Body: {_redact_for_log(result)}")
 
+                if with_response:
+                    return result, response.status_code, response.headers
                 return result
 
             except requests.exceptions.HTTPError as e:
@@ -832,8 +886,11 @@ class TRRCMSApiClient:
         )
 
     def get_building_by_id(self, building_id: str) -> Dict[str, Any]:
-        """Get building details by ID."""
-        return self._request("GET", f"/v1/Buildings/{building_id}")
+        """Get building details by ID (served from the entity cache when fresh)."""
+        return self._entity_cache.get_or_fetch(
+            "building", building_id,
+            lambda: self._request("GET", f"/v1/Buildings/{building_id}"),
+        )
 
     def update_building_geometry(
         self,
@@ -856,11 +913,18 @@ class TRRCMSApiClient:
             raise ValueError("At least one geometry field must be provided")
 
         logger.info(f"Updating geometry for building {building_id}")
-        result = self._request(
-            "PUT",
-            f"/v1/Buildings/{building_id}/geometry",
-            json_data=payload
-        )
+        try:
+            result = self._request(
+                "PUT",
+                f"/v1/Buildings/{building_id}/geometry",
+                json_data=payload
+            )
+        finally:
+            self._entity_cache.invalidate("building", building_id)
+            invalidate_building_tiles(
+                [building_id],
+                geometries=[building_geometry_wkt] if building_geometry_wkt else (),
+            )
         logger.info(f"Geometry updated for building {building_id}")
 
         return result
@@ -894,12 +958,18 @@ class TRRCMSApiClient:
         logger.info(f"Creating building: {api_data.get('buildingId', 'N/A')}")
         result = self._request("POST", "/v1/Buildings", json_data=api_data)
         logger.info(f"Created building: {result.get('buildingId')}")
+        new_id = result.get("id") or result.get("buildingId")
+        if new_id:
+            geo_wkt = api_data.get("buildingGeometryWkt")
+            invalidate_building_tiles([new_id], geometries=[geo_wkt] if geo_wkt else ())
         return result
 
     def update_building(self, building_id: str, building_data: Dict[str, Any]) -> Dict[str, Any]:
         """Update an existing building."""
         result = None
 
+        self._entity_cache.invalidate("building", building_id)
+
         # Update general building data
         update_data = self._build_update_command(building_data)
         if update_data:
@@ -907,6 +977,7 @@ class TRRCMSApiClient:
                 logger.info(f"Updating building data: {building_id}")
                 logger.info(f"  Payload: {update_data}")
                 result = self._request("PUT", f"/v1/Buildings/{building_id}", json_data=update_data)
+                invalidate_building_tiles([building_id])
                 logger.info(f"Building data updated")
             except Exception as e:
                 logger.warning(f"Building data update failed: {e}")
@@ -997,7 +1068,12 @@ class TRRCMSApiClient:
     def delete_building(self, building_id: str) -> bool:
         """Delete a building."""
         logger.info(f"Deleting building: {building_id}")
-        self._request("DELETE", f"/v1/Buildings/{building_id}")
+        try:
+            self._request("DELETE", f"/v1/Buildings/{building_id}")
+        finally:
+            self._entity_cache.invalidate("building", building_id)
+            self._entity_cache.invalidate("building_documents", building_id)
+            invalidate_building_tiles([building_id])
         logger.info(f"Building deleted: {building_id}")
         return True
 
@@ -1008,7 +1084,10 @@ class TRRCMSApiClient:
     def get_building_documents(self, building_id: str) -> List[Dict[str, Any]]:
         """Get documents attached to a building."""
         try:
-            return self._request("GET", f"/v1/building-documents/by-building/{building_id}") or []
+            return self._entity_cache.get_or_fetch(
+                "building_documents", building_id,
+                lambda: self._request("GET", f"/v1/building-documents/by-building/{building_id}") or [],
+            )
         except Exception as e:
             logger.warning(f"Failed to fetch building documents for {building_id}: {e}")
             return []
@@ -1192,7 +1271,10 @@ class TRRCMSApiClient:
         """Update an existing property unit."""
         api_data = self._convert_property_unit_to_api_format(unit_data)
         api_data["id"] = unit_id
-        result = self._request("PUT", f"/v1/PropertyUnits/{unit_id}", json_data=api_data)
+        try:
+            result = self._request("PUT", f"/v1/PropertyUnits/{unit_id}", json_data=api_data)
+        finally:
+            self._entity_cache.invalidate("property_unit", unit_id)
         logger.info(f"Property unit updated: {unit_id}")
         return result
 
@@ -1346,8 +1428,10 @@ class TRRCMSApiClient:
         """Get a single property unit by UUID."""
         if not unit_id:
             return None
-        logger.info(f"Fetching property unit: {unit_id}")
-        return self._request("GET", f"/v1/PropertyUnits/{unit_id}")
+        return self._entity_cache.get_or_fetch(
+            "property_unit", unit_id,
+            lambda: self._request("GET", f"/v1/PropertyUnits/{unit_id}"),
+        )
 
     def delete_property_unit(self, unit_id: str) -> bool:
         """Soft-delete a property unit."""
@@ -1360,6 +1444,8 @@ class TRRCMSApiClient:
         except Exception as e:
             logger.error(f"Failed to delete property unit {unit_id}: {e}")
             return False
+        finally:
+            self._entity_cache.invalidate("property_unit", unit_id)
 
     def get_units_for_building(self, building_id: str) -> List[Dict[str, Any]]:
         """Get all property units for a building."""
@@ -1570,7 +1656,10 @@ class TRRCMSApiClient:
         api_data["id"] = person_id
 
         logger.info(f"Updating person {person_id}")
-        result = self._request("PUT", f"/v1/Persons/{person_id}", json_data=api_data)
+        try:
+            result = self._request("PUT", f"/v1/Persons/{person_id}", json_data=api_data)
+        finally:
+            self._invalidate_person(person_id)
         logger.info(f"Person {person_id} updated successfully")
         return result
 
@@ -1607,7 +1696,10 @@ class TRRCMSApiClient:
 
         endpoint = f"/v1/Surveys/{survey_id}/households/{household_id}/persons/{person_id}"
         logger.info(f"Updating person {person_id} in survey context")
-        result = self._request("PUT", endpoint, json_data=api_data)
+        try:
+            result = self._request("PUT", endpoint, json_data=api_data)
+        finally:
+            self._invalidate_person(person_id)
         logger.info(f"Person {person_id} updated in survey {survey_id}")
         return result
 
@@ -1626,7 +1718,10 @@ class TRRCMSApiClient:
             raise ValueError("person_id is required")
 
         logger.info(f"Deleting person {person_id}")
-        self._request("DELETE", f"/v1/Persons/{person_id}")
+        try:
+            self._request("DELETE", f"/v1/Persons/{person_id}")
+        finally:
+            self._invalidate_person(person_id)
         logger.info(f"Person {person_id} deleted successfully")
 
     def delete_relation(self, survey_id: str, relation_id: str) -> bool:
@@ -1672,6 +1767,38 @@ class TRRCMSApiClient:
         )
         return result.get("items", []) if isinstance(result, dict) else result
 
+    def _send_multipart(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        form_fields: Dict[str, Any],
+        file_path: Optional[str] = None,
+        progress=None,
+    ) -> requests.Response:
+        """Send a multipart form, with `file_path` as its File part.
+
+        progress(sent, total) is called as the encoded body goes out.
+        """
+        import os
+        import mimetypes
+        files = dict(form_fields)
+        if file_path and os.path.exists(file_path):
+            file_name = os.path.basename(file_path)
+            mime_type = mimetypes.guess_type(file_path)[0] or "application/octet-stream"
+            with open(file_path, "rb") as f:
+                files["File"] = (file_name, f, mime_type)
+                prepared = self._session.prepare_request(
+                    requests.Request(method, url, files=files, headers=headers))
+        else:
+            prepared = self._session.prepare_request(
+                requests.Request(method, url, files=files, headers=headers))
+        if progress is not None:
+            prepared.body = _ProgressBody(prepared.body, progress)
+        settings = self._session.merge_environment_settings(
+            prepared.url, {}, None, self._verify_ssl(), None)
+        return self._session.send(prepared, timeout=self.config.timeout, **settings)
+
     def upload_relation_document(
         self,
         survey_id: str,
@@ -1680,11 +1807,11 @@ class TRRCMSApiClient:
         issue_date: str = "",
         file_hash: str = "",
         evidence_type: int = 2,
-        description: str = ""
+        description: str = "",
+        progress=None,
     ) -> Dict[str, Any]:
-        """Upload a tenure evidence document."""
+        """Upload a tenure evidence document (progress: see _send_multipart)."""
         import os
-        import json as _json
         import mimetypes
 
         if not survey_id or not relation_id:
@@ -1717,17 +1844,7 @@ class TRRCMSApiClient:
         logger.info(f"[API REQ] POST {endpoint} File: {file_name} ({mime_type})")
 
         try:
-            with open(file_path, "rb") as f:
-                files = {"File": (file_name, f, mime_type)}
-                files.update(form_fields)
-                response = self._session.post(
-                    url,
-                    files=files,
-                    headers=headers,
-                    timeout=self.config.timeout,
-                    verify=self._verify_ssl()
-                )
-
+            response = self._send_multipart("POST", url, headers, form_fields, file_path, progress)
             response.raise_for_status()
 
             result = None
@@ -1768,13 +1885,13 @@ class TRRCMSApiClient:
         issuing_authority: str = "",
         document_reference_number: str = "",
         notes: str = "",
+        progress=None,
     ) -> Dict[str, Any]:
-        """Upload an identification document for a person.
+        """Upload an identification document for a person (progress: see _send_multipart).
 
         Returns: EvidenceDto
         """
         import os
-        import mimetypes
 
         if not survey_id or not person_id:
             raise ValueError("survey_id and person_id are required")
@@ -1785,7 +1902,6 @@ class TRRCMSApiClient:
         url = f"{self.base_url}{endpoint}"
 
         file_name = os.path.basename(file_path)
-        mime_type = mimetypes.guess_type(file_path)[0] or "application/octet-stream"
 
         self._ensure_valid_token()
         headers = {
@@ -1817,17 +1933,7 @@ class TRRCMSApiClient:
         logger.warning(f"[ID-DOCS UPLOAD] POST {endpoint} file={file_name} person={person_id} survey={survey_id}")
 
         try:
-            with open(file_path, "rb") as f:
-                files = {"File": (file_name, f, mime_type)}
-                files.update(form_fields)
-                response = self._session.post(
-                    url,
-                    files=files,
-                    headers=headers,
-                    timeout=self.config.timeout,
-                    verify=self._verify_ssl()
-                )
-
+            response = self._send_multipart("POST", url, headers, form_fields, file_path, progress)
             response.raise_for_status()
             result = response.json() if response.text else {}
             doc_id = result.get("id") or result.get("Id") or "?"
@@ -1871,14 +1977,14 @@ class TRRCMSApiClient:
         document_expiry_date: str = "",
         issuing_authority: str = "",
         document_reference_number: str = "",
+        progress=None,
     ) -> Dict[str, Any]:
         """Update an existing identification document.
 
         Endpoint changed in v1.7: /identification-documents/{id} (was /evidence/identification/{id})
+        progress: see _send_multipart.
         Returns: IdentificationDocumentDto
         """
-        import os
-        import mimetypes
 
         if not survey_id or not document_id:
             raise ValueError("survey_id and document_id are required")
@@ -1916,18 +2022,7 @@ class TRRCMSApiClient:
         logger.info(f"[API REQ] PUT {endpoint}")
 
         try:
-            if file_path and os.path.exists(file_path):
-                file_name = os.path.basename(file_path)
-                mime_type = mimetypes.guess_type(file_path)[0] or "application/octet-stream"
-                with open(file_path, "rb") as f:
-                    files = {"File": (file_name, f, mime_type)}
-                    files.update(form_fields)
-                    response = self._session.put(url, files=files, headers=headers,
-                                                timeout=self.config.timeout, verify=self._verify_ssl())
-            else:
-                response = self._session.put(url, files=form_fields, headers=headers,
-                                             timeout=self.config.timeout, verify=self._verify_ssl())
-
+            response = self._send_multipart("PUT", url, headers, form_fields, file_path, progress)
             response.raise_for_status()
             result = response.json() if response.text else {}
             logger.info(f"Identification document {document_id} updated")
@@ -1964,6 +2059,13 @@ class TRRCMSApiClient:
             return result.get("items", result.get("$values", result.get("data", [])))
         return result if isinstance(result, list) else []
 
+    def identification_document_download_url(self, person_id: str, document_id: str) -> str:
+        """Download URL of an identification document binary."""
+        return (
+            f"{self.base_url}/v1/persons/{person_id}/identification-documents/"
+            f"{document_id}/download"
+        )
+
     def download_identification_document(
         self, person_id: str, document_id: str, save_path: str
     ) -> bool:
@@ -1975,40 +2077,10 @@ class TRRCMSApiClient:
         import os as _os
         if not person_id or not document_id:
             raise ValueError("person_id and document_id are required")
-        endpoint = (
-            f"/v1/persons/{person_id}/identification-documents/"
-            f"{document_id}/download"
-        )
-        url = f"{self.base_url}{endpoint}"
-        self._ensure_valid_token()
-        headers = {
-            "Authorization": f"Bearer {self.access_token}",
-            "Accept": "*/*",
-        }
+        url = self.identification_document_download_url(person_id, document_id)
         logger.warning(f"[ID-DOCS DOWNLOAD] GET {url}")
         try:
-            with self._session.get(
-                url, headers=headers, stream=True,
-                timeout=self.config.timeout, verify=self._verify_ssl(),
-            ) as resp:
-                if resp.status_code >= 400:
-                    body_preview = ""
-                    try:
-                        body_preview = resp.text[:1000]
-                    except Exception:
-                        pass
-                    logger.warning(
-                        f"[ID-DOCS DOWNLOAD] HTTP {resp.status_code} "
-                        f"headers={dict(resp.headers)!r} body={body_preview!r}"
-                    )
-                resp.raise_for_status()
-                parent = _os.path.dirname(save_path)
-                if parent:
-                    _os.makedirs(parent, exist_ok=True)
-                with open(save_path, "wb") as f:
-                    for chunk in resp.iter_content(chunk_size=8192):
-                        if chunk:
-                            f.write(chunk)
+            self.download_to_file(url, save_path)
             return _os.path.exists(save_path) and _os.path.getsize(save_path) > 0
         except Exception as e:
             logger.warning(
@@ -2025,11 +2097,10 @@ class TRRCMSApiClient:
         issue_date: str = "",
         evidence_type: int = 2,
         description: str = "",
-        notes: str = ""
+        notes: str = "",
+        progress=None,
     ) -> Dict[str, Any]:
-        """Update an existing tenure document."""
-        import os
-        import mimetypes
+        """Update an existing tenure document (progress: see _send_multipart)."""
 
         if not survey_id or not evidence_id:
             raise ValueError("survey_id and evidence_id are required")
@@ -2060,18 +2131,7 @@ class TRRCMSApiClient:
         logger.info(f"[API REQ] PUT {endpoint}")
 
         try:
-            if file_path and os.path.exists(file_path):
-                file_name = os.path.basename(file_path)
-                mime_type = mimetypes.guess_type(file_path)[0] or "application/octet-stream"
-                with open(file_path, "rb") as f:
-                    files = {"File": (file_name, f, mime_type)}
-                    files.update(form_fields)
-                    response = self._session.put(url, files=files, headers=headers,
-                                                timeout=self.config.timeout, verify=self._verify_ssl())
-            else:
-                response = self._session.put(url, files=form_fields, headers=headers,
-                                             timeout=self.config.timeout, verify=self._verify_ssl())
-
+            response = self._send_multipart("PUT", url, headers, form_fields, file_path, progress)
             response.raise_for_status()
             result = response.json() if response.text else {}
             logger.info(f"Tenure evidence {evidence_id} updated")
@@ -2147,8 +2207,45 @@ class TRRCMSApiClient:
         self._request("DELETE", f"/v1/Surveys/{survey_id}/evidence/{evidence_id}")
         return True
 
-    def download_evidence(self, evidence_id: str, save_path: str) -> str:
-        """Download an evidence file to disk. Tries v1 then v2 endpoints."""
+    def evidence_download_url(self, evidence_id: str) -> str:
+        """Download URL of an evidence file.
+
+        Only the v1 endpoint is supported by the backend. The v2 path
+        always returns 404 in this environment — keeping it caused noisy
+        log spam and slow fallbacks. utils.helpers.download_evidence_file
+        already retries via metadata (fileUrl / filePath) when v1 fails.
+        """
+        return f"{self.base_url}/v1/Surveys/evidence/{evidence_id}/download"
+
+    def download_to_file(
+        self,
+        url: str,
+        save_path: str,
+        resume: bool = False,
+        validator: str = "",
+        on_start=None,
+        progress=None,
+        token=None,
+        chunk_size: int = 64 * 1024,
+    ) -> Dict[str, Any]:
+        """Stream a file download into save_path, block by block.
+
+        With resume, bytes already in save_path are kept and only the rest
+        is requested (Range, guarded by If-Range: `validator`, the ETag or
+        Last-Modified seen by the first attempt). A server that ignores the
+        range, or reports that the file changed, sends it whole and
+        save_path is rewritten.
+
+        on_start(validator, total, offset) is called once the response
+        headers are in (offset: bytes kept from save_path, 0 on a restart),
+        progress(received, total) after every block (total is 0 when the
+        server does not say), and `token` (a CancellationToken) is checked
+        between blocks.
+
+        Returns {"size", "total", "resumed", "validator"}. Raises ApiException
+        on HTTP errors and NetworkException on connection errors, timeouts and
+        transfers cut short; the partial file is left for the next attempt.
+        """
         import os
         self._ensure_valid_token()
         headers = {
@@ -2156,44 +2253,73 @@ class TRRCMSApiClient:
             "Accept": "*/*",
             "Accept-Language": self._get_accept_language(),
         }
-
-        # Only the v1 endpoint is supported by the backend. The v2 path
-        # always returns 404 in this environment — keeping it caused noisy
-        # log spam and slow fallbacks. utils.helpers.download_evidence_file
-        # already retries via metadata (fileUrl / filePath) when v1 fails.
-        urls = [
-            f"{self.base_url}/v1/Surveys/evidence/{evidence_id}/download",
-        ]
-
-        last_error = None
-        for url in urls:
-            try:
-                logger.info(f"[API REQ] GET {url.replace(self.base_url, '')}")
-                response = self._session.get(url, headers=headers, timeout=self.config.timeout, verify=self._verify_ssl())
+        offset = os.path.getsize(save_path) if resume and os.path.exists(save_path) else 0
+        if offset:
+            headers["Range"] = f"bytes={offset}-"
+            if validator:
+                headers["If-Range"] = validator
+
+        endpoint = url.replace(self.base_url, '')
+        logger.info(f"[API REQ] GET {endpoint}" + (f" (resuming at {offset} bytes)" if offset else ""))
+        received = 0
+        total = 0
+        try:
+            with self._session.get(
+                url, headers=headers, stream=True,
+                timeout=self.config.timeout, verify=self._verify_ssl(),
+            ) as response:
                 response.raise_for_status()
-                os.makedirs(os.path.dirname(save_path), exist_ok=True)
-                with open(save_path, 'wb') as f:
-                    f.write(response.content)
-                if os.path.getsize(save_path) > 0:
-                    logger.info(f"Evidence downloaded: {evidence_id} -> {save_path}")
-                    return save_path
-            except requests.exceptions.HTTPError as e:
-                status_code = e.response.status_code if e.response is not None else 0
-                body = ""
-                try:
-                    body = e.response.text[:200] if e.response is not None else ""
-                except Exception:
-                    pass
-                logger.warning(f"Download failed {status_code} {url.replace(self.base_url, '')} — {body}")
-                last_error = e
-                continue
-            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
-                logger.error(f"Network error during download: {e}")
-                raise NetworkException(message=str(e), original_error=e)
+                resumed = offset > 0 and response.status_code == 206
+                received = offset if resumed else 0
+                content_range = response.headers.get("Content-Range", "")
+                if resumed and "/" in content_range and not content_range.endswith("/*"):
+                    total = int(content_range.rsplit("/", 1)[1])
+                elif response.headers.get("Content-Length"):
+                    total = received + int(response.headers["Content-Length"])
+                etag = response.headers.get("ETag", "")
+                # If-Range needs a strong validator; weak ETags fall back to Last-Modified
+                validator = (etag if etag and not etag.startswith("W/") else
+                             response.headers.get("Last-Modified", "")) or (validator if resumed else "")
+                if on_start:
+                    on_start(validator, total, received)
+
+                parent = os.path.dirname(save_path)
+                if parent:
+                    os.makedirs(parent, exist_ok=True)
+                with open(save_path, "ab" if resumed else "wb") as f:
+                    for block in response.iter_content(chunk_size=chunk_size):
+                        if token is not None:
+                            token.raise_if_cancelled()
+                        if block:
+                            f.write(block)
+                            received += len(block)
+                            if progress:
+                                progress(received, total)
+        except requests.exceptions.HTTPError as e:
+            status_code = e.response.status_code if e.response is not None else 0
+            body = ""
+            try:
+                body = e.response.text[:200] if e.response is not None else ""
+            except Exception:
+                pass
+            logger.warning(f"Download failed {status_code} {endpoint} — {body}")
+            raise ApiException(message=str(e), status_code=status_code, endpoint=endpoint, method="GET")
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout,
+                requests.exceptions.ChunkedEncodingError) as e:
+            logger.error(f"Network error during download: {e}")
+            raise NetworkException(message=str(e), original_error=e)
 
-        if last_error:
-            status_code = last_error.response.status_code if last_error.response is not None else 0
-            raise ApiException(message=str(last_error), status_code=status_code)
+        if total and received < total:
+            raise NetworkException(message=f"Download of {endpoint} ended at {received} of {total} bytes")
+        return {"size": received, "total": total, "resumed": resumed, "validator": validator}
+
+    def download_evidence(self, evidence_id: str, save_path: str) -> str:
+        """Download an evidence file to disk (streamed, see download_to_file)."""
+        import os
+        self.download_to_file(self.evidence_download_url(evidence_id), save_path)
+        if os.path.getsize(save_path) > 0:
+            logger.info(f"Evidence downloaded: {evidence_id} -> {save_path}")
+            return save_path
         raise ApiException(message=f"No download URL succeeded for {evidence_id}", status_code=404)
 
     def _convert_person_to_api_format_with_household(self, person_data: Dict[str, Any], survey_id: str, household_id: str) -> Dict[str, Any]:
@@ -2490,7 +2616,11 @@ class TRRCMSApiClient:
                 api_data['autoCreateClaim'] = finalize_options['autoCreateClaim']
 
         logger.info(f"Processing claims for office survey {survey_id}")
-        result = self._request("POST", f"/v1/Surveys/office/{survey_id}/process-claims", json_data=api_data)
+        try:
+            result = self._request("POST", f"/v1/Surveys/office/{survey_id}/process-claims", json_data=api_data)
+        finally:
+            # Creates claims and cases for the survey's units and persons
+            self.clear_entity_cache()
         logger.info(f"Office survey claims processed successfully")
         return result
 
@@ -2500,7 +2630,11 @@ class TRRCMSApiClient:
             raise ValueError("survey_id is required")
 
         logger.info(f"Finalizing office survey {survey_id}")
-        result = self._request("POST", f"/v1/Surveys/office/{survey_id}/finalize")
+        try:
+            result = self._request("POST", f"/v1/Surveys/office/{survey_id}/finalize")
+        finally:
+            # Finalizing updates the survey's building, units, persons and claims
+            self.clear_entity_cache()
         logger.info(f"Office survey finalized successfully")
         return result
 
@@ -2587,7 +2721,10 @@ class TRRCMSApiClient:
         """
         if not case_id:
             raise ValueError("case_id is required")
-        return self._request("GET", f"/v1/Cases/{case_id}")
+        return self._entity_cache.get_or_fetch(
+            "case", case_id,
+            lambda: self._request("GET", f"/v1/Cases/{case_id}"),
+        )
 
     def get_case_by_property_unit(self, property_unit_id: str) -> Optional[Dict[str, Any]]:
         """Get case for a specific property unit.
@@ -2612,7 +2749,10 @@ class TRRCMSApiClient:
         """
         if not case_id:
             raise ValueError("case_id is required")
-        self._request("PUT", f"/v1/Cases/{case_id}/editable", json_data={"isEditable": is_editable})
+        try:
+            self._request("PUT", f"/v1/Cases/{case_id}/editable", json_data={"isEditable": is_editable})
+        finally:
+            self._entity_cache.invalidate("case", case_id)
         logger.info(f"Case {case_id} editable set to {is_editable}")
 
     # ── End Case endpoints ────────────────────────────────────────
@@ -2672,39 +2812,52 @@ class TRRCMSApiClient:
         }
         return {k: v for k, v in api_data.items() if v is not None and v != ''}
 
+    # Administrative divisions and neighborhoods are served from the persistent
+    # reference-data cache (services/reference_data_cache.py): each filter is
+    # downloaded once, then revalidated with its ETag after login.
+
+    def get_reference_data(self, endpoint: str, params: Optional[Dict] = None,
+                           etag: Optional[str] = None) -> Tuple[Optional[List[Dict[str, Any]]], Optional[str]]:
+        """
+        Conditional GET for a reference-data list (divisions, neighborhoods).
+
+        Sends If-None-Match when an ETag is known. Returns (items, etag);
+        items is None when the server answered 304 Not Modified.
+        """
+        headers = {"If-None-Match": etag} if etag else None
+        result, status, response_headers = self._request(
+            "GET", endpoint, params=params or None, headers_override=headers, with_response=True
+        )
+        new_etag = response_headers.get("ETag") or etag
+        if status == 304:
+            return None, new_etag
+        items = result.get("items", []) if isinstance(result, dict) else (result or [])
+        return items, response_headers.get("ETag")
+
     def get_governorates(self) -> List[Dict[str, Any]]:
         """Get all governorates."""
-        return self._request("GET", "/v1/administrative-divisions/governorates")
+        from services.reference_data_cache import get_reference_data_cache
+        return get_reference_data_cache().get("governorates", client=self)
 
     def get_districts(self, governorate_code: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get districts, optionally filtered by governorate."""
-        params = {}
-        if governorate_code:
-            params["governorateCode"] = governorate_code
-        return self._request("GET", "/v1/administrative-divisions/districts", params=params)
+        from services.reference_data_cache import get_reference_data_cache
+        return get_reference_data_cache().get("districts", governorate_code, client=self)
 
     def get_sub_districts(self, governorate_code: Optional[str] = None,
                           district_code: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get sub-districts, optionally filtered by governorate and district."""
-        params = {}
-        if governorate_code:
-            params["governorateCode"] = governorate_code
-        if district_code:
-            params["districtCode"] = district_code
-        return self._request("GET", "/v1/administrative-divisions/sub-districts", params=params)
+        from services.reference_data_cache import get_reference_data_cache
+        return get_reference_data_cache().get("sub_districts", governorate_code, district_code, client=self)
 
     def get_communities(self, governorate_code: Optional[str] = None,
                         district_code: Optional[str] = None,
                         sub_district_code: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get communities, optionally filtered by governorate, district, and sub-district."""
-        params = {}
-        if governorate_code:
-            params["governorateCode"] = governorate_code
-        if district_code:
-            params["districtCode"] = district_code
-        if sub_district_code:
-            params["subDistrictCode"] = sub_district_code
-        return self._request("GET", "/v1/administrative-divisions/communities", params=params)
+        from services.reference_data_cache import get_reference_data_cache
+        return get_reference_data_cache().get(
+            "communities", governorate_code, district_code, sub_district_code, client=self
+        )
 
     def get_neighborhoods_by_bounds(self, sw_lat: float, sw_lng: float, ne_lat: float, ne_lng: float) -> List[Dict[str, Any]]:
         """
@@ -2763,29 +2916,11 @@ class TRRCMSApiClient:
         Returns:
             List of neighborhoods with full details
         """
-        params = {}
-        if governorate_code:
-            params["governorateCode"] = governorate_code
-        if district_code:
-            params["districtCode"] = district_code
-        if subdistrict_code:
-            params["subDistrictCode"] = subdistrict_code
-        if community_code:
-            params["communityCode"] = community_code
-
-        # Cache only the unfiltered full list (common hot path from _resolve_address_names)
-        if not params and self._neighborhoods_cache is not None:
-            return self._neighborhoods_cache
-
-        logger.info(f"Fetching neighborhoods with filters: {params or 'none'}")
-        result = self._request("GET", "/v2/neighborhoods", params=params)
-        neighborhoods = result.get("items", []) if isinstance(result, dict) else result
-        logger.info(f"Fetched {len(neighborhoods)} neighborhoods")
-
-        if not params:
-            self._neighborhoods_cache = neighborhoods
-
-        return neighborhoods
+        from services.reference_data_cache import get_reference_data_cache
+        return get_reference_data_cache().get(
+            "neighborhoods", governorate_code, district_code, subdistrict_code, community_code,
+            client=self,
+        )
 
     def get_neighborhood_by_code(self, full_code: str) -> Optional[Dict[str, Any]]:
         """
@@ -2833,7 +2968,10 @@ class TRRCMSApiClient:
         """Get a single person by UUID."""
         from services.exceptions import ApiException
         try:
-            return self._request("GET", f"/v1/Persons/{person_id}")
+            return self._entity_cache.get_or_fetch(
+                "person", person_id,
+                lambda: self._request("GET", f"/v1/Persons/{person_id}"),
+            )
         except ApiException as e:
             if e.status_code == 404:
                 logger.warning(f"Person {person_id} not found (404)")
@@ -2938,7 +3076,10 @@ class TRRCMSApiClient:
             raise ValueError("claim_id is required")
 
         logger.info(f"Fetching claim details: {claim_id}")
-        result = self._request("GET", f"/v1/Claims/{claim_id}")
+        result = self._entity_cache.get_or_fetch(
+            "claim", claim_id,
+            lambda: self._request("GET", f"/v1/Claims/{claim_id}"),
+        )
         logger.info(f"Fetched claim: {result.get('claimNumber', 'N/A')}")
         return result
 
@@ -2952,7 +3093,10 @@ class TRRCMSApiClient:
         """Delete a claim."""
         if not claim_id:
             raise ValueError("claim_id is required")
-        self._request("DELETE", f"/v1/Claims/{claim_id}")
+        try:
+            self._request("DELETE", f"/v1/Claims/{claim_id}")
+        finally:
+            self._invalidate_claim(claim_id)
         logger.info(f"Claim {claim_id} deleted")
         return True
 
@@ -2962,18 +3106,27 @@ class TRRCMSApiClient:
             raise ValueError("claim_id is required")
         payload = {"claimId": claim_id, **update_data}
         logger.info(f"Updating claim: {claim_id}")
-        return self._request("PUT", f"/v1/Claims/{claim_id}", json_data=payload)
+        try:
+            return self._request("PUT", f"/v1/Claims/{claim_id}", json_data=payload)
+        finally:
+            self._invalidate_claim(claim_id)
 
     def submit_claim(self, claim_id: str, user_id: str) -> Dict[str, Any]:
         """Submit claim for processing."""
-        return self._request("PUT", f"/v1/Claims/{claim_id}/submit",
-                             json_data={"claimId": claim_id, "submittedByUserId": user_id})
+        try:
+            return self._request("PUT", f"/v1/Claims/{claim_id}/submit",
+                                 json_data={"claimId": claim_id, "submittedByUserId": user_id})
+        finally:
+            self._invalidate_claim(claim_id)
 
     def verify_claim(self, claim_id: str, user_id: str, notes: str = "") -> Dict[str, Any]:
         """Verify claim."""
-        return self._request("PUT", f"/v1/Claims/{claim_id}/verify",
-                             json_data={"claimId": claim_id, "verifiedByUserId": user_id,
-                                        "verificationNotes": notes})
+        try:
+            return self._request("PUT", f"/v1/Claims/{claim_id}/verify",
+                                 json_data={"claimId": claim_id, "verifiedByUserId": user_id,
+                                            "verificationNotes": notes})
+        finally:
+            self._invalidate_claim(claim_id)
 
     def assign_claim(self, claim_id: str, user_id: str,
                      target_date: Optional[str] = None) -> Dict[str, Any]:
@@ -2981,7 +3134,15 @@ class TRRCMSApiClient:
         payload = {"claimId": claim_id, "assignToUserId": user_id}
         if target_date:
             payload["targetCompletionDate"] = target_date
-        return self._request("PUT", f"/v1/Claims/{claim_id}/assign", json_data=payload)
+        try:
+            return self._request("PUT", f"/v1/Claims/{claim_id}/assign", json_data=payload)
+        finally:
+            self._invalidate_claim(claim_id)
+
+    def _invalidate_claim(self, claim_id: str):
+        """A claim change also changes its case's status/claim list."""
+        self._entity_cache.invalidate("claim", claim_id)
+        self._entity_cache.invalidate("case")
 
     def get_all_users(
         self,
@@ -3182,11 +3343,15 @@ class TRRCMSApiClient:
     def commit_import_package(self, package_id: str) -> Dict[str, Any]:
         """Commit approved staging records to production tables."""
         logger.info(f"Committing import package: {package_id}")
-        return self._request(
-            "POST",
-            f"/v1/import/packages/{package_id}/commit",
-            json_data={"packageId": package_id}
-        )
+        try:
+            return self._request(
+                "POST",
+                f"/v1/import/packages/{package_id}/commit",
+                json_data={"packageId": package_id}
+            )
+        finally:
+            # Committed records overwrite production buildings, units and persons
+            self.clear_entity_cache()
 
     def get_commit_report(self, package_id: str) -> Dict[str, Any]:
         """Get the commit report for an import package."""
@@ -3313,7 +3478,11 @@ class TRRCMSApiClient:
         Endpoint: POST /api/v1/conflicts/{id}/merge
         """
         body = {"masterRecordId": master_record_id, "reason": justification}
-        return self._request("POST", f"/v1/conflicts/{conflict_id}/merge", json_data=body)
+        try:
+            return self._request("POST", f"/v1/conflicts/{conflict_id}/merge", json_data=body)
+        finally:
+            # Merged / re-linked records may be any cached entity type.
+            self.clear_entity_cache()
 
     def keep_separate_conflict(
         self, conflict_id: str, justification: str = ""
@@ -3324,7 +3493,10 @@ class TRRCMSApiClient:
         Endpoint: POST /api/v1/conflicts/{id}/keep-separate
         """
         body = {"reason": justification}
-        return self._request("POST", f"/v1/conflicts/{conflict_id}/keep-separate", json_data=body)
+        try:
+            return self._request("POST", f"/v1/conflicts/{conflict_id}/keep-separate", json_data=body)
+        finally:
+            self.clear_entity_cache()
 
     def resolve_conflict(
         self, conflict_id: str, resolution_type: str = "", justification: str = ""
@@ -3335,7 +3507,10 @@ class TRRCMSApiClient:
         Endpoint: POST /api/v1/conflicts/{id}/resolve
         """
         body = {"resolutionType": resolution_type, "reason": justification}
-        return self._request("POST", f"/v1/conflicts/{conflict_id}/resolve", json_data=body)
+        try:
+            return self._request("POST", f"/v1/conflicts/{conflict_id}/resolve", json_data=body)
+        finally:
+            self.clear_entity_cache()
 
     def escalate_conflict(
         self, conflict_id: str, justification: str = ""
@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+"""
+Read-through entity cache for TRRCMSApiClient.
+
+Detail pages, dialogs and wizard steps fetch the same building / unit /
+person / claim / case several times in quick succession (often from
+different QThreads at once). This module keeps the last response per
+entity for a short time:
+
+- one `EntityCache` per entity type, each with its own TTL and a
+  size-bounded LRU (OrderedDict),
+- `get_or_fetch()` coalesces concurrent misses for the same key
+  (single-flight): the first caller runs the HTTP request, the others
+  wait for and share its result (or exception),
+- callers get a deep copy, so mutating a returned dict never changes
+  the cached entry,
+- hit/miss/coalesced/eviction counters are exposed through `stats()`
+  and logged with the `[API_CACHE]` tag every `stats_interval` seconds
+  (on the next lookup), at logout and at application exit.
+
+Entries are invalidated by the client's create/update/delete methods and
+dropped entirely on login/logout, survey finalization and import commits.
+"""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# entity type -> (ttl seconds, max entries)
+DEFAULT_POLICIES = {
+    "building": (120.0, 500),
+    "building_documents": (60.0, 200),
+    "property_unit": (120.0, 1000),
+    "person": (120.0, 1000),
+    "claim": (60.0, 300),
+    "case": (60.0, 300),
+}
+
+
+@dataclass
+class _Flight:
+    """An in-progress fetch that concurrent callers can wait on."""
+    done: threading.Event = field(default_factory=threading.Event)
+    result: Any = None
+    error: Optional[BaseException] = None
+
+
+class EntityCache:
+    """TTL + LRU cache for one entity type, with single-flight fetches."""
+
+    def __init__(self, name: str, ttl: float, max_entries: int):
+        self.name = name
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._flights: Dict[Hashable, _Flight] = {}
+        self._lock = threading.Lock()
+        # Bumped on invalidation so a fetch that started before an update
+        # does not store its (stale) response afterwards.
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get_or_fetch(self, key: Hashable, fetch: Callable[[], Any],
+                     cacheable: Callable[[Any], bool] = None) -> Any:
+        """Return the cached value for `key`, or run `fetch()` once for all waiters.
+
+        `cacheable(result)` decides whether a fetched result is stored
+        (default: anything except None).
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return copy.deepcopy(value)
+                del self._entries[key]
+                self.expirations += 1
+
+            flight = self._flights.get(key)
+            if flight is not None:
+                self.coalesced += 1
+                leader = False
+            else:
+                flight = self._flights[key] = _Flight()
+                self.misses += 1
+                leader = True
+                generation = self._generation
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return copy.deepcopy(flight.result)
+
+        try:
+            result = fetch()
+        except BaseException as e:
+            flight.error = e
+            raise
+        else:
+            flight.result = result
+            keep = cacheable(result) if cacheable else result is not None
+            if keep:
+                self._store(key, result, generation)
+            return copy.deepcopy(result)
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+            flight.done.set()
+
+    def _store(self, key: Hashable, value: Any, generation: int):
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._entries[key] = (copy.deepcopy(value), time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key: Hashable = None):
+        """Drop one entry, or all entries when `key` is None."""
+        with self._lock:
+            self._generation += 1
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses + self.coalesced
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                # Coalesced waiters did not cause an HTTP call either.
+                "hit_rate": (self.hits + self.coalesced) / lookups if lookups else 0.0,
+            }
+
+
+class ApiEntityCache:
+    """The set of per-entity-type caches owned by one API client."""
+
+    def __init__(self, policies: Dict[str, tuple] = None, enabled: bool = True,
+                 stats_interval: float = 0.0):
+        self.enabled = enabled
+        self._caches: Dict[str, EntityCache] = {
+            name: EntityCache(name, ttl, size)
+            for name, (ttl, size) in (policies or DEFAULT_POLICIES).items()
+        }
+        self.stats_interval = stats_interval
+        self._next_stats = time.monotonic() + stats_interval
+
+    @classmethod
+    def from_config(cls) -> "ApiEntityCache":
+        from app.config import Config
+        ttl_scale = Config.API_CACHE_TTL_SCALE
+        size_scale = Config.API_CACHE_SIZE_SCALE
+        policies = {
+            name: (ttl * ttl_scale, max(1, int(size * size_scale)))
+            for name, (ttl, size) in DEFAULT_POLICIES.items()
+        }
+        return cls(policies, enabled=Config.API_CACHE_ENABLED and ttl_scale > 0,
+                   stats_interval=Config.API_CACHE_STATS_MINUTES * 60)
+
+    def get_or_fetch(self, entity: str, key: Hashable, fetch: Callable[[], Any],
+                     cacheable: Callable[[Any], bool] = None) -> Any:
+        if not self.enabled or key is None:
+            return fetch()
+        if self.stats_interval > 0 and time.monotonic() >= self._next_stats:
+            self._next_stats = time.monotonic() + self.stats_interval
+            self.log_stats("periodic")
+        return self._caches[entity].get_or_fetch(key, fetch, cacheable)
+
+    def invalidate(self, entity: str, key: Hashable = None):
+        self._caches[entity].invalidate(key)
+
+    def clear(self):
+        for cache in self._caches.values():
+            cache.invalidate()
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        return {name: cache.stats() for name, cache in self._caches.items()}
+
+    def log_stats(self, reason: str = ""):
+        parts = []
+        for name, s in self.stats().items():
+            if s["hits"] or s["misses"] or s["coalesced"]:
+                parts.append(
+                    f"{name}={s['hit_rate']:.0%} (hit={s['hits']} miss={s['misses']} "
+                    f"coalesced={s['coalesced']} evict={s['evictions']} n={s['entries']})"
+                )
+        suffix = f" {reason}" if reason else ""
+        logger.info(f"[API_CACHE]{suffix} " + (", ".join(parts) or "no lookups"))
@@ -1,15 +1,25 @@
 # -*- coding: utf-8 -*-
 """Generic background worker for non-blocking API calls."""
 
-from PyQt5.QtCore import QThread, pyqtSignal
+import sys
+
+from PyQt5.QtCore import QObject, pyqtSignal
 from utils.logger import get_logger
-from services.worker_registry import register as _register_worker
+from services.task_executor import Priority, get_task_executor
 
 logger = get_logger(__name__)
 
 
-class ApiWorker(QThread):
-    """Runs any callable in a background thread to avoid blocking the UI."""
+class ApiWorker(QObject):
+    """
+    Runs any callable on the shared task executor to avoid blocking the UI.
+
+    Keeps the QThread-style interface (finished/error signals delivered on
+    the GUI thread, start(), isRunning(), wait(), quit()), but no thread is
+    created per call. start() optionally takes a priority and `supersede`:
+    True (or a name shared by several call sites) makes a new start from
+    the same page cancel the previous one, whose result is then dropped.
+    """
     finished = pyqtSignal(object)
     error = pyqtSignal(str)
 
@@ -18,21 +28,49 @@ class ApiWorker(QThread):
         self._func = func
         self._args = args
         self._kwargs = kwargs
-        # Auto-register so the registry can stop us at app shutdown without
-        # every call site needing to opt in.
-        _register_worker(self)
+        self._handle = None
+        # Supersession key: call site + the object (page/dialog) creating us
+        caller = sys._getframe(1)
+        self._call_site = f"{caller.f_code.co_filename}:{caller.f_lineno}"
+        self._owner_id = id(caller.f_locals.get("self", caller.f_code))
+
+    def start(self, priority: Priority = Priority.INTERACTIVE, supersede=False):
+        key = None
+        if supersede:
+            name = supersede if isinstance(supersede, str) else self._call_site
+            key = f"{self._owner_id}:{name}"
+        self._handle = get_task_executor().submit(
+            self._call, priority=priority, key=key,
+            on_result=self.finished.emit, on_error=self._emit_error,
+        )
+
+    def _call(self):
+        return self._func(*self._args, **self._kwargs)
 
-    def run(self):
+    def _emit_error(self, e: Exception):
         from services.exceptions import (
             ApiException, NetworkException, humanize_exception, log_exception,
         )
-        try:
-            result = self._func(*self._args, **self._kwargs)
-            self.finished.emit(result)
-        except (ApiException, NetworkException) as e:
+        if isinstance(e, (ApiException, NetworkException)):
             # Surface a safe user-facing message; never a stack trace.
             log_exception(e, logger, context="api_worker")
             self.error.emit(humanize_exception(e))
-        except Exception as e:
+        else:
             logger.warning(f"ApiWorker error: {e}")
             self.error.emit(str(e))
+
+    def cancel(self):
+        """Drop the call: cancel it if queued, discard its result if running."""
+        if self._handle is not None:
+            self._handle.cancel()
+
+    def isRunning(self) -> bool:
+        return self._handle is not None and not self._handle.done()
+
+    def wait(self, timeout_ms: int = None) -> bool:
+        if self._handle is None:
+            return True
+        return self._handle.wait(None if timeout_ms is None else timeout_ms / 1000)
+
+    quit = cancel
+    requestInterruption = cancel
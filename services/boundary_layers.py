@@ -0,0 +1,315 @@
+# -*- coding: utf-8 -*-
+"""
+Compact binary boundary layers (.bnd), read through a memory map.
+
+tools/convert_shapefiles.py writes one .bnd file next to each boundary
+GeoJSON in assets/geojson. A file holds, for one administrative level:
+
+- a JSON header (level, feature count, levels of detail, array table),
+- per-feature bounding boxes and properties (JSON, one slice per feature),
+- one coordinate set per level of detail: Douglas-Peucker simplified
+  copies (float32) for low zooms and the full-detail rings (float64).
+  Each set is a flat (n, 2) coordinate array plus ring and feature
+  offsets, so a feature's rings are two slices away.
+
+`BoundaryLayer` maps the file and exposes per-feature access, bbox queries
+and a GeoJSON FeatureCollection limited to a viewport at the detail level
+its zoom needs. Nothing is parsed up front: opening a layer reads only the
+header, and the OS pages in the arrays a query touches.
+"""
+
+import json
+import os
+import struct
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from services.geometry_codec import Geometry
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+MAGIC = b"TRRBND\x00\x01"
+FORMAT_VERSION = 1
+SUFFIX = ".bnd"
+
+# Simplified levels of detail: lod i serves zooms <= LOD_MAX_ZOOMS[i] and is
+# simplified to one screen pixel at that zoom. Higher zooms get full detail.
+LOD_MAX_ZOOMS = (5, 8, 11, 13)
+
+_ALIGN = 16
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // _ALIGN) * _ALIGN
+
+
+def pixel_degrees(zoom: float) -> float:
+    """Width of one 256-px tile pixel in degrees of longitude at `zoom`."""
+    return 360.0 / (256 * 2 ** zoom)
+
+
+# ---------------------------------------------------------------------------
+# Simplification
+# ---------------------------------------------------------------------------
+
+def _douglas_peucker(points: np.ndarray, tolerance: float) -> np.ndarray:
+    """Keep-mask of an open polyline simplified to `tolerance`."""
+    n = len(points)
+    keep = np.zeros(n, dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, n - 1)]
+    while stack:
+        a, b = stack.pop()
+        if b <= a + 1:
+            continue
+        seg = points[b] - points[a]
+        rel = points[a + 1:b] - points[a]
+        length = float(np.hypot(seg[0], seg[1]))
+        if length > 0:
+            dist = np.abs(seg[0] * rel[:, 1] - seg[1] * rel[:, 0]) / length
+        else:
+            dist = np.hypot(rel[:, 0], rel[:, 1])
+        i = int(np.argmax(dist))
+        if dist[i] > tolerance:
+            k = a + 1 + i
+            keep[k] = True
+            stack.append((a, k))
+            stack.append((k, b))
+    return keep
+
+
+def simplify_ring(ring: np.ndarray, tolerance: float) -> np.ndarray:
+    """Douglas-Peucker for a closed ring; the result keeps at least 3 distinct vertices."""
+    if tolerance <= 0 or len(ring) <= 4:
+        return ring
+    # Split at the vertex farthest from the start so both halves are open lines.
+    far = int(np.argmax(np.hypot(*(ring[:-1] - ring[0]).T)))
+    if far == 0:
+        return ring
+    keep = np.concatenate((_douglas_peucker(ring[:far + 1], tolerance),
+                           _douglas_peucker(ring[far:], tolerance)[1:]))
+    if np.count_nonzero(keep) < 4:
+        seg = ring[far] - ring[0]
+        rel = ring - ring[0]
+        keep[int(np.argmax(np.abs(seg[0] * rel[:, 1] - seg[1] * rel[:, 0])))] = True
+    return ring[keep]
+
+
+# ---------------------------------------------------------------------------
+# Writing
+# ---------------------------------------------------------------------------
+
+def _geojson_polygons(geometry: Optional[Dict[str, Any]]) -> List[List[np.ndarray]]:
+    if not geometry:
+        return []
+    kind, coords = geometry.get("type"), geometry.get("coordinates") or []
+    polygons = [coords] if kind == "Polygon" else coords if kind == "MultiPolygon" else []
+    out = []
+    for polygon in polygons:
+        rings = []
+        for ring in polygon:
+            ring = np.asarray(ring, dtype=np.float64)
+            if ring.ndim != 2 or len(ring) < 3:
+                continue
+            ring = ring[:, :2]
+            if not np.array_equal(ring[0], ring[-1]):
+                ring = np.vstack((ring, ring[:1]))
+            rings.append(ring)
+        if rings:
+            out.append(rings)
+    return out
+
+
+def write_layer(collection: Dict[str, Any], path: Path, level: str, source_size: int = 0) -> int:
+    """
+    Write a GeoJSON FeatureCollection dict as a .bnd layer (atomically).
+
+    Non-polygon features are skipped. Returns the number of features written.
+    """
+    features = []
+    for feature in collection.get("features", []):
+        polygons = _geojson_polygons(feature.get("geometry"))
+        if polygons:
+            features.append((feature.get("properties") or {}, polygons))
+
+    arrays: List[Tuple[str, np.ndarray]] = []
+    bboxes = np.array([
+        (min(r[:, 0].min() for p in polys for r in p), min(r[:, 1].min() for p in polys for r in p),
+         max(r[:, 0].max() for p in polys for r in p), max(r[:, 1].max() for p in polys for r in p))
+        for _, polys in features
+    ], dtype="<f8").reshape(-1, 4)
+    arrays.append(("bbox", bboxes))
+
+    blobs = [json.dumps(props, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+             for props, _ in features]
+    arrays.append(("props_offsets", np.concatenate(([0], np.cumsum([len(b) for b in blobs]))).astype("<i8")))
+    arrays.append(("props", np.frombuffer(b"".join(blobs), dtype=np.uint8)))
+
+    tolerances = [pixel_degrees(z) for z in LOD_MAX_ZOOMS] + [0.0]
+    lods = []
+    for lod, tolerance in enumerate(tolerances):
+        coords, ring_offsets, feature_offsets, holes = [], [0], [0], []
+        for _, polygons in features:
+            for polygon in polygons:
+                for r, ring in enumerate(polygon):
+                    ring = simplify_ring(ring, tolerance)
+                    coords.append(ring)
+                    ring_offsets.append(ring_offsets[-1] + len(ring))
+                    holes.append(1 if r else 0)
+            feature_offsets.append(len(holes))
+        dtype = "<f4" if tolerance else "<f8"
+        arrays.append((f"coords{lod}", (np.vstack(coords) if coords else np.empty((0, 2))).astype(dtype)))
+        arrays.append((f"rings{lod}", np.asarray(ring_offsets, dtype="<i8")))
+        arrays.append((f"features{lod}", np.asarray(feature_offsets, dtype="<i8")))
+        arrays.append((f"holes{lod}", np.asarray(holes, dtype=np.uint8)))
+        lods.append({"max_zoom": LOD_MAX_ZOOMS[lod] if tolerance else None, "tolerance": tolerance})
+
+    relative, cursor = {}, 0
+    for name, array in arrays:
+        cursor = _aligned(cursor)
+        relative[name] = cursor
+        cursor += array.nbytes
+
+    # Array offsets depend on the header length, which depends on the offsets:
+    # grow the data start until the header fits in front of it.
+    base = 0
+    while True:
+        table = {name: [base + relative[name], array.dtype.str, list(array.shape)] for name, array in arrays}
+        header_bytes = json.dumps({
+            "version": FORMAT_VERSION, "level": level, "source_size": source_size,
+            "features": len(features), "lods": lods, "arrays": table,
+        }).encode("utf-8")
+        needed = _aligned(len(MAGIC) + 4 + len(header_bytes))
+        if needed <= base:
+            break
+        base = needed
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<I", len(header_bytes)))
+        f.write(header_bytes)
+        for name, array in arrays:
+            f.write(b"\0" * (table[name][0] - f.tell()))
+            f.write(np.ascontiguousarray(array).tobytes())
+    os.replace(tmp, path)
+    return len(features)
+
+
+# ---------------------------------------------------------------------------
+# Reading
+# ---------------------------------------------------------------------------
+
+class BoundaryLayer:
+    """Memory-mapped view of one .bnd boundary layer."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"{self.path.name}: not a boundary layer file")
+            (length,) = struct.unpack("<I", f.read(4))
+            header = json.loads(f.read(length).decode("utf-8"))
+        if header.get("version") != FORMAT_VERSION:
+            raise ValueError(f"{self.path.name}: unsupported version {header.get('version')}")
+        self.level: str = header["level"]
+        self.source_size: int = header.get("source_size", 0)
+        self.feature_count: int = header["features"]
+        self.lods: List[Dict[str, Any]] = header["lods"]
+        self._table = header["arrays"]
+        self._map = np.memmap(self.path, dtype=np.uint8, mode="r")
+        self.bboxes = self._array("bbox")
+
+    def _array(self, name: str) -> np.ndarray:
+        offset, dtype, shape = self._table[name]
+        return np.ndarray(tuple(shape), dtype=np.dtype(dtype), buffer=self._map, offset=offset)
+
+    def close(self):
+        """Release the memory map (required before the file can be replaced on Windows)."""
+        self.bboxes = None
+        mm, self._map = self._map, None
+        if mm is not None and getattr(mm, "_mmap", None) is not None:
+            mm._mmap.close()
+
+    def __len__(self) -> int:
+        return self.feature_count
+
+    # -- Lookup ---------------------------------------------------------------
+
+    def lod_for_zoom(self, zoom: Optional[float]) -> int:
+        """Coarsest level of detail that still looks exact at `zoom` (None -> full)."""
+        if zoom is not None:
+            for lod, info in enumerate(self.lods):
+                if info["max_zoom"] is not None and zoom <= info["max_zoom"]:
+                    return lod
+        return len(self.lods) - 1
+
+    def query(self, bbox: Optional[Sequence[float]]) -> np.ndarray:
+        """Indexes of features whose bbox intersects (min_lng, min_lat, max_lng, max_lat)."""
+        if bbox is None:
+            return np.arange(self.feature_count)
+        west, south, east, north = bbox
+        b = self.bboxes
+        return np.flatnonzero((b[:, 0] <= east) & (b[:, 2] >= west) & (b[:, 1] <= north) & (b[:, 3] >= south))
+
+    def properties(self, index: int) -> Dict[str, Any]:
+        offsets = self._array("props_offsets")
+        blob = self._array("props")[offsets[index]:offsets[index + 1]]
+        return json.loads(blob.tobytes().decode("utf-8"))
+
+    def polygons(self, index: int, lod: Optional[int] = None) -> List[List[np.ndarray]]:
+        """Feature rings grouped into polygons (exterior first), as (n, 2) float64 arrays."""
+        lod = len(self.lods) - 1 if lod is None else lod
+        features, rings = self._array(f"features{lod}"), self._array(f"rings{lod}")
+        holes, coords = self._array(f"holes{lod}"), self._array(f"coords{lod}")
+        polygons: List[List[np.ndarray]] = []
+        for r in range(int(features[index]), int(features[index + 1])):
+            ring = np.asarray(coords[rings[r]:rings[r + 1]], dtype=np.float64)
+            if holes[r] and polygons:
+                polygons[-1].append(ring)
+            else:
+                polygons.append([ring])
+        return polygons
+
+    def geometry(self, index: int, lod: Optional[int] = None) -> Geometry:
+        polygons = self.polygons(index, lod)
+        if len(polygons) == 1:
+            return Geometry("Polygon", polygons[0])
+        return Geometry("MultiPolygon", polygons)
+
+    def features(self, lod: Optional[int] = None) -> Iterable[Tuple[Dict[str, Any], Geometry]]:
+        """(properties, Geometry) for every feature."""
+        for index in range(self.feature_count):
+            yield self.properties(index), self.geometry(index, lod)
+
+    def to_geojson(self, bbox: Optional[Sequence[float]] = None, zoom: Optional[float] = None) -> str:
+        """FeatureCollection of the features intersecting `bbox`, at the detail `zoom` needs."""
+        lod = self.lod_for_zoom(zoom)
+        tolerance = self.lods[lod]["tolerance"]
+        # ~1/10 pixel precision for simplified levels keeps the payload small.
+        digits = max(1, int(np.ceil(-np.log10(tolerance / 10)))) if tolerance else 7
+        features = []
+        for index in self.query(bbox).tolist():
+            polygons = [[np.round(ring, digits).tolist() for ring in polygon]
+                        for polygon in self.polygons(index, lod)]
+            geometry = ({"type": "Polygon", "coordinates": polygons[0]} if len(polygons) == 1
+                        else {"type": "MultiPolygon", "coordinates": polygons})
+            features.append({"type": "Feature", "geometry": geometry, "properties": self.properties(index)})
+        return json.dumps({"type": "FeatureCollection", "features": features},
+                          ensure_ascii=False, separators=(",", ":"))
+
+
+def open_layer(path: Path) -> Optional[BoundaryLayer]:
+    """Open a .bnd file; None (logged) if it is missing or unreadable."""
+    if not Path(path).exists():
+        return None
+    try:
+        return BoundaryLayer(path)
+    except (OSError, ValueError, KeyError) as e:
+        logger.warning(f"Could not open boundary layer {path}: {e}")
+        return None
@@ -1,15 +1,20 @@
 # -*- coding: utf-8 -*-
 """
-BoundaryService: loads and caches administrative boundary GeoJSON files.
+BoundaryService: loads and caches administrative boundary layers.
 
 Files are read from assets/geojson/ (produced by tools/convert_shapefiles.py).
-Each level is cached in memory after the first read.
+Polygon levels ship both as GeoJSON and as a compact binary layer (.bnd, see
+services.boundary_layers) that is memory-mapped instead of parsed: feature
+counts, per-feature access and viewport/zoom-limited GeoJSON come from it.
+Raw GeoJSON text is still available through get() and cached after the
+first read.
 """
 
 import json
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Sequence
 
+from services.boundary_layers import SUFFIX as _BINARY_SUFFIX, BoundaryLayer, open_layer, write_layer
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -27,6 +32,8 @@ _LEVEL_FILES = {
 }
 
 _cache: dict = {}
+# Opened binary layers (None = level has no usable binary layer)
+_layers: dict = {}
 # Separate cache for the parsed places list (list of dicts, not raw JSON string)
 _places_list_cache: list = []
 
@@ -39,6 +46,12 @@ def is_available(level: str) -> bool:
     return (_ASSETS_DIR / filename).exists()
 
 
+def file_path(level: str) -> Optional[Path]:
+    """Return the on-disk path of the given level's file, or None if unknown."""
+    filename = _LEVEL_FILES.get(level)
+    return _ASSETS_DIR / filename if filename else None
+
+
 def get(level: str) -> Optional[str]:
     """
     Return GeoJSON string for the given administrative level.
@@ -70,8 +83,68 @@ def get(level: str) -> Optional[str]:
         return None
 
 
+def get_layer(level: str) -> Optional[BoundaryLayer]:
+    """
+    Return the memory-mapped binary layer for a polygon level.
+
+    Uses the shipped .bnd file when it matches the GeoJSON next to it;
+    otherwise converts the GeoJSON once into DATA_DIR/boundary_layers.
+    Returns None if the level has no polygon data.
+    """
+    if level in _layers:
+        return _layers[level]
+
+    filename = _LEVEL_FILES.get(level)
+    if not filename or not filename.endswith('.geojson'):
+        return None
+    source = _ASSETS_DIR / filename
+    source_size = source.stat().st_size if source.exists() else None
+
+    layer = _open_current(source.with_suffix(_BINARY_SUFFIX), source_size)
+    if layer is None and source_size is not None:
+        from app.config import Config
+        cached = Config.DATA_DIR / 'boundary_layers' / (source.stem + _BINARY_SUFFIX)
+        layer = _open_current(cached, source_size)
+        if layer is None:
+            try:
+                collection = json.loads(source.read_text(encoding='utf-8'))
+                count = write_layer(collection, cached, level, source_size)
+                logger.info(f"BoundaryService: converted '{level}' to binary ({count} features)")
+                layer = open_layer(cached)
+            except (OSError, ValueError) as e:
+                logger.error(f"BoundaryService: failed to convert '{level}': {e}")
+
+    _layers[level] = layer
+    return layer
+
+
+def _open_current(path: Path, source_size: Optional[int]) -> Optional[BoundaryLayer]:
+    """Open a binary layer unless it was built from a different GeoJSON file."""
+    layer = open_layer(path)
+    if layer is not None and source_size is not None and layer.source_size != source_size:
+        layer.close()
+        return None
+    return layer
+
+
+def get_geojson(level: str, bbox: Sequence[float] = None, zoom: float = None) -> Optional[str]:
+    """
+    Return GeoJSON for the features of `level` that intersect `bbox`
+    (min_lng, min_lat, max_lng, max_lat), simplified for `zoom`.
+
+    Falls back to the full raw file when no binary layer is available.
+    """
+    layer = get_layer(level)
+    if layer is None:
+        return get(level)
+    return layer.to_geojson(bbox, zoom)
+
+
 def get_feature_count(level: str) -> int:
     """Return number of features in the given level (0 if unavailable)."""
+    layer = get_layer(level)
+    if layer is not None:
+        return layer.feature_count
     raw = get(level)
     if not raw:
         return 0
@@ -136,3 +209,7 @@ def clear_cache():
     global _places_list_cache
     _cache.clear()
     _places_list_cache = []
+    for layer in _layers.values():
+        if layer is not None:
+            layer.close()
+    _layers.clear()
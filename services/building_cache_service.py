@@ -36,6 +36,7 @@ from threading import Lock
 from datetime import datetime, timedelta
 
 from models.building import Building
+from models.compact_building import CompactBuilding
 from repositories.database import Database
 from controllers.building_controller import BuildingController, BuildingFilter
 from utils.logger import get_logger
@@ -106,8 +107,8 @@ class BuildingCacheService(metaclass=BuildingCacheServiceMeta):
         self.db = db
         self.building_controller = BuildingController(db)
 
-        # Cache storage
-        self._cache: Dict[str, Building] = {}  # building_id -> Building
+        # Cache storage (compact: shared admin hierarchy, interned codes)
+        self._cache: Dict[str, CompactBuilding] = {}  # building_id -> CompactBuilding
         self._spatial_index: Dict[Tuple[int, int], List[str]] = {}  # (lat_grid, lon_grid) -> [building_ids]
         self._cache_timestamp = datetime.now()
         self._lock = Lock()
@@ -191,7 +192,7 @@ class BuildingCacheService(metaclass=BuildingCacheServiceMeta):
             building: Building object to cache
         """
         # Add to main cache
-        self._cache[building.building_id] = building
+        self._cache[building.building_id] = CompactBuilding.from_building(building)
 
         # Add to spatial index (grid-based)
         if building.latitude and building.longitude:
@@ -300,7 +301,7 @@ class BuildingCacheService(metaclass=BuildingCacheServiceMeta):
                                     north_east_lat, north_east_lng,
                                     south_west_lat, south_west_lng
                                 ):
-                                    cached_buildings.append(building)
+                                    cached_buildings.append(building.to_building())
 
             # Cache hit statistics
             if cached_buildings:
@@ -447,7 +448,8 @@ class BuildingCacheService(metaclass=BuildingCacheServiceMeta):
             Building or None if not in cache
         """
         with self._lock:
-            return self._cache.get(building_id)
+            compact = self._cache.get(building_id)
+        return compact.to_building() if compact is not None else None
 
     def _should_refresh_cache(self) -> bool:
         """Check if cache should be refreshed based on TTL."""
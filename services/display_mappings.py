@@ -19,6 +19,22 @@ def _vocab_label(vocab_name: str, key, str_fallback: dict = None) -> str:
         result = get_label(vocab_name, key)
         if result != str(key):
             return result
+    return _fallback_label(key, str_fallback)
+
+
+def _vocab_labels(vocab_name: str, keys, str_fallback: dict = None) -> list:
+    """Bulk _vocab_label() for a whole table column (vocab_service.get_labels)."""
+    from services.vocab_service import get_labels, is_initialized
+    keys = list(keys)
+    if not is_initialized():
+        return [_fallback_label(key, str_fallback) for key in keys]
+    return [
+        label if label != str(key) else _fallback_label(key, str_fallback)
+        for key, label in zip(keys, get_labels(vocab_name, keys))
+    ]
+
+
+def _fallback_label(key, str_fallback: dict = None) -> str:
     # Fallback for string keys not in API vocab
     if str_fallback and not isinstance(key, int):
         tr_key = str_fallback.get(str(key).lower().replace("_", "") if key else "")
@@ -32,41 +48,55 @@ def _vocab_options(vocab_name: str) -> list:
     from services.vocab_service import get_options
     return get_options(vocab_name)
 
+_BUILDING_TYPE_FALLBACK = {
+    "residential": "mapping.building_type.residential",
+    "commercial": "mapping.building_type.commercial",
+    "mixed_use": "mapping.building_type.mixed_use",
+    "mixeduse": "mapping.building_type.mixed_use",
+    "industrial": "mapping.building_type.industrial",
+    "public": "mapping.building_type.public",
+}
+
+_BUILDING_STATUS_FALLBACK = {
+    "intact": "mapping.building_status.intact",
+    "standing": "mapping.building_status.intact",
+    "minordamage": "mapping.building_status.minor_damage",
+    "minor_damage": "mapping.building_status.minor_damage",
+    "moderatedamage": "mapping.building_status.moderate_damage",
+    "moderate_damage": "mapping.building_status.moderate_damage",
+    "damaged": "mapping.building_status.moderate_damage",
+    "partiallydamaged": "mapping.building_status.moderate_damage",
+    "partially_damaged": "mapping.building_status.moderate_damage",
+    "majordamage": "mapping.building_status.major_damage",
+    "major_damage": "mapping.building_status.major_damage",
+    "severelydamaged": "mapping.building_status.severely_damaged",
+    "severely_damaged": "mapping.building_status.severely_damaged",
+    "destroyed": "mapping.building_status.destroyed",
+    "demolished": "mapping.building_status.destroyed",
+    "rubble": "mapping.building_status.destroyed",
+    "underconstruction": "mapping.building_status.under_construction",
+    "under_construction": "mapping.building_status.under_construction",
+    "abandoned": "mapping.building_status.abandoned",
+    "unknown": "mapping.building_status.unknown",
+}
+
+
 def get_building_type_display(type_key) -> str:
-    _str_fallback = {
-        "residential": "mapping.building_type.residential",
-        "commercial": "mapping.building_type.commercial",
-        "mixed_use": "mapping.building_type.mixed_use",
-        "mixeduse": "mapping.building_type.mixed_use",
-        "industrial": "mapping.building_type.industrial",
-        "public": "mapping.building_type.public",
-    }
-    return _vocab_label("BuildingType", type_key, _str_fallback)
+    return _vocab_label("BuildingType", type_key, _BUILDING_TYPE_FALLBACK)
+
 
 def get_building_status_display(status_key) -> str:
-    _str_fallback = {
-        "intact": "mapping.building_status.intact",
-        "standing": "mapping.building_status.intact",
-        "minordamage": "mapping.building_status.minor_damage",
-        "minor_damage": "mapping.building_status.minor_damage",
-        "moderatedamage": "mapping.building_status.moderate_damage",
-        "moderate_damage": "mapping.building_status.moderate_damage",
-        "damaged": "mapping.building_status.moderate_damage",
-        "partiallydamaged": "mapping.building_status.moderate_damage",
-        "partially_damaged": "mapping.building_status.moderate_damage",
-        "majordamage": "mapping.building_status.major_damage",
-        "major_damage": "mapping.building_status.major_damage",
-        "severelydamaged": "mapping.building_status.severely_damaged",
-        "severely_damaged": "mapping.building_status.severely_damaged",
-        "destroyed": "mapping.building_status.destroyed",
-        "demolished": "mapping.building_status.destroyed",
-        "rubble": "mapping.building_status.destroyed",
-        "underconstruction": "mapping.building_status.under_construction",
-        "under_construction": "mapping.building_status.under_construction",
-        "abandoned": "mapping.building_status.abandoned",
-        "unknown": "mapping.building_status.unknown",
-    }
-    return _vocab_label("BuildingStatus", status_key, _str_fallback)
+    return _vocab_label("BuildingStatus", status_key, _BUILDING_STATUS_FALLBACK)
+
+
+def get_building_type_displays(type_keys) -> list:
+    """get_building_type_display() for a whole column."""
+    return _vocab_labels("BuildingType", type_keys, _BUILDING_TYPE_FALLBACK)
+
+
+def get_building_status_displays(status_keys) -> list:
+    """get_building_status_display() for a whole column."""
+    return _vocab_labels("BuildingStatus", status_keys, _BUILDING_STATUS_FALLBACK)
 
 
 def get_building_type_options() -> list:
@@ -1,9 +1,11 @@
 # -*- coding: utf-8 -*-
 """
-Administrative Divisions Service — API-only.
+Administrative Divisions Service.
 
 Reads hierarchical data (governorate -> district -> subdistrict -> community)
-from Backend API.
+through the persistent reference-data cache (services.reference_data_cache):
+each list is downloaded from the Backend API once, then served from memory
+or disk and revalidated after login.
 
 Usage:
     service = DivisionsService()
@@ -14,13 +16,14 @@ Usage:
 """
 
 from typing import List, Tuple
+from services.reference_data_cache import get_reference_data_cache
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
 class DivisionsService:
-    """Administrative divisions data provider (API-only)."""
+    """Administrative divisions data provider (reference-data cache backed)."""
 
     _instance = None
 
@@ -35,100 +38,61 @@ class DivisionsService:
         if self._initialized:
             return
         self._initialized = True
-        self._governorates_cache = None
-        self._districts_cache = {}
-        self._subdistricts_cache = {}
-        self._communities_cache = {}
-
-    def _get_api_client(self):
-        """Get API client if available."""
-        try:
-            from services.api_client import get_api_client
-            return get_api_client()
-        except Exception:
-            return None
+        # (kind, *codes) -> (cached item list, rows derived from it)
+        self._rows_cache = {}
+        self._communities_fallback = {}
+
+    def _rows(self, kind: str, *codes: str) -> List[Tuple[str, str, str]]:
+        """Active items of a cached dataset as [(code, name_en, name_ar)]."""
+        items = get_reference_data_cache().get(kind, *codes)
+        key = (kind,) + codes
+        cached = self._rows_cache.get(key)
+        if cached is not None and cached[0] is items:
+            return cached[1]
+        rows = [
+            (i.get("code", ""), i.get("nameEnglish", ""), i.get("nameArabic", ""))
+            for i in items or [] if i.get("isActive", True)
+        ]
+        self._rows_cache[key] = (items, rows)
+        return rows
 
     def get_governorates(self) -> List[Tuple[str, str, str]]:
         """Get all governorates as [(code, name_en, name_ar)]."""
-        if self._governorates_cache is not None:
-            return self._governorates_cache
-
-        api = self._get_api_client()
-        items = api.get_governorates()
-        self._governorates_cache = [
-            (g.get("code", ""), g.get("nameEnglish", ""), g.get("nameArabic", ""))
-            for g in items if g.get("isActive", True)
-        ]
-        return self._governorates_cache
+        return self._rows("governorates")
 
     def get_districts(self, gov_code: str) -> List[Tuple[str, str, str]]:
         """Get districts for a governorate as [(code, name_en, name_ar)]."""
-        if gov_code in self._districts_cache:
-            return self._districts_cache[gov_code]
-
-        api = self._get_api_client()
-        items = api.get_districts(governorate_code=gov_code)
-        self._districts_cache[gov_code] = [
-            (d.get("code", ""), d.get("nameEnglish", ""), d.get("nameArabic", ""))
-            for d in items if d.get("isActive", True)
-        ]
-        return self._districts_cache[gov_code]
+        return self._rows("districts", gov_code)
 
     def get_subdistricts(self, gov_code: str, dist_code: str) -> List[Tuple[str, str, str]]:
         """Get subdistricts for a district as [(code, name_en, name_ar)]."""
-        cache_key = (gov_code, dist_code)
-        if cache_key in self._subdistricts_cache:
-            return self._subdistricts_cache[cache_key]
-
-        api = self._get_api_client()
-        items = api.get_sub_districts(
-            governorate_code=gov_code, district_code=dist_code
-        )
-        self._subdistricts_cache[cache_key] = [
-            (s.get("code", ""), s.get("nameEnglish", ""), s.get("nameArabic", ""))
-            for s in items if s.get("isActive", True)
-        ]
-        return self._subdistricts_cache[cache_key]
+        return self._rows("sub_districts", gov_code, dist_code)
 
     def get_communities(self, gov_code: str, dist_code: str, subdist_code: str) -> List[Tuple[str, str, str]]:
         """Get communities for a subdistrict as [(code, name_en, name_ar)]."""
-        cache_key = (gov_code, dist_code, subdist_code)
-        if cache_key in self._communities_cache:
-            return self._communities_cache[cache_key]
-
         try:
-            api = self._get_api_client()
-            items = api.get_communities(
-                governorate_code=gov_code,
-                district_code=dist_code,
-                sub_district_code=subdist_code
-            )
-            result = [
-                (c.get("code", ""), c.get("nameEnglish", ""), c.get("nameArabic", ""))
-                for c in items if c.get("isActive", True)
-            ]
+            result = self._rows("communities", gov_code, dist_code, subdist_code)
             if result:
-                self._communities_cache[cache_key] = result
                 return result
         except Exception:
             pass
 
-    # Local fallback from populated places dataset
+        # Local fallback from populated places dataset
+        cache_key = (gov_code, dist_code, subdist_code)
+        if cache_key in self._communities_fallback:
+            return self._communities_fallback[cache_key]
+        result = []
         try:
             from services import boundary_service
             places = boundary_service.get_places_list(admin3_pcode=subdist_code)
-            if places:
-                result = [
-                    (p.get('pcode', ''), p.get('name_en', ''), p.get('name_ar', ''))
-                    for p in places
-                ]
-                self._communities_cache[cache_key] = result
-                return result
+            result = [
+                (p.get('pcode', ''), p.get('name_en', ''), p.get('name_ar', ''))
+                for p in places
+            ]
         except Exception:
             pass
-
-        self._communities_cache[cache_key] = []
-        return []
+        self._communities_fallback[cache_key] = result
+        return result
 
     def get_governorate_name(self, gov_code: str) -> Tuple[str, str]:
         """Get (name_en, name_ar) for a governorate."""
@@ -0,0 +1,348 @@
+# -*- coding: utf-8 -*-
+"""
+Content-defined chunk store for document versions.
+
+Scanned deeds are re-uploaded with small changes (an extra stamped page,
+an incremental PDF save) or as exact duplicates under other documents.
+Instead of a whole copy per version, a file is split into content-defined
+chunks and each chunk is stored once, named by its SHA-256:
+
+    document_storage/chunks/<hash[:2]>/<hash>
+
+  * boundaries come from a rolling sum of a fixed byte table over a
+    64-byte window (vectorized with numpy), cut where its low bits are
+    zero, so an insertion only changes the chunks around it;
+  * chunk sizes stay between avg/4 and avg*4 (avg from
+    Config.DOCUMENT_CHUNK_AVG_KB);
+  * put_file() hashes the whole file and its chunks in one pass with
+    1 MB reads and writes only chunks the store does not have yet;
+  * open() returns a seekable stream over a chunk list; every chunk is
+    checked against its hash when first read;
+  * digests are cached per (path, mtime, size), so repeated integrity
+    checks of unchanged files do not re-read them.
+
+The version -> chunk manifests live in the database (document_version_chunks,
+see DocumentVersionService); this module only handles the files.
+
+Usage:
+    store = DocumentChunkStore(storage_path / "chunks")
+    stored = store.put_file(path)         # StoredFile(file_hash, size, chunks, new_chunks)
+    with store.open(stored.chunks) as f:
+        data = f.read(65536)
+"""
+
+import bisect
+import hashlib
+import io
+import os
+import threading
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Read size for hashing and chunking
+HASH_BUFFER_SIZE = 1024 * 1024
+DEFAULT_AVG_CHUNK_SIZE = 64 * 1024
+_WINDOW = 64
+_INTEGRITY_CACHE_SIZE = 100_000
+
+# Rolling-sum table: fixed, so boundaries are the same on every install
+_GEAR = np.array(
+    [int.from_bytes(hashlib.sha256(bytes([i])).digest()[:4], "little") for i in range(256)],
+    dtype=np.uint32,
+)
+
+Chunk = Tuple[str, int]  # (sha256 hex, size)
+
+
+class ChunkIntegrityError(IOError):
+    """A stored chunk does not match its hash (or is missing)."""
+
+
+@dataclass
+class StoredFile:
+    """Result of DocumentChunkStore.put_file()."""
+    file_hash: str
+    size: int
+    chunks: List[Chunk] = field(default_factory=list)
+    new_chunks: List[str] = field(default_factory=list)  # hashes written by this call
+
+    @property
+    def new_bytes(self) -> int:
+        new = set(self.new_chunks)
+        return sum(size for digest, size in self.chunks if digest in new)
+
+
+class IntegrityCache:
+    """SHA-256 of files, cached per (path, mtime_ns, size)."""
+
+    def __init__(self, max_entries: int = _INTEGRITY_CACHE_SIZE):
+        self._entries: Dict[str, Tuple[int, int, str]] = {}
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, path: Path, stat: os.stat_result) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(str(path))
+            if entry and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+                self.hits += 1
+                return entry[2]
+            self.misses += 1
+            return None
+
+    def store(self, path: Path, stat: os.stat_result, digest: str) -> None:
+        with self._lock:
+            if len(self._entries) >= self._max_entries:
+                self._entries.pop(next(iter(self._entries)))
+            self._entries[str(path)] = (stat.st_mtime_ns, stat.st_size, digest)
+
+    def digest(self, path: Path) -> str:
+        """SHA-256 of `path`, read only when the file changed since the last call."""
+        stat = os.stat(path)
+        cached = self.lookup(path, stat)
+        if cached is None:
+            cached = hash_file(path)
+            self.store(path, stat, cached)
+        return cached
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+
+def hash_file(path: Path, buffer_size: int = HASH_BUFFER_SIZE) -> str:
+    """SHA-256 of a file, read in `buffer_size` blocks into one reused buffer."""
+    sha256 = hashlib.sha256()
+    buffer = bytearray(buffer_size)
+    view = memoryview(buffer)
+    with open(path, "rb", buffering=0) as f:
+        while True:
+            read = f.readinto(buffer)
+            if not read:
+                break
+            sha256.update(view[:read])
+    return sha256.hexdigest()
+
+
+def hash_stream(stream: BinaryIO, buffer_size: int = HASH_BUFFER_SIZE) -> str:
+    """SHA-256 of the rest of a stream."""
+    sha256 = hashlib.sha256()
+    for block in iter(lambda: stream.read(buffer_size), b""):
+        sha256.update(block)
+    return sha256.hexdigest()
+
+
+class ContentChunker:
+    """Splits a byte stream at content-defined boundaries."""
+
+    def __init__(self, avg_size: int = DEFAULT_AVG_CHUNK_SIZE):
+        bits = min(30, max(8, round(np.log2(max(avg_size, 256)))))
+        self.avg_size = 1 << bits
+        self.min_size = max(self.avg_size // 4, _WINDOW)
+        self.max_size = self.avg_size * 4
+        self._mask = np.uint32(self.avg_size - 1)
+
+    def _candidates(self, data: bytes) -> np.ndarray:
+        """End offsets (exclusive) where the rolling sum hits the mask."""
+        # uint32 sums wrap; the window difference is still exact modulo 2**32
+        sums = np.take(_GEAR, np.frombuffer(data, dtype=np.uint8))
+        np.cumsum(sums, out=sums)
+        rolling = sums[_WINDOW:] - sums[:-_WINDOW]
+        rolling &= self._mask
+        return np.flatnonzero(rolling == 0) + _WINDOW + 1
+
+    def split(self, stream: BinaryIO, buffer_size: int = HASH_BUFFER_SIZE) -> Iterator[bytes]:
+        """Yield the chunks of a stream in order."""
+        pending = b""
+        eof = False
+        while not eof:
+            block = stream.read(buffer_size)
+            eof = not block
+            data = pending + block if pending else block
+            if not data:
+                break
+            candidates = self._candidates(data) if len(data) > _WINDOW else np.empty(0, dtype=np.intp)
+            start = 0
+            while True:
+                remaining = len(data) - start
+                if remaining < self.min_size and not eof:
+                    break
+                i = np.searchsorted(candidates, start + self.min_size)
+                cut = int(candidates[i]) if i < len(candidates) else None
+                if cut is None or cut - start > self.max_size:
+                    if remaining > self.max_size:
+                        cut = start + self.max_size
+                    elif eof:
+                        cut = len(data) if remaining else None
+                    else:
+                        break
+                if cut is None:
+                    break
+                yield data[start:cut]
+                start = cut
+            pending = data[start:]
+
+
+class ChunkReader(io.RawIOBase):
+    """Seekable read-only stream over a chunk list, verifying each chunk on load."""
+
+    def __init__(self, store: "DocumentChunkStore", chunks: List[Chunk]):
+        super().__init__()
+        self._store = store
+        self._chunks = list(chunks)
+        self._offsets = [0]
+        for _, size in self._chunks:
+            self._offsets.append(self._offsets[-1] + size)
+        self._pos = 0
+        self._index = -1
+        self._data = b""
+
+    @property
+    def size(self) -> int:
+        return self._offsets[-1]
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += self.size
+        if offset < 0:
+            raise ValueError("negative seek position")
+        self._pos = offset
+        return offset
+
+    def readinto(self, buffer) -> int:
+        if self._pos >= self.size:
+            return 0
+        index = bisect.bisect_right(self._offsets, self._pos) - 1
+        if index != self._index:
+            digest, size = self._chunks[index]
+            self._data = self._store.read_chunk(digest, size)
+            self._index = index
+        start = self._pos - self._offsets[index]
+        count = min(len(buffer), len(self._data) - start)
+        buffer[:count] = self._data[start:start + count]
+        self._pos += count
+        return count
+
+
+class DocumentChunkStore:
+    """Chunk files under `root`, one per distinct SHA-256."""
+
+    def __init__(self, root: Path, avg_chunk_size: int = DEFAULT_AVG_CHUNK_SIZE):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.chunker = ContentChunker(avg_chunk_size)
+        self.integrity = IntegrityCache()
+
+    def chunk_path(self, digest: str) -> Path:
+        return self.root / digest[:2] / digest
+
+    def has_chunk(self, digest: str, size: int) -> bool:
+        try:
+            return os.stat(self.chunk_path(digest)).st_size == size
+        except OSError:
+            return False
+
+    def _write_chunk(self, digest: str, data: bytes) -> None:
+        path = self.chunk_path(digest)
+        path.parent.mkdir(exist_ok=True)
+        tmp = path.with_name(f"{digest}.{uuid.uuid4().hex[:8]}.tmp")
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+        self.integrity.store(path, os.stat(path), digest)
+
+    def put_stream(self, stream: BinaryIO) -> StoredFile:
+        """Chunk and store a stream; chunks already present are not rewritten."""
+        file_sha = hashlib.sha256()
+        stored = StoredFile(file_hash="", size=0)
+        for data in self.chunker.split(stream):
+            file_sha.update(data)
+            digest = hashlib.sha256(data).hexdigest()
+            if not self.has_chunk(digest, len(data)):
+                self._write_chunk(digest, data)
+                stored.new_chunks.append(digest)
+            stored.chunks.append((digest, len(data)))
+            stored.size += len(data)
+        stored.file_hash = file_sha.hexdigest()
+        return stored
+
+    def put_file(self, path: Path) -> StoredFile:
+        with open(path, "rb") as f:
+            return self.put_stream(f)
+
+    def read_chunk(self, digest: str, size: Optional[int] = None) -> bytes:
+        """Chunk content, hash-checked unless the file is unchanged since its last check."""
+        path = self.chunk_path(digest)
+        try:
+            with open(path, "rb") as f:
+                stat = os.fstat(f.fileno())
+                data = f.read()
+        except OSError as e:
+            raise ChunkIntegrityError(f"Chunk missing: {digest}") from e
+        if size is not None and len(data) != size:
+            raise ChunkIntegrityError(f"Chunk size mismatch: {digest}")
+        if self.integrity.lookup(path, stat) != digest:
+            if hashlib.sha256(data).hexdigest() != digest:
+                raise ChunkIntegrityError(f"Chunk hash mismatch: {digest}")
+            self.integrity.store(path, stat, digest)
+        return data
+
+    def verify_chunk(self, digest: str, size: Optional[int] = None) -> bool:
+        path = self.chunk_path(digest)
+        try:
+            if size is not None and os.stat(path).st_size != size:
+                return False
+            return self.integrity.digest(path) == digest
+        except OSError:
+            return False
+
+    def open(self, chunks: List[Chunk]) -> BinaryIO:
+        """Buffered, seekable stream over `chunks`."""
+        return io.BufferedReader(ChunkReader(self, chunks), buffer_size=HASH_BUFFER_SIZE)
+
+    def export(self, chunks: List[Chunk], destination: Path) -> Path:
+        """Reassemble `chunks` into `destination` (written atomically)."""
+        destination = Path(destination)
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        tmp = destination.with_name(f"{destination.name}.{uuid.uuid4().hex[:8]}.tmp")
+        try:
+            with open(tmp, "wb") as out:
+                for digest, size in chunks:
+                    out.write(self.read_chunk(digest, size))
+            os.replace(tmp, destination)
+        finally:
+            if tmp.exists():
+                tmp.unlink()
+        return destination
+
+    def remove(self, digests: Iterable[str]) -> int:
+        """Delete chunk files; returns the number removed."""
+        removed = 0
+        for digest in digests:
+            try:
+                self.chunk_path(digest).unlink()
+                removed += 1
+            except FileNotFoundError:
+                pass
+        return removed
@@ -1,22 +1,34 @@
 """Document version management service with history and integrity verification."""
 
 import json
-import hashlib
 import shutil
 import os
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Tuple, BinaryIO
+from typing import List, Optional, Dict, Any, Tuple, BinaryIO, Iterator
 import logging
 import uuid
 
+from app.config import Config
 from repositories.db_adapter import DatabaseFactory, DatabaseAdapter, RowProxy, DatabaseType
+from services.document_chunk_store import (
+    ChunkIntegrityError, DocumentChunkStore, IntegrityCache, StoredFile, hash_stream
+)
 
 logger = logging.getLogger(__name__)
 
 
+def _as_datetime(value: Any) -> datetime:
+    """TIMESTAMP column value: datetime (SQLite converters, psycopg2) or ISO string.
+
+    Timestamps are written with a space separator (isoformat(sep=" ")), the
+    form sqlite3's TIMESTAMP converter parses.
+    """
+    return value if isinstance(value, datetime) else datetime.fromisoformat(value)
+
+
 class DocumentType(Enum):
     """Types of documents in the system."""
     ID_CARD = "id_card"
@@ -202,6 +214,14 @@ class DocumentVersionService:
             self.storage_path = Path("./document_storage")
         self.storage_path.mkdir(parents=True, exist_ok=True)
 
+        # Content-defined chunk store shared by all versions and documents
+        self._chunking = Config.DOCUMENT_CHUNK_AVG_KB > 0
+        self._chunks = DocumentChunkStore(
+            self.storage_path / "chunks",
+            avg_chunk_size=max(Config.DOCUMENT_CHUNK_AVG_KB, 1) * 1024
+        )
+        self._integrity = IntegrityCache()
+
         self._ensure_tables()
 
     def _ensure_tables(self):
@@ -301,6 +321,23 @@ class DocumentVersionService:
                     )
                 """)
 
+            # Chunk manifests of chunked versions (ordered by seq)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS document_version_chunks (
+                    version_id TEXT NOT NULL,
+                    seq INTEGER NOT NULL,
+                    chunk_hash TEXT NOT NULL,
+                    chunk_size INTEGER NOT NULL,
+                    PRIMARY KEY (version_id, seq)
+                )
+            """)
+
+            # Chunk references (garbage collection after hard deletes)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_doc_version_chunks_hash
+                ON document_version_chunks(chunk_hash)
+            """)
+
             # Hash index for duplicate detection
             cursor.execute("""
                 CREATE INDEX IF NOT EXISTS idx_doc_versions_hash
@@ -322,20 +359,14 @@ class DocumentVersionService:
             logger.info("Document versioning tables initialized")
 
     def _compute_file_hash(self, file_path: Path) -> str:
-        """Compute SHA-256 hash of a file."""
-        sha256 = hashlib.sha256()
-        with open(file_path, 'rb') as f:
-            for chunk in iter(lambda: f.read(8192), b''):
-                sha256.update(chunk)
-        return sha256.hexdigest()
+        """Compute SHA-256 hash of a file (cached while its mtime and size are unchanged)."""
+        return self._integrity.digest(file_path)
 
     def _compute_stream_hash(self, file_stream: BinaryIO) -> str:
         """Compute SHA-256 hash from a file stream."""
-        sha256 = hashlib.sha256()
-        for chunk in iter(lambda: file_stream.read(8192), b''):
-            sha256.update(chunk)
+        digest = hash_stream(file_stream)
         file_stream.seek(0)  # Reset stream position
-        return sha256.hexdigest()
+        return digest
 
     def _get_storage_path(self, document_id: str, version: int, file_ext: str) -> Path:
         """Generate storage path for a document version."""
@@ -345,6 +376,69 @@ class DocumentVersionService:
         subdir.mkdir(parents=True, exist_ok=True)
         return subdir / f"v{version}{file_ext}"
 
+    def _store_version_file(
+        self,
+        source_path: Path,
+        document_id: str,
+        version: int,
+        file_ext: str
+    ) -> Tuple[str, str, Optional[StoredFile]]:
+        """
+        Store the content of a new version.
+
+        Returns:
+            Tuple of (relative file_path, file_hash, StoredFile or None for a whole-file copy)
+        """
+        if not self._chunking:
+            storage_path = self._get_storage_path(document_id, version, file_ext)
+            shutil.copy2(source_path, storage_path)
+            return (str(storage_path.relative_to(self.storage_path)),
+                    self._compute_file_hash(source_path), None)
+
+        # Logical path only: the content lives in the chunk store
+        stored = self._chunks.put_file(source_path)
+        file_path = f"{document_id[:2]}/{document_id}/v{version}{file_ext}"
+        return file_path, stored.file_hash, stored
+
+    def _insert_chunk_manifest(self, cursor: Any, version_id: str, stored: StoredFile):
+        """Record the chunk list of a version."""
+        cursor.executemany("""
+            INSERT INTO document_version_chunks (version_id, seq, chunk_hash, chunk_size)
+            VALUES (?, ?, ?, ?)
+        """, [(version_id, seq, digest, size) for seq, (digest, size) in enumerate(stored.chunks)])
+
+    def _discard_version_file(self, file_path: str, stored: Optional[StoredFile]):
+        """Remove what _store_version_file wrote when the version is not saved."""
+        if stored is None:
+            path = self.storage_path / file_path
+            if path.exists():
+                path.unlink()
+        else:
+            self._collect_chunks(stored.new_chunks)
+
+    def _collect_chunks(self, digests: List[str]) -> int:
+        """Delete chunk files no manifest references any more."""
+        if not digests:
+            return 0
+        unreferenced = set(digests)
+        digest_list = list(unreferenced)
+        for i in range(0, len(digest_list), 500):
+            batch = digest_list[i:i + 500]
+            rows = self._adapter.fetch_all(f"""
+                SELECT DISTINCT chunk_hash FROM document_version_chunks
+                WHERE chunk_hash IN ({", ".join("?" for _ in batch)})
+            """, tuple(batch))
+            unreferenced.difference_update(row["chunk_hash"] for row in rows)
+        return self._chunks.remove(unreferenced)
+
+    def _version_chunks(self, version_id: str) -> List[Tuple[str, int]]:
+        """Chunk list of a version; empty for whole-file copies."""
+        rows = self._adapter.fetch_all("""
+            SELECT chunk_hash, chunk_size FROM document_version_chunks
+            WHERE version_id = ? ORDER BY seq
+        """, (version_id,))
+        return [(row["chunk_hash"], row["chunk_size"]) for row in rows]
+
     def _detect_mime_type(self, file_path: Path) -> str:
         """Detect MIME type from file extension."""
         ext = file_path.suffix.lower()
@@ -386,14 +480,6 @@ class DocumentVersionService:
         if mime_type not in self.SUPPORTED_MIME_TYPES and mime_type != "application/octet-stream":
             logger.warning(f"Unsupported MIME type: {mime_type}")
 
-        # Compute hash
-        file_hash = self._compute_file_hash(source_path)
-
-        # Check for duplicates
-        duplicate = self.find_by_hash(file_hash)
-        if duplicate:
-            logger.warning(f"Duplicate file detected: {duplicate.document_id}")
-
         # Generate IDs
         document_id = str(uuid.uuid4())
         version_id = str(uuid.uuid4())
@@ -401,16 +487,20 @@ class DocumentVersionService:
         # Get file extension
         file_ext = source_path.suffix or self.SUPPORTED_MIME_TYPES.get(mime_type, "")
 
-        # Copy file to storage
-        storage_path = self._get_storage_path(document_id, 1, file_ext)
-        shutil.copy2(source_path, storage_path)
+        # Store file (hash computed in the same pass)
+        file_path_rel, file_hash, stored = self._store_version_file(source_path, document_id, 1, file_ext)
+
+        # Check for duplicates
+        duplicate = self.find_by_hash(file_hash)
+        if duplicate:
+            logger.warning(f"Duplicate file detected: {duplicate.document_id}")
 
         # Create document version
         version = DocumentVersion(
             version_id=version_id,
             document_id=document_id,
             version_number=1,
-            file_path=str(storage_path.relative_to(self.storage_path)),
+            file_path=file_path_rel,
             file_name=source_path.name,
             file_size=file_size,
             mime_type=mime_type,
@@ -461,6 +551,8 @@ class DocumentVersionService:
                     version_id, document_id, 1, version.file_path,
                     version.file_name, file_size, mime_type, file_hash, created_by
                 ))
+                if stored:
+                    self._insert_chunk_manifest(cursor, version_id, stored)
 
                 # Insert entity links
                 for link in (linked_entities or []):
@@ -483,8 +575,7 @@ class DocumentVersionService:
 
         except Exception as e:
             # Clean up stored file on error
-            if storage_path.exists():
-                storage_path.unlink()
+            self._discard_version_file(file_path_rel, stored)
             raise e
 
     def add_version(
@@ -522,26 +613,28 @@ class DocumentVersionService:
             raise ValueError(f"File size exceeds maximum")
 
         mime_type = self._detect_mime_type(source_path)
-        file_hash = self._compute_file_hash(source_path)
-
-        # Check if file is same as current version
-        current = self.get_current_version(document_id)
-        if current and current.file_hash == file_hash:
-            raise ValueError("New file is identical to current version")
 
         # Generate new version
         new_version_number = document.current_version + 1
         version_id = str(uuid.uuid4())
 
+        # Store file (hash computed in the same pass)
         file_ext = source_path.suffix or self.SUPPORTED_MIME_TYPES.get(mime_type, "")
-        storage_path = self._get_storage_path(document_id, new_version_number, file_ext)
-        shutil.copy2(source_path, storage_path)
+        file_path_rel, file_hash, stored = self._store_version_file(
+            source_path, document_id, new_version_number, file_ext
+        )
+
+        # Check if file is same as current version
+        current = self.get_current_version(document_id)
+        if current and current.file_hash == file_hash:
+            self._discard_version_file(file_path_rel, stored)
+            raise ValueError("New file is identical to current version")
 
         version = DocumentVersion(
             version_id=version_id,
             document_id=document_id,
             version_number=new_version_number,
-            file_path=str(storage_path.relative_to(self.storage_path)),
+            file_path=file_path_rel,
             file_name=source_path.name,
             file_size=file_size,
             mime_type=mime_type,
@@ -571,6 +664,8 @@ class DocumentVersionService:
                     version.file_name, file_size, mime_type, file_hash,
                     created_by, change_notes
                 ))
+                if stored:
+                    self._insert_chunk_manifest(cursor, version_id, stored)
 
                 # Update document
                 cursor.execute("""
@@ -579,7 +674,7 @@ class DocumentVersionService:
                         modified_at = ?,
                         modified_by = ?
                     WHERE document_id = ?
-                """, (new_version_number, datetime.utcnow().isoformat(), created_by, document_id))
+                """, (new_version_number, datetime.utcnow().isoformat(sep=" "), created_by, document_id))
 
                 # Audit log
                 self._log_action(
@@ -597,8 +692,7 @@ class DocumentVersionService:
             return version
 
         except Exception as e:
-            if storage_path.exists():
-                storage_path.unlink()
+            self._discard_version_file(file_path_rel, stored)
             raise e
 
     def get_document(self, document_id: str, include_versions: bool = True) -> Optional[Document]:
@@ -626,7 +720,7 @@ class DocumentVersionService:
                     file_size=v_row["file_size"],
                     mime_type=v_row["mime_type"],
                     file_hash=v_row["file_hash"],
-                    created_at=datetime.fromisoformat(v_row["created_at"]) if v_row["created_at"] else datetime.utcnow(),
+                    created_at=_as_datetime(v_row["created_at"]) if v_row["created_at"] else datetime.utcnow(),
                     created_by=v_row["created_by"] or "",
                     change_notes=v_row["change_notes"] or "",
                     is_current=bool(v_row["is_current"])
@@ -648,16 +742,16 @@ class DocumentVersionService:
             status=DocumentStatus(row["status"]) if row["status"] else DocumentStatus.ACTIVE,
             verification_status=VerificationStatus(row["verification_status"]) if row["verification_status"] else VerificationStatus.PENDING,
             verified_by=row["verified_by"] or "",
-            verified_at=datetime.fromisoformat(row["verified_at"]) if row["verified_at"] else None,
+            verified_at=_as_datetime(row["verified_at"]) if row["verified_at"] else None,
             verification_notes=row["verification_notes"] or "",
             metadata=DocumentMetadata.from_dict(json.loads(row["metadata"])) if row["metadata"] else DocumentMetadata(),
             current_version=row["current_version"],
             versions=versions,
             linked_entities=linked_entities,
             tags=json.loads(row["tags"]) if row["tags"] else [],
-            created_at=datetime.fromisoformat(row["created_at"]) if row["created_at"] else datetime.utcnow(),
+            created_at=_as_datetime(row["created_at"]) if row["created_at"] else datetime.utcnow(),
             created_by=row["created_by"] or "",
-            modified_at=datetime.fromisoformat(row["modified_at"]) if row["modified_at"] else None,
+            modified_at=_as_datetime(row["modified_at"]) if row["modified_at"] else None,
             modified_by=row["modified_by"] or ""
         )
 
@@ -680,7 +774,7 @@ class DocumentVersionService:
             file_size=row["file_size"],
             mime_type=row["mime_type"],
             file_hash=row["file_hash"],
-            created_at=datetime.fromisoformat(row["created_at"]) if row["created_at"] else datetime.utcnow(),
+            created_at=_as_datetime(row["created_at"]) if row["created_at"] else datetime.utcnow(),
             created_by=row["created_by"] or "",
             change_notes=row["change_notes"] or "",
             is_current=True
@@ -705,23 +799,75 @@ class DocumentVersionService:
             file_size=row["file_size"],
             mime_type=row["mime_type"],
             file_hash=row["file_hash"],
-            created_at=datetime.fromisoformat(row["created_at"]) if row["created_at"] else datetime.utcnow(),
+            created_at=_as_datetime(row["created_at"]) if row["created_at"] else datetime.utcnow(),
             created_by=row["created_by"] or "",
             change_notes=row["change_notes"] or "",
             is_current=bool(row["is_current"])
         )
 
-    def get_file_path(self, document_id: str, version_number: Optional[int] = None) -> Optional[Path]:
-        """Get full file path for a document version."""
+    def _resolve_version(self, document_id: str, version_number: Optional[int]) -> Optional[DocumentVersion]:
         if version_number:
-            version = self.get_version(document_id, version_number)
-        else:
-            version = self.get_current_version(document_id)
+            return self.get_version(document_id, version_number)
+        return self.get_current_version(document_id)
 
+    def get_file_path(self, document_id: str, version_number: Optional[int] = None) -> Optional[Path]:
+        """
+        Get full file path for a document version.
+
+        Chunked versions are reassembled once into storage_path/cache (named
+        by content hash, so duplicates share the file); prefer open_version()
+        when the content is only read.
+        """
+        version = self._resolve_version(document_id, version_number)
+        if not version:
+            return None
+
+        chunks = self._version_chunks(version.version_id)
+        if not chunks:
+            return self.storage_path / version.file_path
+
+        cached = self.storage_path / "cache" / f"{version.file_hash}{Path(version.file_path).suffix}"
+        if not (cached.exists() and cached.stat().st_size == version.file_size):
+            self._chunks.export(chunks, cached)
+        return cached
+
+    def open_version(self, document_id: str, version_number: Optional[int] = None) -> Optional[BinaryIO]:
+        """
+        Open a document version for streaming reads (e.g. the evidence viewer).
+
+        Returns a seekable binary stream, or None if the version does not exist.
+        Chunks are checked against their hashes as they are read (a
+        ChunkIntegrityError is raised on damage); whole-file copies are
+        verified before they are opened.
+        """
+        version = self._resolve_version(document_id, version_number)
         if not version:
             return None
 
-        return self.storage_path / version.file_path
+        chunks = self._version_chunks(version.version_id)
+        if chunks:
+            return self._chunks.open(chunks)
+
+        file_path = self.storage_path / version.file_path
+        if not file_path.exists():
+            raise FileNotFoundError("Version file not found in storage")
+        if self._compute_file_hash(file_path) != version.file_hash:
+            raise ChunkIntegrityError(f"Hash mismatch: {file_path}")
+        return open(file_path, "rb")
+
+    def iter_version_content(
+        self,
+        document_id: str,
+        version_number: Optional[int] = None,
+        block_size: int = 256 * 1024
+    ) -> Iterator[bytes]:
+        """Yield the content of a document version in blocks."""
+        stream = self.open_version(document_id, version_number)
+        if stream is None:
+            return
+        with stream:
+            for block in iter(lambda: stream.read(block_size), b""):
+                yield block
 
     def list_documents(
         self,
@@ -820,9 +966,9 @@ class DocumentVersionService:
             """, (
                 status.value,
                 verified_by,
-                datetime.utcnow().isoformat(),
+                datetime.utcnow().isoformat(sep=" "),
                 notes,
-                datetime.utcnow().isoformat(),
+                datetime.utcnow().isoformat(sep=" "),
                 verified_by,
                 document_id
             ))
@@ -846,14 +992,21 @@ class DocumentVersionService:
         Returns:
             Tuple of (is_valid, message)
         """
-        if version_number:
-            version = self.get_version(document_id, version_number)
-        else:
-            version = self.get_current_version(document_id)
-
+        version = self._resolve_version(document_id, version_number)
         if not version:
             return False, "Version not found"
 
+        # Chunked version: every chunk matches its hash and the sizes add up.
+        # Hashes are cached per (path, mtime, size): unchanged chunks are not re-read.
+        chunks = self._version_chunks(version.version_id)
+        if chunks:
+            if sum(size for _, size in chunks) != version.file_size:
+                return False, "Chunk manifest does not match file size"
+            for digest, size in chunks:
+                if not self._chunks.verify_chunk(digest, size):
+                    return False, f"Chunk damaged or missing: {digest}"
+            return True, "File integrity verified"
+
         file_path = self.storage_path / version.file_path
         if not file_path.exists():
             return False, "File not found in storage"
@@ -933,7 +1086,7 @@ class DocumentVersionService:
                     modified_at = ?,
                     modified_by = ?
                 WHERE document_id = ?
-            """, (status.value, datetime.utcnow().isoformat(), updated_by, document_id))
+            """, (status.value, datetime.utcnow().isoformat(sep=" "), updated_by, document_id))
 
             self._log_action(
                 cursor, document_id, "status_changed",
@@ -960,6 +1113,11 @@ class DocumentVersionService:
         if not document:
             raise ValueError(f"Document not found: {document_id}")
 
+        released_chunks = []
+        if hard_delete:
+            for version in document.versions:
+                released_chunks.extend(digest for digest, _ in self._version_chunks(version.version_id))
+
         with self._adapter.cursor() as cursor:
             if hard_delete:
                 # Remove physical files
@@ -968,6 +1126,11 @@ class DocumentVersionService:
                     if file_path.exists():
                         file_path.unlink()
 
+                # Drop chunk manifests; shared chunks are collected below
+                for version in document.versions:
+                    cursor.execute("DELETE FROM document_version_chunks WHERE version_id = ?",
+                                   (version.version_id,))
+
                 # Remove from database
                 cursor.execute("DELETE FROM document_entity_links WHERE document_id = ?", (document_id,))
                 cursor.execute("DELETE FROM document_versions WHERE document_id = ?", (document_id,))
@@ -986,7 +1149,7 @@ class DocumentVersionService:
                         modified_at = ?,
                         modified_by = ?
                     WHERE document_id = ?
-                """, (datetime.utcnow().isoformat(), deleted_by, document_id))
+                """, (datetime.utcnow().isoformat(sep=" "), deleted_by, document_id))
 
                 self._log_action(
                     cursor, document_id, "soft_deleted",
@@ -994,6 +1157,7 @@ class DocumentVersionService:
                     deleted_by
                 )
 
+        self._collect_chunks(released_chunks)
         return True
 
     def update_metadata(
@@ -1016,7 +1180,7 @@ class DocumentVersionService:
                 WHERE document_id = ?
             """, (
                 json.dumps(metadata.to_dict()),
-                datetime.utcnow().isoformat(),
+                datetime.utcnow().isoformat(sep=" "),
                 updated_by,
                 document_id
             ))
@@ -1049,7 +1213,7 @@ class DocumentVersionService:
                 WHERE document_id = ?
             """, (
                 json.dumps(tags),
-                datetime.utcnow().isoformat(),
+                datetime.utcnow().isoformat(sep=" "),
                 updated_by,
                 document_id
             ))
@@ -1137,8 +1301,8 @@ class DocumentVersionService:
             raise ValueError("Version is already current")
 
         # Get the file path
-        file_path = self.storage_path / version.file_path
-        if not file_path.exists():
+        file_path = self.get_file_path(document_id, version_number)
+        if not file_path or not file_path.exists():
             raise FileNotFoundError("Version file not found in storage")
 
         # Add as new version
@@ -1210,7 +1374,7 @@ class DocumentVersionService:
                 action=row["action"],
                 details=json.loads(row["details"]) if row["details"] else {},
                 performed_by=row["performed_by"],
-                performed_at=datetime.fromisoformat(row["performed_at"]) if row["performed_at"] else datetime.utcnow()
+                performed_at=_as_datetime(row["performed_at"]) if row["performed_at"] else datetime.utcnow()
             ))
 
         return entries
@@ -1257,3 +1421,151 @@ class DocumentVersionService:
         stats["avg_versions_per_document"] = round(result["avg"] or 0, 2) if result else 0
 
         return stats
+
+    def migrate_to_chunk_store(self, limit: Optional[int] = None) -> Dict[str, int]:
+        """
+        Move whole-file versions into the chunk store.
+
+        Each file is chunked, checked against its recorded hash and removed
+        once its manifest is saved. Files that are missing or do not match
+        their hash are left untouched.
+
+        Returns:
+            Counts: migrated, skipped, bytes_before, bytes_written
+        """
+        query = """
+            SELECT v.version_id, v.file_path, v.file_hash FROM document_versions v
+            WHERE NOT EXISTS (
+                SELECT 1 FROM document_version_chunks c WHERE c.version_id = v.version_id
+            )
+            ORDER BY v.created_at
+        """
+        params: Tuple = ()
+        if limit:
+            query += " LIMIT ?"
+            params = (limit,)
+
+        result = {"migrated": 0, "skipped": 0, "bytes_before": 0, "bytes_written": 0}
+        for row in self._adapter.fetch_all(query, params):
+            file_path = self.storage_path / row["file_path"]
+            if not file_path.exists():
+                result["skipped"] += 1
+                continue
+
+            stored = self._chunks.put_file(file_path)
+            if stored.file_hash != row["file_hash"]:
+                logger.warning(f"Not migrating {row['version_id']}: hash mismatch")
+                self._collect_chunks(stored.new_chunks)
+                result["skipped"] += 1
+                continue
+
+            try:
+                with self._adapter.cursor() as cursor:
+                    self._insert_chunk_manifest(cursor, row["version_id"], stored)
+            except Exception:
+                self._collect_chunks(stored.new_chunks)
+                raise
+            file_path.unlink()
+            result["migrated"] += 1
+            result["bytes_before"] += stored.size
+            result["bytes_written"] += stored.new_bytes
+
+        logger.info(f"Chunk store migration: {result}")
+        return result
+
+    def _document_neighborhoods(self) -> Dict[str, str]:
+        """document_id -> neighborhood_code, from linked buildings or claims (first code wins)."""
+        rows = self._adapter.fetch_all("""
+            SELECT l.document_id, b.neighborhood_code
+            FROM document_entity_links l
+            JOIN buildings b ON b.building_id = l.entity_id
+            WHERE l.entity_type = 'building'
+            UNION ALL
+            SELECT l.document_id, b.neighborhood_code
+            FROM document_entity_links l
+            JOIN buildings b ON b.building_uuid = l.entity_id
+            WHERE l.entity_type = 'building'
+            UNION ALL
+            SELECT l.document_id, b.neighborhood_code
+            FROM document_entity_links l
+            JOIN claims c ON c.claim_id = l.entity_id
+            JOIN property_units u ON u.unit_id = c.unit_id
+            JOIN buildings b ON b.building_id = u.building_id
+            WHERE l.entity_type = 'claim'
+            UNION ALL
+            SELECT l.document_id, b.neighborhood_code
+            FROM document_entity_links l
+            JOIN claims c ON c.claim_uuid = l.entity_id
+            JOIN property_units u ON u.unit_id = c.unit_id
+            JOIN buildings b ON b.building_id = u.building_id
+            WHERE l.entity_type = 'claim'
+        """)
+        neighborhoods: Dict[str, str] = {}
+        for row in rows:
+            code = row["neighborhood_code"]
+            if code and (row["document_id"] not in neighborhoods or code < neighborhoods[row["document_id"]]):
+                neighborhoods[row["document_id"]] = code
+        return neighborhoods
+
+    def get_storage_savings(self) -> Dict[str, Any]:
+        """
+        Storage saved by chunk deduplication, per neighborhood.
+
+        logical_bytes is the size of all versions as uploaded; stored_bytes
+        counts each distinct chunk once (whole-file versions in full).
+        Within a neighborhood only its own chunks are counted, so the total
+        (shared across neighborhoods) is less than the sum of the rows.
+        Documents not linked to a building or claim are under None.
+
+        Returns:
+            {"neighborhoods": [...], "total": {...}}, rows sorted by saved_bytes
+        """
+        neighborhoods = self._document_neighborhoods()
+
+        def bucket():
+            return {"documents": set(), "versions": 0, "logical_bytes": 0,
+                    "stored_bytes": 0, "chunks": set()}
+
+        buckets: Dict[Optional[str], Dict[str, Any]] = {}
+        total = bucket()
+
+        def add_chunk(entry, digest, size):
+            if digest not in entry["chunks"]:
+                entry["chunks"].add(digest)
+                entry["stored_bytes"] += size
+
+        for row in self._adapter.iter_rows("""
+            SELECT v.document_id, v.version_id, v.file_size,
+                   (SELECT COUNT(*) FROM document_version_chunks c
+                    WHERE c.version_id = v.version_id) AS chunk_count
+            FROM document_versions v
+        """):
+            for entry in (buckets.setdefault(neighborhoods.get(row["document_id"]), bucket()), total):
+                entry["documents"].add(row["document_id"])
+                entry["versions"] += 1
+                entry["logical_bytes"] += row["file_size"]
+                if not row["chunk_count"]:
+                    entry["stored_bytes"] += row["file_size"]
+
+        for row in self._adapter.iter_rows("""
+            SELECT v.document_id, c.chunk_hash, c.chunk_size
+            FROM document_version_chunks c
+            JOIN document_versions v ON v.version_id = c.version_id
+        """):
+            add_chunk(buckets[neighborhoods.get(row["document_id"])], row["chunk_hash"], row["chunk_size"])
+            add_chunk(total, row["chunk_hash"], row["chunk_size"])
+
+        def summary(entry):
+            saved = entry["logical_bytes"] - entry["stored_bytes"]
+            return {
+                "documents": len(entry["documents"]),
+                "versions": entry["versions"],
+                "logical_bytes": entry["logical_bytes"],
+                "stored_bytes": entry["stored_bytes"],
+                "saved_bytes": saved,
+                "savings_ratio": round(saved / entry["logical_bytes"], 4) if entry["logical_bytes"] else 0.0
+            }
+
+        rows = [{"neighborhood_code": code, **summary(entry)} for code, entry in buckets.items()]
+        rows.sort(key=lambda r: r["saved_bytes"], reverse=True)
+        return {"neighborhoods": rows, "total": summary(total)}
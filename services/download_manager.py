@@ -0,0 +1,517 @@
+# -*- coding: utf-8 -*-
+"""
+Background download manager for case attachments.
+
+Evidence and identification documents used to be fetched whole, one at a
+time, into a temp file on every case view, and an interrupted transfer
+started over. Downloads now go through one manager:
+
+  * a bounded queue: at most Config.DOWNLOAD_WORKERS transfers run at once,
+    INTERACTIVE requests (the user opened a file) are dequeued before
+    NORMAL ones (card previews, see evidence_viewer.load_evidence_preview)
+    and BACKGROUND prefetches, and a queued transfer is promoted when the
+    same file is requested at a higher priority;
+    concurrent requests for one attachment share a single transfer;
+  * resume: transfers are streamed into data/attachments/partial and an
+    interrupted one (network error, cancel, app restart) continues with an
+    HTTP Range request guarded by If-Range, retried with backoff;
+  * a content-addressed cache: finished files are stored once per SHA-256
+    (the key of the document version store and the preview cache) as
+    data/attachments/objects/<hash[:2]>/<hash>/<file name>; an index maps
+    each attachment (evidence id, identification document id) to its
+    content, so a case that was viewed before opens without a download and
+    the preview cache finds previews already rendered for the same content;
+  * the cache is bounded by Config.ATTACHMENT_CACHE_MB; least recently used
+    files (by mtime, refreshed on every hit) are evicted first;
+  * prefetch_evidences() queues a case's attachments in the background when
+    the case is opened, dropping prefetches still queued for the previous
+    case;
+  * per-transfer Qt signals: progress(key, received, total),
+    finished(key, path) and failed(key, message).
+
+Usage:
+    manager = get_download_manager()
+    path = manager.download_evidence(evidence_id, file_name)      # blocking, cached
+    future = manager.fetch_evidence(evidence_id, file_name)       # concurrent.futures.Future
+    manager.prefetch_evidences(claim_evidences)
+    manager.progress.connect(on_progress)
+"""
+
+import hashlib
+import heapq
+import itertools
+import json
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from PyQt5.QtCore import QCoreApplication, QObject, pyqtSignal
+
+from app.config import Config
+from services.document_chunk_store import hash_file
+from services.exceptions import ApiException, NetworkException
+from services.task_executor import CancellationToken, Priority, TaskCancelled
+from utils.helpers import sanitize_filename
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_MAX_ATTEMPTS = 4
+_RETRY_DELAY_S = 1.0  # doubled after every failed attempt
+_PROGRESS_STEP = 256 * 1024
+_PARTIAL_MAX_AGE_S = 7 * 86400
+
+
+def evidence_key(evidence_id: str) -> str:
+    return f"evidence:{evidence_id}"
+
+
+def identification_document_key(document_id: str) -> str:
+    return f"iddoc:{document_id}"
+
+
+class _Job:
+    """One queued or running transfer."""
+
+    __slots__ = ("key", "url", "file_name", "priority", "preview_alias",
+                 "future", "token", "started", "received", "reported")
+
+    def __init__(self, key: str, url: str, file_name: str, priority: Priority,
+                 preview_alias: Optional[str]):
+        self.key = key
+        self.url = url
+        self.file_name = file_name
+        self.priority = priority
+        self.preview_alias = preview_alias
+        self.future: Future = Future()
+        self.token = CancellationToken()
+        self.started = False
+        self.received = 0
+        self.reported = 0
+
+
+class DownloadManager(QObject):
+    """Bounded parallel download queue over a content-addressed attachment cache."""
+
+    progress = pyqtSignal(str, object, object)  # key, bytes received, total (0 = unknown)
+    finished = pyqtSignal(str, str)  # key, local path
+    failed = pyqtSignal(str, str)  # key, error message
+
+    def __init__(self, root: Optional[Path] = None, max_bytes: Optional[int] = None,
+                 workers: Optional[int] = None, api=None):
+        super().__init__()
+        app = QCoreApplication.instance()
+        if app is not None:
+            self.moveToThread(app.thread())
+        self.root = Path(root or Config.DATA_DIR / "attachments")
+        self._objects = self.root / "objects"
+        self._index = self.root / "index"
+        self._partial = self.root / "partial"
+        for path in (self._objects, self._index, self._partial):
+            path.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes if max_bytes is not None else Config.ATTACHMENT_CACHE_MB * 1024 * 1024
+        self.workers = max(1, Config.DOWNLOAD_WORKERS if workers is None else workers)
+        self._api = api
+        self._cond = threading.Condition()
+        self._heap: List = []
+        self._seq = itertools.count()
+        self._jobs: Dict[str, _Job] = {}
+        self._threads: List[threading.Thread] = []
+        self._stopped = False
+        self._total_bytes: Optional[int] = None
+        self._counters = {"hits": 0, "downloads": 0, "resumed": 0, "retries": 0, "failed": 0,
+                          "deduplicated": 0, "evicted": 0, "bytes_received": 0}
+
+    def _client(self):
+        if self._api is None:
+            from services.api_client import get_api_client
+            return get_api_client()
+        return self._api
+
+    # -- paths -------------------------------------------------------------
+
+    @staticmethod
+    def _key_name(key: str) -> str:
+        return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+    def _partial_path(self, key: str) -> Path:
+        return self._partial / f"{self._key_name(key)}.part"
+
+    def _state_path(self, key: str) -> Path:
+        return self._partial / f"{self._key_name(key)}.json"
+
+    # -- cache -------------------------------------------------------------
+
+    def cached_path(self, key: str) -> Optional[Path]:
+        """Local copy of an attachment, or None; a hit refreshes its LRU position."""
+        try:
+            relative = (self._index / self._key_name(key)).read_text(encoding="utf-8").strip()
+            path = self._objects / relative
+            os.utime(path)
+        except OSError:
+            return None
+        with self._cond:
+            self._counters["hits"] += 1
+        return path
+
+    def _store(self, job: _Job, part: Path) -> Path:
+        """Move a finished download into the object store (once per content)."""
+        digest = hash_file(part)
+        directory = self._objects / digest[:2] / digest
+        with self._cond:
+            directory.mkdir(parents=True, exist_ok=True)
+            existing = next(directory.iterdir(), None)
+            if existing is not None:
+                part.unlink()
+                os.utime(existing)
+                target = existing
+                self._counters["deduplicated"] += 1
+            else:
+                target = directory / (sanitize_filename(job.file_name) or digest)
+                size = part.stat().st_size
+                os.replace(part, target)
+                if self._total_bytes is not None:
+                    self._total_bytes += size
+            index = self._index / self._key_name(job.key)
+            tmp = index.with_name(f"{index.name}.{uuid.uuid4().hex[:8]}.tmp")
+            tmp.write_text(target.relative_to(self._objects).as_posix(), encoding="utf-8")
+            os.replace(tmp, index)
+        self._state_path(job.key).unlink(missing_ok=True)
+
+        if job.preview_alias:
+            try:
+                from services.preview_cache import get_preview_cache
+                get_preview_cache().set_alias(job.preview_alias, digest)
+            except Exception as e:
+                logger.debug(f"Preview alias not recorded for {job.key}: {e}")
+        self._evict_if_needed()
+        return target
+
+    # -- queue -------------------------------------------------------------
+
+    def fetch(self, key: str, url: str, file_name: str,
+              priority: Priority = Priority.INTERACTIVE,
+              preview_alias: Optional[str] = None) -> Future:
+        """
+        Future resolving to the local Path of `url`, stored under `key`.
+
+        Resolves at once from the cache; otherwise queues the transfer (or
+        joins the one already queued / running for `key`, promoting it to
+        `priority`).
+        """
+        cached = self.cached_path(key)
+        if cached:
+            future = Future()
+            future.set_result(cached)
+            return future
+
+        with self._cond:
+            if self._stopped:
+                raise RuntimeError("Download manager is shut down")
+            job = self._jobs.get(key)
+            if job is None:
+                job = _Job(key, url, file_name, priority, preview_alias)
+                self._jobs[key] = job
+                self._push(job)
+            elif not job.started and priority < job.priority:
+                job.priority = priority
+                self._push(job)
+            if len(self._threads) < self.workers:
+                thread = threading.Thread(target=self._worker_loop, daemon=True,
+                                          name=f"download-{len(self._threads)}")
+                self._threads.append(thread)
+                thread.start()
+            self._cond.notify()
+        return job.future
+
+    def fetch_evidence(self, evidence_id: str, file_name: str = "",
+                       priority: Priority = Priority.INTERACTIVE) -> Future:
+        api = self._client()
+        if api is None:
+            future = Future()
+            future.set_exception(RuntimeError("API client not available"))
+            return future
+        return self.fetch(evidence_key(evidence_id), api.evidence_download_url(evidence_id),
+                          file_name or evidence_id, priority, preview_alias=evidence_id)
+
+    def fetch_identification_document(self, person_id: str, document_id: str, file_name: str = "",
+                                      priority: Priority = Priority.INTERACTIVE) -> Future:
+        api = self._client()
+        if api is None:
+            future = Future()
+            future.set_exception(RuntimeError("API client not available"))
+            return future
+        return self.fetch(identification_document_key(document_id),
+                          api.identification_document_download_url(person_id, document_id),
+                          file_name or document_id, priority)
+
+    def download_evidence(self, evidence_id: str, file_name: str = "",
+                          priority: Priority = Priority.INTERACTIVE,
+                          timeout: Optional[float] = None) -> Optional[str]:
+        """Local path of an evidence file, downloading it if needed; None on failure.
+
+        Blocks until the transfer is done: call from a worker thread.
+        """
+        if not evidence_id:
+            return None
+        return self._wait(self.fetch_evidence(evidence_id, file_name, priority), timeout,
+                          f"evidence {evidence_id}")
+
+    def download_identification_document(self, person_id: str, document_id: str, file_name: str = "",
+                                         priority: Priority = Priority.INTERACTIVE,
+                                         timeout: Optional[float] = None) -> Optional[str]:
+        if not person_id or not document_id:
+            return None
+        return self._wait(self.fetch_identification_document(person_id, document_id, file_name, priority),
+                          timeout, f"identification document {document_id}")
+
+    @staticmethod
+    def _wait(future: Future, timeout: Optional[float], label: str) -> Optional[str]:
+        try:
+            return str(future.result(timeout))
+        except Exception as e:
+            logger.warning(f"Download of {label} failed: {e}")
+            return None
+
+    def prefetch_evidences(self, evidences: Iterable[dict]) -> int:
+        """
+        Queue the attachments of a case in the background; returns how many
+        were queued (cached ones are skipped).
+
+        Prefetches still queued for a previously opened case are dropped.
+        """
+        self.cancel_pending(Priority.BACKGROUND)
+        queued = 0
+        for evidence in evidences or []:
+            evidence_id = str(evidence.get("id") or evidence.get("evidenceId") or "")
+            if not evidence_id or self.cached_path(evidence_key(evidence_id)):
+                continue
+            file_name = str(evidence.get("fileName") or evidence.get("originalFileName") or "")
+            future = self.fetch_evidence(evidence_id, file_name, Priority.BACKGROUND)
+            if not future.done():
+                queued += 1
+        if queued:
+            logger.info(f"Prefetching {queued} attachment(s)")
+        return queued
+
+    def cancel(self, key: str) -> bool:
+        """Cancel a queued or running transfer; a partial file is kept for resuming."""
+        with self._cond:
+            job = self._jobs.get(key)
+            if job is None:
+                return False
+            job.token.cancel()
+            if not job.started:
+                self._drop(job)
+        return True
+
+    def cancel_pending(self, priority: Priority = Priority.BACKGROUND) -> int:
+        """Drop queued (not yet running) transfers at `priority` or lower."""
+        with self._cond:
+            pending = [job for job in self._jobs.values() if not job.started and job.priority >= priority]
+            for job in pending:
+                job.token.cancel("superseded")
+                self._drop(job)
+        return len(pending)
+
+    def _drop(self, job: _Job) -> None:
+        # Caller holds the lock; stale heap entries are skipped when popped
+        self._jobs.pop(job.key, None)
+        job.future.set_exception(TaskCancelled(job.token.reason or "cancelled"))
+
+    def _push(self, job: _Job) -> None:
+        heapq.heappush(self._heap, (job.priority, next(self._seq), job))
+
+    def _next_job(self) -> Optional[_Job]:
+        while self._heap:
+            priority, _, job = heapq.heappop(self._heap)
+            if self._jobs.get(job.key) is job and not job.started and priority == job.priority:
+                return job
+        return None
+
+    def _worker_loop(self) -> None:
+        while True:
+            with self._cond:
+                job = self._next_job()
+                while job is None:
+                    if self._stopped:
+                        return
+                    self._cond.wait()
+                    job = self._next_job()
+                job.started = True
+            self._run(job)
+
+    def _run(self, job: _Job) -> None:
+        try:
+            path = self._download(job)
+        except Exception as e:
+            with self._cond:
+                if self._jobs.get(job.key) is job:
+                    self._jobs.pop(job.key)
+                if not isinstance(e, TaskCancelled):
+                    self._counters["failed"] += 1
+            job.future.set_exception(e)
+            if not isinstance(e, TaskCancelled):
+                logger.warning(f"Download failed for {job.key}: {e}")
+                self.failed.emit(job.key, str(e))
+            return
+        with self._cond:
+            if self._jobs.get(job.key) is job:
+                self._jobs.pop(job.key)
+        job.future.set_result(path)
+        self.finished.emit(job.key, str(path))
+
+    # -- transfer ----------------------------------------------------------
+
+    def _load_state(self, job: _Job, part: Path) -> Dict[str, str]:
+        """Resume state of a partial download; a partial of another URL is discarded."""
+        try:
+            state = json.loads(self._state_path(job.key).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            state = {}
+        if state.get("url") != job.url:
+            part.unlink(missing_ok=True)
+            state = {"url": job.url}
+        return state
+
+    def _save_state(self, key: str, state: Dict[str, str]) -> None:
+        path = self._state_path(key)
+        tmp = path.with_name(f"{path.name}.{uuid.uuid4().hex[:8]}.tmp")
+        tmp.write_text(json.dumps(state), encoding="utf-8")
+        os.replace(tmp, path)
+
+    def _download(self, job: _Job) -> Path:
+        api = self._client()
+        if api is None:
+            raise RuntimeError("API client not available")
+        part = self._partial_path(job.key)
+        state = self._load_state(job, part)
+
+        def on_start(validator, total, offset):
+            job.received = job.reported = offset
+            state.update(validator=validator, total=total)
+            self._save_state(job.key, state)
+
+        def on_progress(received, total):
+            with self._cond:
+                self._counters["bytes_received"] += received - job.received
+            job.received = received
+            if received - job.reported >= _PROGRESS_STEP or received == total:
+                job.reported = received
+                self.progress.emit(job.key, received, total)
+
+        delay = _RETRY_DELAY_S
+        for attempt in range(1, _MAX_ATTEMPTS + 1):
+            job.token.raise_if_cancelled()
+            try:
+                result = api.download_to_file(
+                    job.url, str(part), resume=True, validator=state.get("validator", ""),
+                    on_start=on_start, progress=on_progress, token=job.token)
+                break
+            except (NetworkException, ApiException) as e:
+                status_code = getattr(e, "status_code", None) or 0
+                if status_code == 416:
+                    # Range past the end: the partial file is stale, start over
+                    part.unlink(missing_ok=True)
+                elif isinstance(e, ApiException) and status_code < 500:
+                    raise
+                if attempt == _MAX_ATTEMPTS:
+                    raise
+                with self._cond:
+                    self._counters["retries"] += 1
+                logger.info(f"Download of {job.key} interrupted ({e}); retrying in {delay:.0f}s")
+                time.sleep(delay)
+                delay *= 2
+
+        with self._cond:
+            self._counters["downloads"] += 1
+            self._counters["resumed"] += int(result["resumed"])
+        return self._store(job, part)
+
+    # -- eviction ----------------------------------------------------------
+
+    def _scan(self) -> List:
+        entries = []
+        for path in self._objects.glob("??/*/*"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _evict_if_needed(self) -> None:
+        with self._cond:
+            if self._total_bytes is None:
+                self._total_bytes = sum(size for _, size, _ in self._scan())
+                self._purge_stale_partials()
+            if self._total_bytes <= self.max_bytes:
+                return
+            # Evict down to 90% so eviction does not run on every download
+            target = int(self.max_bytes * 0.9)
+            entries = sorted(self._scan())
+            total = sum(size for _, size, _ in entries)
+            evicted = 0
+            for _, size, path in entries:
+                if total <= target:
+                    break
+                try:
+                    path.unlink()
+                    path.parent.rmdir()
+                except OSError:
+                    pass
+                total -= size
+                evicted += 1
+            self._total_bytes = total
+            self._counters["evicted"] += evicted
+        if evicted:
+            logger.info(f"Attachment cache: evicted {evicted} files")
+
+    def _purge_stale_partials(self) -> None:
+        cutoff = time.time() - _PARTIAL_MAX_AGE_S
+        for path in self._partial.iterdir():
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+            except OSError:
+                pass
+
+    def stats(self) -> Dict[str, int]:
+        with self._cond:
+            return dict(self._counters, total_bytes=self._total_bytes or 0,
+                        queued=sum(not job.started for job in self._jobs.values()),
+                        running=sum(job.started for job in self._jobs.values()))
+
+    def shutdown(self) -> None:
+        """Cancel queued and running transfers (partial files are kept) and stop the workers."""
+        with self._cond:
+            self._stopped = True
+            for job in list(self._jobs.values()):
+                job.token.cancel("shutdown")
+                if not job.started:
+                    self._drop(job)
+            self._cond.notify_all()
+
+
+_manager: Optional[DownloadManager] = None
+_manager_lock = threading.Lock()
+
+
+def get_download_manager() -> DownloadManager:
+    """The process-wide download manager."""
+    global _manager
+    with _manager_lock:
+        if _manager is None:
+            _manager = DownloadManager()
+        return _manager
+
+
+def shutdown_download_manager() -> None:
+    """Stop transfers (called at application exit)."""
+    with _manager_lock:
+        if _manager is not None:
+            _manager.shutdown()
@@ -15,6 +15,7 @@ from typing import List, Dict, Any, Optional
 from enum import Enum
 
 from models.building import Building
+from services.geometry_codec import try_parse
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -220,40 +221,17 @@ class GeoJSONConverter:
     @staticmethod
     def _wkt_polygon_to_geojson(wkt: str) -> Optional[Dict]:
         """
-        Convert WKT POLYGON to GeoJSON geometry.
+        Convert WKT POLYGON to GeoJSON geometry (outer ring and holes).
 
         Example WKT: POLYGON((lon lat, lon lat, lon lat, lon lat))
         """
-        try:
-            # Extract coordinates from WKT
-            import re
-            match = re.search(r'POLYGON\s*\(\s*\((.*?)\)\s*\)', wkt, re.IGNORECASE)
-            if not match:
-                return None
-
-            coords_str = match.group(1)
-            points = []
-
-            for point_str in coords_str.split(','):
-                point_str = point_str.strip()
-                if not point_str:
-                    continue
-
-                parts = point_str.split()
-                if len(parts) >= 2:
-                    lon, lat = float(parts[0]), float(parts[1])
-                    points.append([lon, lat])
-
-            if len(points) >= 4:  # Polygon must have at least 4 points (closed ring)
-                return {
-                    "type": "Polygon",
-                    "coordinates": [points]  # Outer ring only (no holes for now)
-                }
-
-        except Exception as e:
-            logger.error(f"Error parsing WKT polygon: {e}")
-
-        return None
+        geometry = try_parse(wkt, "WKT polygon")
+        if geometry is None or geometry.geom_type != "Polygon" or geometry.is_empty:
+            return None
+        # Polygon must have at least 4 points (closed ring)
+        if len(geometry.coords[0]) < 4:
+            return None
+        return geometry.to_geojson()
 
     @staticmethod
     def _wkt_multipolygon_to_geojson(wkt: str) -> Optional[Dict]:
@@ -262,68 +240,17 @@ class GeoJSONConverter:
 
         Example WKT: MULTIPOLYGON(((lon lat, lon lat, ...)), ((lon lat, lon lat, ...)))
         """
-        try:
-            import re
-
-            # Remove MULTIPOLYGON wrapper and get inner content
-            # MULTIPOLYGON(((coords)), ((coords))) -> ((coords)), ((coords))
-            inner_match = re.search(r'MULTIPOLYGON\s*\(\s*(.*)\s*\)', wkt, re.IGNORECASE)
-            if not inner_match:
-                return None
-
-            inner_content = inner_match.group(1)
-
-            # Split into individual polygons by finding balanced parentheses
-            # Each polygon is in format ((coords))
-            all_polygons = []
-            depth = 0
-            current_polygon = ""
-
-            for char in inner_content:
-                if char == '(':
-                    depth += 1
-                    current_polygon += char
-                elif char == ')':
-                    depth -= 1
-                    current_polygon += char
-                    # When we close a complete polygon (depth returns to 0)
-                    if depth == 0 and current_polygon.strip():
-                        # Parse this polygon - remove exactly 2 outer parens
-                        # ((coords)) -> coords or , ((coords)) -> coords
-                        polygon_str = current_polygon.strip().lstrip(',').strip()
-                        if polygon_str.startswith('((') and polygon_str.endswith('))'):
-                            polygon_coords = polygon_str[2:-2]  # Remove (( and ))
-                        else:
-                            polygon_coords = polygon_str.strip('() ')
-
-                        points = []
-                        for point_str in polygon_coords.split(','):
-                            point_str = point_str.strip()
-                            if not point_str:
-                                continue
-
-                            parts = point_str.split()
-                            if len(parts) >= 2:
-                                lon, lat = float(parts[0]), float(parts[1])
-                                points.append([lon, lat])
-
-                        if len(points) >= 4:  # Valid polygon ring
-                            all_polygons.append([points])
-
-                        current_polygon = ""
-                else:
-                    current_polygon += char
-
-            if all_polygons:
-                return {
-                    "type": "MultiPolygon",
-                    "coordinates": all_polygons
-                }
-
-        except Exception as e:
-            logger.error(f"Error parsing WKT multipolygon: {e}")
-
-        return None
+        geometry = try_parse(wkt, "WKT multipolygon")
+        if geometry is None or geometry.geom_type != "MultiPolygon":
+            return None
+        all_polygons = [
+            [ring.tolist() for ring in polygon]
+            for polygon in geometry.coords
+            if polygon and len(polygon[0]) >= 4  # Valid polygon ring
+        ]
+        if not all_polygons:
+            return None
+        return {"type": "MultiPolygon", "coordinates": all_polygons}
 
     @staticmethod
     def _wkt_point_to_geojson(wkt: str) -> Optional[Dict]:
@@ -332,19 +259,10 @@ class GeoJSONConverter:
 
         Example WKT: POINT(lon lat)
         """
-        try:
-            import re
-            match = re.search(r'POINT\s*\(\s*([\d.-]+)\s+([\d.-]+)\s*\)', wkt, re.IGNORECASE)
-            if match:
-                lon, lat = float(match.group(1)), float(match.group(2))
-                return {
-                    "type": "Point",
-                    "coordinates": [lon, lat]
-                }
-        except Exception as e:
-            logger.error(f"Error parsing WKT point: {e}")
-
-        return None
+        geometry = try_parse(wkt, "WKT point")
+        if geometry is None or geometry.geom_type != "Point" or geometry.is_empty:
+            return None
+        return {"type": "Point", "coordinates": geometry.coords[0, :2].tolist()}
 
     @staticmethod
     def _calculate_centroid(geometry: Dict) -> Optional[Dict]:
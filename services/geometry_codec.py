@@ -0,0 +1,506 @@
+# -*- coding: utf-8 -*-
+"""
+Shared WKT / WKB geometry codec.
+
+Building footprints, neighborhood boundaries and picked points travel as
+WKT text (API, PostGIS `ST_AsText`) and occasionally as (E)WKB. This
+module is the one place that parses them:
+
+- `parse_wkt()` tokenizes WKT / EWKT into NumPy coordinate arrays
+  (one array per ring or line, shape (n, 2) or (n, 3)),
+- `parse_wkb()` reads ISO WKB and PostGIS EWKB (bytes or hex string),
+- parsed geometries are kept in an LRU cache keyed by the geometry
+  string, so re-rendering the same buildings does not re-parse them,
+- `Geometry.to_geojson()` emits GeoJSON straight from the arrays
+  (`ndarray.tolist()`), without building per-point Python tuples.
+
+Parsed arrays are read-only because cached geometries are shared.
+Supported types: Point, LineString, Polygon, MultiPoint,
+MultiLineString, MultiPolygon.
+"""
+
+import re
+import struct
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Parsed geometries kept in memory (a building footprint is a few KB).
+CACHE_SIZE = 4096
+
+# Strings longer than this are parsed but not cached (huge boundaries).
+MAX_CACHED_LENGTH = 1_000_000
+
+_TYPES = {
+    "POINT": "Point",
+    "LINESTRING": "LineString",
+    "POLYGON": "Polygon",
+    "MULTIPOINT": "MultiPoint",
+    "MULTILINESTRING": "MultiLineString",
+    "MULTIPOLYGON": "MultiPolygon",
+}
+# Nesting depth of coordinate arrays per type (0 = a single array).
+_DEPTH = {
+    "Point": 0, "LineString": 0, "MultiPoint": 0,
+    "Polygon": 1, "MultiLineString": 1,
+    "MultiPolygon": 2,
+}
+_WKB_CODES = {1: "Point", 2: "LineString", 3: "Polygon",
+              4: "MultiPoint", 5: "MultiLineString", 6: "MultiPolygon"}
+_WKB_TYPE_CODES = {name: code for code, name in _WKB_CODES.items()}
+
+_HEADER_RE = re.compile(
+    r"\s*(?:SRID=(\d+);)?\s*([A-Za-z]+)\s*(ZM|Z|M)?\s*(EMPTY)?\s*", re.IGNORECASE
+)
+_TOKEN_RE = re.compile(r"[()]|[^()]+")
+_HEX_RE = re.compile(r"^(?:[0-9A-Fa-f]{2})+$")
+
+
+class GeometryParseError(ValueError):
+    """Raised when a WKT / WKB value cannot be decoded."""
+
+
+@dataclass(frozen=True)
+class Geometry:
+    """
+    A decoded geometry.
+
+    `coords` nesting follows GeoJSON: Point/LineString/MultiPoint hold one
+    array, Polygon/MultiLineString a list of arrays, MultiPolygon a list of
+    lists of arrays. A Point array has shape (1, d); an empty geometry has
+    no arrays.
+    """
+    geom_type: str
+    coords: Any
+    srid: Optional[int] = None
+    has_z: bool = False
+
+    # -- Coordinate access --------------------------------------------------
+
+    def arrays(self) -> List[np.ndarray]:
+        """Every coordinate array (ring / line / point list), flattened."""
+        depth = _DEPTH[self.geom_type]
+        if depth == 0:
+            return [self.coords] if self.coords is not None and len(self.coords) else []
+        if depth == 1:
+            return list(self.coords)
+        return [ring for polygon in self.coords for ring in polygon]
+
+    def vertices(self) -> np.ndarray:
+        """All vertices as one (n, d) array (closing points included)."""
+        arrays = self.arrays()
+        if not arrays:
+            return np.empty((0, 3 if self.has_z else 2))
+        return arrays[0] if len(arrays) == 1 else np.concatenate(arrays)
+
+    def exterior(self) -> Optional[np.ndarray]:
+        """Outer ring of a Polygon (first polygon of a MultiPolygon)."""
+        if self.geom_type == "Polygon" and self.coords:
+            return self.coords[0]
+        if self.geom_type == "MultiPolygon" and self.coords and self.coords[0]:
+            return self.coords[0][0]
+        return None
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.arrays()
+
+    def bounds(self) -> Optional[Tuple[float, float, float, float]]:
+        """(min_x, min_y, max_x, max_y), or None when empty."""
+        vertices = self.vertices()
+        if not len(vertices):
+            return None
+        lo = vertices[:, :2].min(axis=0)
+        hi = vertices[:, :2].max(axis=0)
+        return float(lo[0]), float(lo[1]), float(hi[0]), float(hi[1])
+
+    def vertex_mean(self) -> Optional[Tuple[float, float]]:
+        """Mean (x, y) of all vertices — the cheap "center" used for map labels."""
+        vertices = self.vertices()
+        if not len(vertices):
+            return None
+        mean = vertices[:, :2].mean(axis=0)
+        return float(mean[0]), float(mean[1])
+
+    def centroid(self) -> Optional[Tuple[float, float]]:
+        """Area-weighted centroid of (multi)polygons; vertex mean for other types."""
+        if self.geom_type not in ("Polygon", "MultiPolygon") or self.is_empty:
+            return self.vertex_mean()
+        polygons = [self.coords] if self.geom_type == "Polygon" else self.coords
+        area = cx = cy = 0.0
+        for polygon in polygons:
+            for i, ring in enumerate(polygon):
+                x, y = ring[:, 0], ring[:, 1]
+                x1, y1 = np.roll(x, -1), np.roll(y, -1)
+                cross = x * y1 - x1 * y
+                a = cross.sum() / 2.0
+                sign = (1.0 if i == 0 else -1.0) * (1.0 if a >= 0 else -1.0)
+                area += sign * a
+                cx += sign * ((x + x1) * cross).sum() / 6.0
+                cy += sign * ((y + y1) * cross).sum() / 6.0
+        if abs(area) < 1e-18:
+            return self.vertex_mean()
+        return float(cx / area), float(cy / area)
+
+    def rings(self) -> List[List[Tuple[float, float]]]:
+        """Polygon rings as lists of (x, y) tuples (for GeoPolygon and friends)."""
+        if self.geom_type == "Polygon":
+            return [list(map(tuple, ring[:, :2].tolist())) for ring in self.coords]
+        if self.geom_type == "MultiPolygon":
+            return [list(map(tuple, ring[:, :2].tolist())) for poly in self.coords for ring in poly]
+        return []
+
+    # -- Encoding -------------------------------------------------------------
+
+    def to_geojson(self) -> Dict[str, Any]:
+        """GeoJSON geometry dict (fresh lists, safe to mutate)."""
+        depth = _DEPTH[self.geom_type]
+        if depth == 0:
+            coords = self.coords.tolist() if self.coords is not None else []
+            if self.geom_type == "Point":
+                coords = coords[0] if coords else []
+        elif depth == 1:
+            coords = [a.tolist() for a in self.coords]
+        else:
+            coords = [[a.tolist() for a in polygon] for polygon in self.coords]
+        return {"type": self.geom_type, "coordinates": coords}
+
+    def to_wkt(self) -> str:
+        name = self.geom_type.upper()
+        if self.is_empty:
+            return f"{name} EMPTY"
+        tag = f"{name} Z" if self.has_z else name
+
+        def seq(array: np.ndarray) -> str:
+            return ", ".join(" ".join(repr(float(v)) for v in row) for row in array.tolist())
+
+        depth = _DEPTH[self.geom_type]
+        if self.geom_type == "Point":
+            body = seq(self.coords)
+        elif self.geom_type == "MultiPoint":
+            body = ", ".join(f"({seq(row[None, :])})" for row in self.coords)
+        elif depth == 0:
+            body = seq(self.coords)
+        elif depth == 1:
+            body = ", ".join(f"({seq(a)})" for a in self.coords)
+        else:
+            body = ", ".join("(" + ", ".join(f"({seq(a)})" for a in poly) + ")"
+                             for poly in self.coords)
+        text = f"{tag} ({body})"
+        return f"SRID={self.srid};{text}" if self.srid else text
+
+    def to_wkb(self, hex: bool = False) -> Union[bytes, str]:
+        """Little-endian WKB; Z and SRID are written as PostGIS EWKB flags."""
+        out = bytearray()
+        _write_wkb(out, self, self.srid)
+        data = bytes(out)
+        return data.hex().upper() if hex else data
+
+
+# ---------------------------------------------------------------------------
+# WKT
+# ---------------------------------------------------------------------------
+
+def _coord_array(text: str, dims: Optional[int], keep: Optional[int] = None) -> np.ndarray:
+    first = text.split(",", 1)[0].split()
+    width = dims or len(first)
+    if width < 2:
+        raise GeometryParseError(f"bad coordinate: {first!r}")
+    try:
+        flat = np.array(text.replace(",", " ").split(), dtype=np.float64)
+    except ValueError as e:
+        raise GeometryParseError(str(e)) from e
+    if flat.size % width:
+        raise GeometryParseError("inconsistent coordinate dimensions")
+    array = flat.reshape(-1, width)[:, :keep]  # drop M values
+    array.flags.writeable = False
+    return array
+
+
+def _wkt_tree(body: str, dims: Optional[int], keep: Optional[int] = None) -> list:
+    """Nested lists of the parenthesised body; leaves are coordinate arrays."""
+    root: list = []
+    stack = [root]
+    for token in _TOKEN_RE.findall(body):
+        if token == "(":
+            child: list = []
+            stack[-1].append(child)
+            stack.append(child)
+        elif token == ")":
+            if len(stack) == 1:
+                raise GeometryParseError("unbalanced parentheses")
+            stack.pop()
+        else:
+            text = token.strip().strip(",").strip()
+            if text:
+                stack[-1].append(_coord_array(text, dims, keep))
+    if len(stack) != 1:
+        raise GeometryParseError("unbalanced parentheses")
+    return root
+
+
+def _leaf(node) -> np.ndarray:
+    """The single coordinate array of a `( x y, ... )` group."""
+    if isinstance(node, np.ndarray):
+        return node
+    arrays = [n for n in node if isinstance(n, np.ndarray)]
+    if len(arrays) != 1 or len(node) != 1:
+        raise GeometryParseError("expected a coordinate sequence")
+    return arrays[0]
+
+
+def _decode_wkt(text: str) -> Geometry:
+    header = _HEADER_RE.match(text)
+    if not header:
+        raise GeometryParseError("missing geometry type")
+    srid, name, dim_tag, empty = header.groups()
+    geom_type = _TYPES.get(name.upper())
+    if geom_type is None:
+        raise GeometryParseError(f"unsupported geometry type: {name}")
+    dim_tag = (dim_tag or "").upper()
+    dims, keep = {"": (None, None), "Z": (3, 3), "M": (3, 2), "ZM": (4, 3)}[dim_tag]
+    srid = int(srid) if srid else None
+    has_z = "Z" in dim_tag
+
+    if empty:
+        coords = None if _DEPTH[geom_type] == 0 else []
+        return Geometry(geom_type, coords, srid, has_z)
+
+    tree = _wkt_tree(text[header.end():], dims, keep)
+    if len(tree) != 1 or isinstance(tree[0], np.ndarray):
+        raise GeometryParseError("expected one parenthesised body")
+    body = tree[0]
+
+    if geom_type in ("Point", "LineString"):
+        coords = _leaf(body)
+        if geom_type == "Point" and len(coords) != 1:
+            raise GeometryParseError("POINT needs exactly one coordinate")
+    elif geom_type == "MultiPoint":
+        # Both "MULTIPOINT (1 2, 3 4)" and "MULTIPOINT ((1 2), (3 4))".
+        parts = [node if isinstance(node, np.ndarray) else _leaf(node) for node in body]
+        coords = parts[0] if len(parts) == 1 else np.concatenate(parts)
+        coords.flags.writeable = False
+    elif geom_type in ("Polygon", "MultiLineString"):
+        coords = [_leaf(node) for node in body]
+    else:
+        coords = [[_leaf(ring) for ring in polygon] for polygon in body]
+
+    if dims is None:
+        has_z = any(a.shape[1] >= 3 for a in Geometry(geom_type, coords).arrays())
+    return Geometry(geom_type, coords, srid, has_z)
+
+
+# ---------------------------------------------------------------------------
+# WKB
+# ---------------------------------------------------------------------------
+
+class _WKBReader:
+    def __init__(self, data: bytes):
+        self.data = data
+        self.pos = 0
+
+    def unpack(self, fmt: str):
+        size = struct.calcsize(fmt)
+        if self.pos + size > len(self.data):
+            raise GeometryParseError("truncated WKB")
+        values = struct.unpack_from(fmt, self.data, self.pos)
+        self.pos += size
+        return values
+
+    def points(self, count: int, dims: int, order: str) -> np.ndarray:
+        size = count * dims * 8
+        if self.pos + size > len(self.data):
+            raise GeometryParseError("truncated WKB")
+        array = np.frombuffer(self.data, dtype=f"{order}f8", count=count * dims,
+                              offset=self.pos).reshape(count, dims)
+        self.pos += size
+        return array.astype(np.float64)  # native byte order, own copy
+
+    @staticmethod
+    def drop_m(array: np.ndarray, has_z: bool) -> np.ndarray:
+        return array[:, :3 if has_z else 2]
+
+    def geometry(self) -> Geometry:
+        (flag,) = self.unpack("B")
+        order = "<" if flag == 1 else ">"
+        (code,) = self.unpack(f"{order}I")
+        srid = None
+        # PostGIS EWKB flags, then ISO Z/M/ZM offsets (1000/2000/3000).
+        has_z = bool(code & 0x80000000)
+        has_m = bool(code & 0x40000000)
+        if code & 0x20000000:
+            (srid,) = self.unpack(f"{order}I")
+        code &= 0x0FFFFFFF
+        iso, base = divmod(code, 1000)
+        has_z = has_z or iso in (1, 3)
+        has_m = has_m or iso in (2, 3)
+        geom_type = _WKB_CODES.get(base)
+        if geom_type is None:
+            raise GeometryParseError(f"unsupported WKB type: {code}")
+        dims = 2 + has_z + has_m
+
+        def freeze(array: np.ndarray) -> np.ndarray:
+            if has_m:
+                array = self.drop_m(array, has_z)
+            array.flags.writeable = False
+            return array
+
+        if geom_type == "Point":
+            point = self.points(1, dims, order)
+            coords = None if np.isnan(point).all() else freeze(point)
+        elif geom_type == "LineString":
+            (n,) = self.unpack(f"{order}I")
+            coords = freeze(self.points(n, dims, order))
+        elif geom_type == "Polygon":
+            (rings,) = self.unpack(f"{order}I")
+            coords = []
+            for _ in range(rings):
+                (n,) = self.unpack(f"{order}I")
+                coords.append(freeze(self.points(n, dims, order)))
+        else:
+            (parts,) = self.unpack(f"{order}I")
+            members = [self.geometry() for _ in range(parts)]
+            if geom_type == "MultiPoint":
+                arrays = [m.coords for m in members if m.coords is not None]
+                coords = freeze(np.concatenate(arrays)) if arrays else None
+            else:
+                coords = [m.coords for m in members]
+        return Geometry(geom_type, coords, srid, has_z)
+
+
+def _write_wkb(out: bytearray, geometry: Geometry, srid: Optional[int]):
+    code = _WKB_TYPE_CODES[geometry.geom_type]
+    dims = 3 if geometry.has_z else 2
+    if geometry.has_z:
+        code |= 0x80000000
+    if srid:
+        code |= 0x20000000
+    out += struct.pack("<BI", 1, code)
+    if srid:
+        out += struct.pack("<I", srid)
+
+    def seq(array: np.ndarray, counted: bool = True):
+        array = np.ascontiguousarray(array[:, :dims], dtype="<f8")
+        if counted:
+            out.extend(struct.pack("<I", len(array)))
+        out.extend(array.tobytes())
+
+    coords = geometry.coords
+    if geometry.geom_type == "Point":
+        if coords is None:
+            out.extend(np.full(dims, np.nan, dtype="<f8").tobytes())
+        else:
+            seq(coords, counted=False)
+    elif geometry.geom_type == "LineString":
+        seq(coords)
+    elif geometry.geom_type == "Polygon":
+        out += struct.pack("<I", len(coords))
+        for ring in coords:
+            seq(ring)
+    elif geometry.geom_type == "MultiPoint":
+        rows = [] if coords is None else list(coords)
+        out += struct.pack("<I", len(rows))
+        for row in rows:
+            _write_wkb(out, Geometry("Point", row[None, :], None, geometry.has_z), None)
+    else:
+        member = "LineString" if geometry.geom_type == "MultiLineString" else "Polygon"
+        out += struct.pack("<I", len(coords))
+        for part in coords:
+            _write_wkb(out, Geometry(member, part, None, geometry.has_z), None)
+
+
+# ---------------------------------------------------------------------------
+# Cached entry points
+# ---------------------------------------------------------------------------
+
+_cache: "OrderedDict[Any, Geometry]" = OrderedDict()
+_cache_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0}
+
+
+def _cached(key, decode) -> Geometry:
+    with _cache_lock:
+        geometry = _cache.get(key)
+        if geometry is not None:
+            _cache.move_to_end(key)
+            _stats["hits"] += 1
+            return geometry
+        _stats["misses"] += 1
+    geometry = decode()
+    if len(key) <= MAX_CACHED_LENGTH:
+        with _cache_lock:
+            _cache[key] = geometry
+            while len(_cache) > CACHE_SIZE:
+                _cache.popitem(last=False)
+    return geometry
+
+
+def parse_wkt(wkt: str) -> Geometry:
+    """Decode WKT / EWKT. Raises GeometryParseError on malformed input."""
+    if not isinstance(wkt, str) or not wkt.strip():
+        raise GeometryParseError("empty WKT")
+    return _cached(wkt, lambda: _decode_wkt(wkt))
+
+
+def parse_wkb(wkb: Union[bytes, bytearray, memoryview, str]) -> Geometry:
+    """Decode ISO WKB / PostGIS EWKB, given as bytes or a hex string."""
+    if isinstance(wkb, str):
+        text = wkb.strip()
+        if not _HEX_RE.match(text):
+            raise GeometryParseError("invalid WKB hex string")
+        key = text.upper()
+        return _cached(key, lambda: _read_wkb(bytes.fromhex(text)))
+    data = bytes(wkb)
+    return _cached(data, lambda: _read_wkb(data))
+
+
+def _read_wkb(data: bytes) -> Geometry:
+    try:
+        return _WKBReader(data).geometry()
+    except struct.error as e:
+        raise GeometryParseError(str(e)) from e
+
+
+def parse_geometry(value: Union[str, bytes, bytearray, memoryview]) -> Geometry:
+    """Decode WKT, EWKT, hex (E)WKB or raw WKB bytes."""
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return parse_wkb(value)
+    if isinstance(value, str) and _HEX_RE.match(value.strip()):
+        return parse_wkb(value)
+    return parse_wkt(value)
+
+
+def try_parse(value, what: str = "geometry") -> Optional[Geometry]:
+    """parse_geometry(), logging and returning None instead of raising."""
+    if not value:
+        return None
+    try:
+        return parse_geometry(value)
+    except GeometryParseError as e:
+        preview = value[:60] if isinstance(value, str) else f"<{len(value)} bytes>"
+        logger.warning(f"Failed to parse {what}: {e} ({preview!r})")
+        return None
+
+
+def wkt_to_geojson(wkt: str) -> Optional[Dict[str, Any]]:
+    """GeoJSON geometry dict for a WKT / WKB value, or None when unparseable."""
+    geometry = try_parse(wkt)
+    return geometry.to_geojson() if geometry is not None and not geometry.is_empty else None
+
+
+def cache_info() -> Dict[str, int]:
+    with _cache_lock:
+        return {"entries": len(_cache), "max_entries": CACHE_SIZE, **_stats}
+
+
+def clear_cache():
+    with _cache_lock:
+        _cache.clear()
+        _stats["hits"] = _stats["misses"] = 0
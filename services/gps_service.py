@@ -12,20 +12,25 @@ Features:
 - NMEA sentence parsing
 - Position averaging for better accuracy
 - Geofencing support
-- Track logging
+- Track logging (compact, disk-backed: services/gps_track_store.py)
 """
 
+import io
 import json
 import math
+import operator
 import re
+import tempfile
 import time
 import threading
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from functools import reduce
+from typing import Any, Callable, Dict, List, Optional, TextIO, Tuple
 from queue import Queue
 
+from services.gps_track_store import TrackStore
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -132,6 +137,9 @@ class GPSConfig:
     geofence_center_lat: Optional[float] = None
     geofence_center_lng: Optional[float] = None
     geofence_radius: float = 10000  # meters
+    track_tolerance: float = 2.0  # meters, track simplification (0 = keep every fix)
+    track_segment_points: int = 4096  # fixes held in memory before a track segment is written to disk
+    replay_speed: float = 1.0  # NMEA file replay: multiple of real time (0 = as fast as possible)
 
 
 @dataclass
@@ -182,10 +190,7 @@ class NMEAParser:
     @staticmethod
     def _calculate_checksum(data: str) -> str:
         """Calculate NMEA checksum."""
-        checksum = 0
-        for char in data:
-            checksum ^= ord(char)
-        return f"{checksum:02X}"
+        return f"{reduce(operator.xor, data.encode('latin-1', errors='replace'), 0):02X}"
 
     @staticmethod
     def _parse_gga(parts: List[str]) -> Dict[str, Any]:
@@ -305,7 +310,8 @@ class GPSService:
         self._status = GPSStatus.DISCONNECTED
         self._current_position: Optional[GPSPosition] = None
         self._position_history: List[GPSPosition] = []
-        self._track_points: List[TrackPoint] = []
+        self._track: Optional[TrackStore] = None
+        self._track_recording = False
         self._averaging_buffer: List[GPSPosition] = []
 
         self._running = False
@@ -458,6 +464,7 @@ class GPSService:
         while self._running:
             try:
                 if self._serial_port and self._serial_port.is_open:
+                    # Blocks until a full sentence or the port timeout: no polling delay
                     line = self._serial_port.readline().decode('ascii', errors='ignore')
 
                     if line:
@@ -465,14 +472,14 @@ class GPSService:
                         if parsed:
                             self._process_nmea_data(parsed)
                             last_valid_time = time.time()
+                else:
+                    time.sleep(0.5)
 
                 # Check for timeout
                 if time.time() - last_valid_time > self.config.timeout:
                     if self._status != GPSStatus.SEARCHING:
                         self._set_status(GPSStatus.SEARCHING)
 
-                time.sleep(0.01)
-
             except Exception as e:
                 logger.error(f"Error reading GPS: {e}")
                 if self.config.auto_reconnect:
@@ -504,22 +511,55 @@ class GPSService:
                 time.sleep(5.0)
 
     def _nmea_file_loop(self):
-        """Read NMEA sentences from log file (for testing)."""
+        """
+        Read NMEA sentences from log file (for testing).
+
+        Replays at config.replay_speed times real time, paced by the
+        sentences' UTC time fields (0 = as fast as possible). The reader only
+        waits when it is ahead of schedule, so high speeds are not limited
+        by sleep granularity.
+        """
+        speed = self.config.replay_speed
+        first_time = None
+        start = 0.0
+        day_offset = 0.0
+        last_time = 0.0
         try:
-            with open(self.config.port, 'r') as f:
+            with open(self.config.port, 'r', encoding='ascii', errors='ignore') as f:
                 for line in f:
                     if not self._running:
                         break
 
                     parsed = NMEAParser.parse_sentence(line)
-                    if parsed:
-                        self._process_nmea_data(parsed)
-
-                    time.sleep(0.1)  # Simulate real-time
+                    if not parsed:
+                        continue
+
+                    sentence_time = self._nmea_seconds(parsed.get('time')) if speed > 0 else None
+                    if sentence_time is not None:
+                        if sentence_time + day_offset < last_time - 43200.0:
+                            day_offset += 86400.0  # past midnight UTC
+                        last_time = sentence_time + day_offset
+                        if first_time is None:
+                            first_time, start = last_time, time.perf_counter()
+                        ahead = start + (last_time - first_time) / speed - time.perf_counter()
+                        if ahead > 0:
+                            time.sleep(ahead)
+
+                    self._process_nmea_data(parsed)
 
         except Exception as e:
             logger.error(f"Error reading NMEA file: {e}")
 
+    @staticmethod
+    def _nmea_seconds(value: Optional[str]) -> Optional[float]:
+        """Seconds of day of an NMEA hhmmss.ss time field."""
+        if not value or len(value) < 6:
+            return None
+        try:
+            return int(value[0:2]) * 3600 + int(value[2:4]) * 60 + float(value[4:])
+        except ValueError:
+            return None
+
     def _get_windows_location(self) -> Optional[GPSPosition]:
         """Get location from Windows Location API."""
         try:
@@ -642,6 +682,9 @@ class GPSService:
         # Store position
         self._current_position = position
         self._position_history.append(position)
+        if self._track_recording:
+            self._track.append(position.longitude, position.latitude, position.altitude,
+                               position.timestamp.timestamp())
 
         # Trim history
         if len(self._position_history) > 1000:
@@ -731,71 +774,79 @@ class GPSService:
         if callback in self._status_callbacks:
             self._status_callbacks.remove(callback)
 
-    def start_track(self):
-        """Start logging GPS track."""
-        self._track_points = []
-        logger.info("Track logging started")
+    def start_track(self, record: bool = True, directory: Optional[str] = None):
+        """
+        Start logging a GPS track.
+
+        With `record`, every accepted fix is added; otherwise only the fixes
+        passed to add_track_point(). Tracks are kept in a TrackStore, which
+        simplifies them to config.track_tolerance and writes full segments
+        to disk (DATA_DIR/tracks by default).
+        """
+        self._track = TrackStore(
+            directory=directory,
+            tolerance=self.config.track_tolerance,
+            segment_points=self.config.track_segment_points,
+        )
+        self._track_recording = record
+        logger.info(f"Track logging started: {self._track.directory}")
 
-    def stop_track(self) -> List[TrackPoint]:
-        """Stop logging and return track points."""
-        track = self._track_points.copy()
-        logger.info(f"Track logging stopped: {len(track)} points")
-        return track
+    def stop_track(self) -> Optional[TrackStore]:
+        """Stop logging and return the track (iterate it with fixes(), export it with write_gpx())."""
+        self._track_recording = False
+        if self._track is None:
+            return None
+        self._track.finish()
+        logger.info(f"Track logging stopped: {self._track.received} fixes, {len(self._track)} kept")
+        return self._track
 
     def add_track_point(self, note: Optional[str] = None):
-        """Add current position to track with optional note."""
-        if self._current_position:
-            self._track_points.append(TrackPoint(
-                position=self._current_position,
-                timestamp=datetime.now(),
-                note=note
-            ))
+        """Add current position to track with optional note (kept by simplification)."""
+        if self._current_position and self._track is not None:
+            pos = self._current_position
+            self._track.append(pos.longitude, pos.latitude, pos.altitude, time.time(), note)
+
+    def get_track_points(self) -> List[TrackPoint]:
+        """Track fixes as TrackPoint objects (loads the whole track: prefer the write_track_* exports)."""
+        if self._track is None:
+            return []
+        points = []
+        for lon, lat, alt, t, note in self._track.fixes():
+            timestamp = datetime.fromtimestamp(t)
+            position = GPSPosition(latitude=lat, longitude=lon, altitude=alt,
+                                   timestamp=timestamp, source=self.config.source)
+            points.append(TrackPoint(position=position, timestamp=timestamp, note=note))
+        return points
+
+    def _export_track(self, write: Callable[[TrackStore], int]) -> int:
+        if self._track is not None:
+            return write(self._track)
+        # No track yet: export an empty one
+        empty = TrackStore(directory=tempfile.mkdtemp(prefix="trrcms_track_"))
+        try:
+            return write(empty)
+        finally:
+            empty.discard()
+
+    def write_track_gpx(self, fp: TextIO) -> int:
+        """Stream the track to `fp` as GPX; returns the number of points written."""
+        return self._export_track(lambda track: track.write_gpx(fp))
+
+    def write_track_geojson(self, fp: TextIO) -> int:
+        """Stream the track to `fp` as a GeoJSON Feature; returns the number of points written."""
+        return self._export_track(lambda track: track.write_geojson(fp))
 
     def export_track_gpx(self) -> str:
         """Export track to GPX format."""
-        gpx = ['<?xml version="1.0" encoding="UTF-8"?>']
-        gpx.append('<gpx version="1.1" creator="TRRCMS">')
-        gpx.append('  <trk>')
-        gpx.append('    <name>TRRCMS Track</name>')
-        gpx.append('    <trkseg>')
-
-        for point in self._track_points:
-            pos = point.position
-            gpx.append(f'      <trkpt lat="{pos.latitude}" lon="{pos.longitude}">')
-            if pos.altitude:
-                gpx.append(f'        <ele>{pos.altitude}</ele>')
-            gpx.append(f'        <time>{point.timestamp.isoformat()}</time>')
-            if point.note:
-                gpx.append(f'        <desc>{point.note}</desc>')
-            gpx.append('      </trkpt>')
-
-        gpx.append('    </trkseg>')
-        gpx.append('  </trk>')
-        gpx.append('</gpx>')
-
-        return '\n'.join(gpx)
+        buffer = io.StringIO()
+        self.write_track_gpx(buffer)
+        return buffer.getvalue()
 
     def export_track_geojson(self) -> Dict:
         """Export track to GeoJSON format."""
-        coordinates = [
-            [p.position.longitude, p.position.latitude]
-            + ([p.position.altitude] if p.position.altitude else [])
-            for p in self._track_points
-        ]
-
-        return {
-            "type": "Feature",
-            "geometry": {
-                "type": "LineString",
-                "coordinates": coordinates
-            },
-            "properties": {
-                "name": "TRRCMS Track",
-                "points": len(self._track_points),
-                "start_time": self._track_points[0].timestamp.isoformat() if self._track_points else None,
-                "end_time": self._track_points[-1].timestamp.isoformat() if self._track_points else None
-            }
-        }
+        buffer = io.StringIO()
+        self.write_track_geojson(buffer)
+        return json.loads(buffer.getvalue())
 
     def set_manual_position(
         self,
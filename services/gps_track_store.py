@@ -0,0 +1,280 @@
+# -*- coding: utf-8 -*-
+"""
+Compact GPS track store.
+
+GPSService used to keep a track as a list of TrackPoint objects (a
+GPSPosition dataclass and two datetimes per fix, around 1 KB each), and the
+GPX / GeoJSON exports built the whole document in memory, so a field day of
+1 Hz fixes grew without bound. A TrackStore keeps a track as:
+
+  * array-backed columns (longitude, latitude, altitude, epoch seconds;
+    32 bytes per fix) for the segment being recorded;
+  * full segments of `segment_points` fixes simplified with Douglas-Peucker
+    to `tolerance` metres and spilled to disk as <directory>/<n>.seg, so
+    memory stays bounded however long the track runs. Fixes with a note
+    are always kept, and the last fix of a segment carries over as the
+    first of the next, so the simplified line stays continuous;
+  * streaming exports: write_gpx() / write_geojson() write fix by fix to a
+    file object, reading one segment at a time.
+
+Usage:
+    track = TrackStore(tolerance=2.0)
+    track.append(lon, lat, alt, time.time())
+    track.finish()
+    with open("track.gpx", "w", encoding="utf-8") as fp:
+        track.write_gpx(fp)
+    track.discard()
+"""
+
+import json
+import math
+import os
+import shutil
+import threading
+import uuid
+from array import array
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, TextIO, Tuple
+from xml.sax.saxutils import escape
+
+import numpy as np
+
+from app.config import Config
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# One stored fix: longitude, latitude, altitude (NaN = none), epoch seconds
+_FIELDS = 4
+_METERS_PER_DEGREE = 111320.0
+
+# (longitude, latitude, altitude or None, epoch seconds, note or None)
+TrackFix = Tuple[float, float, Optional[float], float, Optional[str]]
+
+
+def simplify(lons: Sequence[float], lats: Sequence[float], tolerance: float,
+             keep: Sequence[int] = ()) -> np.ndarray:
+    """
+    Indices of the fixes kept by Douglas-Peucker at `tolerance` metres.
+
+    Distances are measured in a local equirectangular projection around the
+    first fix. The ends and the indices in `keep` are always kept.
+    """
+    n = len(lons)
+    if n <= 2 or tolerance <= 0:
+        return np.arange(n)
+    lats = np.asarray(lats, dtype=float)
+    xs = (np.asarray(lons, dtype=float) - lons[0]) * _METERS_PER_DEGREE * math.cos(math.radians(lats[0]))
+    ys = (lats - lats[0]) * _METERS_PER_DEGREE
+
+    kept = np.zeros(n, dtype=bool)
+    kept[[0, n - 1]] = True
+    kept[list(keep)] = True
+    anchors = np.flatnonzero(kept)
+    stack = list(zip(anchors[:-1].tolist(), anchors[1:].tolist()))
+    tolerance2 = tolerance * tolerance
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2:
+            continue
+        dx, dy = xs[last] - xs[first], ys[last] - ys[first]
+        px, py = xs[first + 1:last] - xs[first], ys[first + 1:last] - ys[first]
+        length2 = dx * dx + dy * dy
+        if length2 > 0:
+            # Distance to the segment (not the infinite line): a track can double back
+            t = np.clip((px * dx + py * dy) / length2, 0.0, 1.0)
+            px, py = px - t * dx, py - t * dy
+        distance2 = px * px + py * py
+        worst = int(np.argmax(distance2))
+        if distance2[worst] > tolerance2:
+            split = first + 1 + worst
+            kept[split] = True
+            stack.append((first, split))
+            stack.append((split, last))
+    return np.flatnonzero(kept)
+
+
+class TrackStore:
+    """Append-only GPS track with bounded memory, simplified on-disk segments and streaming export."""
+
+    def __init__(self, directory: Optional[Path] = None, tolerance: float = 2.0,
+                 segment_points: int = 4096):
+        self.directory = Path(directory or Config.DATA_DIR / "tracks" / uuid.uuid4().hex)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.tolerance = tolerance
+        self.segment_points = max(3, segment_points)
+        self._lock = threading.Lock()
+        self._columns = [array("d") for _ in range(_FIELDS)]
+        self._buffer_notes: Dict[int, str] = {}  # buffer index -> note
+        self._notes: Dict[int, str] = {}  # stored index -> note
+        self._segments: List[Tuple[Path, int]] = []
+        self._stored = 0
+        self._received = 0
+
+    @classmethod
+    def open(cls, directory: Path) -> "TrackStore":
+        """A finished track previously written to `directory`."""
+        track = cls(directory, tolerance=0.0)
+        track._segments = [(path, path.stat().st_size // (8 * _FIELDS))
+                           for path in sorted(track.directory.glob("*.seg"))]
+        track._stored = track._received = sum(count for _, count in track._segments)
+        notes_path = track.directory / "notes.json"
+        notes = json.loads(notes_path.read_text(encoding="utf-8")) if notes_path.exists() else {}
+        track._notes = {int(index): note for index, note in notes.items()}
+        return track
+
+    # -- recording -----------------------------------------------------------
+
+    def append(self, longitude: float, latitude: float, altitude: Optional[float],
+               timestamp: float, note: Optional[str] = None) -> None:
+        """Add a fix (timestamp in epoch seconds); fixes with a note survive simplification."""
+        with self._lock:
+            lons, lats, alts, times = self._columns
+            if note:
+                self._buffer_notes[len(lons)] = note
+            lons.append(longitude)
+            lats.append(latitude)
+            alts.append(math.nan if altitude is None else altitude)
+            times.append(timestamp)
+            self._received += 1
+            if len(lons) >= self.segment_points:
+                self._spill(carry=True)
+
+    def finish(self) -> None:
+        """Write the segment being recorded; the track can still be appended to afterwards."""
+        with self._lock:
+            if len(self._columns[0]):
+                self._spill(carry=False)
+            self._write_notes()
+
+    def _simplified_buffer(self) -> Tuple[np.ndarray, np.ndarray]:
+        """(kept indices, fixes as an (n, 4) array) of the segment being recorded."""
+        fixes = np.column_stack([np.frombuffer(column, dtype=np.float64) for column in self._columns])
+        kept = simplify(fixes[:, 0], fixes[:, 1], self.tolerance, sorted(self._buffer_notes))
+        return kept, fixes
+
+    def _spill(self, carry: bool) -> None:
+        kept, fixes = self._simplified_buffer()
+        if carry:
+            # The last fix stays in memory as the anchor of the next segment
+            kept = kept[:-1]
+        path = self.directory / f"{len(self._segments):05d}.seg"
+        tmp = path.with_name(f"{path.name}.tmp")
+        fixes[kept].tofile(tmp)
+        os.replace(tmp, path)
+
+        for position, index in enumerate(kept.tolist()):
+            if index in self._buffer_notes:
+                self._notes[self._stored + position] = self._buffer_notes[index]
+        self._segments.append((path, len(kept)))
+        self._stored += len(kept)
+        logger.debug(f"Track segment {path.name}: {len(fixes)} fixes, {len(kept)} kept")
+
+        last = fixes[-1].tolist() if carry else None
+        last_note = self._buffer_notes.get(len(fixes) - 1) if carry else None
+        self._columns = [array("d") for _ in range(_FIELDS)]
+        self._buffer_notes = {}
+        if last is not None:
+            for column, value in zip(self._columns, last):
+                column.append(value)
+            if last_note:
+                self._buffer_notes[0] = last_note
+
+    def _write_notes(self) -> None:
+        path = self.directory / "notes.json"
+        tmp = path.with_name(f"{path.name}.tmp")
+        tmp.write_text(json.dumps(self._notes, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, path)
+
+    # -- reading -------------------------------------------------------------
+
+    def __len__(self) -> int:
+        """Fixes stored (spilled segments plus the segment being recorded)."""
+        with self._lock:
+            return self._stored + len(self._columns[0])
+
+    @property
+    def received(self) -> int:
+        """Fixes appended, before simplification."""
+        return self._received
+
+    def disk_bytes(self) -> int:
+        return sum(path.stat().st_size for path, _ in self._segments if path.exists())
+
+    def fixes(self) -> Iterator[TrackFix]:
+        """Stored fixes in order, one segment in memory at a time."""
+        with self._lock:
+            segments = list(self._segments)
+            notes = dict(self._notes)
+            tail_notes = dict(self._buffer_notes)
+            tail = None
+            if len(self._columns[0]):
+                kept, fixes = self._simplified_buffer()
+                tail = (kept, fixes[kept])
+
+        index = 0
+        for path, _ in segments:
+            for lon, lat, alt, t in np.fromfile(path, dtype=np.float64).reshape(-1, _FIELDS).tolist():
+                yield lon, lat, None if math.isnan(alt) else alt, t, notes.get(index)
+                index += 1
+        if tail is not None:
+            kept, fixes = tail
+            for source, (lon, lat, alt, t) in zip(kept.tolist(), fixes.tolist()):
+                yield lon, lat, None if math.isnan(alt) else alt, t, tail_notes.get(source)
+
+    # -- export --------------------------------------------------------------
+
+    def write_gpx(self, fp: TextIO, name: str = "TRRCMS Track") -> int:
+        """Write the track as GPX 1.1; returns the number of fixes written."""
+        fp.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        fp.write('<gpx version="1.1" creator="TRRCMS">\n')
+        fp.write('  <trk>\n')
+        fp.write(f'    <name>{escape(name)}</name>\n')
+        fp.write('    <trkseg>\n')
+        count = 0
+        for lon, lat, alt, t, note in self.fixes():
+            parts = [f'      <trkpt lat="{lat}" lon="{lon}">\n']
+            if alt:
+                parts.append(f'        <ele>{alt}</ele>\n')
+            parts.append(f'        <time>{datetime.fromtimestamp(t).isoformat()}</time>\n')
+            if note:
+                parts.append(f'        <desc>{escape(note)}</desc>\n')
+            parts.append('      </trkpt>\n')
+            fp.write("".join(parts))
+            count += 1
+        fp.write('    </trkseg>\n')
+        fp.write('  </trk>\n')
+        fp.write('</gpx>')
+        return count
+
+    def write_geojson(self, fp: TextIO, name: str = "TRRCMS Track") -> int:
+        """Write the track as a GeoJSON LineString Feature; returns the number of fixes written."""
+        fp.write('{"type": "Feature", "geometry": {"type": "LineString", "coordinates": [')
+        count = 0
+        first = last = None
+        for lon, lat, alt, t, _ in self.fixes():
+            coordinate = [lon, lat] + ([alt] if alt else [])
+            fp.write(("" if count == 0 else ", ") + json.dumps(coordinate))
+            if first is None:
+                first = t
+            last = t
+            count += 1
+        properties = {
+            "name": name,
+            "points": count,
+            "start_time": datetime.fromtimestamp(first).isoformat() if first is not None else None,
+            "end_time": datetime.fromtimestamp(last).isoformat() if last is not None else None,
+        }
+        fp.write(f']}}, "properties": {json.dumps(properties, ensure_ascii=False)}}}')
+        return count
+
+    def discard(self) -> None:
+        """Delete the track's files."""
+        with self._lock:
+            self._segments = []
+            self._columns = [array("d") for _ in range(_FIELDS)]
+            self._buffer_notes = {}
+            self._notes = {}
+            self._stored = 0
+        shutil.rmtree(self.directory, ignore_errors=True)
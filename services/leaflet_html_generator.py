@@ -187,6 +187,11 @@ class LeafletHTMLGenerator:
     <style>{LeafletHTMLGenerator._load_asset("MarkerCluster.css")}</style>
     <style>{LeafletHTMLGenerator._load_asset("MarkerCluster.Default.css")}</style>'''
         clustering_js = f'<script>{LeafletHTMLGenerator._load_asset("leaflet.markercluster.js")}</script>'
+        from app.config import Config as _Cfg
+        vector_tiles_js = (
+            f'<script>{LeafletHTMLGenerator._load_asset("leaflet.vectortiles.js")}</script>'
+            if _Cfg.MAP_VECTOR_TILES and local_assets_url else ''
+        )
         qwebchannel_content = LeafletHTMLGenerator._get_qwebchannel_content()
         qwebchannel_tag = (
             f'<script>{qwebchannel_content}</script>'
@@ -223,6 +228,7 @@ class LeafletHTMLGenerator:
     <script>window._mp('leaflet_loaded');</script>
     {clustering_js}
     <script>window._mp('clustering_loaded');</script>
+    {vector_tiles_js}
     {drawing_js}
     {qwebchannel_tag}
     <script>window._mp('qwebchannel_loaded');</script>
@@ -804,6 +810,11 @@ class LeafletHTMLGenerator:
         if _Cfg.GEOSERVER_ENABLED and _Cfg.GEOSERVER_URL:
             geoserver_wms_url = f"{_Cfg.GEOSERVER_URL}/{_Cfg.GEOSERVER_WORKSPACE}/wms"
 
+        # Building vector tiles from the local tile server (optional, from .env)
+        vector_tiles_url = ""
+        if _Cfg.MAP_VECTOR_TILES and local_assets_url:
+            vector_tiles_url = f"{local_assets_url}/vtiles/{{z}}/{{x}}/{{y}}.pbf"
+
         status_colors = LeafletHTMLGenerator.STATUS_COLORS
         status_labels = LeafletHTMLGenerator.STATUS_LABELS_AR
 
@@ -816,6 +827,10 @@ class LeafletHTMLGenerator:
         status_labels_json = LeafletHTMLGenerator._safe_js_json(status_labels)
 
         empty_fc = '{"type":"FeatureCollection","features":[]}'
+        if vector_tiles_url:
+            # The tile layer draws every building; markers are only injected
+            # later for explicit cases (e.g. the focused building).
+            buildings_geojson = empty_fc
         buildings_json = LeafletHTMLGenerator._safe_js_json(buildings_geojson, fallback=empty_fc)
 
         if existing_polygons_geojson:
@@ -845,6 +860,7 @@ class LeafletHTMLGenerator:
         # Build popup JS block - skip popups in multi-select mode (clicking toggles selection)
         if enable_multiselect:
             popup_js_block = '// Multi-select mode: no popups, clicking toggles selection'
+            vt_popup_js_block = popup_js_block
         else:
             selection_btn_js = (
                 'if (buildingIdForApi) { popup += "<button class=\\"select-building-btn\\" '
@@ -852,7 +868,7 @@ class LeafletHTMLGenerator:
                 f'<span style=\\"font-size:16px\\">✓</span> {_lbl_select}</button>"; }}'
             ) if enable_selection else '// Selection disabled'
 
-            popup_js_block = (
+            popup_html_js = (
                 "var popup = '<div class=\"building-popup\" dir=\"auto\">' +\n"
                 "                    '<h4>' + buildingIdDisplay + ' ' +\n"
                 "                    '<span class=\"geometry-badge\">' + geomType + '</span></h4>' +\n"
@@ -874,9 +890,17 @@ class LeafletHTMLGenerator:
                 "\n"
                 "                " + selection_btn_js + "\n"
                 "\n"
-                "                popup += '</div>';\n"
-                "\n"
-                "                layer.bindPopup(popup);"
+                "                popup += '</div>';"
+            )
+            popup_js_block = popup_html_js + "\n\n                layer.bindPopup(popup);"
+            vt_popup_js_block = (
+                "var statusLabel = statusLabels[props.status] || props.status;\n"
+                "                var statusClass = 'status-' + props.status;\n"
+                "                var geomType = 'Point';\n"
+                "                var buildingIdDisplay = props.building_id;\n"
+                "                var buildingIdForApi = p.building_uuid || p.building_id;\n"
+                "                " + popup_html_js + "\n"
+                "                L.popup().setLatLng(e.latlng).setContent(popup).openOn(map);"
             )
 
         # Build hover JS block - skip in multi-select mode (multiselect template adds its own)
@@ -954,6 +978,43 @@ class LeafletHTMLGenerator:
             var gsOverlays = {{"Buildings (GeoServer)": gsBuildingsLayer}};
             L.control.layers(null, gsOverlays).addTo(map);
         }}
+        // Building footprints as vector tiles (optional, configured via .env).
+        // When enabled this is the building layer: clicks open the popup or
+        // toggle the multi-select selection, and no GeoJSON is pushed in.
+        var vectorTilesUrl = '{vector_tiles_url}';
+        var vtBuildingsLayer = null;
+        if (vectorTilesUrl && typeof L.buildingVectorTiles === 'function') {{
+            vtBuildingsLayer = L.buildingVectorTiles(vectorTilesUrl, {{
+                style: function(props) {{
+                    var radius = map.getZoom() >= 16 ? 6 : 3;
+                    if (typeof selectedBuildings !== 'undefined' && selectedBuildings.has(String(props.building_id))) {{
+                        return {{fill: '#64B5F6', stroke: '#1976D2', width: 3, radius: radius + 2}};
+                    }}
+                    var color = (typeof statusColors !== 'undefined')
+                        ? (statusColors[getStatusKey(props.building_status)] || '#3B82F6')
+                        : '#3B82F6';
+                    return {{fill: color + '99', stroke: color, width: 1, radius: radius}};
+                }}
+            }});
+            vtBuildingsLayer.on('click', function(e) {{
+                var p = e.properties;
+                if (!p.building_id && !p.building_uuid) return;
+                var props = {{
+                    building_id: p.building_id || p.building_uuid,
+                    neighborhood: p.neighborhood_code,
+                    status: getStatusKey(p.building_status || 1),
+                    units: p.number_of_units,
+                    type: p.building_type
+                }};
+                if (window.multiselectMode && typeof toggleBuildingMultiSelect === 'function') {{
+                    toggleBuildingMultiSelect(String(props.building_id), null,
+                                              {{properties: props, geometry: {{type: 'VectorTile'}}}});
+                    return;
+                }}
+                {vt_popup_js_block}
+            }});
+            vtBuildingsLayer.addTo(map);
+        }}
 
         // Loading overlay: keep visible until ALL viewport tiles are loaded so the user
         // never sees dark/empty tile areas. 'load' fires when every tile in the current
@@ -65,6 +65,7 @@ MULTISELECT_JS_TEMPLATE = """
                 selectBuildingMulti(buildingId, layer, feature);
             }
 
+            restyleVectorBuildings();
             updateMultiSelectCounter();
             sendMultiSelectedBuildingsToPython();
         }
@@ -107,10 +108,18 @@ MULTISELECT_JS_TEMPLATE = """
             selectedBuildings.delete(buildingId);
         }
 
+        // Vector tile buildings have no per-building layer: repaint their tiles instead
+        function restyleVectorBuildings() {
+            if (typeof vtBuildingsLayer !== 'undefined' && vtBuildingsLayer) {
+                vtBuildingsLayer.restyle();
+            }
+        }
+
         // Clear all selections
         function clearAllSelections() {
             selectedLayersGroup.clearLayers();
             selectedBuildings.clear();
+            restyleVectorBuildings();
             updateMultiSelectCounter();
             sendMultiSelectedBuildingsToPython();
         }
@@ -35,8 +35,10 @@ VIEWPORT_LOADING_JS_TEMPLATE = '''
         var MIN_ZOOM_FOR_LOADING = 15;
         var MAX_MARKERS_PER_VIEWPORT = 2000;
 
-        // Viewport loading state
-        var viewportLoadingEnabled = true;
+        // Viewport loading state. With vector tiles every building is already on
+        // the map, so nothing is requested per viewport; updateBuildingsOnMap()
+        // still renders markers Python injects explicitly (the focused building).
+        var viewportLoadingEnabled = !(typeof vtBuildingsLayer !== 'undefined' && vtBuildingsLayer);
         var viewportLoadingDebounceTimer = null;
         var viewportLoadingDebounceDelay = 300; // ms — single debounce (Python debounce removed)
         var currentBuildingsLayer = null;
@@ -294,6 +296,9 @@ VIEWPORT_LOADING_JS_TEMPLATE = '''
                 map.removeLayer(currentBuildingsLayer);
                 currentBuildingsLayer = null;
             }
+            if (typeof vtBuildingsLayer !== 'undefined' && vtBuildingsLayer) {
+                vtBuildingsLayer.redraw();
+            }
             isLoadingViewport = false;
             console.log('Map buildings cleared for refresh');
         };
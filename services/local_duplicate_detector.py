@@ -0,0 +1,573 @@
+# -*- coding: utf-8 -*-
+"""
+Local duplicate detection for staged persons, buildings and property units.
+
+Offline imports (.uhc containers) and pre-upload checks cannot wait for the
+server's /detect-duplicates round trip. `LocalDuplicateDetector` compares
+staged records against each other and against the local database and emits
+conflicts in the same shape as the backend conflict list, so
+`DuplicateService.compute_local_summary()` and the duplicates page can read
+them unchanged. The import wizard runs it through
+`ImportController.detect_local_duplicates()` when the server's detection
+fails after staging.
+
+Persons
+    Names are normalized with the search-index rules (diacritics, alef /
+    yaa / taa-marbuta / hamza forms, Arabic-Indic digits) plus name
+    particles: "بن/ابن/بنت/bin/ibn", a leading "ال"/"al", and "عبد X" written
+    as one word. Candidates are blocked, never compared all-pairs:
+      - same national ID                    -> duplicate, score 1.0
+      - same birth year + surname prefix    -> scored
+      - surname + first-name prefix         -> scored (records without year)
+    Within a block, names become L2-normalized character-bigram count
+    vectors (hashed into `dims` buckets) and one matrix product scores the
+    whole block. Different national IDs or genders never match.
+
+Buildings
+    Same building code -> duplicate. Within a neighbourhood, buildings whose
+    points are closer than `building_radius_m` are flagged; points are
+    bucketed in a grid of radius-sized cells, so each staged building is
+    only measured against its neighbouring cells.
+
+Property units
+    Within a building, the same floor and unit number (leading zeros and
+    separators ignored). Staged units name their building by UUID and local
+    rows by code; both are resolved to the code.
+
+Records are read in either shape: local snake_case columns or the staged
+API payloads (`StagedSnapshot.records`) in camelCase.
+"""
+
+import re
+import uuid
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from repositories.search_index import normalize_search_text
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_PARTICLES = {"بن", "ابن", "بنت", "bin", "ibn", "bint", "ben"}
+_ARTICLES = {"al", "el"}
+_ABD = {"عبد", "abd", "abdul", "abdel"}
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+_DIGITS_RE = re.compile(r"\D")
+
+_NAME_WIDTH = 48          # characters kept per name for vectorization
+_BUCKET_PRIME = 1_000_003
+
+# Keys per name part, in local `persons` order: local Arabic column, staged
+# API field, then the Latin forms. Matched in this order.
+_PERSON_NAME_FIELDS = (
+    ("first_name_ar", "firstNameArabic", "first_name", "firstName"),
+    ("father_name_ar", "fatherNameArabic", "father_name", "fatherName"),
+    ("last_name_ar", "familyNameArabic", "lastNameArabic",
+     "last_name", "familyName", "lastName"),
+)
+_FULL_NAME_FIELDS = ("full_name_ar", "fullNameArabic", "full_name", "fullName")
+
+# Coordinate key pairs, local columns first.
+_POINT_FIELDS = (
+    ("latitude", "longitude"),
+    ("lat", "lng"),
+    ("lat", "lon"),
+    ("Latitude", "Longitude"),
+    ("gpsLatitude", "gpsLongitude"),
+)
+
+_UUID_RE = re.compile(r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$")
+
+
+def normalize_person_name(text) -> str:
+    """Normalize one name part for matching (see module docstring)."""
+    tokens = _TOKEN_RE.findall(normalize_search_text(text))
+    out: List[str] = []
+    pending_abd = False
+    for token in tokens:
+        if token in _PARTICLES or token in _ARTICLES:
+            continue
+        if pending_abd:
+            out[-1] += token
+            pending_abd = False
+            continue
+        if token.startswith("ال") and len(token) > 3:
+            token = token[2:]
+        if token in _ABD:
+            token = "عبد" if token == "عبد" else "abd"
+            pending_abd = True
+        out.append(token)
+    return " ".join(out)
+
+
+def _first(record: Dict[str, Any], *keys, default=None):
+    for key in keys:
+        value = record.get(key)
+        if value not in (None, ""):
+            return value
+    return default
+
+
+def _digits(value) -> str:
+    return _DIGITS_RE.sub("", normalize_search_text(value)) if value else ""
+
+
+def _year(record: Dict[str, Any]) -> int:
+    value = _first(record, "year_of_birth", "yearOfBirth", "date_of_birth", "dateOfBirth")
+    try:
+        return int(str(value)[:4]) if value else 0
+    except ValueError:
+        return 0
+
+
+class _PersonKey:
+    """Normalized fields of one person used for blocking and scoring."""
+
+    __slots__ = ("entity_id", "name", "last", "first", "year", "national_id", "gender", "label")
+
+    def __init__(self, record: Dict[str, Any]):
+        self.entity_id = str(_first(record, "person_id", "person_uuid", "id", "personId", default=""))
+        raw = [str(_first(record, *keys, default="")) for keys in _PERSON_NAME_FIELDS]
+        if not any(raw):
+            # Only a full name: first token, last token, the rest as father.
+            words = str(_first(record, *_FULL_NAME_FIELDS, default="")).split()
+            if words:
+                raw = [words[0], " ".join(words[1:-1]), words[-1] if len(words) > 1 else ""]
+        parts = [normalize_person_name(value) for value in raw]
+        self.first, _father, self.last = parts
+        self.name = " ".join(p for p in parts if p)
+        self.year = _year(record)
+        self.national_id = _digits(_first(record, "national_id", "nationalId"))
+        self.gender = str(_first(record, "gender", default="")).strip().lower()
+        self.label = " ".join(v for v in raw if v).strip()
+
+    def blocks(self) -> List[Tuple]:
+        """Blocks this record lives in (base side)."""
+        keys = []
+        if len(self.national_id) >= 5:
+            keys.append(("nid", self.national_id))
+        if self.last:
+            keys.append(("year", self.year, self.last[:3]))
+            keys.append(("name", self.last[:3], self.first[:2]))
+        return keys
+
+    def probes(self) -> List[Tuple]:
+        """Blocks a staged record is compared in.
+
+        With a birth year: same year, plus base rows without a year. Without
+        one: surname + first-name prefix across all years.
+        """
+        keys = []
+        if len(self.national_id) >= 5:
+            keys.append(("nid", self.national_id))
+        if self.last:
+            if self.year:
+                keys.append(("year", self.year, self.last[:3]))
+                keys.append(("year", 0, self.last[:3]))
+            else:
+                keys.append(("name", self.last[:3], self.first[:2]))
+        return keys
+
+
+def name_vectors(names: Sequence[str], dims: int = 64) -> np.ndarray:
+    """L2-normalized hashed character-bigram count vectors, one row per name.
+
+    Fully vectorized: names are laid out as a UCS-4 code-point matrix, the
+    bigram hashes are computed column-wise and counted with one bincount.
+    """
+    n = len(names)
+    if n == 0:
+        return np.zeros((0, dims), dtype=np.float32)
+    padded = np.array([f" {name} " for name in names], dtype=f"<U{_NAME_WIDTH}")
+    codes = padded.view(np.uint32).reshape(n, _NAME_WIDTH).astype(np.int64)
+    left, right = codes[:, :-1], codes[:, 1:]
+    valid = (left != 0) & (right != 0)
+    buckets = (left * _BUCKET_PRIME + right) % dims
+    rows = np.broadcast_to(np.arange(n, dtype=np.int64)[:, None], buckets.shape)
+    flat = (rows * dims + buckets)[valid]
+    counts = np.bincount(flat, minlength=n * dims).reshape(n, dims).astype(np.float32)
+    norms = np.linalg.norm(counts, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return counts / norms
+
+
+class LocalDuplicateDetector:
+    """Blocked, vectorized duplicate detection over staged records."""
+
+    def __init__(self, person_threshold: float = 0.88, dims: int = 64,
+                 building_radius_m: float = 5.0, max_block: int = 20000):
+        self.person_threshold = person_threshold
+        self.dims = dims
+        self.building_radius_m = building_radius_m
+        # Oversized blocks (very common surname + year) are split into
+        # chunks of this many base rows so one matrix stays bounded.
+        self.max_block = max_block
+
+    # -- Persons ---------------------------------------------------------
+
+    def detect_persons(self, staged: Iterable[Dict[str, Any]],
+                       base: Iterable[Dict[str, Any]] = (),
+                       package_id: str = None) -> List[Dict[str, Any]]:
+        """Conflicts between staged persons and (staged + base) persons."""
+        staged = list(staged)
+        staged_keys = [_PersonKey(r) for r in staged]
+        staged_keys = [k for k in staged_keys if k.entity_id and (k.name or k.national_id)]
+        if not staged_keys:
+            return []
+
+        staged_blocks: Dict[Tuple, List[int]] = defaultdict(list)
+        for i, key in enumerate(staged_keys):
+            for block in key.probes():
+                staged_blocks[block].append(i)
+
+        # Keep only base rows that share a block with some staged row.
+        staged_ids = {k.entity_id for k in staged_keys} | _original_ids(staged)
+        base_keys: List[_PersonKey] = []
+        base_blocks: Dict[Tuple, List[int]] = defaultdict(list)
+        for record in base:
+            key = _PersonKey(record)
+            if not key.entity_id or key.entity_id in staged_ids:
+                continue
+            blocks = [b for b in key.blocks() if b in staged_blocks]
+            if not blocks:
+                continue
+            idx = len(base_keys)
+            base_keys.append(key)
+            for block in blocks:
+                base_blocks[block].append(idx)
+
+        staged_vectors = name_vectors([k.name for k in staged_keys], self.dims)
+        pairs: Dict[Tuple[str, str], Tuple[float, _PersonKey, _PersonKey, str]] = {}
+
+        for block, s_idx in staged_blocks.items():
+            s_idx_arr = np.asarray(s_idx)
+            b_idx = base_blocks.get(block, [])
+            # Staged vs staged (upper triangle only). The "year 0" probe mixes
+            # years, so it is only used against the base.
+            if len(s_idx) > 1 and not (block[0] == "year" and block[1] == 0
+                                       and staged_keys[s_idx[0]].year):
+                sims = staged_vectors[s_idx_arr] @ staged_vectors[s_idx_arr].T
+                self._collect(pairs, block, sims, s_idx, s_idx, staged_keys, staged_keys,
+                              "staging", upper_only=True)
+            # Staged vs base, chunked for very large blocks.
+            for start in range(0, len(b_idx), self.max_block):
+                chunk = b_idx[start:start + self.max_block]
+                base_vectors = name_vectors([base_keys[j].name for j in chunk], self.dims)
+                sims = staged_vectors[s_idx_arr] @ base_vectors.T
+                self._collect(pairs, block, sims, s_idx, chunk, staged_keys, base_keys,
+                              "production")
+
+        now = datetime.utcnow().isoformat()
+        conflicts = [
+            self._person_conflict(first, second, score, source, package_id, now)
+            for score, first, second, source in pairs.values()
+        ]
+        logger.info(
+            f"[LOCAL_DEDUP] persons: staged={len(staged_keys)} base_candidates={len(base_keys)} "
+            f"blocks={len(staged_blocks)} conflicts={len(conflicts)}"
+        )
+        return conflicts
+
+    def _collect(self, pairs, block, sims, rows, cols, row_keys, col_keys, source,
+                 upper_only=False):
+        if block[0] == "nid":
+            hits = np.argwhere(np.ones_like(sims, dtype=bool))
+        else:
+            hits = np.argwhere(sims >= self.person_threshold)
+        for r, c in hits:
+            if upper_only and c <= r:
+                continue
+            first, second = row_keys[rows[r]], col_keys[cols[c]]
+            if first.entity_id == second.entity_id:
+                continue
+            if first.national_id and second.national_id and first.national_id != second.national_id:
+                continue
+            if first.gender and second.gender and first.gender != second.gender:
+                continue
+            score = 1.0 if block[0] == "nid" else round(float(sims[r, c]), 4)
+            pair = tuple(sorted((first.entity_id, second.entity_id)))
+            if pair not in pairs or pairs[pair][0] < score:
+                pairs[pair] = (score, first, second, source)
+
+    @staticmethod
+    def _person_conflict(first: _PersonKey, second: _PersonKey, score: float,
+                         source: str, package_id: Optional[str], detected: str) -> Dict[str, Any]:
+        fields = []
+        if first.national_id and first.national_id == second.national_id:
+            fields.append("national_id")
+        if first.name and first.name == second.name:
+            fields.append("full_name")
+        elif "national_id" not in fields:
+            fields.append("name_similarity")
+        if first.year and first.year == second.year:
+            fields.append("year_of_birth")
+        return _conflict(
+            "PersonDuplicate", "Person", first.entity_id, second.entity_id,
+            first.label, second.label, score, fields, source, package_id, detected,
+        )
+
+    # -- Buildings -------------------------------------------------------
+
+    def detect_buildings(self, staged: Iterable[Dict[str, Any]],
+                         base: Iterable[Dict[str, Any]] = (),
+                         package_id: str = None) -> List[Dict[str, Any]]:
+        staged = [r for r in staged if _building_id(r)]
+        if not staged:
+            return []
+        now = datetime.utcnow().isoformat()
+        conflicts: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
+        by_code: Dict[str, List[Tuple[Dict[str, Any], str]]] = defaultdict(list)
+        by_area: Dict[str, List[Tuple[Dict[str, Any], str]]] = defaultdict(list)
+        for record in staged:
+            by_code[_building_code(record)].append((record, "staging"))
+            by_area[_neighborhood(record)].append((record, "staging"))
+        staged_ids = {_building_id(r) for r in staged} | _original_ids(staged)
+        for record in base:
+            if _building_id(record) in staged_ids:
+                continue
+            code, area = _building_code(record), _neighborhood(record)
+            if code in by_code:
+                by_code[code].append((record, "production"))
+            if area in by_area:
+                by_area[area].append((record, "production"))
+
+        for code, members in by_code.items():
+            if code and len(members) > 1:
+                self._building_pairs(conflicts, members, None, ["building_id"], package_id, now)
+
+        radius = self.building_radius_m
+        for area, members in by_area.items():
+            with_point = [(r, s) for r, s in members if _point(r) is not None]
+            if radius <= 0 or len(with_point) < 2:
+                continue
+            pts = np.array([_point(r) for r, _ in with_point], dtype=np.float64)
+            lat0 = np.radians(pts[:, 0].mean())
+            xy = np.column_stack((pts[:, 1] * np.cos(lat0), pts[:, 0])) * 111_320.0
+            # Grid of radius-sized cells: a staged building is only measured
+            # against the points of its own and the eight neighbouring cells.
+            cells: Dict[Tuple[int, int], List[int]] = defaultdict(list)
+            cell_keys = np.floor(xy / radius).astype(np.int64).tolist()
+            for i, key in enumerate(cell_keys):
+                cells[tuple(key)].append(i)
+            for i, (_, source) in enumerate(with_point):
+                if source != "staging":
+                    continue
+                cx, cy = cell_keys[i]
+                near = np.array([j for dx in (-1, 0, 1) for dy in (-1, 0, 1)
+                                 for j in cells.get((cx + dx, cy + dy), ())])
+                d = np.linalg.norm(xy[near] - xy[i], axis=1)
+                for c, dist in zip(near[d < radius].tolist(), d[d < radius].tolist()):
+                    if c == i or (with_point[c][1] == "staging" and c < i):
+                        continue
+                    score = round(1.0 - dist / (2 * radius), 4)
+                    self._building_pairs(conflicts, [with_point[i], with_point[c]], score,
+                                         ["location"], package_id, now)
+
+        result = list(conflicts.values())
+        logger.info(f"[LOCAL_DEDUP] buildings: staged={len(staged)} conflicts={len(result)}")
+        return result
+
+    @staticmethod
+    def _building_pairs(conflicts, members, score, fields, package_id, detected):
+        for i, (first, first_source) in enumerate(members):
+            if first_source != "staging":
+                continue
+            for second, source in members[i + 1:]:
+                a, b = _building_id(first), _building_id(second)
+                if a == b:
+                    continue
+                pair = tuple(sorted((a, b)))
+                existing = conflicts.get(pair)
+                if existing:
+                    existing["matchingFields"] = sorted(set(existing["matchingFields"]) | set(fields))
+                    continue
+                conflicts[pair] = _conflict(
+                    "PropertyDuplicate", "Building", a, b,
+                    _building_code(first), _building_code(second),
+                    1.0 if score is None else score, list(fields), source, package_id, detected,
+                )
+
+    # -- Property units --------------------------------------------------
+
+    def detect_units(self, staged: Iterable[Dict[str, Any]],
+                     base: Iterable[Dict[str, Any]] = (),
+                     package_id: str = None,
+                     building_codes: Dict[str, str] = None) -> List[Dict[str, Any]]:
+        """Units sharing building, floor and number.
+
+        Staged units reference their building by UUID, local rows by code;
+        `building_codes` (UUID -> code, see `building_code_map`) puts both
+        on the code.
+        """
+        staged = [r for r in staged if _unit_id(r)]
+        if not staged:
+            return []
+        codes = building_codes or {}
+        now = datetime.utcnow().isoformat()
+        groups: Dict[Tuple[str, str, str], List[Tuple[Dict[str, Any], str]]] = defaultdict(list)
+        for record in staged:
+            groups[_unit_key(record, codes)].append((record, "staging"))
+        staged_ids = {_unit_id(r) for r in staged} | _original_ids(staged)
+        for record in base:
+            key = _unit_key(record, codes)
+            if key in groups and _unit_id(record) not in staged_ids:
+                groups[key].append((record, "production"))
+
+        conflicts = []
+        for key, members in groups.items():
+            if not key[2] or len(members) < 2:
+                continue
+            first = members[0][0]
+            for second, source in members[1:]:
+                conflicts.append(_conflict(
+                    "PropertyDuplicate", "PropertyUnit", _unit_id(first), _unit_id(second),
+                    _unit_label(first), _unit_label(second), 1.0,
+                    ["building_id", "floor_number", "unit_number"], source, package_id, now,
+                ))
+        logger.info(f"[LOCAL_DEDUP] units: staged={len(staged)} conflicts={len(conflicts)}")
+        return conflicts
+
+    # -- All -------------------------------------------------------------
+
+    def detect(self, staged: Dict[str, List[Dict[str, Any]]], db=None,
+               package_id: str = None) -> Dict[str, List[Dict[str, Any]]]:
+        """Run all detectors; `db` (iter_rows()-capable) supplies the local base."""
+        units = staged.get("units", []) or staged.get("property_units", [])
+        codes = {}
+        if units:
+            codes = building_code_map(
+                _iter_table(db, "buildings", "SELECT building_uuid, building_id FROM buildings"))
+            codes.update(building_code_map(staged.get("buildings", [])))
+        return {
+            "persons": self.detect_persons(
+                staged.get("persons", []), _iter_table(db, "persons"), package_id),
+            "buildings": self.detect_buildings(
+                staged.get("buildings", []), _iter_table(db, "buildings"), package_id),
+            "units": self.detect_units(
+                units, _iter_table(db, "property_units"), package_id, codes),
+        }
+
+
+# ---------------------------------------------------------------------------
+# Record helpers
+# ---------------------------------------------------------------------------
+
+def _conflict(conflict_type: str, entity_type: str, first_id: str, second_id: str,
+              first_label: str, second_label: str, score: float, fields: List[str],
+              source: str, package_id: Optional[str], detected: str) -> Dict[str, Any]:
+    """One conflict in the backend conflict-list shape."""
+    return {
+        "id": str(uuid.uuid4()),
+        "conflictType": conflict_type,
+        "entityType": entity_type,
+        "status": "PendingReview",
+        "priority": "High" if score >= 0.97 else "Medium",
+        "isEscalated": False,
+        "firstEntityId": first_id,
+        "secondEntityId": second_id,
+        "firstEntityIdentifier": first_label or first_id,
+        "secondEntityIdentifier": second_label or second_id,
+        "firstEntityType": entity_type,
+        "secondEntityType": entity_type,
+        "secondEntitySource": "Staging" if source == "staging" else "Production",
+        "similarityScore": score,
+        "matchingFields": fields,
+        "detectedDate": detected,
+        "importPackageId": package_id,
+        "source": "local",
+    }
+
+
+def _original_ids(records) -> set:
+    """Ids of the local entities staged rows update (excluded from the base)."""
+    return {str(r["originalEntityId"]) for r in records if r.get("originalEntityId")}
+
+
+def _is_uuid(value) -> bool:
+    return bool(value) and bool(_UUID_RE.match(str(value)))
+
+
+def _building_id(record) -> str:
+    return str(_first(record, "building_uuid", "id", "buildingUuid", "building_id", default=""))
+
+
+def _building_code(record) -> str:
+    """17-digit building code; API records may carry the UUID under buildingId."""
+    for key in ("building_id", "buildingCode", "buildingId"):
+        value = record.get(key)
+        if value not in (None, "") and not _is_uuid(value):
+            return _digits(value)
+    return ""
+
+
+def building_code_map(records: Iterable[Dict[str, Any]]) -> Dict[str, str]:
+    """Every UUID a building record is known by -> its building code."""
+    codes = {}
+    for record in records:
+        code = _building_code(record)
+        if not code:
+            continue
+        for key in ("building_uuid", "id", "buildingUuid", "originalEntityId", "buildingId"):
+            value = record.get(key)
+            if _is_uuid(value):
+                codes[str(value).lower()] = code
+    return codes
+
+
+def _neighborhood(record) -> str:
+    return str(_first(record, "neighborhood_code", "neighborhoodCode", default=""))
+
+
+def _point(record) -> Optional[Tuple[float, float]]:
+    location = record.get("location")
+    sources = (record, location) if isinstance(location, dict) else (record,)
+    for source in sources:
+        for lat_key, lng_key in _POINT_FIELDS:
+            lat, lng = source.get(lat_key), source.get(lng_key)
+            if lat in (None, "") or lng in (None, ""):
+                continue
+            try:
+                return float(lat), float(lng)
+            except (TypeError, ValueError):
+                return None
+    return None
+
+
+def _unit_id(record) -> str:
+    return str(_first(record, "unit_uuid", "id", "propertyUnitId", "unit_id", default=""))
+
+
+def _unit_key(record, building_codes: Dict[str, str] = None) -> Tuple[str, str, str]:
+    """(building code, floor, unit number); a building UUID is mapped to its code."""
+    ref = _first(record, "building_id", "buildingId", "building_uuid", "buildingUuid", default="")
+    if _is_uuid(ref):
+        building = (building_codes or {}).get(str(ref).lower(), str(ref).lower())
+    else:
+        building = _digits(ref)
+    floor = str(_first(record, "floor_number", "floorNumber", default="0"))
+    number = _digits(_first(record, "unit_number", "apartment_number", "unitNumber",
+                            "unitIdentifier")).lstrip("0")
+    return building, floor, number
+
+
+def _unit_label(record) -> str:
+    return str(_first(record, "unit_id", "unitIdentifier", "unit_number", "unitNumber", default=""))
+
+
+def _iter_table(db, table: str, query: str = None, batch: int = 5000):
+    """Stream rows of a local table as dicts; nothing when unavailable.
+
+    Uses the lock-free read path (`iter_rows`), so a long detection run
+    never holds the adapter's write lock.
+    """
+    if db is None:
+        return
+    try:
+        for row in db.iter_rows(query or f"SELECT * FROM {table}", (), batch):
+            yield dict(row)
+    except Exception as e:
+        logger.warning(f"[LOCAL_DEDUP] Could not read local {table}: {e}")
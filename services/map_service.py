@@ -8,6 +8,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 from app.config import Config
+from services.geometry_codec import try_parse
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -40,19 +41,12 @@ class GeoPoint:
     @classmethod
     def from_wkt(cls, wkt: str) -> Optional['GeoPoint']:
         """Create from WKT string."""
-        try:
-            # Simple parser for POINT format
-            wkt = wkt.strip().upper()
-            if wkt.startswith("POINT"):
-                coords_str = wkt.split("(")[1].split(")")[0].strip()
-                parts = coords_str.split()
-                lon = float(parts[0])
-                lat = float(parts[1])
-                alt = float(parts[2]) if len(parts) > 2 else None
-                return cls(latitude=lat, longitude=lon, altitude=alt)
-        except Exception as e:
-            logger.warning(f"Failed to parse WKT: {e}")
-        return None
+        geometry = try_parse(wkt, "WKT point")
+        if geometry is None or geometry.geom_type != "Point" or geometry.is_empty:
+            return None
+        coords = geometry.coords[0].tolist()
+        alt = coords[2] if len(coords) > 2 else None
+        return cls(latitude=coords[1], longitude=coords[0], altitude=alt)
 
 
 @dataclass
@@ -78,23 +72,10 @@ class GeoPolygon:
     @classmethod
     def from_wkt(cls, wkt: str) -> Optional['GeoPolygon']:
         """Create from WKT string."""
-        try:
-            wkt = wkt.strip()
-            if wkt.upper().startswith("POLYGON"):
-                # Extract coordinates
-                coords_str = wkt[wkt.index("(")+1:wkt.rindex(")")]
-                rings = []
-                for ring_str in coords_str.split("),"):
-                    ring_str = ring_str.strip().strip("(").strip(")")
-                    ring = []
-                    for point_str in ring_str.split(","):
-                        parts = point_str.strip().split()
-                        ring.append((float(parts[0]), float(parts[1])))
-                    rings.append(ring)
-                return cls(coordinates=rings)
-        except Exception as e:
-            logger.warning(f"Failed to parse WKT polygon: {e}")
-        return None
+        geometry = try_parse(wkt, "WKT polygon")
+        if geometry is None or geometry.geom_type != "Polygon" or geometry.is_empty:
+            return None
+        return cls(coordinates=geometry.rings())
 
     def get_centroid(self) -> GeoPoint:
         """Calculate centroid of the polygon."""
@@ -9,7 +9,6 @@
 from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
 import json
-import time
 from app.config import Config
 from services.api_client import TRRCMSApiClient, get_api_client, ApiConfig
 from services.map_service import GeoPoint, GeoPolygon, BuildingGeoData
@@ -33,8 +32,6 @@ class MapServiceAPI:
         "min_lon": Config.MAP_BOUNDS_MIN_LNG,
         "max_lon": Config.MAP_BOUNDS_MAX_LNG
     }
-    _resolved_address_cache = {}
-    _neighborhoods_by_code_cache = None
     _divisions_service = None
     # Class-level caches for address lookups (loaded once)
     # Class-level attributes
@@ -625,36 +622,13 @@ class MapServiceAPI:
             cls._divisions_service = DivisionsService()
         return cls._divisions_service
 
-    @classmethod
-    def _get_neighborhoods_by_code_cached(cls):
-        if cls._neighborhoods_by_code_cache is None:
-            cls._neighborhoods_by_code_cache = {}
-            try:
-                from services.api_client import get_api_client
-                api = get_api_client()
-                if api:
-                    neighborhoods = api.get_neighborhoods()
-                    for n in neighborhoods:
-                        code = n.get("neighborhoodCode")
-                        if code:
-                            cls._neighborhoods_by_code_cache[code] = n.get("nameArabic", "")
-            except Exception as e:
-                logger.warning(f"Failed to warm neighborhoods cache: {e}")
-
-        return cls._neighborhoods_by_code_cache
-    
-    
     @classmethod
     def _resolve_address_names(cls, gov_code: str, dist_code: str, subdist_code: str,
                                community_code: str, neighborhood_code: str) -> Dict[str, str]:
         """
-        Resolve address names from codes using cached lookups.
+        Resolve address names from codes via the reference-data cache
+        (no network call once the divisions and neighborhoods are synced).
         """
-        cache_key = (gov_code, dist_code, subdist_code, community_code, neighborhood_code)
-
-        if cache_key in cls._resolved_address_cache:
-            return cls._resolved_address_cache[cache_key]
-
         result = {
             "governorate_name_ar": "",
             "district_name_ar": "",
@@ -662,7 +636,6 @@ class MapServiceAPI:
             "community_name_ar": "",
             "neighborhood_name_ar": ""
         }
-        addr_perf_start = time.perf_counter()
         # Resolve admin divisions via cached singleton service
         try:
             service = cls._get_divisions_service_cached()
@@ -685,16 +658,15 @@ class MapServiceAPI:
 
         except Exception as e:
             logger.warning(f"Error resolving admin division names: {e}")
-        
-        # Resolve neighborhood name from cache loaded once
+
         if neighborhood_code:
             try:
-                neighborhoods_map = cls._get_neighborhoods_by_code_cached()
-                result["neighborhood_name_ar"] = neighborhoods_map.get(neighborhood_code, "")
+                from services.reference_data_cache import get_reference_data_cache
+                neighborhoods = get_reference_data_cache().by_code("neighborhoods", key="neighborhoodCode")
+                result["neighborhood_name_ar"] = neighborhoods.get(neighborhood_code, {}).get("nameArabic", "")
             except Exception as e:
                 logger.warning(f"Failed to resolve neighborhood name: {e}")
-        
-        cls._resolved_address_cache[cache_key] = result
+
         return result
 
     def _convert_api_building_to_model(self, data: Dict[str, Any],resolve_address_names: bool = True) -> Building:
@@ -864,7 +836,18 @@ class MapServiceAPI:
 
         Returns:
             Neighborhood data or None
+
+        Answered from the local neighborhood boundary index when it is
+        available; the data provider (API) is the fallback.
         """
+        try:
+            from services.reverse_geocoder import API_NEIGHBORHOODS, get_reverse_geocoder
+            local = get_reverse_geocoder().lookup(longitude, latitude, API_NEIGHBORHOODS)
+            if local:
+                return local
+        except Exception as e:
+            logger.debug(f"Local neighborhood lookup failed: {e}")
+
         try:
             neighborhood = self.data_provider.get_neighborhood_by_point(lat=latitude, lng=longitude)
             if neighborhood:
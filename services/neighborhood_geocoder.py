@@ -1,14 +1,17 @@
 # -*- coding: utf-8 -*-
 """
-Neighborhood Geocoder Service — API-only.
+Neighborhood Geocoder Service.
 
-Provides reverse geocoding: converts coordinates to neighborhood information
-using Backend API.
+Provides reverse geocoding: converts coordinates to neighborhood information.
+Lookups run offline against the persisted neighborhood boundary index
+(services.reverse_geocoder); the Backend API is only the fallback.
 """
 
-from typing import Optional, Tuple
+from typing import List, Optional, Sequence, Tuple
 from dataclasses import dataclass
 
+from services.geometry_codec import try_parse
+from services.reverse_geocoder import API_NEIGHBORHOODS, get_reverse_geocoder
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -24,7 +27,11 @@ class NeighborhoodInfo:
 
 
 class NeighborhoodGeocoder:
-    """Reverse geocoding service for neighborhoods (API-only)."""
+    """Reverse geocoding service for neighborhoods (local index, API fallback)."""
+
+    # Set once the boundary list has been requested, so a backend without
+    # boundaries is not asked again on every lookup.
+    _boundaries_requested = False
 
     def __init__(self):
         pass
@@ -47,24 +54,67 @@ class NeighborhoodGeocoder:
 
         lng, lat = point
 
+        if self._ensure_local_index():
+            props = get_reverse_geocoder().lookup(lng, lat, API_NEIGHBORHOODS)
+            if props:
+                return self._to_info(props)
+
         from services.api_client import get_api_client
         api = get_api_client()
         result = api.get_neighborhood_by_point(lat, lng)
         if result:
-            return NeighborhoodInfo(
-                code=result.get("neighborhoodCode", ""),
-                name_en=result.get("nameEnglish", ""),
-                name_ar=result.get("nameArabic", ""),
-                confidence=1.0
-            )
+            return self._to_info(result)
         return None
 
+    def find_neighborhoods(self, points: Sequence[Tuple[float, float]]) -> List[Optional[NeighborhoodInfo]]:
+        """
+        Batch lookup for (longitude, latitude) points, e.g. during import validation.
+
+        Uses the local index only; points it cannot place come back as None.
+        """
+        if not points or not self._ensure_local_index():
+            return [None] * len(points)
+        return [self._to_info(props) if props else None
+                for props in get_reverse_geocoder().lookup_many(points, API_NEIGHBORHOODS)]
+
+    @classmethod
+    def _ensure_local_index(cls) -> bool:
+        """Make sure the neighborhood index exists, fetching boundaries once if needed."""
+        geocoder = get_reverse_geocoder()
+        if geocoder.has_index(API_NEIGHBORHOODS):
+            return True
+        if cls._boundaries_requested:
+            return False
+        cls._boundaries_requested = True
+        try:
+            from services.api_client import get_api_client
+            from app.config import Config
+            neighborhoods = get_api_client().get_neighborhoods_by_bounds(
+                sw_lat=Config.MAP_BOUNDS_MIN_LAT,
+                sw_lng=Config.MAP_BOUNDS_MIN_LNG,
+                ne_lat=Config.MAP_BOUNDS_MAX_LAT,
+                ne_lng=Config.MAP_BOUNDS_MAX_LNG
+            )
+            return geocoder.set_neighborhoods(neighborhoods) > 0
+        except Exception as e:
+            logger.warning(f"Could not load neighborhood boundaries: {e}")
+            return False
+
+    @staticmethod
+    def _to_info(data: dict) -> NeighborhoodInfo:
+        return NeighborhoodInfo(
+            code=data.get("neighborhoodCode", ""),
+            name_en=data.get("nameEnglish", ""),
+            name_ar=data.get("nameArabic", ""),
+            confidence=1.0
+        )
+
     def _extract_point_from_wkt(self, wkt: str) -> Optional[Tuple[float, float]]:
         """
         Extract a point from WKT geometry.
 
         For POINT: returns the point
-        For POLYGON: returns centroid
+        For POLYGON / MULTIPOLYGON: returns the area-weighted centroid
 
         Args:
             wkt: WKT geometry string
@@ -72,31 +122,18 @@ class NeighborhoodGeocoder:
         Returns:
             (longitude, latitude) or None
         """
-        wkt = wkt.strip().upper()
-
-        if wkt.startswith("POINT"):
-            coords = wkt.replace("POINT(", "").replace(")", "").strip()
-            lng, lat = coords.split()
-            return float(lng), float(lat)
-
-        elif wkt.startswith("POLYGON"):
-            coords_str = wkt.replace("POLYGON((", "").replace("))", "").strip()
-            coord_pairs = coords_str.split(",")
-
-            points = []
-            for pair in coord_pairs:
-                lng, lat = pair.strip().split()
-                points.append((float(lng), float(lat)))
-
-            if not points:
-                return None
-            avg_lng = sum(p[0] for p in points) / len(points)
-            avg_lat = sum(p[1] for p in points) / len(points)
-            return avg_lng, avg_lat
-
-        else:
-            logger.warning(f"Unsupported geometry type: {wkt[:20]}")
+        geometry = try_parse(wkt, "geometry for neighborhood lookup")
+        if geometry is None or geometry.is_empty:
+            return None
+
+        if geometry.geom_type == "Point":
+            x, y = geometry.coords[0, :2].tolist()
+            return x, y
+
+        if geometry.exterior() is None:
+            logger.warning(f"Unsupported geometry type: {geometry.geom_type}")
             return None
+        return geometry.centroid()
 
     def get_neighborhood_by_code(self, code: str) -> Optional[NeighborhoodInfo]:
         """
@@ -2,6 +2,11 @@
 """
 PDF Report Generation Service.
 Generates Arabic PDF reports with QR codes and digital signatures.
+
+Claim reports can also be generated in bulk (generate_claim_reports):
+claims are streamed from the database in chunks and rendered in a process
+pool whose workers register the font and build the paragraph styles once,
+into a directory of per-claim PDFs or one merged PDF.
 """
 
 import hashlib
@@ -9,11 +14,16 @@ import hmac
 import io
 import json
 import os
+import re
+import time
 import uuid
-from dataclasses import dataclass
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
+from itertools import groupby
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
 
 try:
     from reportlab.lib import colors
@@ -25,9 +35,10 @@ try:
     from reportlab.pdfbase.ttfonts import TTFont
     from reportlab.platypus import (
         SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle,
-        Image, PageBreak, KeepTogether
+        PageBreak, KeepTogether
     )
     from reportlab.pdfgen import canvas
+    from reportlab.graphics.shapes import Drawing, Path as VectorPath
     REPORTLAB_AVAILABLE = True
 except ImportError:
     REPORTLAB_AVAILABLE = False
@@ -38,6 +49,19 @@ try:
 except ImportError:
     QRCODE_AVAILABLE = False
 
+try:
+    import arabic_reshaper
+    from bidi.algorithm import get_display
+    ARABIC_SHAPING_AVAILABLE = True
+except ImportError:
+    ARABIC_SHAPING_AVAILABLE = False
+
+try:
+    from pypdf import PdfWriter
+    PYPDF_AVAILABLE = True
+except ImportError:
+    PYPDF_AVAILABLE = False
+
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -45,6 +69,30 @@ logger = get_logger(__name__)
 # Signature key (use secure key management in production)
 REPORT_SIGNATURE_KEY = b"UN-HABITAT-REPORT-SIGNATURE-2025"
 
+_ARABIC_CHARS = re.compile(r"[\u0600-\u06FF\u0750-\u077F\uFB50-\uFDFF\uFE70-\uFEFF]")
+
+
+@lru_cache(maxsize=65536)
+def shape_arabic(text: str) -> str:
+    """
+    Reshape and reorder Arabic text for drawing with ReportLab.
+
+    ReportLab draws characters in logical order without joining forms, so
+    Arabic must be reshaped (arabic-reshaper) and put in visual order
+    (python-bidi) first. Labels, statuses and names repeat on every report,
+    hence the cache.
+    """
+    if not ARABIC_SHAPING_AVAILABLE or not _ARABIC_CHARS.search(text):
+        return text
+    return get_display(arabic_reshaper.reshape(text))
+
+
+def _ar(value: Any) -> str:
+    """Table cell / paragraph text: shaped, '-' for missing values."""
+    if value is None or value == "":
+        return "-"
+    return shape_arabic(str(value))
+
 
 @dataclass
 class ReportMetadata:
@@ -60,6 +108,85 @@ class ReportMetadata:
     qr_data: str
 
 
+@dataclass
+class ClaimReportBatch:
+    """Aggregate result of `PDFReportService.generate_claim_reports()`."""
+    total: int = 0
+    generated: int = 0
+    failed: int = 0
+    pages: int = 0
+    files: List[Path] = field(default_factory=list)
+    merged_path: Optional[Path] = None
+    errors: Dict[str, str] = field(default_factory=dict)
+    duration_seconds: float = 0.0
+    workers: int = 1
+
+    @property
+    def pages_per_second(self) -> float:
+        return self.pages / self.duration_seconds if self.duration_seconds else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "total": self.total,
+            "generated": self.generated,
+            "failed": self.failed,
+            "pages": self.pages,
+            "files": [str(p) for p in self.files],
+            "merged_path": str(self.merged_path) if self.merged_path else None,
+            "errors": dict(self.errors),
+            "duration_seconds": round(self.duration_seconds, 3),
+            "pages_per_second": round(self.pages_per_second, 1),
+            "workers": self.workers,
+        }
+
+
+def _init_report_worker():
+    """Process-pool initializer: register the font and build styles once."""
+    PDFReportService._register_arabic_font()
+    PDFReportService._get_arabic_styles()
+
+
+def _render_claim_chunk(claims: List[Dict], output_dir: Optional[str], stamp: str) -> Dict[str, Any]:
+    """
+    Process-pool worker: render a chunk of claims.
+
+    With `output_dir`, writes one PDF per claim and returns their entries;
+    without, renders the chunk as one document (a part of a merged PDF).
+    """
+    generated_at = datetime.strptime(stamp, "%Y%m%d_%H%M%S")
+    if output_dir is None:
+        story = []
+        for claim_data in claims:
+            if story:
+                story.append(PageBreak())
+            story.extend(PDFReportService._claim_story(claim_data, str(uuid.uuid4()), generated_at))
+        content, pages = PDFReportService._render_pdf(story)
+        return {"part": content, "pages": pages, "claims": len(claims)}
+
+    reports, errors = [], {}
+    for claim_data in claims:
+        try:
+            report_id = str(uuid.uuid4())
+            content, pages = PDFReportService._render_pdf(
+                PDFReportService._claim_story(claim_data, report_id, generated_at))
+            file_path = Path(output_dir) / f"claim_report_{claim_data['case_number']}_{stamp}.pdf"
+            file_path.write_bytes(content)
+            checksum = hashlib.sha256(content).hexdigest()
+            reports.append({
+                "report_id": report_id,
+                "file_path": str(file_path),
+                "pages": pages,
+                "checksum": checksum,
+                "signature": PDFReportService._compute_report_signature(checksum, {
+                    'report_id': report_id,
+                    'generated_at': generated_at.isoformat()
+                }),
+            })
+        except Exception as e:
+            errors[str(claim_data.get('case_number') or claim_data.get('claim_uuid'))] = str(e)
+    return {"reports": reports, "errors": errors, "claims": len(claims)}
+
+
 class PDFReportService:
     """
     PDF Report Generation Service.
@@ -67,12 +194,17 @@ class PDFReportService:
     - QR codes embedding Record IDs
     - Digital signatures for authenticity
     - Multiple report templates
+    - Batch claim reports (process pool, directory or merged output)
     """
 
     # Arabic font path (update to actual font path)
     ARABIC_FONT_PATH = None
     FONT_REGISTERED = False
 
+    # Built once per process
+    _styles: Optional[Dict[str, "ParagraphStyle"]] = None
+    _table_styles: Dict[str, "TableStyle"] = {}
+
     def __init__(self, db_connection, output_dir: str = None):
         self.db = db_connection
         self.output_dir = Path(output_dir) if output_dir else Path("reports")
@@ -80,7 +212,8 @@ class PDFReportService:
 
         self._register_arabic_font()
 
-    def _register_arabic_font(self):
+    @staticmethod
+    def _register_arabic_font():
         """Register Arabic font for PDF generation."""
         if not REPORTLAB_AVAILABLE:
             logger.warning("ReportLab not available, PDF generation disabled")
@@ -108,13 +241,17 @@ class PDFReportService:
                 except Exception as e:
                     logger.warning(f"Could not register font {path}: {e}")
 
-    def _get_arabic_styles(self) -> Dict[str, ParagraphStyle]:
-        """Get paragraph styles for Arabic text."""
+    @staticmethod
+    def _get_arabic_styles() -> Dict[str, ParagraphStyle]:
+        """Get paragraph styles for Arabic text (built once per process)."""
+        if PDFReportService._styles is not None:
+            return PDFReportService._styles
+
         styles = getSampleStyleSheet()
 
         font_name = 'Arabic' if PDFReportService.FONT_REGISTERED else 'Helvetica'
 
-        return {
+        PDFReportService._styles = {
             'title': ParagraphStyle(
                 'ArabicTitle',
                 parent=styles['Title'],
@@ -171,9 +308,34 @@ class PDFReportService:
                 textColor=colors.gray
             )
         }
-
-    def _generate_qr_code(self, data: str) -> Optional[io.BytesIO]:
-        """Generate QR code image."""
+        return PDFReportService._styles
+
+    @staticmethod
+    def _table_style(align: str, font_size: int, padding: int, grid: float = 1,
+                     striped: bool = True) -> "TableStyle":
+        """Header-row table style, cached per parameter set."""
+        key = (align, font_size, padding, grid, striped)
+        style = PDFReportService._table_styles.get(key)
+        if style is None:
+            commands = [
+                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1a5276')),
+                ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+                ('ALIGN', (0, 0), (-1, -1), align),
+                ('FONTNAME', (0, 0), (-1, -1), 'Arabic' if PDFReportService.FONT_REGISTERED else 'Helvetica'),
+                ('FONTSIZE', (0, 0), (-1, -1), font_size),
+                ('BOTTOMPADDING', (0, 0), (-1, -1), padding),
+                ('TOPPADDING', (0, 0), (-1, -1), padding),
+                ('GRID', (0, 0), (-1, -1), grid, colors.black),
+            ]
+            if striped:
+                commands.append(
+                    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f8f9fa')]))
+            style = PDFReportService._table_styles[key] = TableStyle(commands)
+        return style
+
+    @staticmethod
+    def _qr_flowable(data: str, h_align: str = 'CENTER') -> Optional["Drawing"]:
+        """QR code drawn as one vector path (no PNG to encode, decode and embed)."""
         if not QRCODE_AVAILABLE:
             return None
 
@@ -181,24 +343,40 @@ class PDFReportService:
             qr = qrcode.QRCode(
                 version=1,
                 error_correction=qrcode.constants.ERROR_CORRECT_L,
-                box_size=10,
                 border=4
             )
             qr.add_data(data)
             qr.make(fit=True)
-
-            img = qr.make_image(fill_color="black", back_color="white")
-            buffer = io.BytesIO()
-            img.save(buffer, format='PNG')
-            buffer.seek(0)
-
-            return buffer
-
+            matrix = qr.get_matrix()
         except Exception as e:
             logger.warning(f"Could not generate QR code: {e}")
             return None
 
-    def _compute_report_signature(self, content_hash: str, metadata: Dict) -> str:
+        size = 3*cm
+        module = size / len(matrix)
+        path = VectorPath(fillColor=colors.black, strokeColor=None, strokeWidth=0)
+        for row_index, row in enumerate(matrix):
+            y0 = size - (row_index + 1) * module
+            x = 0
+            # One rectangle per horizontal run of dark modules
+            for dark, run in groupby(row):
+                length = len(list(run))
+                if dark:
+                    x0, x1 = x * module, (x + length) * module
+                    path.moveTo(x0, y0)
+                    path.lineTo(x1, y0)
+                    path.lineTo(x1, y0 + module)
+                    path.lineTo(x0, y0 + module)
+                    path.closePath()
+                x += length
+
+        drawing = Drawing(size, size)
+        drawing.add(path)
+        drawing.hAlign = h_align
+        return drawing
+
+    @staticmethod
+    def _compute_report_signature(content_hash: str, metadata: Dict) -> str:
         """Compute digital signature for report."""
         message = f"{metadata['report_id']}:{content_hash}:{metadata['generated_at']}"
         signature = hmac.new(
@@ -208,6 +386,121 @@ class PDFReportService:
         ).hexdigest()
         return signature
 
+    @staticmethod
+    def _render_pdf(story: List) -> tuple:
+        """Build `story` into an in-memory A4 PDF. Returns (bytes, page count)."""
+        buffer = io.BytesIO()
+        doc = SimpleDocTemplate(
+            buffer,
+            pagesize=A4,
+            rightMargin=2*cm,
+            leftMargin=2*cm,
+            topMargin=2*cm,
+            bottomMargin=2*cm
+        )
+        doc.build(story)
+        return buffer.getvalue(), doc.page
+
+    @staticmethod
+    def _claim_story(claim_data: Dict, report_id: str, generated_at: datetime) -> List:
+        """Flowables of one claim report."""
+        styles = PDFReportService._get_arabic_styles()
+        story = []
+
+        # Header with logo placeholder
+        story.append(Paragraph("UN-Habitat", styles['title']))
+        story.append(Paragraph(shape_arabic("نظام تسجيل حقوق الحيازة وإدارة المطالبات"), styles['title']))
+        story.append(Spacer(1, 0.5*cm))
+        story.append(Paragraph(shape_arabic("تقرير مطالبة"), styles['heading']))
+        story.append(Spacer(1, 0.5*cm))
+
+        # QR Code with claim reference
+        qr_data = json.dumps({
+            "report_id": report_id,
+            "claim_id": claim_data['claim_uuid'],
+            "case_number": claim_data['case_number'],
+            "generated_at": generated_at.isoformat()
+        })
+        qr_code = PDFReportService._qr_flowable(qr_data, 'LEFT')
+        if qr_code:
+            story.append(qr_code)
+            story.append(Spacer(1, 0.3*cm))
+
+        # Claim details section
+        story.append(Paragraph(shape_arabic("معلومات المطالبة"), styles['subheading']))
+
+        claim_table_data = [
+            [_ar("القيمة"), _ar("الحقل")],
+            [_ar(claim_data['case_number']), _ar("رقم المطالبة")],
+            [_ar(claim_data['case_status']), _ar("الحالة")],
+            [_ar(claim_data['source']), _ar("المصدر")],
+            [_ar(claim_data.get('created_at')), _ar("تاريخ الإنشاء")],
+        ]
+
+        claim_table = Table(claim_table_data, colWidths=[10*cm, 5*cm])
+        claim_table.setStyle(PDFReportService._table_style('RIGHT', 10, 8))
+        story.append(claim_table)
+        story.append(Spacer(1, 0.5*cm))
+
+        # Property details
+        if claim_data.get('building'):
+            story.append(Paragraph(shape_arabic("معلومات العقار"), styles['subheading']))
+
+            building = claim_data['building']
+            property_table_data = [
+                [_ar("القيمة"), _ar("الحقل")],
+                [_ar(building.get('building_id')), _ar("رقم المبنى")],
+                [_ar(building.get('neighborhood_code')), _ar("رمز الحي")],
+                [_ar(building.get('building_type')), _ar("نوع المبنى")],
+                [_ar(claim_data.get('unit_id')), _ar("رقم الوحدة")],
+            ]
+
+            property_table = Table(property_table_data, colWidths=[10*cm, 5*cm])
+            property_table.setStyle(PDFReportService._table_style('RIGHT', 10, 8))
+            story.append(property_table)
+            story.append(Spacer(1, 0.5*cm))
+
+        # Claimants
+        if claim_data.get('claimants'):
+            story.append(Paragraph(shape_arabic("المطالبون"), styles['subheading']))
+
+            claimants_table_data = [[_ar("نوع العلاقة"), _ar("اسم الأب"), _ar("اسم العائلة"), _ar("الاسم الأول")]]
+            for claimant in claim_data['claimants']:
+                claimants_table_data.append([
+                    _ar(claimant.get('relation_type')),
+                    _ar(claimant.get('father_name')),
+                    _ar(claimant.get('last_name')),
+                    _ar(claimant.get('first_name'))
+                ])
+
+            claimants_table = Table(claimants_table_data, colWidths=[3.5*cm, 4*cm, 4*cm, 4*cm])
+            claimants_table.setStyle(PDFReportService._table_style('CENTER', 9, 6))
+            story.append(claimants_table)
+            story.append(Spacer(1, 0.5*cm))
+
+        # Documents
+        if claim_data.get('documents'):
+            story.append(Paragraph(shape_arabic("المستندات المرفقة"), styles['subheading']))
+
+            docs_table_data = [[_ar("تاريخ الإصدار"), _ar("رقم المستند"), _ar("نوع المستند")]]
+            for doc in claim_data['documents']:
+                docs_table_data.append([
+                    _ar(doc.get('issue_date')),
+                    _ar(doc.get('document_number')),
+                    _ar(doc.get('document_type'))
+                ])
+
+            docs_table = Table(docs_table_data, colWidths=[4*cm, 5*cm, 6*cm])
+            docs_table.setStyle(PDFReportService._table_style('CENTER', 9, 6))
+            story.append(docs_table)
+
+        # Footer with signature info
+        story.append(Spacer(1, 1*cm))
+        story.append(Paragraph(
+            shape_arabic(f"تم التوليد بتاريخ: {generated_at.strftime('%Y-%m-%d %H:%M')}"), styles['footer']))
+        story.append(Paragraph(shape_arabic(f"معرف التقرير: {report_id}"), styles['footer']))
+        return story
+
     def generate_claim_report(
         self,
         claim_id: str,
@@ -231,166 +524,19 @@ class PDFReportService:
 
             # Generate report
             report_id = str(uuid.uuid4())
-            filename = f"claim_report_{claim_data['case_number']}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
+            generated_at = datetime.now()
+            filename = f"claim_report_{claim_data['case_number']}_{generated_at.strftime('%Y%m%d_%H%M%S')}.pdf"
             file_path = self.output_dir / filename
 
-            # Create PDF
-            doc = SimpleDocTemplate(
-                str(file_path),
-                pagesize=A4,
-                rightMargin=2*cm,
-                leftMargin=2*cm,
-                topMargin=2*cm,
-                bottomMargin=2*cm
-            )
-
-            styles = self._get_arabic_styles()
-            story = []
-
-            # Header with logo placeholder
-            story.append(Paragraph("UN-Habitat", styles['title']))
-            story.append(Paragraph("نظام تسجيل حقوق الحيازة وإدارة المطالبات", styles['title']))
-            story.append(Spacer(1, 0.5*cm))
-            story.append(Paragraph("تقرير مطالبة", styles['heading']))
-            story.append(Spacer(1, 0.5*cm))
-
-            # QR Code with claim reference
-            qr_data = json.dumps({
-                "report_id": report_id,
-                "claim_id": claim_id,
-                "case_number": claim_data['case_number'],
-                "generated_at": datetime.now().isoformat()
-            })
-            qr_buffer = self._generate_qr_code(qr_data)
-            if qr_buffer:
-                qr_image = Image(qr_buffer, width=3*cm, height=3*cm)
-                qr_image.hAlign = 'LEFT'
-                story.append(qr_image)
-                story.append(Spacer(1, 0.3*cm))
-
-            # Claim details section
-            story.append(Paragraph("معلومات المطالبة", styles['subheading']))
-
-            claim_table_data = [
-                ["القيمة", "الحقل"],
-                [claim_data['case_number'], "رقم المطالبة"],
-                [claim_data['case_status'], "الحالة"],
-                [claim_data['source'], "المصدر"],
-                [claim_data.get('created_at', '-'), "تاريخ الإنشاء"],
-            ]
-
-            claim_table = Table(claim_table_data, colWidths=[10*cm, 5*cm])
-            claim_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1a5276')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-                ('ALIGN', (0, 0), (-1, -1), 'RIGHT'),
-                ('FONTNAME', (0, 0), (-1, -1), 'Arabic' if self.FONT_REGISTERED else 'Helvetica'),
-                ('FONTSIZE', (0, 0), (-1, -1), 10),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-                ('TOPPADDING', (0, 0), (-1, -1), 8),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f8f9fa')])
-            ]))
-            story.append(claim_table)
-            story.append(Spacer(1, 0.5*cm))
-
-            # Property details
-            if claim_data.get('building'):
-                story.append(Paragraph("معلومات العقار", styles['subheading']))
-
-                building = claim_data['building']
-                property_table_data = [
-                    ["القيمة", "الحقل"],
-                    [building.get('building_id', '-'), "رقم المبنى"],
-                    [building.get('neighborhood_code', '-'), "رمز الحي"],
-                    [building.get('building_type', '-'), "نوع المبنى"],
-                    [claim_data.get('unit_id', '-'), "رقم الوحدة"],
-                ]
-
-                property_table = Table(property_table_data, colWidths=[10*cm, 5*cm])
-                property_table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1a5276')),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-                    ('ALIGN', (0, 0), (-1, -1), 'RIGHT'),
-                    ('FONTNAME', (0, 0), (-1, -1), 'Arabic' if self.FONT_REGISTERED else 'Helvetica'),
-                    ('FONTSIZE', (0, 0), (-1, -1), 10),
-                    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-                    ('TOPPADDING', (0, 0), (-1, -1), 8),
-                    ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f8f9fa')])
-                ]))
-                story.append(property_table)
-                story.append(Spacer(1, 0.5*cm))
-
-            # Claimants
-            if claim_data.get('claimants'):
-                story.append(Paragraph("المطالبون", styles['subheading']))
-
-                claimants_table_data = [["نوع العلاقة", "اسم الأب", "اسم العائلة", "الاسم الأول"]]
-                for claimant in claim_data['claimants']:
-                    claimants_table_data.append([
-                        claimant.get('relation_type', '-'),
-                        claimant.get('father_name', '-'),
-                        claimant.get('last_name', '-'),
-                        claimant.get('first_name', '-')
-                    ])
-
-                claimants_table = Table(claimants_table_data, colWidths=[3.5*cm, 4*cm, 4*cm, 4*cm])
-                claimants_table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1a5276')),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                    ('FONTNAME', (0, 0), (-1, -1), 'Arabic' if self.FONT_REGISTERED else 'Helvetica'),
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),
-                    ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-                    ('TOPPADDING', (0, 0), (-1, -1), 6),
-                    ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f8f9fa')])
-                ]))
-                story.append(claimants_table)
-                story.append(Spacer(1, 0.5*cm))
-
-            # Documents
-            if claim_data.get('documents'):
-                story.append(Paragraph("المستندات المرفقة", styles['subheading']))
-
-                docs_table_data = [["تاريخ الإصدار", "رقم المستند", "نوع المستند"]]
-                for doc in claim_data['documents']:
-                    docs_table_data.append([
-                        doc.get('issue_date', '-'),
-                        doc.get('document_number', '-'),
-                        doc.get('document_type', '-')
-                    ])
-
-                docs_table = Table(docs_table_data, colWidths=[4*cm, 5*cm, 6*cm])
-                docs_table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1a5276')),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                    ('FONTNAME', (0, 0), (-1, -1), 'Arabic' if self.FONT_REGISTERED else 'Helvetica'),
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),
-                    ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-                    ('TOPPADDING', (0, 0), (-1, -1), 6),
-                    ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f8f9fa')])
-                ]))
-                story.append(docs_table)
-
-            # Footer with signature info
-            story.append(Spacer(1, 1*cm))
-            story.append(Paragraph(f"تم التوليد بتاريخ: {datetime.now().strftime('%Y-%m-%d %H:%M')}", styles['footer']))
-            story.append(Paragraph(f"معرف التقرير: {report_id}", styles['footer']))
-
-            # Build PDF
-            doc.build(story)
+            content, _ = self._render_pdf(self._claim_story(claim_data, report_id, generated_at))
+            file_path.write_bytes(content)
 
             # Compute checksum and signature
-            with open(file_path, 'rb') as f:
-                content_hash = hashlib.sha256(f.read()).hexdigest()
+            content_hash = hashlib.sha256(content).hexdigest()
 
             metadata = {
                 'report_id': report_id,
-                'generated_at': datetime.now().isoformat()
+                'generated_at': generated_at.isoformat()
             }
             signature = self._compute_report_signature(content_hash, metadata)
 
@@ -411,6 +557,144 @@ class PDFReportService:
             logger.error(f"Failed to generate claim report: {e}", exc_info=True)
             return None
 
+    def generate_claim_reports(
+        self,
+        neighborhood_code: str = None,
+        claim_ids: Sequence[str] = None,
+        output: str = None,
+        merged: bool = False,
+        workers: Optional[int] = None,
+        chunk_size: int = 25,
+        generated_by: str = None,
+        progress: Callable[[int, int, int, float], None] = None,
+    ) -> ClaimReportBatch:
+        """
+        Generate claim reports for a neighbourhood (or given claims / all claims).
+
+        Claims are read in chunks of `chunk_size` and rendered in a process
+        pool (`workers` defaults to the CPU count; 1 renders in-process).
+        Output is one PDF per claim in the directory `output`, or with
+        `merged` a single PDF at `output` (the pool needs pypdf to join the
+        parts; without it the merged document is rendered in-process).
+        `progress(done, total, pages, seconds)` is called after each chunk.
+        Call from a worker thread, not the UI thread.
+        """
+        started = time.perf_counter()
+        batch = ClaimReportBatch()
+        if not REPORTLAB_AVAILABLE:
+            logger.error("ReportLab not available")
+            return batch
+
+        generated_at = datetime.now()
+        stamp = generated_at.strftime('%Y%m%d_%H%M%S')
+        if merged:
+            batch.merged_path = Path(output) if output else self.output_dir / f"claim_reports_{stamp}.pdf"
+            batch.merged_path.parent.mkdir(parents=True, exist_ok=True)
+            output_dir = None
+        else:
+            target = Path(output) if output else self.output_dir / f"claim_reports_{stamp}"
+            target.mkdir(parents=True, exist_ok=True)
+            output_dir = str(target)
+
+        batch.total = self._count_claims(neighborhood_code, claim_ids)
+        chunks = self._iter_claim_chunks(neighborhood_code, claim_ids, chunk_size)
+        workers = workers or os.cpu_count() or 1
+        if merged and not PYPDF_AVAILABLE and workers > 1:
+            logger.info("pypdf not installed, rendering the merged claim report in-process")
+            workers = 1
+        batch.workers = max(1, min(workers, -(-batch.total // chunk_size)))
+
+        parts: Dict[int, bytes] = {}
+        log_rows: List[tuple] = []
+        done = 0
+
+        def collect(index: int, result: Dict[str, Any]):
+            nonlocal done
+            done += result["claims"]
+            if output_dir is None:
+                parts[index] = result["part"]
+                batch.generated += result["claims"]
+                batch.pages += result["pages"]
+            else:
+                for report in result["reports"]:
+                    batch.files.append(Path(report["file_path"]))
+                    batch.pages += report["pages"]
+                    log_rows.append((report["report_id"], "claim_report", report["file_path"],
+                                     report["checksum"], report["signature"]))
+                batch.generated += len(result["reports"])
+                batch.failed += len(result["errors"])
+                batch.errors.update(result["errors"])
+            if progress:
+                progress(done, batch.total, batch.pages, time.perf_counter() - started)
+
+        if batch.workers <= 1:
+            _init_report_worker()
+            if output_dir is None:
+                # One document, no merge step needed
+                story = []
+                for chunk in chunks:
+                    for claim_data in chunk:
+                        if story:
+                            story.append(PageBreak())
+                        story.extend(self._claim_story(claim_data, str(uuid.uuid4()), generated_at))
+                    done += len(chunk)
+                    if progress:
+                        progress(done, batch.total, batch.pages, time.perf_counter() - started)
+                if story:
+                    content, batch.pages = self._render_pdf(story)
+                    parts[0] = content
+                    batch.generated = done
+            else:
+                for index, chunk in enumerate(chunks):
+                    collect(index, _render_claim_chunk(chunk, output_dir, stamp))
+        else:
+            with ProcessPoolExecutor(max_workers=batch.workers, initializer=_init_report_worker) as pool:
+                # Bounded in flight so streamed claims are not all buffered at once
+                pending = {}
+                for index, chunk in enumerate(chunks):
+                    pending[pool.submit(_render_claim_chunk, chunk, output_dir, stamp)] = index
+                    if len(pending) >= batch.workers * 2:
+                        finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in finished:
+                            collect(pending.pop(future), future.result())
+                for future in list(pending):
+                    collect(pending.pop(future), future.result())
+
+        if output_dir is None and parts:
+            self._write_merged(batch.merged_path, [parts[i] for i in sorted(parts)])
+            content_hash = hashlib.sha256(batch.merged_path.read_bytes()).hexdigest()
+            report_id = str(uuid.uuid4())
+            log_rows.append((report_id, "claim_reports_merged", str(batch.merged_path), content_hash,
+                             self._compute_report_signature(content_hash, {
+                                 'report_id': report_id,
+                                 'generated_at': generated_at.isoformat()
+                             })))
+        elif output_dir is None:
+            batch.merged_path = None
+        self._log_report_generations(log_rows, generated_by)
+
+        batch.duration_seconds = time.perf_counter() - started
+        logger.info(
+            f"Claim reports: {batch.generated}/{batch.total} claims, {batch.pages} pages, "
+            f"{batch.failed} failed in {batch.duration_seconds:.2f}s "
+            f"({batch.pages_per_second:.1f} pages/s, {batch.workers} workers)"
+        )
+        return batch
+
+    @staticmethod
+    def _write_merged(path: Path, parts: List[bytes]):
+        """Write the rendered parts as one PDF (atomically)."""
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        if len(parts) == 1:
+            tmp.write_bytes(parts[0])
+        else:
+            writer = PdfWriter()
+            for part in parts:
+                writer.append(io.BytesIO(part))
+            with open(tmp, 'wb') as f:
+                writer.write(f)
+        os.replace(tmp, path)
+
     def generate_daily_summary_report(
         self,
         date: datetime = None,
@@ -443,8 +727,8 @@ class PDFReportService:
 
             # Header
             story.append(Paragraph("UN-Habitat", styles['title']))
-            story.append(Paragraph("تقرير ملخص يومي", styles['title']))
-            story.append(Paragraph(f"التاريخ: {date.strftime('%Y-%m-%d')}", styles['heading']))
+            story.append(Paragraph(shape_arabic("تقرير ملخص يومي"), styles['title']))
+            story.append(Paragraph(shape_arabic(f"التاريخ: {date.strftime('%Y-%m-%d')}"), styles['heading']))
             story.append(Spacer(1, 1*cm))
 
             # QR Code
@@ -453,62 +737,44 @@ class PDFReportService:
                 "type": "daily_summary",
                 "date": date.strftime('%Y-%m-%d')
             })
-            qr_buffer = self._generate_qr_code(qr_data)
-            if qr_buffer:
-                story.append(Image(qr_buffer, width=3*cm, height=3*cm))
+            qr_code = self._qr_flowable(qr_data)
+            if qr_code:
+                story.append(qr_code)
                 story.append(Spacer(1, 0.5*cm))
 
             # Summary statistics
-            story.append(Paragraph("إحصائيات اليوم", styles['subheading']))
+            story.append(Paragraph(shape_arabic("إحصائيات اليوم"), styles['subheading']))
 
             stats_table_data = [
-                ["القيمة", "المؤشر"],
-                [str(summary.get('new_claims', 0)), "المطالبات الجديدة"],
-                [str(summary.get('updated_claims', 0)), "المطالبات المحدثة"],
-                [str(summary.get('new_buildings', 0)), "المباني المضافة"],
-                [str(summary.get('new_persons', 0)), "الأشخاص المسجلون"],
-                [str(summary.get('documents_uploaded', 0)), "المستندات المرفوعة"],
+                [_ar("القيمة"), _ar("المؤشر")],
+                [_ar(summary.get('new_claims', 0)), _ar("المطالبات الجديدة")],
+                [_ar(summary.get('updated_claims', 0)), _ar("المطالبات المحدثة")],
+                [_ar(summary.get('new_buildings', 0)), _ar("المباني المضافة")],
+                [_ar(summary.get('new_persons', 0)), _ar("الأشخاص المسجلون")],
+                [_ar(summary.get('documents_uploaded', 0)), _ar("المستندات المرفوعة")],
             ]
 
             stats_table = Table(stats_table_data, colWidths=[8*cm, 7*cm])
-            stats_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1a5276')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, -1), 'Arabic' if self.FONT_REGISTERED else 'Helvetica'),
-                ('FONTSIZE', (0, 0), (-1, -1), 11),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-                ('TOPPADDING', (0, 0), (-1, -1), 10),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ]))
+            stats_table.setStyle(self._table_style('CENTER', 11, 10, striped=False))
             story.append(stats_table)
             story.append(Spacer(1, 1*cm))
 
             # Claims by status
             if summary.get('claims_by_status'):
-                story.append(Paragraph("المطالبات حسب الحالة", styles['subheading']))
+                story.append(Paragraph(shape_arabic("المطالبات حسب الحالة"), styles['subheading']))
 
-                status_table_data = [["العدد", "الحالة"]]
+                status_table_data = [[_ar("العدد"), _ar("الحالة")]]
                 for status, count in summary['claims_by_status'].items():
-                    status_table_data.append([str(count), status])
+                    status_table_data.append([_ar(count), _ar(status)])
 
                 status_table = Table(status_table_data, colWidths=[6*cm, 9*cm])
-                status_table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1a5276')),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                    ('FONTNAME', (0, 0), (-1, -1), 'Arabic' if self.FONT_REGISTERED else 'Helvetica'),
-                    ('FONTSIZE', (0, 0), (-1, -1), 10),
-                    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-                    ('TOPPADDING', (0, 0), (-1, -1), 8),
-                    ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                ]))
+                status_table.setStyle(self._table_style('CENTER', 10, 8, striped=False))
                 story.append(status_table)
 
             # Footer
             story.append(Spacer(1, 1*cm))
-            story.append(Paragraph(f"تم التوليد: {datetime.now().strftime('%Y-%m-%d %H:%M')}", styles['footer']))
-            story.append(Paragraph(f"معرف التقرير: {report_id}", styles['footer']))
+            story.append(Paragraph(shape_arabic(f"تم التوليد: {datetime.now().strftime('%Y-%m-%d %H:%M')}"), styles['footer']))
+            story.append(Paragraph(shape_arabic(f"معرف التقرير: {report_id}"), styles['footer']))
 
             doc.build(story)
 
@@ -565,9 +831,9 @@ class PDFReportService:
 
             # Header
             story.append(Paragraph("UN-Habitat", styles['title']))
-            story.append(Paragraph("تقرير حالة العقارات", styles['title']))
+            story.append(Paragraph(shape_arabic("تقرير حالة العقارات"), styles['title']))
             if neighborhood_code:
-                story.append(Paragraph(f"الحي: {neighborhood_code}", styles['heading']))
+                story.append(Paragraph(shape_arabic(f"الحي: {neighborhood_code}"), styles['heading']))
             story.append(Spacer(1, 0.5*cm))
 
             # QR Code
@@ -576,42 +842,32 @@ class PDFReportService:
                 "type": "property_status",
                 "neighborhood": neighborhood_code
             })
-            qr_buffer = self._generate_qr_code(qr_data)
-            if qr_buffer:
-                story.append(Image(qr_buffer, width=3*cm, height=3*cm))
+            qr_code = self._qr_flowable(qr_data)
+            if qr_code:
+                story.append(qr_code)
                 story.append(Spacer(1, 0.5*cm))
 
             # Properties table
-            story.append(Paragraph("قائمة العقارات", styles['subheading']))
+            story.append(Paragraph(shape_arabic("قائمة العقارات"), styles['subheading']))
 
-            property_table_data = [["الحالة", "عدد الوحدات", "نوع المبنى", "رقم المبنى"]]
+            property_table_data = [[_ar("الحالة"), _ar("عدد الوحدات"), _ar("نوع المبنى"), _ar("رقم المبنى")]]
             for prop in properties[:50]:  # Limit to 50 for readability
                 property_table_data.append([
-                    prop.get('building_status', '-'),
-                    str(prop.get('number_of_units', 0)),
-                    prop.get('building_type', '-'),
-                    prop.get('building_id', '-')
+                    _ar(prop.get('building_status')),
+                    _ar(prop.get('number_of_units', 0)),
+                    _ar(prop.get('building_type')),
+                    _ar(prop.get('building_id'))
                 ])
 
             property_table = Table(property_table_data, colWidths=[3*cm, 3*cm, 4*cm, 5*cm])
-            property_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1a5276')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, -1), 'Arabic' if self.FONT_REGISTERED else 'Helvetica'),
-                ('FONTSIZE', (0, 0), (-1, -1), 9),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-                ('TOPPADDING', (0, 0), (-1, -1), 6),
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
-                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f8f9fa')])
-            ]))
+            property_table.setStyle(self._table_style('CENTER', 9, 6, grid=0.5))
             story.append(property_table)
 
             # Footer
             story.append(Spacer(1, 1*cm))
-            story.append(Paragraph(f"إجمالي العقارات: {len(properties)}", styles['body']))
-            story.append(Paragraph(f"تم التوليد: {datetime.now().strftime('%Y-%m-%d %H:%M')}", styles['footer']))
-            story.append(Paragraph(f"معرف التقرير: {report_id}", styles['footer']))
+            story.append(Paragraph(shape_arabic(f"إجمالي العقارات: {len(properties)}"), styles['body']))
+            story.append(Paragraph(shape_arabic(f"تم التوليد: {datetime.now().strftime('%Y-%m-%d %H:%M')}"), styles['footer']))
+            story.append(Paragraph(shape_arabic(f"معرف التقرير: {report_id}"), styles['footer']))
 
             doc.build(story)
 
@@ -637,90 +893,152 @@ class PDFReportService:
             logger.error(f"Failed to generate property status report: {e}", exc_info=True)
             return None
 
+    _CLAIM_SELECT = """
+        SELECT c.claim_uuid, c.case_number, c.case_status, c.source,
+               c.created_at, c.updated_at, c.unit_uuid,
+               u.unit_id, u.unit_type,
+               b.building_uuid, b.building_id, b.neighborhood_code,
+               b.building_type, b.building_status
+        FROM claims c
+        LEFT JOIN units u ON c.unit_uuid = u.unit_uuid
+        LEFT JOIN buildings b ON u.building_uuid = b.building_uuid
+    """
+
+    @staticmethod
+    def _claim_from_row(row) -> Dict:
+        return {
+            'claim_uuid': row[0],
+            'case_number': row[1],
+            'case_status': row[2],
+            'source': row[3],
+            'created_at': row[4],
+            'updated_at': row[5],
+            'unit_uuid': row[6],
+            'unit_id': row[7],
+            'unit_type': row[8],
+            'building': {
+                'building_uuid': row[9],
+                'building_id': row[10],
+                'neighborhood_code': row[11],
+                'building_type': row[12],
+                'building_status': row[13]
+            } if row[9] else None
+        }
+
+    def _attach_claim_details(self, claims: List[Dict]):
+        """Fill claimants and documents of several claims with one query each."""
+        by_uuid = {}
+        for claim_data in claims:
+            claim_data['claimants'] = []
+            claim_data['documents'] = []
+            by_uuid[claim_data['claim_uuid']] = claim_data
+        if not by_uuid:
+            return
+        placeholders = ",".join("?" * len(by_uuid))
+        cursor = self.db.cursor()
+
+        # Claimants
+        cursor.execute(f"""
+            SELECT cp.claim_uuid, p.first_name, p.father_name, p.last_name, r.relation_type
+            FROM claim_persons cp
+            JOIN persons p ON cp.person_uuid = p.person_uuid
+            LEFT JOIN person_unit_relations r ON p.person_uuid = r.person_uuid
+            WHERE cp.claim_uuid IN ({placeholders})
+        """, list(by_uuid))
+        for row in cursor.fetchall():
+            by_uuid[row[0]]['claimants'].append({
+                'first_name': row[1],
+                'father_name': row[2],
+                'last_name': row[3],
+                'relation_type': row[4]
+            })
+
+        # Documents
+        cursor.execute(f"""
+            SELECT cd.claim_uuid, d.document_type, d.document_number, d.issue_date, d.verified
+            FROM claim_documents cd
+            JOIN documents d ON cd.document_uuid = d.document_uuid
+            WHERE cd.claim_uuid IN ({placeholders})
+        """, list(by_uuid))
+        for row in cursor.fetchall():
+            by_uuid[row[0]]['documents'].append({
+                'document_type': row[1],
+                'document_number': row[2],
+                'issue_date': row[3],
+                'verified': bool(row[4])
+            })
+
     def _fetch_claim_data(self, claim_id: str) -> Optional[Dict]:
         """Fetch claim data for report."""
         try:
             cursor = self.db.cursor()
-
-            # Claim details
-            cursor.execute("""
-                SELECT c.claim_uuid, c.case_number, c.case_status, c.source,
-                       c.created_at, c.updated_at, c.unit_uuid,
-                       u.unit_id, u.unit_type,
-                       b.building_uuid, b.building_id, b.neighborhood_code,
-                       b.building_type, b.building_status
-                FROM claims c
-                LEFT JOIN units u ON c.unit_uuid = u.unit_uuid
-                LEFT JOIN buildings b ON u.building_uuid = b.building_uuid
-                WHERE c.claim_uuid = ? OR c.case_number = ?
-            """, (claim_id, claim_id))
+            cursor.execute(self._CLAIM_SELECT + " WHERE c.claim_uuid = ? OR c.case_number = ?",
+                           (claim_id, claim_id))
 
             row = cursor.fetchone()
             if not row:
                 return None
 
-            claim_data = {
-                'claim_uuid': row[0],
-                'case_number': row[1],
-                'case_status': row[2],
-                'source': row[3],
-                'created_at': row[4],
-                'updated_at': row[5],
-                'unit_uuid': row[6],
-                'unit_id': row[7],
-                'unit_type': row[8],
-                'building': {
-                    'building_uuid': row[9],
-                    'building_id': row[10],
-                    'neighborhood_code': row[11],
-                    'building_type': row[12],
-                    'building_status': row[13]
-                } if row[9] else None
-            }
-
-            # Claimants
-            cursor.execute("""
-                SELECT p.first_name, p.father_name, p.last_name, r.relation_type
-                FROM claim_persons cp
-                JOIN persons p ON cp.person_uuid = p.person_uuid
-                LEFT JOIN person_unit_relations r ON p.person_uuid = r.person_uuid
-                WHERE cp.claim_uuid = ?
-            """, (claim_data['claim_uuid'],))
-
-            claim_data['claimants'] = [
-                {
-                    'first_name': row[0],
-                    'father_name': row[1],
-                    'last_name': row[2],
-                    'relation_type': row[3]
-                }
-                for row in cursor.fetchall()
-            ]
-
-            # Documents
-            cursor.execute("""
-                SELECT d.document_type, d.document_number, d.issue_date, d.verified
-                FROM claim_documents cd
-                JOIN documents d ON cd.document_uuid = d.document_uuid
-                WHERE cd.claim_uuid = ?
-            """, (claim_data['claim_uuid'],))
-
-            claim_data['documents'] = [
-                {
-                    'document_type': row[0],
-                    'document_number': row[1],
-                    'issue_date': row[2],
-                    'verified': bool(row[3])
-                }
-                for row in cursor.fetchall()
-            ]
-
+            claim_data = self._claim_from_row(row)
+            self._attach_claim_details([claim_data])
             return claim_data
 
         except Exception as e:
             logger.error(f"Error fetching claim data: {e}")
             return None
 
+    @staticmethod
+    def _claim_filter(neighborhood_code: str = None, claim_ids: Sequence[str] = None) -> tuple:
+        """WHERE clause and parameters selecting the claims of a batch."""
+        if claim_ids:
+            placeholders = ",".join("?" * len(claim_ids))
+            return (f" WHERE c.claim_uuid IN ({placeholders}) OR c.case_number IN ({placeholders})",
+                    list(claim_ids) * 2)
+        if neighborhood_code:
+            return " WHERE b.neighborhood_code = ?", [neighborhood_code]
+        return "", []
+
+    def _count_claims(self, neighborhood_code: str = None, claim_ids: Sequence[str] = None) -> int:
+        where, params = self._claim_filter(neighborhood_code, claim_ids)
+        try:
+            cursor = self.db.cursor()
+            cursor.execute("""
+                SELECT COUNT(*) FROM claims c
+                LEFT JOIN units u ON c.unit_uuid = u.unit_uuid
+                LEFT JOIN buildings b ON u.building_uuid = b.building_uuid
+            """ + where, params)
+            return cursor.fetchone()[0]
+        except Exception as e:
+            logger.error(f"Error counting claims: {e}")
+            return 0
+
+    def _iter_claim_chunks(
+        self,
+        neighborhood_code: str = None,
+        claim_ids: Sequence[str] = None,
+        chunk_size: int = 25
+    ) -> Iterator[List[Dict]]:
+        """Stream claim data in chunks (fetchmany; details batched per chunk)."""
+        if claim_ids:
+            # Queried piecewise to stay under the parameter limit
+            claim_ids = list(claim_ids)
+            for start in range(0, len(claim_ids), chunk_size):
+                yield from self._read_claim_chunks(
+                    *self._claim_filter(claim_ids=claim_ids[start:start + chunk_size]), chunk_size)
+            return
+        yield from self._read_claim_chunks(*self._claim_filter(neighborhood_code), chunk_size)
+
+    def _read_claim_chunks(self, where: str, params: list, chunk_size: int) -> Iterator[List[Dict]]:
+        cursor = self.db.cursor()
+        cursor.execute(self._CLAIM_SELECT + where + " ORDER BY c.case_number", params)
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                return
+            claims = [self._claim_from_row(row) for row in rows]
+            self._attach_claim_details(claims)
+            yield claims
+
     def _fetch_daily_summary(self, date: datetime) -> Dict:
         """Fetch daily summary data."""
         try:
@@ -837,6 +1155,23 @@ class PDFReportService:
         except Exception as e:
             logger.warning(f"Could not log report generation: {e}")
 
+    def _log_report_generations(self, rows: List[tuple], generated_by: str):
+        """Log many generated reports (report_id, type, path, checksum, signature) in one commit."""
+        if not rows:
+            return
+        try:
+            generated_at = datetime.now().isoformat()
+            cursor = self.db.cursor()
+            cursor.executemany("""
+                INSERT INTO report_log (
+                    report_id, report_type, file_path, checksum,
+                    signature, generated_at, generated_by
+                ) VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, [row + (generated_at, generated_by) for row in rows])
+            self.db.commit()
+        except Exception as e:
+            logger.warning(f"Could not log report generation: {e}")
+
     def verify_report(self, file_path: Path) -> tuple:
         """
         Verify report integrity and signature.
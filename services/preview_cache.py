@@ -0,0 +1,315 @@
+# -*- coding: utf-8 -*-
+"""
+Thumbnail / preview cache for evidence documents.
+
+Document cards used to decode the full-resolution scan (or download it)
+just to draw a 60 px thumbnail, every time a case was opened. Previews are
+now rendered once and kept on disk:
+
+  * one render produces every size in PREVIEW_SIZES from a single decode:
+    JPEGs are decoded at reduced scale (PIL draft mode), PDFs have their
+    first page rendered at the largest preview size (PyMuPDF, optional);
+  * renders run in a process pool (Config.PREVIEW_WORKERS; 0 = in the
+    calling thread) so they do not hold the GIL of the UI process, and
+    concurrent requests for the same content share one render;
+  * files are keyed by the SHA-256 of the content (so the same scan filed
+    under several evidences is rendered once) and stored as
+    DATA_DIR/previews/<hash[:2]>/<hash>_<size>.jpg;
+  * an alias (evidence id) -> content hash map lets a case that was viewed
+    before show its previews without downloading the files again;
+  * the cache is bounded by Config.PREVIEW_CACHE_MB; least recently used
+    previews (by mtime, refreshed on every hit) are evicted first.
+
+The Qt side (placeholder, then the small preview, then the requested size)
+lives in ui/components/evidence_viewer.load_evidence_preview().
+
+Usage:
+    cache = get_preview_cache()
+    path = cache.lookup_alias(evidence_id, PREVIEW_SMALL)      # no I/O beyond a stat
+    path = cache.get_or_render(local_file, PREVIEW_SMALL, alias=evidence_id)
+"""
+
+import hashlib
+import os
+import threading
+import uuid
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from app.config import Config
+from services.document_chunk_store import IntegrityCache
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+try:
+    from PIL import Image, ImageOps
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+try:
+    import fitz  # PyMuPDF
+    FITZ_AVAILABLE = True
+except ImportError:
+    FITZ_AVAILABLE = False
+
+# Card thumbnails and the larger hover / dialog preview (pixels, longest side)
+PREVIEW_SMALL = 128
+PREVIEW_LARGE = 512
+PREVIEW_SIZES = (PREVIEW_SMALL, PREVIEW_LARGE)
+
+IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".bmp", ".gif", ".tif", ".tiff", ".webp"}
+_JPEG_QUALITY = 85
+
+
+def can_preview(file_name: str) -> bool:
+    """Whether a preview can be rendered for this file type."""
+    ext = Path(file_name or "").suffix.lower()
+    if ext in IMAGE_EXTENSIONS:
+        return PIL_AVAILABLE
+    return ext == ".pdf" and PIL_AVAILABLE and FITZ_AVAILABLE
+
+
+# ---------------------------------------------------------------------------
+# Worker side (runs in the process pool)
+# ---------------------------------------------------------------------------
+
+def _open_source(source: str, largest: int):
+    """First page / frame of `source` as an RGB PIL image, decoded no larger than needed."""
+    if Path(source).suffix.lower() == ".pdf":
+        with fitz.open(source) as pdf:
+            page = pdf[0]
+            zoom = largest / max(page.rect.width, page.rect.height, 1)
+            pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False)
+            return Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
+
+    image = Image.open(source)
+    # JPEG: decode directly at 1/2 .. 1/8 scale
+    image.draft("RGB", (largest, largest))
+    image = ImageOps.exif_transpose(image)
+    if image.mode != "RGB":
+        image = image.convert("RGB")
+    return image
+
+
+def _render_previews(source: str, targets: List[Tuple[int, str]]) -> List[Tuple[int, str]]:
+    """Render `source` once into each (size, path) target, largest first; returns those written."""
+    targets = sorted(targets, reverse=True)
+    image = _open_source(source, targets[0][0])
+    written = []
+    for size, path in targets:
+        image.thumbnail((size, size), Image.BILINEAR, reducing_gap=2.0)
+        tmp = f"{path}.{uuid.uuid4().hex[:8]}.tmp"
+        image.save(tmp, "JPEG", quality=_JPEG_QUALITY)
+        os.replace(tmp, path)
+        written.append((size, path))
+    return written
+
+
+# ---------------------------------------------------------------------------
+# Cache
+# ---------------------------------------------------------------------------
+
+class PreviewCache:
+    """Size-bounded disk cache of rendered previews, keyed by content hash."""
+
+    def __init__(self, root: Optional[Path] = None, max_bytes: Optional[int] = None,
+                 workers: Optional[int] = None):
+        self.root = Path(root or Config.DATA_DIR / "previews")
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._aliases = self.root / "aliases"
+        self._aliases.mkdir(exist_ok=True)
+        self.max_bytes = max_bytes if max_bytes is not None else Config.PREVIEW_CACHE_MB * 1024 * 1024
+        self.workers = Config.PREVIEW_WORKERS if workers is None else workers
+        self._hashes = IntegrityCache()
+        self._lock = threading.Lock()
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._inflight: Dict[str, Future] = {}
+        self._total_bytes: Optional[int] = None
+        self._counters = {"hits": 0, "renders": 0, "evicted": 0, "errors": 0}
+
+    # -- paths -------------------------------------------------------------
+
+    def preview_path(self, content_hash: str, size: int) -> Path:
+        return self.root / content_hash[:2] / f"{content_hash}_{size}.jpg"
+
+    def _alias_path(self, alias: str) -> Path:
+        return self._aliases / hashlib.sha1(alias.encode("utf-8")).hexdigest()
+
+    def content_hash(self, file_path: str) -> str:
+        """SHA-256 of a file (cached per path, mtime and size)."""
+        return self._hashes.digest(Path(file_path))
+
+    # -- lookups -----------------------------------------------------------
+
+    def lookup(self, content_hash: str, size: int) -> Optional[Path]:
+        """Cached preview, or None; a hit refreshes its LRU position."""
+        path = self.preview_path(content_hash, size)
+        try:
+            os.utime(path)
+        except OSError:
+            return None
+        with self._lock:
+            self._counters["hits"] += 1
+        return path
+
+    def lookup_alias(self, alias: str, size: int) -> Optional[Path]:
+        """Cached preview of the content last seen under `alias` (e.g. an evidence id)."""
+        if not alias:
+            return None
+        try:
+            content_hash = self._alias_path(alias).read_text(encoding="ascii").strip()
+        except OSError:
+            return None
+        return self.lookup(content_hash, size) if content_hash else None
+
+    def best_available(self, alias: str, size: int) -> Optional[Tuple[Path, int]]:
+        """(path, size) of the requested size if cached, else of the closest smaller one."""
+        for candidate in sorted((s for s in PREVIEW_SIZES if s <= size), reverse=True) or [size]:
+            path = self.lookup_alias(alias, candidate)
+            if path:
+                return path, candidate
+        return None
+
+    def set_alias(self, alias: str, content_hash: str) -> None:
+        path = self._alias_path(alias)
+        tmp = path.with_name(f"{path.name}.{uuid.uuid4().hex[:8]}.tmp")
+        tmp.write_text(content_hash, encoding="ascii")
+        os.replace(tmp, path)
+
+    # -- rendering ---------------------------------------------------------
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.workers)
+            return self._pool
+
+    def get_or_render(self, file_path: str, size: int = PREVIEW_SMALL,
+                      alias: Optional[str] = None) -> Optional[Path]:
+        """
+        Preview of a local file at `size`, rendering every preview size on a miss.
+
+        Blocks until the render is done: call from a worker thread. Returns
+        None for unsupported types or files that cannot be decoded.
+        """
+        if not file_path or not can_preview(file_path) or not os.path.exists(file_path):
+            return None
+        content_hash = self.content_hash(file_path)
+        if alias:
+            self.set_alias(alias, content_hash)
+
+        cached = self.lookup(content_hash, size)
+        if cached:
+            return cached
+
+        with self._lock:
+            future = self._inflight.get(content_hash)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[content_hash] = future
+
+        if owner:
+            try:
+                future.set_result(self._render(file_path, content_hash))
+            except Exception as e:
+                with self._lock:
+                    self._counters["errors"] += 1
+                logger.warning(f"Preview render failed for {file_path}: {e}")
+                future.set_result([])
+            finally:
+                with self._lock:
+                    self._inflight.pop(content_hash, None)
+
+        written = dict(future.result())
+        return Path(written[size]) if size in written else None
+
+    def _render(self, file_path: str, content_hash: str) -> List[Tuple[int, str]]:
+        targets = []
+        for size in PREVIEW_SIZES:
+            path = self.preview_path(content_hash, size)
+            path.parent.mkdir(exist_ok=True)
+            targets.append((size, str(path)))
+
+        if self.workers > 0:
+            written = self._get_pool().submit(_render_previews, file_path, targets).result()
+        else:
+            written = _render_previews(file_path, targets)
+
+        added = sum(os.path.getsize(path) for _, path in written)
+        with self._lock:
+            self._counters["renders"] += 1
+            if self._total_bytes is not None:
+                self._total_bytes += added
+        self._evict_if_needed()
+        return written
+
+    # -- eviction ----------------------------------------------------------
+
+    def _scan(self) -> List[Tuple[float, int, Path]]:
+        entries = []
+        for path in self.root.glob("??/*.jpg"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _evict_if_needed(self) -> None:
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = sum(size for _, size, _ in self._scan())
+            if self._total_bytes <= self.max_bytes:
+                return
+            # Evict down to 90% so eviction does not run on every render
+            target = int(self.max_bytes * 0.9)
+            entries = sorted(self._scan())
+            total = sum(size for _, size, _ in entries)
+            evicted = 0
+            for _, size, path in entries:
+                if total <= target:
+                    break
+                try:
+                    path.unlink()
+                    total -= size
+                    evicted += 1
+                except OSError:
+                    pass
+            self._total_bytes = total
+            self._counters["evicted"] += evicted
+        if evicted:
+            logger.info(f"Preview cache: evicted {evicted} previews")
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._counters, total_bytes=self._total_bytes or 0)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+_cache: Optional[PreviewCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_preview_cache() -> PreviewCache:
+    """The process-wide preview cache."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = PreviewCache()
+        return _cache
+
+
+def shutdown_preview_cache() -> None:
+    """Stop the render pool (called at application exit)."""
+    with _cache_lock:
+        if _cache is not None:
+            _cache.shutdown()
@@ -0,0 +1,368 @@
+# -*- coding: utf-8 -*-
+"""
+Reference-data cache: one persistent, versioned store for lookup lists.
+
+Administrative divisions (governorate -> community), neighborhoods and
+vocabularies change rarely but used to be downloaded again by every
+process, each service keeping its own in-memory copy. Here every dataset
+lives in memory and on disk under DATA_DIR/reference_data together with a
+version (hash of its content) and the server's ETag:
+
+  * lookups after the first sync are answered from memory or disk, with
+    no network call;
+  * refresh() (run after login) revalidates the datasets that are due with
+    If-None-Match and rewrites only the files whose content changed;
+  * counters record how many requests the cache answered locally and are
+    reported at startup and after each refresh.
+
+Datasets are named after their kind and parent codes, e.g. "districts/01"
+holds the districts of governorate 01 and "neighborhoods" the full list.
+
+Usage:
+    cache = get_reference_data_cache()
+    districts = cache.get("districts", "01")
+    by_code = cache.by_code("neighborhoods", key="neighborhoodCode")
+"""
+
+import atexit
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+FORMAT_VERSION = 1
+MANIFEST_NAME = "manifest.json"
+
+# kind -> (endpoint, query parameters filled from the dataset's codes)
+DATASET_KINDS: Dict[str, Tuple[str, Tuple[str, ...]]] = {
+    "governorates": ("/v1/administrative-divisions/governorates", ()),
+    "districts": ("/v1/administrative-divisions/districts", ("governorateCode",)),
+    "sub_districts": ("/v1/administrative-divisions/sub-districts", ("governorateCode", "districtCode")),
+    "communities": ("/v1/administrative-divisions/communities",
+                    ("governorateCode", "districtCode", "subDistrictCode")),
+    "neighborhoods": ("/v2/neighborhoods",
+                      ("governorateCode", "districtCode", "subDistrictCode", "communityCode")),
+    "vocabularies": ("/v2/vocabularies", ()),
+}
+# Served without authentication (fetched before login)
+PUBLIC_KINDS = frozenset({"vocabularies"})
+
+_EMPTY_CODE = "-"
+
+
+def dataset_name(kind: str, *codes: Optional[str]) -> str:
+    """Name of the dataset holding `kind` filtered by parent `codes`."""
+    if kind not in DATASET_KINDS:
+        raise ValueError(f"Unknown reference dataset kind: {kind}")
+    parts = [str(c) if c else _EMPTY_CODE for c in codes]
+    while parts and parts[-1] == _EMPTY_CODE:
+        parts.pop()
+    return "/".join([kind] + parts)
+
+
+def _split_name(name: str) -> Tuple[str, List[str]]:
+    kind, *codes = name.split("/")
+    return kind, ["" if c == _EMPTY_CODE else c for c in codes]
+
+
+def _content_version(items: list) -> str:
+    payload = json.dumps(items, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def _write_atomic(path: Path, text: str):
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
+
+
+class ReferenceDataCache:
+    """Persistent, versioned cache of reference-data lists (thread-safe)."""
+
+    def __init__(self, cache_dir: Path = None, revalidate_hours: float = None):
+        from app.config import Config
+        self._dir = Path(cache_dir) if cache_dir else Config.DATA_DIR / "reference_data"
+        if revalidate_hours is None:
+            revalidate_hours = Config.REFERENCE_DATA_REVALIDATE_HOURS
+        self._revalidate_after = revalidate_hours * 3600
+        self._lock = threading.RLock()
+        self._items: Dict[str, list] = {}
+        self._indexes: Dict[Tuple[str, str], Tuple[list, Dict[str, dict]]] = {}
+        self._manifest = self._load_manifest()
+        self._flushed_saved = 0
+        # Session counters: memory/disk = answered locally, fetched = downloads,
+        # not_modified = 304 revalidations, skipped = not yet due at refresh()
+        self.stats = {"memory": 0, "disk": 0, "fetched": 0, "not_modified": 0,
+                      "changed": 0, "skipped": 0, "failed": 0}
+
+    # -- Lookups ---------------------------------------------------------------
+
+    def get(self, kind: str, *codes: Optional[str], fetch: bool = True, client=None) -> Optional[list]:
+        """
+        Items of the dataset `kind` filtered by parent `codes`.
+
+        Served from memory, then disk; downloaded only on first use. With
+        fetch=False returns None instead of going to the network. Download
+        errors propagate to the caller.
+        """
+        name = dataset_name(kind, *codes)
+        with self._lock:
+            items = self._items.get(name)
+            if items is not None:
+                self.stats["memory"] += 1
+                return items
+            items = self._read(name)
+            if items is not None:
+                self._items[name] = items
+                self.stats["disk"] += 1
+                return items
+        if not fetch:
+            return None
+        return self._fetch(name, client=client)[0]
+
+    def by_code(self, kind: str, *codes: Optional[str], key: str = "code",
+                fetch: bool = True) -> Dict[str, dict]:
+        """{item[key]: item} over a dataset, rebuilt only when the dataset changes."""
+        items = self.get(kind, *codes, fetch=fetch)
+        if items is None:
+            return {}
+        index_key = (dataset_name(kind, *codes), key)
+        with self._lock:
+            cached = self._indexes.get(index_key)
+            if cached is not None and cached[0] is items:
+                return cached[1]
+            index = {item.get(key): item for item in items if item.get(key)}
+            self._indexes[index_key] = (items, index)
+            return index
+
+    def has(self, kind: str, *codes: Optional[str]) -> bool:
+        """True if the dataset has been synced at least once."""
+        with self._lock:
+            return dataset_name(kind, *codes) in self._manifest["datasets"]
+
+    def seed(self, kind: str, items: list, *codes: Optional[str]):
+        """Store items obtained elsewhere (e.g. a legacy cache file) without an ETag."""
+        self._store(dataset_name(kind, *codes), items, None)
+
+    # -- Refresh ---------------------------------------------------------------
+
+    def revalidate(self, kind: str, *codes: Optional[str], client=None) -> bool:
+        """Conditionally re-download one dataset. Returns True if its content changed."""
+        return self._fetch(dataset_name(kind, *codes), client=client)[1]
+
+    def refresh(self, force: bool = False, exclude: Tuple[str, ...] = ()) -> List[str]:
+        """
+        Revalidate every synced dataset that is due (all of them with force).
+
+        Datasets validated less than REFERENCE_DATA_REVALIDATE_HOURS ago
+        are skipped, kinds in `exclude` are left alone. Errors are logged
+        per dataset. Returns the names of the datasets whose content changed.
+        """
+        now = time.time()
+        with self._lock:
+            entries = list(self._manifest["datasets"].items())
+        changed = []
+        for name, entry in entries:
+            if _split_name(name)[0] in exclude:
+                continue
+            if not force and now - entry.get("validated_at", 0) < self._revalidate_after:
+                self.stats["skipped"] += 1
+                continue
+            try:
+                if self._fetch(name)[1]:
+                    changed.append(name)
+            except Exception as e:
+                logger.warning(f"Reference data refresh failed for '{name}': {e}")
+        self.flush()
+        return changed
+
+    # -- Reporting -------------------------------------------------------------
+
+    @property
+    def saved_calls(self) -> int:
+        """Requests this session answered without the network (disk loads + skipped revalidations)."""
+        return self.stats["disk"] + self.stats["skipped"]
+
+    def report(self) -> Dict[str, Any]:
+        """Dataset and item totals, session counters and saved-call history."""
+        with self._lock:
+            datasets = self._manifest["datasets"]
+            history = self._manifest["stats"]
+            return {
+                "datasets": len(datasets),
+                "items": sum(e.get("count", 0) for e in datasets.values()),
+                "session": dict(self.stats),
+                "saved_calls": self.saved_calls,
+                "previous_session_saved": history.get("previous_session_saved", 0),
+                "saved_total": history.get("saved_total", 0) + self.saved_calls - self._flushed_saved,
+            }
+
+    def log_report(self, stage: str):
+        """Log a one-line summary of the cache (startup, login, ...)."""
+        r = self.report()
+        s = r["session"]
+        logger.info(
+            f"Reference data [{stage}]: {r['datasets']} datasets / {r['items']} items cached; "
+            f"session saved {r['saved_calls']} API calls (disk {s['disk']}, skipped {s['skipped']}), "
+            f"memory hits {s['memory']}, fetched {s['fetched']} ({s['not_modified']} not modified, "
+            f"{s['changed']} changed); previous session saved {r['previous_session_saved']}, "
+            f"total {r['saved_total']}"
+        )
+
+    def flush(self):
+        """Persist the saved-call counters."""
+        with self._lock:
+            saved = self.saved_calls
+            history = self._manifest["stats"]
+            history["saved_total"] = history.get("saved_total", 0) + saved - self._flushed_saved
+            history["session_saved"] = saved
+            self._flushed_saved = saved
+            self._save_manifest()
+
+    def clear(self):
+        """Drop every dataset from memory and disk."""
+        with self._lock:
+            for name in list(self._manifest["datasets"]):
+                self._path(name).unlink(missing_ok=True)
+            self._manifest["datasets"] = {}
+            self._items.clear()
+            self._indexes.clear()
+            self._save_manifest()
+
+    # -- Internals -------------------------------------------------------------
+
+    def _fetch(self, name: str, client=None) -> Tuple[Optional[list], bool]:
+        """Download (conditionally, if an ETag is known) and store a dataset."""
+        with self._lock:
+            entry = self._manifest["datasets"].get(name)
+        etag = entry.get("etag") if entry else None
+        kind, codes = _split_name(name)
+        try:
+            items, new_etag = self._download(kind, codes, etag, client)
+        except Exception:
+            self.stats["failed"] += 1
+            raise
+        self.stats["fetched"] += 1
+        if items is None:
+            self.stats["not_modified"] += 1
+            with self._lock:
+                current = self._items.get(name) or self._read(name)
+                if current is not None:
+                    self._items[name] = current
+                    entry["validated_at"] = time.time()
+                    entry["etag"] = new_etag
+                    self._save_manifest()
+                    return current, False
+            # Our copy is gone: ask again without the ETag
+            items, new_etag = self._download(kind, codes, None, client)
+        return self._store(name, items, new_etag)
+
+    @staticmethod
+    def _download(kind: str, codes: List[str], etag: Optional[str], client) -> Tuple[Optional[list], Optional[str]]:
+        endpoint, param_names = DATASET_KINDS[kind]
+        params = {p: c for p, c in zip(param_names, codes) if c}
+        if kind in PUBLIC_KINDS:
+            return _public_get(endpoint, params, etag)
+        if client is None:
+            from services.api_client import get_api_client
+            client = get_api_client()
+        if client is None:
+            raise RuntimeError("API client unavailable")
+        return client.get_reference_data(endpoint, params, etag)
+
+    def _store(self, name: str, items: list, etag: Optional[str]) -> Tuple[list, bool]:
+        version = _content_version(items)
+        now = time.time()
+        with self._lock:
+            entry = self._manifest["datasets"].get(name)
+            changed = entry is None or entry.get("version") != version
+            if changed:
+                self._dir.mkdir(parents=True, exist_ok=True)
+                _write_atomic(self._path(name), json.dumps(items, ensure_ascii=False))
+                self._items[name] = items
+                if entry is not None:
+                    self.stats["changed"] += 1
+                    logger.info(f"Reference data '{name}' changed ({len(items)} items)")
+            else:
+                items = self._items.setdefault(name, items)
+            self._manifest["datasets"][name] = {
+                "version": version,
+                "etag": etag,
+                "count": len(items),
+                "fetched_at": now if changed else entry.get("fetched_at", now),
+                "validated_at": now,
+            }
+            self._save_manifest()
+        return items, changed
+
+    def _path(self, name: str) -> Path:
+        return self._dir / (re.sub(r"[^A-Za-z0-9_-]", "_", name.replace("/", "__")) + ".json")
+
+    def _read(self, name: str) -> Optional[list]:
+        if name not in self._manifest["datasets"]:
+            return None
+        try:
+            return json.loads(self._path(name).read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Reference data '{name}' unreadable, will re-download: {e}")
+            self._manifest["datasets"].pop(name, None)
+            return None
+
+    def _load_manifest(self) -> Dict[str, Any]:
+        manifest = {"format": FORMAT_VERSION, "datasets": {}, "stats": {}}
+        try:
+            data = json.loads((self._dir / MANIFEST_NAME).read_text(encoding="utf-8"))
+            if data.get("format") == FORMAT_VERSION:
+                manifest.update(data)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.warning(f"Reference data manifest unreadable, starting empty: {e}")
+        stats = manifest["stats"]
+        stats["previous_session_saved"] = stats.pop("session_saved", 0)
+        return manifest
+
+    def _save_manifest(self):
+        try:
+            self._dir.mkdir(parents=True, exist_ok=True)
+            _write_atomic(self._dir / MANIFEST_NAME, json.dumps(self._manifest, ensure_ascii=False))
+        except OSError as e:
+            logger.warning(f"Could not save reference data manifest: {e}")
+
+
+def _public_get(endpoint: str, params: dict, etag: Optional[str]) -> Tuple[Optional[list], Optional[str]]:
+    """Conditional GET of an unauthenticated endpoint (vocabularies)."""
+    import requests
+    from app.config import get_api_base_url, should_verify_ssl
+    url = f"{get_api_base_url()}{endpoint}"
+    headers = {"If-None-Match": etag} if etag else {}
+    response = requests.get(url, params=params or None, headers=headers,
+                            timeout=10, verify=should_verify_ssl(url))
+    if response.status_code == 304:
+        return None, response.headers.get("ETag") or etag
+    response.raise_for_status()
+    raw = response.json()
+    items = raw.get("items", raw) if isinstance(raw, dict) else raw
+    return items, response.headers.get("ETag")
+
+
+_cache: Optional[ReferenceDataCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_reference_data_cache() -> ReferenceDataCache:
+    """The process-wide reference-data cache."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ReferenceDataCache()
+            atexit.register(_cache.flush)
+        return _cache
@@ -19,6 +19,9 @@ from datetime import datetime, timedelta
 from dataclasses import dataclass
 
 from repositories.database import Database
+from repositories.stat_counters import (
+    count_created_since, counter_value, has_stat_counters, read_stat_counters
+)
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -429,30 +432,12 @@ class ReportService:
         end_str = end_date.strftime("%Y-%m-%d")
 
         # Gather statistics
-        stats = {}
-
-        # New buildings
-        cursor.execute("""
-            SELECT COUNT(*) FROM buildings WHERE date(created_at) >= ?
-        """, (start_str,))
-        stats["new_buildings"] = cursor.fetchone()[0]
-
-        # New units
-        cursor.execute("""
-            SELECT COUNT(*) FROM property_units WHERE date(created_at) >= ?
-        """, (start_str,))
-        stats["new_units"] = cursor.fetchone()[0]
+        stats = self._created_since_counts(cursor, start_str)
 
-        # New claims
-        cursor.execute("""
-            SELECT COUNT(*) FROM claims WHERE date(created_at) >= ?
-        """, (start_str,))
-        stats["new_claims"] = cursor.fetchone()[0]
-
-        # Claims by status
+        # Claims by status (ISO timestamps compare as text: no date() on the column)
         cursor.execute("""
             SELECT case_status, COUNT(*) as count FROM claims
-            WHERE date(created_at) >= ?
+            WHERE created_at >= ?
             GROUP BY case_status
         """, (start_str,))
         stats["claims_by_status"] = {row[0]: row[1] for row in cursor.fetchall()}
@@ -460,33 +445,17 @@ class ReportService:
         # Approved claims
         cursor.execute("""
             SELECT COUNT(*) FROM claims
-            WHERE case_status = 'approved' AND date(updated_at) >= ?
+            WHERE case_status = 'approved' AND updated_at >= ?
         """, (start_str,))
         stats["approved_claims"] = cursor.fetchone()[0]
 
         # Rejected claims
         cursor.execute("""
             SELECT COUNT(*) FROM claims
-            WHERE case_status = 'rejected' AND date(updated_at) >= ?
+            WHERE case_status = 'rejected' AND updated_at >= ?
         """, (start_str,))
         stats["rejected_claims"] = cursor.fetchone()[0]
 
-        # New persons
-        cursor.execute("""
-            SELECT COUNT(*) FROM persons WHERE date(created_at) >= ?
-        """, (start_str,))
-        stats["new_persons"] = cursor.fetchone()[0]
-
-        # New documents
-        try:
-            cursor.execute("""
-                SELECT COUNT(*) FROM documents WHERE date(created_at) >= ?
-            """, (start_str,))
-            stats["new_documents"] = cursor.fetchone()[0]
-        except Exception as e:
-            logger.warning(f"Failed to count new documents: {e}")
-            stats["new_documents"] = 0
-
         # Generate PDF
         doc = SimpleDocTemplate(str(file_path), pagesize=A4)
         elements = []
@@ -681,8 +650,45 @@ class ReportService:
             return "0"
         return str(round((with_count / total) * 100, 1))
 
+    _CREATED_SINCE = (
+        ("new_buildings", "buildings"),
+        ("new_units", "property_units"),
+        ("new_claims", "claims"),
+        ("new_persons", "persons"),
+        ("new_documents", "documents"),
+    )
+
+    def _created_since_counts(self, cursor, start_str: str) -> Dict[str, int]:
+        """Rows created since `start_str` per entity (daily counter buckets when available)."""
+        stats = {}
+        for key, table in self._CREATED_SINCE:
+            try:
+                if has_stat_counters(self.db):
+                    stats[key] = count_created_since(self.db, table, start_str)
+                else:
+                    cursor.execute(f"SELECT COUNT(*) FROM {table} WHERE created_at >= ?", (start_str,))
+                    stats[key] = cursor.fetchone()[0]
+            except Exception as e:
+                logger.warning(f"Failed to count {key}: {e}")
+                stats[key] = 0
+        return stats
+
     def get_dashboard_statistics(self) -> Dict[str, Any]:
         """Get statistics for dashboard display."""
+        week_ago = (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d")
+
+        if has_stat_counters(self.db):
+            # Counter rows by primary key: constant time at any table size
+            return {
+                "total_buildings": counter_value(self.db, "buildings"),
+                "total_units": counter_value(self.db, "property_units"),
+                "total_persons": counter_value(self.db, "persons"),
+                "total_claims": counter_value(self.db, "claims"),
+                "claims_by_status": read_stat_counters(self.db, "claims").get("status", {}),
+                "new_buildings_week": count_created_since(self.db, "buildings", week_ago),
+                "new_claims_week": count_created_since(self.db, "claims", week_ago),
+            }
+
         cursor = self.db.cursor()
         stats = {}
 
@@ -723,13 +729,11 @@ class ReportService:
             stats["claims_by_status"] = {}
 
         # Recent activity (last 7 days)
-        week_ago = (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d")
-
-        cursor.execute("SELECT COUNT(*) FROM buildings WHERE date(created_at) >= ?", (week_ago,))
+        cursor.execute("SELECT COUNT(*) FROM buildings WHERE created_at >= ?", (week_ago,))
         stats["new_buildings_week"] = cursor.fetchone()[0]
 
         try:
-            cursor.execute("SELECT COUNT(*) FROM claims WHERE date(created_at) >= ?", (week_ago,))
+            cursor.execute("SELECT COUNT(*) FROM claims WHERE created_at >= ?", (week_ago,))
             stats["new_claims_week"] = cursor.fetchone()[0]
         except Exception as e:
             logger.warning(f"Failed to count new claims this week: {e}")
@@ -0,0 +1,374 @@
+# -*- coding: utf-8 -*-
+"""
+Offline reverse geocoding over administrative boundary polygons.
+
+`BoundaryIndex` packs polygon bounding boxes into an STR (sort-tile-
+recursive) R-tree and answers "which polygon contains this point" with an
+exact even-odd ray test on the candidate polygons' edges. Holes and
+multipolygon parts are handled by testing every ring of a feature at once.
+
+`ReverseGeocoder` keeps one index per level:
+
+- the boundary layers shipped in assets/geojson (governorates, districts,
+  subdistricts, neighbourhoods — see boundary_service), keyed by the
+  binary layer file's size and mtime;
+- `api_neighborhoods`: the backend neighbourhood polygons (boundaryWkt),
+  which carry the neighbourhood codes the app uses. They are registered
+  from an API neighbourhood list with `set_neighborhoods()`.
+
+Indexes are built lazily on first use and persisted as .npz files under
+DATA_DIR/boundary_index, so later sessions load them in milliseconds and
+lookups need no network at all. Single lookups take tens of microseconds;
+`lookup_many` walks the tree once for a whole batch of points.
+"""
+
+import hashlib
+import io
+import json
+import math
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from services.geometry_codec import Geometry, try_parse
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+FORMAT_VERSION = 1
+NODE_CAPACITY = 8
+
+ASSET_LEVELS = ("governorates", "districts", "subdistricts", "neighbourhoods")
+API_NEIGHBORHOODS = "api_neighborhoods"
+
+# Point x edge pairs evaluated at once by the batch ray test (bounds memory).
+_PIP_CHUNK = 1 << 21
+
+_BOUNDARY_KEYS = ("boundaryWkt", "boundaries", "boundary")
+
+
+def _polygon_rings(geometry: Geometry) -> List[np.ndarray]:
+    return geometry.arrays() if geometry.geom_type in ("Polygon", "MultiPolygon") else []
+
+
+def _ring_edges(ring: np.ndarray) -> Optional[np.ndarray]:
+    ring = ring[:, :2]
+    if len(ring) < 3:
+        return None
+    if not np.array_equal(ring[0], ring[-1]):
+        ring = np.vstack((ring, ring[:1]))
+    return np.hstack((ring[:-1], ring[1:]))
+
+
+def _inside(edges: np.ndarray, points: np.ndarray) -> np.ndarray:
+    """Even-odd ray test of (n, 2) points against (e, 4) edges -> (n,) bool."""
+    x, y = points[:, 0:1], points[:, 1:2]
+    x1, y1, x2, y2 = edges[:, 0], edges[:, 1], edges[:, 2], edges[:, 3]
+    straddles = (y1 > y) != (y2 > y)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x_cross = x1 + (y - y1) * (x2 - x1) / (y2 - y1)
+    return (np.count_nonzero(straddles & (x < x_cross), axis=1) & 1).astype(bool)
+
+
+def _str_order(bboxes: np.ndarray) -> np.ndarray:
+    """Sort-tile-recursive order: vertical slices by x centre, then y within each."""
+    n = len(bboxes)
+    if not n:
+        return np.empty(0, dtype=np.int64)
+    cx = (bboxes[:, 0] + bboxes[:, 2]) / 2
+    cy = (bboxes[:, 1] + bboxes[:, 3]) / 2
+    slices = math.ceil(math.sqrt(math.ceil(n / NODE_CAPACITY)))
+    per_slice = slices * NODE_CAPACITY
+    by_x = np.argsort(cx, kind="stable")
+    parts = [chunk[np.argsort(cy[chunk], kind="stable")]
+             for chunk in (by_x[i:i + per_slice] for i in range(0, n, per_slice))]
+    return np.concatenate(parts).astype(np.int64)
+
+
+def _pack_levels(leaves: np.ndarray) -> List[np.ndarray]:
+    """Node bboxes per tree level, leaves first; node i owns children i*C .. i*C+C-1."""
+    levels = [leaves]
+    while len(levels[-1]) > 1:
+        boxes = levels[-1]
+        starts = np.arange(0, len(boxes), NODE_CAPACITY)
+        levels.append(np.column_stack((
+            np.minimum.reduceat(boxes[:, 0], starts),
+            np.minimum.reduceat(boxes[:, 1], starts),
+            np.maximum.reduceat(boxes[:, 2], starts),
+            np.maximum.reduceat(boxes[:, 3], starts),
+        )))
+    return levels
+
+
+class BoundaryIndex:
+    """STR-packed R-tree of polygon bboxes with exact point-in-polygon tests."""
+
+    def __init__(self, properties: List[Dict[str, Any]], bboxes: np.ndarray,
+                 edges: np.ndarray, edge_start: np.ndarray, order: np.ndarray,
+                 signature: str = ""):
+        self.properties = properties   # one dict per feature
+        self.bboxes = bboxes           # (F, 4) min_x, min_y, max_x, max_y
+        self.edges = edges             # (E, 4) x1, y1, x2, y2 of every ring edge
+        self.edge_start = edge_start   # (F + 1,) feature -> slice of edges
+        self.order = order             # leaf slot -> feature
+        self.levels = _pack_levels(bboxes[order])
+        self.signature = signature
+        self._boxes = [level.tolist() for level in self.levels]
+        self._order = order.tolist()
+
+    def __len__(self) -> int:
+        return len(self.properties)
+
+    @classmethod
+    def build(cls, features: Iterable[Tuple[Dict[str, Any], Geometry]],
+              signature: str = "") -> "BoundaryIndex":
+        """Index (properties, polygon Geometry) pairs; other geometry types are skipped."""
+        properties, boxes, parts, counts = [], [], [], []
+        for props, geometry in features:
+            edges = [e for e in map(_ring_edges, _polygon_rings(geometry)) if e is not None]
+            if not edges:
+                continue
+            edges = np.vstack(edges)
+            properties.append(props)
+            parts.append(edges)
+            counts.append(len(edges))
+            boxes.append((
+                min(edges[:, 0].min(), edges[:, 2].min()), min(edges[:, 1].min(), edges[:, 3].min()),
+                max(edges[:, 0].max(), edges[:, 2].max()), max(edges[:, 1].max(), edges[:, 3].max()),
+            ))
+        bboxes = np.array(boxes, dtype=np.float64).reshape(-1, 4)
+        edges = np.vstack(parts) if parts else np.empty((0, 4), dtype=np.float64)
+        edge_start = np.concatenate(([0], np.cumsum(counts))).astype(np.int64)
+        return cls(properties, bboxes, edges, edge_start, _str_order(bboxes), signature)
+
+    # -- Lookups --------------------------------------------------------------
+
+    def candidates(self, x: float, y: float) -> List[int]:
+        """Features whose bbox contains (x, y), via the tree."""
+        if not len(self.order):
+            return []
+        # Plain-Python descent: a handful of nodes per level is cheaper than NumPy calls.
+        nodes = [0]
+        for level in range(len(self._boxes) - 1, 0, -1):
+            boxes, below = self._boxes[level], len(self._boxes[level - 1])
+            nodes = [child
+                     for node in nodes
+                     if boxes[node][0] <= x <= boxes[node][2] and boxes[node][1] <= y <= boxes[node][3]
+                     for child in range(node * NODE_CAPACITY, min(node * NODE_CAPACITY + NODE_CAPACITY, below))]
+        leaves = self._boxes[0]
+        return [self._order[slot] for slot in nodes
+                if leaves[slot][0] <= x <= leaves[slot][2] and leaves[slot][1] <= y <= leaves[slot][3]]
+
+    def contains(self, feature: int, x: float, y: float) -> bool:
+        edges = self.edges[self.edge_start[feature]:self.edge_start[feature + 1]]
+        # Only straddling edges can cross the ray, and they never divide by zero.
+        edges = edges[(edges[:, 1] > y) != (edges[:, 3] > y)]
+        x_cross = edges[:, 0] + (y - edges[:, 1]) * (edges[:, 2] - edges[:, 0]) / (edges[:, 3] - edges[:, 1])
+        return bool(np.count_nonzero(x < x_cross) & 1)
+
+    def lookup(self, x: float, y: float) -> int:
+        """Index of the feature containing (x, y), or -1."""
+        for feature in self.candidates(x, y):
+            if self.contains(feature, x, y):
+                return feature
+        return -1
+
+    def lookup_many(self, points: np.ndarray) -> np.ndarray:
+        """(n, 2) x/y points -> (n,) feature indexes (-1 where none)."""
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        result = np.full(len(points), -1, dtype=np.int64)
+        if not len(points) or not len(self.order):
+            return result
+        stack = [(len(self.levels) - 1, 0, np.arange(len(points)))]
+        while stack:
+            level, node, idx = stack.pop()
+            box = self.levels[level][node]
+            p = points[idx]
+            idx = idx[(p[:, 0] >= box[0]) & (p[:, 0] <= box[2]) &
+                      (p[:, 1] >= box[1]) & (p[:, 1] <= box[3]) & (result[idx] < 0)]
+            if not len(idx):
+                continue
+            if level == 0:
+                feature = int(self.order[node])
+                edges = self.edges[self.edge_start[feature]:self.edge_start[feature + 1]]
+                step = max(1, _PIP_CHUNK // max(1, len(edges)))
+                for i in range(0, len(idx), step):
+                    chunk = idx[i:i + step]
+                    result[chunk[_inside(edges, points[chunk])]] = feature
+                continue
+            first = node * NODE_CAPACITY
+            last = min(first + NODE_CAPACITY, len(self.levels[level - 1]))
+            stack.extend((level - 1, child, idx) for child in range(first, last))
+        return result
+
+    # -- Persistence ----------------------------------------------------------
+
+    def save(self, path: Path):
+        """Write the index atomically as an .npz file (no pickles)."""
+        meta = {"version": FORMAT_VERSION, "signature": self.signature}
+        buffer = io.BytesIO()
+        np.savez(
+            buffer,
+            bboxes=self.bboxes, edges=self.edges, edge_start=self.edge_start, order=self.order,
+            properties=np.frombuffer(json.dumps(self.properties, ensure_ascii=False).encode("utf-8"),
+                                     dtype=np.uint8),
+            meta=np.frombuffer(json.dumps(meta).encode("utf-8"), dtype=np.uint8),
+        )
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_bytes(buffer.getvalue())
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: Path, signature: Optional[str] = None) -> Optional["BoundaryIndex"]:
+        """Read an index saved by `save`; None if missing, stale or unreadable."""
+        if not path.exists():
+            return None
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                meta = json.loads(data["meta"].tobytes().decode("utf-8"))
+                if meta.get("version") != FORMAT_VERSION:
+                    return None
+                if signature is not None and meta.get("signature") != signature:
+                    return None
+                return cls(
+                    json.loads(data["properties"].tobytes().decode("utf-8")),
+                    data["bboxes"], data["edges"], data["edge_start"], data["order"],
+                    meta.get("signature", ""),
+                )
+        except Exception as e:
+            logger.warning(f"Could not read boundary index {path.name}: {e}")
+            return None
+
+
+class ReverseGeocoder:
+    """Point -> administrative area lookups over persisted boundary indexes."""
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        if cache_dir is None:
+            from app.config import Config
+            cache_dir = Config.DATA_DIR / "boundary_index"
+        self.cache_dir = Path(cache_dir)
+        self._indexes: Dict[str, Optional[BoundaryIndex]] = {}
+        self._lock = threading.Lock()
+
+    def _path(self, level: str) -> Path:
+        return self.cache_dir / f"{level}.npz"
+
+    def index(self, level: str) -> Optional[BoundaryIndex]:
+        """The index for `level`, loaded or built on first use (None if unavailable)."""
+        if level in self._indexes:
+            return self._indexes[level]
+        with self._lock:
+            if level not in self._indexes:
+                if level == API_NEIGHBORHOODS:
+                    self._indexes[level] = BoundaryIndex.load(self._path(level))
+                else:
+                    self._indexes[level] = self._asset_index(level)
+            return self._indexes[level]
+
+    def has_index(self, level: str) -> bool:
+        index = self.index(level)
+        return index is not None and len(index) > 0
+
+    def _asset_index(self, level: str) -> Optional[BoundaryIndex]:
+        from services import boundary_service
+
+        layer = boundary_service.get_layer(level)
+        if layer is None:
+            return None
+        stat = layer.path.stat()
+        signature = f"{layer.path.name}-{stat.st_size}-{stat.st_mtime_ns}"
+        index = BoundaryIndex.load(self._path(level), signature)
+        if index is not None:
+            return index
+
+        index = BoundaryIndex.build(layer.features(), signature)
+        self._persist(level, index)
+        logger.info(f"ReverseGeocoder: indexed {len(index)} '{level}' polygons")
+        return index
+
+    def _persist(self, level: str, index: BoundaryIndex):
+        try:
+            index.save(self._path(level))
+        except OSError as e:
+            logger.warning(f"ReverseGeocoder: could not persist '{level}' index: {e}")
+
+    def set_neighborhoods(self, neighborhoods: Sequence[Dict[str, Any]]) -> int:
+        """
+        (Re)index backend neighbourhoods from an API list carrying WKT boundaries.
+
+        Unchanged lists (same codes and boundaries) keep the current index.
+        Returns the number of indexed polygons.
+        """
+        digest = hashlib.sha1()
+        features = []
+        for item in neighborhoods or ():
+            wkt = next((item[k] for k in _BOUNDARY_KEYS if item.get(k)), None)
+            geometry = try_parse(wkt, "neighborhood boundary") if wkt else None
+            if geometry is None:
+                continue
+            props = {k: v for k, v in item.items()
+                     if k not in _BOUNDARY_KEYS and (v is None or isinstance(v, (str, int, float, bool)))}
+            digest.update(json.dumps(props, sort_keys=True, ensure_ascii=False).encode("utf-8"))
+            digest.update(wkt.encode("utf-8"))
+            features.append((props, geometry))
+        if not features:
+            return 0
+
+        signature = digest.hexdigest()
+        current = self.index(API_NEIGHBORHOODS)
+        if current is not None and current.signature == signature:
+            return len(current)
+        index = BoundaryIndex.build(features, signature)
+        with self._lock:
+            self._indexes[API_NEIGHBORHOODS] = index
+        self._persist(API_NEIGHBORHOODS, index)
+        logger.info(f"ReverseGeocoder: indexed {len(index)} backend neighborhoods")
+        return len(index)
+
+    def lookup(self, longitude: float, latitude: float, level: str) -> Optional[Dict[str, Any]]:
+        """Properties of the `level` polygon containing the point, or None."""
+        index = self.index(level)
+        if index is None:
+            return None
+        feature = index.lookup(longitude, latitude)
+        return index.properties[feature] if feature >= 0 else None
+
+    def lookup_many(self, points: Sequence[Tuple[float, float]], level: str) -> List[Optional[Dict[str, Any]]]:
+        """Batch `lookup` for (longitude, latitude) pairs."""
+        index = self.index(level)
+        if index is None:
+            return [None] * len(points)
+        features = index.lookup_many(np.asarray(points, dtype=np.float64)).tolist()
+        return [index.properties[f] if f >= 0 else None for f in features]
+
+    def reverse_geocode(self, longitude: float, latitude: float) -> Dict[str, Dict[str, Any]]:
+        """{level: properties} for every shipped boundary level containing the point."""
+        found = {}
+        for level in ASSET_LEVELS:
+            props = self.lookup(longitude, latitude, level)
+            if props is not None:
+                found[level] = props
+        return found
+
+    def clear(self):
+        """Forget in-memory indexes (persisted files are kept)."""
+        with self._lock:
+            self._indexes.clear()
+
+
+_geocoder: Optional[ReverseGeocoder] = None
+_geocoder_lock = threading.Lock()
+
+
+def get_reverse_geocoder() -> ReverseGeocoder:
+    """The process-wide ReverseGeocoder."""
+    global _geocoder
+    with _geocoder_lock:
+        if _geocoder is None:
+            _geocoder = ReverseGeocoder()
+        return _geocoder
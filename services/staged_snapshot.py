@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+"""
+Shared, indexed snapshot of an import package's staged entities.
+
+`GET /import/packages/{id}/staged-entities` returns one grouped payload
+({"persons": [...], "buildings": [...], "propertyUnits": [...], ...}).
+The import wizard steps and the claim comparison page all need it, and
+the comparison page looks entities up by id many times per conflict.
+
+`StagedSnapshot` wraps that payload once per package:
+
+- the raw grouped dict stays available as `.data` (review/commit steps),
+- id lookups go through a hash index per collection, built lazily on the
+  first lookup, covering every id alias a staged row may carry,
+- `stagingData` / `entityData` JSON strings are parsed at most once.
+
+Snapshots live in a small module-level registry keyed by package id and
+are released when the package is staged again, approved, committed or
+cancelled (see ImportController).
+"""
+
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Every key a staged row may carry its id under (matched in this order).
+ID_KEYS = (
+    "id", "originalEntityId", "stagedEntityId",
+    "personId", "buildingId", "propertyUnitId", "entityId",
+)
+
+# Packages kept in memory at once; the wizard works on one at a time.
+MAX_SNAPSHOTS = 3
+
+
+class StagedSnapshot:
+    """Staged entities of one package with per-collection id indexes."""
+
+    def __init__(self, package_id: str, data: Optional[Dict[str, Any]]):
+        self.package_id = package_id
+        self.data: Dict[str, Any] = data if isinstance(data, dict) else {}
+        self._indexes: Dict[str, Dict[str, int]] = {}
+        self._payloads: Dict[str, List[Any]] = {}
+        self._lock = threading.Lock()
+
+    def collection(self, key: str) -> List[Any]:
+        items = self.data.get(key)
+        return items if isinstance(items, list) else []
+
+    def _index(self, key: str) -> Dict[str, int]:
+        index = self._indexes.get(key)
+        if index is not None:
+            return index
+        with self._lock:
+            index = self._indexes.get(key)
+            if index is None:
+                index = {}
+                for pos, item in enumerate(self.collection(key)):
+                    if not isinstance(item, dict):
+                        continue
+                    for id_key in ID_KEYS:
+                        val = item.get(id_key)
+                        if val:
+                            # First row in list order wins, as with a linear scan.
+                            index.setdefault(str(val), pos)
+                self._payloads[key] = [None] * len(self.collection(key))
+                self._indexes[key] = index
+        return index
+
+    def find(self, key: str, entity_id) -> Optional[Dict[str, Any]]:
+        """Unwrapped staging payload of the row in `key` matching `entity_id`.
+
+        Returns `stagingData` / `entityData` (parsed if it is a JSON string)
+        or the row itself, as a shallow copy; None when not found.
+        """
+        if not entity_id:
+            return None
+        pos = self._index(key).get(str(entity_id))
+        if pos is None:
+            return None
+        payloads = self._payloads[key]
+        payload = payloads[pos]
+        if payload is None:
+            payload = payloads[pos] = _unwrap(self.collection(key)[pos])
+        return dict(payload)
+
+    def records(self, key: str) -> List[Dict[str, Any]]:
+        """Unwrapped staging payloads of `key`, each carrying its row id as "id".
+
+        The row's `originalEntityId` is kept too: other staged rows reference
+        the entity by it (a unit's buildingId, for instance).
+        """
+        records = []
+        for item in self.collection(key):
+            if not isinstance(item, dict):
+                continue
+            record = dict(_unwrap(item))
+            row_id = next((item[k] for k in ID_KEYS if item.get(k)), None)
+            if row_id:
+                record["id"] = str(row_id)
+            if item.get("originalEntityId"):
+                record.setdefault("originalEntityId", str(item["originalEntityId"]))
+            records.append(record)
+        return records
+
+    def __len__(self) -> int:
+        return sum(len(v) for v in self.data.values() if isinstance(v, list))
+
+
+def _unwrap(item: Dict[str, Any]) -> Dict[str, Any]:
+    payload = item.get("stagingData") or item.get("entityData") or item
+    if isinstance(payload, str):
+        try:
+            payload = json.loads(payload)
+        except (ValueError, TypeError):
+            payload = item
+    return payload if isinstance(payload, dict) else item
+
+
+# ---------------------------------------------------------------------------
+# Per-package registry
+# ---------------------------------------------------------------------------
+
+_snapshots: "OrderedDict[str, StagedSnapshot]" = OrderedDict()
+_registry_lock = threading.Lock()
+_load_locks: Dict[str, threading.Lock] = {}
+
+
+def get_staged_snapshot(package_id: str,
+                        loader: Callable[[str], Any] = None,
+                        refresh: bool = False) -> StagedSnapshot:
+    """Shared snapshot for `package_id`, loading it once via `loader`.
+
+    `loader(package_id)` defaults to the API client's get_staged_entities.
+    Concurrent callers for the same package wait for a single load.
+    Loader exceptions propagate and nothing is cached.
+    """
+    with _registry_lock:
+        snapshot = None if refresh else _snapshots.get(package_id)
+        if snapshot is not None:
+            _snapshots.move_to_end(package_id)
+            return snapshot
+        load_lock = _load_locks.setdefault(package_id, threading.Lock())
+
+    with load_lock:
+        with _registry_lock:
+            snapshot = None if refresh else _snapshots.get(package_id)
+        if snapshot is not None:
+            return snapshot
+
+        if loader is None:
+            from services.api_client import get_api_client
+            loader = get_api_client().get_staged_entities
+        snapshot = StagedSnapshot(package_id, loader(package_id))
+
+        with _registry_lock:
+            _snapshots[package_id] = snapshot
+            _snapshots.move_to_end(package_id)
+            while len(_snapshots) > MAX_SNAPSHOTS:
+                old_id, _ = _snapshots.popitem(last=False)
+                _load_locks.pop(old_id, None)
+        logger.debug(f"Staged snapshot loaded for package {package_id}: {len(snapshot)} rows")
+        return snapshot
+
+
+def peek_staged_snapshot(package_id: str) -> Optional[StagedSnapshot]:
+    """The cached snapshot for `package_id`, without loading it."""
+    with _registry_lock:
+        return _snapshots.get(package_id)
+
+
+def release_staged_snapshot(package_id: str = None):
+    """Drop the snapshot of one package (or all when `package_id` is None)."""
+    with _registry_lock:
+        if package_id is None:
+            _snapshots.clear()
+            _load_locks.clear()
+        elif _snapshots.pop(package_id, None) is not None:
+            _load_locks.pop(package_id, None)
+            logger.debug(f"Staged snapshot released for package {package_id}")
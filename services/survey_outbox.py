@@ -0,0 +1,549 @@
+# -*- coding: utf-8 -*-
+"""
+Offline-first outbox for the office survey wizard.
+
+The wizard used to wait on a backend round trip at almost every step and
+lost the change when the link dropped. Its mutations now go to a SQLite
+journal (DATA_DIR/survey_outbox.db) and are applied optimistically: the
+step has already updated the SurveyContext and moves on, while a
+background thread replays the journal against the API in order.
+
+  * updates / deletes / uploads are journaled and return immediately;
+  * creates whose id the next steps need (contact person, household,
+    relation) are sent directly once the survey's journal is drained; when
+    the link is down they are journaled too and get a local id
+    ("local-<hex>"), replaced by the server id in every pending entry once
+    the create is flushed (listeners receive an "id_mapped" event so the
+    wizard can update its context);
+  * successive updates to the same entity are coalesced into one call
+    (patch-style payloads are merged), and a delete drops the entity's
+    pending updates, or the whole entity if its create was never sent;
+  * entries survive a crash or restart and are replayed after login. An
+    entry is removed only once the server acknowledged it, so a call cut
+    off mid-request is sent again (at-least-once);
+  * network errors, 401/408/429 and 5xx are retried with backoff; any other
+    API error marks the entry failed and holds back the rest of that
+    survey's journal until the entity is saved again (which replaces the
+    failed payload) or the survey is discarded;
+  * status(survey_id) reports the per-survey sync state: "synced",
+    "pending", "offline" or "error";
+  * create() and wait_until_synced() may wait up to DRAIN_TIMEOUT for the
+    journal to drain: the GUI calls create_async() / when_synced(), which
+    wait on the shared task executor and call back on the GUI thread.
+
+Usage:
+    outbox = get_survey_outbox()
+    outbox.enqueue(survey_id, "update_household", household_id, data, survey_id=survey_id)
+    outbox.create_async(survey_id, "create_household", data, survey_id=survey_id,
+                        on_result=self._on_created, on_error=self._on_create_failed)
+    outbox.when_synced(survey_id, self._finalize_if_synced)  # callback(bool)
+"""
+
+import inspect
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+LOCAL_ID_PREFIX = "local-"
+
+# Seconds create()/wait_until_synced() wait for the journal to drain
+DRAIN_TIMEOUT = 15.0
+_MAX_BACKOFF = 60.0
+_ID_MAP_RETENTION_DAYS = 30
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    survey_id TEXT NOT NULL,
+    op TEXT NOT NULL,
+    entity TEXT,
+    local_id TEXT,
+    kwargs TEXT NOT NULL,
+    state TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_outbox_survey ON outbox(survey_id, seq);
+CREATE TABLE IF NOT EXISTS id_map (
+    local_id TEXT PRIMARY KEY,
+    server_id TEXT NOT NULL,
+    survey_id TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+"""
+
+
+class _Operation(NamedTuple):
+    kind: str                  # create | update | delete | call
+    entity: str                # entity type used for coalescing
+    id_arg: Optional[str]      # argument holding the entity id (None for creates)
+    merge: bool = False        # update payloads are patches: merge instead of replace
+    id_keys: Tuple[str, ...] = ()  # response keys holding a created entity's id
+
+
+# ApiClient methods the wizard may journal. Contact persons are persons.
+OPERATIONS: Dict[str, _Operation] = {
+    "create_contact_person": _Operation("create", "person", None, id_keys=("id", "contactPersonId")),
+    "update_contact_person": _Operation("update", "person", "person_id"),
+    "update_person_in_survey": _Operation("update", "person", "person_id"),
+    "delete_person": _Operation("delete", "person", "person_id"),
+    "upload_identification_document": _Operation("call", "person", "person_id"),
+    "create_household": _Operation("create", "household", None, id_keys=("id", "householdId")),
+    "update_household": _Operation("update", "household", "household_id"),
+    "delete_household": _Operation("delete", "household", "household_id"),
+    "link_person_to_unit": _Operation("create", "relation", None,
+                                      id_keys=("id", "relationId", "personPropertyRelationId")),
+    "update_relation": _Operation("update", "relation", "relation_id", merge=True),
+    "delete_relation": _Operation("delete", "relation", "relation_id"),
+    "upload_relation_document": _Operation("call", "relation", "relation_id"),
+    "link_evidence_to_relation": _Operation("call", "relation", "relation_id"),
+    "save_draft_to_backend": _Operation("update", "draft", "survey_id", merge=True),
+}
+
+
+def is_local_id(value) -> bool:
+    return isinstance(value, str) and value.startswith(LOCAL_ID_PREFIX)
+
+
+def _bind(op: str, args: tuple, kwargs: dict) -> Dict[str, Any]:
+    """Map a call's positional and keyword arguments to parameter names."""
+    from services.api_client import TRRCMSApiClient
+    signature = inspect.signature(getattr(TRRCMSApiClient, op))
+    bound = signature.bind(None, *args, **kwargs)
+    arguments = dict(bound.arguments)
+    arguments.pop(next(iter(signature.parameters)))  # self
+    return arguments
+
+
+def is_transient_error(error: Exception) -> bool:
+    """Whether a failed call is worth retrying (network, auth refresh, throttling, 5xx)."""
+    from services.exceptions import ApiException, NetworkException
+    if isinstance(error, NetworkException):
+        return True
+    if isinstance(error, ApiException):
+        status = error.status_code or 0
+        return status in (0, 401, 408, 429) or status >= 500
+    try:
+        import requests
+        return isinstance(error, (requests.RequestException, OSError))
+    except ImportError:
+        return isinstance(error, OSError)
+
+
+class _Entry(NamedTuple):
+    seq: int
+    survey_id: str
+    op: str
+    entity: Optional[str]
+    local_id: Optional[str]
+    kwargs: Dict[str, Any]
+    attempts: int
+
+
+class SurveyOutbox:
+    """Durable, ordered journal of survey mutations with a background flusher."""
+
+    def __init__(self, db_path: Path = None):
+        from app.config import Config
+        self._path = Path(db_path) if db_path else Config.DATA_DIR / "survey_outbox.db"
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._cond = threading.Condition(threading.RLock())
+        self._db = sqlite3.connect(str(self._path), check_same_thread=False)
+        self._db.executescript(_SCHEMA)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("DELETE FROM id_map WHERE created_at < ?",
+                         (time.time() - _ID_MAP_RETENTION_DAYS * 86400,))
+        self._db.commit()
+        self._id_map: Dict[str, str] = dict(self._db.execute("SELECT local_id, server_id FROM id_map"))
+        self._listeners: List[Callable[[str, str, Any], None]] = []
+        self._inflight: Optional[int] = None
+        self._retry_at = 0.0
+        self._offline = False
+        self._last_transient_at = 0.0
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+
+    # -- Journal -----------------------------------------------------------------
+
+    def enqueue(self, survey_id: str, op: str, /, *args, **kwargs) -> Optional[int]:
+        """
+        Journal ApiClient.<op>(*args, **kwargs) for `survey_id`.
+
+        Returns the entry's sequence number, or None when a delete cancelled
+        an entity that was never sent.
+        """
+        spec = OPERATIONS[op]
+        if spec.kind == "create":
+            raise ValueError(f"{op} is a create: use create()")
+        arguments = self.resolve(_bind(op, args, kwargs))
+        entity_id = arguments.get(spec.id_arg) if spec.id_arg else None
+        entity = f"{spec.entity}:{entity_id}" if entity_id else None
+
+        seq = None
+        with self._cond:
+            with self._db:
+                if spec.kind == "update" and entity:
+                    arguments = self._coalesce(survey_id, op, entity, arguments, spec.merge)
+                if spec.kind == "delete" and entity and self._drop_entity(survey_id, entity, entity_id):
+                    logger.info(f"Outbox: {entity} was never sent, delete dropped")
+                else:
+                    seq = self._insert(survey_id, op, entity, None, arguments)
+                    self._start_flusher()
+            self._cond.notify_all()
+        self._notify(survey_id, "state", self.status(survey_id))
+        return seq
+
+    def create(self, survey_id: str, op: str, /, *args, drain_timeout: float = DRAIN_TIMEOUT,
+               **kwargs) -> Dict[str, Any]:
+        """
+        Run a create whose response id the caller needs.
+
+        Sent directly once the survey's journal is drained, so API errors
+        (e.g. 409 duplicate) reach the caller as before. If the journal does
+        not drain in time or the link is down, the create is journaled and
+        {"id": "local-...", "queued": True} is returned instead.
+        """
+        from services.exceptions import NetworkException
+        spec = OPERATIONS[op]
+        if spec.kind != "create":
+            raise ValueError(f"{op} is not a create")
+        arguments = self.resolve(_bind(op, args, kwargs))
+
+        if self.wait_until_synced(survey_id, drain_timeout):
+            from services.api_client import get_api_client
+            try:
+                return getattr(get_api_client(), op)(**arguments)
+            except NetworkException as e:
+                logger.warning(f"Outbox: {op} failed on network ({e}), journaling it")
+                with self._cond:
+                    self._mark_offline()
+
+        local_id = f"{LOCAL_ID_PREFIX}{uuid.uuid4().hex}"
+        with self._cond:
+            with self._db:
+                self._insert(survey_id, op, f"{spec.entity}:{local_id}", local_id, arguments)
+            self._start_flusher()
+            self._cond.notify_all()
+        self._notify(survey_id, "state", self.status(survey_id))
+        return {"id": local_id, "queued": True}
+
+    def create_async(self, survey_id: str, op: str, /, *args,
+                     on_result: Callable[[Dict[str, Any]], None],
+                     on_error: Callable[[Exception], None] = None, **kwargs):
+        """
+        create() on the task executor, for the GUI thread.
+
+        on_result(response) / on_error(exception) are called on the GUI
+        thread. Returns the TaskHandle.
+        """
+        from services.task_executor import get_task_executor
+        return get_task_executor().submit(self.create, survey_id, op, *args,
+                                          on_result=on_result, on_error=on_error, **kwargs)
+
+    def _insert(self, survey_id, op, entity, local_id, arguments) -> int:
+        cursor = self._db.execute(
+            "INSERT INTO outbox (survey_id, op, entity, local_id, kwargs, created_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (survey_id, op, entity, local_id,
+             json.dumps(arguments, ensure_ascii=False, default=str), time.time()),
+        )
+        return cursor.lastrowid
+
+    def _coalesce(self, survey_id, op, entity, arguments, merge) -> Dict[str, Any]:
+        """Fold a previous unsent update of the same entity into this one."""
+        row = self._db.execute(
+            "SELECT seq, kwargs FROM outbox WHERE survey_id = ? AND op = ? AND entity = ? "
+            "AND seq IS NOT ? ORDER BY seq DESC LIMIT 1",
+            (survey_id, op, entity, self._inflight),
+        ).fetchone()
+        if row is None:
+            return arguments
+        if merge:
+            previous = json.loads(row[1])
+            for name, value in arguments.items():
+                if isinstance(value, dict) and isinstance(previous.get(name), dict):
+                    arguments[name] = {**previous[name], **value}
+        # The new entry goes to the tail: anything it refers to is queued before it
+        self._db.execute("DELETE FROM outbox WHERE seq = ?", (row[0],))
+        logger.debug(f"Outbox: coalesced {op} on {entity}")
+        return arguments
+
+    def _drop_entity(self, survey_id, entity, entity_id) -> bool:
+        """Drop unsent entries of a deleted entity. True if its create was never sent."""
+        self._db.execute(
+            "DELETE FROM outbox WHERE survey_id = ? AND entity = ? AND local_id IS NULL AND seq IS NOT ?",
+            (survey_id, entity, self._inflight),
+        )
+        if not is_local_id(entity_id):
+            return False
+        create = self._db.execute(
+            "SELECT seq FROM outbox WHERE local_id = ?", (entity_id,)).fetchone()
+        if create is None or create[0] == self._inflight:
+            return False
+        # Never created on the server: drop it and everything referring to it
+        self._db.execute(
+            "DELETE FROM outbox WHERE survey_id = ? AND (local_id = ? OR kwargs LIKE ?)",
+            (survey_id, entity_id, f'%"{entity_id}"%'),
+        )
+        return True
+
+    # -- Ids ---------------------------------------------------------------------
+
+    def resolve(self, value):
+        """Replace local ids that were already created on the server (recursive)."""
+        if isinstance(value, str):
+            return self._id_map.get(value, value) if is_local_id(value) else value
+        if isinstance(value, dict):
+            return {k: self.resolve(v) for k, v in value.items()}
+        if isinstance(value, (list, tuple)):
+            return type(value)(self.resolve(v) for v in value)
+        return value
+
+    def _map_id(self, entry: _Entry, server_id: str):
+        """Record local -> server id and rewrite the pending entries that use it."""
+        local_id = entry.local_id
+        self._db.execute(
+            "INSERT OR REPLACE INTO id_map (local_id, server_id, survey_id, created_at) VALUES (?, ?, ?, ?)",
+            (local_id, server_id, entry.survey_id, time.time()),
+        )
+        self._db.execute(
+            "UPDATE outbox SET kwargs = replace(kwargs, ?, ?), entity = replace(entity, ?, ?) "
+            "WHERE kwargs LIKE ? OR entity LIKE ?",
+            (f'"{local_id}"', json.dumps(server_id), local_id, server_id,
+             f'%"{local_id}"%', f"%{local_id}"),
+        )
+        self._id_map[local_id] = server_id
+
+    # -- Status ------------------------------------------------------------------
+
+    def status(self, survey_id: str) -> Dict[str, Any]:
+        """Sync state of one survey: state, pending/failed counts and last error."""
+        with self._cond:
+            pending, failed = self._db.execute(
+                "SELECT COALESCE(SUM(state = 'pending'), 0), COALESCE(SUM(state = 'failed'), 0) "
+                "FROM outbox WHERE survey_id = ?",
+                (survey_id,),
+            ).fetchone()
+            row = self._db.execute(
+                "SELECT last_error FROM outbox WHERE survey_id = ? AND last_error IS NOT NULL "
+                "ORDER BY state = 'failed' DESC, seq LIMIT 1",
+                (survey_id,),
+            ).fetchone()
+            offline = self._offline
+        if failed:
+            state = "error"
+        elif pending:
+            state = "offline" if offline else "pending"
+        else:
+            state = "synced"
+        return {"state": state, "pending": pending, "failed": failed,
+                "last_error": row[0] if row else None}
+
+    def pending_surveys(self) -> List[str]:
+        with self._cond:
+            return [r[0] for r in self._db.execute("SELECT DISTINCT survey_id FROM outbox")]
+
+    def wait_until_synced(self, survey_id: str, timeout: float = DRAIN_TIMEOUT) -> bool:
+        """
+        Block until every entry of `survey_id` reached the server.
+
+        Retries immediately instead of waiting for the backoff. Returns False
+        on timeout, when an entry failed, or when the retry hit the network
+        again.
+        """
+        deadline = time.monotonic() + timeout
+        kicked_at = time.time()
+        with self._cond:
+            if not self._has_entries(survey_id):
+                return True
+            self._retry_at = 0.0
+            self._start_flusher()
+            self._cond.notify_all()
+            while True:
+                if not self._has_entries(survey_id):
+                    return True
+                if self._has_entries(survey_id, "failed") or self._last_transient_at > kicked_at:
+                    return False
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+
+    def when_synced(self, survey_id: str, callback: Callable[[bool], None],
+                    timeout: float = DRAIN_TIMEOUT):
+        """
+        wait_until_synced() on the task executor, for the GUI thread.
+
+        callback(synced) is called on the GUI thread. Returns the TaskHandle.
+        """
+        from services.task_executor import get_task_executor
+        return get_task_executor().submit(self.wait_until_synced, survey_id, timeout,
+                                          on_result=callback, on_error=lambda e: callback(False))
+
+    def _has_entries(self, survey_id: str, state: str = None) -> bool:
+        query = "SELECT 1 FROM outbox WHERE survey_id = ?"
+        params = [survey_id]
+        if state:
+            query += " AND state = ?"
+            params.append(state)
+        return self._db.execute(query + " LIMIT 1", params).fetchone() is not None
+
+    def discard(self, survey_id: str) -> int:
+        """Drop every unsent entry of a survey (e.g. the survey was deleted)."""
+        with self._cond:
+            with self._db:
+                count = self._db.execute(
+                    "DELETE FROM outbox WHERE survey_id = ? AND seq IS NOT ?",
+                    (survey_id, self._inflight),
+                ).rowcount
+            self._cond.notify_all()
+        self._notify(survey_id, "state", self.status(survey_id))
+        return count
+
+    # -- Listeners ---------------------------------------------------------------
+
+    def add_listener(self, callback: Callable[[str, str, Any], None]):
+        """
+        callback(survey_id, event, data), called from any thread:
+        ("state", status dict) or ("id_mapped", (local_id, server_id)).
+        """
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+
+    def remove_listener(self, callback):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _notify(self, survey_id, event, data):
+        for callback in list(self._listeners):
+            try:
+                callback(survey_id, event, data)
+            except Exception as e:
+                logger.warning(f"Outbox listener failed: {e}")
+
+    # -- Flusher -----------------------------------------------------------------
+
+    def resume(self):
+        """Replay entries left from a previous session (call after login)."""
+        surveys = self.pending_surveys()
+        if surveys:
+            logger.info(f"Outbox: resuming {len(surveys)} survey(s) with unsent changes")
+            with self._cond:
+                self._retry_at = 0.0
+                self._start_flusher()
+                self._cond.notify_all()
+
+    def stop(self, timeout: float = 2.0):
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def _start_flusher(self):
+        if self._thread is None and not self._stopped:
+            self._thread = threading.Thread(target=self._flush_loop, name="survey-outbox", daemon=True)
+            self._thread.start()
+
+    def _mark_offline(self):
+        self._offline = True
+        self._last_transient_at = time.time()
+
+    def _next_entry(self) -> Optional[_Entry]:
+        """Oldest pending entry of a survey that is not held back by a failed one."""
+        row = self._db.execute(
+            "SELECT seq, survey_id, op, entity, local_id, kwargs, attempts FROM outbox "
+            "WHERE state = 'pending' AND survey_id NOT IN "
+            "(SELECT survey_id FROM outbox WHERE state = 'failed') ORDER BY seq LIMIT 1"
+        ).fetchone()
+        if row is None:
+            return None
+        return _Entry(row[0], row[1], row[2], row[3], row[4], json.loads(row[5]), row[6])
+
+    def _flush_loop(self):
+        while True:
+            with self._cond:
+                while True:
+                    if self._stopped:
+                        return
+                    delay = self._retry_at - time.time()
+                    entry = self._next_entry() if delay <= 0 else None
+                    if entry is not None:
+                        break
+                    self._cond.wait(delay if delay > 0 else None)
+                self._inflight = entry.seq
+            try:
+                self._send(entry)
+            finally:
+                with self._cond:
+                    self._inflight = None
+                    self._cond.notify_all()
+
+    def _send(self, entry: _Entry):
+        from services.api_client import get_api_client
+        from services.exceptions import humanize_exception
+        from services.upload_pipeline import UPLOAD_OPERATIONS, get_upload_pipeline
+        try:
+            if entry.op in UPLOAD_OPERATIONS:
+                # Hash skip: a replayed upload the server already took is not sent twice
+                response = get_upload_pipeline().send(entry.op, entry.kwargs)
+            else:
+                response = getattr(get_api_client(), entry.op)(**entry.kwargs)
+        except Exception as e:
+            transient = is_transient_error(e)
+            with self._cond:
+                with self._db:
+                    self._db.execute(
+                        "UPDATE outbox SET attempts = attempts + 1, last_error = ?, state = ? WHERE seq = ?",
+                        (humanize_exception(e), "pending" if transient else "failed", entry.seq),
+                    )
+                if transient:
+                    self._mark_offline()
+                    self._retry_at = time.time() + min(_MAX_BACKOFF, 2.0 ** min(entry.attempts, 6))
+            if transient:
+                logger.warning(f"Outbox: {entry.op} for survey {entry.survey_id} deferred: {e}")
+            else:
+                logger.error(f"Outbox: {entry.op} for survey {entry.survey_id} rejected: {e}")
+            self._notify(entry.survey_id, "state", self.status(entry.survey_id))
+            return
+
+        server_id = None
+        if entry.local_id:
+            spec = OPERATIONS[entry.op]
+            if isinstance(response, dict):
+                server_id = next((response[k] for k in spec.id_keys if response.get(k)), None)
+            if not server_id:
+                logger.error(f"Outbox: {entry.op} returned no id; {entry.local_id} stays unresolved")
+        with self._cond:
+            with self._db:
+                self._db.execute("DELETE FROM outbox WHERE seq = ?", (entry.seq,))
+                if server_id:
+                    self._map_id(entry, str(server_id))
+            self._offline = False
+        logger.debug(f"Outbox: {entry.op} for survey {entry.survey_id} sent")
+        if server_id:
+            self._notify(entry.survey_id, "id_mapped", (entry.local_id, str(server_id)))
+        self._notify(entry.survey_id, "state", self.status(entry.survey_id))
+
+
+_outbox: Optional[SurveyOutbox] = None
+_outbox_lock = threading.Lock()
+
+
+def get_survey_outbox() -> SurveyOutbox:
+    """The process-wide survey outbox."""
+    global _outbox
+    with _outbox_lock:
+        if _outbox is None:
+            _outbox = SurveyOutbox()
+        return _outbox
@@ -0,0 +1,406 @@
+# -*- coding: utf-8 -*-
+"""
+Shared background task executor.
+
+One bounded pool of worker threads runs every background call of the UI
+(ApiWorker is a thin facade over it) instead of a new QThread per call:
+
+  * priorities: INTERACTIVE work (what the user is waiting for) is always
+    dequeued before NORMAL and BACKGROUND prefetch work, and background
+    tasks never occupy the last free worker;
+  * cancellation: every task has a CancellationToken; long-running
+    callables can poll current_token() and stop early;
+  * supersession: tasks submitted with the same key ("latest wins")
+    cancel their predecessor, so only the newest search delivers;
+  * delivery: results and errors reach the GUI thread through a single
+    queued-signal dispatcher; cancelled tasks never call back;
+  * metrics: queue depth, counters and queue-wait / run latencies
+    (stats(), log_stats()).
+
+Usage:
+    executor = get_task_executor()
+    handle = executor.submit(api.search, text, key="buildings.search",
+                             on_result=self._show, on_error=self._fail)
+    handle.cancel()
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from collections import deque
+from enum import IntEnum
+from typing import Any, Callable, Dict, List, Optional
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_LATENCY_SAMPLES = 512
+
+
+class Priority(IntEnum):
+    """Lower value runs first."""
+    INTERACTIVE = 0
+    NORMAL = 1
+    BACKGROUND = 2
+
+
+class TaskCancelled(Exception):
+    """Raised by CancellationToken.raise_if_cancelled()."""
+
+
+class CancellationToken:
+    """Cooperative cancellation flag shared by a task and its submitter."""
+
+    __slots__ = ("_event", "reason")
+
+    def __init__(self):
+        self._event = threading.Event()
+        self.reason = ""
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self, reason: str = "cancelled"):
+        if not self._event.is_set():
+            self.reason = reason
+            self._event.set()
+
+    def raise_if_cancelled(self):
+        if self._event.is_set():
+            raise TaskCancelled(self.reason)
+
+
+_local = threading.local()
+_NEVER_CANCELLED = CancellationToken()
+
+
+def current_token() -> CancellationToken:
+    """Token of the task running on this thread (a never-cancelled one elsewhere)."""
+    return getattr(_local, "token", None) or _NEVER_CANCELLED
+
+
+class TaskHandle:
+    """Returned by submit(): cancel the task or wait for it."""
+
+    __slots__ = ("func", "args", "kwargs", "priority", "key", "token",
+                 "on_result", "on_error", "submitted_at", "started_at", "_done")
+
+    def __init__(self, func, args, kwargs, priority, key, on_result, on_error):
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.priority = priority
+        self.key = key
+        self.token = CancellationToken()
+        self.on_result = on_result
+        self.on_error = on_error
+        self.submitted_at = time.perf_counter()
+        self.started_at = None
+        self._done = threading.Event()
+
+    def cancel(self, reason: str = "cancelled"):
+        self.token.cancel(reason)
+
+    @property
+    def cancelled(self) -> bool:
+        return self.token.cancelled
+
+    def done(self) -> bool:
+        """True once the task ran (or was dropped) and its callback is queued."""
+        return self._done.is_set()
+
+    def wait(self, timeout: float = None) -> bool:
+        return self._done.wait(timeout)
+
+
+class _Latency:
+    """Bounded sample window with avg/p95/max in milliseconds."""
+
+    def __init__(self):
+        self._samples = deque(maxlen=_LATENCY_SAMPLES)
+
+    def add(self, seconds: float):
+        self._samples.append(seconds * 1e3)
+
+    def summary(self) -> Dict[str, float]:
+        if not self._samples:
+            return {"avg": 0.0, "p95": 0.0, "max": 0.0}
+        ordered = sorted(self._samples)
+        return {
+            "avg": round(sum(ordered) / len(ordered), 2),
+            "p95": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 2),
+            "max": round(ordered[-1], 2),
+        }
+
+
+class _Dispatcher:
+    """Runs callbacks on the GUI thread through one queued Qt signal."""
+
+    def __init__(self):
+        self._emitter = None
+        try:
+            from PyQt5.QtCore import QCoreApplication, QObject, Qt, pyqtSignal
+
+            app = QCoreApplication.instance()
+            if app is None:
+                return
+
+            class _Emitter(QObject):
+                deliver = pyqtSignal(object)
+
+            self._emitter = _Emitter()
+            self._emitter.moveToThread(app.thread())
+            self._emitter.deliver.connect(self._run, Qt.QueuedConnection)
+        except ImportError:
+            pass
+
+    def post(self, callback: Callable[[], None]):
+        if self._emitter is not None:
+            self._emitter.deliver.emit(callback)
+        else:  # no Qt event loop (scripts, benchmarks): call back inline
+            self._run(callback)
+
+    @staticmethod
+    def _run(callback):
+        try:
+            callback()
+        except Exception as e:
+            logger.error(f"Task callback failed: {e}", exc_info=True)
+
+
+class TaskExecutor:
+    """Bounded, prioritized thread pool with supersession and GUI-thread delivery."""
+
+    def __init__(self, max_workers: int = 4):
+        self._max_workers = max(1, max_workers)
+        self._cond = threading.Condition()
+        self._heap: List = []
+        self._seq = itertools.count()
+        self._latest: Dict[str, TaskHandle] = {}
+        self._threads: List[threading.Thread] = []
+        self._running = 0
+        self._running_background = 0
+        self._shutdown = False
+        self._dispatcher = None
+        self._counters = {"submitted": 0, "completed": 0, "failed": 0,
+                          "cancelled": 0, "superseded": 0}
+        self._wait_latency = _Latency()
+        self._run_latency = _Latency()
+
+    # -- Submission ------------------------------------------------------------
+
+    def submit(self, func: Callable, *args, priority: Priority = Priority.INTERACTIVE,
+               key: str = None, on_result: Callable[[Any], None] = None,
+               on_error: Callable[[Exception], None] = None, **kwargs) -> TaskHandle:
+        """
+        Queue func(*args, **kwargs).
+
+        on_result / on_error are called on the GUI thread unless the task
+        was cancelled first. A task submitted with `key` cancels the
+        previous task with the same key.
+        """
+        if self._dispatcher is None:
+            self._dispatcher = _Dispatcher()
+        handle = TaskHandle(func, args, kwargs, Priority(priority), key, on_result, on_error)
+        with self._cond:
+            if self._shutdown:
+                raise RuntimeError("TaskExecutor is shut down")
+            if key is not None:
+                # Still queued, running or with its result not yet delivered
+                previous = self._latest.get(key)
+                if previous is not None:
+                    previous.cancel("superseded")
+                    self._counters["superseded"] += 1
+                self._latest[key] = handle
+            heapq.heappush(self._heap, (handle.priority, next(self._seq), handle))
+            self._counters["submitted"] += 1
+            if len(self._threads) < self._max_workers and len(self._heap) > self._idle_workers():
+                self._spawn_worker()
+            self._cond.notify()
+        return handle
+
+    def cancel(self, key: str) -> bool:
+        """Cancel the latest task submitted with `key`. Returns True if one was pending/running."""
+        with self._cond:
+            handle = self._latest.get(key)
+        if handle is None or handle.done():
+            return False
+        handle.cancel()
+        return True
+
+    # -- Metrics -----------------------------------------------------------------
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth per priority, running tasks, counters and latencies (ms)."""
+        with self._cond:
+            queued = {p.name.lower(): 0 for p in Priority}
+            for priority, _, handle in self._heap:
+                if not handle.cancelled:
+                    queued[Priority(priority).name.lower()] += 1
+            return {
+                "workers": len(self._threads),
+                "max_workers": self._max_workers,
+                "running": self._running,
+                "queued": queued,
+                **self._counters,
+                "queue_wait_ms": self._wait_latency.summary(),
+                "run_ms": self._run_latency.summary(),
+            }
+
+    def log_stats(self):
+        s = self.stats()
+        logger.info(
+            f"TaskExecutor: {s['submitted']} submitted, {s['completed']} completed, "
+            f"{s['failed']} failed, {s['cancelled']} cancelled ({s['superseded']} superseded); "
+            f"queue wait avg {s['queue_wait_ms']['avg']} ms / p95 {s['queue_wait_ms']['p95']} ms, "
+            f"run avg {s['run_ms']['avg']} ms / p95 {s['run_ms']['p95']} ms"
+        )
+
+    # -- Shutdown ----------------------------------------------------------------
+
+    def shutdown(self, timeout: float = 2.0) -> int:
+        """
+        Cancel queued tasks and wait up to `timeout` seconds for running ones.
+        Returns the number of tasks still running when the timeout expired.
+        """
+        with self._cond:
+            self._shutdown = True
+            for _, _, handle in self._heap:
+                handle.cancel("shutdown")
+            self._heap.clear()
+            self._cond.notify_all()
+            threads = list(self._threads)
+        deadline = time.monotonic() + timeout
+        for thread in threads:
+            thread.join(max(0.0, deadline - time.monotonic()))
+        still_running = sum(t.is_alive() for t in threads)
+        if still_running:
+            logger.warning(f"TaskExecutor: {still_running} task(s) still running at shutdown")
+        return still_running
+
+    # -- Workers -----------------------------------------------------------------
+
+    def _idle_workers(self) -> int:
+        return len(self._threads) - self._running
+
+    def _spawn_worker(self):
+        thread = threading.Thread(target=self._worker_loop, daemon=True,
+                                  name=f"task-worker-{len(self._threads) + 1}")
+        self._threads.append(thread)
+        thread.start()
+
+    def _next_task(self) -> Optional[TaskHandle]:
+        """Pop the best runnable task (called with the condition held)."""
+        while True:
+            if self._shutdown:
+                return None
+            deferred = []
+            picked = None
+            while self._heap:
+                entry = heapq.heappop(self._heap)
+                handle = entry[2]
+                if handle.cancelled:
+                    self._finish_dropped(handle)
+                    continue
+                # Keep one worker free for interactive work
+                if (handle.priority == Priority.BACKGROUND
+                        and self._running_background >= self._max_workers - 1
+                        and self._max_workers > 1):
+                    deferred.append(entry)
+                    continue
+                picked = handle
+                break
+            for entry in deferred:
+                heapq.heappush(self._heap, entry)
+            if picked is not None:
+                return picked
+            self._cond.wait()
+
+    def _worker_loop(self):
+        while True:
+            with self._cond:
+                handle = self._next_task()
+                if handle is None:
+                    return
+                self._running += 1
+                if handle.priority == Priority.BACKGROUND:
+                    self._running_background += 1
+            try:
+                self._run(handle)
+            finally:
+                with self._cond:
+                    self._running -= 1
+                    if handle.priority == Priority.BACKGROUND:
+                        self._running_background -= 1
+                    self._cond.notify_all()
+
+    def _run(self, handle: TaskHandle):
+        handle.started_at = time.perf_counter()
+        self._wait_latency.add(handle.started_at - handle.submitted_at)
+        _local.token = handle.token
+        try:
+            result = handle.func(*handle.args, **handle.kwargs)
+            error = None
+        except TaskCancelled:
+            result, error = None, None
+        except Exception as e:
+            result, error = None, e
+        finally:
+            _local.token = None
+        self._run_latency.add(time.perf_counter() - handle.started_at)
+
+        if handle.cancelled:
+            self._finish_dropped(handle)
+            return
+        with self._cond:
+            self._counters["failed" if error is not None else "completed"] += 1
+        callback = handle.on_error if error is not None else handle.on_result
+        value = error if error is not None else result
+
+        def deliver():
+            self._release(handle)
+            # A newer task may have superseded this one while the result was queued
+            if not handle.cancelled and callback is not None:
+                callback(value)
+
+        handle._done.set()
+        self._dispatcher.post(deliver)
+
+    def _finish_dropped(self, handle: TaskHandle):
+        with self._cond:
+            self._counters["cancelled"] += 1
+        handle._done.set()
+        self._release(handle)
+
+    def _release(self, handle: TaskHandle):
+        """Forget the handle as the latest of its key (drops callback references)."""
+        if handle.key is not None:
+            with self._cond:
+                if self._latest.get(handle.key) is handle:
+                    del self._latest[handle.key]
+
+
+_executor: Optional[TaskExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_task_executor() -> TaskExecutor:
+    """The process-wide executor used by ApiWorker."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            from app.config import Config
+            _executor = TaskExecutor(Config.TASK_EXECUTOR_WORKERS)
+        return _executor
+
+
+def shutdown_task_executor(timeout: float = 2.0) -> int:
+    """Shut the executor down if it was started (app exit)."""
+    executor = _executor
+    if executor is None:
+        return 0
+    executor.log_stats()
+    return executor.shutdown(timeout)
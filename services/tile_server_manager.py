@@ -55,7 +55,7 @@ class _ThreadPoolHTTPServer(HTTPServer):
 
 
 class TileServer(BaseHTTPRequestHandler):
-    """HTTP server to serve tiles from MBTiles file and static assets - OPTIMIZED."""
+    """HTTP server to serve tiles from MBTiles file, building vector tiles, boundary layers and static assets - OPTIMIZED."""
 
     mbtiles_path = None
     assets_path = None
@@ -109,6 +109,8 @@ class TileServer(BaseHTTPRequestHandler):
                 self._serve_static_file_cached(self.assets_path / 'MarkerCluster.css', 'text/css')
             elif path == '/MarkerCluster.Default.css':
                 self._serve_static_file_cached(self.assets_path / 'MarkerCluster.Default.css', 'text/css')
+            elif path == '/leaflet.vectortiles.js':
+                self._serve_static_file_cached(self.assets_path / 'leaflet.vectortiles.js', 'application/javascript')
             elif path.startswith('/images/'):
                 image_name = path[8:]
                 self._serve_static_file_cached(self.assets_path / 'images' / image_name, 'image/png')
@@ -122,6 +124,18 @@ class TileServer(BaseHTTPRequestHandler):
                 else:
                     self.send_response(404)
                     self.end_headers()
+            elif path.startswith('/vtiles/'):
+                parts = path.split('/')
+                if len(parts) >= 5 and parts[4].endswith('.pbf'):
+                    z = int(parts[2])
+                    x = int(parts[3])
+                    y = int(parts[4][:-4])
+                    self._serve_vector_tile(z, x, y)
+                else:
+                    self.send_response(404)
+                    self.end_headers()
+            elif path.startswith('/boundaries/') and path.endswith('.geojson'):
+                self._serve_boundaries(path[len('/boundaries/'):-len('.geojson')], self.path.partition('?')[2])
             elif path == '/qwebchannel.js':
                 # Serve Qt WebChannel JavaScript file
                 self._serve_qwebchannel()
@@ -338,6 +352,70 @@ class TileServer(BaseHTTPRequestHandler):
         else:
             self._send_empty_tile()
 
+    def _serve_vector_tile(self, z, x, y):
+        """Serve a building vector tile (MVT) with ETag revalidation."""
+        from services.vector_tile_service import get_vector_tile_service, valid_tile
+
+        if not valid_tile(z, x, y):
+            self.send_response(404)
+            self.end_headers()
+            return
+
+        data, etag = get_vector_tile_service().get_tile(z, x, y)
+        try:
+            if self.headers.get('If-None-Match') == etag:
+                self.send_response(304)
+                self.send_header('ETag', etag)
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/vnd.mapbox-vector-tile')
+            self.send_header('Access-Control-Allow-Origin', '*')
+            # Buildings change: the browser revalidates every tile against the ETag.
+            self.send_header('Cache-Control', 'no-cache')
+            self.send_header('ETag', etag)
+            self.send_header('Content-Length', len(data))
+            self.end_headers()
+            self.wfile.write(data)
+        except (ConnectionAbortedError, ConnectionResetError, BrokenPipeError):
+            # Connection closed by client - ignore
+            pass
+
+    def _serve_boundaries(self, level, query):
+        """Serve boundary features for ?bbox=w,s,e,n&z=zoom, simplified for that zoom."""
+        from urllib.parse import parse_qs
+        from services import boundary_service
+
+        params = parse_qs(query)
+        try:
+            bbox = [float(v) for v in params['bbox'][0].split(',')] if 'bbox' in params else None
+            zoom = float(params['z'][0]) if 'z' in params else None
+            if bbox is not None and len(bbox) != 4:
+                raise ValueError(bbox)
+        except ValueError:
+            self.send_response(400)
+            self.end_headers()
+            return
+
+        layer = boundary_service.get_layer(level)
+        if layer is None:
+            self.send_response(404)
+            self.end_headers()
+            return
+
+        data = layer.to_geojson(bbox, zoom).encode('utf-8')
+        try:
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/geo+json; charset=utf-8')
+            self.send_header('Access-Control-Allow-Origin', '*')
+            self.send_header('Cache-Control', 'public, max-age=3600')
+            self.send_header('Content-Length', len(data))
+            self.end_headers()
+            self.wfile.write(data)
+        except (ConnectionAbortedError, ConnectionResetError, BrokenPipeError):
+            # Connection closed by client - ignore
+            pass
+
     def _send_tile(self, tile_data):
         """Send tile data with proper headers."""
         try:
@@ -367,6 +367,9 @@ AR_TRANSLATIONS = {
     "wizard.error.finalize_failed": "فشل في إنهاء المسح:\n\n{error_msg}",
     "wizard.error.save_draft_failed": "حدث خطأ أثناء حفظ المسودة:\n{details}",
     "wizard.error.load_draft_failed": "حدث خطأ أثناء تحميل المسودة:\n{details}",
+    "wizard.sync.pending_changes": "لم تصل بعض تعديلات المسح إلى الخادم بعد.\nتحقق من الاتصال وحاول مجدداً.",
+    "wizard.sync.failed": "رفض الخادم أحد تعديلات المسح: {error_msg}",
+    "wizard.upload.progress": "جارٍ رفع المستندات {done}/{total} ({percent}%)",
     "wizard.confirm.cancel": "هل أنت متأكد من إلغاء المسح؟\nسيتم فقد جميع البيانات المدخلة.",
     "wizard.confirm.cancel_message": "هل أنت متأكد من إلغاء المسح؟\nسيتم فقد جميع البيانات المدخلة.",
     "wizard.confirm.cancel_title": "تأكيد الإلغاء",
@@ -2850,6 +2853,7 @@ AR_TRANSLATIONS = {
     "wizard.import.processing.conflicts_title": "توجد تعارضات تحتاج إلى حل",
     "wizard.import.processing.conflicts_detail": "تم كشف تكرارات بين بيانات الحزمة وقاعدة البيانات الرئيسية. يجب حلها قبل الإدخال.",
     "wizard.import.processing.conflicts_summary": "عدد التعارضات: {count}",
+    "wizard.import.local_duplicates_found": "تعذّر كشف التكرارات على الخادم. عثر الفحص المحلي على {count} من التكرارات المحتملة في هذه الحزمة.",
     "wizard.import.processing.resolve_conflicts_btn": "حل التعارضات الآن",
     "wizard.import.processing.ready_title": "الحزمة جاهزة للإدخال",
     "wizard.import.processing.ready_detail": "انتقل إلى الخطوة التالية لمراجعة البيانات واعتماد الإدخال.",
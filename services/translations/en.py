@@ -367,6 +367,9 @@ EN_TRANSLATIONS = {
     "wizard.error.finalize_failed": "Failed to finalize survey:\n\n{error_msg}",
     "wizard.error.save_draft_failed": "Error saving draft:\n{details}",
     "wizard.error.load_draft_failed": "Error loading draft:\n{details}",
+    "wizard.sync.pending_changes": "Some survey changes have not reached the server yet.\nCheck the connection and try again.",
+    "wizard.sync.failed": "A survey change was rejected by the server: {error_msg}",
+    "wizard.upload.progress": "Uploading documents {done}/{total} ({percent}%)",
     "wizard.confirm.cancel": "Are you sure you want to cancel the survey?\nAll entered data will be lost.",
     "wizard.confirm.cancel_message": "Are you sure you want to cancel the survey?\nAll entered data will be lost.",
     "wizard.confirm.cancel_title": "Confirm Cancel",
@@ -2849,6 +2852,7 @@ EN_TRANSLATIONS = {
     "wizard.import.processing.conflicts_title": "Conflicts need to be resolved",
     "wizard.import.processing.conflicts_detail": "Duplicates were detected between this package and production data. Resolve them before importing.",
     "wizard.import.processing.conflicts_summary": "Unresolved conflicts: {count}",
+    "wizard.import.local_duplicates_found": "Server duplicate detection failed. A local check found {count} possible duplicates in this package.",
     "wizard.import.processing.resolve_conflicts_btn": "Resolve Conflicts Now",
     "wizard.import.processing.ready_title": "Package is ready for import",
     "wizard.import.processing.ready_detail": "Move to the next step to review data and approve the import.",
@@ -27,6 +27,7 @@ SCHEMA_VERSION = "1.0.0"
 FORM_SCHEMA_VERSION = "1.0.0"
 MAX_CONTAINER_SIZE_MB = 500  # Maximum size before splitting
 SIGNATURE_KEY = b"UN-HABITAT-TRRCMS-2025"  # In production, use secure key management
+_DEDUP_TABLES = ("persons", "buildings", "units", "property_units")
 
 
 @dataclass
@@ -75,6 +76,8 @@ class UHCContainerService:
         self.vocab_repo = vocab_repo
         self.attachment_path = Path(attachment_storage_path) if attachment_storage_path else Path("attachments")
         self.device_id = self._get_device_id()
+        # staging_id -> {table: [row dicts]} for tables checked for duplicates
+        self._staged_records: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
 
     def _get_device_id(self) -> str:
         """Get unique device identifier."""
@@ -878,6 +881,10 @@ class UHCContainerService:
                         staging_id
                     )
                     result["record_counts"][table_name] = len(rows)
+                    if table_name in _DEDUP_TABLES:
+                        self._staged_records.setdefault(staging_id, {})[table_name] = [
+                            dict(zip(columns, row)) for row in rows
+                        ]
 
             # Extract attachments
             try:
@@ -890,8 +897,43 @@ class UHCContainerService:
         finally:
             conn.close()
 
+        self._check_building_locations(staging_id, result)
         return result
 
+    def _check_building_locations(self, staging_id: str, result: Dict[str, Any]):
+        """Warn about staged buildings located outside every neighborhood or in another one.
+
+        Uses the offline boundary index in one batch; skipped when no index is available.
+        """
+        buildings = self._staged_records.get(staging_id, {}).get("buildings") or []
+        located = [b for b in buildings if b.get("latitude") is not None and b.get("longitude") is not None]
+        if not located:
+            return
+        try:
+            from services.reverse_geocoder import API_NEIGHBORHOODS, get_reverse_geocoder
+            geocoder = get_reverse_geocoder()
+            if not geocoder.has_index(API_NEIGHBORHOODS):
+                return
+            found = geocoder.lookup_many(
+                [(float(b["longitude"]), float(b["latitude"])) for b in located], API_NEIGHBORHOODS
+            )
+        except Exception as e:
+            logger.warning(f"Building location check skipped: {e}")
+            return
+
+        outside = mismatched = 0
+        for building, props in zip(located, found):
+            if props is None:
+                outside += 1
+            else:
+                code = building.get("neighborhood_code")
+                if code and props.get("neighborhoodCode") not in (None, code):
+                    mismatched += 1
+        if outside:
+            result["warnings"].append(f"{outside} building(s) located outside all known neighborhoods")
+        if mismatched:
+            result["warnings"].append(f"{mismatched} building(s) located in a different neighborhood than their code")
+
     def _insert_to_staging_table(
         self,
         table_name: str,
@@ -929,14 +971,25 @@ class UHCContainerService:
                 f.write(data)
 
     def _detect_duplicates_in_staging(self, staging_id: str) -> Dict[str, List]:
-        """Detect potential duplicates in staged data."""
+        """Detect potential duplicates in staged data against the local database.
+
+        Returns {"persons": [...], "buildings": [...], "units": [...]} of
+        conflict dicts (backend conflict-list shape), so the combined list
+        can be fed to DuplicateService.compute_local_summary().
+        """
         duplicates = {
             "persons": [],
             "buildings": [],
             "units": []
         }
-        # Duplicate detection logic would go here
-        # This is handled by the existing duplicate_service.py
+        staged = self._staged_records.pop(staging_id, None)
+        if not staged:
+            return duplicates
+        try:
+            from services.local_duplicate_detector import LocalDuplicateDetector
+            duplicates.update(LocalDuplicateDetector().detect(staged, self.db, package_id=staging_id))
+        except Exception as e:
+            logger.warning(f"Local duplicate detection failed: {e}")
         return duplicates
 
     def _log_import_audit(
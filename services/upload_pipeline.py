@@ -0,0 +1,568 @@
+# -*- coding: utf-8 -*-
+"""
+Parallel upload pipeline for relation and identification documents.
+
+The wizard used to upload a household's scanned IDs and deeds one after
+another, each as a full-resolution file in a single blocking request.
+Uploads now go through one pipeline:
+
+  * bounded parallelism: Config.UPLOAD_WORKERS files are sent at once;
+    run_upload_batch() waits for a whole batch, running a nested event loop
+    on the GUI thread so the wizard keeps painting; the active window is
+    disabled (and cannot be closed) meanwhile, so a second Save click or
+    Esc cannot re-enter the save that started the batch;
+  * images (JPEG, PNG, TIFF, BMP without transparency) are downscaled to
+    Config.UPLOAD_IMAGE_DPI and recompressed as JPEG, and the result is
+    sent only when it is clearly smaller than the original. Images that do
+    not record a scan resolution are bounded to the long side of an A4 page
+    at that DPI. Prepared files are cached by content hash in
+    TEMP/trrcms_uploads, so a retry does not encode them again;
+  * hash skip: the SHA-256 of the original and of the prepared file are
+    compared with the fileHash of the documents the server already holds
+    (the survey's evidence for relation documents, the person's
+    identification documents). A relation document the survey already has
+    is linked to the relation instead of uploaded again, an identification
+    document the person already has is not sent, and a replacement whose
+    content did not change is sent without the file. When the issue date or
+    document type of the new upload differ from the stored document's, its
+    metadata is updated without the file;
+  * per-file retry: network errors, 401/408/429 and 5xx are retried with
+    backoff for that file only, while the rest of the batch carries on;
+  * progress: the `progress` signal carries the aggregate of every batch in
+    flight (files done / total, bytes sent / total) for the wizard footer;
+    `file_finished` reports each file.
+
+The survey outbox sends its journaled uploads through send(): same
+preparation and hash skip, one attempt, in journal order.
+
+Usage:
+    jobs = [UploadJob("upload_relation_document",
+                      {"survey_id": sid, "relation_id": rid, "file_path": path}, tag=path)]
+    for result in run_upload_batch(jobs):
+        if result.ok:
+            evidence_id = result.evidence_id
+"""
+
+import os
+import queue
+import tempfile
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from PyQt5.QtCore import QCoreApplication, QEvent, QEventLoop, QObject, QThread, pyqtSignal
+
+from app.config import Config
+from services.document_chunk_store import IntegrityCache
+from services.survey_outbox import is_transient_error
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+try:
+    from PIL import Image, ImageOps
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+# ApiClient methods the pipeline can send (all take file_path and progress)
+UPLOAD_OPERATIONS = (
+    "upload_relation_document",
+    "upload_identification_document",
+    "update_tenure_evidence",
+    "update_identification_document",
+)
+
+IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".tif", ".tiff", ".bmp"}
+_A4_LONG_SIDE_IN = 11.69
+# Cameras and editors write 72/96 dpi by default: not a scan resolution
+_MIN_SCAN_DPI = 100
+_JPEG_QUALITY = 85
+# The prepared image is sent only if it is at most this share of the original
+_MAX_PREPARED_RATIO = 0.9
+_MAX_ATTEMPTS = 3
+_RETRY_DELAY_S = 1.0  # doubled after every failed attempt
+_PROGRESS_STEP = 64 * 1024
+
+
+@dataclass
+class UploadJob:
+    """One ApiClient upload call (op is one of UPLOAD_OPERATIONS)."""
+    op: str
+    kwargs: Dict[str, Any]
+    tag: Any = None  # caller's handle, returned with the result
+
+
+@dataclass
+class UploadResult:
+    job: UploadJob
+    response: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[Exception] = None
+    skipped: bool = False  # the server already had the content; the file was not sent
+    attempts: int = 0
+    bytes_sent: int = 0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    @property
+    def evidence_id(self) -> str:
+        r = self.response or {}
+        return str(r.get("id") or r.get("evidenceId") or r.get("Id") or r.get("EvidenceId") or "")
+
+
+@dataclass
+class PreparedFile:
+    """The file sent for an upload and the hashes it is known by."""
+    path: str
+    original_hash: str
+    file_hash: str
+    original_size: int
+    size: int
+
+    @property
+    def hashes(self) -> Set[str]:
+        return {self.original_hash, self.file_hash}
+
+
+def _scan_dpi(image) -> float:
+    dpi = image.info.get("dpi") or (0, 0)
+    try:
+        value = float(dpi[0] if isinstance(dpi, (tuple, list)) else dpi)
+    except (TypeError, ValueError):
+        return 0.0
+    return value if value >= _MIN_SCAN_DPI else 0.0
+
+
+def _downscale(source: str, target: Path, dpi: int) -> bool:
+    """Write `source` to `target` as a JPEG at no more than `dpi`; False if it cannot be converted."""
+    with Image.open(source) as image:
+        if image.mode in ("RGBA", "LA", "PA") or "transparency" in image.info:
+            return False
+        source_dpi = _scan_dpi(image)
+        long_side = max(image.size)
+        if source_dpi:
+            scale = min(1.0, dpi / source_dpi)
+        else:
+            scale = min(1.0, _A4_LONG_SIDE_IN * dpi / long_side)
+        target_side = max(1, round(long_side * scale))
+        # JPEG: decode directly at 1/2 .. 1/8 scale
+        image.draft("L" if image.mode == "L" else "RGB", (target_side, target_side))
+        prepared = ImageOps.exif_transpose(image)
+        if prepared.mode not in ("RGB", "L"):
+            prepared = prepared.convert("RGB")
+        if max(prepared.size) > target_side:
+            prepared.thumbnail((target_side, target_side), Image.LANCZOS, reducing_gap=3.0)
+        out_dpi = round(min(dpi, source_dpi) if source_dpi else dpi)
+        tmp = target.with_name(f"{target.name}.{uuid.uuid4().hex[:8]}.tmp")
+        prepared.save(tmp, "JPEG", quality=_JPEG_QUALITY, optimize=True, dpi=(out_dpi, out_dpi))
+    os.replace(tmp, target)
+    return True
+
+
+def prepare_upload_file(file_path: str, dpi: Optional[int] = None,
+                        cache_dir: Optional[Path] = None,
+                        integrity: Optional[IntegrityCache] = None) -> PreparedFile:
+    """The file to send for `file_path`: a downscaled JPEG when that is clearly smaller, else the original."""
+    dpi = Config.UPLOAD_IMAGE_DPI if dpi is None else dpi
+    integrity = integrity or IntegrityCache()
+    original_hash = integrity.digest(Path(file_path))
+    original_size = os.path.getsize(file_path)
+    original = PreparedFile(file_path, original_hash, original_hash, original_size, original_size)
+    if dpi <= 0 or not PIL_AVAILABLE or Path(file_path).suffix.lower() not in IMAGE_EXTENSIONS:
+        return original
+
+    directory = Path(cache_dir or Path(tempfile.gettempdir()) / "trrcms_uploads") / f"{original_hash[:32]}_{dpi}"
+    target = directory / f"{Path(file_path).stem}.jpg"
+    keep_original = directory / ".original"
+    if not target.exists():
+        if keep_original.exists():
+            return original
+        directory.mkdir(parents=True, exist_ok=True)
+        try:
+            written = _downscale(file_path, target, dpi)
+        except Exception as e:
+            logger.warning(f"Could not downscale {file_path}, uploading it as is: {e}")
+            written = False
+        if not written or target.stat().st_size > original_size * _MAX_PREPARED_RATIO:
+            target.unlink(missing_ok=True)
+            keep_original.touch()
+            return original
+    return PreparedFile(str(target), original_hash, integrity.digest(target),
+                        original_size, target.stat().st_size)
+
+
+class UploadBatch:
+    """Uploads submitted together; results keep the submission order."""
+
+    def __init__(self, jobs: Iterable[UploadJob]):
+        self.jobs: List[UploadJob] = list(jobs)
+        self.results: List[Optional[UploadResult]] = [None] * len(self.jobs)
+        self._remaining = len(self.jobs)
+        self._done = threading.Event()
+        # Server documents looked up once per batch: (kind, id) -> list
+        self.lookups: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        self.lookup_lock = threading.Lock()
+        if not self.jobs:
+            self._done.set()
+
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        return self._done.wait(timeout)
+
+
+class UploadPipeline(QObject):
+    """Bounded pool of upload workers with image preparation, hash skip and per-file retry."""
+
+    progress = pyqtSignal(object)  # {"files_done", "files_total", "bytes_sent", "bytes_total", "active"}
+    file_finished = pyqtSignal(object)  # UploadResult
+    batch_finished = pyqtSignal(object)  # UploadBatch
+
+    def __init__(self, workers: Optional[int] = None, api=None):
+        super().__init__()
+        app = QCoreApplication.instance()
+        if app is not None:
+            self.moveToThread(app.thread())
+        self.workers = max(1, Config.UPLOAD_WORKERS if workers is None else workers)
+        self._api = api
+        self._integrity = IntegrityCache()
+        self._queue: "queue.Queue[Optional[Tuple[UploadBatch, int]]]" = queue.Queue()
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._stopped = False
+        self._totals = {"files_done": 0, "files_total": 0, "bytes_sent": 0, "bytes_total": 0}
+        self._counters = {"uploaded": 0, "skipped": 0, "failed": 0, "retries": 0,
+                          "bytes_original": 0, "bytes_sent": 0}
+
+    def _client(self):
+        if self._api is None:
+            from services.api_client import get_api_client
+            return get_api_client()
+        return self._api
+
+    # -- submission ----------------------------------------------------------
+
+    def submit(self, jobs: Iterable[UploadJob]) -> UploadBatch:
+        """Queue a batch of uploads; returns at once."""
+        batch = UploadBatch(jobs)
+        with self._lock:
+            if self._stopped:
+                raise RuntimeError("Upload pipeline is shut down")
+            for job in batch.jobs:
+                if job.op not in UPLOAD_OPERATIONS:
+                    raise ValueError(f"{job.op} is not an upload operation")
+            self._totals["files_total"] += len(batch.jobs)
+            self._totals["bytes_total"] += sum(self._file_size(job) for job in batch.jobs)
+            for index in range(len(batch.jobs)):
+                self._queue.put((batch, index))
+            while len(self._threads) < min(self.workers, len(self._threads) + len(batch.jobs)):
+                thread = threading.Thread(target=self._worker_loop, daemon=True,
+                                          name=f"upload-{len(self._threads)}")
+                self._threads.append(thread)
+                thread.start()
+        self._emit_progress()
+        if not batch.jobs:
+            self.batch_finished.emit(batch)
+        return batch
+
+    def send(self, op: str, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """One upload in the calling thread, one attempt (the caller retries); raises on failure."""
+        result = UploadResult(UploadJob(op, dict(kwargs)))
+        self._upload(result, UploadBatch([]), attempts=1, track=False)
+        return result.response
+
+    @staticmethod
+    def _file_size(job: UploadJob) -> int:
+        try:
+            return os.path.getsize(job.kwargs.get("file_path") or "")
+        except OSError:
+            return 0
+
+    # -- workers -------------------------------------------------------------
+
+    def _worker_loop(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            batch, index = item
+            job = batch.jobs[index]
+            result = UploadResult(job)
+            if self._stopped:
+                result.error = RuntimeError("Upload pipeline is shut down")
+            else:
+                try:
+                    self._upload(result, batch)
+                except Exception as e:
+                    result.error = e
+            self._finish(batch, index, result)
+
+    def _finish(self, batch: UploadBatch, index: int, result: UploadResult) -> None:
+        job = result.job
+        with self._lock:
+            self._counters["failed" if result.error else "skipped" if result.skipped else "uploaded"] += 1
+            self._totals["files_done"] += 1
+            batch.results[index] = result
+            batch._remaining -= 1
+            finished = batch._remaining == 0
+            if self._totals["files_done"] >= self._totals["files_total"]:
+                self._totals = dict.fromkeys(self._totals, 0)
+        if result.error:
+            logger.warning(f"Upload failed ({job.op}, {job.kwargs.get('file_path')}): {result.error}")
+        self.file_finished.emit(result)
+        self._emit_progress()
+        if finished:
+            batch._done.set()
+            self.batch_finished.emit(batch)
+
+    def _emit_progress(self) -> None:
+        with self._lock:
+            data = dict(self._totals, active=self._totals["files_total"] > 0)
+        self.progress.emit(data)
+
+    def _add_totals(self, **deltas) -> None:
+        with self._lock:
+            if self._totals["files_total"]:
+                for key, delta in deltas.items():
+                    self._totals[key] += delta
+
+    # -- one upload ----------------------------------------------------------
+
+    def _upload(self, result: UploadResult, batch: UploadBatch, attempts: int = _MAX_ATTEMPTS,
+                track: bool = True) -> None:
+        job = result.job
+        add_totals = self._add_totals if track else (lambda **deltas: None)
+        kwargs = dict(job.kwargs)
+        api = self._client()
+        if api is None:
+            raise RuntimeError("API client not available")
+
+        op = job.op
+        file_path = kwargs.get("file_path")
+        estimate = self._file_size(job)
+        prepared = None
+        if file_path and os.path.exists(file_path):
+            prepared = prepare_upload_file(file_path, integrity=self._integrity)
+            kwargs["file_path"] = prepared.path
+            add_totals(bytes_total=prepared.size - estimate)
+            estimate = prepared.size
+
+            existing = self._find_existing(api, op, kwargs, prepared, batch)
+            if existing is not None:
+                result.skipped = True
+                add_totals(bytes_total=-estimate)
+                if op == "upload_relation_document":
+                    result.response = self._link_existing(api, kwargs, existing)
+                    if self._same_metadata(existing, kwargs.get("evidence_type", 2), kwargs.get("issue_date")):
+                        return
+                    op, kwargs = "update_tenure_evidence", dict(
+                        survey_id=kwargs.get("survey_id"), evidence_id=self._document_id(existing),
+                        relation_id=kwargs.get("relation_id"), issue_date=kwargs.get("issue_date", ""),
+                        evidence_type=kwargs.get("evidence_type", 2))
+                elif op == "upload_identification_document":
+                    if self._same_metadata(existing, kwargs.get("document_type"),
+                                           kwargs.get("document_issued_date")):
+                        logger.info(f"Identification document already on the server: {file_path}")
+                        result.response = existing
+                        return
+                    op, kwargs = "update_identification_document", dict(
+                        survey_id=kwargs.get("survey_id"), document_id=self._document_id(existing),
+                        person_id=kwargs.get("person_id"), document_type=kwargs.get("document_type"),
+                        document_issued_date=kwargs.get("document_issued_date", ""))
+                # Content already on the server: update the metadata only
+                kwargs["file_path"] = None
+                estimate = 0
+
+        sent = [0]
+
+        def on_progress(position, total):
+            if position - sent[0] >= _PROGRESS_STEP or position == total:
+                add_totals(bytes_sent=position - sent[0])
+                sent[0] = position
+                if track:
+                    self._emit_progress()
+
+        delay = _RETRY_DELAY_S
+        for attempt in range(1, attempts + 1):
+            result.attempts = attempt
+            try:
+                result.response = getattr(api, op)(**kwargs, progress=on_progress) or {}
+                break
+            except Exception as e:
+                add_totals(bytes_sent=-sent[0])
+                sent[0] = 0
+                if attempt == attempts or not is_transient_error(e):
+                    raise
+                with self._lock:
+                    self._counters["retries"] += 1
+                logger.info(f"Upload of {file_path} interrupted ({e}); retrying in {delay:.0f}s")
+                time.sleep(delay)
+                delay *= 2
+        result.bytes_sent = estimate
+        with self._lock:
+            self._counters["bytes_sent"] += estimate
+            if estimate:
+                self._counters["bytes_original"] += prepared.original_size
+
+    def _documents(self, api, batch: UploadBatch, kind: str, owner_id: str) -> List[Dict[str, Any]]:
+        """Server documents of a survey / person, fetched once per batch."""
+        key = (kind, owner_id)
+        with batch.lookup_lock:
+            if key not in batch.lookups:
+                try:
+                    if kind == "survey":
+                        batch.lookups[key] = api.get_survey_evidences(owner_id) or []
+                    else:
+                        batch.lookups[key] = api.get_person_identification_documents(owner_id) or []
+                except Exception as e:
+                    logger.debug(f"Could not list {kind} {owner_id} documents for hash skip: {e}")
+                    batch.lookups[key] = []
+            return batch.lookups[key]
+
+    def _find_existing(self, api, op: str, kwargs: Dict[str, Any], prepared: PreparedFile,
+                       batch: UploadBatch) -> Optional[Dict[str, Any]]:
+        """Server document with the same content as `prepared`, if any."""
+        def same_content(document):
+            return (document.get("fileHash") or document.get("FileHash")) in prepared.hashes
+
+        if op == "upload_relation_document":
+            documents = self._documents(api, batch, "survey", kwargs.get("survey_id", ""))
+            return next((d for d in documents if same_content(d)), None)
+        if op == "upload_identification_document":
+            documents = self._documents(api, batch, "person", kwargs.get("person_id", ""))
+            return next((d for d in documents if same_content(d)), None)
+        if op == "update_identification_document" and kwargs.get("person_id"):
+            documents = self._documents(api, batch, "person", kwargs["person_id"])
+            return next((d for d in documents if str(d.get("id")) == str(kwargs.get("document_id"))
+                         and same_content(d)), None)
+        if op == "update_tenure_evidence":
+            try:
+                current = api.get_evidence_by_id(kwargs.get("evidence_id", "")) or {}
+            except Exception as e:
+                logger.debug(f"Could not fetch evidence {kwargs.get('evidence_id')} for hash skip: {e}")
+                return None
+            return current if same_content(current) else None
+        return None
+
+    @staticmethod
+    def _document_id(document: Dict[str, Any]) -> str:
+        return str(document.get("id") or document.get("evidenceId") or "")
+
+    @staticmethod
+    def _same_metadata(document: Dict[str, Any], document_type: Any, issue_date: Optional[str]) -> bool:
+        """Whether a stored document already has the type and issue date of a new upload (unset = any)."""
+        stored_type = document.get("evidenceType", document.get("documentType"))
+        if document_type is not None and str(document_type).lower() != str(stored_type).lower():
+            return False
+        stored_date = document.get("documentIssuedDate") or document.get("DocumentIssuedDate") or ""
+        return not issue_date or str(issue_date)[:10] == str(stored_date)[:10]
+
+    @classmethod
+    def _link_existing(cls, api, kwargs: Dict[str, Any], evidence: Dict[str, Any]) -> Dict[str, Any]:
+        """Attach a survey evidence with the same content to the relation instead of uploading it."""
+        relation_id = kwargs.get("relation_id")
+        evidence_id = cls._document_id(evidence)
+        linked = {str(r.get("personPropertyRelationId"))
+                  for r in (evidence.get("evidenceRelations") or [])}
+        if str(relation_id) not in linked:
+            api.link_evidence_to_relation(kwargs.get("survey_id"), evidence_id, relation_id)
+            evidence.setdefault("evidenceRelations", []).append({"personPropertyRelationId": relation_id})
+            logger.info(f"Evidence {evidence_id} already on the server, linked to relation {relation_id}")
+        return evidence
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._counters)
+
+    def shutdown(self) -> None:
+        """Fail queued uploads and stop the workers (running uploads finish)."""
+        with self._lock:
+            self._stopped = True
+            threads = list(self._threads)
+        for _ in threads:
+            self._queue.put(None)
+
+
+class _WindowBlocker(QObject):
+    """Keeps the active window disabled and open while a batch runs in a nested event loop."""
+
+    def __init__(self):
+        super().__init__()
+        from PyQt5.QtWidgets import QApplication
+        self._window = None
+        if isinstance(QCoreApplication.instance(), QApplication):
+            self._window = QApplication.activeModalWidget() or QApplication.activeWindow()
+        self._was_enabled = False
+
+    def __enter__(self):
+        if self._window is not None:
+            self._was_enabled = self._window.isEnabled()
+            self._window.setEnabled(False)
+            self._window.installEventFilter(self)
+        return self
+
+    def __exit__(self, *exc_info):
+        if self._window is not None:
+            self._window.removeEventFilter(self)
+            if self._was_enabled:
+                self._window.setEnabled(True)
+
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.Close:
+            event.ignore()
+            return True
+        return False
+
+
+def run_upload_batch(jobs: Iterable[UploadJob], pipeline: Optional[UploadPipeline] = None) -> List[UploadResult]:
+    """
+    Upload `jobs` in parallel and return their results in submission order.
+
+    On the GUI thread the wait runs a nested event loop, so progress keeps
+    being painted, with the active window disabled; elsewhere it blocks.
+    """
+    pipeline = pipeline or get_upload_pipeline()
+    batch = pipeline.submit(jobs)
+    app = QCoreApplication.instance()
+    if app is not None and QThread.currentThread() == app.thread():
+        loop = QEventLoop()
+
+        def _on_finished(finished):
+            if finished is batch:
+                loop.quit()
+
+        pipeline.batch_finished.connect(_on_finished)
+        try:
+            if not batch.done():
+                with _WindowBlocker():
+                    loop.exec_()
+        finally:
+            pipeline.batch_finished.disconnect(_on_finished)
+    batch.wait()
+    return batch.results
+
+
+_pipeline: Optional[UploadPipeline] = None
+_pipeline_lock = threading.Lock()
+
+
+def get_upload_pipeline() -> UploadPipeline:
+    """The process-wide upload pipeline."""
+    global _pipeline
+    with _pipeline_lock:
+        if _pipeline is None:
+            _pipeline = UploadPipeline()
+        return _pipeline
+
+
+def shutdown_upload_pipeline() -> None:
+    """Stop the upload workers (called at application exit)."""
+    with _pipeline_lock:
+        if _pipeline is not None:
+            _pipeline.shutdown()
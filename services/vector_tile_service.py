@@ -0,0 +1,692 @@
+# -*- coding: utf-8 -*-
+"""
+Building vector tiles (Mapbox Vector Tile, MVT) for the local tile server.
+
+`TileServer` serves `/vtiles/{z}/{x}/{y}.pbf` from this service, so the
+map can draw every building footprint at every zoom without pushing
+GeoJSON through `runJavaScript`:
+
+- On PostgreSQL/PostGIS a tile is one `ST_AsMVT` query.
+- Otherwise tiles are encoded in Python from a snapshot of the buildings.
+  The app's service reads them from the backend (`/v2/buildings/map` over
+  the configured map bounds, one building re-read by id after a change)
+  and falls back to the local `buildings` table when the API has nothing.
+  The snapshot keeps NumPy bounding boxes in Web Mercator per building, so
+  a tile only touches buildings that overlap it.
+- Encoded tiles are kept in a per-z/x/y LRU cache. When a building
+  changes, only the cached tiles that cover its old or new bounds are
+  dropped (PostGIS: all tiles, since no bounds are known locally).
+
+Buildings too small to survive quantization at low zooms are emitted as
+points, so they stay visible. One layer, `buildings`, carries building_id,
+building_uuid, neighborhood_code, building_type, building_status and
+number_of_units.
+"""
+
+import math
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+LAYER_NAME = "buildings"
+EXTENT = 4096
+BUFFER = 64
+MAX_CACHED_TILES = 2048
+MAX_ZOOM = 22
+EMPTY_SNAPSHOT_RETRY = 30.0  # seconds before an empty snapshot is read again
+
+_ORIGIN = 20037508.342789244  # half the Web Mercator world width (m)
+_RADIUS = 6378137.0
+_MAX_LAT = 85.0511287798
+
+PROPERTY_COLUMNS = (
+    "building_id", "building_uuid", "neighborhood_code",
+    "building_type", "building_status", "number_of_units",
+)
+
+_POINT, _POLYGON = 1, 3
+
+
+# ---------------------------------------------------------------------------
+# Tile math
+# ---------------------------------------------------------------------------
+
+def tile_bounds(z: int, x: int, y: int) -> Tuple[float, float, float, float]:
+    """(min_x, min_y, max_x, max_y) of an XYZ tile in EPSG:3857 metres."""
+    size = 2 * _ORIGIN / (1 << z)
+    min_x = -_ORIGIN + x * size
+    max_y = _ORIGIN - y * size
+    return min_x, max_y - size, min_x + size, max_y
+
+
+def tile_bounds_lonlat(z: int, x: int, y: int) -> Tuple[float, float, float, float]:
+    """(min_lon, min_lat, max_lon, max_lat) of an XYZ tile."""
+    n = 1 << z
+    min_lon = x / n * 360.0 - 180.0
+    max_lon = (x + 1) / n * 360.0 - 180.0
+    max_lat = math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * y / n))))
+    min_lat = math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * (y + 1) / n))))
+    return min_lon, min_lat, max_lon, max_lat
+
+
+def to_web_mercator(lonlat: np.ndarray) -> np.ndarray:
+    """(n, 2) lon/lat degrees -> (n, 2) EPSG:3857 metres."""
+    lon = np.radians(lonlat[:, 0])
+    lat = np.radians(np.clip(lonlat[:, 1], -_MAX_LAT, _MAX_LAT))
+    return np.column_stack((_RADIUS * lon, _RADIUS * np.log(np.tan(np.pi / 4 + lat / 2))))
+
+
+def valid_tile(z: int, x: int, y: int) -> bool:
+    return 0 <= z <= MAX_ZOOM and 0 <= x < (1 << z) and 0 <= y < (1 << z)
+
+
+# ---------------------------------------------------------------------------
+# MVT (protobuf) encoder
+# ---------------------------------------------------------------------------
+
+_SHIFTS = np.arange(0, 70, 7, dtype=np.uint64)
+
+
+def _varint(value: int) -> bytes:
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def _pack_varints(values: np.ndarray) -> bytes:
+    """Protobuf varints of an unsigned int array, vectorized."""
+    v = np.asarray(values, dtype=np.uint64)
+    if not len(v):
+        return b""
+    groups = (v[:, None] >> _SHIFTS) & np.uint64(0x7F)
+    lengths = 1 + np.count_nonzero(v[:, None] >= (np.uint64(1) << _SHIFTS[1:]), axis=1)
+    columns = np.arange(len(_SHIFTS))
+    used = columns < lengths[:, None]
+    more = columns < (lengths - 1)[:, None]
+    groups = groups | (more.astype(np.uint64) << np.uint64(7))
+    return groups[used].astype(np.uint8).tobytes()
+
+
+def _field(number: int, payload: bytes) -> bytes:
+    """Length-delimited field."""
+    return _varint((number << 3) | 2) + _varint(len(payload)) + payload
+
+
+def _zigzag(values: np.ndarray) -> np.ndarray:
+    return ((values << 1) ^ (values >> 63)).astype(np.uint64)
+
+
+def _encode_value(value) -> bytes:
+    if isinstance(value, bool):
+        return _varint((7 << 3) | 0) + _varint(int(value))
+    if isinstance(value, int):
+        if value >= 0:
+            return _varint((5 << 3) | 0) + _varint(value)
+        return _varint((6 << 3) | 0) + _varint((value << 1) ^ (value >> 63))
+    if isinstance(value, float):
+        return _varint((3 << 3) | 1) + np.float64(value).astype("<f8").tobytes()
+    data = str(value).encode("utf-8")
+    return _field(1, data)
+
+
+class _LayerBuilder:
+    """Accumulates features of one MVT layer."""
+
+    def __init__(self, name: str, extent: int = EXTENT):
+        self.name = name
+        self.extent = extent
+        self._keys: Dict[str, int] = {}
+        self._values: Dict[Tuple[type, Any], int] = {}
+        self._features: List[bytes] = []
+
+    def add(self, geom_type: int, commands: np.ndarray, properties: Dict[str, Any]):
+        tags = []
+        for key, value in properties.items():
+            if value is None or value == "":
+                continue
+            tags.append(self._keys.setdefault(key, len(self._keys)))
+            tags.append(self._values.setdefault((type(value), value), len(self._values)))
+        body = _field(2, _pack_varints(np.array(tags, dtype=np.uint64))) if tags else b""
+        body += _varint((3 << 3) | 0) + _varint(geom_type)
+        body += _field(4, _pack_varints(commands))
+        self._features.append(body)
+
+    def __len__(self):
+        return len(self._features)
+
+    def encode(self) -> bytes:
+        body = bytearray()
+        body += _varint((15 << 3) | 0) + _varint(2)  # version
+        body += _field(1, self.name.encode("utf-8"))
+        for feature in self._features:
+            body += _field(2, feature)
+        for key in self._keys:
+            body += _field(3, key.encode("utf-8"))
+        for (_, value) in self._values:
+            body += _field(4, _encode_value(value))
+        body += _varint((5 << 3) | 0) + _varint(self.extent)
+        return _field(3, bytes(body))
+
+
+def _ring_commands(ring: np.ndarray, cursor: np.ndarray) -> np.ndarray:
+    """MoveTo / LineTo / ClosePath commands of a closed ring (no closing point)."""
+    deltas = np.diff(ring, axis=0, prepend=cursor[None, :])
+    zz = _zigzag(deltas).ravel()
+    head = np.array([(1 & 7) | (1 << 3), zz[0], zz[1], (2 & 7) | ((len(ring) - 1) << 3)],
+                    dtype=np.uint64)
+    return np.concatenate((head, zz[2:], np.array([(7 & 7) | (1 << 3)], dtype=np.uint64)))
+
+
+def _point_commands(point: np.ndarray) -> np.ndarray:
+    zz = _zigzag(point.astype(np.int64))
+    return np.array([(1 & 7) | (1 << 3), zz[0], zz[1]], dtype=np.uint64)
+
+
+def _signed_area(ring: np.ndarray) -> float:
+    x, y = ring[:, 0], ring[:, 1]
+    return float(np.dot(x, np.roll(y, -1)) - np.dot(np.roll(x, -1), y))
+
+
+def _clip_ring(ring: np.ndarray, lo: float, hi: float) -> np.ndarray:
+    """Sutherland–Hodgman clip of a closed ring to the square [lo, hi]²."""
+    points = ring
+    for axis, bound, keep_below in ((0, lo, False), (0, hi, True), (1, lo, False), (1, hi, True)):
+        if not len(points):
+            break
+        values = points[:, axis]
+        inside = values <= bound if keep_below else values >= bound
+        if inside.all():
+            continue
+        out = []
+        prev, prev_in = points[-1], inside[-1]
+        for point, cur_in in zip(points, inside):
+            if cur_in != prev_in:
+                t = (bound - prev[axis]) / (point[axis] - prev[axis])
+                out.append(prev + t * (point - prev))
+            if cur_in:
+                out.append(point)
+            prev, prev_in = point, cur_in
+        points = np.array(out) if out else np.empty((0, 2))
+    return points
+
+
+def _quantize_ring(ring: np.ndarray) -> Optional[np.ndarray]:
+    """Integer ring without repeated / closing points, None when degenerate."""
+    q = np.rint(ring).astype(np.int64)
+    if len(q) > 1 and (q[0] == q[-1]).all():
+        q = q[:-1]
+    if len(q) < 3:
+        return None
+    keep = np.any(q != np.roll(q, 1, axis=0), axis=1)
+    q = q[keep]
+    if len(q) < 3 or _signed_area(q) == 0:
+        return None
+    return q
+
+
+# ---------------------------------------------------------------------------
+# Offline snapshot of the local buildings table
+# ---------------------------------------------------------------------------
+
+class BuildingSnapshot:
+    """Building geometries in EPSG:3857 with a NumPy bounding-box index."""
+
+    def __init__(self, rows: Iterable[Dict[str, Any]] = ()):
+        self._geoms: List[Optional[Tuple[int, list]]] = []
+        self._props: List[Dict[str, Any]] = []
+        self._keys: Dict[str, int] = {}
+        bboxes = []
+        for row in rows:
+            geom = self._geometry_of(row)
+            bboxes.append(self._bbox_of(geom))
+            self._append(row, geom)
+        self._bbox = np.array(bboxes, dtype=np.float64).reshape(-1, 4)
+
+    def __len__(self) -> int:
+        return sum(1 for g in self._geoms if g is not None)
+
+    @staticmethod
+    def _geometry_of(row: Dict[str, Any]) -> Optional[Tuple[int, list]]:
+        from services.geometry_codec import GeometryParseError, parse_geometry
+        wkt = row.get("geo_location")
+        if wkt:
+            try:
+                geometry = parse_geometry(wkt)
+            except GeometryParseError:
+                geometry = None
+            if geometry is not None and not geometry.is_empty:
+                if geometry.geom_type == "Polygon":
+                    polygons = [geometry.coords]
+                elif geometry.geom_type == "MultiPolygon":
+                    polygons = geometry.coords
+                elif geometry.geom_type == "Point":
+                    return _POINT, [to_web_mercator(geometry.coords[:, :2])]
+                else:
+                    polygons = []
+                if polygons:
+                    return _POLYGON, [[to_web_mercator(ring[:, :2]) for ring in polygon]
+                                      for polygon in polygons]
+        lat, lng = row.get("latitude"), row.get("longitude")
+        if lat is not None and lng is not None:
+            return _POINT, [to_web_mercator(np.array([[float(lng), float(lat)]]))]
+        return None
+
+    @staticmethod
+    def _bbox_of(geom) -> Tuple[float, float, float, float]:
+        if geom is None:
+            return (np.nan,) * 4
+        kind, parts = geom
+        arrays = parts if kind == _POINT else [polygon[0] for polygon in parts]
+        stacked = np.concatenate(arrays)
+        lo, hi = stacked.min(axis=0), stacked.max(axis=0)
+        return lo[0], lo[1], hi[0], hi[1]
+
+    def _append(self, row: Dict[str, Any], geom):
+        index = len(self._geoms)
+        self._geoms.append(geom)
+        self._props.append({key: row.get(key) for key in PROPERTY_COLUMNS})
+        for key in ("building_uuid", "building_id"):
+            if row.get(key):
+                self._keys[str(row[key])] = index
+
+    def bbox_of(self, key: str) -> Optional[Tuple[float, float, float, float]]:
+        index = self._keys.get(str(key))
+        if index is None or self._geoms[index] is None:
+            return None
+        return tuple(self._bbox[index])
+
+    def upsert(self, key: str, row: Optional[Dict[str, Any]]):
+        """Replace (or remove, when `row` is None) one building in place."""
+        index = self._keys.get(str(key))
+        geom = self._geometry_of(row) if row else None
+        if index is None:
+            if row is None:
+                return
+            self._append(row, geom)
+            self._bbox = np.vstack((self._bbox, np.array(self._bbox_of(geom))[None, :]))
+            return
+        self._geoms[index] = geom
+        self._bbox[index] = self._bbox_of(geom)
+        if row is not None:
+            self._props[index] = {k: row.get(k) for k in PROPERTY_COLUMNS}
+
+    def candidates(self, bounds: Tuple[float, float, float, float]) -> np.ndarray:
+        min_x, min_y, max_x, max_y = bounds
+        b = self._bbox
+        with np.errstate(invalid="ignore"):
+            mask = (b[:, 2] >= min_x) & (b[:, 0] <= max_x) & (b[:, 3] >= min_y) & (b[:, 1] <= max_y)
+        return np.nonzero(mask)[0]
+
+    def encode_tile(self, z: int, x: int, y: int) -> bytes:
+        min_x, min_y, max_x, max_y = tile_bounds(z, x, y)
+        scale = EXTENT / (max_x - min_x)
+        margin = BUFFER / scale
+        layer = _LayerBuilder(LAYER_NAME)
+        origin = np.array([min_x, max_y])
+        flip = np.array([scale, -scale])
+        lo, hi = -BUFFER, EXTENT + BUFFER
+
+        for index in self.candidates((min_x - margin, min_y - margin, max_x + margin, max_y + margin)):
+            kind, parts = self._geoms[index]
+            props = self._props[index]
+            if kind == _POINT:
+                point = np.rint((parts[0][0] - origin) * flip)
+                if lo <= point[0] <= hi and lo <= point[1] <= hi:
+                    layer.add(_POINT, _point_commands(point), props)
+                continue
+
+            bbox = self._bbox[index]
+            clip = not (min_x <= bbox[0] and bbox[2] <= max_x and min_y <= bbox[1] and bbox[3] <= max_y)
+            commands, cursor = [], np.zeros(2, dtype=np.int64)
+            for polygon in parts:
+                for ring_no, ring in enumerate(polygon):
+                    local = (ring - origin) * flip
+                    if clip:
+                        local = _clip_ring(local, lo, hi)
+                    q = _quantize_ring(local) if len(local) else None
+                    if q is None:
+                        if ring_no == 0:
+                            break  # exterior collapsed: skip its holes too
+                        continue
+                    area = _signed_area(q)
+                    if (ring_no == 0) != (area > 0):
+                        q = q[::-1]  # exterior positive, holes negative (y down)
+                    commands.append(_ring_commands(q, cursor))
+                    cursor = q[-1]
+            if commands:
+                layer.add(_POLYGON, np.concatenate(commands), props)
+            else:
+                # Sub-pixel footprint at this zoom: keep it visible as a point.
+                center = np.rint((((bbox[:2] + bbox[2:]) / 2) - origin) * flip)
+                if lo <= center[0] <= hi and lo <= center[1] <= hi:
+                    layer.add(_POINT, _point_commands(center), props)
+
+        return layer.encode() if len(layer) else b""
+
+
+# ---------------------------------------------------------------------------
+# Service
+# ---------------------------------------------------------------------------
+
+_POSTGIS_TILE_SQL = """
+    WITH tile AS (
+        SELECT
+            COALESCE(
+                ST_AsMVTGeom(ST_Transform(g.geom, 3857), ST_MakeEnvelope(?, ?, ?, ?, 3857), ?, ?, true),
+                ST_AsMVTGeom(ST_Transform(ST_PointOnSurface(g.geom), 3857),
+                             ST_MakeEnvelope(?, ?, ?, ?, 3857), ?, ?, true)
+            ) AS geom,
+            b.building_id, b.building_uuid, b.neighborhood_code,
+            b.building_type, b.building_status, b.number_of_units
+        FROM buildings b
+        CROSS JOIN LATERAL (
+            SELECT COALESCE(b.building_geometry, b.geo_location::geometry) AS geom
+        ) g
+        WHERE b.building_geometry && ST_MakeEnvelope(?, ?, ?, ?, 4326)
+           OR (b.building_geometry IS NULL
+               AND b.geo_location && ST_MakeEnvelope(?, ?, ?, ?, 4326)::geography)
+    )
+    SELECT ST_AsMVT(tile, ?, ?, 'geom') FROM tile WHERE geom IS NOT NULL
+"""
+
+_SNAPSHOT_SQL = (
+    "SELECT building_uuid, building_id, neighborhood_code, building_type, building_status, "
+    "number_of_units, latitude, longitude, geo_location FROM buildings"
+)
+
+
+def api_row(dto: Dict[str, Any]) -> Dict[str, Any]:
+    """Snapshot row for a building DTO (map or detail shape)."""
+    return {
+        "building_uuid": dto.get("id") or dto.get("buildingUuid"),
+        "building_id": dto.get("buildingCode") or dto.get("buildingId"),
+        "neighborhood_code": dto.get("neighborhoodCode"),
+        "building_type": dto.get("buildingType"),
+        "building_status": dto.get("status") or dto.get("buildingStatus"),
+        "number_of_units": dto.get("numberOfPropertyUnits"),
+        "latitude": dto.get("latitude"),
+        "longitude": dto.get("longitude"),
+        "geo_location": dto.get("buildingGeometryWkt") or dto.get("geoLocation"),
+    }
+
+
+def _api_client():
+    from services.api_client import get_api_client
+    return get_api_client()
+
+
+def api_snapshot_rows() -> List[Dict[str, Any]]:
+    """Every building inside the configured map bounds, from the backend."""
+    from app.config import Config
+    api = _api_client()
+    if api is None:
+        return []
+    dtos = api.get_buildings_for_map(
+        north_east_lat=Config.MAP_BOUNDS_MAX_LAT,
+        north_east_lng=Config.MAP_BOUNDS_MAX_LNG,
+        south_west_lat=Config.MAP_BOUNDS_MIN_LAT,
+        south_west_lng=Config.MAP_BOUNDS_MIN_LNG,
+    )
+    return [api_row(dto) for dto in dtos or ()]
+
+
+def api_snapshot_row(key: str) -> Optional[Dict[str, Any]]:
+    """One building re-read from the backend after it changed."""
+    api = _api_client()
+    if api is None:
+        return None
+    dto = api.get_building_by_id(key)
+    return api_row(dto) if dto else None
+
+
+class VectorTileService:
+    """Encodes, caches and invalidates building vector tiles."""
+
+    def __init__(self, db=None, snapshot_loader: Callable[[], Iterable[Dict[str, Any]]] = None,
+                 max_tiles: int = MAX_CACHED_TILES, use_api: bool = False):
+        self._db = db
+        self._snapshot_loader = snapshot_loader
+        self._use_api = use_api
+        self.max_tiles = max_tiles
+        self._tiles: "OrderedDict[Tuple[int, int, int], Tuple[bytes, str]]" = OrderedDict()
+        self._snapshot: Optional[BuildingSnapshot] = None
+        self._pending: set = set()  # building keys changed since the snapshot was read
+        self._lock = threading.Lock()
+        self._snapshot_lock = threading.Lock()
+        self._generation = 0
+        self._loaded_at = 0.0
+        self._source = None  # "loader", "api" or "local" once the snapshot is read
+        self.hits = 0
+        self.misses = 0
+
+    def set_database(self, db):
+        """Use `db` (Database or adapter) as the tile source and drop cached tiles."""
+        self._db = db
+        self.invalidate()
+
+    # -- Tiles ----------------------------------------------------------------
+
+    def get_tile(self, z: int, x: int, y: int) -> Tuple[bytes, str]:
+        """(MVT bytes, ETag) for an XYZ tile; empty bytes when nothing is there."""
+        key = (z, x, y)
+        with self._lock:
+            cached = self._tiles.get(key)
+            if cached is not None:
+                self._tiles.move_to_end(key)
+                self.hits += 1
+                return cached
+            self.misses += 1
+            generation = self._generation
+
+        data = self._encode(z, x, y)
+        entry = (data, f'"{zlib.crc32(data):08x}-{len(data)}"')
+        with self._lock:
+            if generation == self._generation:
+                self._tiles[key] = entry
+                while len(self._tiles) > self.max_tiles:
+                    self._tiles.popitem(last=False)
+        return entry
+
+    def _encode(self, z: int, x: int, y: int) -> bytes:
+        db = self._database()
+        if db is not None and self._snapshot_loader is None and self._is_postgis(db):
+            try:
+                return self._postgis_tile(db, z, x, y)
+            except Exception as e:
+                logger.warning(f"ST_AsMVT tile {z}/{x}/{y} failed, using local snapshot: {e}")
+        snapshot = self._get_snapshot()
+        return snapshot.encode_tile(z, x, y) if snapshot is not None else b""
+
+    def _database(self):
+        if self._db is not None:
+            return self._db
+        from repositories.db_adapter import DatabaseFactory
+        return DatabaseFactory.get_instance()
+
+    @staticmethod
+    def _is_postgis(db) -> bool:
+        from repositories.db_adapter import DatabaseType
+        return getattr(db, "db_type", None) == DatabaseType.POSTGRESQL
+
+    @staticmethod
+    def _postgis_tile(db, z: int, x: int, y: int) -> bytes:
+        envelope = tile_bounds(z, x, y)
+        min_lon, min_lat, max_lon, max_lat = tile_bounds_lonlat(z, x, y)
+        pad_lon = (max_lon - min_lon) * BUFFER / EXTENT
+        pad_lat = (max_lat - min_lat) * BUFFER / EXTENT
+        search = (min_lon - pad_lon, min_lat - pad_lat, max_lon + pad_lon, max_lat + pad_lat)
+        params = (*envelope, EXTENT, BUFFER, *envelope, EXTENT, BUFFER,
+                  *search, *search, LAYER_NAME, EXTENT)
+        row = db.fetch_one(_POSTGIS_TILE_SQL, params)
+        data = row[0] if row else None
+        return bytes(data) if data else b""
+
+    # -- Offline snapshot ------------------------------------------------------
+
+    def _load_rows(self) -> Iterable[Dict[str, Any]]:
+        if self._snapshot_loader is not None:
+            self._source = "loader"
+            return self._snapshot_loader()
+        if self._use_api:
+            try:
+                rows = api_snapshot_rows()
+            except Exception as e:
+                logger.warning(f"Could not read buildings from the API for vector tiles: {e}")
+                rows = []
+            if rows:
+                self._source = "api"
+                return rows
+        self._source = "local"
+        db = self._database()
+        if db is None:
+            return []
+        try:
+            return [dict(zip(row.keys(), (row[k] for k in row.keys())))
+                    for row in db.fetch_all(_SNAPSHOT_SQL)]
+        except Exception as e:
+            logger.warning(f"Could not read local buildings for vector tiles: {e}")
+            return []
+
+    def _load_row(self, key: str) -> Optional[Dict[str, Any]]:
+        if self._snapshot_loader is not None:
+            return next((r for r in self._snapshot_loader()
+                         if key in (str(r.get("building_uuid")), str(r.get("building_id")))), None)
+        if self._source == "api":
+            return api_snapshot_row(key)
+        db = self._database()
+        if db is None:
+            return None
+        row = db.fetch_one(f"{_SNAPSHOT_SQL} WHERE building_uuid = ? OR building_id = ?", (key, key))
+        return dict(zip(row.keys(), (row[k] for k in row.keys()))) if row else None
+
+    def _get_snapshot(self) -> Optional[BuildingSnapshot]:
+        with self._snapshot_lock:
+            if self._snapshot is not None and self._pending:
+                self._apply_pending()
+            if (self._snapshot is not None and not len(self._snapshot)
+                    and time.monotonic() - self._loaded_at > EMPTY_SNAPSHOT_RETRY):
+                # Read before login or while offline: try again, and forget the empty tiles.
+                self._snapshot = None
+                with self._lock:
+                    self._generation += 1
+                    self._tiles.clear()
+            if self._snapshot is None:
+                with self._lock:
+                    self._pending.clear()
+                self._snapshot = BuildingSnapshot(self._load_rows())
+                self._loaded_at = time.monotonic()
+                logger.info(f"Vector tile snapshot loaded: {len(self._snapshot)} buildings ({self._source})")
+            return self._snapshot
+
+    def _apply_pending(self):
+        """Re-read changed buildings and drop the tiles covering their new bounds."""
+        with self._lock:
+            pending, self._pending = self._pending, set()
+        for key in pending:
+            try:
+                row = self._load_row(key)
+            except Exception as e:
+                logger.warning(f"Could not refresh building {key} for vector tiles: {e}")
+                self._snapshot = None
+                return
+            self._snapshot.upsert(key, row)
+            bbox = self._snapshot.bbox_of(key)
+            if bbox is not None:
+                self._drop_tiles(bbox)
+
+    # -- Invalidation ----------------------------------------------------------
+
+    def invalidate(self, building_ids: Iterable[str] = None, geometries: Iterable[str] = ()):
+        """
+        Drop cached tiles after buildings changed.
+
+        With `building_ids`, only tiles covering those buildings' old bounds
+        (and the bounds of `geometries`, WKT of the new shapes) are dropped
+        and the snapshot is patched lazily; without, everything is reloaded.
+        """
+        if building_ids is None or self._is_postgis(self._database()):
+            with self._lock:
+                self._generation += 1
+                self._tiles.clear()
+            with self._snapshot_lock:
+                self._snapshot = None
+            return
+
+        keys = [str(k) for k in building_ids if k]
+        boxes = []
+        snapshot = self._snapshot
+        if snapshot is not None:
+            boxes.extend(b for b in (snapshot.bbox_of(k) for k in keys) if b is not None)
+        for wkt in geometries or ():
+            geom = BuildingSnapshot._geometry_of({"geo_location": wkt})
+            if geom is not None:
+                boxes.append(BuildingSnapshot._bbox_of(geom))
+        with self._lock:
+            self._pending.update(keys)
+        for bbox in boxes:
+            self._drop_tiles(bbox)
+        if not boxes:
+            # Unknown location (new building): the pending refresh drops its tiles,
+            # but tiles encoded meanwhile must not be cached.
+            with self._lock:
+                self._generation += 1
+
+    def _drop_tiles(self, bbox: Tuple[float, float, float, float]):
+        min_x, min_y, max_x, max_y = bbox
+        with self._lock:
+            self._generation += 1
+            for key in list(self._tiles):
+                t_min_x, t_min_y, t_max_x, t_max_y = tile_bounds(*key)
+                margin = (t_max_x - t_min_x) * BUFFER / EXTENT
+                if (max_x >= t_min_x - margin and min_x <= t_max_x + margin
+                        and max_y >= t_min_y - margin and min_y <= t_max_y + margin):
+                    del self._tiles[key]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "tiles": len(self._tiles),
+                "max_tiles": self.max_tiles,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "snapshot_buildings": len(self._snapshot) if self._snapshot is not None else None,
+            }
+
+
+_service: Optional[VectorTileService] = None
+_service_lock = threading.Lock()
+
+
+def get_vector_tile_service() -> VectorTileService:
+    """The process-wide VectorTileService used by the local tile server."""
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = VectorTileService(use_api=True)
+        return _service
+
+
+def invalidate_building_tiles(building_ids: Iterable[str] = None, geometries: Iterable[str] = ()):
+    """Invalidate building tiles if the service is running (no-op otherwise)."""
+    service = _service
+    if service is not None:
+        try:
+            service.invalidate(building_ids, geometries)
+        except Exception as e:
+            logger.warning(f"Vector tile invalidation failed: {e}")
@@ -2,13 +2,13 @@
 """
 Vocabulary Service - Single source of truth for vocabulary data.
 
-Fetches from backend API on startup (GET /api/v1/vocabularies, public, no auth).
+Loaded through the reference-data cache (GET /v2/vocabularies, public, no auth;
+persisted with its ETag and revalidated after login).
 Falls back to hardcoded values from Vocabularies class + translation keys.
 """
 
 import json
-import requests
-from typing import Dict, List, Tuple, Any, Optional
+from typing import Dict, Iterable, List, NamedTuple, Tuple, Any, Optional
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -17,77 +17,82 @@ _lookup: Dict[str, Dict[int, Dict[str, Any]]] = {}
 _options_cache: Dict[str, List[Tuple[int, str, str, int]]] = {}
 _initialized: bool = False
 
+_LANGUAGES = ("ar", "en")
+
+
+class _LabelTable(NamedTuple):
+    """Precompiled lookups of one vocabulary in one language."""
+    labels: Dict[Any, str]   # code as stored (int, or str for legacy vocabularies) -> label
+    by_str: Dict[str, str]   # str(code).lower() -> label
+    codes: Dict[str, Any]    # label -> code
+
+
+# {lang: {vocab key: _LabelTable}}. Compiled from _lookup and only ever
+# replaced as a whole, so readers never see a half-built table.
+_tables: Dict[str, Dict[str, _LabelTable]] = {}
+_current_lang: Optional[str] = None
+_current_tables: Dict[str, _LabelTable] = {}
+_name_keys: Dict[str, str] = {}
+_language_listener_registered = False
+
 def initialize_vocabularies():
     """
-    Fetch vocabularies from backend API and build in-memory cache.
-    Falls back to hardcoded values if API is unavailable.
+    Load vocabularies and build in-memory cache.
+
+    Served from the reference-data cache (services.reference_data_cache) when
+    synced before, so startup makes no network call; otherwise fetched from
+    the API. Revalidated after login by refresh_vocabularies().
     Called once at app startup from main.py.
     """
     global _initialized
-    from app.config import Config, get_api_base_url, should_verify_ssl
-    url = f"{get_api_base_url()}/v2/vocabularies"
-    logger.info(f"Fetching vocabularies from: {url}")
+    from services.reference_data_cache import get_reference_data_cache
+    cache = get_reference_data_cache()
+    _import_legacy_vocab_cache(cache)
     try:
-        response = requests.get(url, timeout=10, verify=should_verify_ssl(url))
-        response.raise_for_status()
-        raw = response.json()
-        data = raw.get("items", raw) if isinstance(raw, dict) else raw
-        _build_cache(data)
-        _build_from_translation_keys()
-        _save_vocab_cache(data)
-        _initialized = True
-        logger.info(f"Loaded {len(data)} vocabularies from API")
+        data = cache.get("vocabularies")
+        lookup, options = _build_cache(data)
+        _build_from_translation_keys(lookup, options)
+        _install(data, lookup, options)
+        logger.info(f"Loaded {len(data)} vocabularies")
     except Exception as e:
-        logger.warning(f"Could not load vocabularies from API ({e}).")
-        cached = _load_vocab_cache()
-        if cached:
-            _build_cache(cached)
-            _build_from_translation_keys()
-            logger.info("Using locally cached vocabularies (offline mode)")
-        else:
-            logger.error("API unavailable and no local cache. Vocabularies not loaded.")
-        _initialized = True
-
-
-def refresh_vocabularies():
+        logger.error(f"API unavailable and no local cache ({e}). Vocabularies not loaded.")
+    _initialized = True
+
+
+def refresh_vocabularies() -> bool:
     """
-    Re-fetch vocabularies from backend API and rebuild cache.
-    Can be called at runtime without restarting the app.
+    Revalidate vocabularies against the backend (conditional GET) and
+    rebuild the in-memory cache if they changed.
+    Can be called at runtime without restarting the app: the new tables
+    replace the old ones in one step, lookups never see an empty cache.
+
+    Returns:
+        True if the vocabularies were rebuilt.
     """
-    global _initialized, _raw_vocabularies, _lookup, _options_cache
-    _initialized = False
-    _raw_vocabularies = []
-    _lookup = {}
-    _options_cache = {}
+    from services.reference_data_cache import get_reference_data_cache
+    changed = get_reference_data_cache().revalidate("vocabularies")
+    if not changed and _raw_vocabularies:
+        logger.info("Vocabularies unchanged on server")
+        return False
     initialize_vocabularies()
+    from models.compact_building import invalidate_display_cache
+    invalidate_display_cache()
+    return True
 
 
-def _save_vocab_cache(data: list) -> None:
-    """Save raw API vocabulary data to local cache file."""
-    try:
-        from app.config import Config
-        cache_path = Config.DATA_DIR / "vocab_cache.json"
-        Config.DATA_DIR.mkdir(parents=True, exist_ok=True)
-        with open(cache_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False)
-        logger.info(f"Saved vocab cache ({len(data)} vocabularies)")
-    except Exception as e:
-        logger.warning(f"Could not save vocab cache: {e}")
-
-
-def _load_vocab_cache() -> list:
-    """Load vocabulary data from local cache file. Returns [] if not found."""
+def _import_legacy_vocab_cache(cache) -> None:
+    """Seed the reference-data cache from data/vocab_cache.json (shipped / older versions)."""
+    if cache.has("vocabularies"):
+        return
     try:
         from app.config import Config
-        cache_path = Config.DATA_DIR / "vocab_cache.json"
-        if cache_path.exists():
-            with open(cache_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            logger.info(f"Loaded vocab cache ({len(data)} vocabularies)")
-            return data
+        legacy_path = Config.DATA_DIR / "vocab_cache.json"
+        if legacy_path.exists():
+            with open(legacy_path, 'r', encoding='utf-8') as f:
+                cache.seed("vocabularies", json.load(f))
+            logger.info("Seeded reference data cache from vocab_cache.json")
     except Exception as e:
-        logger.warning(f"Could not load vocab cache: {e}")
-    return []
+        logger.warning(f"Could not import legacy vocab cache: {e}")
 
 
 def get_label(vocab_name: str, code, lang: str = None) -> str:
@@ -103,29 +108,48 @@ def get_label(vocab_name: str, code, lang: str = None) -> str:
     Returns:
         Label string, or str(code) as fallback if not found.
     """
-    if lang is None:
-        lang = _get_current_language()
+    tables = _current_tables if lang is None or lang == _current_lang else _tables_for(lang)
+    key = _name_keys.get(vocab_name) or _vocab_key(vocab_name)
+    table = tables.get(key)
+    if table is not None:
+        label = _resolve(table, code)
+        if label is not None:
+            return label
+    return str(code) if code is not None else ""
 
-    key = _normalize_name(vocab_name)
-    vocab = _lookup.get(key, {})
 
-    # Try integer lookup first
-    try:
-        code_int = int(code)
-        entry = vocab.get(code_int)
-        if entry:
-            return entry.get(lang, entry.get("ar", str(code)))
-    except (ValueError, TypeError):
-        pass
-
-    # Try string code lookup (scan values for match)
-    if code is not None:
-        code_str = str(code).lower()
-        for c, entry in vocab.items():
-            if str(c).lower() == code_str:
-                return entry.get(lang, entry.get("ar", str(code)))
+def get_labels(vocab_name: str, codes: Iterable, lang: str = None) -> List[str]:
+    """
+    Bulk get_label() for table rendering: one table lookup for the whole
+    column, each distinct code resolved once.
 
-    return str(code) if code is not None else ""
+    Returns:
+        Labels in the order of `codes` (str(code) / "" when not found).
+    """
+    table = _tables_for(lang).get(_vocab_key(vocab_name))
+    resolved: Dict[Any, str] = {}
+    labels = []
+    for code in codes:
+        try:
+            label = resolved[code]
+        except KeyError:
+            label = _resolve(table, code) if table is not None else None
+            if label is None:
+                label = str(code) if code is not None else ""
+            resolved[code] = label
+        except TypeError:  # unhashable code
+            label = str(code)
+        labels.append(label)
+    return labels
+
+
+def get_code(vocab_name: str, label: str, lang: str = None):
+    """
+    Reverse lookup: the code whose label (in `lang`, default current
+    language) is `label`, or None.
+    """
+    table = _tables_for(lang).get(_vocab_key(vocab_name))
+    return table.codes.get(label) if table is not None else None
 
 
 def get_options(vocab_name: str, lang: str = None, include_deprecated: bool = False) -> List[Tuple[int, str]]:
@@ -191,6 +215,7 @@ def add_term(vocab_name: str, code: int, label_ar: str, label_en: str, order: in
     _lookup[key][code] = {"ar": label_ar, "en": label_en, "order": order, "deprecated": False}
     _options_cache[key].append((code, label_ar, label_en, order, False))
     _options_cache[key].sort(key=lambda x: x[3])
+    _recompile(key)
 
 
 def update_term(vocab_name: str, code: int, label_ar: str, label_en: str):
@@ -206,6 +231,7 @@ def update_term(vocab_name: str, code: int, label_ar: str, label_en: str):
             deprecated = item[4] if len(item) > 4 else False
             _options_cache[key][i] = (code, label_ar, label_en, item[3], deprecated)
             break
+    _recompile(key)
 
 
 def remove_term(vocab_name: str, code: int):
@@ -215,6 +241,7 @@ def remove_term(vocab_name: str, code: int):
         _lookup[key].pop(code, None)
     if key in _options_cache:
         _options_cache[key] = [t for t in _options_cache[key] if t[0] != code]
+    _recompile(key)
 
 
 def get_next_code(vocab_name: str) -> int:
@@ -233,6 +260,14 @@ def _normalize_name(name: str) -> str:
     return name.lower().replace("_", "")
 
 
+def _vocab_key(name: str) -> str:
+    """_normalize_name() memoized (called once per table cell)."""
+    key = _name_keys.get(name)
+    if key is None:
+        key = _name_keys[name] = _normalize_name(name)
+    return key
+
+
 def _get_current_language() -> str:
     """Get current app language, defaulting to Arabic."""
     try:
@@ -241,12 +276,126 @@ def _get_current_language() -> str:
     except Exception:
         return "ar"
 
-def _build_cache(api_data: List[Dict]):
-    """Build lookup dicts from API response."""
+
+def _tables_for(lang: Optional[str]) -> Dict[str, _LabelTable]:
+    """Label tables of `lang` (None = current language, unknown = Arabic)."""
+    if lang is None or lang == _current_lang:
+        return _current_tables
+    tables = _tables.get(lang)
+    return tables if tables is not None else _tables.get("ar", {})
+
+
+def _resolve(table: _LabelTable, code) -> Optional[str]:
+    """
+    Label of `code`, or None: integer lookup first, then the code as a
+    case-insensitive string (by_str already resolves numeric strings to
+    their integer code, so the common cases are a single dict lookup).
+    """
+    code_type = type(code)
+    if code_type is int:
+        label = table.labels.get(code)
+        return label if label is not None else table.by_str.get(str(code))
+    if code_type is str:
+        label = table.by_str.get(code.lower())
+        if label is not None:
+            return label
+    elif code is None:
+        return None
+    try:
+        label = table.labels.get(int(code))
+    except (ValueError, TypeError, OverflowError):
+        label = None
+    if label is None and code_type is not str:
+        label = table.by_str.get(str(code).lower())
+    return label
+
+
+def _compile_table(code_map: Dict[Any, Dict[str, Any]], lang: str) -> _LabelTable:
+    labels, by_str, codes = {}, {}, {}
+    for code, entry in code_map.items():
+        label = entry.get(lang, entry.get("ar", str(code)))
+        if label is None:
+            label = ""
+        labels[code] = label
+        by_str.setdefault(str(code).lower(), label)
+        if label:
+            codes.setdefault(label, code)
+    # Integer lookup wins over string codes: "3" / "03" resolve like 3
+    for text in by_str:
+        try:
+            code_int = int(text)
+        except (ValueError, OverflowError):
+            continue
+        if code_int in labels:
+            by_str[text] = labels[code_int]
+    return _LabelTable(labels, by_str, codes)
+
+
+def _compile_tables(lookup: Dict[str, Dict[Any, Dict[str, Any]]]) -> Dict[str, Dict[str, _LabelTable]]:
+    tables = {}
+    for lang in _LANGUAGES:
+        compiled = {}  # aliases share their code map: compile it once
+        lang_tables = {}
+        for key, code_map in lookup.items():
+            table = compiled.get(id(code_map))
+            if table is None:
+                table = compiled[id(code_map)] = _compile_table(code_map, lang)
+            lang_tables[key] = table
+        tables[lang] = lang_tables
+    return tables
+
+
+def _set_tables(tables: Dict[str, Dict[str, _LabelTable]]):
+    """Swap in new label tables and the current-language view of them."""
+    global _tables, _current_tables, _current_lang
+    _ensure_language_listener()
+    if _current_lang is None:
+        _current_lang = _get_current_language()
+    _tables = tables
+    _current_tables = tables.get(_current_lang) or tables.get("ar", {})
+
+
+def _on_language_changed(lang: str):
+    global _current_lang, _current_tables
+    _current_tables = _tables.get(lang) or _tables.get("ar", {})
+    _current_lang = lang
+
+
+def _ensure_language_listener():
+    global _language_listener_registered
+    if _language_listener_registered:
+        return
+    _language_listener_registered = True
+    try:
+        from services.translation_manager import TranslationManager
+        TranslationManager().on_language_changed(_on_language_changed)
+    except Exception as e:
+        logger.warning(f"Could not register language listener for vocabularies: {e}")
+
+
+def _install(api_data: List[Dict], lookup: Dict, options: Dict):
+    """Publish freshly built vocabularies and their label tables."""
     global _raw_vocabularies, _lookup, _options_cache
-    _raw_vocabularies = api_data
-    _lookup = {}
-    _options_cache = {}
+    tables = _compile_tables(lookup)
+    _raw_vocabularies, _lookup, _options_cache = api_data, lookup, options
+    _set_tables(tables)
+
+
+def _recompile(key: str):
+    """Rebuild the tables of one edited vocabulary (and its aliases), copy-on-write."""
+    code_map = _lookup.get(key, {})
+    keys = [k for k, m in _lookup.items() if m is code_map] or [key]
+    tables = {}
+    for lang in _LANGUAGES:
+        table = _compile_table(code_map, lang)
+        tables[lang] = dict(_tables.get(lang, {}))
+        tables[lang].update((k, table) for k in keys)
+    _set_tables(tables)
+
+def _build_cache(api_data: List[Dict]) -> Tuple[Dict, Dict]:
+    """Build (lookup, options) dicts from API response."""
+    lookup = {}
+    options = {}
 
     for vocab in api_data:
         name = vocab.get("vocabularyName", "")
@@ -268,8 +417,8 @@ def _build_cache(api_data: List[Dict]):
 
         options_list.sort(key=lambda x: x[3])
 
-        _lookup[key] = code_map
-        _options_cache[key] = options_list
+        lookup[key] = code_map
+        options[key] = options_list
 
     # Add aliases for API vocab names that differ from our code's naming convention
     # e.g. API uses "tenure_contract_type" but our code calls it "ContractType"
@@ -280,13 +429,14 @@ def _build_cache(api_data: List[Dict]):
         "unitstatus": "propertyunitstatus",       # UnitStatus → property_unit_status
     }
     for alias, real_key in _ALIASES.items():
-        if real_key in _lookup and alias not in _lookup:
-            _lookup[alias] = _lookup[real_key]
-            _options_cache[alias] = _options_cache[real_key]
+        if real_key in lookup and alias not in lookup:
+            lookup[alias] = lookup[real_key]
+            options[alias] = options[real_key]
+    return lookup, options
 
 
-def _build_from_translation_keys():
-    """Build fallback entries for vocabularies that only exist in display_mappings."""
+def _build_from_translation_keys(lookup: Dict, options: Dict):
+    """Add fallback entries for vocabularies that only exist in display_mappings."""
     try:
         from services.translations.ar import AR_TRANSLATIONS
         from services.translations.en import EN_TRANSLATIONS
@@ -438,7 +588,7 @@ def _build_from_translation_keys():
     }
 
     for key, items in _extra_vocabs.items():
-        if key in _lookup:
+        if key in lookup:
             continue  # Already loaded from Vocabularies class
         code_map = {}
         options_list = []
@@ -448,5 +598,5 @@ def _build_from_translation_keys():
             entry = {"ar": ar, "en": en, "order": idx + 1}
             code_map[code] = entry
             options_list.append((code, ar, en, idx + 1))
-        _lookup[key] = code_map
-        _options_cache[key] = options_list
+        lookup[key] = code_map
+        options[key] = options_list
@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-"""Global registry for live ApiWorker (QThread) instances.
+"""Global registry for live background workers.
 
 The registry exists for one reason: when the user closes the app, every
 background thread we started must be told to stop and given a brief moment
@@ -7,9 +7,12 @@ to wind down. Without this, PyQt prints
 ``QThread: Destroyed while thread is still running`` and the OS may keep
 the process alive briefly with half-finished network requests in flight.
 
-Pages do not need to talk to this module directly — ``ApiWorker.__init__``
-registers itself automatically. Wiring lives at the application boundary
-(``main.py`` connects ``QApplication.aboutToQuit`` to ``stop_all_workers``).
+``ApiWorker`` no longer owns a thread: its calls run on the shared
+``services.task_executor`` pool, which ``stop_all_workers`` shuts down
+(queued calls are cancelled, running ones get the same timeout). ``register``
+remains for any standalone QThread that needs the same treatment. Wiring
+lives at the application boundary (``main.py`` connects
+``QApplication.aboutToQuit`` to ``stop_all_workers``).
 """
 
 from typing import Set
@@ -44,16 +47,17 @@ def register(worker) -> None:
 
 
 def stop_all_workers(timeout_ms: int = 2000) -> int:
-    """Politely stop every still-running worker; returns count stopped.
-
-    ``QThread.quit()`` only ends a thread that runs an event loop — our
-    ApiWorker subclass returns from ``run()`` on its own once the wrapped
-    callable finishes, so quit() is largely advisory. The real safety
-    comes from ``wait(timeout_ms)``, which blocks the caller (the GUI
-    thread, during shutdown) until the worker exits or the timeout
-    expires. Workers that do not respect the timeout are abandoned —
-    we do not call ``terminate()`` because that can leave Python objects
-    in inconsistent states.
+    """Politely stop every still-running worker, the shared task executor,
+    attachment downloads and the preview render pool; returns the number of
+    registered workers stopped plus executor tasks that were still running
+    when the timeout expired.
+
+    ``QThread.quit()`` only ends a thread that runs an event loop, so quit()
+    is largely advisory. The real safety comes from ``wait(timeout_ms)``,
+    which blocks the caller (the GUI thread, during shutdown) until the
+    worker exits or the timeout expires. Workers that do not respect the
+    timeout are abandoned — we do not call ``terminate()`` because that can
+    leave Python objects in inconsistent states.
     """
     snapshot = list(_LIVE_WORKERS)
     stopped = 0
@@ -66,6 +70,18 @@ def stop_all_workers(timeout_ms: int = 2000) -> int:
         except Exception as e:
             logger.debug(f"Error stopping worker: {e}")
     _LIVE_WORKERS.clear()
+
+    from services.task_executor import shutdown_task_executor
+    stopped += shutdown_task_executor(timeout=timeout_ms / 1000)
+
+    from services.download_manager import shutdown_download_manager
+    shutdown_download_manager()
+
+    from services.upload_pipeline import shutdown_upload_pipeline
+    shutdown_upload_pipeline()
+
+    from services.preview_cache import shutdown_preview_cache
+    shutdown_preview_cache()
     if stopped:
         logger.info(f"Stopped {stopped} background worker(s) on shutdown")
     return stopped
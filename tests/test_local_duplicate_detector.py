@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""LocalDuplicateDetector against staged rows in the API's camelCase shape."""
+
+import json
+import threading
+
+import pytest
+
+from repositories.db_adapter import SQLiteAdapter
+from services.local_duplicate_detector import LocalDuplicateDetector
+from services.staged_snapshot import StagedSnapshot
+
+BUILDING_UUID = "3f1c2a4e-8b7d-4c21-9f3a-1b2c3d4e5f60"
+STAGED_BUILDING_UUID = "7a9e0c11-2d3f-4b5a-8c6d-9e0f1a2b3c4d"
+
+
+def _row(row_id, payload, original=None):
+    row = {"id": row_id, "stagingData": json.dumps(payload, ensure_ascii=False)}
+    if original:
+        row["originalEntityId"] = original
+    return row
+
+
+@pytest.fixture
+def db(tmp_path):
+    adapter = SQLiteAdapter(tmp_path / "dedup.db")
+    with adapter.transaction() as conn:
+        conn.executescript("""
+            CREATE TABLE persons (person_id TEXT PRIMARY KEY, first_name_ar TEXT,
+                father_name_ar TEXT, last_name_ar TEXT, national_id TEXT,
+                year_of_birth INTEGER, gender TEXT);
+            CREATE TABLE buildings (building_uuid TEXT PRIMARY KEY, building_id TEXT,
+                neighborhood_code TEXT, latitude REAL, longitude REAL);
+            CREATE TABLE property_units (unit_uuid TEXT PRIMARY KEY, unit_id TEXT,
+                building_id TEXT, floor_number INTEGER, unit_number TEXT);
+        """)
+        conn.execute("INSERT INTO persons VALUES ('p-local', 'محمد', 'أحمد', 'الخطيب', NULL, 1980, 'male')")
+        conn.execute("INSERT INTO buildings VALUES (?, '01010100100100001', '001', 36.2021, 37.1343)",
+                     (BUILDING_UUID,))
+        conn.execute("INSERT INTO property_units VALUES "
+                     "('u-local', '01010100100100001-003', '01010100100100001', 2, '3')")
+    yield adapter
+    adapter.close()
+
+
+@pytest.fixture
+def snapshot():
+    return StagedSnapshot("pkg-1", {
+        "persons": [_row("sp-1", {
+            "firstNameArabic": "محمد", "fatherNameArabic": "احمد", "familyNameArabic": "خطيب",
+            "dateOfBirth": "1980-05-01T00:00:00", "gender": "Male",
+        })],
+        "buildings": [_row("sb-1", {
+            "buildingCode": "01010100100100002", "neighborhoodCode": "001",
+            "latitude": 36.20211, "longitude": 37.13431,
+        }, original=STAGED_BUILDING_UUID)],
+        "propertyUnits": [
+            _row("su-1", {"buildingId": BUILDING_UUID, "floorNumber": 2, "unitIdentifier": "003"}),
+            _row("su-2", {"buildingId": STAGED_BUILDING_UUID, "floorNumber": 1, "unitIdentifier": "1"}),
+            _row("su-3", {"buildingId": STAGED_BUILDING_UUID, "floorNumber": 1, "unitIdentifier": "01"}),
+        ],
+    })
+
+
+def _detect(snapshot, db):
+    return LocalDuplicateDetector().detect(
+        {
+            "persons": snapshot.records("persons"),
+            "buildings": snapshot.records("buildings"),
+            "units": snapshot.records("propertyUnits"),
+        },
+        db,
+        package_id="pkg-1",
+    )
+
+
+def test_camel_case_person_matches_local_row(snapshot, db):
+    persons = _detect(snapshot, db)["persons"]
+    assert [(c["firstEntityId"], c["secondEntityId"]) for c in persons] == [("sp-1", "p-local")]
+    assert persons[0]["firstEntityIdentifier"] == "محمد احمد خطيب"
+
+
+def test_camel_case_building_point_is_compared(snapshot, db):
+    buildings = _detect(snapshot, db)["buildings"]
+    assert len(buildings) == 1
+    assert buildings[0]["matchingFields"] == ["location"]
+    assert {buildings[0]["firstEntityId"], buildings[0]["secondEntityId"]} == {"sb-1", BUILDING_UUID}
+
+
+def test_unit_building_uuid_matches_local_code(snapshot, db):
+    units = _detect(snapshot, db)["units"]
+    pairs = {tuple(sorted((c["firstEntityId"], c["secondEntityId"]))) for c in units}
+    assert pairs == {("su-1", "u-local"), ("su-2", "su-3")}
+
+
+def test_detection_does_not_hold_the_write_lock(snapshot, db):
+    acquired = []
+
+    class LockProbe:
+        """Streams through the real adapter; another thread writes mid-stream."""
+
+        def iter_rows(self, query, params=(), batch_size=2000):
+            for row in db.iter_rows(query, params, batch_size):
+                t = threading.Thread(target=write)
+                t.start()
+                t.join()
+                yield row
+
+    def write():
+        got = db._write_lock.acquire(timeout=1)
+        acquired.append(got)
+        if got:
+            db._write_lock.release()
+
+    found = _detect(snapshot, LockProbe())
+    assert acquired and all(acquired)
+    assert len(found["persons"]) == 1
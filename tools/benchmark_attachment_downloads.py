@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark: case attachments through the download manager vs. one-by-one full downloads.
+
+Serves a case worth of synthetic evidence files from a local HTTP server
+that behaves like the backend over a field-office link (per-request
+latency, per-connection and shared bandwidth caps, Range / If-Range
+support) and drops a share of the connections half-way, then opens the
+case a few times:
+  sequential      previous path: api.download_evidence() per file, whole
+                  body in memory, on every view; a dropped transfer fails
+                  and is requested again from the first byte
+  manager         DownloadManager: prefetch of the case with bounded
+                  parallel transfers, Range resume of dropped transfers,
+                  content-addressed cache for later views
+
+Reports wall time per view, bytes sent by the server and transfers
+resumed, and cross-checks every downloaded file against the served content.
+
+Usage:
+    python tools/benchmark_attachment_downloads.py
+    python tools/benchmark_attachment_downloads.py --attachments 40 --workers 4 --drop 0.2
+"""
+
+import argparse
+import hashlib
+import os
+import random
+import re
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from PyQt5.QtCore import Qt  # noqa: E402
+from services.api_client import ApiConfig, TRRCMSApiClient  # noqa: E402
+from services.download_manager import DownloadManager  # noqa: E402
+from services.task_executor import Priority  # noqa: E402
+
+_BLOCK = 16 * 1024
+
+
+class _Link:
+    """Shared bandwidth of the office link (token bucket)."""
+
+    def __init__(self, bytes_per_s):
+        self.rate = bytes_per_s
+        self._next = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def send(self, size):
+        with self._lock:
+            now = time.perf_counter()
+            self._next = max(self._next, now) + size / self.rate
+            wait = self._next - now
+        time.sleep(wait)
+
+
+def _server(files, args):
+    link = _Link(args.link_mbps * 2**20 / 8)
+    per_connection = args.connection_mbps * 2**20 / 8
+    rnd = random.Random(11)
+    stats = {"bytes_sent": 0, "requests": 0, "dropped": 0}
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            match = re.search(r"/evidence/([^/]+)/download$", self.path)
+            if not match or match.group(1) not in files:
+                self.send_error(404)
+                return
+            data = files[match.group(1)]
+            etag = '"%s"' % hashlib.sha1(data).hexdigest()
+            start = 0
+            range_header = self.headers.get("Range", "")
+            if range_header and self.headers.get("If-Range", etag) == etag:
+                start = int(re.match(r"bytes=(\d+)-", range_header).group(1))
+                if start >= len(data):
+                    self.send_error(416)
+                    return
+            time.sleep(args.latency_ms / 1000)
+            body = memoryview(data)[start:]
+            self.send_response(206 if start else 200)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", str(len(body)))
+            if start:
+                self.send_header("Content-Range", f"bytes {start}-{len(data) - 1}/{len(data)}")
+            self.end_headers()
+            with lock:
+                stats["requests"] += 1
+                drop = rnd.random() < args.drop
+                stats["dropped"] += int(drop)
+            limit = len(body) // 2 if drop else len(body)
+            t0 = time.perf_counter()
+            sent = 0
+            try:
+                while sent < limit:
+                    block = body[sent:min(sent + _BLOCK, limit)]
+                    link.send(len(block))
+                    self.wfile.write(block)
+                    sent += len(block)
+                    ahead = sent / per_connection - (time.perf_counter() - t0)
+                    if ahead > 0:
+                        time.sleep(ahead)
+            except (BrokenPipeError, ConnectionResetError):
+                drop = True  # client went away (cancelled transfer)
+            with lock:
+                stats["bytes_sent"] += sent
+            if drop:
+                self.close_connection = True
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, stats
+
+
+def _sequential_view(api, ids, workdir):
+    """Previous behaviour: every file downloaded on every view, retried from zero on failure."""
+    paths = {}
+    for evidence_id in ids:
+        path = workdir / f"{evidence_id}.bin"
+        while True:
+            try:
+                # api.download_evidence before the download manager
+                response = api._session.get(api.evidence_download_url(evidence_id),
+                                            headers={"Authorization": f"Bearer {api.access_token}"},
+                                            timeout=api.config.timeout)
+                response.raise_for_status()
+                path.write_bytes(response.content)
+                break
+            except Exception:
+                continue
+        paths[evidence_id] = path
+    return paths
+
+
+def _manager_view(manager, ids):
+    manager.prefetch_evidences([{"id": evidence_id, "fileName": f"{evidence_id}.pdf"} for evidence_id in ids])
+    return {evidence_id: Path(manager.download_evidence(evidence_id, f"{evidence_id}.pdf", Priority.NORMAL))
+            for evidence_id in ids}
+
+
+def _timed(stats, func, *args):
+    sent = stats["bytes_sent"]
+    t0 = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - t0, stats["bytes_sent"] - sent, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark attachment downloads")
+    parser.add_argument("--attachments", type=int, default=24)
+    parser.add_argument("--workers", type=int, default=3)
+    parser.add_argument("--views", type=int, default=3, help="times the case is opened")
+    parser.add_argument("--drop", type=float, default=0.15, help="share of transfers cut half-way")
+    parser.add_argument("--latency-ms", type=float, default=150)
+    parser.add_argument("--connection-mbps", type=float, default=16, help="per-connection cap")
+    parser.add_argument("--link-mbps", type=float, default=48, help="shared link cap")
+    args = parser.parse_args()
+
+    rnd = random.Random(7)
+    files = {f"ev{i:03d}": rnd.randbytes(rnd.randint(100, 1500) * 1024) for i in range(args.attachments)}
+    # A few attachments are the same scan filed under two evidences
+    for i in range(0, args.attachments - 1, 8):
+        files[f"ev{i + 1:03d}"] = files[f"ev{i:03d}"]
+    ids = list(files)
+    total_mb = sum(len(data) for data in files.values()) / 2**20
+
+    server, stats = _server(files, args)
+    workdir = Path(tempfile.mkdtemp(prefix="attachment_downloads_"))
+    try:
+        api = TRRCMSApiClient(ApiConfig(base_url=f"http://127.0.0.1:{server.server_port}/api",
+                                        username="bench", password="bench", timeout=30))
+        api.access_token = "bench"
+
+        (workdir / "sequential").mkdir()
+        sequential = [_timed(stats, _sequential_view, api, ids, workdir / "sequential") for _ in range(args.views)]
+        manager = DownloadManager(root=workdir / "attachments", max_bytes=1024 * 2**20,
+                                  workers=args.workers, api=api)
+        progress_events = []
+        # No event loop here: receive the workers' signals directly
+        manager.progress.connect(lambda key, received, total: progress_events.append(key), Qt.DirectConnection)
+        managed = [_timed(stats, _manager_view, manager, ids) for _ in range(args.views)]
+        manager_stats = manager.stats()
+        manager.shutdown()
+
+        def mismatches(paths):
+            return sum(p.read_bytes() != files[evidence_id] for evidence_id, p in paths.items())
+
+        print(f"=== Attachment download benchmark: {args.attachments} attachments, {total_mb:.1f} MB, "
+              f"{args.latency_ms:.0f} ms latency, {args.connection_mbps:.0f}/{args.link_mbps:.0f} Mbit/s "
+              f"connection/link, {args.drop:.0%} of transfers dropped ===\n")
+        print(f"  {'method':<12}{'view 1 s':>10}{'later views s':>15}{'MB sent':>10}")
+        for name, runs in (("sequential", sequential), ("manager", managed)):
+            print(f"  {name:<12}{runs[0][0]:>10.2f}{min(r[0] for r in runs[1:]):>15.2f}"
+                  f"{sum(r[1] for r in runs) / 2**20:>10.1f}")
+        print(f"\n  manager: {manager_stats['downloads']} transfers, {manager_stats['resumed']} resumed, "
+              f"{manager_stats['retries']} retries, {manager_stats['deduplicated']} deduplicated, "
+              f"{manager_stats['hits']} cache hits, {len(progress_events)} progress signals")
+        print(f"  server: {stats['requests']} requests, {stats['dropped']} dropped")
+        print(f"  files not matching the served content: sequential {mismatches(sequential[-1][2])}, "
+              f"manager {mismatches(managed[-1][2])}")
+    finally:
+        server.shutdown()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark: memory-mapped binary boundary layers vs. raw GeoJSON text.
+
+For each boundary level in assets/geojson reports:
+  geojson_count   read the GeoJSON text + json.loads to count features
+                  (what get_feature_count() did on every call)
+  bnd_open        open the .bnd layer (header only, arrays memory-mapped)
+  viewport        GeoJSON for an Aleppo-sized viewport at several zooms,
+                  with its size next to the full file that used to be
+                  embedded in the map HTML
+
+Usage:
+    python tools/benchmark_boundary_layers.py
+    python tools/benchmark_boundary_layers.py --bbox 36.1 33.4 36.5 33.7   # Damascus
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from services.boundary_layers import SUFFIX, BoundaryLayer  # noqa: E402
+
+GEOJSON_DIR = Path(__file__).parent.parent / "assets" / "geojson"
+LEVELS = ("country", "governorates", "districts", "neighbourhoods")
+
+
+def _timed(fn, repeat=5):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark binary boundary layers")
+    parser.add_argument("--bbox", type=float, nargs=4, default=[37.05, 36.10, 37.25, 36.30],
+                        metavar=("W", "S", "E", "N"), help="Viewport (default: Aleppo city)")
+    parser.add_argument("--zooms", type=int, nargs="+", default=[6, 9, 12, 15])
+    args = parser.parse_args()
+
+    print(f"=== Boundary layer benchmark (viewport {args.bbox}) ===\n")
+    for level in LEVELS:
+        source = GEOJSON_DIR / f"{level}.geojson"
+        binary = source.with_suffix(SUFFIX)
+        if not source.exists() or not binary.exists():
+            print(f"[{level}] skipped (run tools/convert_shapefiles.py --binary-only)")
+            continue
+
+        geojson_s, count = _timed(lambda: len(json.loads(source.read_text(encoding="utf-8"))["features"]))
+        open_s, layer = _timed(lambda: BoundaryLayer(binary))
+        full_kb = source.stat().st_size / 1024
+
+        print(f"[{level}] {count} features, GeoJSON {full_kb:,.0f} KB, .bnd {binary.stat().st_size / 1024:,.0f} KB")
+        print(f"  {'geojson_count':<16}{geojson_s * 1e3:>9.2f} ms")
+        print(f"  {'bnd_open':<16}{open_s * 1e3:>9.2f} ms   ({geojson_s / open_s:,.0f}x)")
+        for zoom in args.zooms:
+            view_s, text = _timed(lambda: layer.to_geojson(args.bbox, zoom))
+            features = len(json.loads(text)["features"])
+            print(f"  viewport z{zoom:<7}{view_s * 1e3:>9.2f} ms   {features:>4} features "
+                  f"{len(text.encode('utf-8')) / 1024:>8,.0f} KB (lod {layer.lod_for_zoom(zoom)})")
+        layer.close()
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark: memory footprint of Building vs. CompactBuilding.
+
+Generates synthetic buildings spread over a realistic number of
+neighborhoods (names repeated per neighborhood, as the API returns them)
+and measures the bytes retained per instance with tracemalloc, plus the
+time to build the list and to render type/status display strings.
+
+Usage:
+    python tools/benchmark_building_memory.py                    # 10k, 100k, 1M
+    python tools/benchmark_building_memory.py --sizes 10000 100000
+    python tools/benchmark_building_memory.py --neighborhoods 400
+"""
+
+import argparse
+import gc
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from models.building import Building  # noqa: E402
+from models.compact_building import (  # noqa: E402
+    AdminHierarchy, CompactBuilding, invalidate_display_cache,
+)
+
+
+def _fresh(text: str) -> str:
+    """A new string object, like the ones json.loads() hands back per row."""
+    return text.encode("utf-8").decode("utf-8")
+
+
+def _rows(count: int, neighborhoods: int, seed: int = 7):
+    """API-shaped dicts: every row carries its own copy of the names."""
+    rnd = random.Random(seed)
+    for i in range(count):
+        n = i % neighborhoods
+        community = n // 20 + 1
+        yield {
+            "id": f"{i:08x}-0000-4000-8000-{rnd.getrandbits(48):012x}",
+            "buildingCode": f"010101{community:03d}{n + 1:03d}{i % 100000:05d}",
+            "governorate_code": "01", "governorate_name": _fresh("Aleppo"),
+            "governorate_name_ar": _fresh("حلب"),
+            "district_code": "01", "district_name": _fresh("Aleppo City"),
+            "district_name_ar": _fresh("مدينة حلب"),
+            "subdistrict_code": "01", "subdistrict_name": _fresh("Aleppo Center"),
+            "subdistrict_name_ar": _fresh("حلب المركز"),
+            "community_code": f"{community:03d}",
+            "community_name": f"Community {community}",
+            "community_name_ar": f"المجتمع {community}",
+            "neighborhood_code": f"{n + 1:03d}",
+            "neighborhood_name": f"Neighborhood {n + 1}",
+            "neighborhood_name_ar": f"الحي {n + 1}",
+            "building_number": f"{i % 100000:05d}",
+            "building_type": rnd.randint(1, 4),
+            "building_status": rnd.randint(1, 7),
+            "number_of_units": rnd.randint(1, 30),
+            "number_of_floors": rnd.randint(1, 12),
+            "latitude": 36.2 + rnd.random() * 0.1,
+            "longitude": 37.1 + rnd.random() * 0.1,
+        }
+
+
+def _measure(count: int, neighborhoods: int, compact: bool) -> dict:
+    AdminHierarchy.clear()
+    invalidate_display_cache()
+    gc.collect()
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    t0 = time.perf_counter()
+    if compact:
+        items = [CompactBuilding.from_dict(row) for row in _rows(count, neighborhoods)]
+    else:
+        items = [Building.from_dict(row) for row in _rows(count, neighborhoods)]
+    build_s = time.perf_counter() - t0
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - base
+    tracemalloc.stop()
+
+    t0 = time.perf_counter()
+    for b in items:
+        b.building_type_display
+        b.building_status_display
+        b.building_id_display
+    display_s = time.perf_counter() - t0
+
+    del items
+    gc.collect()
+    return {
+        "bytes": retained,
+        "per_item": retained / count,
+        "build_s": build_s,
+        "display_s": display_s,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Building memory footprint")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--neighborhoods", type=int, default=300,
+                        help="Distinct neighborhoods (default: 300)")
+    args = parser.parse_args()
+
+    # Resolve labels from translation fallbacks without hitting the API.
+    from services import vocab_service
+    lookup, options = {}, {}
+    vocab_service._build_from_translation_keys(lookup, options)
+    vocab_service._install([], lookup, options)
+    vocab_service._initialized = True
+
+    print(f"=== Building memory benchmark ({args.neighborhoods} neighborhoods) ===\n")
+    print(f"  {'count':>9}  {'model':<8}{'total':>11}{'per item':>11}"
+          f"{'build':>9}{'display':>10}")
+    for count in args.sizes:
+        results = {}
+        for name, compact in (("legacy", False), ("compact", True)):
+            r = results[name] = _measure(count, args.neighborhoods, compact)
+            print(f"  {count:>9,}  {name:<8}{r['bytes'] / 1048576:>9.1f}MB"
+                  f"{r['per_item']:>9.0f} B{r['build_s']:>8.2f}s{r['display_s']:>9.2f}s")
+        saved = 1 - results["compact"]["bytes"] / results["legacy"]["bytes"]
+        print(f"  {'':>9}  saved {saved:.0%}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark: batch claim-report generation vs. one generate_claim_report call per claim.
+
+Fills an in-memory SQLite database with synthetic claims (Arabic names,
+statuses, claimants and documents) and renders a report for each:
+  per_claim       previous path: generate_claim_report per claim, with the
+                  per-call costs it had (styles and table styles rebuilt,
+                  PNG QR code, uncached reshaping, 3 queries per claim)
+  batch           generate_claim_reports in-process (streamed chunks,
+                  styles built once, memoized reshaping, vector QR)
+  batch_pool      same on a process pool (--workers)
+  batch_merged    one merged PDF
+
+Reports claims/s and pages/s; page counts of all methods are cross-checked.
+
+Usage:
+    python tools/benchmark_claim_reports.py
+    python tools/benchmark_claim_reports.py --claims 1000 --workers 4 --chunk-size 25
+"""
+
+import argparse
+import io
+import os
+import random
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from services import pdf_report_service  # noqa: E402
+from services.pdf_report_service import PDFReportService  # noqa: E402
+
+_SCHEMA = """
+CREATE TABLE buildings (building_uuid TEXT PRIMARY KEY, building_id TEXT, neighborhood_code TEXT,
+                        building_type TEXT, building_status TEXT);
+CREATE TABLE units (unit_uuid TEXT PRIMARY KEY, building_uuid TEXT, unit_id TEXT, unit_type TEXT);
+CREATE TABLE claims (claim_uuid TEXT PRIMARY KEY, case_number TEXT, case_status TEXT, source TEXT,
+                     created_at TEXT, updated_at TEXT, unit_uuid TEXT);
+CREATE TABLE persons (person_uuid TEXT PRIMARY KEY, first_name TEXT, father_name TEXT, last_name TEXT);
+CREATE TABLE claim_persons (claim_uuid TEXT, person_uuid TEXT);
+CREATE TABLE person_unit_relations (person_uuid TEXT, relation_type TEXT);
+CREATE TABLE documents (document_uuid TEXT PRIMARY KEY, document_type TEXT, document_number TEXT,
+                        issue_date TEXT, verified INTEGER);
+CREATE TABLE claim_documents (claim_uuid TEXT, document_uuid TEXT);
+CREATE TABLE report_log (report_id TEXT, report_type TEXT, file_path TEXT, checksum TEXT,
+                         signature TEXT, generated_at TEXT, generated_by TEXT);
+CREATE INDEX idx_cp ON claim_persons (claim_uuid);
+CREATE INDEX idx_cd ON claim_documents (claim_uuid);
+CREATE INDEX idx_pur ON person_unit_relations (person_uuid);
+"""
+
+_FIRST = ["محمد", "أحمد", "علي", "فاطمة", "مريم", "خالد", "يوسف", "سارة", "عمر", "ليلى"]
+_LAST = ["الحلبي", "الشامي", "العلي", "الأحمد", "الخطيب", "النجار", "الحسن", "الصالح"]
+_STATUS = ["قيد المراجعة", "مقبولة", "مرفوضة", "بانتظار المستندات"]
+_SOURCE = ["مسح ميداني", "مكتب", "استيراد"]
+_RELATION = ["مالك", "مستأجر", "شاغل", "وريث"]
+_DOC_TYPE = ["سند ملكية", "عقد إيجار", "فاتورة كهرباء", "حكم محكمة"]
+_BUILDING_TYPE = ["سكني", "تجاري", "مختلط"]
+
+
+def _populate(db, claims, rnd):
+    cur = db.cursor()
+    cur.executescript(_SCHEMA)
+    for i in range(claims):
+        b, u, c = f"b{i}", f"u{i}", f"c{i}"
+        cur.execute("INSERT INTO buildings VALUES (?,?,?,?,?)",
+                    (b, f"01-02-03-{i:05d}", "NB-001", rnd.choice(_BUILDING_TYPE), "سليم"))
+        cur.execute("INSERT INTO units VALUES (?,?,?,?)", (u, b, f"{i:05d}-001", "شقة"))
+        cur.execute("INSERT INTO claims VALUES (?,?,?,?,?,?,?)",
+                    (c, f"CL-2025-{i:06d}", rnd.choice(_STATUS), rnd.choice(_SOURCE),
+                     "2025-03-01", "2025-03-02", u))
+        for k in range(rnd.randint(1, 4)):
+            p = f"p{i}_{k}"
+            cur.execute("INSERT INTO persons VALUES (?,?,?,?)",
+                        (p, rnd.choice(_FIRST), rnd.choice(_FIRST), rnd.choice(_LAST)))
+            cur.execute("INSERT INTO claim_persons VALUES (?,?)", (c, p))
+            cur.execute("INSERT INTO person_unit_relations VALUES (?,?)", (p, rnd.choice(_RELATION)))
+        for k in range(rnd.randint(0, 3)):
+            d = f"d{i}_{k}"
+            cur.execute("INSERT INTO documents VALUES (?,?,?,?,?)",
+                        (d, rnd.choice(_DOC_TYPE), f"{rnd.randint(10000, 99999)}", "2019-05-12", 1))
+            cur.execute("INSERT INTO claim_documents VALUES (?,?)", (c, d))
+    db.commit()
+
+
+def _png_qr_flowable(data, h_align='CENTER'):
+    """QR code as the previous path made it: qrcode PNG embedded as an image."""
+    import qrcode
+    from reportlab.lib.units import cm
+    from reportlab.platypus import Image
+
+    qr = qrcode.QRCode(version=1, error_correction=qrcode.constants.ERROR_CORRECT_L, box_size=10, border=4)
+    qr.add_data(data)
+    qr.make(fit=True)
+    buffer = io.BytesIO()
+    qr.make_image(fill_color="black", back_color="white").save(buffer, format='PNG')
+    buffer.seek(0)
+    image = Image(buffer, width=3*cm, height=3*cm)
+    image.hAlign = h_align
+    return image
+
+
+def _per_claim(service, case_numbers):
+    """generate_claim_report per claim with the per-call costs of the previous path."""
+    qr_flowable = PDFReportService._qr_flowable
+    PDFReportService._qr_flowable = staticmethod(_png_qr_flowable)
+    pages = 0
+    try:
+        for case_number in case_numbers:
+            PDFReportService._styles = None
+            PDFReportService._table_styles = {}
+            pdf_report_service.shape_arabic.cache_clear()
+            path = service.generate_claim_report(case_number)
+            pages += _page_count(path.read_bytes())
+    finally:
+        PDFReportService._qr_flowable = qr_flowable
+    return pages
+
+
+def _page_count(content):
+    return content.count(b"/Type /Page\n") or content.count(b"/Type /Page ")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark batch claim-report generation")
+    parser.add_argument("--claims", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=max(2, os.cpu_count() or 1))
+    parser.add_argument("--chunk-size", type=int, default=25)
+    args = parser.parse_args()
+
+    if not pdf_report_service.REPORTLAB_AVAILABLE:
+        print("ReportLab not installed")
+        return
+
+    db = sqlite3.connect(":memory:")
+    _populate(db, args.claims, random.Random(7))
+    case_numbers = [row[0] for row in db.execute("SELECT case_number FROM claims ORDER BY case_number")]
+    out = tempfile.mkdtemp(prefix="claim_reports_")
+    try:
+        service = PDFReportService(db, output_dir=os.path.join(out, "single"))
+
+        t0 = time.perf_counter()
+        legacy_pages = _per_claim(service, case_numbers)
+        legacy_s = time.perf_counter() - t0
+
+        results = [("per_claim", legacy_s, legacy_pages, 1)]
+        runs = (
+            ("batch", dict(workers=1)),
+            ("batch_pool", dict(workers=args.workers)),
+            ("batch_merged", dict(workers=1, merged=True, output=os.path.join(out, "merged.pdf"))),
+        )
+        for name, kwargs in runs:
+            kwargs.setdefault("output", os.path.join(out, name))
+            batch = service.generate_claim_reports(chunk_size=args.chunk_size, **kwargs)
+            results.append((name, batch.duration_seconds, batch.pages, batch.workers))
+            if name == "batch_merged":
+                merged_pages = _page_count(batch.merged_path.read_bytes())
+
+        print(f"=== Claim report benchmark: {args.claims:,} claims, chunk {args.chunk_size}, "
+              f"{os.cpu_count()} CPUs ===\n")
+        print(f"  {'method':<14}{'workers':>8}{'seconds':>10}{'pages':>8}{'claims/s':>10}{'pages/s':>10}{'speedup':>10}")
+        for name, seconds, pages, workers in results:
+            print(f"  {name:<14}{workers:>8}{seconds:>10.2f}{pages:>8}{args.claims / seconds:>10.1f}"
+                  f"{pages / seconds:>10.1f}{legacy_s / seconds:>9.1f}x")
+        print(f"\n  reshape cache: {pdf_report_service.shape_arabic.cache_info()}")
+        print(f"  merged PDF pages on disk: {merged_pages}")
+        mismatches = len({pages for _, _, pages, _ in results} | {merged_pages}) - 1
+        print(f"  page-count mismatches between methods: {mismatches}")
+    finally:
+        shutil.rmtree(out, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark: dashboard statistics from counter tables vs. COUNT(*) / GROUP BY scans.
+
+Builds a throw-away SQLite database with the application schema (counter
+triggers included) and bulk-loads claims, buildings and persons created
+over the past year, then measures:
+  load            bulk insert of all rows, counters maintained by triggers
+  trigger cost    per-row insert time of extra claims with / without the
+                  counter triggers
+  scan            the previous dashboard queries: building and claim
+                  get_statistics() plus the dashboard totals and
+                  `date(created_at) >= ?` week filters
+  counters        the same statistics from the counter tables
+                  (BuildingRepository / ClaimRepository.get_statistics,
+                  ReportService.get_dashboard_statistics)
+  reconcile       full rebuild of the counters, with the drift found
+
+Results of both dashboard paths are cross-checked.
+
+Usage:
+    python tools/benchmark_dashboard_stats.py                  # 1,000,000 claims
+    python tools/benchmark_dashboard_stats.py --claims 100000 --repeat 20
+"""
+
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from repositories.building_repository import BuildingRepository  # noqa: E402
+from repositories.claim_repository import ClaimRepository  # noqa: E402
+from repositories.database import Database  # noqa: E402
+from repositories import stat_counters  # noqa: E402
+from services.report_service import ReportService  # noqa: E402
+
+_STATUSES = ["draft", "submitted", "screening", "under_review", "approved", "rejected"]
+_CLAIM_TYPES = ["ownership", "occupancy", "tenancy"]
+_BUILDING_TYPES = ["residential", "commercial", "mixed_use"]
+_BUILDING_STATUSES = ["intact", "minor_damage", "major_damage", "destroyed"]
+_BATCH = 50_000
+
+
+def _created_at(rnd, now):
+    return (now - timedelta(seconds=rnd.randint(0, 365 * 86400))).isoformat(timespec="seconds")
+
+
+def _claim_rows(count, rnd, now):
+    for _ in range(count):
+        created = _created_at(rnd, now)
+        yield (str(uuid.uuid4()), f"CL-{uuid.uuid4().hex[:12]}", rnd.choice(_STATUSES),
+               rnd.choice(_CLAIM_TYPES), int(rnd.random() < 0.05), created, created)
+
+
+def _building_rows(count, rnd, now):
+    for i in range(count):
+        created = _created_at(rnd, now)
+        hood = rnd.randint(1, 60)
+        yield (str(uuid.uuid4()), f"01-01-01-{hood:03d}-{i:07d}", f"{hood:03d}", f"Neighborhood {hood}",
+               rnd.choice(_BUILDING_TYPES), rnd.choice(_BUILDING_STATUSES), rnd.randint(1, 12), created, created)
+
+
+def _person_rows(count, rnd, now):
+    for _ in range(count):
+        created = _created_at(rnd, now)
+        yield (str(uuid.uuid4()), "Ahmad", "أحمد", "Halabi", "الحلبي", created, created)
+
+
+_CLAIM_COLUMNS = ["claim_uuid", "claim_id", "case_status", "claim_type", "has_conflict", "created_at", "updated_at"]
+_BUILDING_COLUMNS = ["building_uuid", "building_id", "neighborhood_code", "neighborhood_name",
+                     "building_type", "building_status", "number_of_units", "created_at", "updated_at"]
+_PERSON_COLUMNS = ["person_id", "first_name", "first_name_ar", "last_name", "last_name_ar",
+                   "created_at", "updated_at"]
+
+
+def _load(db, table, columns, rows):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= _BATCH:
+            db.copy_rows(table, columns, batch)
+            batch = []
+    if batch:
+        db.copy_rows(table, columns, batch)
+
+
+def scan_statistics(db):
+    """The dashboard statistics as computed before the counter tables."""
+    def one(query, params=()):
+        return db.fetch_one(query, params)["count"]
+
+    week_ago = (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d")
+    buildings = {
+        "total": one("SELECT COUNT(*) as count FROM buildings"),
+        "by_status": {r["building_status"]: r["count"] for r in db.fetch_all(
+            "SELECT building_status, COUNT(*) as count FROM buildings GROUP BY building_status")},
+        "by_type": {r["building_type"]: r["count"] for r in db.fetch_all(
+            "SELECT building_type, COUNT(*) as count FROM buildings GROUP BY building_type")},
+        "by_neighborhood": {r["neighborhood_name"]: r["count"] for r in db.fetch_all(
+            "SELECT neighborhood_name, COUNT(*) as count FROM buildings "
+            "GROUP BY neighborhood_code ORDER BY count DESC LIMIT 10")},
+        "total_units": db.fetch_one("SELECT SUM(number_of_units) as total FROM buildings")["total"] or 0,
+    }
+    claims = {
+        "total": one("SELECT COUNT(*) as count FROM claims"),
+        "by_status": {r["case_status"]: r["count"] for r in db.fetch_all(
+            "SELECT case_status, COUNT(*) as count FROM claims GROUP BY case_status")},
+        "pending_review": one("SELECT COUNT(*) as count FROM claims "
+                              "WHERE case_status IN ('submitted', 'screening', 'under_review')"),
+        "with_conflicts": one("SELECT COUNT(*) as count FROM claims WHERE has_conflict = 1"),
+        "recent": one("SELECT COUNT(*) as count FROM claims WHERE date(created_at) >= ?",
+                      ((datetime.now().date() - timedelta(days=7)).isoformat(),)),
+    }
+    dashboard = {
+        "total_buildings": buildings["total"],
+        "total_units": one("SELECT COUNT(*) as count FROM property_units"),
+        "total_persons": one("SELECT COUNT(*) as count FROM persons"),
+        "total_claims": claims["total"],
+        "claims_by_status": claims["by_status"],
+        "new_buildings_week": one("SELECT COUNT(*) as count FROM buildings WHERE date(created_at) >= ?",
+                                  (week_ago,)),
+        "new_claims_week": one("SELECT COUNT(*) as count FROM claims WHERE date(created_at) >= ?",
+                               (week_ago,)),
+    }
+    return buildings, claims, dashboard
+
+
+def counter_statistics(db):
+    return (BuildingRepository(db).get_statistics(), ClaimRepository(db).get_statistics(),
+            ReportService(db).get_dashboard_statistics())
+
+
+def _timed(func, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - t0)
+    return best, result
+
+
+def _insert_claims(db, count, rnd, now):
+    with db.transaction():
+        t0 = time.perf_counter()
+        _load(db, "claims", _CLAIM_COLUMNS, _claim_rows(count, rnd, now))
+        return time.perf_counter() - t0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark dashboard statistics")
+    parser.add_argument("--claims", type=int, default=1_000_000)
+    parser.add_argument("--buildings", type=int, default=None, help="default: claims / 5")
+    parser.add_argument("--persons", type=int, default=None, help="default: claims / 20")
+    parser.add_argument("--extra", type=int, default=20_000, help="claims inserted to measure trigger cost")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    buildings = args.buildings if args.buildings is not None else args.claims // 5
+    persons = args.persons if args.persons is not None else args.claims // 20
+
+    rnd = random.Random(7)
+    now = datetime.now()
+    workdir = tempfile.mkdtemp(prefix="dashboard_stats_")
+    try:
+        db = Database(Path(workdir) / "bench.db")
+        db.initialize()
+
+        t0 = time.perf_counter()
+        with db.transaction():
+            _load(db, "buildings", _BUILDING_COLUMNS, _building_rows(buildings, rnd, now))
+            _load(db, "persons", _PERSON_COLUMNS, _person_rows(persons, rnd, now))
+            _load(db, "claims", _CLAIM_COLUMNS, _claim_rows(args.claims, rnd, now))
+        load_s = time.perf_counter() - t0
+
+        # Trigger cost: extra claims with and without the counter triggers
+        with_triggers_s = _insert_claims(db, args.extra, rnd, now)
+        triggers = db.fetch_all("SELECT name, sql FROM sqlite_master WHERE type = 'trigger' "
+                                "AND name LIKE 'claims_stats_%'")
+        for trigger in triggers:
+            db.execute(f"DROP TRIGGER {trigger['name']}")
+        without_triggers_s = _insert_claims(db, args.extra, rnd, now)
+        for trigger in triggers:
+            db.execute(trigger["sql"])
+        db.execute("DELETE FROM stat_counters WHERE entity = 'claims'")
+        with db.transaction() as conn:
+            stat_counters.rebuild_stat_counters(conn.cursor(), "claims")
+
+        db.execute("ANALYZE")
+        scan_s, scanned = _timed(lambda: scan_statistics(db), args.repeat)
+        counters_s, counted = _timed(lambda: counter_statistics(db), args.repeat)
+
+        t0 = time.perf_counter()
+        drift = stat_counters.reconcile_stat_counters(db)
+        reconcile_s = time.perf_counter() - t0
+
+        total_claims = args.claims + 2 * args.extra
+        print(f"=== Dashboard statistics benchmark: {total_claims:,} claims, {buildings:,} buildings, "
+              f"{persons:,} persons ===\n")
+        print(f"  load (all rows, triggers on)   {load_s:>9.2f} s")
+        print(f"  claim insert, counter triggers {with_triggers_s / args.extra * 1e6:>9.1f} us/row")
+        print(f"  claim insert, no triggers      {without_triggers_s / args.extra * 1e6:>9.1f} us/row\n")
+        print(f"  {'dashboard':<12}{'ms':>10}{'speedup':>10}")
+        print(f"  {'scan':<12}{scan_s * 1e3:>10.2f}{1:>9.1f}x")
+        print(f"  {'counters':<12}{counters_s * 1e3:>10.2f}{scan_s / counters_s:>9.1f}x")
+        print(f"\n  reconcile: {reconcile_s:.2f} s, drift {sum(drift.values())} ({drift})")
+        mismatches = [name for name, a, b in zip(("buildings", "claims", "dashboard"), scanned, counted)
+                      if a != b]
+        print(f"  mismatches between scan and counters: {mismatches or 0}")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark: chunked document version store vs. whole-file copies.
+
+Generates synthetic scanned deeds (incompressible page images) across a
+few neighborhoods and uploads them through DocumentVersionService as
+field offices do: new documents, re-uploads with an extra stamped page or
+a patched page, and exact duplicates filed under other documents.
+  whole_file      previous store: one copy per version
+                  (DOCUMENT_CHUNK_AVG_KB=0), 8 KB hash reads
+  chunked         content-defined chunks shared across versions and
+                  documents, 1 MB hash reads
+
+Measures upload time and bytes on disk, integrity checks of every version
+(previous full re-read vs. chunk hashes, cold and cached) and streaming
+reads, then prints the per-neighborhood savings report. Contents read back
+through both stores are cross-checked.
+
+Usage:
+    python tools/benchmark_document_store.py
+    python tools/benchmark_document_store.py --documents 200 --pages 8 --chunk-kb 64
+"""
+
+import argparse
+import hashlib
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.config import Config  # noqa: E402
+from repositories.db_adapter import DatabaseFactory  # noqa: E402
+from services.document_version_service import (  # noqa: E402
+    DocumentType, DocumentVersionService, EntityType
+)
+
+_PAGE_KB = (120, 400)
+
+
+def _page(rnd):
+    return rnd.randbytes(rnd.randint(*_PAGE_KB) * 1024)
+
+
+def _deed(pages):
+    """PDF-like file: header, page streams, trailer."""
+    body = b"".join(b"%d 0 obj stream\n" % i + page + b"\nendstream\n" for i, page in enumerate(pages))
+    return b"%PDF-1.4\n" + body + b"trailer\n%%EOF\n"
+
+
+def _uploads(args, rnd):
+    """(action, key, neighborhood, pages) in upload order; key names the document."""
+    documents = {}
+    for i in range(args.documents):
+        hood = f"{rnd.randint(1, args.neighborhoods):03d}"
+        pages = [_page(rnd) for _ in range(rnd.randint(1, args.pages))]
+        documents[i] = (hood, pages)
+        yield "create", i, hood, pages
+        roll = rnd.random()
+        if roll < 0.35:
+            # Re-scan with a stamp page appended
+            pages = pages + [_page(rnd)]
+            documents[i] = (hood, pages)
+            yield "version", i, hood, pages
+        elif roll < 0.55:
+            # One page patched (signature, correction)
+            pages = list(pages)
+            k = rnd.randrange(len(pages))
+            page = bytearray(pages[k])
+            start = rnd.randrange(len(page) - 4096)
+            page[start:start + 4096] = rnd.randbytes(4096)
+            pages[k] = bytes(page)
+            documents[i] = (hood, pages)
+            yield "version", i, hood, pages
+        if rnd.random() < 0.15 and documents:
+            # Same deed filed again under another building
+            source = rnd.choice(list(documents))
+            yield "create", f"dup{i}", documents[source][0], documents[source][1]
+
+
+def _legacy_hash(path):
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(8192), b""):
+            sha256.update(block)
+    return sha256.hexdigest()
+
+
+def _service(workdir, name, chunk_kb):
+    Config.DOCUMENT_CHUNK_AVG_KB = chunk_kb
+    os.environ["TRRCMS_DB_TYPE"] = "sqlite"
+    os.environ["TRRCMS_SQLITE_PATH"] = str(Path(workdir) / f"{name}.db")
+    adapter = DatabaseFactory.create()
+    adapter.execute("CREATE TABLE buildings (building_uuid TEXT, building_id TEXT, neighborhood_code TEXT)")
+    adapter.execute("CREATE TABLE claims (claim_uuid TEXT, claim_id TEXT, unit_id TEXT)")
+    adapter.execute("CREATE TABLE property_units (unit_id TEXT, building_id TEXT)")
+    return DocumentVersionService(storage_path=str(Path(workdir) / name))
+
+
+def _dir_size(path):
+    return sum(f.stat().st_size for f in Path(path).rglob("*") if f.is_file() and "cache" not in f.parts)
+
+
+def _run(service, uploads, incoming):
+    ids = {}
+    t0 = time.perf_counter()
+    for n, (action, key, hood, pages) in enumerate(uploads):
+        path = incoming / f"upload{n}.pdf"
+        path.write_bytes(_deed(pages))
+        if action == "create":
+            building_id = f"B-{hood}-{n}"
+            service._adapter.execute("INSERT INTO buildings VALUES (?, ?, ?)", (building_id, building_id, hood))
+            document = service.create_document(
+                str(path), DocumentType.DEED, "bench",
+                linked_entities=[{"entity_type": EntityType.BUILDING.value, "entity_id": building_id}])
+            ids[key] = document.document_id
+        else:
+            service.add_version(ids[key], str(path), "bench", "re-scan")
+    return time.perf_counter() - t0, ids
+
+
+def _versions(service):
+    return [(row["document_id"], row["version_number"]) for row in service._adapter.fetch_all(
+        "SELECT document_id, version_number FROM document_versions ORDER BY created_at, version_number")]
+
+
+def _stream_all(service, versions):
+    digests = []
+    for document_id, number in versions:
+        sha256 = hashlib.sha256()
+        for block in service.iter_version_content(document_id, number):
+            sha256.update(block)
+        digests.append(sha256.hexdigest())
+    return digests
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the chunked document store")
+    parser.add_argument("--documents", type=int, default=120)
+    parser.add_argument("--pages", type=int, default=6, help="max pages per deed")
+    parser.add_argument("--neighborhoods", type=int, default=5)
+    parser.add_argument("--chunk-kb", type=int, default=64)
+    args = parser.parse_args()
+
+    uploads = list(_uploads(args, random.Random(7)))
+    workdir = Path(tempfile.mkdtemp(prefix="document_store_"))
+    incoming = workdir / "incoming"
+    incoming.mkdir()
+    try:
+        results = {}
+        for name, chunk_kb in (("whole_file", 0), ("chunked", args.chunk_kb)):
+            service = _service(workdir, name, chunk_kb)
+            upload_s, _ = _run(service, uploads, incoming)
+            versions = _versions(service)
+
+            if not chunk_kb:
+                # Previous verify_file_integrity: full re-read with 8 KB blocks on every call
+                t0 = time.perf_counter()
+                legacy_ok = all(_legacy_hash(service.get_file_path(d, v)) == service.get_version(d, v).file_hash
+                                for d, v in versions)
+                legacy_verify_s = time.perf_counter() - t0
+
+            service._integrity.clear()
+            service._chunks.integrity.clear()
+            t0 = time.perf_counter()
+            ok = all(service.verify_file_integrity(d, v)[0] for d, v in versions)
+            verify_s = time.perf_counter() - t0
+            t0 = time.perf_counter()
+            ok = all(service.verify_file_integrity(d, v)[0] for d, v in versions) and ok
+            verify_warm_s = time.perf_counter() - t0
+
+            t0 = time.perf_counter()
+            digests = _stream_all(service, versions)
+            stream_s = time.perf_counter() - t0
+            expected = [service.get_version(d, v).file_hash for d, v in versions]
+
+            results[name] = dict(upload_s=upload_s, disk=_dir_size(workdir / name), versions=len(versions),
+                                 verify_s=verify_s, verify_warm_s=verify_warm_s, stream_s=stream_s, ok=ok,
+                                 digests=digests, bad_reads=sum(a != b for a, b in zip(digests, expected)),
+                                 service=service)
+
+        chunked = results["chunked"]
+        savings = chunked["service"].get_storage_savings()
+        logical = savings["total"]["logical_bytes"]
+
+        print(f"=== Document store benchmark: {len(uploads)} uploads, {chunked['versions']} versions, "
+              f"{logical / 2**20:.1f} MB uploaded, {args.chunk_kb} KB chunks ===\n")
+        print(f"  {'store':<12}{'upload s':>10}{'MB on disk':>12}{'verify ms':>11}{'cached ms':>11}"
+              f"{'stream MB/s':>13}")
+        for name, r in results.items():
+            print(f"  {name:<12}{r['upload_s']:>10.2f}{r['disk'] / 2**20:>12.1f}{r['verify_s'] * 1e3:>11.1f}"
+                  f"{r['verify_warm_s'] * 1e3:>11.1f}{logical / 2**20 / r['stream_s']:>13.1f}")
+        print(f"  previous verify (8 KB re-read on every call): {legacy_verify_s * 1e3:.1f} ms")
+
+        print(f"\n  {'neighborhood':<14}{'docs':>6}{'versions':>10}{'logical MB':>12}{'stored MB':>11}"
+              f"{'saved':>8}")
+        for row in savings["neighborhoods"] + [dict(savings["total"], neighborhood_code="total")]:
+            print(f"  {str(row['neighborhood_code']):<14}{row['documents']:>6}{row['versions']:>10}"
+                  f"{row['logical_bytes'] / 2**20:>12.1f}{row['stored_bytes'] / 2**20:>11.1f}"
+                  f"{row['savings_ratio']:>8.1%}")
+
+        legacy = results["whole_file"]
+        print(f"\n  integrity checks passed: whole_file {legacy['ok'] and legacy_ok}, chunked {chunked['ok']}")
+        print(f"  streamed reads not matching the version hash: "
+              f"whole_file {legacy['bad_reads']}, chunked {chunked['bad_reads']}")
+        mismatches = sorted(legacy["digests"]) != sorted(chunked["digests"])
+        print(f"  content mismatches between stores: {int(mismatches)}")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
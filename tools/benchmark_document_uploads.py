@@ -0,0 +1,275 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark: tenure document uploads through the upload pipeline vs. one-by-one originals.
+
+Generates a household's worth of scanned documents (A4 JPEGs at 300 dpi
+plus a few PDFs) and uploads them to a local HTTP server that behaves like
+the backend over a field-office uplink (per-request latency, per-connection
+and shared bandwidth caps) and drops a share of the connections half-way:
+  sequential      previous path: api.upload_relation_document() per file,
+                  full-resolution original, one after another; a dropped
+                  upload is sent again from the start
+  pipeline        UploadPipeline: bounded parallel uploads, images
+                  downscaled to --dpi, per-file retry
+
+Then saves the same documents again under a second relation (what a
+re-save or an outbox replay costs): the pipeline finds them in the
+survey's evidence by content hash and links them instead of uploading.
+
+Reports wall time, bytes received by the server and retries, and checks
+that every document ends up on the server and linked to its relation.
+
+Usage:
+    python tools/benchmark_document_uploads.py
+    python tools/benchmark_document_uploads.py --documents 16 --workers 4 --dpi 150
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import re
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from PIL import Image, ImageDraw  # noqa: E402
+from PyQt5.QtCore import Qt  # noqa: E402
+from services.api_client import ApiConfig, TRRCMSApiClient  # noqa: E402
+from services.upload_pipeline import UploadJob, UploadPipeline, run_upload_batch  # noqa: E402
+
+_BLOCK = 16 * 1024
+
+
+class _Link:
+    """Shared bandwidth of the office uplink (token bucket)."""
+
+    def __init__(self, bytes_per_s):
+        self.rate = bytes_per_s
+        self._next = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def send(self, size):
+        with self._lock:
+            now = time.perf_counter()
+            self._next = max(self._next, now) + size / self.rate
+            wait = self._next - now
+        time.sleep(wait)
+
+
+def _file_part(body, content_type):
+    """Content of the multipart 'File' field."""
+    boundary = re.search(r"boundary=([^;]+)", content_type).group(1).encode()
+    for part in body.split(b"--" + boundary):
+        head, _, data = part.partition(b"\r\n\r\n")
+        if b'name="File"' in head:
+            return data[:-2]  # trailing CRLF before the next boundary
+    return b""
+
+
+def _server(args):
+    link = _Link(args.link_mbps * 2**20 / 8)
+    per_connection = args.connection_mbps * 2**20 / 8
+    rnd = random.Random(11)
+    evidences = {}  # id -> {"id", "fileHash", "size", "evidenceRelations"}
+    stats = {"bytes_received": 0, "uploads": 0, "dropped": 0, "links": 0}
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args):
+            pass
+
+        def _json(self, data, status=200):
+            body = json.dumps(data).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            time.sleep(args.latency_ms / 1000)
+            if re.search(r"/v2/surveys/[^/]+/evidence$", self.path.split("?")[0]):
+                with lock:
+                    self._json({"items": [dict(e) for e in evidences.values()]})
+            else:
+                self.send_error(404)
+
+        def do_POST(self):
+            time.sleep(args.latency_ms / 1000)
+            length = int(self.headers.get("Content-Length", 0))
+            link_match = re.search(r"/evidence/([^/]+)/link-to-relation$", self.path)
+            if link_match:
+                relation_id = json.loads(self.rfile.read(length))["personPropertyRelationId"]
+                with lock:
+                    evidences[link_match.group(1)]["evidenceRelations"].append(
+                        {"personPropertyRelationId": relation_id})
+                    stats["links"] += 1
+                self._json({"id": link_match.group(1)})
+                return
+            if not self.path.endswith("/evidence/tenure"):
+                self.send_error(404)
+                return
+
+            with lock:
+                drop = rnd.random() < args.drop
+                stats["dropped"] += int(drop)
+            limit = length // 2 if drop else length
+            body = bytearray()
+            t0 = time.perf_counter()
+            while len(body) < limit:
+                block = self.rfile.read(min(_BLOCK, limit - len(body)))
+                if not block:
+                    break
+                link.send(len(block))
+                body += block
+                ahead = len(body) / per_connection - (time.perf_counter() - t0)
+                if ahead > 0:
+                    time.sleep(ahead)
+            with lock:
+                stats["bytes_received"] += len(body)
+            if drop or len(body) < length:
+                self.close_connection = True
+                return
+
+            data = _file_part(bytes(body), self.headers["Content-Type"])
+            relation_id = re.search(rb'name="PersonPropertyRelationId"\r\n\r\n([^\r]+)', body).group(1).decode()
+            evidence = {"id": uuid.uuid4().hex, "fileHash": hashlib.sha256(data).hexdigest(),
+                        "size": len(data), "evidenceRelations": [{"personPropertyRelationId": relation_id}]}
+            with lock:
+                evidences[evidence["id"]] = evidence
+                stats["uploads"] += 1
+            self._json(evidence)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, stats, evidences
+
+
+def _documents(workdir, count):
+    """Scanned pages (A4 at 300 dpi JPEG) and, every fourth, a PDF."""
+    rnd = random.Random(7)
+    files = []
+    for i in range(count):
+        if i % 4 == 3:
+            path = workdir / f"deed{i}.pdf"
+            path.write_bytes(b"%PDF-1.4\n" + rnd.randbytes(rnd.randint(200, 600) * 1024))
+        else:
+            path = workdir / f"scan{i}.jpg"
+            size = (2480, 3508)
+            image = Image.effect_noise(size, 24).convert("RGB")
+            image = Image.blend(image, Image.new("RGB", size, (236, 232, 220)), 0.8)
+            draw = ImageDraw.Draw(image)
+            for y in range(200, size[1] - 200, 70):
+                draw.line((180, y, rnd.randint(size[0] // 2, size[0] - 180), y), fill=(40, 40, 60), width=6)
+            image.save(path, quality=90, dpi=(300, 300))
+        files.append(path)
+    return files
+
+
+def _sequential(api, files, relation_id):
+    """Previous behaviour: originals one after another, re-sent from the start when dropped."""
+    retries = 0
+    for path in files:
+        while True:
+            try:
+                api.upload_relation_document(survey_id="s1", relation_id=relation_id, file_path=str(path))
+                break
+            except Exception:
+                retries += 1
+    return retries
+
+
+def _pipelined(pipeline, files, relation_id):
+    jobs = [UploadJob("upload_relation_document",
+                      {"survey_id": "s1", "relation_id": relation_id, "file_path": str(path)}, tag=path)
+            for path in files]
+    return run_upload_batch(jobs, pipeline)
+
+
+def _timed(stats, func, *args):
+    received = stats["bytes_received"]
+    t0 = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - t0, stats["bytes_received"] - received, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark document uploads")
+    parser.add_argument("--documents", type=int, default=12)
+    parser.add_argument("--workers", type=int, default=3)
+    parser.add_argument("--dpi", type=int, default=200, help="UPLOAD_IMAGE_DPI")
+    parser.add_argument("--drop", type=float, default=0.1, help="share of uploads cut half-way")
+    parser.add_argument("--latency-ms", type=float, default=150)
+    parser.add_argument("--connection-mbps", type=float, default=8, help="per-connection cap")
+    parser.add_argument("--link-mbps", type=float, default=20, help="shared uplink cap")
+    args = parser.parse_args()
+
+    os.environ["UPLOAD_IMAGE_DPI"] = str(args.dpi)
+    workdir = Path(tempfile.mkdtemp(prefix="document_uploads_"))
+    server, stats, evidences = _server(args)
+    try:
+        files = _documents(workdir, args.documents)
+        total_mb = sum(p.stat().st_size for p in files) / 2**20
+        api = TRRCMSApiClient(ApiConfig(base_url=f"http://127.0.0.1:{server.server_port}/api",
+                                        username="bench", password="bench", timeout=60))
+        api.access_token = "bench"
+
+        sequential = _timed(stats, _sequential, api, files, "rel-seq")
+        evidences.clear()
+
+        from app.config import Config
+        Config.UPLOAD_IMAGE_DPI = args.dpi
+        # Prepared images are cached per content; start cold
+        shutil.rmtree(Path(tempfile.gettempdir()) / "trrcms_uploads", ignore_errors=True)
+        pipeline = UploadPipeline(workers=args.workers, api=api)
+        progress_events = []
+        # No event loop here: receive the workers' signals directly
+        pipeline.progress.connect(progress_events.append, Qt.DirectConnection)
+        first = _timed(stats, _pipelined, pipeline, files, "rel-1")
+        links_before = stats["links"]
+        second = _timed(stats, _pipelined, pipeline, files, "rel-2")
+        pipeline_stats = pipeline.stats()
+        pipeline.shutdown()
+
+        failed = sum(not r.ok for r in first[2] + second[2])
+        skipped = sum(r.skipped for r in second[2])
+        linked = {evidence_id: {r["personPropertyRelationId"] for r in e["evidenceRelations"]}
+                  for evidence_id, e in evidences.items()}
+        unlinked = sum(not {"rel-1", "rel-2"} <= linked.get(r.evidence_id, set()) for r in first[2])
+        last = progress_events[-1] if progress_events else {}
+
+        print(f"=== Document upload benchmark: {args.documents} documents, {total_mb:.1f} MB, "
+              f"{args.latency_ms:.0f} ms latency, {args.connection_mbps:.0f}/{args.link_mbps:.0f} Mbit/s "
+              f"connection/uplink, {args.drop:.0%} of uploads dropped, {args.dpi} dpi ===\n")
+        print(f"  {'method':<18}{'time s':>9}{'MB received':>13}")
+        print(f"  {'sequential':<18}{sequential[0]:>9.2f}{sequential[1] / 2**20:>13.1f}")
+        print(f"  {'pipeline':<18}{first[0]:>9.2f}{first[1] / 2**20:>13.1f}")
+        print(f"  {'pipeline re-save':<18}{second[0]:>9.2f}{second[1] / 2**20:>13.1f}")
+        print(f"\n  sequential: {sequential[2]} uploads sent again after a drop")
+        print(f"  pipeline: {pipeline_stats['uploaded']} uploaded, {pipeline_stats['skipped']} skipped "
+              f"({stats['links'] - links_before} linked by hash), {pipeline_stats['retries']} retries, "
+              f"{pipeline_stats['bytes_original'] / 2**20:.1f} MB originals -> "
+              f"{pipeline_stats['bytes_sent'] / 2**20:.1f} MB sent, {len(progress_events)} progress signals")
+        print(f"  server: {stats['uploads']} uploads stored, {stats['dropped']} dropped")
+        print(f"  failed: {failed}, re-save skipped {skipped}/{args.documents}, "
+              f"documents not linked to both relations: {unlinked}, "
+              f"last progress active={last.get('active')}")
+    finally:
+        server.shutdown()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
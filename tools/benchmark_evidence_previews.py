@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark: evidence card thumbnails from the preview cache vs. full-scan decodes.
+
+Writes a case worth of synthetic scans (A4 at 300 dpi JPEGs plus a few
+PNG photos) and measures the time to fill every card thumbnail:
+  full_decode     previous cards: QPixmap(file) of the full scan, scaled
+                  to the card on every view
+  cache_cold      first view: every preview size rendered once per file
+                  (JPEG draft decoding, process pool), small one loaded
+  cache_warm      later views: cached previews only (what reopening the
+                  case costs)
+
+Also checks that the size bound holds by re-running with a cache smaller
+than the rendered previews.
+
+Usage:
+    python tools/benchmark_evidence_previews.py
+    python tools/benchmark_evidence_previews.py --attachments 40 --workers 2
+"""
+
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PIL import Image, ImageDraw  # noqa: E402
+from PyQt5.QtCore import Qt  # noqa: E402
+from PyQt5.QtGui import QGuiApplication, QPixmap  # noqa: E402
+
+from services.preview_cache import PREVIEW_SMALL, PreviewCache  # noqa: E402
+
+_CARD = 60
+
+
+def _scan(path, rnd, size):
+    """Page-like image: paper tone, text lines, noise, a stamp."""
+    image = Image.effect_noise(size, 24).convert("RGB")
+    image = Image.blend(image, Image.new("RGB", size, (236, 232, 220)), 0.8)
+    draw = ImageDraw.Draw(image)
+    for y in range(200, size[1] - 200, 70):
+        draw.line((180, y, rnd.randint(size[0] // 2, size[0] - 180), y), fill=(40, 40, 60), width=6)
+    draw.ellipse((size[0] - 900, size[1] - 900, size[0] - 300, size[1] - 300), outline=(30, 60, 160), width=14)
+    image.save(path, quality=90) if path.suffix == ".jpg" else image.save(path)
+
+
+def _full_decode(files):
+    for path in files:
+        QPixmap(str(path)).scaled(_CARD, _CARD, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+
+def _cached(cache, files):
+    for path in files:
+        preview = cache.get_or_render(str(path), PREVIEW_SMALL, alias=path.name)
+        QPixmap(str(preview)).scaled(_CARD, _CARD, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+
+def _timed(func, *args):
+    t0 = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - t0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark evidence previews")
+    parser.add_argument("--attachments", type=int, default=40)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--views", type=int, default=3, help="times the case is opened")
+    args = parser.parse_args()
+
+    app = QGuiApplication.instance() or QGuiApplication(sys.argv)
+    rnd = random.Random(7)
+    workdir = Path(tempfile.mkdtemp(prefix="evidence_previews_"))
+    try:
+        files = []
+        for i in range(args.attachments):
+            if i % 5 == 4:
+                path, size = workdir / f"photo{i}.png", (1600, 1200)
+            else:
+                path, size = workdir / f"scan{i}.jpg", (2480, 3508)
+            _scan(path, rnd, size)
+            files.append(path)
+        total_mb = sum(p.stat().st_size for p in files) / 2**20
+
+        legacy_s = [_timed(_full_decode, files) for _ in range(args.views)]
+
+        cache = PreviewCache(root=workdir / "previews", max_bytes=256 * 2**20, workers=args.workers)
+        cold_s = _timed(_cached, cache, files)
+        warm_s = [_timed(_cached, cache, files) for _ in range(args.views - 1)]
+        stats = cache.stats()
+        cache.shutdown()
+
+        bounded = PreviewCache(root=workdir / "bounded", max_bytes=stats["total_bytes"] // 3, workers=0)
+        _cached(bounded, files)
+        on_disk = sum(p.stat().st_size for p in (workdir / "bounded").glob("??/*.jpg"))
+
+        print(f"=== Evidence preview benchmark: {args.attachments} attachments, {total_mb:.1f} MB, "
+              f"{args.workers} render workers, {os.cpu_count()} CPUs, Qt {app.platformName()} ===\n")
+        print(f"  {'method':<14}{'view 1 ms':>11}{'later views ms':>16}{'per card ms':>13}")
+        print(f"  {'full_decode':<14}{legacy_s[0] * 1e3:>11.0f}{min(legacy_s[1:]) * 1e3:>16.0f}"
+              f"{min(legacy_s[1:]) * 1e3 / args.attachments:>13.1f}")
+        print(f"  {'preview_cache':<14}{cold_s * 1e3:>11.0f}{min(warm_s) * 1e3:>16.0f}"
+              f"{min(warm_s) * 1e3 / args.attachments:>13.1f}")
+        print(f"\n  renders {stats['renders']}, cache hits {stats['hits']}, "
+              f"previews on disk {stats['total_bytes'] / 1024:.0f} KB")
+        print(f"  bounded cache: limit {bounded.max_bytes / 1024:.0f} KB, on disk {on_disk / 1024:.0f} KB, "
+              f"evicted {bounded.stats()['evicted']}")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark: shared geometry codec vs. the previous ad-hoc WKT parsing.
+
+"legacy" is the old GeoJSONConverter._wkt_polygon_to_geojson (regex +
+str.split + float() per coordinate, rebuilt on every render). "codec" is
+services.geometry_codec: a cold parse (cache cleared per pass) and a warm
+pass that re-renders the same footprints from the LRU cache.
+
+Usage:
+    python tools/benchmark_geometry_codec.py                     # 2,000 x 40 vertices
+    python tools/benchmark_geometry_codec.py --count 5000 --vertices 600
+"""
+
+import argparse
+import math
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from services import geometry_codec  # noqa: E402
+
+
+def _legacy_wkt_polygon_to_geojson(wkt):
+    match = re.search(r'POLYGON\s*\(\s*\((.*?)\)\s*\)', wkt, re.IGNORECASE)
+    if not match:
+        return None
+    points = []
+    for point_str in match.group(1).split(','):
+        parts = point_str.strip().split()
+        if len(parts) >= 2:
+            points.append([float(parts[0]), float(parts[1])])
+    return {"type": "Polygon", "coordinates": [points]} if len(points) >= 4 else None
+
+
+def _footprint_wkt(rnd, vertices):
+    lon = 37.10 + rnd.random() * 0.1
+    lat = 36.15 + rnd.random() * 0.1
+    radius = 0.0001 + rnd.random() * 0.0003
+    ring = []
+    for i in range(vertices):
+        angle = 2 * math.pi * i / vertices
+        ring.append(f"{lon + radius * math.cos(angle):.8f} {lat + radius * math.sin(angle):.8f}")
+    ring.append(ring[0])
+    return f"POLYGON(({', '.join(ring)}))"
+
+
+def _time(fn, items, passes):
+    t0 = time.perf_counter()
+    for _ in range(passes):
+        for item in items:
+            fn(item)
+    return (time.perf_counter() - t0) / passes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the geometry codec")
+    parser.add_argument("--count", type=int, default=2000, help="Footprints per render (default: 2000)")
+    parser.add_argument("--vertices", type=int, default=40, help="Vertices per footprint (default: 40)")
+    parser.add_argument("--passes", type=int, default=5, help="Renders timed (default: 5)")
+    args = parser.parse_args()
+
+    rnd = random.Random(5)
+    wkts = [_footprint_wkt(rnd, args.vertices) for _ in range(args.count)]
+    geometry_codec.CACHE_SIZE = max(geometry_codec.CACHE_SIZE, args.count)
+
+    legacy = _time(_legacy_wkt_polygon_to_geojson, wkts, args.passes)
+
+    def cold(wkt):
+        geometry_codec.clear_cache()
+        return geometry_codec.wkt_to_geojson(wkt)
+
+    codec_cold = _time(cold, wkts, args.passes)
+    geometry_codec.clear_cache()
+    for wkt in wkts:
+        geometry_codec.wkt_to_geojson(wkt)
+    codec_warm = _time(geometry_codec.wkt_to_geojson, wkts, args.passes)
+
+    assert all(_legacy_wkt_polygon_to_geojson(w) == geometry_codec.wkt_to_geojson(w) for w in wkts[:50])
+
+    print(f"=== Geometry codec benchmark: {args.count:,} footprints x {args.vertices} vertices, "
+          f"{args.passes} renders ===\n")
+    print(f"  {'parser':<14}{'per render':>12}{'footprints/s':>15}{'speedup':>9}")
+    for name, elapsed in (("legacy", legacy), ("codec_cold", codec_cold), ("codec_cached", codec_warm)):
+        print(f"  {name:<14}{elapsed * 1000:>10.1f}ms{args.count / elapsed:>15,.0f}"
+              f"{legacy / elapsed:>8.1f}x")
+    print(f"\n  cache: {geometry_codec.cache_info()}")
+
+
+if __name__ == "__main__":
+    main()
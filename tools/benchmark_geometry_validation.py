@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark: GeometryValidationService self-intersection test and batch QA.
+
+Generates digitized-looking building footprints around Aleppo (wavy
+star-shaped rings with jittered vertices, 500+ vertices each) and measures:
+  legacy_check    the previous O(n^2) all-pairs edge intersection test
+  sweep_check     the Shamos-Hoey sweep used by validate_polygon()
+  batch_serial    validate_batch() with workers=1
+  batch_pool      validate_batch() in a process pool (all CPUs)
+
+Usage:
+    python tools/benchmark_geometry_validation.py                    # 2,000 x 600 vertices
+    python tools/benchmark_geometry_validation.py --count 5000 --vertices 1000
+"""
+
+import argparse
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from services.geometry_validation_service import (  # noqa: E402
+    GeometryValidationService, _ring_edges,
+)
+from services.map_service import GeoPolygon  # noqa: E402
+
+
+def _footprint(rnd, vertices):
+    lon = 37.10 + rnd.random() * 0.1
+    lat = 36.15 + rnd.random() * 0.1
+    radius = 0.0002 + rnd.random() * 0.0004
+    waves = rnd.randint(3, 9)
+    ring = []
+    for i in range(vertices):
+        angle = 2 * math.pi * i / vertices
+        r = radius * (1 + 0.25 * math.sin(waves * angle) + rnd.uniform(-0.002, 0.002))
+        ring.append((lon + r * math.cos(angle), lat + r * math.sin(angle)))
+    ring.append(ring[0])
+    return ring
+
+
+def _legacy_has_self_intersection(service, ring):
+    edges = _ring_edges(ring)
+    m = len(edges)
+    for i in range(m):
+        for j in range(i + 2, m):
+            if i == 0 and j == m - 1:
+                continue
+            if service._segments_intersect(edges[i][0], edges[i][1], edges[j][0], edges[j][1]):
+                return True
+    return False
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark geometry validation")
+    parser.add_argument("--count", type=int, default=2000, help="Footprints in the batch (default: 2000)")
+    parser.add_argument("--vertices", type=int, default=600, help="Vertices per footprint (default: 600)")
+    parser.add_argument("--legacy-sample", type=int, default=20,
+                        help="Footprints timed with the O(n^2) check (default: 20)")
+    args = parser.parse_args()
+
+    rnd = random.Random(7)
+    rings = [_footprint(rnd, args.vertices) for _ in range(args.count)]
+    service = GeometryValidationService()
+    sample = rings[:max(1, min(args.legacy_sample, len(rings)))]
+
+    print(f"=== Geometry validation benchmark: {args.count:,} footprints x "
+          f"{args.vertices} vertices ===\n")
+
+    t0 = time.perf_counter()
+    legacy = [_legacy_has_self_intersection(service, ring) for ring in sample]
+    legacy_time = (time.perf_counter() - t0) / len(sample)
+
+    t0 = time.perf_counter()
+    sweep = [service._has_self_intersection(ring) for ring in sample]
+    sweep_time = (time.perf_counter() - t0) / len(sample)
+    agree = sum(1 for a, b in zip(legacy, sweep) if a == b)
+
+    print(f"  {'check':<15}{'per ring':>12}{'speedup':>10}")
+    print(f"  {'legacy_check':<15}{legacy_time * 1000:>10.1f}ms")
+    print(f"  {'sweep_check':<15}{sweep_time * 1000:>10.1f}ms{legacy_time / sweep_time:>9.1f}x")
+    print(f"  results agree on {agree}/{len(sample)} sampled rings\n")
+
+    batch = [(str(i), GeoPolygon(coordinates=[ring])) for i, ring in enumerate(rings)]
+    serial = service.validate_batch(batch, workers=1)
+    pool = service.validate_batch(batch)
+
+    print(f"  {'batch':<15}{'workers':>8}{'time':>10}{'footprints/s':>15}{'invalid':>9}")
+    for name, report in (("batch_serial", serial), ("batch_pool", pool)):
+        print(f"  {name:<15}{report.workers:>8}{report.duration_seconds:>9.2f}s"
+              f"{report.total / report.duration_seconds:>15,.0f}{report.invalid:>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark: NMEA replay through GPSService and compact track recording.
+
+Writes a synthetic field-day NMEA log (1 Hz GGA + RMC + GSA fixes of a
+surveyor walking between buildings, with receiver noise) and replays it
+through GPSService._nmea_file_loop while recording the track:
+  unpaced         replay_speed=0: parser and fix-processing throughput
+  paced           replay_speed=--speed (100x real time by default) over the
+                  first --paced-minutes of the log: wall time against the
+                  schedule and callback latency (callback time minus the
+                  fix's scheduled time)
+
+Track storage is compared with the previous list of TrackPoint objects
+(memory while recording, GPX export time and peak memory), and the
+simplified track is checked against every recorded fix: no fix may be
+further than the tolerance from the stored line.
+
+The previous replay slept 0.1 s per sentence, so it could not go faster
+than 10 sentences per second; its duration is reported for reference.
+
+Usage:
+    python tools/benchmark_gps_track.py
+    python tools/benchmark_gps_track.py --hours 4 --speed 200 --tolerance 1.0
+"""
+
+import argparse
+import math
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from services.gps_service import (  # noqa: E402
+    GPSConfig, GPSPosition, GPSService, GPSSource, NMEAParser, TrackPoint,
+)
+from services.gps_track_store import TrackStore  # noqa: E402
+
+_METERS_PER_DEGREE = 111320.0
+
+
+def _sentence(body):
+    return f"${body}*{NMEAParser._calculate_checksum(body)}\n"
+
+
+def _nmea_coordinate(value, positive, negative, width):
+    hemisphere = positive if value >= 0 else negative
+    value = abs(value)
+    degrees = int(value)
+    return f"{degrees:0{width}d}{(value - degrees) * 60:07.4f}", hemisphere
+
+
+def _write_log(path, fixes):
+    """1 Hz walk: legs between random stops, pauses at buildings, ~3 m of receiver noise."""
+    rnd = random.Random(5)
+    lat, lon = 33.3152, 44.3661
+    heading, speed, pause = 0.0, 1.2, 0
+    with open(path, "w", encoding="ascii") as fp:
+        for second in range(fixes):
+            if pause:
+                pause -= 1
+                speed = 0.0
+            elif rnd.random() < 0.004:
+                pause = rnd.randint(60, 600)  # interviewing a household
+            else:
+                speed = 1.2
+                heading += rnd.gauss(0, 4) + (rnd.choice((-90, 90)) if rnd.random() < 0.01 else 0)
+            lat += speed * math.cos(math.radians(heading)) / _METERS_PER_DEGREE
+            lon += speed * math.sin(math.radians(heading)) / (_METERS_PER_DEGREE * math.cos(math.radians(lat)))
+            noisy_lat = lat + rnd.gauss(0, 1.5) / _METERS_PER_DEGREE
+            noisy_lon = lon + rnd.gauss(0, 1.5) / _METERS_PER_DEGREE
+            hms = time.strftime("%H%M%S", time.gmtime(6 * 3600 + second)) + ".00"
+            lat_s, ns = _nmea_coordinate(noisy_lat, "N", "S", 2)
+            lon_s, ew = _nmea_coordinate(noisy_lon, "E", "W", 3)
+            fp.write(_sentence(f"GPGGA,{hms},{lat_s},{ns},{lon_s},{ew},1,09,0.9,{34 + rnd.gauss(0, 2):.1f},M,-2.0,M,,"))
+            fp.write(_sentence(f"GPRMC,{hms},A,{lat_s},{ns},{lon_s},{ew},{speed / 0.514444:.1f},"
+                               f"{heading % 360:.1f},181026,,,A"))
+            fp.write(_sentence("GPGSA,A,3,04,05,09,12,17,24,25,29,31,,,,1.6,0.9,1.3"))
+
+
+def _replay(path, speed, tolerance, track_dir, limit_lines=None):
+    """Replay `path`; returns (wall seconds, callback times, recorded fixes, track)."""
+    if limit_lines:
+        sliced = Path(track_dir).parent / "slice.nmea"
+        with open(path, encoding="ascii") as src, open(sliced, "w", encoding="ascii") as dst:
+            for _, line in zip(range(limit_lines), src):
+                dst.write(line)
+        path = sliced
+    service = GPSService(GPSConfig(source=GPSSource.NMEA_FILE, port=str(path), replay_speed=speed,
+                                   track_tolerance=tolerance))
+    callbacks, recorded = [], []
+    service.add_position_callback(lambda p: (callbacks.append(time.perf_counter()),
+                                             recorded.append((p.longitude, p.latitude))))
+    service.start_track(directory=track_dir)
+    t0 = time.perf_counter()
+    service.connect()
+    service._thread.join()
+    wall = time.perf_counter() - t0
+    service.disconnect()
+    return wall, callbacks, recorded, service.stop_track()
+
+
+def _legacy_track(recorded):
+    """Previous storage: a TrackPoint (with its GPSPosition) per fix."""
+    now = datetime.now()
+    return [TrackPoint(position=GPSPosition(latitude=lat, longitude=lon, altitude=34.0, hdop=0.9,
+                                            satellites=9, source=GPSSource.NMEA_FILE),
+                       timestamp=now)
+            for lon, lat in recorded]
+
+
+def _record_store(recorded, tolerance, directory):
+    store = TrackStore(directory=directory, tolerance=tolerance)
+    now = time.time()
+    for lon, lat in recorded:
+        store.append(lon, lat, 34.0, now)
+    store.finish()
+    return store
+
+
+def _legacy_gpx(points):
+    """Previous export_track_gpx: the whole document built in memory."""
+    gpx = ['<?xml version="1.0" encoding="UTF-8"?>', '<gpx version="1.1" creator="TRRCMS">',
+           '  <trk>', '    <name>TRRCMS Track</name>', '    <trkseg>']
+    for point in points:
+        pos = point.position
+        gpx.append(f'      <trkpt lat="{pos.latitude}" lon="{pos.longitude}">')
+        if pos.altitude:
+            gpx.append(f'        <ele>{pos.altitude}</ele>')
+        gpx.append(f'        <time>{point.timestamp.isoformat()}</time>')
+        gpx.append('      </trkpt>')
+    gpx += ['    </trkseg>', '  </trk>', '</gpx>']
+    return '\n'.join(gpx)
+
+
+def _measured(func, *args):
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - t0
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, current, peak, result
+
+
+def _max_deviation(recorded, track):
+    """Largest distance (m) from a recorded fix to the stored line between its neighbours."""
+    stored = [(lon, lat) for lon, lat, _, _, _ in track.fixes()]
+    kx = _METERS_PER_DEGREE * math.cos(math.radians(recorded[0][1]))
+    project = [(lon * kx, lat * _METERS_PER_DEGREE) for lon, lat in recorded]
+    worst, j = 0.0, 0
+    for i, fix in enumerate(recorded):
+        if j + 1 < len(stored) and fix == stored[j + 1]:
+            j += 1
+            continue
+        if fix == stored[j]:
+            continue
+        (ax, ay), (bx, by) = [(lon * kx, lat * _METERS_PER_DEGREE) for lon, lat in stored[j:j + 2]]
+        px, py = project[i]
+        dx, dy = bx - ax, by - ay
+        length2 = dx * dx + dy * dy
+        t = max(0.0, min(1.0, ((px - ax) * dx + (py - ay) * dy) / length2)) if length2 else 0.0
+        worst = max(worst, math.hypot(px - ax - t * dx, py - ay - t * dy))
+    return worst
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark NMEA replay and GPS track storage")
+    parser.add_argument("--hours", type=float, default=8, help="length of the field day (1 Hz fixes)")
+    parser.add_argument("--speed", type=float, default=100, help="paced replay, multiple of real time")
+    parser.add_argument("--paced-minutes", type=float, default=30)
+    parser.add_argument("--tolerance", type=float, default=2.0, help="track simplification, metres")
+    args = parser.parse_args()
+
+    fixes = int(args.hours * 3600)
+    workdir = Path(tempfile.mkdtemp(prefix="gps_track_"))
+    try:
+        log = workdir / "field_day.nmea"
+        _write_log(log, fixes)
+        lines = fixes * 3
+
+        wall, _, recorded, track = _replay(log, 0, args.tolerance, workdir / "unpaced")
+        paced_fixes = int(args.paced_minutes * 60)
+        paced_wall, callbacks, _, paced_track = _replay(log, args.speed, args.tolerance, workdir / "paced",
+                                                        limit_lines=paced_fixes * 3)
+        # Fix i is due (i / speed) seconds after the first one
+        lags = [(t - callbacks[0]) - i / args.speed for i, t in enumerate(callbacks)]
+
+        legacy_s, legacy_bytes, _, legacy_points = _measured(_legacy_track, recorded)
+        store_s, _, store_peak, store = _measured(_record_store, recorded, args.tolerance, workdir / "store")
+        gpx_legacy_s, _, gpx_legacy_peak, _ = _measured(_legacy_gpx, legacy_points)
+        del legacy_points
+        with open(workdir / "track.gpx", "w", encoding="utf-8") as fp:
+            gpx_s, _, gpx_peak, written = _measured(track.write_gpx, fp)
+
+        print(f"=== GPS track benchmark: {args.hours:g} h at 1 Hz, {fixes} fixes, {lines} NMEA sentences, "
+              f"tolerance {args.tolerance:g} m ===\n")
+        print(f"  unpaced replay: {wall:.2f} s, {lines / wall:,.0f} sentences/s, {len(recorded) / wall:,.0f} fixes/s "
+              f"(previous replay: {lines * 0.1 / 3600:.1f} h)")
+        print(f"  paced replay at {args.speed:g}x, {paced_fixes} fixes: {paced_wall:.2f} s "
+              f"(schedule {paced_fixes / args.speed:.2f} s), callback lag "
+              f"p50 {statistics.median(lags) * 1e3:.2f} ms, p99 {sorted(lags)[int(len(lags) * 0.99)] * 1e3:.2f} ms, "
+              f"max {max(lags) * 1e3:.2f} ms")
+        print()
+        print(f"  {'track':<14}{'points':>9}{'memory KB':>12}{'disk KB':>10}{'GPX s':>8}{'GPX peak KB':>13}")
+        print(f"  {'TrackPoint list':<14}{len(recorded):>9}{legacy_bytes / 1024:>12.0f}{0:>10}"
+              f"{gpx_legacy_s:>8.2f}{gpx_legacy_peak / 1024:>13.0f}")
+        print(f"  {'TrackStore':<14}{len(track):>9}{store_peak / 1024:>12.0f}{track.disk_bytes() / 1024:>10.0f}"
+              f"{gpx_s:>8.2f}{gpx_peak / 1024:>13.0f}")
+        print(f"\n  recording {len(recorded)} fixes: TrackPoint list {legacy_s:.2f} s, TrackStore {store_s:.2f} s; "
+              f"{written} points exported")
+        print(f"  check: max distance of a recorded fix from the stored line {_max_deviation(recorded, track):.2f} m "
+              f"(tolerance {args.tolerance:g} m); re-recorded store matches: {len(store) == len(track)}; "
+              f"paced track {len(paced_track)} of {paced_track.received} fixes")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark: LIKE scan vs. FTS5 ranked search over persons.
+
+Creates a throw-away SQLite database with the application schema, loads
+synthetic persons (Arabic names with hamza/taa-marbuta/diacritic variants,
+Latin transliterations, national IDs) through the normal insert path so the
+FTS triggers run, indexes the pending documents (what the background
+refresh does after writes), then times the legacy LIKE query against
+PersonRepository.search_ranked() for a set of typical search strings.
+
+Usage:
+    python tools/benchmark_person_search.py                 # 1,000,000 persons
+    python tools/benchmark_person_search.py --persons 100000 --repeat 10
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from repositories.database import Database  # noqa: E402
+from repositories.person_repository import PersonRepository  # noqa: E402
+from repositories.search_index import refresh_search_index  # noqa: E402
+
+FIRST_AR = ["أحمد", "محمد", "إبراهيم", "فاطمة", "عائشة", "آمنة", "خديجة", "يوسف",
+            "مصطفى", "عبد الله", "أسامة", "رقيّة", "علي", "حسن", "زينب", "مريم"]
+FIRST_EN = ["Ahmad", "Mohammad", "Ibrahim", "Fatima", "Aisha", "Amina", "Khadija", "Yousef",
+            "Mustafa", "Abdullah", "Osama", "Ruqayya", "Ali", "Hasan", "Zeinab", "Maryam"]
+LAST_AR = ["الحلبي", "الأحمد", "الإدلبي", "السيّد", "حمزة", "الشامي", "قطّان", "النجار",
+           "الخطيب", "العلي", "الزعبي", "طلاس", "الأسعد", "درويش", "عثمان", "شيخة"]
+LAST_EN = ["Halabi", "Al-Ahmad", "Idlibi", "Sayyed", "Hamza", "Shami", "Qattan", "Najjar",
+           "Khatib", "Ali", "Zoubi", "Tlass", "Asaad", "Darwish", "Othman", "Sheikha"]
+
+QUERIES = ["احمد الحلبي", "فاطمه", "ابراهيم", "Mustafa Khatib", "12345", "حمزه", "shami",
+           "خطيب", "4567"]
+
+LEGACY_SQL = """
+    SELECT * FROM persons WHERE (
+        first_name LIKE ? OR first_name_ar LIKE ? OR
+        last_name LIKE ? OR last_name_ar LIKE ? OR
+        national_id LIKE ?
+    ) ORDER BY last_name_ar, first_name_ar LIMIT 50
+"""
+
+
+def _rows(count: int, seed: int = 11):
+    rnd = random.Random(seed)
+    now = "2024-01-01T00:00:00"
+    for i in range(count):
+        f = rnd.randrange(len(FIRST_AR))
+        fa = rnd.randrange(len(FIRST_AR))
+        l = rnd.randrange(len(LAST_AR))
+        yield (
+            str(uuid.UUID(int=rnd.getrandbits(128))),
+            FIRST_EN[f], FIRST_AR[f], FIRST_EN[fa], FIRST_AR[fa], LAST_EN[l], LAST_AR[l],
+            rnd.choice(["M", "F"]), 1940 + rnd.randrange(70),
+            f"{rnd.randrange(10**11):011d}", now, now,
+        )
+
+
+def _load(db: Database, count: int, batch: int = 20000):
+    query = """
+        INSERT INTO persons (
+            person_id, first_name, first_name_ar, father_name, father_name_ar,
+            last_name, last_name_ar, gender, year_of_birth, national_id,
+            created_at, updated_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    chunk = []
+    for row in _rows(count):
+        chunk.append(row)
+        if len(chunk) >= batch:
+            db._adapter.execute_many(query, chunk)
+            chunk = []
+    if chunk:
+        db._adapter.execute_many(query, chunk)
+
+
+def _time(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1000.0)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark person search")
+    parser.add_argument("--persons", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(Path(tmp) / "bench.db")
+        db.initialize()
+        repo = PersonRepository(db)
+
+        t0 = time.perf_counter()
+        _load(db, args.persons)
+        loaded = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        refresh_search_index(db, "persons_fts")
+        print(f"=== Person search benchmark: {args.persons:,} persons "
+              f"(loaded with FTS triggers in {loaded:.1f}s, "
+              f"indexed in {time.perf_counter() - t0:.1f}s) ===\n")
+        print(f"  {'query':<18}{'LIKE':>10}{'FTS5':>10}{'speedup':>9}{'LIKE hits':>11}{'FTS hits':>10}")
+
+        for text in QUERIES:
+            pattern = f"%{text}%"
+            legacy_hits = len(db.fetch_all(LEGACY_SQL, (pattern,) * 5))
+            fts_hits = len(repo.search_ranked(text, limit=50))
+            like_ms = _time(lambda: db.fetch_all(LEGACY_SQL, (pattern,) * 5), args.repeat)
+            fts_ms = _time(lambda: repo.search_ranked(text, limit=50), args.repeat)
+            print(f"  {text:<18}{like_ms:>8.1f}ms{fts_ms:>8.1f}ms{like_ms / fts_ms:>8.1f}x"
+                  f"{legacy_hits:>11}{fts_hits:>10}")
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark: offline reverse geocoding over the shipped boundary GeoJSON.
+
+Reports, for one boundary level from assets/geojson:
+  build           parse GeoJSON + build the STR index (first run ever)
+  load            read the persisted .npz index (every later session)
+  linear_scan     bbox filter + ray test over every polygon (no index)
+  lookup          ReverseGeocoder.lookup, one point at a time
+  lookup_many     one batch call for all points (import validation)
+
+Points are drawn inside random polygon bounding boxes, so most of them
+hit a polygon. Results of every method are cross-checked.
+
+Usage:
+    python tools/benchmark_reverse_geocoder.py                          # neighbourhoods, 10k points
+    python tools/benchmark_reverse_geocoder.py --level districts --points 50000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from services.reverse_geocoder import ASSET_LEVELS, ReverseGeocoder  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark offline reverse geocoding")
+    parser.add_argument("--level", default="neighbourhoods", choices=ASSET_LEVELS)
+    parser.add_argument("--points", type=int, default=10_000)
+    args = parser.parse_args()
+
+    cache_dir = Path(tempfile.mkdtemp(prefix="boundary_index_"))
+    t0 = time.perf_counter()
+    index = ReverseGeocoder(cache_dir).index(args.level)
+    build_s = time.perf_counter() - t0
+    if index is None:
+        print(f"No GeoJSON for level '{args.level}' in assets/geojson")
+        return
+
+    geocoder = ReverseGeocoder(cache_dir)
+    t0 = time.perf_counter()
+    index = geocoder.index(args.level)
+    load_s = time.perf_counter() - t0
+
+    rnd = np.random.default_rng(5)
+    boxes = index.bboxes[rnd.integers(0, len(index), args.points)]
+    points = np.column_stack((rnd.uniform(boxes[:, 0], boxes[:, 2]), rnd.uniform(boxes[:, 1], boxes[:, 3])))
+    pairs = points.tolist()
+
+    print(f"=== Reverse geocoding benchmark: {len(index):,} '{args.level}' polygons, "
+          f"{len(index.edges):,} edges, {args.points:,} points ===\n")
+    print(f"  {'build':<14}{build_s * 1e3:>10.1f} ms")
+    print(f"  {'load':<14}{load_s * 1e3:>10.1f} ms\n")
+
+    scan_n = min(len(pairs), 1000)
+    bboxes = index.bboxes.tolist()
+    t0 = time.perf_counter()
+    scanned = []
+    for x, y in pairs[:scan_n]:
+        hit = -1
+        for f, (x0, y0, x1, y1) in enumerate(bboxes):
+            if x0 <= x <= x1 and y0 <= y <= y1 and index.contains(f, x, y):
+                hit = f
+                break
+        scanned.append(hit)
+    scan = (time.perf_counter() - t0) / scan_n
+
+    t0 = time.perf_counter()
+    single = [index.lookup(x, y) for x, y in pairs]
+    lookup = (time.perf_counter() - t0) / len(pairs)
+
+    t0 = time.perf_counter()
+    batch = index.lookup_many(points)
+    many = (time.perf_counter() - t0) / len(pairs)
+
+    print(f"  {'method':<14}{'µs/point':>10}{'speedup':>10}")
+    for name, per_point in (("linear_scan", scan), ("lookup", lookup), ("lookup_many", many)):
+        print(f"  {name:<14}{per_point * 1e6:>10.1f}{scan / per_point:>9.1f}x")
+
+    hits = int((batch >= 0).sum())
+    mismatches = int((np.array(single) != batch).sum()) + sum(
+        a != b for a, b in zip(scanned, single[:scan_n]))
+    print(f"\n  hits {hits:,}/{len(pairs):,}, mismatches between methods: {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark: SQLiteAdapter tuned profile vs. the previous adapter behaviour.
+
+"legacy" reproduces the old adapter in-process: rollback journal with
+synchronous=FULL, default cache, a commit after every execute(), a dict
+built per row by the connection row factory and a dict-backed row proxy.
+"tuned" is the current SQLiteAdapter (WAL, synchronous=NORMAL, cache/mmap,
+unit-of-work transactions, tuple rows with shared column metadata).
+
+Measured on a throw-away database with the application schema:
+  insert_single   N single-row INSERTs via execute() (autocommit path)
+  insert_uow      N INSERTs inside one transaction() unit of work
+  read_all        fetch_all() of every row, then dict(row) on each
+  read_point      N primary-key fetch_one() lookups
+
+Usage:
+    python tools/benchmark_sqlite_adapter.py                 # 5,000 rows
+    python tools/benchmark_sqlite_adapter.py --rows 20000
+"""
+
+import argparse
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from repositories.db_adapter import DatabaseConfig, SQLiteAdapter  # noqa: E402
+
+INSERT_SQL = """
+    INSERT INTO persons (person_id, first_name, first_name_ar, last_name, last_name_ar,
+                         gender, year_of_birth, national_id, created_at, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+class _LegacyRow:
+    def __init__(self, data, columns=None):
+        self._data = data
+        self._columns = columns or list(data.keys())
+
+    def __getitem__(self, key):
+        if isinstance(key, int):
+            return self._data[self._columns[key]]
+        return self._data[key]
+
+    def keys(self):
+        return self._data.keys()
+
+
+class _LegacyAdapter:
+    """The previous single-connection, autocommit-per-statement adapter."""
+
+    def __init__(self, path: Path):
+        self._conn = sqlite3.connect(str(path), check_same_thread=False,
+                                     detect_types=sqlite3.PARSE_DECLTYPES)
+        self._conn.row_factory = self._dict_factory
+        self._conn.execute("PRAGMA foreign_keys = ON")
+
+    @staticmethod
+    def _dict_factory(cursor, row):
+        columns = [col[0] for col in cursor.description]
+        return {col: row[idx] for idx, col in enumerate(columns)}
+
+    def execute(self, query, params=None):
+        cursor = self._conn.cursor()
+        cursor.execute(query, params or ())
+        self._conn.commit()
+        if cursor.description:
+            columns = [col[0] for col in cursor.description]
+            return [_LegacyRow(row, columns) for row in cursor.fetchall()]
+        return []
+
+    def fetch_one(self, query, params=None):
+        cursor = self._conn.cursor()
+        cursor.execute(query, params or ())
+        row = cursor.fetchone()
+        if row and cursor.description:
+            return _LegacyRow(row, [col[0] for col in cursor.description])
+        return None
+
+    def fetch_all(self, query, params=None):
+        cursor = self._conn.cursor()
+        cursor.execute(query, params or ())
+        columns = [col[0] for col in cursor.description]
+        return [_LegacyRow(row, columns) for row in cursor.fetchall()]
+
+    @contextmanager
+    def transaction(self):
+        # The old transaction() did not suppress execute()'s own commits.
+        yield self._conn
+        self._conn.commit()
+
+    def close(self):
+        self._conn.close()
+
+
+def _rows(count: int, offset: int = 0):
+    now = "2024-01-01T00:00:00"
+    for i in range(offset, offset + count):
+        yield (str(uuid.UUID(int=i + 1)), f"First{i}", f"الاسم{i}", f"Last{i}", f"الكنية{i}",
+               "M" if i % 2 else "F", 1950 + i % 60, f"{i:011d}", now, now)
+
+
+def _run(adapter, rows: int) -> dict:
+    results = {}
+
+    t0 = time.perf_counter()
+    for row in _rows(rows):
+        adapter.execute(INSERT_SQL, row)
+    results["insert_single"] = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    with adapter.transaction():
+        for row in _rows(rows, offset=rows):
+            adapter.execute(INSERT_SQL, row)
+    results["insert_uow"] = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    fetched = adapter.fetch_all("SELECT * FROM persons")
+    for row in fetched:
+        dict(zip(row.keys(), (row[k] for k in row.keys())))
+    results["read_all"] = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    for i in range(rows):
+        adapter.fetch_one("SELECT * FROM persons WHERE person_id = ?", (str(uuid.UUID(int=i + 1)),))
+    results["read_point"] = time.perf_counter() - t0
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark SQLiteAdapter profiles")
+    parser.add_argument("--rows", type=int, default=5000, help="Rows per phase (default: 5000)")
+    args = parser.parse_args()
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        schema_path = Path(tmp) / "legacy.db"
+        schema = SQLiteAdapter(schema_path, DatabaseConfig())
+        schema.initialize()
+        schema.close()
+        # Schema creation leaves WAL on; the legacy run uses the rollback journal.
+        conn = sqlite3.connect(str(schema_path))
+        conn.execute("PRAGMA journal_mode = DELETE")
+        conn.close()
+
+        legacy = _LegacyAdapter(schema_path)
+        results["legacy"] = _run(legacy, args.rows)
+        legacy.close()
+
+        tuned = SQLiteAdapter(Path(tmp) / "tuned.db", DatabaseConfig())
+        tuned.initialize()
+        results["tuned"] = _run(tuned, args.rows)
+        tuned.close()
+
+    print(f"=== SQLiteAdapter benchmark: {args.rows:,} rows per phase ===\n")
+    print(f"  {'phase':<15}{'legacy':>11}{'tuned':>11}{'rows/s (tuned)':>17}{'speedup':>9}")
+    for phase in ("insert_single", "insert_uow", "read_all", "read_point"):
+        before, after = results["legacy"][phase], results["tuned"][phase]
+        print(f"  {phase:<15}{before:>10.2f}s{after:>10.2f}s{args.rows / after:>17,.0f}"
+              f"{before / after:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
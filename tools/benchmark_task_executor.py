@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark: shared task executor vs. one QThread per ApiWorker call.
+
+Simulates a burst of UI calls (a user typing into a search box, pages
+reloading) where each call sleeps like a network round-trip:
+  qthread_per_call  previous ApiWorker: a new QThread started per call,
+                    every result delivered
+  executor          ApiWorker on the shared pool, every result delivered
+  superseded        same burst with supersede=True: stale searches are
+                    cancelled and only the newest result is delivered
+
+Reports wall time until the last delivery, the number of threads created
+and the executor's queue-wait / run latencies.
+
+Usage:
+    python tools/benchmark_task_executor.py
+    python tools/benchmark_task_executor.py --calls 200 --latency-ms 40 --interval-ms 5
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtCore import QCoreApplication, QThread, QTimer, pyqtSignal  # noqa: E402
+
+from services.task_executor import TaskExecutor  # noqa: E402
+import services.task_executor as task_executor  # noqa: E402
+
+
+class _LegacyWorker(QThread):
+    """ApiWorker as it was: one QThread per call."""
+    finished = pyqtSignal(object)
+
+    def __init__(self, func):
+        super().__init__()
+        self._func = func
+
+    def run(self):
+        self.finished.emit(self._func())
+
+
+def _fake_call(latency_s):
+    def call():
+        time.sleep(latency_s)
+        return threading.get_ident()
+    return call
+
+
+def _run_burst(app, args, start_one, settled):
+    """Start `calls` calls `interval` apart until settled(delivered); return (seconds, delivered)."""
+    delivered = []
+    state = {"started": 0}
+    t0 = time.perf_counter()
+
+    def on_result(value):
+        delivered.append(value)
+
+    def tick():
+        if state["started"] < args.calls:
+            start_one(on_result)
+            state["started"] += 1
+            QTimer.singleShot(args.interval_ms, tick)
+
+    def poll():
+        if state["started"] >= args.calls and settled(delivered):
+            app.quit()
+        else:
+            QTimer.singleShot(1, poll)
+
+    QTimer.singleShot(0, tick)
+    QTimer.singleShot(1, poll)
+    app.exec_()
+    return time.perf_counter() - t0, delivered
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the shared task executor")
+    parser.add_argument("--calls", type=int, default=100)
+    parser.add_argument("--latency-ms", type=int, default=30)
+    parser.add_argument("--interval-ms", type=int, default=5)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv)
+    call = _fake_call(args.latency_ms / 1000)
+
+    # -- One QThread per call ------------------------------------------------
+    threads = []
+
+    def start_legacy(on_result):
+        worker = _LegacyWorker(call)
+        worker.finished.connect(on_result)
+        threads.append(worker)
+        worker.start()
+
+    every_call = lambda delivered: len(delivered) >= args.calls  # noqa: E731
+    legacy_s, legacy_results = _run_burst(app, args, start_legacy, every_call)
+    for worker in threads:
+        worker.wait()
+    legacy_threads = len(threads)
+
+    # -- Shared executor, every call delivered -------------------------------
+    task_executor._executor = executor = TaskExecutor(args.workers)
+
+    def start_pooled(on_result, key=None):
+        executor.submit(call, key=key, on_result=on_result)
+
+    pooled_s, pooled_results = _run_burst(app, args, start_pooled, every_call)
+    pooled_stats = executor.stats()
+    executor.shutdown()
+
+    # -- Shared executor, latest wins ----------------------------------------
+    task_executor._executor = executor = TaskExecutor(args.workers)
+    superseded_s, superseded_results = _run_burst(
+        app, args, lambda on_result: start_pooled(on_result, key="search"),
+        lambda delivered: bool(delivered) and not executor._latest)
+    superseded_stats = executor.stats()
+    executor.shutdown()
+    task_executor._executor = None
+
+    print(f"=== Task executor benchmark: {args.calls} calls of {args.latency_ms} ms, "
+          f"one every {args.interval_ms} ms, {args.workers} workers ===\n")
+    print(f"  {'method':<18}{'wall ms':>10}{'threads':>9}{'delivered':>11}{'cancelled':>11}")
+    print(f"  {'qthread_per_call':<18}{legacy_s * 1e3:>10.1f}{legacy_threads:>9}"
+          f"{len(legacy_results):>11}{0:>11}")
+    print(f"  {'executor':<18}{pooled_s * 1e3:>10.1f}{pooled_stats['workers']:>9}"
+          f"{len(pooled_results):>11}{pooled_stats['cancelled']:>11}")
+    print(f"  {'superseded':<18}{superseded_s * 1e3:>10.1f}{superseded_stats['workers']:>9}"
+          f"{len(superseded_results):>11}{superseded_stats['cancelled']:>11}")
+    for name, s in (("executor", pooled_stats), ("superseded", superseded_stats)):
+        print(f"\n  {name}: queue wait avg {s['queue_wait_ms']['avg']} ms, "
+              f"p95 {s['queue_wait_ms']['p95']} ms; run avg {s['run_ms']['avg']} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark: per-widget setStyleSheet vs. the compiled application stylesheet.
+
+Builds a synthetic page shaped like the real list/form pages (scroll area,
+form inputs, wizard step pills, pagination buttons, primary buttons) twice:
+
+  legacy  — every widget gets its own StyleManager stylesheet text
+  theme   — ThemeEngine.install(app) + apply_variant()/apply_component_style()
+
+and reports page build time, RTL/LTR toggle time, the time to flip every
+input between its error/default variants and how many themed widgets ended
+up carrying a stylesheet of their own (the ancestor-stylesheet fallback).
+
+By default the page is added to the page stack of a real MainWindow (on a
+scratch database), so the window frame, watermark container and stack sit
+above it exactly as in the application; `--standalone` builds it top-level.
+
+Usage:
+    python tools/benchmark_theme.py                 # 200 rows, 5 rounds
+    python tools/benchmark_theme.py --rows 500 --rounds 3
+    python tools/benchmark_theme.py --standalone
+"""
+
+import argparse
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtCore import Qt  # noqa: E402
+from PyQt5.QtWidgets import (  # noqa: E402
+    QApplication, QFrame, QHBoxLayout, QLabel, QLineEdit, QPushButton,
+    QScrollArea, QVBoxLayout, QWidget,
+)
+
+from ui.style_manager import StyleManager, InputVariant  # noqa: E402
+from ui.theme_engine import ThemeEngine, apply_variant, apply_component_style  # noqa: E402
+
+
+def _style(widget, mode, variant, legacy_qss):
+    if mode == "theme":
+        apply_variant(widget, variant)
+    else:
+        widget.setStyleSheet(legacy_qss)
+
+
+def build_page(rows: int, mode: str) -> QWidget:
+    page = QWidget()
+    outer = QVBoxLayout(page)
+    scroll = QScrollArea()
+    scroll.setWidgetResizable(True)
+    _style(scroll, mode, "scroll-transparent",
+           "QScrollArea { background: transparent; border: none; }" + StyleManager.scrollbar())
+    content = QWidget()
+    layout = QVBoxLayout(content)
+
+    header = QHBoxLayout()
+    for i in range(6):
+        pill = QLabel(f"Step {i + 1}")
+        _style(pill, mode, "step-pill-active" if i == 0 else "step-pill",
+               StyleManager.wizard_step_pill(active=(i == 0)))
+        header.addWidget(pill)
+        connector = QFrame()
+        _style(connector, mode, "step-connector", StyleManager.step_connector())
+        header.addWidget(connector)
+    layout.addLayout(header)
+
+    page.inputs = []
+    for r in range(rows):
+        row = QHBoxLayout()
+        for c in range(3):
+            edit = QLineEdit(f"{r}:{c}")
+            _style(edit, mode, "input-default", StyleManager.input_field(InputVariant.DEFAULT))
+            row.addWidget(edit)
+            page.inputs.append(edit)
+        btn = QPushButton("Save")
+        btn.setObjectName("PrimaryButton")
+        if mode == "theme":
+            apply_component_style(btn, StyleManager.button_primary)
+        else:
+            btn.setStyleSheet(StyleManager.button_primary())
+        row.addWidget(btn)
+        layout.addLayout(row)
+
+    pager = QHBoxLayout()
+    for _ in range(2):
+        b = QPushButton("<")
+        _style(b, mode, "pagination", StyleManager.pagination_button())
+        pager.addWidget(b)
+    layout.addLayout(pager)
+
+    scroll.setWidget(content)
+    outer.addWidget(scroll)
+    return page
+
+
+def _ms(fn) -> float:
+    app = QApplication.instance()
+    t0 = time.perf_counter()
+    fn()
+    app.processEvents()
+    return (time.perf_counter() - t0) * 1000.0
+
+
+def _own_sheets(page: QWidget) -> int:
+    """Widgets under `page` that carry a stylesheet of their own."""
+    return sum(1 for w in page.findChildren(QWidget) if w.styleSheet())
+
+
+def run_mode(rows: int, rounds: int, mode: str, db=None) -> dict:
+    app = QApplication.instance()
+    if mode == "theme":
+        ThemeEngine.install(app)
+    else:
+        ThemeEngine.uninstall()
+
+    window = None
+    if db is not None:
+        from app.main_window_v2 import MainWindow
+        window = MainWindow(db, "ar")
+        window.resize(1280, 800)
+        window.show()
+        app.processEvents()
+
+    build, toggle, switch, own = [], [], [], []
+    for _ in range(rounds):
+        holder = {}
+
+        def _build():
+            holder["page"] = build_page(rows, mode)
+            if window is not None:
+                window.stack.addWidget(holder["page"])
+                window.stack.setCurrentWidget(holder["page"])
+            else:
+                holder["page"].resize(1280, 800)
+                holder["page"].show()
+
+        build.append(_ms(_build))
+        page = holder["page"]
+        own.append(_own_sheets(page))
+
+        def _toggle():
+            page.setLayoutDirection(Qt.RightToLeft)
+            app.processEvents()
+            page.setLayoutDirection(Qt.LeftToRight)
+
+        toggle.append(_ms(_toggle))
+
+        def _switch():
+            for edit in page.inputs:
+                _style(edit, mode, "input-error", StyleManager.input_field(InputVariant.ERROR))
+            app.processEvents()
+            for edit in page.inputs:
+                _style(edit, mode, "input-default", StyleManager.input_field(InputVariant.DEFAULT))
+
+        switch.append(_ms(_switch))
+        if window is not None:
+            window.stack.removeWidget(page)
+        page.close()
+        page.deleteLater()
+        app.processEvents()
+
+    if window is not None:
+        window.hide()
+        window.deleteLater()
+        app.processEvents()
+
+    return {
+        "build_ms": statistics.median(build),
+        "toggle_ms": statistics.median(toggle),
+        "variant_switch_ms": statistics.median(switch),
+        "own_sheets": statistics.median(own),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark TRRCMS theming strategies")
+    parser.add_argument("--rows", type=int, default=200, help="Form rows per page (default: 200)")
+    parser.add_argument("--rounds", type=int, default=5, help="Rounds per mode (default: 5)")
+    parser.add_argument("--standalone", action="store_true",
+                        help="Build pages top-level instead of inside MainWindow's stack")
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    widgets = args.rows * 4 + 16
+    host = "standalone" if args.standalone else "MainWindow stack"
+    print(f"=== Theme benchmark: {args.rows} rows (~{widgets} styled widgets), "
+          f"{host}, {app.style().objectName()} style, median of {args.rounds} rounds ===\n")
+
+    workdir = None
+    db = None
+    if not args.standalone:
+        from repositories.database import Database
+        workdir = tempfile.mkdtemp(prefix="theme_bench_")
+        db = Database(Path(workdir) / "bench.db")
+        db.initialize()
+    try:
+        results = {mode: run_mode(args.rows, args.rounds, mode, db)
+                   for mode in ("legacy", "theme")}
+    finally:
+        if db is not None:
+            db.close()
+        if workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    print(f"  {'metric':<20}{'legacy':>12}{'theme':>12}{'speedup':>10}")
+    for key in ("build_ms", "toggle_ms", "variant_switch_ms"):
+        before, after = results["legacy"][key], results["theme"][key]
+        speedup = before / after if after else float("inf")
+        print(f"  {key:<20}{before:>10.1f}ms{after:>10.1f}ms{speedup:>9.1f}x")
+    print(f"  {'own_sheets':<20}{results['legacy']['own_sheets']:>12.0f}"
+          f"{results['theme']['own_sheets']:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
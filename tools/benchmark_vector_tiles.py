@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark: building vector tiles (VectorTileService) vs. a GeoJSON payload.
+
+Generates a synthetic offline snapshot of rectangular building footprints
+scattered over Aleppo, then reports per zoom level the cold (encode) and
+cached (LRU hit) time per tile for a block of tiles around the city centre,
+the average tile size, and the size of the equivalent GeoJSON
+FeatureCollection that would otherwise be pushed through runJavaScript.
+
+Usage:
+    python tools/benchmark_vector_tiles.py                      # 100k buildings
+    python tools/benchmark_vector_tiles.py --buildings 20000 --zooms 12 14 16
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from services.geometry_codec import wkt_to_geojson  # noqa: E402
+from services.vector_tile_service import VectorTileService  # noqa: E402
+
+CENTER_LAT, CENTER_LNG = 36.2021, 37.1343
+SPREAD = 0.08  # degrees around the centre
+
+
+def _building(rnd, i):
+    lat = CENTER_LAT + rnd.uniform(-SPREAD, SPREAD)
+    lng = CENTER_LNG + rnd.uniform(-SPREAD, SPREAD)
+    w, h = rnd.uniform(0.0001, 0.0004), rnd.uniform(0.0001, 0.0004)
+    ring = [(lng, lat), (lng + w, lat), (lng + w, lat + h), (lng, lat + h), (lng, lat)]
+    wkt = "POLYGON((" + ", ".join(f"{x:.7f} {y:.7f}" for x, y in ring) + "))"
+    return {
+        "building_uuid": f"uuid-{i}",
+        "building_id": f"01-01-01-{i // 1000:03d}-{i % 1000:03d}-{i % 99:05d}",
+        "neighborhood_code": f"{i % 50:03d}",
+        "building_type": rnd.randrange(1, 5),
+        "building_status": rnd.randrange(1, 9),
+        "number_of_units": rnd.randrange(1, 30),
+        "latitude": lat + h / 2,
+        "longitude": lng + w / 2,
+        "geo_location": wkt,
+    }
+
+
+def _tile_xy(lat, lng, z):
+    n = 1 << z
+    x = int((lng + 180.0) / 360.0 * n)
+    y = int((1 - math.asinh(math.tan(math.radians(lat))) / math.pi) / 2 * n)
+    return x, y
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark building vector tiles")
+    parser.add_argument("--buildings", type=int, default=100_000)
+    parser.add_argument("--zooms", type=int, nargs="+", default=[11, 13, 15, 17])
+    parser.add_argument("--radius", type=int, default=2,
+                        help="Tiles around the centre tile per axis (default: 2 -> 5x5 block)")
+    args = parser.parse_args()
+
+    rnd = random.Random(7)
+    rows = [_building(rnd, i) for i in range(args.buildings)]
+    service = VectorTileService(snapshot_loader=lambda: rows)
+
+    t0 = time.perf_counter()
+    service.get_tile(0, 0, 0)
+    snapshot_s = time.perf_counter() - t0
+
+    geojson = json.dumps({
+        "type": "FeatureCollection",
+        "features": [
+            {"type": "Feature", "geometry": wkt_to_geojson(r["geo_location"]),
+             "properties": {k: r[k] for k in ("building_id", "building_uuid", "neighborhood_code",
+                                              "building_type", "building_status", "number_of_units")}}
+            for r in rows
+        ],
+    }, ensure_ascii=False)
+
+    print(f"=== Vector tile benchmark: {args.buildings:,} buildings "
+          f"(snapshot + z0 tile in {snapshot_s:.2f}s) ===\n")
+    print(f"  {'zoom':>4}  {'tiles':>5}  {'cold ms/tile':>12}  {'cached µs/tile':>14}  "
+          f"{'avg KB/tile':>11}  {'total KB':>9}")
+
+    for z in args.zooms:
+        cx, cy = _tile_xy(CENTER_LAT, CENTER_LNG, z)
+        tiles = [(z, x, y)
+                 for x in range(cx - args.radius, cx + args.radius + 1)
+                 for y in range(cy - args.radius, cy + args.radius + 1)]
+
+        t0 = time.perf_counter()
+        sizes = [len(service.get_tile(*t)[0]) for t in tiles]
+        cold = (time.perf_counter() - t0) / len(tiles)
+
+        t0 = time.perf_counter()
+        for t in tiles:
+            service.get_tile(*t)
+        cached = (time.perf_counter() - t0) / len(tiles)
+
+        total = sum(sizes)
+        print(f"  {z:>4}  {len(tiles):>5}  {cold * 1e3:>12.2f}  {cached * 1e6:>14.1f}  "
+              f"{total / len(tiles) / 1024:>11.1f}  {total / 1024:>9.0f}")
+
+    print(f"\n  GeoJSON FeatureCollection for all buildings: {len(geojson.encode('utf-8')) / 1024:,.0f} KB")
+    print(f"  cache: {service.stats()}")
+
+
+if __name__ == "__main__":
+    main()
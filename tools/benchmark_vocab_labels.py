@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark: vocabulary label lookups for table rendering.
+
+Loads the vocabularies (reference-data cache or data/vocab_cache.json) and
+resolves a column of codes the way a table repaint does:
+  legacy_scan     previous get_label: int lookup, then a linear scan of
+                  the vocabulary with str(c).lower() per entry
+  get_label       precompiled per-language tables, one call per cell
+  get_labels      one bulk call for the whole column
+
+Codes are a mix of int codes, numeric strings, string codes in another
+case and unknown values, so the legacy scan path is exercised. Results of
+all methods are cross-checked.
+
+Usage:
+    python tools/benchmark_vocab_labels.py
+    python tools/benchmark_vocab_labels.py --rows 100000 --vocab BuildingStatus
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from services import vocab_service  # noqa: E402
+
+
+def legacy_get_label(vocab_name, code, lang="ar"):
+    """get_label as it was before the precompiled tables."""
+    vocab = vocab_service._lookup.get(vocab_service._normalize_name(vocab_name), {})
+    try:
+        entry = vocab.get(int(code))
+        if entry:
+            return entry.get(lang, entry.get("ar", str(code)))
+    except (ValueError, TypeError):
+        pass
+    if code is not None:
+        code_str = str(code).lower()
+        for c, entry in vocab.items():
+            if str(c).lower() == code_str:
+                return entry.get(lang, entry.get("ar", str(code)))
+    return str(code) if code is not None else ""
+
+
+def _column(vocab_name, rows, rnd):
+    codes = list(vocab_service._lookup.get(vocab_service._normalize_name(vocab_name), {}))
+    pool = codes + [str(c) for c in codes] + [str(c).upper() for c in codes] + ["unknown", None, 9999]
+    return [rnd.choice(pool) for _ in range(rows)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark vocabulary label lookups")
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--vocab", default="BuildingType")
+    parser.add_argument("--lang", default="ar", choices=("ar", "en"))
+    args = parser.parse_args()
+
+    vocab_service.initialize_vocabularies()
+    column = _column(args.vocab, args.rows, random.Random(7))
+    if not column or all(c in ("unknown", None, 9999) for c in column):
+        print(f"Vocabulary '{args.vocab}' not loaded")
+        return
+
+    t0 = time.perf_counter()
+    legacy = [legacy_get_label(args.vocab, c, args.lang) for c in column]
+    legacy_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    single = [vocab_service.get_label(args.vocab, c, args.lang) for c in column]
+    single_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    bulk = vocab_service.get_labels(args.vocab, column, args.lang)
+    bulk_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    vocab_service.initialize_vocabularies()
+    rebuild_s = time.perf_counter() - t0
+
+    print(f"=== Vocabulary label benchmark: '{args.vocab}', {args.rows:,} cells ({args.lang}) ===\n")
+    print(f"  {'method':<14}{'ms':>10}{'ns/cell':>10}{'speedup':>10}")
+    for name, seconds in (("legacy_scan", legacy_s), ("get_label", single_s), ("get_labels", bulk_s)):
+        print(f"  {name:<14}{seconds * 1e3:>10.2f}{seconds / args.rows * 1e9:>10.0f}{legacy_s / seconds:>9.1f}x")
+    print(f"\n  full reload + table rebuild: {rebuild_s * 1e3:.1f} ms")
+    mismatches = sum(a != b for a, b in zip(legacy, single)) + sum(a != b for a, b in zip(single, bulk))
+    print(f"  mismatches between methods: {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
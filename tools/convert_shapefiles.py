@@ -1,13 +1,18 @@
 # -*- coding: utf-8 -*-
 """
-One-time conversion script: Syria Shapefiles (ZIP) → GeoJSON files.
+One-time conversion script: Syria Shapefiles (ZIP) → GeoJSON files,
+plus a memory-mappable binary layer (.bnd) for each boundary level.
 Run once from Habitat-Desktop root:
     python tools/convert_shapefiles.py
 
+Rebuild only the binary layers from the existing GeoJSON (no ZIPs needed):
+    python tools/convert_shapefiles.py --binary-only
+
 Input:  ../Map/OneDrive_*.zip
-Output: assets/geojson/*.geojson
+Output: assets/geojson/*.geojson, assets/geojson/*.bnd
 """
 
+import argparse
 import json
 import os
 import sys
@@ -15,11 +20,14 @@ import tempfile
 import zipfile
 from pathlib import Path
 
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from services.boundary_layers import SUFFIX as BINARY_SUFFIX, write_layer  # noqa: E402
+
 try:
     import shapefile
 except ImportError:
-    print("ERROR: pyshp not installed. Run: pip install pyshp")
-    sys.exit(1)
+    shapefile = None
 
 
 # Maps output name → (zip filename prefix, shapefile name inside zip)
@@ -225,22 +233,49 @@ def extract_places_json(zip_dir: Path, out_dir: Path):
         print(f'  Sample: {places[0]}')
 
 
+def write_binary_layers(out_dir: Path):
+    """Write a .bnd binary layer (LODs + feature index) next to each boundary GeoJSON."""
+    for name in SHAPEFILES:
+        geojson_path = out_dir / f"{name}.geojson"
+        if not geojson_path.exists():
+            continue
+        out_path = geojson_path.with_suffix(BINARY_SUFFIX)
+        print(f"\n[{name}.bnd]")
+        with open(geojson_path, encoding='utf-8') as f:
+            collection = json.load(f)
+        count = write_layer(collection, out_path, name, geojson_path.stat().st_size)
+        size_kb = out_path.stat().st_size // 1024
+        print(f"  OK: {count} features, {size_kb} KB -> {out_path.name}")
+
+
 def main():
+    parser = argparse.ArgumentParser(description="Convert Syria shapefiles to GeoJSON and binary layers")
+    parser.add_argument("--binary-only", action="store_true",
+                        help="Only rebuild the .bnd layers from the existing GeoJSON")
+    args = parser.parse_args()
+
     script_dir = Path(__file__).parent
     project_root = script_dir.parent
 
     zip_dir = project_root.parent / 'Map'
     out_dir = project_root / 'assets' / 'geojson'
 
-    print(f"ZIP source: {zip_dir}")
-    print(f"GeoJSON output: {out_dir}")
+    if not args.binary_only:
+        print(f"ZIP source: {zip_dir}")
+        print(f"GeoJSON output: {out_dir}")
+
+        if shapefile is None:
+            print("ERROR: pyshp not installed. Run: pip install pyshp")
+            sys.exit(1)
+
+        if not zip_dir.exists():
+            print(f"\nERROR: Map directory not found: {zip_dir}")
+            sys.exit(1)
 
-    if not zip_dir.exists():
-        print(f"\nERROR: Map directory not found: {zip_dir}")
-        sys.exit(1)
+        convert_all(zip_dir, out_dir)
+        extract_places_json(zip_dir, out_dir)
 
-    convert_all(zip_dir, out_dir)
-    extract_places_json(zip_dir, out_dir)
+    write_binary_layers(out_dir)
     print("\nConversion complete.")
 
 
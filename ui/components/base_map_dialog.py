@@ -1109,6 +1109,17 @@ class BaseMapDialog(QDialog):
         if self._viewport_loader:
             self._viewport_loader.clear_cache()
 
+        from app.config import Config
+        if Config.MAP_VECTOR_TILES:
+            # Buildings come from vector tiles: re-read them and repaint the tiles.
+            from services.vector_tile_service import invalidate_building_tiles
+            invalidate_building_tiles()
+            if self.web_view:
+                self.web_view.page().runJavaScript(
+                    "if (typeof window.clearMapBuildings === 'function') window.clearMapBuildings();"
+                )
+            return
+
         # 2. Clear JS additive state so all buildings reload fresh
         if self.web_view:
             loading_text = tr("dialog.map.loading_buildings") or "جاري تحميل المباني..."
@@ -349,6 +349,9 @@ class BuildingMapDialog(BaseMapDialog):
         self._selected_building_id = selected_building_id
         self._is_view_only = read_only or bool(selected_building_id)  # Support explicit read_only
         self._buildings_cache = []  # Cache loaded buildings for quick lookup
+        # Vector tiles draw every building; only view-only still fetches its one building
+        from app.config import Config
+        self._buildings_from_tiles = Config.MAP_VECTOR_TILES and not self._is_view_only
 
         # Subclass hooks (preserve if subclass set them before super().__init__)
         # Use __dict__.get to avoid PyQt's __getattr__ before Qt C++ is initialized
@@ -571,7 +574,7 @@ class BuildingMapDialog(BaseMapDialog):
         """
 
         # Buildings worker started early in _prefetch_buildings_early; start here only if missed
-        if self._buildings_worker is None:
+        if self._buildings_worker is None and not self._buildings_from_tiles:
             if self._perf_trace:
                 self._perf_trace.mark('buildings_worker_start_late')
             self._buildings_worker = _BuildingsWorker(
@@ -594,11 +597,12 @@ class BuildingMapDialog(BaseMapDialog):
         """Start fetching buildings immediately on dialog open, before HTML is ready."""
         if self._perf_trace:
             self._perf_trace.mark('prefetch_start')
-        if self._is_view_only or self._buildings_worker is not None:
+        if self._is_view_only or self._buildings_from_tiles or self._buildings_worker is not None:
             if self._perf_trace:
                 self._perf_trace.mark(
                     'prefetch_skipped',
-                    reason='view_only' if self._is_view_only else 'already_running',
+                    reason=('view_only' if self._is_view_only
+                            else 'vector_tiles' if self._buildings_from_tiles else 'already_running'),
                 )
             return
         self._buildings_worker = _BuildingsWorker(
@@ -778,7 +782,8 @@ class BuildingMapDialog(BaseMapDialog):
         if success:
             self._page_loaded = True
             # Show loading overlay now (page DOM is ready)
-            if not self._is_view_only and self.web_view and hasattr(self, '_js_loading_overlay'):
+            if (not self._is_view_only and not self._buildings_from_tiles
+                    and self.web_view and hasattr(self, '_js_loading_overlay')):
                 self.web_view.page().runJavaScript(self._js_loading_overlay)
             if self._pending_buildings_data:
                 self._inject_buildings(self._pending_buildings_data)
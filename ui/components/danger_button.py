@@ -9,6 +9,7 @@ from PyQt5.QtWidgets import QPushButton
 from PyQt5.QtCore import Qt, QTimer
 
 from ..style_manager import StyleManager
+from ..theme_engine import apply_component_style
 from ..font_utils import create_font, FontManager
 
 
@@ -33,7 +34,7 @@ class DangerButton(QPushButton):
             letter_spacing=0
         )
         self.setFont(btn_font)
-        self.setStyleSheet(StyleManager.button_danger())
+        apply_component_style(self, StyleManager.button_danger)
 
     def set_loading(self, loading: bool, text: str = ""):
         self._is_loading = loading
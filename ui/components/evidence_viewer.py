@@ -1,10 +1,13 @@
 # -*- coding: utf-8 -*-
-"""Shared helper to download and open an evidence document.
+"""Shared helpers to preview, download and open an evidence document.
 
 Centralises the download-then-open behavior used by claim details, the
 evidence picker dialog and the person dialog so they share the same UX:
 "downloading" toast → background download → open with system app, or an
 error toast if the download/open fails.
+
+load_evidence_preview() fills a card's thumbnail label from the preview
+cache (services/preview_cache.py) instead of decoding the full scan.
 """
 
 import os
@@ -12,10 +15,12 @@ import threading
 from typing import Optional
 
 from PyQt5.QtCore import QObject, Qt, pyqtSignal, QUrl
-from PyQt5.QtGui import QDesktopServices
-from PyQt5.QtWidgets import QWidget
+from PyQt5.QtGui import QDesktopServices, QPixmap
+from PyQt5.QtWidgets import QLabel, QWidget
 
 from ui.components.toast import Toast
+from services.preview_cache import PREVIEW_SMALL, can_preview, get_preview_cache
+from services.task_executor import Priority, get_task_executor
 from services.translation_manager import tr
 from utils.helpers import download_evidence_file
 from utils.logger import get_logger
@@ -89,3 +94,68 @@ def download_and_open_evidence(
         )
         return
     _EvidenceOpener(parent).start(evidence_id, file_name)
+
+
+def _show_preview(label: QLabel, path, style: Optional[str]) -> None:
+    pixmap = QPixmap(str(path))
+    if pixmap.isNull():
+        return
+    try:
+        side = max(min(label.width(), label.height()) - 4, 16)
+        label.setText("")
+        if style is not None:
+            label.setStyleSheet(style)
+        label.setPixmap(pixmap.scaled(side, side, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+    except RuntimeError:
+        pass  # card closed before the preview arrived
+
+
+def load_evidence_preview(
+    label: QLabel,
+    file_path: str = "",
+    evidence_id: str = "",
+    file_name: str = "",
+    size: int = PREVIEW_SMALL,
+    style: Optional[str] = None,
+) -> bool:
+    """Show a cached preview of an evidence file in `label`, progressively.
+
+    The label keeps its placeholder (file-type icon) until a preview is
+    available. A preview cached for `evidence_id` is shown at once (a
+    smaller size first if the requested one is missing); otherwise the
+    local file, or the evidence downloaded in the background, is rendered
+    by the preview cache's process pool. `style` replaces the label's
+    stylesheet once a preview is shown. Returns False when the file type
+    has no preview. Safe to call from the UI thread.
+    """
+    if not can_preview(file_name or file_path):
+        return False
+    if not file_path and not evidence_id:
+        return False
+
+    cache = get_preview_cache()
+    cached = cache.best_available(evidence_id, size) if evidence_id else None
+    if cached:
+        _show_preview(label, cached[0], style)
+        if cached[1] == size:
+            return True
+
+    def _render():
+        local = file_path if file_path and os.path.exists(file_path) else None
+        if not local and evidence_id:
+            # Queued behind files the user opened (INTERACTIVE)
+            local = download_evidence_file(evidence_id, file_name or evidence_id, Priority.NORMAL)
+        if not local:
+            return None
+        return cache.get_or_render(local, size, alias=evidence_id or None)
+
+    def _on_result(path):
+        if path:
+            _show_preview(label, path, style)
+
+    get_task_executor().submit(
+        _render, priority=Priority.BACKGROUND, key=f"preview:{id(label)}",
+        on_result=_on_result,
+        on_error=lambda exc: logger.debug(f"Preview failed for {evidence_id or file_path}: {exc}"),
+    )
+    return True
@@ -7,7 +7,7 @@ Reusable input field component.
 from PyQt5.QtWidgets import QLineEdit
 from PyQt5.QtCore import Qt
 
-from ..style_manager import StyleManager, InputVariant
+from ..theme_engine import apply_variant
 from ..font_utils import create_font, FontManager
 
 
@@ -37,13 +37,11 @@ class InputField(QLineEdit):
         self._apply_variant()
 
     def _apply_variant(self):
-        """Apply variant-specific styling."""
-        if self.variant == "error":
-            self.setStyleSheet(StyleManager.input_field(InputVariant.ERROR))
-        elif self.variant == "success":
-            self.setStyleSheet(StyleManager.input_field(InputVariant.SUCCESS))
+        """Apply variant-specific styling (theme property, no stylesheet parse)."""
+        if self.variant in ("error", "success"):
+            apply_variant(self, f"input-{self.variant}")
         else:
-            self.setStyleSheet(StyleManager.input_field(InputVariant.DEFAULT))
+            apply_variant(self, "input-default")
 
     def set_variant(self, variant: str):
         """Change input variant dynamically."""
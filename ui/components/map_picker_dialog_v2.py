@@ -61,6 +61,7 @@ class MapPickerDialog(BaseMapDialog):
 
     def _load_map(self):
         """Load map with drawing tools AND existing buildings."""
+        from app.config import Config
         from services.tile_server_manager import get_local_server_url, get_tile_server_url
 
         try:
@@ -71,7 +72,9 @@ class MapPickerDialog(BaseMapDialog):
 
             # Load buildings using shared method
             buildings_geojson = '{"type":"FeatureCollection","features":[]}'  # Default empty
-            if self.db:
+            if Config.MAP_VECTOR_TILES:
+                logger.info("Map picker buildings come from vector tiles")
+            elif self.db:
                 logger.info("Loading buildings for map picker...")
 
                 # Get auth token from parent window if available
@@ -268,7 +271,6 @@ class MapPickerDialog(BaseMapDialog):
 
         try:
             import json
-            import re
 
             geometry = None
 
@@ -284,22 +286,13 @@ class MapPickerDialog(BaseMapDialog):
                     logger.info("Existing polygon is already GeoJSON FeatureCollection")
                     return geo_location
 
-            # Strategy 2: WKT format - use regex (same as GeoJSONConverter)
+            # Strategy 2: WKT format - shared geometry codec (same as GeoJSONConverter)
             if not geometry and 'POLYGON' in geo_location.upper():
-                match = re.search(r'POLYGON\s*\(\s*\((.*?)\)\s*\)', geo_location, re.IGNORECASE)
-                if match:
-                    coords_str = match.group(1)
-                    coordinates = []
-                    for pair in coords_str.split(','):
-                        parts = pair.strip().split()
-                        if len(parts) >= 2:
-                            coordinates.append([float(parts[0]), float(parts[1])])
-
-                    if len(coordinates) >= 3:
-                        geometry = {
-                            "type": "Polygon",
-                            "coordinates": [coordinates]
-                        }
+                from services.geometry_codec import try_parse
+                parsed = try_parse(geo_location, "existing polygon")
+                if parsed is not None and parsed.geom_type in ("Polygon", "MultiPolygon") \
+                        and not parsed.is_empty:
+                    geometry = parsed.to_geojson()
 
             if not geometry:
                 logger.warning(f"Could not parse geo_location: {geo_location[:80]}...")
@@ -7,6 +7,7 @@ from PyQt5.QtCore import Qt, QSize, QTimer, QPropertyAnimation, QEasingCurve
 from ..design_system import ButtonDimensions
 from ..font_utils import create_font, FontManager
 from ..style_manager import StyleManager
+from ..theme_engine import apply_component_style
 from .icon import Icon
 
 
@@ -36,7 +37,7 @@ class PrimaryButton(QPushButton):
             letter_spacing=0,
         )
         self.setFont(btn_font)
-        self.setStyleSheet(StyleManager.button_primary())
+        apply_component_style(self, StyleManager.button_primary)
 
     def _load_icon(self):
         q_icon = Icon.load_qicon(self.icon_name)
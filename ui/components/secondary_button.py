@@ -5,6 +5,7 @@ from PyQt5.QtWidgets import QPushButton
 from PyQt5.QtCore import Qt, QTimer
 
 from ..style_manager import StyleManager
+from ..theme_engine import apply_component_style
 from ..font_utils import create_font, FontManager
 
 
@@ -29,7 +30,7 @@ class SecondaryButton(QPushButton):
             letter_spacing=0
         )
         self.setFont(btn_font)
-        self.setStyleSheet(StyleManager.button_secondary())
+        apply_component_style(self, StyleManager.button_secondary)
 
     def set_loading(self, loading: bool, text: str = ""):
         self._is_loading = loading
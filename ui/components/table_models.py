@@ -11,6 +11,7 @@ from models.building import Building
 from models.unit import PropertyUnit
 from models.person import Person
 from models.claim import Claim
+from services.display_mappings import get_building_type_displays, get_building_status_displays
 from ui.components.base_table_model import BaseTableModel
 
 
@@ -29,6 +30,12 @@ class BuildingsTableModel(QAbstractTableModel):
             ("number_of_units", "Units", "الوحدات"),
             ("number_of_floors", "Floors", "الطوابق"),
         ]
+        self._compute_labels()
+
+    def _compute_labels(self):
+        """Resolve the type/status columns in bulk instead of once per painted cell."""
+        self._type_labels = get_building_type_displays(b.building_type for b in self._buildings)
+        self._status_labels = get_building_status_displays(b.building_status for b in self._buildings)
 
     def rowCount(self, parent=QModelIndex()) -> int:
         return len(self._buildings)
@@ -49,9 +56,9 @@ class BuildingsTableModel(QAbstractTableModel):
             elif column_key == "neighborhood_name":
                 return building.neighborhood_name_ar if self._is_arabic else building.neighborhood_name
             elif column_key == "building_type":
-                return building.building_type_display
+                return self._type_labels[index.row()]
             elif column_key == "building_status":
-                return building.building_status_display
+                return self._status_labels[index.row()]
             elif column_key == "number_of_units":
                 return building.number_of_units
             elif column_key == "number_of_floors":
@@ -85,11 +92,13 @@ class BuildingsTableModel(QAbstractTableModel):
         """Update the buildings list."""
         self.beginResetModel()
         self._buildings = buildings
+        self._compute_labels()
         self.endResetModel()
 
     def set_language(self, is_arabic: bool):
         """Update language setting."""
         self._is_arabic = is_arabic
+        self._compute_labels()
         self.headerDataChanged.emit(Qt.Horizontal, 0, len(self._columns) - 1)
         # Refresh data
         self.dataChanged.emit(
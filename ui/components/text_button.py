@@ -5,6 +5,7 @@ from PyQt5.QtWidgets import QPushButton
 from PyQt5.QtCore import Qt
 
 from ..style_manager import StyleManager
+from ..theme_engine import apply_component_style
 from ..font_utils import create_font, FontManager
 
 
@@ -33,4 +34,4 @@ class TextButton(QPushButton):
         self.setFont(btn_font)
 
         # Apply colors and styling via StyleManager (Single Source of Truth)
-        self.setStyleSheet(StyleManager.button_text())
+        apply_component_style(self, StyleManager.button_text)
@@ -21,7 +21,7 @@ class _ConfigCompat:
     INFO_COLOR = Colors.INFO
 
 Config = _ConfigCompat
-from ui.style_manager import StyleManager
+from ui.theme_engine import apply_variant
 from services.translation_manager import tr
 
 
@@ -83,10 +83,7 @@ class ValidationErrorDialog(QDialog):
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
         scroll.setFrameShape(QFrame.NoFrame)
-        scroll.setStyleSheet(
-            "QScrollArea { background: transparent; border: none; }"
-            + StyleManager.scrollbar()
-        )
+        apply_variant(scroll, "scroll-transparent")
 
         details_widget = QWidget()
         details_layout = QVBoxLayout(details_widget)
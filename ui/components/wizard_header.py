@@ -22,7 +22,7 @@ from PyQt5.QtGui import (
 
 from ui.font_utils import create_font, FontManager
 from ui.design_system import Colors, PageDimensions, ScreenScale
-from ui.style_manager import StyleManager
+from ui.theme_engine import apply_variant
 
 
 class WizardHeader(QWidget):
@@ -163,15 +163,15 @@ class WizardHeader(QWidget):
         """Apply styles to step pills based on current step."""
         for i, pill in enumerate(self._step_pills):
             if i < self._current_step:
-                pill.setStyleSheet(StyleManager.wizard_step_pill(completed=True))
+                apply_variant(pill, "step-pill-completed")
             elif i == self._current_step:
-                pill.setStyleSheet(StyleManager.wizard_step_pill(active=True))
+                apply_variant(pill, "step-pill-active")
             else:
-                pill.setStyleSheet(StyleManager.wizard_step_pill())
+                apply_variant(pill, "step-pill")
 
         for i, connector in enumerate(self._step_connectors):
             active = i < self._current_step
-            connector.setStyleSheet(StyleManager.step_connector(active=active))
+            apply_variant(connector, "step-connector-active" if active else "step-connector")
 
     # --- Public API ---
 
@@ -1,14 +1,24 @@
 # -*- coding: utf-8 -*-
 """
 TRRCMS UI Pages
+
+Page classes are resolved lazily so that importing one page module (e.g.
+the login page at startup) does not pull in every other page.
 """
 
-from .login_page import LoginPage
-from .buildings_page import BuildingsPage
-from .building_details_page import BuildingDetailsPage
+import importlib
+
+_LAZY_EXPORTS = {
+    "LoginPage": ".login_page",
+    "BuildingsPage": ".buildings_page",
+    "BuildingDetailsPage": ".building_details_page",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
 
-__all__ = [
-    "LoginPage",
-    "BuildingsPage",
-    "BuildingDetailsPage",
-]
+def __getattr__(name):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module, __name__), name)
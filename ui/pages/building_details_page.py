@@ -26,6 +26,7 @@ from ui.components.accent_line import AccentLine
 from ui.design_system import Colors, PageDimensions, ButtonDimensions, ScreenScale
 from ui.font_utils import create_font, FontManager
 from ui.style_manager import StyleManager
+from ui.theme_engine import apply_variant
 from utils.helpers import format_date, build_hierarchical_address
 from utils.i18n import I18n
 from services.api_worker import ApiWorker
@@ -129,10 +130,7 @@ class BuildingDetailsPage(QWidget):
         scroll.setWidgetResizable(True)
         scroll.setFrameShape(QFrame.NoFrame)
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        scroll.setStyleSheet(
-            "QScrollArea { background: transparent; border: none; }"
-            + StyleManager.scrollbar()
-        )
+        apply_variant(scroll, "scroll-transparent")
 
         scroll_content = QWidget()
         scroll_content.setLayoutDirection(get_layout_direction())
@@ -15,7 +15,7 @@ from PyQt5.QtWidgets import (
     QStylePainter, QStyleOptionComboBox, QSizePolicy
     )
 from PyQt5.QtCore import Qt, pyqtSignal, QPoint, QRect, QSize, QLocale, QTimer
-from PyQt5.QtGui import QColor, QCursor, QPainter, QFont, QIcon, QPixmap
+from PyQt5.QtGui import QColor, QCursor, QPainter, QFont, QIcon
 
 # Try to import WebEngine for map
 try:
@@ -33,6 +33,7 @@ from services.display_mappings import (
     )
 from services.divisions_service import DivisionsService
 from services.api_client import get_api_client
+from services.reference_data_cache import get_reference_data_cache
 from models.building import Building
 from repositories.database import Database
 from controllers.building_controller import BuildingController
@@ -40,6 +41,7 @@ from services.export_service import ExportService
 from services.validation_service import ValidationService
 from ui.components.rtl_combo import RtlCombo
 from ui.components.toast import Toast
+from ui.components.evidence_viewer import load_evidence_preview
 from ui.error_handler import ErrorHandler
 from ui.components.custom_button import CustomButton
 from ui.components.primary_button import PrimaryButton
@@ -49,8 +51,10 @@ from ui.components.accent_line import AccentLine
 from ui.components.empty_state import EmptyState
 from ui.design_system import PageDimensions, Colors, ButtonDimensions, ScreenScale
 from ui.style_manager import StyleManager
+from ui.theme_engine import apply_variant
 from ui.font_utils import create_font, FontManager
 from services.api_worker import ApiWorker
+from services.task_executor import Priority
 from utils.i18n import I18n
 from utils.logger import get_logger
 from services.translation_manager import tr, get_layout_direction
@@ -177,10 +181,7 @@ class AddBuildingPage(QWidget):
         scroll.setFrameShape(QFrame.NoFrame)
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         scroll.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        scroll.setStyleSheet(
-            "QScrollArea { border: none; background: transparent; }"
-            + StyleManager.scrollbar()
-        )
+        apply_variant(scroll, "scroll-transparent")
 
         # Container widget for scroll area
         container = QWidget()
@@ -812,7 +813,7 @@ class AddBuildingPage(QWidget):
         self._docs_worker.finished.connect(self._on_building_documents_loaded)
         self._docs_worker.error.connect(self._on_building_documents_error)
         self._spinner.show_loading(tr("component.loading.default"))
-        self._docs_worker.start()
+        self._docs_worker.start(supersede=True)
 
     def _fetch_building_documents_bg(self, building_uuid):
         """Background: fetch building documents from API."""
@@ -880,12 +881,9 @@ class AddBuildingPage(QWidget):
         thumb.setStyleSheet("border: none; background: transparent;")
 
         if mime_type.startswith("image/") and file_path:
-            px = QPixmap(file_path)
-            if not px.isNull():
-                thumb.setPixmap(px.scaled(60, 60, Qt.KeepAspectRatio, Qt.SmoothTransformation))
-            else:
-                thumb.setText("🖼")
-                thumb.setFont(create_font(size=20, weight=FontManager.WEIGHT_REGULAR))
+            thumb.setText("🖼")
+            thumb.setFont(create_font(size=20, weight=FontManager.WEIGHT_REGULAR))
+            load_evidence_preview(thumb, file_path=file_path)
         else:
             thumb.setText("📄")
             thumb.setFont(create_font(size=20, weight=FontManager.WEIGHT_REGULAR))
@@ -1304,7 +1302,7 @@ class AddBuildingPage(QWidget):
         self._neighborhoods_geojson_worker.finished.connect(self._on_neighborhoods_geojson_loaded)
         self._neighborhoods_geojson_worker.error.connect(self._on_neighborhoods_geojson_error)
         self._spinner.show_loading(tr("component.loading.default"))
-        self._neighborhoods_geojson_worker.start()
+        self._neighborhoods_geojson_worker.start(priority=Priority.BACKGROUND)
 
     def _on_neighborhoods_geojson_loaded(self, neighborhoods_geojson):
         """Callback: open map picker dialog with fetched neighborhoods GeoJSON."""
@@ -1820,13 +1818,19 @@ class AddBuildingPage(QWidget):
         self.neighborhood_combo.blockSignals(False)
 
         if gov_code and dist_code and subdist_code and comm_code:
+            cached = get_reference_data_cache().get(
+                "neighborhoods", gov_code, dist_code, subdist_code, comm_code, fetch=False
+            )
+            if cached is not None:
+                self._populate_neighborhood_combo(cached)
+                return
             self._spinner.show_loading(tr("component.loading.default"))
             self._neighborhoods_api_worker = ApiWorker(
                 self._fetch_neighborhoods_bg, gov_code, dist_code, subdist_code, comm_code
             )
             self._neighborhoods_api_worker.finished.connect(self._on_neighborhoods_api_loaded)
             self._neighborhoods_api_worker.error.connect(self._on_neighborhoods_api_error)
-            self._neighborhoods_api_worker.start()
+            self._neighborhoods_api_worker.start(supersede=True)
 
     def _fetch_neighborhoods_bg(self, gov_code, dist_code, subdist_code, comm_code):
         """Background: fetch neighborhoods from API."""
@@ -1843,6 +1847,10 @@ class AddBuildingPage(QWidget):
     def _on_neighborhoods_api_loaded(self, neighborhoods):
         """Callback: populate neighborhood combo with API results."""
         self._spinner.hide_loading()
+        self._populate_neighborhood_combo(neighborhoods)
+
+    def _populate_neighborhood_combo(self, neighborhoods):
+        """Append neighborhoods to the combo and select the first one."""
         if not neighborhoods:
             neighborhoods = []
         self._neighborhoods_cache = neighborhoods
@@ -1925,18 +1933,13 @@ class AddBuildingPage(QWidget):
 
     def _parse_wkt_bounds(self, wkt: str):
         """Extract [[min_lat, min_lng], [max_lat, max_lng]] from any WKT geometry."""
-        import re
-        if not wkt:
+        from services.geometry_codec import try_parse
+        geometry = try_parse(wkt, "neighborhood boundary")
+        bounds = geometry.bounds() if geometry is not None else None
+        if not bounds:
             return None
-        try:
-            coords = re.findall(r'([-\d.]+)\s+([-\d.]+)', wkt)
-            if coords:
-                lngs = [float(c[0]) for c in coords]
-                lats = [float(c[1]) for c in coords]
-                return [[min(lats), min(lngs)], [max(lats), max(lngs)]]
-        except Exception:
-            pass
-        return None
+        min_lng, min_lat, max_lng, max_lat = bounds
+        return [[min_lat, min_lng], [max_lat, max_lng]]
 
     def _get_neighborhood_center(self, neighborhood_code: str) -> Optional[Tuple[float, float]]:
         """Get center coordinates of neighborhood from _neighborhoods_cache."""
@@ -1977,6 +1980,11 @@ class AddBuildingPage(QWidget):
             )
 
             if neighborhoods:
+                try:
+                    from services.reverse_geocoder import get_reverse_geocoder
+                    get_reverse_geocoder().set_neighborhoods(neighborhoods)
+                except Exception as e:
+                    logger.debug(f"Neighborhood index refresh skipped: {e}")
                 geojson = self._neighborhoods_api_to_geojson(neighborhoods)
                 if geojson:
                     logger.info(f"Loaded {len(neighborhoods)} neighborhoods from API")
@@ -2029,18 +2037,13 @@ class AddBuildingPage(QWidget):
 
     def _parse_wkt_centroid(self, wkt: str):
         """Extract centroid from any WKT geometry string."""
-        import re
-        if not wkt:
+        from services.geometry_codec import try_parse
+        geometry = try_parse(wkt, "neighborhood boundary")
+        center = geometry.vertex_mean() if geometry is not None else None
+        if not center:
             return None
-        try:
-            coords = re.findall(r'([-\d.]+)\s+([-\d.]+)', wkt)
-            if coords:
-                lngs = [float(c[0]) for c in coords]
-                lats = [float(c[1]) for c in coords]
-                return sum(lats) / len(lats), sum(lngs) / len(lngs)
-        except Exception:
-            pass
-        return None
+        lng, lat = center
+        return lat, lng
 
 class FilterableHeaderView(QHeaderView):
     """
@@ -2381,7 +2384,7 @@ class BuildingsListPage(QWidget):
 
         self._prev_btn = QPushButton("\u276E")
         self._prev_btn.setFixedSize(ScreenScale.w(32), ScreenScale.h(28))
-        self._prev_btn.setStyleSheet(StyleManager.pagination_button())
+        apply_variant(self._prev_btn, "pagination")
         self._prev_btn.clicked.connect(lambda: self._go_to_page(self._current_page - 1))
         self._pagination_bar.addWidget(self._prev_btn)
 
@@ -2392,7 +2395,7 @@ class BuildingsListPage(QWidget):
 
         self._next_btn = QPushButton("\u276F")
         self._next_btn.setFixedSize(ScreenScale.w(32), ScreenScale.h(28))
-        self._next_btn.setStyleSheet(StyleManager.pagination_button())
+        apply_variant(self._next_btn, "pagination")
         self._next_btn.clicked.connect(lambda: self._go_to_page(self._current_page + 1))
         self._pagination_bar.addWidget(self._next_btn)
 
@@ -2426,7 +2429,7 @@ class BuildingsListPage(QWidget):
         self._load_worker = ApiWorker(self._fetch_buildings_bg)
         self._load_worker.finished.connect(self._on_buildings_loaded)
         self._load_worker.error.connect(self._on_buildings_load_error)
-        self._load_worker.start()
+        self._load_worker.start(supersede="buildings")
 
     def _fetch_buildings_bg(self):
         """Background thread: load from controller."""
@@ -2548,7 +2551,7 @@ class BuildingsListPage(QWidget):
                 self._neighborhoods_filter_worker.error.connect(
                     self._on_neighborhoods_for_filter_error
                 )
-                self._neighborhoods_filter_worker.start()
+                self._neighborhoods_filter_worker.start(supersede=True)
                 return
             neighborhoods = self._neighborhoods_api_cache
             for n in neighborhoods:
@@ -2763,7 +2766,7 @@ class BuildingsListPage(QWidget):
         self._search_worker = ApiWorker(_do_search)
         self._search_worker.finished.connect(self._on_search_results)
         self._search_worker.error.connect(self._on_search_error)
-        self._search_worker.start()
+        self._search_worker.start(supersede="buildings")
 
     def _on_search_results(self, result):
         """Display search results in card grid."""
@@ -27,6 +27,7 @@ from PyQt5.QtGui import (
 from ui.design_system import Colors, PageDimensions, ScreenScale
 from ui.font_utils import create_font, FontManager
 from ui.style_manager import StyleManager
+from ui.theme_engine import apply_variant
 from ui.components.icon import Icon
 from ui.components.logo import LogoWidget
 from ui.components.toast import Toast
@@ -943,10 +944,7 @@ class CaseEntityDetailsPage(QWidget):
         self._scroll.setFrameShape(QFrame.NoFrame)
         self._scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         self._scroll.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        self._scroll.setStyleSheet(
-            f"QScrollArea {{ background-color: {Colors.BACKGROUND}; border: none; }}"
-            + StyleManager.scrollbar()
-        )
+        apply_variant(self._scroll, "scroll-page")
 
         scroll_content = QWidget()
         scroll_content.setLayoutDirection(get_layout_direction())
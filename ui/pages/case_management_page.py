@@ -28,7 +28,7 @@ from PyQt5.QtGui import (
 
 from ui.design_system import Colors, PageDimensions, Spacing, ScreenScale
 from ui.font_utils import create_font, FontManager
-from ui.style_manager import StyleManager
+from ui.theme_engine import apply_variant
 from ui.components.nav_style_tab import NavStyleTab
 from ui.components.accent_line import AccentLine
 from ui.components.dark_header_zone import DarkHeaderZone
@@ -609,10 +609,7 @@ class CaseManagementPage(QWidget):
         self._scroll.setWidgetResizable(True)
         self._scroll.setFrameShape(QFrame.NoFrame)
         self._scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self._scroll.setStyleSheet(
-            "QScrollArea { border: none; background: transparent; }"
-            + StyleManager.scrollbar()
-        )
+        apply_variant(self._scroll, "scroll-transparent")
 
         self._scroll_content = QWidget()
         self._scroll_content.setStyleSheet("background: transparent;")
@@ -747,7 +744,7 @@ class CaseManagementPage(QWidget):
         self._worker = ApiWorker(self._fetch_cases_data)
         self._worker.finished.connect(self._on_cases_loaded)
         self._worker.error.connect(self._on_cases_load_error)
-        self._worker.start()
+        self._worker.start(supersede=True)
 
     def _fetch_cases_data(self):
         from services.api_client import get_api_client
@@ -28,7 +28,7 @@ from PyQt5.QtGui import (
 
 from ui.design_system import Colors, PageDimensions, Spacing, ScreenScale
 from ui.font_utils import create_font, FontManager
-from ui.style_manager import StyleManager
+from ui.theme_engine import apply_variant
 from ui.components.icon import Icon
 from ui.components.nav_style_tab import NavStyleTab
 from ui.components.accent_line import AccentLine
@@ -588,10 +588,7 @@ class CasesPage(QWidget):
         self._scroll.setWidgetResizable(True)
         self._scroll.setFrameShape(QFrame.NoFrame)
         self._scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self._scroll.setStyleSheet(
-            "QScrollArea { border: none; background: transparent; }"
-            + StyleManager.scrollbar()
-        )
+        apply_variant(self._scroll, "scroll-transparent")
 
         self._scroll_content = QWidget()
         self._scroll_content.setStyleSheet("background: transparent;")
@@ -806,7 +803,7 @@ class CasesPage(QWidget):
         )
         self._worker.finished.connect(self._on_surveys_loaded)
         self._worker.error.connect(self._on_surveys_load_error)
-        self._worker.start()
+        self._worker.start(supersede=True)
 
     def _fetch_surveys_data(self, status, name, clerk_id):
         from services.api_client import get_api_client
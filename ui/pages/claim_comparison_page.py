@@ -13,14 +13,17 @@ from PyQt5.QtGui import QColor, QIcon, QCursor
 from repositories.database import Database
 from services.duplicate_service import DuplicateService
 from services.conflict_classifier import get_conflict_display_category, PERSON
+from services.preview_cache import can_preview
 from ui.font_utils import create_font, FontManager
 from ui.style_manager import StyleManager
+from ui.theme_engine import apply_variant
 from ui.design_system import Colors, PageDimensions, ButtonDimensions, ScreenScale
 from ui.components.dark_header_zone import DarkHeaderZone
 from app.config import Pages
 from ui.components.accent_line import AccentLine
 from ui.components.icon import Icon
 from ui.components.toast import Toast
+from ui.components.evidence_viewer import load_evidence_preview
 from ui.animation_utils import stagger_fade_in
 from services.api_worker import ApiWorker
 from services.translation_manager import tr, get_layout_direction, get_text_alignment
@@ -50,59 +53,40 @@ _LTR_FIELD_KEYS = {
 
 
 def _find_in_staged_persons(staged_snapshot, entity_id):
-    """Search the staged-entities payload for a person record by id.
+    """Search the staged-entities snapshot for a person record by id.
 
-    staged_snapshot shape (from api.get_staged_entities):
+    staged_snapshot is the package's StagedSnapshot (services/staged_snapshot.py),
+    wrapping the grouped api.get_staged_entities payload:
       { "persons": [...], "buildings": [...], "propertyUnits": [...], ... }
-    Each list contains staged entity dicts with various id fields.
     """
     return _find_in_staged_collection(staged_snapshot, "persons", entity_id)
 
 
 def _find_in_staged_property_units(staged_snapshot, entity_id):
-    """Search the staged-entities payload for a property unit by id."""
+    """Search the staged-entities snapshot for a property unit by id."""
     return _find_in_staged_collection(staged_snapshot, "propertyUnits", entity_id)
 
 
 def _find_in_staged_buildings(staged_snapshot, building_id):
-    """Search the staged-entities payload for a building by id."""
+    """Search the staged-entities snapshot for a building by id."""
     return _find_in_staged_collection(staged_snapshot, "buildings", building_id)
 
 
 def _find_in_staged_collection(staged_snapshot, collection_key, entity_id):
-    """Generic id-lookup across one of the staged-entities lists.
+    """Indexed id-lookup in one of the staged-entities lists.
 
     Returns the unwrapped staging payload (`stagingData` / `entityData` /
     the item itself) so callers can read it like a regular DTO.
     """
     if not staged_snapshot or not entity_id:
         return None
-    items = (
-        staged_snapshot.get(collection_key)
-        if isinstance(staged_snapshot, dict) else None
-    )
-    if not isinstance(items, list):
-        return None
-    target = str(entity_id)
-    id_keys = (
-        "id", "originalEntityId", "stagedEntityId",
-        "personId", "buildingId", "propertyUnitId", "entityId",
-    )
-    for item in items:
-        if not isinstance(item, dict):
-            continue
-        for key in id_keys:
-            val = item.get(key)
-            if val and str(val) == target:
-                payload = item.get("stagingData") or item.get("entityData") or item
-                if isinstance(payload, str):
-                    try:
-                        import json as _json
-                        payload = _json.loads(payload)
-                    except (ValueError, TypeError):
-                        payload = item
-                return payload if isinstance(payload, dict) else item
-    return None
+    return staged_snapshot.find(collection_key, entity_id)
+
+
+def _load_staged_snapshot(package_id):
+    """Shared StagedSnapshot for the package (fetched once per package)."""
+    from services.staged_snapshot import get_staged_snapshot
+    return get_staged_snapshot(package_id)
 
 
 # ─── Embedded snapshot helpers (ConflictDetailDto.firstEntity / secondEntity) ──
@@ -470,10 +454,7 @@ class ClaimComparisonPage(QWidget):
         scroll.setWidgetResizable(True)
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         scroll.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        scroll.setStyleSheet(
-            "QScrollArea { border: none; background-color: transparent; }"
-            + StyleManager.scrollbar()
-        )
+        apply_variant(scroll, "scroll-transparent")
         self._scroll_area = scroll
 
         content = QWidget()
@@ -975,6 +956,11 @@ class ClaimComparisonPage(QWidget):
         icon_lbl.setFont(create_font(size=12, weight=FontManager.WEIGHT_REGULAR))
         icon_lbl.setStyleSheet("background: transparent; border: none;")
         icon_lbl.setFixedWidth(ScreenScale.w(20))
+        evidence_id = str(evidence.get("id") or evidence.get("evidenceId") or "")
+        if evidence_id and can_preview(file_name):
+            icon_lbl.setFixedSize(ScreenScale.w(36), ScreenScale.h(36))
+            icon_lbl.setAlignment(Qt.AlignCenter)
+            load_evidence_preview(icon_lbl, evidence_id=evidence_id, file_name=file_name)
         name_row.addWidget(icon_lbl)
 
         name_lbl = QLabel(file_name or "-")
@@ -1803,14 +1789,13 @@ class ClaimComparisonPage(QWidget):
                     # 2) Fallback path — staged-entities then production.
                     if package_id and staged_snapshot is None:
                         try:
-                            from services.api_client import get_api_client
-                            staged_snapshot = get_api_client().get_staged_entities(package_id)
+                            staged_snapshot = _load_staged_snapshot(package_id)
                         except Exception as se:
                             logger.warning(
                                 f"Failed to fetch staged entities for package "
                                 f"{package_id}: {se}"
                             )
-                            staged_snapshot = {}
+                            staged_snapshot = False
 
                     record = (
                         _find_in_staged_persons(staged_snapshot, eid)
@@ -2147,13 +2132,13 @@ class ClaimComparisonPage(QWidget):
             if staged_snapshot is not None or not package_id:
                 return
             try:
-                staged_snapshot = api.get_staged_entities(package_id) or {}
+                staged_snapshot = _load_staged_snapshot(package_id)
             except Exception as se:
                 logger.warning(
                     f"[CMP-PROP] Failed to fetch staged entities for package "
                     f"{package_id}: {se}"
                 )
-                staged_snapshot = {}
+                staged_snapshot = False
 
         results = []
         for entity_id in record_ids:
@@ -27,6 +27,7 @@ from PyQt5.QtGui import (
 from ui.design_system import Colors, PageDimensions, ScreenScale
 from ui.font_utils import create_font, FontManager
 from ui.style_manager import StyleManager
+from ui.theme_engine import apply_variant
 from ui.components.icon import Icon
 from ui.components.logo import LogoWidget
 from ui.components.toast import Toast
@@ -542,10 +543,7 @@ class ClaimDetailsPage(QWidget):
         self._scroll.setFrameShape(QFrame.NoFrame)
         self._scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         self._scroll.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        self._scroll.setStyleSheet(
-            f"QScrollArea {{ background-color: {Colors.BACKGROUND}; border: none; }}"
-            + StyleManager.scrollbar()
-        )
+        apply_variant(self._scroll, "scroll-page")
 
         scroll_content = QWidget()
         scroll_content.setLayoutDirection(get_layout_direction())
@@ -736,6 +734,7 @@ class ClaimDetailsPage(QWidget):
             self._populate_relation_card()
             self._populate_status_card()
             self._update_edit_visibility()
+            self._prefetch_attachments()
 
             if self._failed_sections:
                 sections_text = "، ".join(self._failed_sections)
@@ -745,6 +744,14 @@ class ClaimDetailsPage(QWidget):
         except Exception as e:
             logger.error(f"Error applying claim data: {e}")
 
+    def _prefetch_attachments(self):
+        """Download the case's evidence files in the background so opening one is instant."""
+        try:
+            from services.download_manager import get_download_manager
+            get_download_manager().prefetch_evidences(self._evidences)
+        except Exception as e:
+            logger.debug(f"Attachment prefetch not started: {e}")
+
     def _load_claim_by_id(self, claim_id):
         """Load full claim data from API by claim_id."""
         if self._loading:
@@ -1202,6 +1209,7 @@ class ClaimDetailsPage(QWidget):
 
     def _create_evidence_thumbnail(self, evidence):
         from PyQt5.QtGui import QPixmap
+        from ui.components.evidence_viewer import load_evidence_preview
 
         ev_id = str(evidence.get("id") or "")
         file_name = str(evidence.get("fileName") or evidence.get("originalFileName") or tr("page.claim_details.document"))
@@ -1224,6 +1232,9 @@ class ClaimDetailsPage(QWidget):
         thumb.setStyleSheet("border: none; background: transparent;")
 
         self._set_file_type_icon(thumb, file_name)
+        if ev_id:
+            load_evidence_preview(thumb, evidence_id=ev_id, file_name=file_name,
+                                  style="border: none; background: transparent;")
 
         card_layout.addWidget(thumb, alignment=Qt.AlignCenter)
 
@@ -1258,7 +1269,7 @@ class ClaimDetailsPage(QWidget):
 
     def _create_pending_upload_card(self, file_path):
         import os
-        from PyQt5.QtGui import QPixmap
+        from ui.components.evidence_viewer import load_evidence_preview
         file_name = os.path.basename(file_path)
 
         card = QFrame()
@@ -1277,11 +1288,8 @@ class ClaimDetailsPage(QWidget):
         thumb.setAlignment(Qt.AlignCenter)
         thumb.setStyleSheet("border: none; background: transparent;")
 
-        px = QPixmap(file_path)
-        if not px.isNull():
-            thumb.setPixmap(px.scaled(66, 66, Qt.KeepAspectRatio, Qt.SmoothTransformation))
-        else:
-            self._set_file_type_icon(thumb, file_name)
+        self._set_file_type_icon(thumb, file_name)
+        load_evidence_preview(thumb, file_path=file_path, style="border: none; background: transparent;")
 
         card_layout.addWidget(thumb, alignment=Qt.AlignCenter)
 
@@ -14,6 +14,7 @@ from PyQt5.QtWidgets import QGraphicsDropShadowEffect
 from ui.design_system import Colors, PageDimensions, ScreenScale
 from ui.font_utils import create_font, FontManager
 from ui.style_manager import StyleManager
+from ui.theme_engine import apply_variant
 from ui.components.toast import Toast
 from ui.components.dialogs.modification_reason_dialog import ModificationReasonDialog
 from services.translation_manager import tr, get_layout_direction
@@ -94,10 +95,7 @@ class ClaimEditPage(QWidget):
         scroll.setFrameShape(QFrame.NoFrame)
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         scroll.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        scroll.setStyleSheet(
-            f"QScrollArea {{ background-color: {Colors.BACKGROUND}; border: none; }}"
-            + StyleManager.scrollbar()
-        )
+        apply_variant(scroll, "scroll-page")
 
         body = QWidget()
         self._body_layout = QVBoxLayout(body)
@@ -25,7 +25,7 @@ from PyQt5.QtGui import (
 
 from ui.design_system import Colors, PageDimensions, Spacing, ScreenScale
 from ui.font_utils import create_font, FontManager
-from ui.style_manager import StyleManager
+from ui.theme_engine import apply_variant
 from ui.components.icon import Icon
 from ui.components.nav_style_tab import NavStyleTab
 from ui.components.empty_state import EmptyState
@@ -473,10 +473,7 @@ class CompletedClaimsPage(QWidget):
         self._scroll.setWidgetResizable(True)
         self._scroll.setFrameShape(QFrame.NoFrame)
         self._scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self._scroll.setStyleSheet(
-            "QScrollArea { border: none; background: transparent; }"
-            + StyleManager.scrollbar()
-        )
+        apply_variant(self._scroll, "scroll-transparent")
 
         self._scroll_content = QWidget()
         self._scroll_content.setStyleSheet("background: transparent;")
@@ -641,7 +638,7 @@ class CompletedClaimsPage(QWidget):
         )
         self._worker.finished.connect(self._on_claims_loaded)
         self._worker.error.connect(self._on_claims_error)
-        self._worker.start()
+        self._worker.start(supersede=True)
 
     def _fetch_claims_data(self, case_status, search_text):
         from services.api_client import get_api_client
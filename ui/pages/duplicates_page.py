@@ -30,6 +30,7 @@ from ui.components.animated_card import AnimatedCard, animate_card_entrance
 from ui.components.empty_state import EmptyState
 from ui.font_utils import create_font, FontManager
 from ui.style_manager import StyleManager
+from ui.theme_engine import apply_variant
 from ui.design_system import Colors, PageDimensions, ScreenScale
 from ui.components.toast import Toast
 from services.translation_manager import tr, get_layout_direction, apply_label_alignment
@@ -620,10 +621,7 @@ class DuplicatesPage(QWidget):
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        scroll.setStyleSheet(
-            "QScrollArea { border: none; background: transparent; }"
-            + StyleManager.scrollbar()
-        )
+        apply_variant(scroll, "scroll-transparent")
         scroll.setFrameShape(QFrame.NoFrame)
 
         scroll_content = QWidget()
@@ -959,7 +959,7 @@ class FieldWorkPreparationStep1(QWidget):
         )
         self._buildings_worker.finished.connect(self._on_buildings_loaded)
         self._buildings_worker.error.connect(self._on_buildings_load_error)
-        self._buildings_worker.start()
+        self._buildings_worker.start(supersede=True)
 
     def _on_buildings_loaded(self, response):
         """Handle API response for building search."""
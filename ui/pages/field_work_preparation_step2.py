@@ -19,7 +19,7 @@ from ui.components.toast import Toast
 from ui.animation_utils import stagger_fade_in
 from ui.design_system import Colors, PageDimensions, ScreenScale
 from ui.font_utils import create_font, FontManager
-from ui.style_manager import StyleManager
+from ui.theme_engine import apply_variant
 from utils.i18n import I18n
 from services.api_worker import ApiWorker
 from services.translation_manager import tr, get_layout_direction, apply_label_alignment
@@ -420,10 +420,7 @@ class FieldWorkPreparationStep2(QWidget):
         scroll.setWidgetResizable(True)
         scroll.setFrameShape(QFrame.NoFrame)
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        scroll.setStyleSheet(
-            "QScrollArea { border: none; background: transparent; }"
-            + StyleManager.scrollbar()
-        )
+        apply_variant(scroll, "scroll-transparent")
 
         self._scroll_content = QWidget()
         self._scroll_content.setStyleSheet("background: transparent;")
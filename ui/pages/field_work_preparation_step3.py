@@ -17,6 +17,7 @@ from ui.animation_utils import stagger_fade_in
 from ui.design_system import Colors, ScreenScale
 from ui.font_utils import create_font, FontManager
 from ui.style_manager import StyleManager
+from ui.theme_engine import apply_variant
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -109,10 +110,7 @@ class FieldWorkPreparationStep3(QWidget):
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
         scroll.setFrameShape(QFrame.NoFrame)
-        scroll.setStyleSheet(
-            "QScrollArea { background: transparent; border: none; }"
-            + StyleManager.scrollbar()
-        )
+        apply_variant(scroll, "scroll-transparent")
 
         scroll_content = QWidget()
         scroll_content.setStyleSheet("background: transparent;")
@@ -19,6 +19,7 @@ from ui.components.loading_spinner import LoadingSpinnerOverlay
 from ui.error_handler import ErrorHandler
 from ui.design_system import PageDimensions, ScreenScale
 from ui.style_manager import StyleManager
+from ui.theme_engine import apply_variant
 from ui.font_utils import create_font, FontManager
 from controllers.import_controller import ImportController
 from services.vocab_service import get_label as vocab_get_label
@@ -270,10 +271,7 @@ class ImportPackagesPage(QWidget):
         self._scroll.setWidgetResizable(True)
         self._scroll.setFrameShape(QFrame.NoFrame)
         self._scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self._scroll.setStyleSheet(
-            "QScrollArea { border: none; background: transparent; }"
-            + StyleManager.scrollbar()
-        )
+        apply_variant(self._scroll, "scroll-transparent")
 
         self._scroll_content = QWidget()
         self._scroll_content.setStyleSheet("background: transparent;")
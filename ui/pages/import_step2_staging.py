@@ -20,7 +20,7 @@ from PyQt5.QtGui import QColor
 
 from ui.design_system import Colors, PageDimensions, ScreenScale
 from ui.font_utils import create_font, FontManager
-from ui.style_manager import StyleManager
+from ui.theme_engine import apply_variant
 from services.translation_manager import tr, get_layout_direction, get_text_alignment
 from utils.logger import get_logger
 
@@ -72,10 +72,7 @@ class ImportStep2Staging(QWidget):
         main_scroll = QScrollArea()
         main_scroll.setWidgetResizable(True)
         main_scroll.setFrameShape(QFrame.NoFrame)
-        main_scroll.setStyleSheet(
-            "QScrollArea { background: transparent; border: none; }"
-            + StyleManager.scrollbar()
-        )
+        apply_variant(main_scroll, "scroll-transparent")
 
         scroll_content = QWidget()
         scroll_content.setStyleSheet("background: transparent;")
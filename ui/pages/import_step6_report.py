@@ -10,7 +10,7 @@ from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtGui import QColor
 
 from ui.font_utils import create_font, FontManager
-from ui.style_manager import StyleManager
+from ui.theme_engine import apply_variant
 from services.translation_manager import tr, get_layout_direction, get_text_alignment
 from utils.logger import get_logger
 from ui.design_system import Colors, ScreenScale
@@ -260,10 +260,7 @@ class ImportStep6Report(QWidget):
         self._errors_scroll = QScrollArea()
         self._errors_scroll.setWidgetResizable(True)
         self._errors_scroll.setFrameShape(QFrame.NoFrame)
-        self._errors_scroll.setStyleSheet(
-            "QScrollArea { background: transparent; border: none; }"
-            + StyleManager.scrollbar()
-        )
+        apply_variant(self._errors_scroll, "scroll-transparent")
         # Constrain the errors card so the page itself never scrolls;
         # only the inner errors list scrolls when many errors are present.
         self._errors_scroll.setMaximumHeight(ScreenScale.h(140))
@@ -1035,11 +1035,19 @@ class ImportWizardPage(QWidget):
                 return
             self._blocking_error_active = False
             duplicates_data = None
+            local_detect = None
             if isinstance(result.data, dict):
                 duplicates_data = result.data.get("detect")
+                local_detect = result.data.get("local_detect")
             self._hide_error_banner()
             self._navigate_to_step2(duplicates_data)
             self._update_navigation()
+            # Server detection failed: report what the local check found
+            local_count = (local_detect or {}).get("summary", {}).get("pendingReviewCount", 0)
+            if local_count:
+                self._show_warning_banner(
+                    tr("wizard.import.local_duplicates_found").format(count=local_count)
+                )
 
         def on_error(error_type, msg_ar):
             # Synthesize a minimal failed result so _show_result_error
@@ -29,7 +29,7 @@ from ui.components.empty_state import EmptyState
 from ui.components.dark_header_zone import DarkHeaderZone
 from ui.components.stat_pill import StatPill
 from ui.components.accent_line import AccentLine
-from ui.style_manager import StyleManager
+from ui.theme_engine import apply_variant
 from ui.design_system import Colors, PageDimensions, ScreenScale
 from ui.font_utils import create_font, FontManager
 from utils.i18n import I18n
@@ -123,10 +123,7 @@ class PersonDialog(QDialog):
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
         scroll.setFrameShape(QFrame.NoFrame)
-        scroll.setStyleSheet(
-            "QScrollArea { background: transparent; border: none; }"
-            + StyleManager.scrollbar()
-        )
+        apply_variant(scroll, "scroll-transparent")
         scroll_widget = QWidget()
         layout = QVBoxLayout(scroll_widget)
         layout.setSpacing(16)
@@ -868,10 +865,7 @@ class PersonsPage(QWidget):
         self._scroll.setWidgetResizable(True)
         self._scroll.setFrameShape(QFrame.NoFrame)
         self._scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self._scroll.setStyleSheet(
-            "QScrollArea { border: none; background: transparent; }"
-            + StyleManager.scrollbar()
-        )
+        apply_variant(self._scroll, "scroll-transparent")
 
         self._scroll_content = QWidget()
         self._scroll_content.setStyleSheet("background: transparent;")
@@ -965,7 +959,7 @@ class PersonsPage(QWidget):
         self._load_persons_worker = ApiWorker(self.person_controller.load_persons, filter_)
         self._load_persons_worker.finished.connect(self._on_load_persons_finished)
         self._load_persons_worker.error.connect(self._on_load_persons_error)
-        self._load_persons_worker.start()
+        self._load_persons_worker.start(supersede=True)
 
     def _on_load_persons_finished(self, result):
         self._spinner.hide_loading()
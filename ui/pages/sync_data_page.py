@@ -24,6 +24,7 @@ from ui.components.animated_card import AnimatedCard, animate_card_entrance
 from ui.components.empty_state import EmptyState
 from ui.design_system import Colors, PageDimensions, ScreenScale
 from ui.style_manager import StyleManager
+from ui.theme_engine import apply_variant
 from ui.font_utils import create_font, FontManager
 from utils.logger import get_logger
 
@@ -491,10 +492,7 @@ class SyncDataPage(QWidget):
         self._scroll.setWidgetResizable(True)
         self._scroll.setFrameShape(QFrame.NoFrame)
         self._scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self._scroll.setStyleSheet(
-            "QScrollArea { background: transparent; border: none; }"
-            + StyleManager.scrollbar()
-        )
+        apply_variant(self._scroll, "scroll-transparent")
 
         self._scroll_content = QWidget()
         self._scroll_content.setStyleSheet("background: transparent;")
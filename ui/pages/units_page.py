@@ -30,7 +30,7 @@ from ui.components.primary_button import PrimaryButton
 from ui.error_handler import ErrorHandler
 from utils.i18n import I18n
 from utils.logger import get_logger
-from ui.style_manager import StyleManager
+from ui.theme_engine import apply_variant
 from services.translation_manager import tr, get_layout_direction
 from ui.components.animated_card import AnimatedCard, animate_card_entrance
 from ui.components.empty_state import EmptyState
@@ -230,10 +230,7 @@ class UnitsPage(QWidget):
         self._scroll.setWidgetResizable(True)
         self._scroll.setFrameShape(QFrame.NoFrame)
         self._scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self._scroll.setStyleSheet(
-            "QScrollArea { border: none; background: transparent; }"
-            + StyleManager.scrollbar()
-        )
+        apply_variant(self._scroll, "scroll-transparent")
 
         self._scroll_content = QWidget()
         self._scroll_content.setStyleSheet("background: transparent;")
@@ -349,7 +346,7 @@ class UnitsPage(QWidget):
         )
         self._load_units_worker.finished.connect(self._on_load_units_finished)
         self._load_units_worker.error.connect(self._on_load_units_error)
-        self._load_units_worker.start()
+        self._load_units_worker.start(supersede=True)
 
     def _on_load_units_finished(self, result):
         self._spinner.hide_loading()
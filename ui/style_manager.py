@@ -26,6 +26,10 @@ Usage:
     # Apply navbar style
     navbar.setStyleSheet(StyleManager.navbar())
 
+    Styles that switch at runtime (input states, wizard pills, pagination,
+    scroll areas) are compiled into the application stylesheet by
+    ui.theme_engine and selected with apply_variant() instead.
+
 Author: UN-Habitat TRRCMS Team
 Created: 2025
 """
@@ -469,6 +473,38 @@ class StyleManager:
         """
         return f"background-color: {Colors.BACKGROUND};"
 
+    @staticmethod
+    def main_window_shell() -> str:
+        """
+        Get the main window container stylesheet (object-name keyed).
+
+        Usage: MainWindow central widget, window frame, size grip and page
+        stack. Compiled into the application stylesheet, so the containers
+        carry no stylesheet of their own and themed pages below them keep
+        using the application rules.
+
+        Returns:
+            Complete QSS stylesheet string
+        """
+        return f"""
+            QWidget#MainCentralWidget {{
+                background: transparent;
+            }}
+            QFrame#window_frame {{
+                background-color: {Colors.BACKGROUND};
+                border-radius: 12px;
+            }}
+            QFrame#window_frame[maximized="true"] {{
+                border-radius: 0px;
+            }}
+            QSizeGrip#MainSizeGrip {{
+                background: transparent;
+            }}
+            QStackedWidget#MainStack {{
+                background-color: {Colors.BACKGROUND};
+            }}
+        """
+
     @staticmethod
     def page_header() -> str:
         """
@@ -1812,34 +1848,6 @@ def get_input_style(variant: str = "default") -> str:
         return StyleManager.input_field(InputVariant.DEFAULT)
 
 
-def mark_field_error(widget, error_label=None, message: str = "") -> None:
-    """Apply error visual state to an input widget.
-
-    Args:
-        widget: QLineEdit, QComboBox, or similar input widget.
-        error_label: Optional QLabel to show the error message below the field.
-        message: Error text to display in the error_label.
-    """
-    widget.setStyleSheet(StyleManager.input_field(InputVariant.ERROR))
-    if error_label is not None:
-        error_label.setText(message)
-        error_label.setVisible(bool(message))
-
-
-def mark_field_valid(widget, error_label=None) -> None:
-    """Apply success/valid visual state to an input widget."""
-    widget.setStyleSheet(StyleManager.input_field(InputVariant.SUCCESS))
-    if error_label is not None:
-        error_label.setVisible(False)
-
-
-def clear_field_state(widget, error_label=None) -> None:
-    """Reset an input widget to its default (neutral) visual state."""
-    widget.setStyleSheet(StyleManager.input_field(InputVariant.DEFAULT))
-    if error_label is not None:
-        error_label.setVisible(False)
-
-
 def required_label_html(text: str) -> str:
     """Return an HTML label string with a red asterisk for required fields.
 
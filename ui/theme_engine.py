@@ -0,0 +1,278 @@
+# -*- coding: utf-8 -*-
+"""
+Theme Engine - محرك الأنماط على مستوى التطبيق
+Compiles StyleManager output into one application-level stylesheet.
+
+Every `widget.setStyleSheet(text)` makes Qt re-parse the CSS and re-polish
+the widget's whole subtree. Instead, the theme engine compiles all shared
+styles once into a single QApplication stylesheet whose rules are keyed on:
+
+- object names (e.g. `QPushButton#PrimaryButton`) for component classes
+  that always look the same, and
+- the `themeVariant` dynamic property for everything that switches looks at
+  runtime (input error/success, wizard step pills, pagination buttons ...).
+
+Widgets pick a look with `apply_variant(widget, "input-error")`, which only
+sets a property and re-polishes that one widget.
+
+Qt prefers any rule from an ancestor widget's stylesheet to the application
+stylesheet, whatever the selector specificity: under a parent with
+`QWidget { background: white; border: none; }` the compiled input-error
+border would be lost. Themed widgets are therefore checked when they are
+polished and whenever their style changes (reparenting, an ancestor's
+setStyleSheet): if an ancestor carries a stylesheet, the variant's scoped
+rules are set on the widget itself, which beats every ancestor. That
+fallback costs a parse per widget, so long-lived containers (the main
+window frame and page stack, StyleManager.main_window_shell) keep their
+looks in the compiled sheet rather than in a stylesheet of their own.
+
+Usage:
+    from ui.theme_engine import ThemeEngine, apply_variant
+
+    ThemeEngine.install(app)                     # once, in main.py
+    apply_variant(scroll, "scroll-transparent")  # instead of setStyleSheet(...)
+    apply_component_style(self, StyleManager.button_primary)  # object-name keyed
+
+If the engine has not been installed (tools, isolated dialogs),
+apply_variant falls back to assigning the scoped stylesheet text directly,
+so call sites behave the same either way.
+"""
+
+import re
+from typing import Callable, Dict, List, Optional
+
+from PyQt5.QtCore import QEvent, QObject, Qt
+
+from .design_system import Colors
+from .style_manager import StyleManager, InputVariant
+
+VARIANT_PROPERTY = "themeVariant"
+
+_RULE_RE = re.compile(r"([^{}]+)\{([^{}]*)\}")
+_COMPOUND_RE = re.compile(
+    r"^(?P<head>(?:[A-Za-z_][\w-]*|\*)?(?:#[\w-]+|\.[\w-]+|\[[^\]]*\])*)(?P<tail>.*)$"
+)
+
+
+def _scope_selector(selector: str, attr: str) -> str:
+    """Insert `attr` into the first compound of a selector, before pseudo-states.
+
+    `QLineEdit:focus` -> `QLineEdit[attr]:focus`
+    `QScrollBar::handle:vertical` -> `QScrollBar[attr]::handle:vertical`
+    `QTableView QHeaderView::section` -> `QTableView[attr] QHeaderView::section`
+    """
+    parts = selector.strip().split(None, 1)
+    if not parts:
+        return selector
+    match = _COMPOUND_RE.match(parts[0])
+    first = f"{match.group('head')}{attr}{match.group('tail')}"
+    return first if len(parts) == 1 else f"{first} {parts[1]}"
+
+
+def scope_qss(qss: str, variant: str) -> str:
+    """Rewrite widget-level QSS so it only matches widgets with `variant`."""
+    attr = f'[{VARIANT_PROPERTY}="{variant}"]'
+    rules = []
+    for match in _RULE_RE.finditer(qss):
+        selectors = ", ".join(_scope_selector(s, attr) for s in match.group(1).split(","))
+        body = " ".join(line.strip() for line in match.group(2).strip().splitlines())
+        rules.append(f"{selectors} {{ {body} }}")
+    return "\n".join(rules)
+
+
+class ThemeEngine:
+    """Registry and compiler for the application-level stylesheet."""
+
+    # Object-name keyed sheets, included verbatim.
+    _global_sheets: List[Callable[[], str]] = [
+        StyleManager.button_primary,
+        StyleManager.button_secondary,
+        StyleManager.button_text,
+        StyleManager.button_danger,
+        StyleManager.main_window_shell,
+    ]
+
+    # Property-keyed variants: name -> widget-level QSS generator.
+    _variants: Dict[str, Callable[[], str]] = {
+        "input-default": lambda: StyleManager.input_field(InputVariant.DEFAULT),
+        "input-error": lambda: StyleManager.input_field(InputVariant.ERROR),
+        "input-success": lambda: StyleManager.input_field(InputVariant.SUCCESS),
+        "step-pill": lambda: StyleManager.wizard_step_pill(),
+        "step-pill-active": lambda: StyleManager.wizard_step_pill(active=True),
+        "step-pill-completed": lambda: StyleManager.wizard_step_pill(completed=True),
+        "step-connector": lambda: StyleManager.step_connector(active=False),
+        "step-connector-active": lambda: StyleManager.step_connector(active=True),
+        "pagination": lambda: StyleManager.pagination_button(active=False),
+        "pagination-active": lambda: StyleManager.pagination_button(active=True),
+        "scroll-transparent": lambda: _scroll_area_qss("transparent"),
+        "scroll-page": lambda: _scroll_area_qss(Colors.BACKGROUND),
+    }
+
+    _compiled: Optional[str] = None
+    _scoped_cache: Dict[str, str] = {}
+    _app = None
+    _base_sheet: str = ""
+
+    @classmethod
+    def register_variant(cls, name: str, generator: Callable[[], str]):
+        """Register (or replace) a property-keyed variant."""
+        cls._variants[name] = generator
+        cls.invalidate()
+
+    @classmethod
+    def register_global(cls, generator: Callable[[], str]):
+        """Register an object-name keyed sheet included as-is."""
+        cls._global_sheets.append(generator)
+        cls.invalidate()
+
+    @classmethod
+    def variants(cls) -> List[str]:
+        return sorted(cls._variants)
+
+    @classmethod
+    def has_variant(cls, name: str) -> bool:
+        return name in cls._variants
+
+    @classmethod
+    def scoped_qss(cls, name: str) -> str:
+        """Scoped QSS for one variant (cached)."""
+        qss = cls._scoped_cache.get(name)
+        if qss is None:
+            qss = scope_qss(cls._variants[name](), name)
+            cls._scoped_cache[name] = qss
+        return qss
+
+    @classmethod
+    def compile(cls) -> str:
+        """Compile the full application stylesheet (cached until invalidated)."""
+        if cls._compiled is None:
+            sections = [sheet() for sheet in cls._global_sheets]
+            sections.extend(cls.scoped_qss(name) for name in sorted(cls._variants))
+            cls._compiled = "\n".join(s.strip() for s in sections)
+        return cls._compiled
+
+    @classmethod
+    def invalidate(cls):
+        """Drop the compiled sheet; re-install if already installed."""
+        cls._compiled = None
+        cls._scoped_cache = {}
+        if cls._app is not None:
+            cls._app.setStyleSheet(cls._base_sheet + "\n" + cls.compile())
+
+    @classmethod
+    def install(cls, app):
+        """Set the compiled stylesheet on the QApplication (once)."""
+        if cls._app is None:
+            cls._base_sheet = app.styleSheet() or ""
+        cls._app = app
+        app.setStyleSheet(cls._base_sheet + "\n" + cls.compile())
+
+    @classmethod
+    def uninstall(cls):
+        if cls._app is not None:
+            cls._app.setStyleSheet(cls._base_sheet)
+        cls._app = None
+        cls._base_sheet = ""
+
+    @classmethod
+    def is_installed(cls) -> bool:
+        return cls._app is not None
+
+
+def _scroll_area_qss(background: str) -> str:
+    """QScrollArea look plus StyleManager scrollbars for its own scrollbars."""
+    rules = [f"QScrollArea {{ background: {background}; border: none; }}"]
+    for selectors, body in _RULE_RE.findall(StyleManager.scrollbar()):
+        scoped = ", ".join(f"QScrollArea {sel.strip()}" for sel in selectors.split(","))
+        rules.append(f"{scoped} {{{body}}}")
+    return "\n".join(rules)
+
+
+def _ancestor_has_stylesheet(widget) -> bool:
+    parent = widget.parentWidget()
+    while parent is not None:
+        if parent.styleSheet():
+            return True
+        parent = parent.parentWidget()
+    return False
+
+
+def _own_sheet(widget) -> Optional[str]:
+    """The widget-level text of the theme rules `widget` was given, if any."""
+    variant = widget.property(VARIANT_PROPERTY)
+    if variant and ThemeEngine.has_variant(variant):
+        return ThemeEngine.scoped_qss(variant)
+    generator = getattr(widget, "_theme_component", None)
+    return generator() if generator is not None else None
+
+
+def _sync_theme(widget, replace: bool = False, repolish: bool = False):
+    """Use the application sheet, or a widget sheet when an ancestor has one.
+
+    A sheet the widget got from elsewhere is left alone unless `replace`.
+    """
+    own = _own_sheet(widget)
+    current = widget.styleSheet()
+    if own is None or (current not in ("", own) and not replace):
+        return
+    wanted = own if not ThemeEngine.is_installed() or _ancestor_has_stylesheet(widget) else ""
+    if current != wanted:
+        widget.setStyleSheet(wanted)
+    elif repolish and widget.testAttribute(Qt.WA_WState_Polished):
+        style = widget.style()
+        style.unpolish(widget)
+        style.polish(widget)
+        widget.update()
+
+
+class _ThemeSync(QObject):
+    """Event filter re-checking themed widgets when their cascade can change."""
+
+    _EVENTS = (QEvent.Polish, QEvent.ParentChange, QEvent.StyleChange)
+
+    def eventFilter(self, watched, event):
+        if event.type() in self._EVENTS and not getattr(watched, "_theme_syncing", False):
+            watched._theme_syncing = True
+            try:
+                _sync_theme(watched)
+            finally:
+                watched._theme_syncing = False
+        return False
+
+
+_theme_sync: Optional[_ThemeSync] = None
+
+
+def _watch(widget):
+    global _theme_sync
+    if _theme_sync is None:
+        _theme_sync = _ThemeSync()
+    widget.installEventFilter(_theme_sync)
+
+
+def apply_variant(widget, variant: str):
+    """Switch a widget to a theme variant by property, not stylesheet text.
+
+    Clears any per-widget stylesheet a previous helper left behind (those
+    helpers replaced the whole sheet too), sets the `themeVariant` property
+    and re-polishes only this widget. Where an ancestor has a stylesheet of
+    its own, the variant's scoped rules go on the widget instead (see the
+    module docstring).
+    """
+    if widget.property(VARIANT_PROPERTY) == variant and widget.styleSheet() in ("", _own_sheet(widget)):
+        return
+    widget.setProperty(VARIANT_PROPERTY, variant)
+    _watch(widget)
+    _sync_theme(widget, replace=True, repolish=True)
+
+
+def apply_component_style(widget, generator: Callable[[], str]):
+    """Style an object-name keyed component (PrimaryButton, DangerButton ...).
+
+    With the engine installed the compiled application sheet already holds
+    these rules, so nothing is parsed per widget; otherwise, or under an
+    ancestor with a stylesheet, the component's sheet is assigned directly.
+    """
+    widget._theme_component = generator
+    _watch(widget)
+    _sync_theme(widget, replace=True)
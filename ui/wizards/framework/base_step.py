@@ -3,7 +3,7 @@
 Base Step - Abstract base class for wizard steps.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import Callable, List, Dict, Any, Optional
 from abc import ABCMeta, abstractmethod
 from dataclasses import dataclass
 
@@ -96,6 +96,14 @@ class BaseStep(QWidget, metaclass=ABCQWidgetMeta):
     def collect_data(self) -> Dict[str, Any]:
         """Collect data from the step's UI."""
         pass
+
+    def validate_async(self, callback: Callable[[StepValidationResult], None]):
+        """Validate, then call callback(result).
+
+        Steps whose validation waits on the server override this and call
+        back from a task callback; the wizard navigates only once called.
+        """
+        callback(self.validate())
     # Optional Methods - Can be overridden by subclasses
 
     def populate_data(self):
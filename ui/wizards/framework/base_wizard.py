@@ -264,8 +264,13 @@ class BaseWizard(QWidget, metaclass=ABCQWidgetMeta):
         """Handle wizard submission."""
         # Validate last step
         current_step = self.navigator.get_current_step()
-        if current_step:
-            validation_result = current_step.validate()
+        if not current_step:
+            self._submit()
+            return
+        if self.navigator.validating:
+            return
+
+        def on_validated(validation_result):
             if not validation_result.is_valid:
                 self._on_validation_failed(validation_result)
                 return
@@ -273,7 +278,11 @@ class BaseWizard(QWidget, metaclass=ABCQWidgetMeta):
             # Call on_next() hook for the last step (same as navigate_next does for other steps)
             if hasattr(current_step, 'on_next') and callable(current_step.on_next):
                 current_step.on_next()
+            self._submit()
+
+        self.navigator.validate_step(current_step, on_validated)
 
+    def _submit(self):
         # Call subclass submission handler
         if self.on_submit():
             try:
@@ -3,15 +3,20 @@
 Step Navigator - Manages navigation between wizard steps.
 """
 
-from typing import List, Optional
-from PyQt5.QtCore import QObject, pyqtSignal
+from typing import Callable, List, Optional
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
 
 from .base_step import BaseStep, StepValidationResult
 from .wizard_context import WizardContext
+from services.translation_manager import tr
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# A step that has not called back by then gets a failed result, so the
+# wizard does not stay locked (covers outbox drain plus API retries).
+VALIDATION_TIMEOUT_MS = 180_000
+
 
 class StepNavigator(QObject):
     """Manages navigation between wizard steps."""
@@ -28,6 +33,11 @@ class StepNavigator(QObject):
         self.context = context
         self.steps = steps
         self.current_index = 0
+        self.validating = False
+        self._on_validation_timeout = None
+        self._validation_watchdog = QTimer(self)
+        self._validation_watchdog.setSingleShot(True)
+        self._validation_watchdog.timeout.connect(self._validation_timed_out)
 
         # Connect step signals
         for step in self.steps:
@@ -53,43 +63,101 @@ class StepNavigator(QObject):
         return self.current_index > 0
 
     def next_step(self, skip_validation: bool = False) -> bool:
-        """Navigate to the next step."""
+        """Navigate to the next step.
+
+        Returns False if navigation was refused or is still waiting for an
+        asynchronous validation (the step then moves on when it calls back).
+        """
         if not self.can_go_next():
             logger.debug(f"Cannot go next: already at last step ({self.current_index})")
             return False
+        if self.validating:
+            logger.debug(f"Step {self.current_index} is still validating")
+            return False
 
         logger.info(f"Navigating: Step {self.current_index} → {self.current_index + 1}")
 
-        # Validate current step
-        if not skip_validation:
-            current_step = self.get_current_step()
-            if current_step:
-                logger.debug(f"Validating step {self.current_index}...")
-                validation_result = current_step.validate()
-                if not validation_result.is_valid:
-                    logger.warning(
-                        f"Step {self.current_index} validation failed: {validation_result.errors}"
-                    )
-                    self.validation_failed.emit(validation_result)
-                    return False
+        current_step = self.get_current_step()
+        if skip_validation or not current_step:
+            return self._advance_from(self.current_index)
+
+        logger.debug(f"Validating step {self.current_index}...")
+        index = self.current_index
+        navigated = []
+        self.validate_step(
+            current_step,
+            lambda result: navigated.append(self._on_step_validated(index, current_step, result))
+        )
+        return bool(navigated and navigated[0])
+
+    def validate_step(self, step: BaseStep, on_result: Callable[[StepValidationResult], None]):
+        """Run `step.validate_async` and pass its result to `on_result` exactly once.
+
+        `validating` stays set until then. A step that raises, or that does
+        not call back within VALIDATION_TIMEOUT_MS, produces a failed result
+        instead; a callback arriving after that is ignored.
+        """
+        done = []
+
+        def finish(result: StepValidationResult):
+            if done:
+                logger.warning(f"Late validation callback from {step.get_step_title()} ignored")
+                return
+            done.append(True)
+            self._validation_watchdog.stop()
+            self._on_validation_timeout = None
+            self.validating = False
+            on_result(result)
+
+        self.validating = True
+        self._on_validation_timeout = lambda: finish(
+            StepValidationResult(is_valid=False, errors=[tr("error.api.timeout")])
+        )
+        self._validation_watchdog.start(VALIDATION_TIMEOUT_MS)
+        try:
+            step.validate_async(finish)
+        except Exception as e:
+            logger.error(f"Validation of {step.get_step_title()} failed: {e}", exc_info=True)
+            finish(StepValidationResult(is_valid=False, errors=[tr("error.unexpected_retry")]))
+
+    def _validation_timed_out(self):
+        if self._on_validation_timeout is None:
+            return
+        logger.warning(f"Step {self.current_index} did not finish validating "
+                       f"within {VALIDATION_TIMEOUT_MS // 1000}s, releasing the wizard")
+        self._on_validation_timeout()
+
+    def _on_step_validated(self, index: int, step: BaseStep, result: StepValidationResult) -> bool:
+        if index != self.current_index:
+            logger.warning(f"Validation of step {index} finished after leaving it, ignored")
+            return False
+        if not result.is_valid:
+            logger.warning(f"Step {index} validation failed: {result.errors}")
+            self.validation_failed.emit(result)
+            return False
 
-                logger.debug(f"Step {self.current_index} validated successfully")
-                # Mark step as completed
-                self.context.mark_step_completed(self.current_index)
+        logger.debug(f"Step {index} validated successfully")
+        # Mark step as completed
+        self.context.mark_step_completed(index)
 
-                # Call on_next() hook if the step has it
-                if hasattr(current_step, 'on_next') and callable(current_step.on_next):
-                    logger.debug(f"Calling on_next() for step {self.current_index}")
-                    current_step.on_next()
+        # Call on_next() hook if the step has it
+        if hasattr(step, 'on_next') and callable(step.on_next):
+            logger.debug(f"Calling on_next() for step {index}")
+            step.on_next()
+        return self._advance_from(index)
 
+    def _advance_from(self, index: int) -> bool:
         # Move to next step
-        result = self._navigate_to(self.current_index + 1)
+        result = self._navigate_to(index + 1)
         if result:
             logger.info(f"Successfully navigated to step {self.current_index}")
         return result
 
     def previous_step(self) -> bool:
         """Navigate to the previous step."""
+        if self.validating:
+            logger.debug(f"Step {self.current_index} is still validating")
+            return False
         if not self.can_go_previous():
             logger.debug(f"Cannot go previous: already at first step ({self.current_index})")
             return False
@@ -18,7 +18,7 @@ from PyQt5.QtWidgets import (
     QRadioButton, QButtonGroup, QSizePolicy
 )
 from PyQt5.QtCore import Qt, QUrl, QTimer, QLocale, QDate
-from PyQt5.QtGui import QColor, QPixmap, QRegExpValidator, QDoubleValidator, QIntValidator
+from PyQt5.QtGui import QColor, QRegExpValidator, QDoubleValidator, QIntValidator
 from PyQt5.QtCore import QRegExp as QtRegExp
 
 from app.config import Config
@@ -26,6 +26,7 @@ from services.validation_service import ValidationService
 from services.api_client import get_api_client
 from services.translation_manager import tr, get_layout_direction, get_language
 from services.error_mapper import map_exception
+from services.upload_pipeline import UploadJob, run_upload_batch
 from services.display_mappings import (
     get_relation_type_options, get_relationship_to_head_options,
     get_evidence_type_options,
@@ -34,6 +35,7 @@ from services.display_mappings import (
 from ui.components.rtl_combo import RtlCombo
 from ui.components.centered_text_edit import CenteredTextEdit
 from ui.components.toast import Toast
+from ui.components.evidence_viewer import load_evidence_preview
 from ui.components.loading_spinner import LoadingSpinnerOverlay
 from ui.design_system import Colors, ScreenScale
 from ui.font_utils import create_font, FontManager
@@ -374,6 +376,7 @@ class PersonDialog(QDialog):
 
         # Loading spinner overlay
         self._spinner = LoadingSpinnerOverlay(self)
+        self._saving = False
 
     def _apply_read_only_mode(self):
         """Disable all input fields and change buttons for read-only viewing."""
@@ -1184,11 +1187,8 @@ class PersonDialog(QDialog):
         """)
         thumb.setCursor(Qt.PointingHandCursor)
 
-        pixmap = QPixmap(file_path)
-        if not pixmap.isNull():
-            thumb.setPixmap(pixmap.scaled(40, 40, Qt.KeepAspectRatio, Qt.SmoothTransformation))
-        else:
-            thumb.setText("📄")
+        thumb.setText("📄")
+        load_evidence_preview(thumb, file_path=file_path)
 
         # Click to open image in system viewer
         from PyQt5.QtGui import QDesktopServices
@@ -2673,6 +2673,8 @@ class PersonDialog(QDialog):
         import re
         from ui.error_handler import ErrorHandler
 
+        if self._saving:
+            return
         has_error = False
         # Required: first_name, last_name, father_name, mother_name
         first = self.first_name.text().strip()
@@ -2773,11 +2775,22 @@ class PersonDialog(QDialog):
         if has_error:
             return
 
+        # The spinner and the document uploads process events: ignore a second
+        # Save click and Esc until the save has finished
+        self._saving = True
+        self.setEnabled(False)
         self._spinner.show_loading(tr("component.loading.default"))
         try:
             self._on_final_save_api()
         finally:
             self._spinner.hide_loading()
+            self.setEnabled(True)
+            self._saving = False
+
+    def reject(self):
+        if self._saving:
+            return
+        super().reject()
 
     def _on_final_save_api(self):
         """Execute the API calls for final save (called after validation passes)."""
@@ -2963,23 +2976,24 @@ class PersonDialog(QDialog):
 
             if self._survey_id and person_id:
                 # Replace: pair new files with pending replacement IDs (PUT)
-                for file_path in list(new_id_files):
-                    if not self._pending_id_replacements:
-                        break
-                    old_evidence_id = self._pending_id_replacements.pop(0)
-                    try:
-                        doc_type = self.id_doc_type_combo.currentData() if hasattr(self, 'id_doc_type_combo') else None
-                        response = self._api_service.update_identification_document(
-                            self._survey_id, old_evidence_id, person_id, file_path=file_path,
-                            document_type=doc_type)
-                        new_eid = (response.get("id") or response.get("evidenceId")
-                                   or response.get("Id") or old_evidence_id)
-                        self._evidence_ids[os.path.normpath(file_path)] = new_eid
-                        new_id_files.remove(file_path)
-                        logger.info(f"ID evidence replaced: {old_evidence_id} -> {new_eid}")
-                    except Exception as e:
-                        logger.error(f"Failed to replace ID evidence {old_evidence_id}: {e}")
+                doc_type = self.id_doc_type_combo.currentData() if hasattr(self, 'id_doc_type_combo') else None
+                pairs = list(zip(new_id_files, self._pending_id_replacements))
+                del self._pending_id_replacements[:len(pairs)]
+                jobs = [UploadJob("update_identification_document",
+                                  dict(survey_id=self._survey_id, document_id=old_evidence_id,
+                                       person_id=person_id, file_path=file_path, document_type=doc_type),
+                                  tag=(file_path, old_evidence_id))
+                        for file_path, old_evidence_id in pairs]
+                for result in run_upload_batch(jobs):
+                    file_path, old_evidence_id = result.job.tag
+                    if not result.ok:
+                        logger.error(f"Failed to replace ID evidence {old_evidence_id}: {result.error}")
                         self._pending_id_replacements.insert(0, old_evidence_id)
+                        continue
+                    new_eid = result.evidence_id or old_evidence_id
+                    self._evidence_ids[os.path.normpath(file_path)] = new_eid
+                    new_id_files.remove(file_path)
+                    logger.info(f"ID evidence replaced: {old_evidence_id} -> {new_eid}")
 
                 # Upload remaining new files that had no replacement target (POST)
                 if new_id_files:
@@ -3004,23 +3018,24 @@ class PersonDialog(QDialog):
 
             if self._survey_id and relation_id:
                 # Replace: pair new tenure files with pending replacement IDs (PUT)
-                for file_entry in list(new_rel_files):
-                    if not self._pending_rel_replacements:
-                        break
-                    old_evidence_id = self._pending_rel_replacements.pop(0)
-                    try:
-                        response = self._api_service.update_tenure_evidence(
-                            self._survey_id, old_evidence_id, relation_id,
-                            file_path=file_entry["path"],
-                            issue_date=file_entry.get("issue_date", ""))
-                        new_eid = (response.get("id") or response.get("evidenceId")
-                                   or response.get("Id") or old_evidence_id)
-                        file_entry["evidence_id"] = new_eid
-                        new_rel_files.remove(file_entry)
-                        logger.info(f"Tenure evidence replaced: {old_evidence_id} -> {new_eid}")
-                    except Exception as e:
-                        logger.error(f"Failed to replace tenure evidence {old_evidence_id}: {e}")
+                pairs = list(zip(new_rel_files, self._pending_rel_replacements))
+                del self._pending_rel_replacements[:len(pairs)]
+                jobs = [UploadJob("update_tenure_evidence",
+                                  dict(survey_id=self._survey_id, evidence_id=old_evidence_id,
+                                       relation_id=relation_id, file_path=file_entry["path"],
+                                       issue_date=file_entry.get("issue_date", "")),
+                                  tag=(file_entry, old_evidence_id))
+                        for file_entry, old_evidence_id in pairs]
+                for result in run_upload_batch(jobs):
+                    file_entry, old_evidence_id = result.job.tag
+                    if not result.ok:
+                        logger.error(f"Failed to replace tenure evidence {old_evidence_id}: {result.error}")
                         self._pending_rel_replacements.insert(0, old_evidence_id)
+                        continue
+                    new_eid = result.evidence_id or old_evidence_id
+                    file_entry["evidence_id"] = new_eid
+                    new_rel_files.remove(file_entry)
+                    logger.info(f"Tenure evidence replaced: {old_evidence_id} -> {new_eid}")
 
                 # Upload remaining new tenure files (POST)
                 if new_rel_files:
@@ -3062,25 +3077,22 @@ class PersonDialog(QDialog):
         if not self.uploaded_files:
             return
 
-        from services.exceptions import ApiException
-
-        for file_path in self.uploaded_files:
-            try:
-                doc_type = self.id_doc_type_combo.currentData() if hasattr(self, 'id_doc_type_combo') else None
-                response = self._api_service.upload_identification_document(
-                    self._survey_id, person_id, file_path,
-                    document_type=doc_type,
-                )
-                evidence_id = (
-                    response.get("id") or response.get("evidenceId") or
-                    response.get("Id") or response.get("EvidenceId") or ""
-                )
-                if evidence_id:
-                    self._evidence_ids[os.path.normpath(file_path)] = evidence_id
-                logger.info(f"Identification uploaded: {file_path} (evidence_id={evidence_id})")
-            except Exception as e:
-                logger.error(f"Failed to upload identification file {file_path}: {e}")
-                Toast.show_toast(self, map_exception(e), Toast.ERROR)
+        doc_type = self.id_doc_type_combo.currentData() if hasattr(self, 'id_doc_type_combo') else None
+        jobs = [UploadJob("upload_identification_document",
+                          dict(survey_id=self._survey_id, person_id=person_id,
+                               file_path=file_path, document_type=doc_type),
+                          tag=file_path)
+                for file_path in self.uploaded_files]
+        for result in run_upload_batch(jobs):
+            file_path = result.job.tag
+            if not result.ok:
+                logger.error(f"Failed to upload identification file {file_path}: {result.error}")
+                Toast.show_toast(self, map_exception(result.error), Toast.ERROR)
+                continue
+            evidence_id = result.evidence_id
+            if evidence_id:
+                self._evidence_ids[os.path.normpath(file_path)] = evidence_id
+            logger.info(f"Identification uploaded: {file_path} (evidence_id={evidence_id})")
 
     def _upload_tenure_files(self, relation_id: str):
         """Upload new tenure files and link existing selected documents."""
@@ -3094,38 +3106,29 @@ class PersonDialog(QDialog):
         fail_count = 0
 
         # Upload new files
-        for file_entry in self.relation_uploaded_files:
-            if file_entry.get('_selected_existing'):
-                continue
-            file_path = file_entry.get("path", "")
-            if not file_path:
-                continue
-            issue_date = file_entry.get("issue_date", "")
-            file_hash = file_entry.get("hash", "")
-
-            try:
-                response = self._api_service.upload_relation_document(
-                    survey_id=self._survey_id,
-                    relation_id=relation_id,
-                    file_path=file_path,
-                    issue_date=issue_date,
-                    file_hash=file_hash
-                )
-                evidence_id = (
-                    response.get("id") or response.get("evidenceId") or
-                    response.get("Id") or response.get("EvidenceId") or ""
-                )
-                if evidence_id:
-                    file_entry["evidence_id"] = evidence_id
+        jobs = [UploadJob("upload_relation_document",
+                          dict(survey_id=self._survey_id, relation_id=relation_id,
+                               file_path=file_entry["path"],
+                               issue_date=file_entry.get("issue_date", ""),
+                               file_hash=file_entry.get("hash", "")),
+                          tag=file_entry)
+                for file_entry in self.relation_uploaded_files
+                if not file_entry.get('_selected_existing') and file_entry.get("path")]
+        for result in run_upload_batch(jobs):
+            file_entry = result.job.tag
+            file_path = file_entry["path"]
+            e = result.error
+            if result.ok:
+                if result.evidence_id:
+                    file_entry["evidence_id"] = result.evidence_id
                 success_count += 1
-            except ApiException as e:
-                if e.status_code == 409:
-                    logger.info(f"Document already exists (duplicate hash): {file_path}")
-                    success_count += 1
-                else:
-                    fail_count += 1
-                    logger.error(f"Failed to upload {file_path}: {_map_exc(e)}")
-            except Exception as e:
+            elif isinstance(e, ApiException) and e.status_code == 409:
+                logger.info(f"Document already exists (duplicate hash): {file_path}")
+                success_count += 1
+            elif isinstance(e, ApiException):
+                fail_count += 1
+                logger.error(f"Failed to upload {file_path}: {_map_exc(e)}")
+            else:
                 fail_count += 1
                 logger.error(f"Failed to upload {file_path}: {e}")
 
@@ -12,6 +12,9 @@ from PyQt5.QtGui import QFont, QColor
 from ui.error_handler import ErrorHandler
 from services.error_mapper import map_exception
 from services.api_worker import ApiWorker
+from services.exceptions import NetworkException
+from services.survey_outbox import get_survey_outbox
+from services.upload_pipeline import get_upload_pipeline
 from ui.components.loading_spinner import LoadingSpinnerOverlay
 
 from ui.wizards.framework import BaseWizard, BaseStep
@@ -66,6 +69,8 @@ class OfficeSurveyWizard(BaseWizard):
     survey_completed = pyqtSignal(dict)
     survey_cancelled = pyqtSignal()
     survey_saved_draft = pyqtSignal(str)
+    # (survey_id, event, data) from the survey outbox, re-emitted on the GUI thread
+    _outbox_event = pyqtSignal(str, str, object)
 
     def __init__(self, db: Database = None, parent=None):
         """Initialize the wizard."""
@@ -82,6 +87,12 @@ class OfficeSurveyWizard(BaseWizard):
         self.wizard_cancelled.connect(self.survey_cancelled.emit)
         self.draft_saved.connect(self.survey_saved_draft.emit)
 
+        # Journaled mutations report back from the outbox's flusher thread
+        self._outbox_state = None
+        self._outbox_event.connect(self._on_outbox_event)
+        get_survey_outbox().add_listener(self._outbox_event.emit)
+        get_upload_pipeline().progress.connect(self._on_upload_progress)
+
     def create_context(self) -> SurveyContext:
         """Create and return wizard context."""
         return SurveyContext(db=self.db)
@@ -134,7 +145,7 @@ class OfficeSurveyWizard(BaseWizard):
             True if submission was successful
         """
         try:
-            # If ReviewStep.on_next() already finalized the survey on the backend,
+            # If ReviewStep.validate_async() already finalized the survey on the backend,
             # skip all draft-save logic and show success directly
             if self.context.status == "finalized":
                 finalize_resp = getattr(self.context, 'finalize_response', None) or {}
@@ -300,6 +311,30 @@ class OfficeSurveyWizard(BaseWizard):
         dlg.exec_()
         self._finalization_complete = True
 
+    def _on_outbox_event(self, survey_id: str, event: str, data):
+        """Apply outbox results to the current survey (GUI thread)."""
+        if survey_id != self.context.get_data("survey_id"):
+            return
+        if event == "id_mapped":
+            local_id, server_id = data
+            self.context.replace_local_id(local_id, server_id)
+            logger.info(f"Survey {survey_id}: {local_id} created as {server_id}")
+        elif event == "state":
+            if data.get("state") == "error" and self._outbox_state != "error":
+                Toast.show_toast(
+                    self, tr("wizard.sync.failed", error_msg=data.get("last_error") or ""), Toast.ERROR)
+            self._outbox_state = data.get("state")
+
+    def _on_upload_progress(self, data: dict):
+        """Show document upload progress in the footer (GUI thread)."""
+        if not data.get("active"):
+            self._upload_status.hide()
+            return
+        percent = 100 * data["bytes_sent"] // data["bytes_total"] if data["bytes_total"] else 0
+        self._upload_status.setText(tr("wizard.upload.progress", done=data["files_done"],
+                                       total=data["files_total"], percent=min(percent, 100)))
+        self._upload_status.show()
+
     def on_cancel(self) -> bool:
         """Handle wizard cancellation."""
         # Ask for confirmation
@@ -366,7 +401,16 @@ class OfficeSurveyWizard(BaseWizard):
         }
 
         def _do_save():
-            return api_service.save_draft_to_backend(survey_id, backend_draft_data)
+            outbox = get_survey_outbox()
+            if outbox.wait_until_synced(survey_id):
+                try:
+                    return api_service.save_draft_to_backend(survey_id, backend_draft_data)
+                except NetworkException:
+                    pass
+            # Offline or changes still pending: the draft is kept in the outbox
+            outbox.enqueue(survey_id, "save_draft_to_backend", survey_id, backend_draft_data)
+            logger.info(f"Draft for survey {survey_id} queued until the connection is back")
+            return {}
 
         def _on_saved(_result):
             self._spinner.hide_loading()
@@ -633,6 +677,7 @@ class OfficeSurveyWizard(BaseWizard):
 
                     if not reason_result[0]:
                         return
+                    get_survey_outbox().discard(survey_id)
                     self._cancel_survey_async(survey_id, reason_result[0])
                 self._finalization_complete = True
                 logger.info("User discarded wizard changes on close")
@@ -929,6 +974,14 @@ class OfficeSurveyWizard(BaseWizard):
         self.btn_previous.setEnabled(False)
         layout.addWidget(self.btn_previous)
 
+        # Aggregate progress of document uploads in flight (hidden when idle)
+        self._upload_status = QLabel()
+        self._upload_status.setFont(create_font(size=FontManager.SIZE_SMALL, weight=FontManager.WEIGHT_REGULAR))
+        self._upload_status.setStyleSheet(f"color: {Colors.TEXT_SECONDARY}; background: transparent;")
+        self._upload_status.setContentsMargins(16, 0, 16, 0)
+        self._upload_status.hide()
+        layout.addWidget(self._upload_status)
+
         spacer = QSpacerItem(0, ButtonDimensions.NAV_BUTTON_HEIGHT, QSizePolicy.Expanding, QSizePolicy.Fixed)
         layout.addItem(spacer)
 
@@ -980,6 +1033,8 @@ class OfficeSurveyWizard(BaseWizard):
 
     def _handle_previous(self):
         """Override back navigation with edit mode support and step-1 warning."""
+        if self.navigator.validating:
+            return
         # Edit mode: Cancel → return to review
         if self._edit_mode:
             self._exit_edit_mode()
@@ -1020,19 +1075,24 @@ class OfficeSurveyWizard(BaseWizard):
         if self._edit_mode:
             # Validate current step before saving
             current_step = self.navigator.get_current_step()
-            if current_step:
-                self.btn_next.setEnabled(False)
-                try:
-                    validation_result = current_step.validate()
-                finally:
-                    QTimer.singleShot(150, lambda: self.btn_next.setEnabled(True))
+            if not current_step:
+                self._exit_edit_mode()
+                return
+            if self.navigator.validating:
+                return
+
+            def on_validated(validation_result):
+                QTimer.singleShot(150, lambda: self.btn_next.setEnabled(True))
                 if not validation_result.is_valid:
                     self._on_validation_failed(validation_result)
                     return
                 # Call on_next() hook (API calls, data persistence)
                 if hasattr(current_step, 'on_next') and callable(current_step.on_next):
                     current_step.on_next()
-            self._exit_edit_mode()
+                self._exit_edit_mode()
+
+            self.btn_next.setEnabled(False)
+            self.navigator.validate_step(current_step, on_validated)
             return
 
         super()._handle_next()
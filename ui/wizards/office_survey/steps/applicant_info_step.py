@@ -18,7 +18,7 @@ from PyQt5.QtWidgets import (
     QScrollArea, QFileDialog, QGraphicsDropShadowEffect,
 )
 from PyQt5.QtCore import Qt, QUrl, QRegExp as QtRegExp
-from PyQt5.QtGui import QColor, QPixmap, QRegExpValidator, QDesktopServices
+from PyQt5.QtGui import QColor, QRegExpValidator, QDesktopServices
 
 from app.config import Config
 from ui.wizards.framework import BaseStep, StepValidationResult
@@ -31,10 +31,12 @@ from ui.wizards.office_survey.wizard_styles import (
 from ui.design_system import Colors, ScreenScale
 from ui.font_utils import create_font, FontManager
 from ui.components.rtl_combo import RtlCombo
-from ui.style_manager import StyleManager
+from ui.theme_engine import apply_variant
 from services.display_mappings import get_gender_options, get_nationality_options
 from services.translation_manager import tr, get_layout_direction
+from services.survey_outbox import get_survey_outbox
 from ui.components.toast import Toast
+from ui.components.evidence_viewer import load_evidence_preview
 from ui.components.loading_spinner import LoadingSpinnerOverlay
 from utils.logger import get_logger
 
@@ -60,10 +62,7 @@ class ApplicantInfoStep(BaseStep):
         scroll.setFrameShape(QFrame.NoFrame)
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         scroll.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        scroll.setStyleSheet(
-            "QScrollArea { border: none; background: transparent; }"
-            + StyleManager.scrollbar()
-        )
+        apply_variant(scroll, "scroll-transparent")
 
         content = QWidget()
         content.setStyleSheet("background: transparent;")
@@ -438,12 +437,10 @@ class ApplicantInfoStep(BaseStep):
             }
         """)
         thumb.setCursor(Qt.PointingHandCursor)
-        px = QPixmap(file_path)
-        if not px.isNull():
-            thumb.setPixmap(px.scaled(44, 44, Qt.KeepAspectRatio, Qt.SmoothTransformation))
-        else:
-            thumb.setText("PDF")
-            thumb.setStyleSheet(thumb.styleSheet() + "font-size: 9pt; color: #64748B;")
+        thumb.setText("PDF" if file_path.lower().endswith(".pdf") else "IMG")
+        base_style = thumb.styleSheet()
+        thumb.setStyleSheet(base_style + "font-size: 9pt; color: #64748B;")
+        load_evidence_preview(thumb, file_path=file_path, style=base_style)
 
         def _open_file(event, fp=file_path):
             QDesktopServices.openUrl(QUrl.fromLocalFile(fp))
@@ -742,7 +739,15 @@ class ApplicantInfoStep(BaseStep):
         survey_id = self.context.get_data("survey_id")
         if not survey_id:
             result.add_error(tr("wizard.applicant.no_survey_error"))
-            return result
+        return result
+
+    def validate_async(self, callback):
+        """Validate locally, then save the contact person (the create may wait on the outbox)."""
+        result = self.validate()
+        if not result.is_valid:
+            callback(result)
+            return
+        survey_id = self.context.get_data("survey_id")
 
         # 3. Collect data into context.applicant
         self.collect_data()
@@ -751,36 +756,44 @@ class ApplicantInfoStep(BaseStep):
         self._set_auth_token()
 
         self._spinner.show_loading(tr("component.loading.default"))
-        try:
-            # 5. Call API
-            existing_cp_id = self.context.get_data("contact_person_id")
-            if not existing_cp_id:
-                try:
-                    response = self._api_client.create_contact_person(survey_id, self.context.applicant)
-                    self.context.update_data(
-                        "contact_person_id",
-                        response.get("id") or response.get("contactPersonId", "")
-                    )
-                except Exception as e:
-                    from services.exceptions import ApiException
-                    if isinstance(e, ApiException) and e.status_code == 409:
-                        from services.error_mapper import build_duplicate_person_message
-                        result.add_error(build_duplicate_person_message(e.response_data))
-                    else:
-                        logger.error(f"Contact person API failed: {e}")
-                        result.add_error(tr("wizard.applicant.save_failed"))
+        # 5. Call API (updates, uploads and the draft name go through the outbox)
+        outbox = get_survey_outbox()
+        existing_cp_id = self.context.get_data("contact_person_id")
+        if existing_cp_id:
+            try:
+                outbox.enqueue(survey_id, "update_contact_person",
+                               survey_id, existing_cp_id, self.context.applicant)
+                logger.info(f"Contact person {existing_cp_id} update queued")
+            except Exception as e:
+                logger.error(f"Contact person update failed: {e}")
+                result.add_error(tr("wizard.applicant.update_failed"))
+            self._finish_save(survey_id, result, callback)
+            return
+
+        def on_created(response):
+            self.context.update_data(
+                "contact_person_id",
+                response.get("id") or response.get("contactPersonId", "")
+            )
+            self._finish_save(survey_id, result, callback)
+
+        def on_error(e):
+            from services.exceptions import ApiException
+            if isinstance(e, ApiException) and e.status_code == 409:
+                from services.error_mapper import build_duplicate_person_message
+                result.add_error(build_duplicate_person_message(e.response_data))
             else:
-                try:
-                    self._api_client.update_contact_person(survey_id, existing_cp_id, self.context.applicant)
-                    logger.info(f"Contact person {existing_cp_id} updated")
-                except Exception as e:
-                    from services.error_mapper import is_duplicate_nid_error, build_duplicate_person_message
-                    if is_duplicate_nid_error(e):
-                        result.add_error(build_duplicate_person_message(getattr(e, 'response_data', {})))
-                    else:
-                        logger.error(f"Contact person update failed: {e}")
-                        result.add_error(tr("wizard.applicant.update_failed"))
+                logger.error(f"Contact person API failed: {e}")
+                result.add_error(tr("wizard.applicant.save_failed"))
+            self._finish_save(survey_id, result, callback)
+
+        outbox.create_async(survey_id, "create_contact_person", survey_id, self.context.applicant,
+                            on_result=on_created, on_error=on_error)
 
+    def _finish_save(self, survey_id: str, result: StepValidationResult, callback):
+        """Queue ID photos and the interviewee name, then hand the result back."""
+        outbox = get_survey_outbox()
+        try:
             # 6. Upload ID photos
             person_id = self.context.get_data("contact_person_id")
             if person_id and self.uploaded_files:
@@ -789,14 +802,15 @@ class ApplicantInfoStep(BaseStep):
                 for fp in new_files:
                     try:
                         doc_type = self._id_doc_type_combo.currentData() if hasattr(self, '_id_doc_type_combo') else None
-                        self._api_client.upload_identification_document(
+                        outbox.enqueue(
+                            survey_id, "upload_identification_document",
                             survey_id=survey_id,
                             person_id=person_id,
                             file_path=fp,
                             document_type=doc_type,
                         )
                         already_uploaded.add(fp)
-                        logger.info(f"ID photo uploaded: {os.path.basename(fp)}")
+                        logger.info(f"ID photo upload queued: {os.path.basename(fp)}")
                     except Exception as e:
                         logger.error(f"Failed to upload ID photo {fp}: {e}")
                         from services.error_mapper import map_exception
@@ -812,15 +826,15 @@ class ApplicantInfoStep(BaseStep):
                 parts = [a.get("first_name_ar", ""), a.get("father_name_ar", ""), a.get("last_name_ar", "")]
                 interviewee_name = " ".join(p for p in parts if p) or a.get("full_name")
                 if interviewee_name:
-                    self._api_client.save_draft_to_backend(survey_id, {"interviewee_name": interviewee_name})
-                    logger.info(f"intervieweeName saved: {interviewee_name}")
+                    outbox.enqueue(survey_id, "save_draft_to_backend",
+                                   survey_id, {"interviewee_name": interviewee_name})
+                    logger.info(f"intervieweeName queued: {interviewee_name}")
             except Exception as e:
                 logger.warning(f"Could not save interviewee name: {e}")
                 Toast.show_toast(self, tr("wizard.applicant.load_failed"), Toast.ERROR)
         finally:
             self._spinner.hide_loading()
-
-        return result
+        callback(result)
 
     def _save_contact_person_locally(self, survey_id: str):
         """Cache contact person data locally for draft resume."""
@@ -24,7 +24,7 @@ from ui.wizards.office_survey.wizard_styles import (
 )
 from ui.design_system import Colors, ScreenScale
 from ui.font_utils import create_font, FontManager
-from ui.style_manager import StyleManager
+from ui.theme_engine import apply_variant
 from services.display_mappings import get_building_type_display, get_building_status_display
 from services.translation_manager import tr, get_layout_direction
 from services.api_client import get_api_client
@@ -67,10 +67,7 @@ class BuildingInfoStep(BaseStep):
         scroll.setFrameShape(QFrame.NoFrame)
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         scroll.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        scroll.setStyleSheet(
-            "QScrollArea { border: none; background: transparent; }"
-            + StyleManager.scrollbar()
-        )
+        apply_variant(scroll, "scroll-transparent")
 
         content = QWidget()
         content.setStyleSheet("background: transparent;")
@@ -603,7 +600,7 @@ class BuildingInfoStep(BaseStep):
         if existing_survey_id and previous_building_uuid != building_uuid:
             logger.info(f"Building changed ({previous_building_uuid} -> {building_uuid}), cleaning up")
             try:
-                self.context.cleanup_on_building_change(self._survey_api_service)
+                self.context.cleanup_on_building_change()
             except Exception as e:
                 logger.warning(f"Cleanup failed: {e}")
             for key in ("survey_id", "survey_data", "survey_building_uuid"):
@@ -756,7 +756,7 @@ class BuildingSelectionStep(BaseStep):
                          logger.error(f"Failed to load buildings: {msg}"),
                          Toast.show_toast(self, tr("wizard.building_selection.load_failed"), Toast.ERROR))
         )
-        self._load_buildings_worker.start()
+        self._load_buildings_worker.start(supersede="buildings")
 
     def _on_buildings_loaded(self, result):
         """Handle buildings loaded from API."""
@@ -832,7 +832,7 @@ class BuildingSelectionStep(BaseStep):
                          logger.error(f"Failed to search buildings: {msg}"),
                          Toast.show_toast(self, tr("wizard.building_selection.load_failed"), Toast.ERROR))
         )
-        self._search_buildings_worker.start()
+        self._search_buildings_worker.start(supersede="buildings")
 
     def _on_building_selected(self, item):
         """Handle building selection."""
@@ -1132,7 +1132,7 @@ class BuildingSelectionStep(BaseStep):
         if existing_survey_id and previous_building_uuid != building_uuid:
             logger.info(f"Building changed ({previous_building_uuid} -> {building_uuid}), cleaning up")
             try:
-                self.context.cleanup_on_building_change(self._survey_api_service)
+                self.context.cleanup_on_building_change()
             except Exception as e:
                 logger.warning(f"Cleanup failed: {e}")
                 Toast.show_toast(self, tr("wizard.building_selection.load_failed"), Toast.ERROR)
@@ -33,7 +33,7 @@ from services.api_worker import ApiWorker
 from ui.components.toast import Toast
 from ui.components.loading_spinner import LoadingSpinnerOverlay
 from ui.components.logo import LogoWidget
-from ui.style_manager import StyleManager
+from ui.theme_engine import apply_variant
 from ui.wizards.office_survey.wizard_styles import (
     STEP_CARD_STYLE, READONLY_FIELD_STYLE,
     make_step_card, make_icon_header, EMPTY_STATE_ICON_STYLE,
@@ -290,10 +290,7 @@ class ClaimStep(BaseStep):
         self.scroll_area.setFrameShape(QFrame.NoFrame)
         self.scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         self.scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        self.scroll_area.setStyleSheet(
-            f"QScrollArea {{ background-color: {Colors.BACKGROUND}; border: none; }}"
-            + StyleManager.scrollbar()
-        )
+        apply_variant(self.scroll_area, "scroll-page")
 
         scroll_content = QWidget()
         scroll_content.setLayoutDirection(get_layout_direction())
@@ -31,6 +31,7 @@ from ui.wizards.office_survey.wizard_styles import (
 )
 from app.config import Config
 from services.api_client import get_api_client
+from services.survey_outbox import get_survey_outbox
 from utils.logger import get_logger
 from ui.components.toast import Toast
 from ui.design_system import Colors, ScreenScale
@@ -725,16 +726,9 @@ class HouseholdStep(BaseStep):
                 _le.setPlaceholderText(tr(_ph_key))
 
     def validate(self) -> StepValidationResult:
-        """Validate the step and save household data automatically."""
+        """Validate the household counts."""
         result = self.create_validation_result()
 
-        # Auto-save household data when clicking "Next"
-        property_unit_id = None
-        if self.context.unit:
-            property_unit_id = getattr(self.context.unit, 'unit_uuid', None)
-        elif self.context.new_unit_data:
-            property_unit_id = self.context.new_unit_data.get('unit_uuid')
-
         # Validate: total members must be > 0
         total_entered = self.hh_total_members.value()
         if total_entered <= 0:
@@ -758,6 +752,22 @@ class HouseholdStep(BaseStep):
             result.add_error(tr("wizard.household.disability_exceeds_total"))
             return result
 
+        return result
+
+    def validate_async(self, callback):
+        """Validate, then save household data automatically (a create may wait on the outbox)."""
+        result = self.validate()
+        if not result.is_valid:
+            callback(result)
+            return
+
+        # Auto-save household data when clicking "Next"
+        property_unit_id = None
+        if self.context.unit:
+            property_unit_id = getattr(self.context.unit, 'unit_uuid', None)
+        elif self.context.new_unit_data:
+            property_unit_id = self.context.new_unit_data.get('unit_uuid')
+
         _y = read_int_from_combo(self.hh_start_year)
         _m = read_int_from_combo(self.hh_start_month)
         _d = read_int_from_combo(self.hh_start_day)
@@ -788,52 +798,62 @@ class HouseholdStep(BaseStep):
         # Save household data
         existing_household_id = self.context.get_data("household_id")
         survey_id = self.context.get_data("survey_id")
-        saved = False
 
         self._set_auth_token()
         self._spinner.show_loading(tr("component.loading.default"))
 
-        try:
-            if existing_household_id:
+        if existing_household_id:
+            try:
                 stored = self.context.households[0] if self.context.households else {}
                 if self._household_data_changed(household, stored):
                     try:
-                        self._api_client.update_household(existing_household_id, household, survey_id=survey_id)
-                        logger.info(f"Household {existing_household_id} updated via API")
-                        saved = True
+                        get_survey_outbox().enqueue(
+                            survey_id, "update_household", existing_household_id, household, survey_id=survey_id)
+                        logger.info(f"Household {existing_household_id} update queued")
                     except Exception as e:
-                        logger.error(f"Failed to update household via API: {e}")
+                        logger.error(f"Failed to queue household update: {e}")
                         Toast.show_toast(self, tr("wizard.household.load_failed"), Toast.ERROR)
                         result.add_error(tr("wizard.household.update_failed"))
-                        return result
+                        callback(result)
+                        return
                 else:
                     logger.info(f"Household unchanged ({existing_household_id}), skipping")
-                    saved = True
                 household["api_id"] = existing_household_id
+            finally:
+                self._spinner.hide_loading()
+            self._store_household(household)
+            callback(result)
+            return
+
+        def on_created(api_response):
+            self._spinner.hide_loading()
+            if api_response.get("queued"):
+                logger.info("Household create queued (offline), continuing with a local id")
             else:
-                logger.info(f"Creating household via API: property_unit_id={property_unit_id}, survey_id={survey_id}, size={household['size']}")
-                try:
-                    api_response = self._api_client.create_household(household, survey_id=survey_id)
-                    logger.info("Household created successfully via API")
-                    household_id = api_response.get("id") or api_response.get("householdId", "")
-                    household["api_id"] = household_id
-                    self.context.update_data("household_id", household_id)
-                    saved = True
-                except Exception as e:
-                    logger.error(f"Failed to create household via API: {e}")
-                    Toast.show_toast(self, tr("wizard.household.load_failed"), Toast.ERROR)
-                    result.add_error(tr("wizard.household.save_failed"))
-                    return result
-        finally:
+                logger.info("Household created successfully via API")
+            household_id = api_response.get("id") or api_response.get("householdId", "")
+            household["api_id"] = household_id
+            self.context.update_data("household_id", household_id)
+            self._store_household(household)
+            callback(result)
+
+        def on_error(e):
             self._spinner.hide_loading()
+            logger.error(f"Failed to create household via API: {e}")
+            Toast.show_toast(self, tr("wizard.household.load_failed"), Toast.ERROR)
+            result.add_error(tr("wizard.household.save_failed"))
+            callback(result)
 
+        logger.info(f"Creating household via API: property_unit_id={property_unit_id}, survey_id={survey_id}, size={household['size']}")
+        get_survey_outbox().create_async(survey_id, "create_household", household, survey_id=survey_id,
+                                         on_result=on_created, on_error=on_error)
+
+    def _store_household(self, household: Dict):
         if self.context.households:
             self.context.households[0] = household
         else:
             self.context.households.append(household)
 
-        return result
-
     def _household_data_changed(self, current: Dict, stored: Dict) -> bool:
         """Compare current form data with stored household to detect changes."""
         compare_keys = [
@@ -24,6 +24,9 @@ from ui.wizards.office_survey.dialogs.person_dialog import PersonDialog
 
 from app.config import Config
 from services.api_client import get_api_client
+from services.api_worker import ApiWorker
+from services.survey_outbox import get_survey_outbox
+from services.upload_pipeline import UploadJob, run_upload_batch
 from utils.logger import get_logger
 from ui.error_handler import ErrorHandler
 from ui.font_utils import FontManager, create_font
@@ -49,6 +52,7 @@ from services.translation_manager import tr, get_layout_direction
 from services.display_mappings import get_relation_type_display, get_relationship_to_head_display
 from services.error_mapper import map_exception
 from ui.components.toast import Toast
+from ui.components.loading_spinner import LoadingSpinnerOverlay
 
 logger = get_logger(__name__)
 
@@ -59,6 +63,7 @@ class OccupancyClaimsStep(BaseStep):
     def __init__(self, context: SurveyContext, parent=None):
         super().__init__(context, parent)
         self._api_service = get_api_client()
+        self._relink_waiters = None  # callbacks waiting for _auto_relink_orphaned_persons
 
     def setup_ui(self):
         self.setLayoutDirection(get_layout_direction())
@@ -106,6 +111,9 @@ class OccupancyClaimsStep(BaseStep):
 
         layout.addWidget(persons_frame, 1)
 
+        # Loading spinner overlay
+        self._spinner = LoadingSpinnerOverlay(self)
+
     def _create_empty_state(self) -> QWidget:
         """Create empty state widget shown when no persons are added."""
         from ui.components.icon import Icon
@@ -313,72 +321,31 @@ class OccupancyClaimsStep(BaseStep):
                 if person_id:
                     try:
                         self._set_auth_token()
+                        outbox = get_survey_outbox()
                         if is_applicant and survey_id:
-                            self._api_service.update_contact_person(
-                                survey_id, person_id, updated_data)
+                            outbox.enqueue(survey_id, "update_contact_person",
+                                           survey_id, person_id, updated_data)
                         elif survey_id and household_id:
-                            self._api_service.update_person_in_survey(
-                                survey_id, household_id, person_id, updated_data)
+                            outbox.enqueue(survey_id, "update_person_in_survey",
+                                           survey_id, household_id, person_id, updated_data)
                         else:
                             logger.warning(f"Missing survey_id or household_id for person {person_id}")
-                        logger.info(f"Person {person_id} updated via API")
+                        logger.info(f"Person {person_id} update queued")
                         relation_id = updated_data.get('_relation_id') or person_data.get('_relation_id')
                         if relation_id and survey_id:
                             try:
-                                self._api_service.update_relation(survey_id, relation_id, updated_data)
-                                logger.info(f"Relation {relation_id} updated via API")
+                                outbox.enqueue(survey_id, "update_relation", survey_id, relation_id, updated_data)
+                                logger.info(f"Relation {relation_id} update queued")
                             except Exception as e:
-                                logger.warning(f"Failed to update relation {relation_id}: {e}")
+                                logger.warning(f"Failed to queue relation update {relation_id}: {e}")
                         elif not relation_id and survey_id and unit_id:
                             rel_type = updated_data.get('relation_data', {}).get('rel_type')
                             if rel_type:
                                 relation_data = dict(updated_data.get('relation_data', {}))
                                 relation_data['person_id'] = person_id
                                 relation_data['rel_type'] = rel_type
-                                try:
-                                    response = self._api_service.link_person_to_unit(
-                                        survey_id, unit_id, relation_data)
-                                    new_rel_id = (
-                                        response.get('id') or response.get('relationId') or
-                                        response.get('personPropertyRelationId') or '')
-                                    if new_rel_id:
-                                        updated_data['_relation_id'] = new_rel_id
-                                        logger.info(f"Created relation for person {person_id}: {new_rel_id}")
-                                        tenure_files = updated_data.get('_relation_uploaded_files', [])
-                                        for f_entry in tenure_files:
-                                            if f_entry.get('evidence_id'):
-                                                continue
-                                            f_path = f_entry.get('path', '')
-                                            if not f_path:
-                                                continue
-                                            try:
-                                                resp = self._api_service.upload_relation_document(
-                                                    survey_id=survey_id,
-                                                    relation_id=new_rel_id,
-                                                    file_path=f_path,
-                                                    issue_date=f_entry.get('issue_date', ''),
-                                                    file_hash=f_entry.get('hash', ''))
-                                                eid = (resp.get('id') or resp.get('evidenceId') or '')
-                                                if eid:
-                                                    f_entry['evidence_id'] = eid
-                                                logger.info(f"Tenure file uploaded for relation {new_rel_id}: {f_path}")
-                                            except Exception as ue:
-                                                logger.error(f"Failed to upload tenure file {f_path}: {ue}")
-                                        # Link existing selected documents to the new relation
-                                        for f_entry in tenure_files:
-                                            if not f_entry.get('_selected_existing') or not f_entry.get('evidence_id'):
-                                                continue
-                                            try:
-                                                self._api_service.link_evidence_to_relation(
-                                                    survey_id, f_entry['evidence_id'], new_rel_id
-                                                )
-                                                logger.info(f"Existing evidence {f_entry['evidence_id']} linked to relation {new_rel_id}")
-                                            except Exception as le:
-                                                logger.error(f"Failed to link existing evidence: {le}")
-                                                Toast.show_toast(self, tr("wizard.person_dialog.link_existing_doc_failed"), Toast.ERROR)
-                                except Exception as e:
-                                    logger.error(f"Failed to create relation for person {person_id}: {e}")
-                                    Toast.show_toast(self, map_exception(e), Toast.ERROR)
+                                self._create_relation_async(survey_id, unit_id, person_id,
+                                                            relation_data, updated_data)
                     except Exception as e:
                         from services.error_mapper import is_duplicate_nid_error, build_duplicate_person_message
                         if is_duplicate_nid_error(e):
@@ -395,6 +362,75 @@ class OccupancyClaimsStep(BaseStep):
             self._refresh_persons_list()
             logger.info(f"Person updated: {updated_data.get('first_name', '')} {updated_data.get('last_name', '')}")
 
+    def _create_relation_async(self, survey_id: str, unit_id: str, person_id: str,
+                               relation_data: dict, updated_data: dict):
+        """Link an edited person to the unit, then upload or link its tenure files."""
+        outbox = get_survey_outbox()
+
+        def on_created(response):
+            self._spinner.hide_loading()
+            new_rel_id = (
+                response.get('id') or response.get('relationId') or
+                response.get('personPropertyRelationId') or '')
+            if new_rel_id and response.get('queued'):
+                # Offline: tenure files are uploaded once the link is back
+                updated_data['_relation_id'] = new_rel_id
+                for f_entry in updated_data.get('_relation_uploaded_files', []):
+                    if f_entry.get('path') and not f_entry.get('evidence_id'):
+                        outbox.enqueue(
+                            survey_id, "upload_relation_document",
+                            survey_id=survey_id,
+                            relation_id=new_rel_id,
+                            file_path=f_entry['path'],
+                            issue_date=f_entry.get('issue_date', ''),
+                            file_hash=f_entry.get('hash', ''))
+                    elif f_entry.get('_selected_existing') and f_entry.get('evidence_id'):
+                        outbox.enqueue(survey_id, "link_evidence_to_relation",
+                                       survey_id, f_entry['evidence_id'], new_rel_id)
+                logger.info(f"Relation for person {person_id} queued: {new_rel_id}")
+            elif new_rel_id:
+                updated_data['_relation_id'] = new_rel_id
+                logger.info(f"Created relation for person {person_id}: {new_rel_id}")
+                tenure_files = updated_data.get('_relation_uploaded_files', [])
+                jobs = [UploadJob("upload_relation_document",
+                                  dict(survey_id=survey_id, relation_id=new_rel_id,
+                                       file_path=f_entry['path'],
+                                       issue_date=f_entry.get('issue_date', ''),
+                                       file_hash=f_entry.get('hash', '')),
+                                  tag=f_entry)
+                        for f_entry in tenure_files
+                        if not f_entry.get('evidence_id') and f_entry.get('path')]
+                for result in run_upload_batch(jobs):
+                    f_entry = result.job.tag
+                    if not result.ok:
+                        logger.error(f"Failed to upload tenure file {f_entry['path']}: {result.error}")
+                        continue
+                    if result.evidence_id:
+                        f_entry['evidence_id'] = result.evidence_id
+                    logger.info(f"Tenure file uploaded for relation {new_rel_id}: {f_entry['path']}")
+                # Link existing selected documents to the new relation
+                for f_entry in tenure_files:
+                    if not f_entry.get('_selected_existing') or not f_entry.get('evidence_id'):
+                        continue
+                    try:
+                        self._api_service.link_evidence_to_relation(
+                            survey_id, f_entry['evidence_id'], new_rel_id
+                        )
+                        logger.info(f"Existing evidence {f_entry['evidence_id']} linked to relation {new_rel_id}")
+                    except Exception as le:
+                        logger.error(f"Failed to link existing evidence: {le}")
+                        Toast.show_toast(self, tr("wizard.person_dialog.link_existing_doc_failed"), Toast.ERROR)
+            self._refresh_persons_list()
+
+        def on_error(e):
+            self._spinner.hide_loading()
+            logger.error(f"Failed to create relation for person {person_id}: {e}")
+            Toast.show_toast(self, map_exception(e), Toast.ERROR)
+
+        self._spinner.show_loading(tr("component.loading.default"))
+        outbox.create_async(survey_id, "link_person_to_unit", survey_id, unit_id, relation_data,
+                            on_result=on_created, on_error=on_error)
+
     def _create_person_row_card(self, person: dict, index: int = 0) -> QFrame:
         from PyQt5.QtWidgets import QGraphicsDropShadowEffect
 
@@ -768,25 +804,32 @@ class OccupancyClaimsStep(BaseStep):
             "autoCreateClaim": True
         }
 
-        try:
-            api_data = self._api_service.finalize_office_survey(survey_id, process_options)
-            logger.info(f"Survey {survey_id} claims processed successfully")
-            self.context.finalize_response = api_data
-            self.context.update_data("_survey_finalized_once", True)
+        def on_synced(synced):
+            self._spinner.hide_loading()
+            if not synced:
+                ErrorHandler.show_warning(self, tr("wizard.sync.pending_changes"), tr("common.warning"))
+                return
 
-            claims_count = api_data.get("claimsCreatedCount", 0)
-            created_claims = api_data.get("createdClaims", [])
+            try:
+                api_data = self._api_service.finalize_office_survey(survey_id, process_options)
+                logger.info(f"Survey {survey_id} claims processed successfully")
+                self.context.finalize_response = api_data
+                self.context.update_data("_survey_finalized_once", True)
 
-            if api_data.get("claimCreated") or claims_count > 0:
-                logger.info(f"Claims created: {claims_count}")
-            else:
-                reason = api_data.get('claimNotCreatedReason', 'Unknown')
-                logger.warning(f"Claim not created. Reason: {reason}")
+                claims_count = api_data.get("claimsCreatedCount", 0)
 
-        except Exception as e:
-            logger.error(f"Failed to process claims via API: {e}")
-            from services.error_mapper import map_exception
-            ErrorHandler.show_error(self, map_exception(e), tr("common.error"))
+                if api_data.get("claimCreated") or claims_count > 0:
+                    logger.info(f"Claims created: {claims_count}")
+                else:
+                    reason = api_data.get('claimNotCreatedReason', 'Unknown')
+                    logger.warning(f"Claim not created. Reason: {reason}")
+
+            except Exception as e:
+                logger.error(f"Failed to process claims via API: {e}")
+                ErrorHandler.show_error(self, map_exception(e), tr("common.error"))
+
+        self._spinner.show_loading(tr("component.loading.default"))
+        get_survey_outbox().when_synced(survey_id, on_synced)
 
     # BaseStep interface
 
@@ -918,6 +961,7 @@ class OccupancyClaimsStep(BaseStep):
         self._set_auth_token()
 
         contact_person_id = self.context.get_data('contact_person_id')
+        relinks = []
         for person in orphaned:
             if person.get('_is_contact_person') or person.get('_is_applicant'):
                 continue
@@ -942,13 +986,49 @@ class OccupancyClaimsStep(BaseStep):
                 'has_documents': rel_data.get('has_documents', False),
             }
 
-            try:
-                response = self._api_service.link_person_to_unit(survey_id, unit_id, relation_data)
+            relinks.append((person, relation_data))
+        if not relinks or self._relink_waiters is not None:
+            return
+
+        def _do_relink():
+            # Each create may wait for the survey's journal to drain
+            outbox = get_survey_outbox()
+            results = []
+            for person, relation_data in relinks:
+                try:
+                    results.append((person, outbox.create(survey_id, "link_person_to_unit",
+                                                          survey_id, unit_id, relation_data)))
+                except Exception as e:
+                    logger.error(f"Failed to auto-relink person {person['person_id']}: {e}")
+            return results
+
+        def _on_relinked(results):
+            for person, response in results:
                 new_relation_id = response.get('id') or response.get('relationId')
                 person['_relation_id'] = new_relation_id
-                logger.info(f"Auto-relinked person {person_id} to unit {unit_id}, new relation: {new_relation_id}")
-            except Exception as e:
-                logger.error(f"Failed to auto-relink person {person_id}: {e}")
+                logger.info(f"Auto-relinked person {person['person_id']} to unit {unit_id}, "
+                            f"new relation: {new_relation_id}")
+            _finish()
+
+        def _finish(*_):
+            self._spinner.hide_loading()
+            waiters, self._relink_waiters = self._relink_waiters, None
+            for waiter in waiters:
+                waiter()
+
+        self._relink_waiters = []
+        self._spinner.show_loading(tr("component.loading.default"))
+        self._relink_worker = ApiWorker(_do_relink)
+        self._relink_worker.finished.connect(_on_relinked)
+        self._relink_worker.error.connect(_finish)
+        self._relink_worker.start()
+
+    def validate_async(self, callback):
+        """Validate once relations being re-created in the background are in place."""
+        if self._relink_waiters is not None:
+            self._relink_waiters.append(lambda: callback(self.validate()))
+            return
+        callback(self.validate())
 
     def on_next(self):
         """Called when user clicks Next."""
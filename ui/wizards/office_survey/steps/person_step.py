@@ -28,7 +28,7 @@ from services.api_client import get_api_client
 from ui.components.toast import Toast
 from utils.logger import get_logger
 from ui.error_handler import ErrorHandler
-from ui.style_manager import StyleManager
+from ui.theme_engine import apply_variant
 from ui.font_utils import FontManager, create_font
 from ui.design_system import Colors, ScreenScale
 from services.translation_manager import tr, get_layout_direction
@@ -160,10 +160,7 @@ class PersonStep(BaseStep):
         scroll_area = QScrollArea()
         scroll_area.setLayoutDirection(get_layout_direction())
         scroll_area.setWidgetResizable(True)
-        scroll_area.setStyleSheet(
-            "QScrollArea { border: none; background-color: transparent; }"
-            + StyleManager.scrollbar()
-        )
+        apply_variant(scroll_area, "scroll-transparent")
 
         scroll_widget = QWidget()
         scroll_widget.setLayoutDirection(get_layout_direction())
@@ -21,11 +21,14 @@ from PyQt5.QtCore import Qt, QDate
 
 from ui.components.rtl_combo import RtlCombo
 from ui.style_manager import StyleManager
+from ui.theme_engine import apply_variant
 from ui.wizards.framework import BaseStep, StepValidationResult
 from ui.wizards.office_survey.survey_context import SurveyContext
 from services.api_client import get_api_client
+from services.survey_outbox import get_survey_outbox
 from utils.logger import get_logger
 from ui.components.toast import Toast
+from ui.components.loading_spinner import LoadingSpinnerOverlay
 from ui.error_handler import ErrorHandler
 from services.translation_manager import tr, get_layout_direction
 from services.error_mapper import map_exception
@@ -133,10 +136,7 @@ class RelationStep(BaseStep):
         scroll_area.setLayoutDirection(get_layout_direction())
         scroll_area.setWidgetResizable(True)
         scroll_area.setFrameShape(QFrame.NoFrame)
-        scroll_area.setStyleSheet(
-            "QScrollArea { border: none; background-color: transparent; }"
-            + StyleManager.scrollbar()
-        )
+        apply_variant(scroll_area, "scroll-transparent")
 
         # Container widget for cards
         scroll_widget = QWidget()
@@ -152,6 +152,9 @@ class RelationStep(BaseStep):
         layout.addWidget(main_card)
         layout.addStretch()
 
+        # Loading spinner overlay
+        self._spinner = LoadingSpinnerOverlay(self)
+
         # Initially populate with persons from context
         self._populate_person_cards()
 
@@ -513,15 +516,19 @@ class RelationStep(BaseStep):
         """Get step description."""
         return tr("wizard.relation.step_description")
 
-    def on_next(self):
-        """Called when user clicks Next - process claims via API."""
+    def validate_async(self, callback):
+        """Validate, then process claims via API before moving on to Step 6."""
+        result = self.validate()
         # Guard: only process claims once to prevent duplicate creation
-        if hasattr(self.context, 'finalize_response') and self.context.finalize_response:
+        if not result.is_valid:
+            callback(result)
+        elif hasattr(self.context, 'finalize_response') and self.context.finalize_response:
             logger.info("Claims already processed, skipping duplicate process-claims call")
-            return
-        self._process_claims_via_api()
+            callback(result)
+        else:
+            self._process_claims_via_api(lambda: callback(result))
 
-    def _process_claims_via_api(self):
+    def _process_claims_via_api(self, done):
         """Process claims for the survey by calling the API and store response for Step 6."""
         self._set_auth_token()
 
@@ -529,6 +536,7 @@ class RelationStep(BaseStep):
         if not survey_id:
             logger.warning("No survey_id found in context. Skipping process-claims.")
             ErrorHandler.show_warning(self, "No survey_id found in context!", "Error")
+            done()
             return
 
         logger.info(f"Processing claims for survey {survey_id} from Step 5")
@@ -539,35 +547,46 @@ class RelationStep(BaseStep):
             "autoCreateClaim": True
         }
 
-        try:
-            api_data = self._api_service.finalize_office_survey(survey_id, process_options)
-            logger.info(f"Survey {survey_id} claims processed successfully")
-
-            # Store the full API response in context for Step 6 (ClaimStep)
-            self.context.finalize_response = api_data
-
-            claims_count = api_data.get("claimsCreatedCount", 0)
-            created_claims = api_data.get("createdClaims", [])
-
-            if api_data.get("claimCreated") or claims_count > 0:
-                logger.info(f"Claims created: {claims_count}")
-
-                claim_number = created_claims[0].get('claimNumber', '') if created_claims else ''
-                Toast.show_toast(self, tr("wizard.success.description"), Toast.SUCCESS)
-            else:
-                reason = api_data.get('claimNotCreatedReason', 'Unknown')
-                logger.warning(f"Claim not created. Reason: {reason}")
-                ErrorHandler.show_warning(
-                    self,
-                    f"Survey processed but no claims created.\n\nReason: {reason}",
-                    "Process Claims"
-                )
-
-        except Exception as e:
-            logger.error(f"Failed to process claims: {e}")
-            error_msg = map_exception(e)
-            ErrorHandler.show_error(self, error_msg, tr("common.error"))
-            self.context.finalize_response = None
-
-            # Show warning but allow to continue to step 6
-            Toast.show_toast(self, f"{tr('wizard.relation.claims_failed')}: {error_msg}", Toast.WARNING)
+        def on_synced(synced):
+            self._spinner.hide_loading()
+            if not synced:
+                ErrorHandler.show_warning(self, tr("wizard.sync.pending_changes"), tr("common.warning"))
+                done()
+                return
+
+            try:
+                api_data = self._api_service.finalize_office_survey(survey_id, process_options)
+                logger.info(f"Survey {survey_id} claims processed successfully")
+
+                # Store the full API response in context for Step 6 (ClaimStep)
+                self.context.finalize_response = api_data
+
+                claims_count = api_data.get("claimsCreatedCount", 0)
+                created_claims = api_data.get("createdClaims", [])
+
+                if api_data.get("claimCreated") or claims_count > 0:
+                    logger.info(f"Claims created: {claims_count}")
+
+                    claim_number = created_claims[0].get('claimNumber', '') if created_claims else ''
+                    Toast.show_toast(self, tr("wizard.success.description"), Toast.SUCCESS)
+                else:
+                    reason = api_data.get('claimNotCreatedReason', 'Unknown')
+                    logger.warning(f"Claim not created. Reason: {reason}")
+                    ErrorHandler.show_warning(
+                        self,
+                        f"Survey processed but no claims created.\n\nReason: {reason}",
+                        "Process Claims"
+                    )
+
+            except Exception as e:
+                logger.error(f"Failed to process claims: {e}")
+                error_msg = map_exception(e)
+                ErrorHandler.show_error(self, error_msg, tr("common.error"))
+                self.context.finalize_response = None
+
+                # Show warning but allow to continue to step 6
+                Toast.show_toast(self, f"{tr('wizard.relation.claims_failed')}: {error_msg}", Toast.WARNING)
+            done()
+
+        self._spinner.show_loading(tr("component.loading.default"))
+        get_survey_outbox().when_synced(survey_id, on_synced)
@@ -33,7 +33,7 @@ from ui.wizards.office_survey.wizard_styles import (
     PERSON_CARD_STYLE, CONTEXT_MENU_STYLE, MENU_DOTS_STYLE,
     EVIDENCE_AVAILABLE_STYLE, EVIDENCE_WAITING_STYLE,
 )
-from ui.style_manager import StyleManager
+from ui.theme_engine import apply_variant
 from ui.font_utils import FontManager, create_font
 from ui.components.icon import Icon
 from ui.components.logo import LogoWidget
@@ -41,6 +41,7 @@ from ui.components.toast import Toast
 from utils.logger import get_logger
 from services.api_client import get_api_client
 from services.api_worker import ApiWorker
+from services.survey_outbox import get_survey_outbox
 from services.translation_manager import tr, get_layout_direction
 from services.error_mapper import map_exception
 from ui.wizards.office_survey.steps.occupancy_claims_step import _is_owner_relation
@@ -307,10 +308,7 @@ class ReviewStep(BaseStep):
         self._scroll.setFrameShape(QFrame.NoFrame)
         self._scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         self._scroll.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        self._scroll.setStyleSheet(
-            f"QScrollArea {{ background-color: {Colors.BACKGROUND}; border: none; }}"
-            + StyleManager.scrollbar()
-        )
+        apply_variant(self._scroll, "scroll-page")
 
         scroll_content = QWidget()
         scroll_content.setLayoutDirection(get_layout_direction())
@@ -1200,22 +1198,23 @@ class ReviewStep(BaseStep):
             if person_id:
                 try:
                     self._set_auth_token()
+                    outbox = get_survey_outbox()
                     if is_applicant and survey_id:
-                        self._api_service.update_contact_person(
-                            survey_id, person_id, updated_data)
+                        outbox.enqueue(survey_id, "update_contact_person",
+                                       survey_id, person_id, updated_data)
                     elif survey_id and household_id:
-                        self._api_service.update_person_in_survey(
-                            survey_id, household_id, person_id, updated_data)
+                        outbox.enqueue(survey_id, "update_person_in_survey",
+                                       survey_id, household_id, person_id, updated_data)
                     else:
                         logger.warning(f"Missing survey_id or household_id for person {person_id}")
                         Toast.show_toast(self, tr("wizard.review.load_failed"), Toast.ERROR)
-                    logger.info(f"Person {person_id} updated via API from review step")
+                    logger.info(f"Person {person_id} update queued from review step")
 
                     relation_id = updated_data.get('_relation_id') or person.get('_relation_id')
                     if relation_id and survey_id:
                         try:
-                            self._api_service.update_relation(survey_id, relation_id, updated_data)
-                            logger.info(f"Relation {relation_id} updated via API")
+                            outbox.enqueue(survey_id, "update_relation", survey_id, relation_id, updated_data)
+                            logger.info(f"Relation {relation_id} update queued")
                         except Exception as e:
                             logger.warning(f"Failed to update relation {relation_id}: {e}")
                             Toast.show_toast(self, tr("wizard.review.load_failed"), Toast.ERROR)
@@ -1432,38 +1431,58 @@ class ReviewStep(BaseStep):
     def collect_data(self) -> Dict[str, Any]:
         return self.context.get_summary()
 
-    def on_next(self):
-        """Called when user clicks Next/Submit button. Finalize the survey via API."""
+    def validate_async(self, callback):
+        """Validate, then finalize the survey via API once its journal reached the server.
+
+        Finalization errors are shown to the user but do not hold the
+        wizard on this step.
+        """
+        result = self.validate()
+        if not result.is_valid:
+            callback(result)
+            return
+
         self._set_auth_token()
         survey_id = self.context.get_data("survey_id")
         if not survey_id:
             logger.error("No survey_id found in context. Cannot finalize.")
             ErrorHandler.show_error(self, tr("wizard.review.no_survey_id"), tr("common.error"))
+            callback(result)
             return
 
         self._spinner.show_loading(tr("component.loading.default"))
+        # Save intervieweeName before finalizing
         try:
-            # Save intervieweeName before finalizing
+            a = self.context.applicant or {}
+            parts = [a.get("first_name_ar", ""), a.get("father_name_ar", ""), a.get("last_name_ar", "")]
+            name = " ".join(p for p in parts if p) or a.get("full_name")
+            if name:
+                get_survey_outbox().enqueue(survey_id, "save_draft_to_backend",
+                                            survey_id, {"interviewee_name": name})
+        except Exception as e:
+            logger.warning(f"Could not save interviewee name: {e}")
+            Toast.show_toast(self, tr("wizard.review.load_failed"), Toast.ERROR)
+
+        def on_synced(synced):
             try:
-                a = self.context.applicant or {}
-                parts = [a.get("first_name_ar", ""), a.get("father_name_ar", ""), a.get("last_name_ar", "")]
-                name = " ".join(p for p in parts if p) or a.get("full_name")
-                if name:
-                    self._api_service.save_draft_to_backend(survey_id, {"interviewee_name": name})
-            except Exception as e:
-                logger.warning(f"Could not save interviewee name: {e}")
-                Toast.show_toast(self, tr("wizard.review.load_failed"), Toast.ERROR)
+                # Everything journaled for this survey must reach the server first
+                if not synced:
+                    ErrorHandler.show_warning(self, tr("wizard.sync.pending_changes"), tr("common.warning"))
+                    return
 
-            # Step 1: process-claims if not already done
-            if not (hasattr(self.context, 'finalize_response') and self.context.finalize_response):
-                self._finalize_survey_via_api(survey_id)
+                # Step 1: process-claims if not already done
                 if not (hasattr(self.context, 'finalize_response') and self.context.finalize_response):
-                    return
+                    self._finalize_survey_via_api(survey_id)
+                    if not (hasattr(self.context, 'finalize_response') and self.context.finalize_response):
+                        return
 
-            # Step 2: finalize survey status
-            self._call_finalize_endpoint(survey_id)
-        finally:
-            self._spinner.hide_loading()
+                # Step 2: finalize survey status
+                self._call_finalize_endpoint(survey_id)
+            finally:
+                self._spinner.hide_loading()
+                callback(result)
+
+        get_survey_outbox().when_synced(survey_id, on_synced)
 
     def _finalize_survey_via_api(self, survey_id: str):
         finalize_options = {
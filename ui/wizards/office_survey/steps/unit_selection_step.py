@@ -32,6 +32,7 @@ from controllers.unit_controller import UnitController
 from models.unit import PropertyUnit as Unit
 from services.api_client import get_api_client
 from services.api_worker import ApiWorker
+from services.survey_outbox import get_survey_outbox
 from utils.logger import get_logger
 from utils.helpers import build_hierarchical_address
 from ui.design_system import Colors, ScreenScale
@@ -1157,7 +1158,7 @@ class UnitSelectionStep(BaseStep):
             self._load_units()
 
     def validate(self) -> StepValidationResult:
-        """Validate the step. Linking is performed asynchronously via on_next."""
+        """Validate the selection (linking the unit happens in validate_async)."""
         result = self.create_validation_result()
 
         if not self.context.building:
@@ -1173,27 +1174,40 @@ class UnitSelectionStep(BaseStep):
             result.add_error(tr("wizard.unit.no_survey_error"))
             return result
 
-        current_unit_id = None
-        if self.selected_unit and self.selected_unit != "new_unit":
-            current_unit_id = getattr(self.selected_unit, 'unit_uuid', None)
-        elif self.context.new_unit_data:
-            current_unit_id = self.context.new_unit_data.get('unit_uuid')
-
-        if not survey_id or not current_unit_id:
+        if not self._current_unit_id():
             result.add_error(tr("wizard.unit.no_survey_or_unit_error"))
             return result
 
+        return result
+
+    def _current_unit_id(self) -> Optional[str]:
+        if self.selected_unit and self.selected_unit != "new_unit":
+            return getattr(self.selected_unit, 'unit_uuid', None)
+        if self.context.new_unit_data:
+            return self.context.new_unit_data.get('unit_uuid')
+        return None
+
+    def validate_async(self, callback):
+        """Validate, then link the unit to the survey once its journal is drained."""
+        result = self.validate()
+        if not result.is_valid:
+            callback(result)
+            return
+        survey_id = self.context.get_data("survey_id")
+        current_unit_id = self._current_unit_id()
+
         # Guard: skip if same unit already linked
         if self.context.get_data("unit_linked"):
             previous_unit_id = self.context.get_data("linked_unit_uuid")
             if previous_unit_id == current_unit_id:
                 logger.info(f"Unit already linked ({current_unit_id}), skipping")
-                return result
+                callback(result)
+                return
             else:
                 logger.info(f"Unit changed ({previous_unit_id} -> {current_unit_id}), patching relations")
                 cleaned = False
                 try:
-                    self.context.cleanup_on_unit_change(self._api_service, new_unit_id=current_unit_id)
+                    self.context.cleanup_on_unit_change(new_unit_id=current_unit_id)
                     cleaned = True
                 except Exception as e:
                     logger.warning(f"API cleanup failed, doing local cleanup: {e}")
@@ -1208,23 +1222,35 @@ class UnitSelectionStep(BaseStep):
                                 "claims_count", "created_claims"):
                         self.context.update_data(key, None)
 
-        # Link unit synchronously — block progression if it fails
-        if not self.context.get_data("unit_linked"):
-            self._set_auth_token()
-            self._spinner.show_loading(tr("component.loading.default"))
-            try:
-                self._api_service.link_unit_to_survey(survey_id, current_unit_id)
-                logger.info(f"Unit {current_unit_id} linked to survey {survey_id}")
-                self.context.update_data("unit_linked", True)
-                self.context.update_data("linked_unit_uuid", current_unit_id)
-            except Exception as e:
-                logger.error(f"API link failed: {e}")
-                result.add_error(tr("wizard.unit.link_failed"))
-                return result
-            finally:
-                self._spinner.hide_loading()
+        # Link unit before moving on — block progression if it fails
+        if self.context.get_data("unit_linked"):
+            callback(result)
+            return
+        self._set_auth_token()
+
+        def _do_link():
+            # Relation patches journaled by cleanup_on_unit_change go first
+            get_survey_outbox().wait_until_synced(survey_id)
+            self._api_service.link_unit_to_survey(survey_id, current_unit_id)
+
+        def _on_linked(_result):
+            self._spinner.hide_loading()
+            logger.info(f"Unit {current_unit_id} linked to survey {survey_id}")
+            self.context.update_data("unit_linked", True)
+            self.context.update_data("linked_unit_uuid", current_unit_id)
+            callback(result)
+
+        def _on_link_error(msg):
+            self._spinner.hide_loading()
+            logger.error(f"API link failed: {msg}")
+            result.add_error(tr("wizard.unit.link_failed"))
+            callback(result)
 
-        return result
+        self._spinner.show_loading(tr("component.loading.default"))
+        self._link_worker = ApiWorker(_do_link)
+        self._link_worker.finished.connect(_on_linked)
+        self._link_worker.error.connect(_on_link_error)
+        self._link_worker.start()
 
     def collect_data(self) -> Dict[str, Any]:
         """Collect data from the step."""
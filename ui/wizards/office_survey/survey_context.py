@@ -10,6 +10,7 @@ from datetime import datetime
 from ui.wizards.framework import WizardContext
 from models.building import Building
 from models.unit import PropertyUnit as Unit
+from services.survey_outbox import get_survey_outbox
 
 if TYPE_CHECKING:
     from repositories.database import Database
@@ -186,16 +187,31 @@ class SurveyContext(WizardContext):
             "created_at": self.created_at.isoformat()
         }
 
-    def cleanup_on_building_change(self, api_client) -> None:
+    def replace_local_id(self, local_id: str, server_id: str) -> None:
+        """Swap an outbox local id for the server id once its create was sent (in place)."""
+        def _swap(container):
+            items = container.items() if isinstance(container, dict) else enumerate(container)
+            for key, value in list(items):
+                if value == local_id:
+                    container[key] = server_id
+                elif isinstance(value, (dict, list)):
+                    _swap(value)
+
+        for container in (self.data, self.households, self.persons,
+                          self.relations, self.claims, self.applicant):
+            if container:
+                _swap(container)
+
+    def cleanup_on_building_change(self) -> None:
         """Full cleanup when building changes. Deletes everything from API.
         Order: Relations (cascade deletes evidence) -> Persons -> Household."""
         survey_id = self.get_data("survey_id")
         if not survey_id:
             return
 
-        self._delete_relations_from_api(api_client, survey_id)
-        self._delete_persons_from_api(api_client)
-        self._delete_household_from_api(api_client, survey_id)
+        self._delete_relations_from_api(survey_id)
+        self._delete_persons_from_api(survey_id)
+        self._delete_household_from_api(survey_id)
 
         self.persons = []
         self.relations = []
@@ -206,16 +222,16 @@ class SurveyContext(WizardContext):
                     "claims_count", "created_claims", "contact_person_id"):
             self.update_data(key, None)
 
-    def cleanup_on_unit_change(self, api_client, new_unit_id: str = None) -> None:
+    def cleanup_on_unit_change(self, new_unit_id: str = None) -> None:
         """Update relations when unit changes. Uses PATCH to preserve evidence."""
         survey_id = self.get_data("survey_id")
         if not survey_id:
             return
 
         if new_unit_id:
-            self._patch_relations_unit(api_client, survey_id, new_unit_id)
+            self._patch_relations_unit(survey_id, new_unit_id)
         else:
-            self._delete_relations_from_api(api_client, survey_id)
+            self._delete_relations_from_api(survey_id)
             for person in self.persons:
                 person['_relation_id'] = None
             self.relations = []
@@ -226,45 +242,39 @@ class SurveyContext(WizardContext):
                     "claims_count", "created_claims"):
             self.update_data(key, None)
 
-    def _patch_relations_unit(self, api_client, survey_id: str, new_unit_id: str) -> None:
+    # The calls below go through the survey outbox: they are journaled and
+    # sent in order in the background (see services/survey_outbox.py).
+
+    def _patch_relations_unit(self, survey_id: str, new_unit_id: str) -> None:
         """PATCH each relation to point to the new unit."""
+        outbox = get_survey_outbox()
         for person in self.persons:
             relation_id = person.get('_relation_id')
             if not relation_id:
                 continue
-            try:
-                api_client.update_relation(survey_id, relation_id, {
-                    'propertyUnitId': new_unit_id
-                })
-                logger.info(f"Relation {relation_id} patched to unit {new_unit_id}")
-            except Exception as e:
-                logger.warning(f"Failed to patch relation {relation_id}: {e}")
+            outbox.enqueue(survey_id, "update_relation", survey_id, relation_id, {
+                'propertyUnitId': new_unit_id
+            })
+            logger.info(f"Relation {relation_id} queued for unit {new_unit_id}")
 
-    def _delete_relations_from_api(self, api_client, survey_id: str) -> None:
+    def _delete_relations_from_api(self, survey_id: str) -> None:
         """Delete all person-unit relations from API."""
+        outbox = get_survey_outbox()
         for person in self.persons:
             relation_id = person.get('_relation_id')
             if relation_id:
-                try:
-                    api_client.delete_relation(survey_id, relation_id)
-                except Exception as e:
-                    logger.warning(f"Failed to delete relation {relation_id}: {e}")
+                outbox.enqueue(survey_id, "delete_relation", survey_id, relation_id)
 
-    def _delete_persons_from_api(self, api_client) -> None:
+    def _delete_persons_from_api(self, survey_id: str) -> None:
         """Delete all persons from API."""
+        outbox = get_survey_outbox()
         for person in self.persons:
             person_id = person.get('person_id')
             if person_id:
-                try:
-                    api_client.delete_person(person_id)
-                except Exception as e:
-                    logger.warning(f"Failed to delete person {person_id}: {e}")
+                outbox.enqueue(survey_id, "delete_person", person_id)
 
-    def _delete_household_from_api(self, api_client, survey_id: str) -> None:
+    def _delete_household_from_api(self, survey_id: str) -> None:
         """Delete household from API."""
         household_id = self.get_data("household_id")
         if household_id:
-            try:
-                api_client.delete_household(household_id, survey_id)
-            except Exception as e:
-                logger.warning(f"Failed to delete household {household_id}: {e}")
+            get_survey_outbox().enqueue(survey_id, "delete_household", household_id, survey_id)
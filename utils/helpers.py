@@ -263,8 +263,14 @@ def download_static_file(file_path_val: str, file_name: str) -> Optional[str]:
     return None
 
 
-def download_evidence_file(evidence_id: str, file_name: str) -> Optional[str]:
-    """Download evidence file to temp dir using multiple strategies. Returns local path or None."""
+def download_evidence_file(evidence_id: str, file_name: str, priority=None) -> Optional[str]:
+    """Download evidence file using multiple strategies. Returns local path or None.
+
+    The download endpoint goes through the attachment download manager
+    (cached by content, resumable); the metadata fallbacks write to TEMP.
+    `priority` is the manager's queue priority (default: INTERACTIVE, the
+    user opened the file).
+    """
     if not evidence_id:
         return None
     import os, tempfile, logging
@@ -278,17 +284,17 @@ def download_evidence_file(evidence_id: str, file_name: str) -> Optional[str]:
     if os.path.exists(save_path) and os.path.getsize(save_path) > 0:
         return save_path
 
+    from services.download_manager import get_download_manager
+    from services.task_executor import Priority
+    local = get_download_manager().download_evidence(
+        evidence_id, file_name, Priority.INTERACTIVE if priority is None else priority)
+    if local:
+        return local
+
     from services.api_client import get_api_client
     api = get_api_client()
     api._ensure_valid_token()
 
-    try:
-        api.download_evidence(evidence_id, save_path)
-        if os.path.exists(save_path) and os.path.getsize(save_path) > 0:
-            return save_path
-    except Exception as e:
-        _logger.warning(f"Direct download failed for {evidence_id}: {e}")
-
     try:
         meta = api.get_evidence_by_id(evidence_id)
         if meta:
@@ -343,35 +349,26 @@ def download_identification_document_file(
 ) -> Optional[str]:
     """Cached download of an identification document via the new endpoint.
 
-    Uses GET /v1/persons/{personId}/identification-documents/{documentId}/download.
-    Mirrors download_evidence_file's caching: writes to TEMP/trrcms_iddocs and
-    short-circuits on subsequent calls when the cached file is present.
+    Uses GET /v1/persons/{personId}/identification-documents/{documentId}/download
+    through the attachment download manager (cached by content, resumable).
+    Files cached in TEMP/trrcms_iddocs by earlier versions are still used.
     Returns the local path on success, or None on failure.
     """
     if not person_id or not document_id:
         return None
-    import os, tempfile, logging
-    _logger = logging.getLogger(__name__)
+    import os, tempfile
 
     cache_dir = os.path.join(tempfile.gettempdir(), "trrcms_iddocs")
-    os.makedirs(cache_dir, exist_ok=True)
     safe_name = sanitize_filename(file_name) if file_name else document_id
     save_path = os.path.join(cache_dir, f"{document_id}_{safe_name}")
 
     if os.path.exists(save_path) and os.path.getsize(save_path) > 0:
         return save_path
 
-    from services.api_client import get_api_client
-    api = get_api_client()
-    try:
-        if api.download_identification_document(person_id, document_id, save_path):
-            return save_path
-    except Exception as e:
-        _logger.warning(
-            f"download_identification_document_file failed "
-            f"(person={person_id}, doc={document_id}): {e}"
-        )
-    return None
+    from services.download_manager import get_download_manager
+    return get_download_manager().download_identification_document(
+        person_id, document_id, file_name
+    )
 
 
 def validate_coordinates(lat: float, lon: float) -> bool: